@@ -119,6 +119,7 @@ class CallRecordResponse(BaseModel):
     caller_audio_format: str = "ulaw"
     codec_alignment_ok: bool = True
     barge_in_count: int = 0
+    audio_health: dict = {}
     created_at: Optional[str] = None
 
 
@@ -213,6 +214,7 @@ def _record_to_response(record) -> CallRecordResponse:
         caller_audio_format=record.caller_audio_format,
         codec_alignment_ok=record.codec_alignment_ok,
         barge_in_count=record.barge_in_count,
+        audio_health=getattr(record, "audio_health", None) or {},
         created_at=record.created_at.isoformat() if record.created_at else None,
     )
 
@@ -363,7 +363,8 @@ class CampaignCreateRequest(BaseModel):
     run_end_at_utc: Optional[str] = None
     daily_window_start_local: str = "09:00"
     daily_window_end_local: str = "17:00"
-    max_concurrent: int = Field(1, ge=1, le=5)
+    # Upper bound is AAVA_OUTBOUND_MAX_CONCURRENT_CEILING, applied by the store.
+    max_concurrent: int = Field(1, ge=1)
     min_interval_seconds_between_calls: int = Field(5, ge=0, le=3600)
     default_context: str = "default"
     voicemail_drop_enabled: bool = True
@@ -1744,11 +1744,10 @@ const CallSchedulingPage = () => {
                                         })()}
                                     </div>
                                     <div>
-                                        <FormLabel tooltip="Maximum simultaneous outbound calls for this campaign (MVP supports 1–5).">Max Concurrent</FormLabel>
+                                        <FormLabel tooltip="Maximum simultaneous outbound calls for this campaign (capped by AAVA_OUTBOUND_MAX_CONCURRENT_CEILING, default 5).">Max Concurrent</FormLabel>
                                         <input
                                             type="number"
                                             min={1}
-                                            max={5}
                                             value={campaignModalMode === 'create' ? createForm.max_concurrent : editForm.max_concurrent}
                                             onChange={e =>
                                                 campaignModalMode === 'create'
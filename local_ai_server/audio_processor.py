@@ -1,15 +1,206 @@
 from __future__ import annotations
 
+import io
 import logging
+import math
 import os
 import subprocess
 import tempfile
+import wave
+from typing import Optional, Tuple, Union
 
 from constants import ULAW_SAMPLE_RATE
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+try:
+    import audioop  # removed in Python 3.13; only used when NumPy is missing
+except ImportError:  # pragma: no cover
+    audioop = None  # type: ignore[assignment]
+
+BufferLike = Union[bytes, bytearray, memoryview]
+
+# Polyphase FIR length per branch; 16 taps keeps aliasing well below
+# telephony noise while costing a few µs per 20 ms chunk.
+_TAPS_PER_PHASE = 16
+_KAISER_BETA = 8.0
+
+
+def _build_ulaw_encode_table():
+    """Return a uint8[65536] G.711 μ-law table indexed by the raw PCM16 bit pattern."""
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    mag = np.minimum(np.abs(pcm), 8159) + (0x84 >> 2)
+    seg_end = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+    seg = np.searchsorted(seg_end, mag, side="left")
+    uval = (seg << 4) | ((mag >> (np.minimum(seg, 7) + 1)) & 0x0F)
+    uval = np.where(seg >= 8, 0x7F, uval)
+    return ((uval ^ mask) & 0xFF).astype(np.uint8)
+
+
+_ULAW_ENCODE = _build_ulaw_encode_table() if np is not None else None
+
+
+def pcm16_to_ulaw(pcm: BufferLike) -> bytes:
+    """Encode PCM16LE samples to G.711 μ-law without leaving the process."""
+    if not pcm:
+        return b""
+    if _ULAW_ENCODE is None:
+        return audioop.lin2ulaw(bytes(pcm), 2)
+    samples = np.frombuffer(pcm, dtype="<u2", count=len(pcm) // 2)
+    return _ULAW_ENCODE[samples].tobytes()
+
+
+class StreamingResampler:
+    """Stateful polyphase resampler for mono PCM16LE streams.
+
+    Filter history and output phase persist across ``process()`` calls, so a
+    call's audio can be fed chunk by chunk (straight from websocket
+    memoryviews) without clicks at chunk boundaries or temp-file round trips.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int):
+        if np is None:
+            raise RuntimeError("numpy is required for in-process resampling")
+        self.input_rate = int(input_rate)
+        self.output_rate = int(output_rate)
+        g = math.gcd(self.input_rate, self.output_rate)
+        self.up = self.output_rate // g
+        self.down = self.input_rate // g
+        self._bank = self._design(self.up, self.down)
+        self._offsets = np.arange(_TAPS_PER_PHASE)
+        self.reset()
+
+    @staticmethod
+    def _design(up: int, down: int):
+        n_taps = up * _TAPS_PER_PHASE
+        cutoff = 0.5 / max(up, down)
+        n = np.arange(n_taps, dtype=np.float64) - (n_taps - 1) / 2.0
+        h = 2.0 * cutoff * np.sinc(2.0 * cutoff * n) * np.kaiser(n_taps, _KAISER_BETA)
+        bank = h.reshape(_TAPS_PER_PHASE, up).T
+        sums = bank.sum(axis=1, keepdims=True)
+        sums[sums == 0] = 1.0
+        return bank / sums
+
+    def reset(self) -> None:
+        self._history = np.zeros(_TAPS_PER_PHASE - 1, dtype=np.float64)
+        self._t = 0  # next output position on the upsampled axis
+        self._carry = b""  # odd trailing byte from the previous chunk
+
+    def matches(self, input_rate: int, output_rate: int) -> bool:
+        return self.input_rate == int(input_rate) and self.output_rate == int(output_rate)
+
+    def process(self, data: BufferLike) -> bytes:
+        """Resample one chunk; returns PCM16LE at ``output_rate``."""
+        if self.input_rate == self.output_rate:
+            return bytes(data)
+        if self._carry:
+            data = self._carry + bytes(data)
+            self._carry = b""
+        if len(data) % 2:
+            self._carry = bytes(data[-1:])
+            data = memoryview(data)[:-1]
+        if not data:
+            return b""
+
+        x = np.frombuffer(data, dtype="<i2").astype(np.float64)
+        buf = np.concatenate((self._history, x))
+        limit = x.size * self.up
+        self._history = buf[buf.size - (_TAPS_PER_PHASE - 1):]
+        if self._t >= limit:
+            self._t -= limit
+            return b""
+
+        t = np.arange(self._t, limit, self.down, dtype=np.int64)
+        idx = (t // self.up + (_TAPS_PER_PHASE - 1))[:, None] - self._offsets[None, :]
+        out = np.einsum("ij,ij->i", buf[idx], self._bank[t % self.up])
+        self._t = int(t[-1]) + self.down - limit
+        return np.clip(np.rint(out), -32768, 32767).astype("<i2").tobytes()
+
+
+class RatecvResampler:
+    """Stateful ``audioop.ratecv`` resampler for hosts without NumPy.
+
+    Same interface as ``StreamingResampler``; lower quality (linear
+    interpolation) but still in-process and click-free across chunks.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int):
+        if audioop is None:
+            raise RuntimeError("numpy or audioop is required for in-process resampling")
+        self.input_rate = int(input_rate)
+        self.output_rate = int(output_rate)
+        self.reset()
+
+    def reset(self) -> None:
+        self._state = None
+        self._carry = b""
+
+    def matches(self, input_rate: int, output_rate: int) -> bool:
+        return self.input_rate == int(input_rate) and self.output_rate == int(output_rate)
+
+    def process(self, data: BufferLike) -> bytes:
+        """Resample one chunk; returns PCM16LE at ``output_rate``."""
+        if self.input_rate == self.output_rate:
+            return bytes(data)
+        data = self._carry + bytes(data)
+        self._carry = b""
+        if len(data) % 2:
+            data, self._carry = data[:-1], data[-1:]
+        if not data:
+            return b""
+        out, self._state = audioop.ratecv(data, 2, 1, self.input_rate, self.output_rate, self._state)
+        return out
+
+
+def create_resampler(input_rate: int, output_rate: int) -> Union[StreamingResampler, RatecvResampler]:
+    """Polyphase resampler when NumPy is available, else the ``audioop.ratecv`` one."""
+    if np is None:
+        return RatecvResampler(input_rate, output_rate)
+    return StreamingResampler(input_rate, output_rate)
+
+
+class StreamingUlawEncoder:
+    """Resample PCM16LE to 8 kHz and encode μ-law, keeping resampler state."""
+
+    def __init__(self, input_rate: int):
+        self.resampler = create_resampler(input_rate, ULAW_SAMPLE_RATE)
+
+    def process(self, pcm: BufferLike) -> bytes:
+        return pcm16_to_ulaw(self.resampler.process(pcm))
+
+
+def _read_wav_pcm16(data: BufferLike) -> Optional[Tuple[bytes, int]]:
+    """Return (mono PCM16LE, rate) for a plain PCM16 WAV, else ``None``."""
+    try:
+        with wave.open(io.BytesIO(bytes(data)), "rb") as wav:
+            if wav.getsampwidth() != 2 or wav.getcomptype() != "NONE":
+                return None
+            channels = wav.getnchannels()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    if channels > 1:
+        samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+        frames = samples.mean(axis=1).round().astype("<i2").tobytes()
+    return frames, rate
+
 
 class AudioProcessor:
-    """Handles audio format conversions for MVP uLaw 8kHz pipeline."""
+    """Handles audio format conversions for MVP uLaw 8kHz pipeline.
+
+    Conversions run in-process with NumPy; sox is only used as a fallback for
+    containers it alone understands (non-PCM16 WAVs, or when NumPy is absent).
+    """
+
+    @staticmethod
+    def create_resampler(input_rate: int, output_rate: int) -> Union[StreamingResampler, RatecvResampler]:
+        """Create a per-session streaming resampler (``audioop.ratecv`` based without NumPy)."""
+        return create_resampler(input_rate, output_rate)
 
     @staticmethod
     def resample_audio(
@@ -19,7 +210,51 @@ class AudioProcessor:
         input_format: str = "raw",
         output_format: str = "raw",
     ) -> bytes:
-        """Resample audio using sox (blocking)."""
+        """Resample one buffer of raw PCM16 audio (stateless)."""
+        if np is None or input_format != "raw" or output_format != "raw":
+            return AudioProcessor._sox_resample(
+                input_data, input_rate, output_rate, input_format, output_format
+            )
+        try:
+            return StreamingResampler(input_rate, output_rate).process(input_data)
+        except Exception as exc:  # pragma: no cover
+            logging.error("Audio resampling failed: %s", exc)
+            return input_data
+
+    @staticmethod
+    def convert_pcm16_to_ulaw_8k(pcm16_data: BufferLike, input_rate: int) -> bytes:
+        """Convert raw mono PCM16LE at ``input_rate`` to μ-law 8 kHz."""
+        if not pcm16_data:
+            return b""
+        return StreamingUlawEncoder(input_rate).process(pcm16_data)
+
+    @staticmethod
+    def convert_to_ulaw_8k(input_data: bytes, input_rate: int) -> bytes:
+        """Convert WAV (or raw PCM16 at ``input_rate``) audio to uLaw 8kHz for ARI playback."""
+        if np is None:
+            return AudioProcessor._sox_convert_to_ulaw_8k(input_data)
+        try:
+            if bytes(input_data[:4]) == b"RIFF":
+                parsed = _read_wav_pcm16(input_data)
+                if parsed is None:
+                    return AudioProcessor._sox_convert_to_ulaw_8k(input_data)
+                pcm, rate = parsed
+            else:
+                pcm, rate = input_data, input_rate
+            return AudioProcessor.convert_pcm16_to_ulaw_8k(pcm, rate)
+        except Exception as exc:  # pragma: no cover
+            logging.error("uLaw conversion failed: %s", exc)
+            return input_data
+
+    @staticmethod
+    def _sox_resample(
+        input_data: bytes,
+        input_rate: int,
+        output_rate: int,
+        input_format: str = "raw",
+        output_format: str = "raw",
+    ) -> bytes:
+        """Resample audio using sox (blocking fallback)."""
         try:
             with tempfile.NamedTemporaryFile(
                 suffix=f".{input_format}", delete=False
@@ -71,8 +306,8 @@ class AudioProcessor:
             return input_data
 
     @staticmethod
-    def convert_to_ulaw_8k(input_data: bytes, input_rate: int) -> bytes:
-        """Convert audio to uLaw 8kHz format for ARI playback (blocking)."""
+    def _sox_convert_to_ulaw_8k(input_data: bytes) -> bytes:
+        """Convert audio to uLaw 8kHz using sox (blocking fallback)."""
         try:
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as input_file:
                 input_file.write(input_data)
@@ -108,4 +343,3 @@ class AudioProcessor:
         except Exception as exc:  # pragma: no cover
             logging.error("uLaw conversion failed: %s", exc)
             return input_data
-
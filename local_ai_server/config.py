@@ -22,6 +22,8 @@ class LocalAIConfig:
     ws_host: str = "127.0.0.1"
     ws_port: int = 8765
     ws_auth_token: str = ""
+    # Audio frames a call may have in flight on a binary-framed connection
+    ws_mux_window: int = 16
 
     mock_models: bool = False
     fail_fast: bool = False
@@ -38,6 +40,15 @@ class LocalAIConfig:
     whisper_cpp_model_path: str = "/app/models/stt/ggml-base.en.bin"
     whisper_cpp_language: str = "en"
 
+    # Incremental (sliding-window) decoding for faster_whisper / whisper_cpp
+    whisper_incremental: bool = False
+    whisper_partial_interval_ms: int = 500
+    whisper_max_window_sec: float = 15.0
+    whisper_endpoint_silence_ms: int = 600
+    # Cross-session decode batching (windows per model call / coalescing wait)
+    whisper_batch_size: int = 8
+    whisper_batch_wait_ms: int = 10
+
     kroko_url: str = "wss://app.kroko.ai/api/v1/transcripts/streaming"
     kroko_api_key: str = ""
     kroko_language: str = "en-US"
@@ -62,6 +73,8 @@ class LocalAIConfig:
     )
     llm_use_mlock: bool = False
     llm_infer_timeout_sec: float = 20.0
+    llm_state_cache_mb: int = 512
+    llm_slice_tokens: int = 16
 
     tts_backend: str = "piper"
     tts_model_path: str = "/app/models/tts/en_US-lessac-medium.onnx"
@@ -97,6 +110,7 @@ class LocalAIConfig:
             ws_host=os.getenv("LOCAL_WS_HOST", "127.0.0.1"),
             ws_port=int(os.getenv("LOCAL_WS_PORT", "8765")),
             ws_auth_token=(os.getenv("LOCAL_WS_AUTH_TOKEN", "") or "").strip(),
+            ws_mux_window=int(os.getenv("LOCAL_WS_MUX_WINDOW", "16")),
             mock_models=_parse_bool(os.getenv("LOCAL_AI_MOCK_MODELS", "0")),
             fail_fast=_parse_bool(os.getenv("LOCAL_AI_FAIL_FAST", "0")),
             stt_backend=(os.getenv("LOCAL_STT_BACKEND", "vosk") or "vosk").strip().lower(),
@@ -112,6 +126,12 @@ class LocalAIConfig:
                 "WHISPER_CPP_MODEL_PATH", "/app/models/stt/ggml-base.en.bin"
             ),
             whisper_cpp_language=os.getenv("WHISPER_CPP_LANGUAGE", "en"),
+            whisper_incremental=_parse_bool(os.getenv("WHISPER_INCREMENTAL", "0")),
+            whisper_partial_interval_ms=int(os.getenv("WHISPER_PARTIAL_INTERVAL_MS", "500")),
+            whisper_max_window_sec=float(os.getenv("WHISPER_MAX_WINDOW_SEC", "15.0")),
+            whisper_endpoint_silence_ms=int(os.getenv("WHISPER_ENDPOINT_SILENCE_MS", "600")),
+            whisper_batch_size=int(os.getenv("WHISPER_BATCH_SIZE", "8")),
+            whisper_batch_wait_ms=int(os.getenv("WHISPER_BATCH_WAIT_MS", "10")),
             kroko_url=os.getenv(
                 "KROKO_URL",
                 "wss://app.kroko.ai/api/v1/transcripts/streaming",
@@ -142,6 +162,8 @@ class LocalAIConfig:
             llm_stop_tokens=stop_tokens,
             llm_use_mlock=_parse_bool(os.getenv("LOCAL_LLM_USE_MLOCK", "0")),
             llm_infer_timeout_sec=float(os.getenv("LOCAL_LLM_INFER_TIMEOUT_SEC", "20.0")),
+            llm_state_cache_mb=int(os.getenv("LOCAL_LLM_STATE_CACHE_MB", "512")),
+            llm_slice_tokens=int(os.getenv("LOCAL_LLM_SLICE_TOKENS", "16")),
             tts_backend=(os.getenv("LOCAL_TTS_BACKEND", "piper") or "piper").strip().lower(),
             tts_model_path=os.getenv(
                 "LOCAL_TTS_MODEL_PATH", "/app/models/tts/en_US-lessac-medium.onnx"
@@ -0,0 +1,321 @@
+"""
+Fair, streaming scheduling of local LLM turns across calls.
+
+llama-cpp-python drives a single context, and the model is shared by every
+call, so turns cannot run concurrently.  Before the scheduler a turn held the
+LLM lock for its whole completion: a long answer for one caller stalled every
+other caller's turn, and nothing was sent until the last token.
+
+``LlmScheduler`` runs turns in slices, round-robin:
+
+* A slice streams tokens for one turn.  Once it has produced
+  ``slice_tokens`` tokens and another turn is waiting, it stops.  The turn's
+  context is snapshotted in the ``LlamaStateCache`` and the turn goes to the
+  back of the queue.  A turn with nobody waiting behind it is never
+  interrupted.
+* Resuming restores the snapshot and continues from the prompt plus the text
+  generated so far, so only the last sampled token is evaluated again.
+  Without a snapshot (cache disabled, or the snapshot does not fit the
+  budget) a resume would re-evaluate the whole context, so such a turn is
+  not preempted and runs to completion.
+* A turn whose caller has gone (``submit()`` cancelled, e.g. by the
+  inference timeout) is dropped at the next token instead of taking more
+  slices from live callers.
+* Every streamed chunk is handed to the turn's ``on_partial`` callback on the
+  event loop (``LlmPartialStream`` turns these into ``llm_partial`` messages).
+
+Each slice holds the server's LLM lock, so model reloads still wait for the
+current slice.  Queue wait and tokens/sec are tracked per call for
+``status_response``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+# Per-call stats are kept for this many recent calls.
+_SESSION_STATS_MAX = 64
+
+
+@dataclass
+class _LlmJob:
+    prompt: str
+    call_id: Optional[str]
+    cache_key: str
+    on_partial: Optional[Callable[[str], None]]
+    future: asyncio.Future
+    enqueued_at: float
+    text: str = ""
+    completion_tokens: int = 0
+    prompt_tokens: int = 0
+    reused_tokens: int = 0
+    queue_wait: float = 0.0
+    run_time: float = 0.0
+    prompt_eval: Optional[float] = None
+    first_token_at: Optional[float] = None
+    slices: int = 0
+    parts: List[str] = field(default_factory=list)
+
+
+class LlmScheduler:
+    """Round-robin token-slice scheduler over the server's shared llama-cpp model."""
+
+    def __init__(self, server: Any, *, slice_tokens: int = 16):
+        """
+        Args:
+            server: ``LocalAIServer`` providing the model, LLM settings, lock,
+                state cache and turn stats.
+            slice_tokens: Tokens a turn may generate before yielding to a waiting
+                turn; 0 runs every turn to completion (first come, first served).
+        """
+        self._server = server
+        self.slice_tokens = max(0, int(slice_tokens))
+        self._ready: Deque[_LlmJob] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+        self._active = 0
+        self._sessions: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+    async def submit(
+        self,
+        prompt: str,
+        *,
+        call_id: Optional[str] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """Queue a completion and wait for its full text (None when nothing was generated)."""
+        loop = asyncio.get_running_loop()
+        job = _LlmJob(
+            prompt=prompt,
+            call_id=call_id,
+            # Turns without a call still need a snapshot slot while they are preempted.
+            cache_key=call_id or f"__turn_{next(self._ids)}",
+            on_partial=on_partial,
+            future=loop.create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        self._ready.append(job)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(), name="llm-scheduler")
+        return await job.future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._ready:
+            job = self._ready.popleft()
+            if job.future.done():
+                self._abandon(job)
+                continue
+            job.queue_wait += time.monotonic() - job.enqueued_at
+            self._active += 1
+            try:
+                async with self._server._llm_lock:
+                    finished = await asyncio.to_thread(self._run_slice, job, loop)
+            except Exception as exc:
+                self._release(job)
+                if not job.future.done():
+                    job.future.set_exception(exc)
+                continue
+            finally:
+                self._active -= 1
+            if job.future.done():
+                self._abandon(job)
+            elif finished:
+                self._finish(job)
+            else:
+                job.enqueued_at = time.monotonic()
+                self._ready.append(job)
+
+    def _run_slice(self, job: _LlmJob, loop: asyncio.AbstractEventLoop) -> bool:
+        """Generate one slice (worker thread, LLM lock held). Returns True when the turn is done."""
+        server = self._server
+        model = server.llm_model
+        if model is None:
+            return True
+        started = time.monotonic()
+        job.slices += 1
+        context = job.prompt + job.text
+        tokens = server._llm_tokens(model, context)
+        cache = server._llm_state_cache_for(model)
+        reused = 0
+        if cache is not None:
+            system_tokens = server._llm_tokens(model, server._phi_prompt_prefix())
+            reused = cache.prepare(job.cache_key, tokens, system_tokens)
+        if job.slices == 1:
+            job.prompt_tokens, job.reused_tokens = len(tokens), reused
+
+        remaining = server.llm_max_tokens - job.completion_tokens
+        finished = True
+        produced = 0
+        preemptible = bool(self.slice_tokens) and cache is not None and cache.enabled
+        stream = model(
+            context,
+            max_tokens=max(1, remaining),
+            stop=server.llm_stop_tokens,
+            echo=False,
+            temperature=server.llm_temperature,
+            top_p=server.llm_top_p,
+            repeat_penalty=server.llm_repeat_penalty,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                now = time.monotonic()
+                if job.first_token_at is None:
+                    job.first_token_at = now
+                    job.prompt_eval = now - started
+                choices = chunk.get("choices", []) if isinstance(chunk, dict) else []
+                text = (choices[0].get("text", "") or "") if choices else ""
+                job.completion_tokens += 1
+                produced += 1
+                if text:
+                    job.parts.append(text)
+                    job.text += text
+                    if job.on_partial is not None:
+                        loop.call_soon_threadsafe(job.on_partial, text)
+                if job.completion_tokens >= server.llm_max_tokens or job.future.done():
+                    break
+                if preemptible and produced >= self.slice_tokens and self._ready:
+                    if cache.remember(job.cache_key):
+                        finished = False
+                        break
+                    # Snapshot refused (over budget): a resume would re-evaluate the
+                    # whole context, so finish this turn instead.
+                    preemptible = False
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+            job.run_time += time.monotonic() - started
+
+        if cache is not None and finished and job.call_id:
+            cache.remember(job.cache_key)
+        return finished
+
+    def _release(self, job: _LlmJob) -> None:
+        if job.call_id is None:
+            cache = self._server.llm_state_cache
+            if cache is not None:
+                cache.release(job.cache_key)
+
+    def _abandon(self, job: _LlmJob) -> None:
+        logging.debug(
+            "🤖 LLM TURN - dropped, caller gave up call_id=%s slices=%s tokens=%s",
+            job.call_id,
+            job.slices,
+            job.completion_tokens,
+        )
+        self._release(job)
+
+    def _finish(self, job: _LlmJob) -> None:
+        self._release(job)
+        done = time.monotonic()
+        prompt_eval = job.prompt_eval if job.prompt_eval is not None else job.run_time
+        generation = max(0.0, job.run_time - prompt_eval)
+        # Rate the caller actually receives: first token to last, including time spent preempted.
+        streaming = done - job.first_token_at if job.first_token_at is not None else 0.0
+        tokens_per_sec = job.completion_tokens / streaming if streaming > 0 else 0.0
+
+        self._server.llm_turn_stats.record(
+            job.call_id,
+            prompt_tokens=job.prompt_tokens,
+            reused_tokens=job.reused_tokens,
+            completion_tokens=job.completion_tokens,
+            prompt_eval_ms=prompt_eval * 1000.0,
+            generation_ms=generation * 1000.0,
+            queue_wait_ms=job.queue_wait * 1000.0,
+        )
+        if job.call_id:
+            stats = self._sessions.pop(job.call_id, None) or {
+                "turns": 0,
+                "queue_wait_ms_total": 0.0,
+                "completion_tokens": 0,
+                "streaming_sec": 0.0,
+            }
+            stats["turns"] += 1
+            stats["queue_wait_ms_total"] += job.queue_wait * 1000.0
+            stats["completion_tokens"] += job.completion_tokens
+            stats["streaming_sec"] += streaming
+            stats["last_queue_wait_ms"] = job.queue_wait * 1000.0
+            stats["last_tokens_per_sec"] = tokens_per_sec
+            self._sessions[job.call_id] = stats
+            while len(self._sessions) > _SESSION_STATS_MAX:
+                self._sessions.popitem(last=False)
+        logging.debug(
+            "🤖 LLM TURN - call_id=%s slices=%s prompt_tokens=%s reused=%s queue_wait_ms=%.1f tokens_per_sec=%.1f",
+            job.call_id,
+            job.slices,
+            job.prompt_tokens,
+            job.reused_tokens,
+            job.queue_wait * 1000.0,
+            tokens_per_sec,
+        )
+        if not job.future.done():
+            job.future.set_result("".join(job.parts) if job.parts else None)
+
+    def stats(self) -> Dict[str, Any]:
+        sessions = {}
+        for call_id, s in self._sessions.items():
+            turns = s["turns"]
+            sessions[call_id] = {
+                "turns": turns,
+                "avg_queue_wait_ms": round(s["queue_wait_ms_total"] / turns, 2),
+                "last_queue_wait_ms": round(s["last_queue_wait_ms"], 2),
+                "tokens_per_sec": round(s["completion_tokens"] / s["streaming_sec"], 2) if s["streaming_sec"] else 0.0,
+                "last_tokens_per_sec": round(s["last_tokens_per_sec"], 2),
+            }
+        return {
+            "slice_tokens": self.slice_tokens,
+            "running": self._active,
+            "queued": len(self._ready),
+            "sessions": sessions,
+        }
+
+
+class LlmPartialStream:
+    """Sends a turn's streamed chunks in order, coalescing whatever piled up while a send was in flight."""
+
+    def __init__(self, send: Callable[[str, int], Awaitable[Any]]):
+        """``send(text, seq)`` delivers one ``llm_partial``; ``seq`` starts at 1."""
+        self._send = send
+        self._queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        self._open = True
+        self._seq = 0
+        self._task = asyncio.get_running_loop().create_task(self._pump())
+
+    def push(self, text: str) -> None:
+        if self._open and text:
+            self._queue.put_nowait(text)
+
+    async def _pump(self) -> None:
+        while True:
+            text = await self._queue.get()
+            if text is None:
+                return
+            pending = [text]
+            closing = False
+            while not self._queue.empty():
+                more = self._queue.get_nowait()
+                if more is None:
+                    closing = True
+                    break
+                pending.append(more)
+            self._seq += 1
+            try:
+                await self._send("".join(pending), self._seq)
+            except Exception as exc:
+                logging.debug("LLM partial send failed: %s", exc)
+            if closing:
+                return
+
+    async def close(self) -> None:
+        """Flush queued chunks, then drop anything pushed later (e.g. after a timeout)."""
+        self._open = False
+        self._queue.put_nowait(None)
+        await self._task
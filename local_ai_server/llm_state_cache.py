@@ -0,0 +1,238 @@
+"""
+llama.cpp KV-cache reuse across conversation turns.
+
+Every turn's prompt is the system prompt, then all of the caller's turns so
+far, then the new turn.  llama-cpp-python already skips the tokens its
+context shares with the previous prompt, but the model is shared by every
+call, so after another call's turn only the system prompt (at best) still
+matches and the whole history is evaluated again.
+
+``LlamaStateCache`` keeps snapshots of the model context (``save_state()``):
+
+* one per call, taken after each turn, so the next turn of that call can
+  restore it and evaluate only the new suffix;
+* one for the shared system-prompt prefix, primed once per system prompt and
+  used by first turns and by calls whose own snapshot was evicted.
+
+Before a turn, ``prepare()`` restores whichever snapshot shares the longest
+prefix with the new prompt, unless the live context already shares more.
+Call snapshots are evicted least recently used first to stay within
+``budget_bytes``; the system snapshot is kept as long as it fits.
+
+``LlmTurnStats`` records how each turn split between queue wait, prompt
+evaluation and generation for ``status_response``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+_SYSTEM_KEY = "__system__"
+
+
+def common_prefix_length(a: Sequence[int], b: Sequence[int]) -> int:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+def _state_tokens(state: Any) -> Sequence[int]:
+    return state.input_ids[: state.n_tokens]
+
+
+def _state_size(state: Any) -> int:
+    size = getattr(state, "llama_state_size", None)
+    if size is None:
+        size = len(getattr(state, "llama_state", b"") or b"")
+    # LlamaState also copies input_ids and, with logits_all, an n_ctx x n_vocab scores array.
+    for field in ("input_ids", "scores"):
+        size += int(getattr(getattr(state, field, None), "nbytes", 0) or 0)
+    return int(size)
+
+
+class LlamaStateCache:
+    """Per-call and system-prompt context snapshots for one llama-cpp model.
+
+    Not thread-safe with respect to the model: callers must hold the server's
+    LLM lock around ``prepare()``/``remember()``/``prime_system()``.  Only
+    ``release()`` and ``stats()`` may run concurrently with a turn.
+    """
+
+    def __init__(self, model: Any, *, budget_bytes: int):
+        """
+        Args:
+            model: A ``llama_cpp.Llama`` (or anything with ``input_ids``,
+                ``reset()``, ``eval()``, ``save_state()`` and ``load_state()``).
+            budget_bytes: Memory allowed for all snapshots; 0 disables the cache.
+        """
+        self.model = model
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._states: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._system_tokens: Tuple[int, ...] = ()
+        # System prefix whose snapshot did not fit the budget; not evaluated again every turn
+        self._system_unfit: Tuple[int, ...] = ()
+        self._lock = threading.Lock()
+        self._hits = {"session": 0, "system": 0, "live": 0}
+        self._misses = 0
+        self._evictions = 0
+        self._prompt_tokens = 0
+        self._reused_tokens = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget_bytes > 0
+
+    def _store(self, key: str, state: Any) -> bool:
+        size = _state_size(state)
+        with self._lock:
+            self._drop(key)
+            pinned = self._sizes.get(_SYSTEM_KEY, 0) if key != _SYSTEM_KEY else 0
+            if size + pinned > self.budget_bytes:
+                return False
+            while self._bytes + size > self.budget_bytes:
+                victim = next(k for k in self._states if k != _SYSTEM_KEY)
+                self._drop(victim)
+                self._evictions += 1
+            self._states[key] = state
+            self._sizes[key] = size
+            self._bytes += size
+            return True
+
+    def _drop(self, key: str) -> None:
+        if self._states.pop(key, None) is not None:
+            self._bytes -= self._sizes.pop(key, 0)
+
+    def prime_system(self, system_tokens: Sequence[int]) -> None:
+        """Evaluate and snapshot the system-prompt prefix (no-op if already cached)."""
+        tokens = tuple(system_tokens)
+        if not self.enabled or not tokens:
+            return
+        if tokens == self._system_tokens and _SYSTEM_KEY in self._states:
+            return
+        if tokens == self._system_unfit:
+            return
+        self.model.reset()
+        self.model.eval(list(tokens))
+        if self._store(_SYSTEM_KEY, self.model.save_state()):
+            self._system_tokens = tokens
+            self._system_unfit = ()
+        else:
+            self._system_unfit = tokens
+
+    def prepare(self, call_id: Optional[str], prompt_tokens: Sequence[int], system_tokens: Sequence[int] = ()) -> int:
+        """Load the snapshot that best matches ``prompt_tokens`` into the model.
+
+        Returns how many prompt tokens llama.cpp will not need to evaluate.
+        """
+        self.prime_system(system_tokens)
+        live = common_prefix_length(self.model.input_ids, prompt_tokens)
+        best, best_len, source = None, live, "live"
+        with self._lock:
+            for key, kind in ((call_id, "session"), (_SYSTEM_KEY, "system")):
+                state = self._states.get(key) if key else None
+                if state is None:
+                    continue
+                self._states.move_to_end(key)
+                n = common_prefix_length(_state_tokens(state), prompt_tokens)
+                if n > best_len:
+                    best, best_len, source = state, n, kind
+        if best is not None:
+            self.model.load_state(best)
+        # llama.cpp always re-evaluates the last prompt token to get fresh logits.
+        reused = max(0, min(best_len, len(prompt_tokens) - 1))
+        with self._lock:
+            if reused:
+                self._hits[source] += 1
+            else:
+                self._misses += 1
+            self._prompt_tokens += len(prompt_tokens)
+            self._reused_tokens += reused
+        return reused
+
+    def remember(self, call_id: str) -> bool:
+        """Snapshot the model context after ``call_id``'s turn; False if it was not kept."""
+        if self.enabled and call_id:
+            return self._store(call_id, self.model.save_state())
+        return False
+
+    def release(self, call_id: str) -> None:
+        """Forget a call's snapshot (call ended)."""
+        with self._lock:
+            self._drop(call_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "budget_bytes": self.budget_bytes,
+                "bytes": self._bytes,
+                "calls": sum(1 for k in self._states if k != _SYSTEM_KEY),
+                "system_tokens": len(self._system_tokens) if _SYSTEM_KEY in self._states else 0,
+                "session_hits": self._hits["session"],
+                "system_hits": self._hits["system"],
+                "live_hits": self._hits["live"],
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "prompt_tokens": self._prompt_tokens,
+                "reused_tokens": self._reused_tokens,
+            }
+
+
+class LlmTurnStats:
+    """Queue-wait, prompt-evaluation and generation timings for recent LLM turns."""
+
+    def __init__(self, history: int = 20):
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=max(1, int(history)))
+        self._turns = 0
+        self._prompt_eval_ms = 0.0
+        self._generation_ms = 0.0
+        self._queue_wait_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        call_id: Optional[str],
+        *,
+        prompt_tokens: int,
+        reused_tokens: int,
+        completion_tokens: int,
+        prompt_eval_ms: float,
+        generation_ms: float,
+        queue_wait_ms: float = 0.0,
+    ) -> None:
+        turn = {
+            "call_id": call_id,
+            "at": time.time(),
+            "prompt_tokens": prompt_tokens,
+            "reused_tokens": reused_tokens,
+            "completion_tokens": completion_tokens,
+            "prompt_eval_ms": round(prompt_eval_ms, 2),
+            "generation_ms": round(generation_ms, 2),
+            "queue_wait_ms": round(queue_wait_ms, 2),
+        }
+        with self._lock:
+            self._recent.append(turn)
+            self._turns += 1
+            self._prompt_eval_ms += prompt_eval_ms
+            self._generation_ms += generation_ms
+            self._queue_wait_ms += queue_wait_ms
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            turns = self._turns
+            recent: List[Dict[str, Any]] = list(self._recent)
+            return {
+                "turns": turns,
+                "avg_prompt_eval_ms": round(self._prompt_eval_ms / turns, 2) if turns else 0.0,
+                "avg_generation_ms": round(self._generation_ms / turns, 2) if turns else 0.0,
+                "avg_queue_wait_ms": round(self._queue_wait_ms / turns, 2) if turns else 0.0,
+                "recent": recent,
+            }
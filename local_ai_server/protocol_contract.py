@@ -14,7 +14,8 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import Any, Dict, Optional
+import struct
+from typing import Any, Dict, NamedTuple, Optional
 
 
 PROTOCOL_SCHEMA: Dict[str, Any] = {
@@ -51,6 +52,7 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
                 "type": {"const": "set_mode"},
                 "mode": {"enum": ["full", "stt", "llm", "tts"]},
                 "call_id": {"type": "string"},
+                "llm_stream": {"type": "boolean"},
             },
             "additionalProperties": True,
         },
@@ -229,6 +231,20 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
                 "mode": {"type": "string"},
                 "call_id": {"type": "string"},
                 "request_id": {"type": "string"},
+                "stream": {"type": "boolean"},
+            },
+            "additionalProperties": True,
+        },
+        "LLMPartial": {
+            "type": "object",
+            "required": ["type", "text", "seq", "call_id", "mode"],
+            "properties": {
+                "type": {"const": "llm_partial"},
+                "text": {"type": "string"},
+                "seq": {"type": "integer", "minimum": 1},
+                "call_id": {"type": "string"},
+                "mode": {"type": "string"},
+                "request_id": {"type": "string"},
             },
             "additionalProperties": True,
         },
@@ -285,6 +301,36 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
             },
             "additionalProperties": True,
         },
+        "TransportRequest": {
+            "type": "object",
+            "required": ["type", "framing", "version"],
+            "properties": {
+                "type": {"const": "transport"},
+                "framing": {"const": "binary"},
+                "version": {"type": "integer"},
+            },
+            "additionalProperties": True,
+        },
+        "TransportReady": {
+            "type": "object",
+            "required": ["type", "framing", "version", "window"],
+            "properties": {
+                "type": {"const": "transport_ready"},
+                "framing": {"const": "binary"},
+                "version": {"type": "integer"},
+                "window": {"type": "integer", "minimum": 1},
+            },
+            "additionalProperties": True,
+        },
+        "CallEndRequest": {
+            "type": "object",
+            "required": ["type", "call_id"],
+            "properties": {
+                "type": {"const": "call_end"},
+                "call_id": {"type": "string"},
+            },
+            "additionalProperties": True,
+        },
         "STTResult": {
             "type": "object",
             "required": ["type", "text", "call_id", "mode", "is_final", "is_partial"],
@@ -330,16 +376,87 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
         {"$ref": "#/$defs/ReloadLLMRequest"},
         {"$ref": "#/$defs/ReloadResponse"},
         {"$ref": "#/$defs/LLMRequest"},
+        {"$ref": "#/$defs/LLMPartial"},
         {"$ref": "#/$defs/LLMResponse"},
         {"$ref": "#/$defs/TTSRequest"},
         {"$ref": "#/$defs/TTSResponse"},
         {"$ref": "#/$defs/AudioFrameRequest"},
+        {"$ref": "#/$defs/TransportRequest"},
+        {"$ref": "#/$defs/TransportReady"},
+        {"$ref": "#/$defs/CallEndRequest"},
         {"$ref": "#/$defs/STTResult"},
         {"$ref": "#/$defs/TTSAudioMetadata"},
     ],
 }
 
 
+# Binary framing (negotiated per connection with a ``transport`` request).
+#
+# Every binary message on a framed connection is one frame: a fixed header,
+# the UTF-8 call id, then the payload (raw PCM16 LE for AUDIO, μ-law 8 kHz for
+# TTS_AUDIO, nothing for CREDIT).  All integers are big-endian.
+#
+#   magic    2s  b"LA"
+#   version  B   FRAME_VERSION
+#   kind     B   FRAME_AUDIO | FRAME_TTS_AUDIO | FRAME_CREDIT
+#   mode     B   index into FRAME_MODES
+#   id_len   B   length of the call id in bytes (1-255)
+#   rate     H   sample rate of the payload in Hz
+#   seq      I   per-call sequence number; for CREDIT, the frames granted
+#
+# The engine keeps its own copy of this layout in src/providers/local_mux.py.
+FRAME_MAGIC = b"LA"
+FRAME_VERSION = 1
+FRAME_AUDIO = 1
+FRAME_TTS_AUDIO = 2
+FRAME_CREDIT = 3
+FRAME_MODES = ("full", "stt", "llm", "tts")
+FRAME_HEADER = struct.Struct("!2sBBBBHI")
+
+
+class Frame(NamedTuple):
+    kind: int
+    call_id: str
+    mode: str
+    rate: int
+    seq: int
+    payload: bytes
+
+
+def encode_frame(
+    kind: int,
+    call_id: str,
+    payload: bytes = b"",
+    *,
+    mode: str = "full",
+    rate: int = 0,
+    seq: int = 0,
+) -> bytes:
+    cid = call_id.encode("utf-8")
+    if not 0 < len(cid) < 256:
+        raise ValueError("frame call_id must be 1-255 bytes")
+    header = FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, kind, FRAME_MODES.index(mode), len(cid), rate, seq)
+    return b"".join((header, cid, payload))
+
+
+def decode_frame(message: bytes) -> Frame:
+    """Split a binary frame into header fields and payload. Raises ValueError on malformed frames."""
+    if len(message) < FRAME_HEADER.size:
+        raise ValueError("frame shorter than header")
+    magic, version, kind, mode, id_len, rate, seq = FRAME_HEADER.unpack_from(message)
+    if magic != FRAME_MAGIC:
+        raise ValueError("bad frame magic")
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version {version}")
+    if mode >= len(FRAME_MODES):
+        raise ValueError(f"unknown frame mode {mode}")
+    start = FRAME_HEADER.size + id_len
+    if id_len == 0 or len(message) < start:
+        raise ValueError("truncated frame call_id")
+    call_id = message[FRAME_HEADER.size:start].decode("utf-8")
+    return Frame(kind, call_id, FRAME_MODES[mode], rate, seq, message[start:])
+
+
 def _optional_jsonschema_validator() -> Optional[Any]:
     try:
         import jsonschema  # type: ignore
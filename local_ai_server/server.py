@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import io
 import json
 import logging
 import os
@@ -15,7 +16,7 @@ import wave
 import urllib.request
 import urllib.error
 from time import monotonic
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from websockets.exceptions import ConnectionClosed, ConnectionClosedError, ConnectionClosedOK
 try:
@@ -51,6 +52,9 @@ from optional_imports import VoskModel, KaldiRecognizer, Llama, PiperVoice
 
 from session import SessionContext
 from config import LocalAIConfig
+from llm_scheduler import LlmPartialStream, LlmScheduler
+from llm_state_cache import LlamaStateCache, LlmTurnStats
+from protocol_contract import FRAME_TTS_AUDIO, encode_frame
 from model_manager import ModelManager
 from ws_protocol import WebSocketProtocol
 
@@ -722,8 +726,9 @@ class LocalAIServer:
         
         # Lock to serialize LLM inference (llama-cpp is NOT thread-safe)
         self._llm_lock = asyncio.Lock()
-        # Lock to serialize Faster-Whisper inference (CTranslate2 is NOT thread-safe)
-        self._faster_whisper_lock = asyncio.Lock()
+        # KV-cache snapshots per call / system prompt (rebuilt whenever llm_model changes)
+        self.llm_state_cache: Optional[LlamaStateCache] = None
+        self.llm_turn_stats = LlmTurnStats()
         # Component -> last startup error (used for degraded mode status/logging)
         self.startup_errors: Dict[str, str] = {}
 
@@ -743,6 +748,7 @@ class LocalAIServer:
         self._apply_config(self.config)
         self.model_manager = ModelManager(self)
         self.ws_protocol = WebSocketProtocol(self)
+        self.llm_scheduler = LlmScheduler(self, slice_tokens=self.config.llm_slice_tokens)
 
         # Audio buffering for STT (20ms chunks need to be buffered for effective STT)
         self.audio_buffer = b""
@@ -771,6 +777,12 @@ class LocalAIServer:
         self.faster_whisper_language = config.faster_whisper_language
         self.whisper_cpp_model_path = config.whisper_cpp_model_path
         self.whisper_cpp_language = config.whisper_cpp_language
+        self.whisper_incremental = config.whisper_incremental
+        self.whisper_partial_interval_ms = config.whisper_partial_interval_ms
+        self.whisper_max_window_sec = config.whisper_max_window_sec
+        self.whisper_endpoint_silence_ms = config.whisper_endpoint_silence_ms
+        self.whisper_batch_size = config.whisper_batch_size
+        self.whisper_batch_wait_ms = config.whisper_batch_wait_ms
         self.kroko_url = config.kroko_url
         self.kroko_api_key = config.kroko_api_key
         self.kroko_language = config.kroko_language
@@ -791,6 +803,7 @@ class LocalAIServer:
         self.llm_system_prompt = config.llm_system_prompt
         self.llm_stop_tokens = list(config.llm_stop_tokens)
         self.llm_use_mlock = config.llm_use_mlock
+        self.llm_state_cache_mb = config.llm_state_cache_mb
 
         # TTS configuration
         self.tts_backend = config.tts_backend
@@ -1002,10 +1015,18 @@ class LocalAIServer:
                 compute_type=self.faster_whisper_compute,
                 language=self.faster_whisper_language,
                 sample_rate=PCM16_TARGET_RATE,
+                incremental=self.whisper_incremental,
+                partial_interval_ms=self.whisper_partial_interval_ms,
+                max_window_sec=self.whisper_max_window_sec,
+                endpoint_silence_ms=self.whisper_endpoint_silence_ms,
             )
 
             if not self.faster_whisper_backend.initialize():
                 raise RuntimeError("Failed to initialize Faster-Whisper")
+            self.faster_whisper_backend.enable_batching(
+                max_batch=self.whisper_batch_size,
+                max_wait_ms=self.whisper_batch_wait_ms,
+            )
 
             logging.info("✅ STT backend: Faster-Whisper initialized")
 
@@ -1030,10 +1051,18 @@ class LocalAIServer:
                 model_path=self.whisper_cpp_model_path,
                 language=self.whisper_cpp_language,
                 sample_rate=PCM16_TARGET_RATE,
+                incremental=self.whisper_incremental,
+                partial_interval_ms=self.whisper_partial_interval_ms,
+                max_window_sec=self.whisper_max_window_sec,
+                endpoint_silence_ms=self.whisper_endpoint_silence_ms,
             )
 
             if not self.whisper_cpp_backend.initialize():
                 raise RuntimeError("Failed to initialize Whisper.cpp")
+            self.whisper_cpp_backend.enable_batching(
+                max_batch=self.whisper_batch_size,
+                max_wait_ms=self.whisper_batch_wait_ms,
+            )
 
             logging.info("✅ STT backend: Whisper.cpp initialized")
 
@@ -1253,6 +1282,12 @@ class LocalAIServer:
                 raw_tokens,
                 truncated,
             )
+            # Snapshot the system prompt now so the first call's first turn doesn't pay for it.
+            cache = self._llm_state_cache_for(self.llm_model)
+            if cache is not None:
+                async with self._llm_lock:
+                    system_tokens = self._llm_tokens(self.llm_model, self._phi_prompt_prefix())
+                    await asyncio.to_thread(cache.prime_system, system_tokens)
         except Exception as exc:  # pragma: no cover - best-effort metric
             logging.warning(
                 "🤖 LLM STARTUP LATENCY CHECK FAILED: %s",
@@ -1406,6 +1441,14 @@ class LocalAIServer:
             except Exception as exc:  # pragma: no cover
                 logging.debug("Sherpa backend shutdown failed: %s", exc, exc_info=True)
             self.sherpa_backend = None
+        for attr in ("faster_whisper_backend", "whisper_cpp_backend"):
+            backend = getattr(self, attr, None)
+            if backend:
+                try:
+                    backend.shutdown()
+                except Exception as exc:  # pragma: no cover
+                    logging.debug("Whisper backend shutdown failed: %s", exc, exc_info=True)
+                setattr(self, attr, None)
         if self.kokoro_backend:
             try:
                 self.kokoro_backend.shutdown()
@@ -1494,12 +1537,11 @@ class LocalAIServer:
 
             logging.info("🎵 STT PROCESSING - Faster-Whisper processing buffered audio: %s bytes", len(self.audio_buffer))
 
-            # Process with Faster-Whisper (acquire lock - CTranslate2 is NOT thread-safe)
-            async with self._faster_whisper_lock:
-                transcript = await asyncio.to_thread(
-                    self.faster_whisper_backend.transcribe,
-                    self.audio_buffer
-                )
+            # Process with Faster-Whisper (the backend's batch scheduler owns the model)
+            transcript = await asyncio.to_thread(
+                self.faster_whisper_backend.transcribe,
+                self.audio_buffer
+            )
 
             if transcript:
                 logging.info("📝 STT RESULT - Faster-Whisper transcript: '%s'", transcript)
@@ -1662,49 +1704,81 @@ class LocalAIServer:
             logging.error("STT processing failed: %s", exc, exc_info=True)
             return ""
 
-    async def process_llm(self, prompt: str) -> str:
+    async def process_llm(
+        self,
+        prompt: str,
+        session: Optional[SessionContext] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """Run LLM inference using the prepared Phi-style prompt.
         
-        Uses a lock to serialize inference calls - llama-cpp is NOT thread-safe
-        and will segfault if multiple threads try to use the model simultaneously.
+        Turns from all calls go through ``LlmScheduler``, which holds the LLM
+        lock per slice (llama-cpp is NOT thread-safe and will segfault if
+        multiple threads use the model simultaneously) and interleaves long
+        completions round-robin.  With ``session``, the call's KV-cache snapshot
+        is restored first so only the new turn is evaluated.  ``on_partial``
+        receives each streamed chunk on the event loop.
         """
-        # Acquire lock to prevent concurrent LLM calls (causes segfault in libggml)
-        async with self._llm_lock:
-            try:
-                if not self.llm_model:
-                    logging.warning("LLM model not loaded, using fallback")
-                    return "I'm here to help you. How can I assist you today?"
-
-                loop = asyncio.get_running_loop()
-                started = loop.time()
-                output = await asyncio.to_thread(
-                    self.llm_model,
-                    prompt,
-                    max_tokens=self.llm_max_tokens,
-                    stop=self.llm_stop_tokens,
-                    echo=False,
-                    temperature=self.llm_temperature,
-                    top_p=self.llm_top_p,
-                    repeat_penalty=self.llm_repeat_penalty,
-                )
+        try:
+            if not self.llm_model:
+                logging.warning("LLM model not loaded, using fallback")
+                return "I'm here to help you. How can I assist you today?"
 
-                choices = output.get("choices", []) if isinstance(output, dict) else []
-                if not choices:
-                    logging.warning("🤖 LLM RESULT - No choices returned, using fallback response")
-                    return "I'm here to help you. How can I assist you today?"
+            call_id = session.call_id if session is not None and session.call_id != "unknown" else None
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            response = await self.llm_scheduler.submit(prompt, call_id=call_id, on_partial=on_partial)
+            if response is None:
+                logging.warning("🤖 LLM RESULT - No choices returned, using fallback response")
+                return "I'm here to help you. How can I assist you today?"
 
-                response = choices[0].get("text", "").strip()
-                latency_ms = round((loop.time() - started) * 1000.0, 2)
-                logging.info(
-                    "🤖 LLM RESULT - Completed in %s ms tokens=%s",
-                    latency_ms,
-                    len(response.split()),
-                )
-                return response
+            response = response.strip()
+            latency_ms = round((loop.time() - started) * 1000.0, 2)
+            logging.info(
+                "🤖 LLM RESULT - Completed in %s ms tokens=%s",
+                latency_ms,
+                len(response.split()),
+            )
+            return response
 
-            except Exception as exc:
-                logging.error("LLM processing failed: %s", exc, exc_info=True)
-                return "I'm here to help you. How can I assist you today?"
+        except Exception as exc:
+            logging.error("LLM processing failed: %s", exc, exc_info=True)
+            return "I'm here to help you. How can I assist you today?"
+
+    def _llm_partial_stream(
+        self, websocket, session: SessionContext, request_id: Optional[str], *, source_mode: str
+    ) -> LlmPartialStream:
+        call_id = session.call_id
+
+        async def send(text: str, seq: int) -> None:
+            payload = {
+                "type": "llm_partial",
+                "text": text,
+                "seq": seq,
+                "call_id": call_id,
+                "mode": source_mode,
+            }
+            if request_id:
+                payload["request_id"] = request_id
+            await self._send_json(websocket, payload)
+
+        return LlmPartialStream(send)
+
+    def _llm_state_cache_for(self, model) -> Optional[LlamaStateCache]:
+        if self.llm_state_cache_mb <= 0:
+            return None
+        if self.llm_state_cache is None or self.llm_state_cache.model is not model:
+            self.llm_state_cache = LlamaStateCache(model, budget_bytes=self.llm_state_cache_mb * 1024 * 1024)
+        return self.llm_state_cache
+
+    def _llm_tokens(self, model, text: str) -> List[int]:
+        # Same tokenization llama-cpp-python applies to a completion prompt.
+        return model.tokenize(text.encode("utf-8"), special=True)
+
+    def release_llm_state(self, call_id: Optional[str]) -> None:
+        """Drop a finished call's KV-cache snapshot."""
+        if call_id and self.llm_state_cache is not None:
+            self.llm_state_cache.release(call_id)
 
     def _count_prompt_tokens(self, text: str) -> int:
         if not text:
@@ -1717,12 +1791,13 @@ class LocalAIServer:
                 logging.debug("Tokenization failed, falling back to whitespace split: %s", exc)
         return len(text.split())
 
+    def _phi_prompt_prefix(self) -> str:
+        """Part of every Phi prompt before the user turns (shared by all calls)."""
+        return "\n".join(["<|system|>", self.llm_system_prompt.strip(), "<|user|>"]) + "\n"
+
     def _build_phi_prompt(self, user_text: str) -> str:
         user_text = (user_text or "").strip()
-        segments = ["<|system|>", self.llm_system_prompt.strip(), "<|user|>"]
-        segments.append(user_text if user_text else "Hello")
-        segments.append("<|assistant|>")
-        return "\n".join(segments) + "\n"
+        return self._phi_prompt_prefix() + (user_text if user_text else "Hello") + "\n<|assistant|>\n"
 
     @staticmethod
     def _strip_leading_bos(prompt: str) -> str:
@@ -1784,24 +1859,10 @@ class LocalAIServer:
                 logging.warning("⚠️ MeloTTS returned empty audio")
                 return b""
 
-            # Write to temp WAV file for conversion
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-                wav_path = wav_file.name
-
-            with wave.open(wav_path, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(44100)  # MeloTTS native rate
-                wav_file.writeframes(pcm16_data)
-
-            with open(wav_path, "rb") as wav_file:
-                wav_data = wav_file.read()
-
-            # Convert 44100Hz to 8kHz uLaw
+            # Convert 44100Hz (MeloTTS native rate) to 8kHz uLaw
             ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 44100
+                self.audio_processor.convert_pcm16_to_ulaw_8k, pcm16_data, 44100
             )
-            os.unlink(wav_path)
 
             logging.info("🔊 TTS RESULT - MeloTTS generated uLaw 8kHz audio: %s bytes", len(ulaw_data))
             return ulaw_data
@@ -1819,12 +1880,11 @@ class LocalAIServer:
 
             logging.debug("🔊 TTS INPUT - Generating 22kHz audio for: '%s'", text)
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-                wav_path = wav_file.name
+            wav_buffer = io.BytesIO()
 
             # Write WAV data either by letting Piper stream into the wave writer
             # or by consuming a generator for backward compatibility.
-            with wave.open(wav_path, "wb") as wav_file:
+            with wave.open(wav_buffer, "wb") as wav_file:
                 # Mono, 16-bit, 22.05 kHz (typical Piper voice rate)
                 wav_file.setnchannels(1)
                 wav_file.setsampwidth(2)
@@ -1843,13 +1903,9 @@ class LocalAIServer:
                             if data:
                                 wav_file.writeframes(data)
 
-            with open(wav_path, "rb") as wav_file:
-                wav_data = wav_file.read()
-
             ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 22050
+                self.audio_processor.convert_to_ulaw_8k, wav_buffer.getvalue(), 22050
             )
-            os.unlink(wav_path)
 
             logging.info("🔊 TTS RESULT - Piper generated uLaw 8kHz audio: %s bytes", len(ulaw_data))
             return ulaw_data
@@ -1877,24 +1933,10 @@ class LocalAIServer:
                 logging.warning("⚠️ Kokoro returned empty audio")
                 return b""
 
-            # Write to temp WAV file for conversion
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-                wav_path = wav_file.name
-
-            with wave.open(wav_path, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(24000)
-                wav_file.writeframes(pcm16_data)
-
-            with open(wav_path, "rb") as wav_file:
-                wav_data = wav_file.read()
-
-            # Convert 24kHz WAV to 8kHz uLaw
+            # Convert 24kHz PCM16 to 8kHz uLaw
             ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 24000
+                self.audio_processor.convert_pcm16_to_ulaw_8k, pcm16_data, 24000
             )
-            os.unlink(wav_path)
 
             logging.info("🔊 TTS RESULT - Kokoro generated uLaw 8kHz audio: %s bytes", len(ulaw_data))
             return ulaw_data
@@ -1912,7 +1954,7 @@ class LocalAIServer:
             "model": self.kokoro_api_model,
             "voice": self.kokoro_voice,
             "input": text,
-            # Request WAV so we can feed it directly into sox for ulaw conversion.
+            # Request WAV so we can convert it in-process to ulaw.
             "response_format": "wav",
             "speed": 1.0,
         }
@@ -2034,6 +2076,28 @@ class LocalAIServer:
         # Default: Vosk
         return self.stt_model is not None and KaldiRecognizer is not None
 
+    def _resample_stt_input(
+        self,
+        session: SessionContext,
+        audio_data: bytes,
+        input_rate: int,
+    ) -> bytes:
+        """Resample streaming STT input to 16 kHz with the session's stateful resampler.
+
+        Without NumPy the resampler is ``audioop.ratecv`` based; with neither
+        (Python 3.13+ and no NumPy) each chunk goes through sox.
+        """
+        if input_rate == PCM16_TARGET_RATE:
+            return audio_data
+        resampler = session.stt_resampler
+        if resampler is None or not resampler.matches(input_rate, PCM16_TARGET_RATE):
+            try:
+                resampler = self.audio_processor.create_resampler(input_rate, PCM16_TARGET_RATE)
+            except RuntimeError:
+                return self.audio_processor.resample_audio(bytes(audio_data), input_rate, PCM16_TARGET_RATE)
+            session.stt_resampler = resampler
+        return resampler.process(audio_data)
+
     async def _process_stt_stream(
         self,
         session: SessionContext,
@@ -2063,68 +2127,9 @@ class LocalAIServer:
         if not self.faster_whisper_backend:
             logging.error("Faster-Whisper STT backend not initialized")
             return []
-
-        # Buffer audio for Faster-Whisper (needs sufficient audio for transcription)
-        if not hasattr(session, 'fw_audio_buffer'):
-            session.fw_audio_buffer = b""
-        
-        # Resample to 16kHz if needed
-        if input_rate != PCM16_TARGET_RATE:
-            audio_bytes = await asyncio.to_thread(
-                self.audio_processor.resample_audio,
-                audio_data,
-                input_rate,
-                PCM16_TARGET_RATE,
-                "raw",
-                "raw",
-            )
-        else:
-            audio_bytes = audio_data
-
-        session.fw_audio_buffer += audio_bytes
-        
-        # Only process when we have enough audio (e.g., 1 second = 32000 bytes at 16kHz mono 16-bit)
-        MIN_BUFFER_SIZE = 32000  # 1 second of audio
-        if len(session.fw_audio_buffer) < MIN_BUFFER_SIZE:
-            return []
-
-        updates: List[Dict[str, Any]] = []
-        
-        try:
-            # Acquire lock to prevent concurrent access (CTranslate2 is NOT thread-safe)
-            async with self._faster_whisper_lock:
-                # Reset backend's internal buffer since we manage our own buffer
-                await asyncio.to_thread(self.faster_whisper_backend.reset)
-                
-                # Process buffered audio with Faster-Whisper
-                await asyncio.to_thread(
-                    self.faster_whisper_backend.process_audio,
-                    session.fw_audio_buffer
-                )
-                
-                # Call finalize() to get the final transcript
-                # (Whisper is a batch model, each chunk is effectively final)
-                result = await asyncio.to_thread(self.faster_whisper_backend.finalize)
-            
-            if result and result.get("text"):
-                transcript = result["text"].strip()
-                is_final = result.get("type") == "final"
-                logging.info("📝 STT RESULT - Faster-Whisper transcript: '%s' (final=%s)", transcript, is_final)
-                updates.append({
-                    "type": "stt_result",
-                    "is_final": is_final,
-                    "text": transcript,
-                    "transcript": transcript,
-                })
-            
-            # Clear buffer after processing
-            session.fw_audio_buffer = b""
-            
-        except Exception as exc:
-            logging.error("Faster-Whisper STT stream processing failed: %s", exc, exc_info=True)
-            session.fw_audio_buffer = b""
-
-        return updates
+        return await self._process_stt_stream_whisper(
+            session, audio_data, input_rate, self.faster_whisper_backend, "Faster-Whisper"
+        )
 
     async def _process_stt_stream_whisper_cpp(
         self,
@@ -2136,66 +2141,134 @@ class LocalAIServer:
         if not self.whisper_cpp_backend:
             logging.error("Whisper.cpp STT backend not initialized")
             return []
+        return await self._process_stt_stream_whisper(
+            session, audio_data, input_rate, self.whisper_cpp_backend, "Whisper.cpp"
+        )
 
-        # Buffer audio for Whisper.cpp (needs sufficient audio for transcription)
-        if not hasattr(session, 'wcpp_audio_buffer'):
-            session.wcpp_audio_buffer = b""
-        
+    async def _process_stt_stream_whisper(
+        self,
+        session: SessionContext,
+        audio_data: bytes,
+        input_rate: int,
+        backend: Any,
+        label: str,
+    ) -> List[Dict[str, Any]]:
+        """Shared Whisper streaming path.
+
+        The model is shared across calls; each session owns its stream state
+        (``session.whisper_stream``), and decodes from all sessions are
+        coalesced by the backend's batch scheduler rather than serialized
+        behind a lock.
+        """
         # Resample to 16kHz if needed
-        if input_rate != PCM16_TARGET_RATE:
-            audio_bytes = await asyncio.to_thread(
-                self.audio_processor.resample_audio,
-                audio_data,
-                input_rate,
-                PCM16_TARGET_RATE,
-                "raw",
-                "raw",
-            )
-        else:
-            audio_bytes = audio_data
+        audio_bytes = self._resample_stt_input(session, audio_data, input_rate)
+
+        if session.whisper_stream is None:
+            session.whisper_stream = backend.create_stream()
+            if session.whisper_stream is None:
+                logging.error("%s stream unavailable", label)
+                return []
+        stream = session.whisper_stream
+
+        if backend.incremental:
+            result = await self._run_whisper_locked(session, backend.process_audio, stream, audio_bytes)
+            return self._whisper_result_updates(result, label)
+
+        # Buffer audio (Whisper needs sufficient audio for transcription)
+        session.whisper_audio_buffer += audio_bytes
 
-        session.wcpp_audio_buffer += audio_bytes
-        
         # Only process when we have enough audio (e.g., 1 second = 32000 bytes at 16kHz mono 16-bit)
         MIN_BUFFER_SIZE = 32000  # 1 second of audio
-        if len(session.wcpp_audio_buffer) < MIN_BUFFER_SIZE:
+        if len(session.whisper_audio_buffer) < MIN_BUFFER_SIZE:
             return []
 
         updates: List[Dict[str, Any]] = []
-        
+        buffered = session.whisper_audio_buffer
+        session.whisper_audio_buffer = b""
+
         try:
-            # Reset backend's internal buffer since we manage our own buffer
-            await asyncio.to_thread(self.whisper_cpp_backend.reset)
-            
-            # Process buffered audio with Whisper.cpp
-            await asyncio.to_thread(
-                self.whisper_cpp_backend.process_audio,
-                session.wcpp_audio_buffer
-            )
-            
-            # Call finalize() to get the final transcript
-            result = await asyncio.to_thread(self.whisper_cpp_backend.finalize)
-            
+            # Whisper is a batch model, each chunk is effectively final
+            result = await self._run_whisper_locked(session, self._decode_whisper_chunk, backend, stream, buffered)
+
             if result and result.get("text"):
                 transcript = result["text"].strip()
                 is_final = result.get("type") == "final"
-                logging.info("📝 STT RESULT - Whisper.cpp transcript: '%s' (final=%s)", transcript, is_final)
+                logging.info("📝 STT RESULT - %s transcript: '%s' (final=%s)", label, transcript, is_final)
                 updates.append({
                     "type": "stt_result",
                     "is_final": is_final,
                     "text": transcript,
                     "transcript": transcript,
                 })
-            
-            # Clear buffer after processing
-            session.wcpp_audio_buffer = b""
-            
+
         except Exception as exc:
-            logging.error("Whisper.cpp STT stream processing failed: %s", exc, exc_info=True)
-            session.wcpp_audio_buffer = b""
+            logging.error("%s STT stream processing failed: %s", label, exc, exc_info=True)
+            backend.reset(stream)
 
         return updates
 
+    @staticmethod
+    async def _run_whisper_locked(session: SessionContext, func: Any, *args: Any) -> Any:
+        """Run a blocking call on the session's Whisper stream in a worker thread.
+
+        Calls are serialized by ``session.whisper_lock``. The lock is released
+        only when the thread returns, even if the awaiting task is cancelled
+        (a worker thread cannot be interrupted), so a feed and a finalize
+        never touch the decoder at the same time.
+        """
+        await session.whisper_lock.acquire()
+        work = asyncio.ensure_future(asyncio.to_thread(func, *args))
+
+        def _release(fut: asyncio.Future) -> None:
+            session.whisper_lock.release()
+            if not fut.cancelled():
+                fut.exception()  # retrieved by the caller unless it was cancelled
+
+        work.add_done_callback(_release)
+        return await asyncio.shield(work)
+
+    @staticmethod
+    def _decode_whisper_chunk(backend: Any, stream: Any, audio_bytes: bytes) -> Optional[Dict[str, Any]]:
+        """Decode one buffered chunk on a session stream (runs off the event loop)."""
+        backend.reset(stream)
+        backend.process_audio(stream, audio_bytes)
+        return backend.finalize(stream)
+
+    @staticmethod
+    def _finalize_whisper_decoder(backend: Any, stream: Any) -> Optional[Dict[str, Any]]:
+        """Flush an incremental decoder, resetting it on failure (runs off the event loop)."""
+        try:
+            return backend.finalize(stream)
+        except Exception as exc:
+            logging.error("Incremental Whisper finalize failed: %s", exc, exc_info=True)
+            backend.reset(stream)
+            return None
+
+    async def _finalize_whisper_stream(self, session: SessionContext) -> Optional[Dict[str, Any]]:
+        """Flush the session's incremental Whisper decoder (idle finalizer path)."""
+        stream = session.whisper_stream
+        backend = self.faster_whisper_backend if self.stt_backend == "faster_whisper" else self.whisper_cpp_backend
+        if stream is None or backend is None or not backend.incremental:
+            return None
+        return await self._run_whisper_locked(session, self._finalize_whisper_decoder, backend, stream)
+
+    @staticmethod
+    def _whisper_result_updates(result: Optional[Dict[str, Any]], label: str) -> List[Dict[str, Any]]:
+        if not result or not result.get("text"):
+            return []
+        text = result["text"].strip()
+        is_final = result.get("type") == "final"
+        if is_final:
+            logging.info("📝 STT RESULT - %s final transcript: '%s'", label, text)
+        else:
+            logging.debug("📝 STT PARTIAL - %s: '%s'", label, text)
+        return [{
+            "text": text,
+            "is_final": is_final,
+            "is_partial": not is_final,
+            "confidence": None,
+        }]
+
     async def _process_stt_stream_kroko(
         self,
         session: SessionContext,
@@ -2208,17 +2281,7 @@ class LocalAIServer:
             return []
 
         # Resample to 16kHz if needed
-        if input_rate != PCM16_TARGET_RATE:
-            audio_bytes = await asyncio.to_thread(
-                self.audio_processor.resample_audio,
-                audio_data,
-                input_rate,
-                PCM16_TARGET_RATE,
-                "raw",
-                "raw",
-            )
-        else:
-            audio_bytes = audio_data
+        audio_bytes = self._resample_stt_input(session, audio_data, input_rate)
 
         updates: List[Dict[str, Any]] = []
 
@@ -2286,17 +2349,7 @@ class LocalAIServer:
             return []
 
         # Resample to 16kHz if needed
-        if input_rate != PCM16_TARGET_RATE:
-            audio_bytes = await asyncio.to_thread(
-                self.audio_processor.resample_audio,
-                audio_data,
-                input_rate,
-                PCM16_TARGET_RATE,
-                "raw",
-                "raw",
-            )
-        else:
-            audio_bytes = audio_data
+        audio_bytes = self._resample_stt_input(session, audio_data, input_rate)
 
         updates: List[Dict[str, Any]] = []
 
@@ -2359,16 +2412,7 @@ class LocalAIServer:
                 PCM16_TARGET_RATE,
                 len(audio_data),
             )
-            audio_bytes = await asyncio.to_thread(
-                self.audio_processor.resample_audio,
-                audio_data,
-                input_rate,
-                PCM16_TARGET_RATE,
-                "raw",
-                "raw",
-            )
-        else:
-            audio_bytes = audio_data
+        audio_bytes = self._resample_stt_input(session, audio_data, input_rate)
 
         updates: List[Dict[str, Any]] = []
 
@@ -2579,6 +2623,15 @@ class LocalAIServer:
             if not await self._send_json(websocket, metadata):
                 return
         if audio_bytes:
+            if session.framed:
+                # Other calls share this connection; the frame header names the call.
+                audio_bytes = encode_frame(
+                    FRAME_TTS_AUDIO,
+                    session.call_id,
+                    audio_bytes,
+                    mode=source_mode,
+                    rate=ULAW_SAMPLE_RATE,
+                )
             await self._send_bytes(websocket, audio_bytes)
 
     async def _handle_final_transcript(
@@ -2703,6 +2756,12 @@ class LocalAIServer:
         )
 
         infer_timeout = self.config.llm_infer_timeout_sec
+        response_mode = mode if mode != "full" else "llm"
+        partials = (
+            self._llm_partial_stream(websocket, session, request_id, source_mode=response_mode)
+            if session.llm_stream
+            else None
+        )
         try:
             logging.info(
                 "🧠 LLM START - Generating response call_id=%s mode=%s preview=%s",
@@ -2710,8 +2769,11 @@ class LocalAIServer:
                 mode,
                 prompt_text[:80],
             )
+            # Not shielded: on timeout the scheduler drops the turn instead of
+            # finishing it for nobody (its worker task is never cancelled mid-slice).
             llm_response = await asyncio.wait_for(
-                asyncio.shield(self.process_llm(prompt_text)), timeout=infer_timeout
+                self.process_llm(prompt_text, session, partials.push if partials else None),
+                timeout=infer_timeout,
             )
         except asyncio.TimeoutError:
             logging.warning(
@@ -2730,13 +2792,15 @@ class LocalAIServer:
                 exc_info=True,
             )
             llm_response = "I'm here to help you. Could you please repeat that?"
+        if partials is not None:
+            await partials.close()
 
         if not await self._emit_llm_response(
             websocket,
             llm_response,
             session,
             request_id,
-            source_mode=mode if mode != "full" else "llm",
+            source_mode=response_mode,
         ):
             return
 
@@ -2770,12 +2834,15 @@ class LocalAIServer:
                 timeout_sec = max(self.buffer_timeout_ms / 1000.0, 0.1)
                 await asyncio.sleep(timeout_sec)
                 recognizer = session.recognizer
-                if recognizer is None:
+                if recognizer is not None:
+                    try:
+                        result = json.loads(recognizer.FinalResult() or "{}")
+                    except json.JSONDecodeError:
+                        result = {}
+                elif session.whisper_stream is not None:
+                    result = await self._finalize_whisper_stream(session) or {}
+                else:
                     return
-                try:
-                    result = json.loads(recognizer.FinalResult() or "{}")
-                except json.JSONDecodeError:
-                    result = {}
                 text = (result.get("text") or "").strip()
                 confidence = result.get("confidence")
                 logging.info(
@@ -2845,11 +2912,12 @@ class LocalAIServer:
                 return
         else:
             audio_bytes = incoming_bytes
-            logging.info(
-                "🎤 AUDIO (binary) call_id=%s bytes=%d",
-                call_id or "unknown",
-                len(audio_bytes),
-            )
+            if DEBUG_AUDIO_FLOW:
+                logging.debug(
+                    "🎤 AUDIO (binary) call_id=%s bytes=%d",
+                    call_id or "unknown",
+                    len(audio_bytes),
+                )
 
         if not audio_bytes:
             logging.debug("Audio payload empty after decoding")
@@ -3019,14 +3087,22 @@ class LocalAIServer:
         )
 
         infer_timeout = self.config.llm_infer_timeout_sec
+        stream = bool(data.get("stream", session.llm_stream))
+        partials = (
+            self._llm_partial_stream(websocket, session, request_id, source_mode=mode or "llm")
+            if stream
+            else None
+        )
         try:
             logging.info(
                 "🧠 LLM START - Generating response call_id=%s mode=%s",
                 session.call_id,
                 mode or "llm",
             )
+            # Not shielded: see _handle_final_transcript.
             llm_response = await asyncio.wait_for(
-                asyncio.shield(self.process_llm(text)), timeout=infer_timeout
+                self.process_llm(text, on_partial=partials.push if partials else None),
+                timeout=infer_timeout,
             )
         except asyncio.TimeoutError:
             logging.warning(
@@ -3045,6 +3121,8 @@ class LocalAIServer:
                 exc_info=True,
             )
             llm_response = "I'm here to help you. Could you please repeat that?"
+        if partials is not None:
+            await partials.close()
 
         await self._emit_llm_response(
             websocket,
@@ -24,12 +24,25 @@ class SessionContext:
     last_final_norm: str = ""
     last_final_at: float = 0.0
     llm_user_turns: List[str] = field(default_factory=list)
+    # Send llm_partial chunks while the LLM generates (set_mode "llm_stream")
+    llm_stream: bool = False
     audio_buffer: bytes = b""
+    # In-process streaming resampler for STT input (created on first audio)
+    stt_resampler: Optional[Any] = None
     # Kroko-specific session state
     kroko_ws: Optional[Any] = None
     kroko_connected: bool = False
     # Sherpa-onnx session state
     sherpa_stream: Optional[Any] = None
+    # Whisper session state (faster_whisper / whisper_cpp); the model itself is shared
+    whisper_stream: Optional[Any] = None
+    whisper_audio_buffer: bytes = b""
+    # Serializes decoder calls on whisper_stream (audio feed vs. idle finalizer)
+    whisper_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     # Optional auth state (enabled if LOCAL_WS_AUTH_TOKEN set)
     authenticated: bool = False
+    # Call multiplexed on a binary-framed connection: TTS audio goes out as frames
+    framed: bool = False
+    # Per-call state once the connection negotiated binary framing (connection session only)
+    mux: Optional[Any] = None
 
@@ -38,6 +38,31 @@ def _stt_status(server) -> Tuple[bool, Optional[str], Optional[str]]:
     return False, None, None
 
 
+def _stt_batching(server) -> Optional[Dict[str, Any]]:
+    backend = None
+    if server.stt_backend == "faster_whisper":
+        backend = getattr(server, "faster_whisper_backend", None)
+    elif server.stt_backend == "whisper_cpp":
+        backend = getattr(server, "whisper_cpp_backend", None)
+    scheduler = getattr(backend, "scheduler", None)
+    return scheduler.stats() if scheduler is not None else None
+
+
+def _llm_state_cache(server) -> Optional[Dict[str, Any]]:
+    cache = getattr(server, "llm_state_cache", None)
+    return cache.stats() if cache is not None else None
+
+
+def _llm_scheduler(server) -> Optional[Dict[str, Any]]:
+    scheduler = getattr(server, "llm_scheduler", None)
+    return scheduler.stats() if scheduler is not None else None
+
+
+def _llm_turn_timings(server) -> Optional[Dict[str, Any]]:
+    turn_stats = getattr(server, "llm_turn_stats", None)
+    return turn_stats.stats() if turn_stats is not None else None
+
+
 def _tts_status(server) -> Tuple[bool, Optional[str], Optional[str]]:
     if server.tts_backend == "piper":
         loaded = server.mock_models or server.tts_model is not None
@@ -87,6 +112,7 @@ def build_status_response(server) -> Dict[str, Any]:
                 "loaded": stt_loaded,
                 "path": stt_path,
                 "display": stt_display,
+                "batching": _stt_batching(server),
             },
             "llm": {
                 "loaded": llm_loaded,
@@ -97,6 +123,9 @@ def build_status_response(server) -> Dict[str, Any]:
                     "threads": server.llm_threads,
                     "batch": server.llm_batch,
                 },
+                "state_cache": _llm_state_cache(server),
+                "turn_timings": _llm_turn_timings(server),
+                "scheduler": _llm_scheduler(server),
             },
             "tts": {
                 "backend": server.tts_backend,
@@ -4,7 +4,9 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from websockets.exceptions import ConnectionClosed
@@ -334,15 +336,363 @@ class SherpaONNXSTTBackend:
         logging.info("🛑 SHERPA - Recognizer shutdown")
 
 
-class FasterWhisperSTTBackend:
+class AudioRingBuffer:
+    """Preallocated float32 ring buffer for streaming audio.
+
+    Appends and front-drops are O(chunk); ``view()`` returns a contiguous
+    array (a zero-copy slice unless the data wraps around the end).
+    """
+
+    def __init__(self, capacity: int):
+        self._buf = np.zeros(max(1, int(capacity)), dtype=np.float32)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._buf.size
+
+    def append(self, samples: np.ndarray) -> None:
+        n = samples.size
+        if n == 0:
+            return
+        if self._size + n > self._buf.size:
+            self._grow(self._size + n)
+        end = (self._start + self._size) % self._buf.size
+        first = min(n, self._buf.size - end)
+        self._buf[end:end + first] = samples[:first]
+        if first < n:
+            self._buf[: n - first] = samples[first:]
+        self._size += n
+
+    def drop(self, n: int) -> None:
+        n = max(0, min(int(n), self._size))
+        self._start = (self._start + n) % self._buf.size
+        self._size -= n
+        if self._size == 0:
+            self._start = 0
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def view(self) -> np.ndarray:
+        end = self._start + self._size
+        if end <= self._buf.size:
+            return self._buf[self._start:end]
+        return np.concatenate((self._buf[self._start:], self._buf[: end - self._buf.size]))
+
+    def _grow(self, needed: int) -> None:
+        data = self.view().copy()
+        self._buf = np.zeros(max(needed, self._buf.size * 2), dtype=np.float32)
+        self._buf[: data.size] = data
+        self._start = 0
+
+
+@dataclass
+class _TimedWord:
+    start: float
+    end: float
+    text: str
+
+
+# (audio window, prompt, final) -> [(start_sec, end_sec, text), ...]
+WindowTranscriber = Callable[[np.ndarray, str, bool], Sequence[Tuple[float, float, str]]]
+
+_WORD_NORMALIZE = re.compile(r"[^\w']+")
+
+
+def _norm_word(word: str) -> str:
+    return _WORD_NORMALIZE.sub("", word.lower())
+
+
+class IncrementalWhisperDecoder:
+    """
+    Sliding-window incremental decoding for Whisper-style batch models.
+
+    Audio is kept in a preallocated ring buffer.  Every ``partial_interval_ms``
+    of new audio the current window is transcribed; words on which two
+    consecutive hypotheses agree are committed (LocalAgreement-2).  Once a
+    segment is fully committed its audio is dropped from the window using the
+    segment timestamps, so each decode only covers the uncommitted tail and
+    per-utterance cost grows linearly with utterance length instead of
+    quadratically.  ``max_window_sec`` bounds the window if agreement stalls.
+    """
+
+    def __init__(
+        self,
+        transcribe: WindowTranscriber,
+        *,
+        sample_rate: int = PCM16_TARGET_RATE,
+        partial_interval_ms: int = 500,
+        min_audio_ms: int = 1000,
+        max_window_sec: float = 15.0,
+        endpoint_silence_ms: int = 0,
+        silence_threshold: float = 0.01,
+        prompt_chars: int = 200,
+    ):
+        self._transcribe = transcribe
+        self.sample_rate = int(sample_rate)
+        self.partial_interval = int(self.sample_rate * max(partial_interval_ms, 20) / 1000)
+        self.min_audio = int(self.sample_rate * max(min_audio_ms, 0) / 1000)
+        self.max_window = int(self.sample_rate * max(max_window_sec, 1.0))
+        self.endpoint_silence = int(self.sample_rate * max(endpoint_silence_ms, 0) / 1000)
+        self.silence_threshold = float(silence_threshold)
+        self.prompt_chars = int(prompt_chars)
+        self._ring = AudioRingBuffer(self.max_window + self.partial_interval)
+        # Stats for benchmarks/status: decodes run and samples fed to the model.
+        self.decode_count = 0
+        self.decoded_samples = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self._ring.clear()
+        self._offset = 0.0  # absolute time (sec) of the ring's first sample
+        self._committed: List[_TimedWord] = []
+        self._hypothesis: List[_TimedWord] = []
+        self._pending = 0  # samples fed since the last decode
+        self._silence = 0  # trailing low-energy samples
+        self._heard_speech = False
+        self._last_emitted = ""
+
+    @property
+    def committed_text(self) -> str:
+        return " ".join(w.text for w in self._committed)
+
+    @property
+    def buffered_seconds(self) -> float:
+        return len(self._ring) / self.sample_rate
+
+    def feed(self, pcm16_audio: bytes) -> Optional[Dict[str, Any]]:
+        """Add PCM16 audio; returns a partial/final result dict or ``None``."""
+        samples = np.frombuffer(pcm16_audio, dtype=np.int16).astype(np.float32) / 32768.0
+        return self.feed_float(samples)
+
+    def feed_float(self, samples: np.ndarray) -> Optional[Dict[str, Any]]:
+        if samples.size == 0:
+            return None
+        self._ring.append(samples)
+        self._pending += samples.size
+
+        if self.endpoint_silence:
+            rms = float(np.sqrt(np.mean(samples * samples)))
+            if rms < self.silence_threshold:
+                self._silence += samples.size
+            else:
+                self._silence = 0
+                self._heard_speech = True
+            if self._heard_speech and self._silence >= self.endpoint_silence:
+                return self.finalize()
+
+        if len(self._ring) < self.min_audio or self._pending < self.partial_interval:
+            return None
+        return self._decode_partial()
+
+    def finalize(self) -> Optional[Dict[str, Any]]:
+        """Decode the remaining window and return the full utterance as final."""
+        text = self.committed_text
+        if len(self._ring) >= max(self.min_audio // 4, 1):
+            words, _ = self._run(final=True)
+            tail = " ".join(w.text for w in words)
+            text = f"{text} {tail}".strip() if tail else text
+        self.reset()
+        if text:
+            return {"type": "final", "text": text}
+        return None
+
+    def _run(self, final: bool) -> Tuple[List[_TimedWord], List[Tuple[float, float]]]:
+        """Transcribe the window; return new words and absolute segment spans."""
+        window = self._ring.view()
+        prompt = self.committed_text[-self.prompt_chars:] if self.prompt_chars else ""
+        segments = self._transcribe(window, prompt, final)
+        self.decode_count += 1
+        self.decoded_samples += window.size
+        self._pending = 0
+
+        committed_end = self._committed[-1].end if self._committed else self._offset
+        words: List[_TimedWord] = []
+        spans: List[Tuple[float, float]] = []
+        for seg_start, seg_end, seg_text in segments:
+            start = self._offset + float(seg_start)
+            end = self._offset + float(seg_end)
+            spans.append((start, end))
+            tokens = (seg_text or "").split()
+            if not tokens:
+                continue
+            step = (end - start) / len(tokens)
+            for i, token in enumerate(tokens):
+                w = _TimedWord(start + i * step, start + (i + 1) * step, token)
+                # Skip words that belong to audio already committed.
+                if w.start >= committed_end - 0.1 or not self._committed:
+                    words.append(w)
+        return words, spans
+
+    def _decode_partial(self) -> Optional[Dict[str, Any]]:
+        words, spans = self._run(final=False)
+
+        agreed = 0
+        for prev, cur in zip(self._hypothesis, words):
+            if _norm_word(prev.text) != _norm_word(cur.text):
+                break
+            agreed += 1
+        self._committed.extend(words[:agreed])
+        self._hypothesis = words[agreed:]
+
+        # Drop audio for segments whose words are all committed.
+        committed_end = self._committed[-1].end if self._committed else self._offset
+        cut = self._offset
+        for start, end in spans:
+            if end <= committed_end + 1e-3:
+                cut = end
+        if len(self._ring) > self.max_window:
+            # Agreement stalled: force-commit the hypothesis and slide the window.
+            self._committed.extend(self._hypothesis)
+            self._hypothesis = []
+            cut = max(cut, spans[-1][1] if spans else self._offset)
+        self._trim_to(cut)
+        if len(self._ring) > self.max_window:
+            self._trim_to(self._offset + (len(self._ring) - self.max_window) / self.sample_rate)
+
+        text = " ".join(w.text for w in self._committed + self._hypothesis)
+        if text and text != self._last_emitted:
+            self._last_emitted = text
+            return {"type": "partial", "text": text}
+        return None
+
+    def _trim_to(self, abs_time: float) -> None:
+        drop = int(round((abs_time - self._offset) * self.sample_rate))
+        if drop <= 0:
+            return
+        drop = min(drop, len(self._ring))
+        self._ring.drop(drop)
+        self._offset += drop / self.sample_rate
+
+
+class WhisperStream:
+    """Per-session state for buffered (non-incremental) Whisper decoding."""
+
+    __slots__ = ("audio_buffer", "last_text")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.audio_buffer = np.array([], dtype=np.float32)
+        self.last_text = ""
+
+
+class _WhisperModelMixin:
+    """
+    Shared-model plumbing for the Whisper backends.
+
+    The backend instance only holds the loaded model and its settings; every
+    call gets its own stream from ``create_stream()`` (a ``WhisperStream`` or,
+    in incremental mode, an ``IncrementalWhisperDecoder``).  Model access goes
+    through a ``WhisperBatchScheduler`` once ``enable_batching()`` has been
+    called, so concurrent sessions are coalesced instead of serialised.
+    """
+
+    _LOG_TAG = "WHISPER"
+
+    def _init_streaming(
+        self,
+        incremental: bool,
+        partial_interval_ms: int,
+        max_window_sec: float,
+        endpoint_silence_ms: int,
+    ) -> None:
+        self.incremental = incremental
+        self.partial_interval_ms = partial_interval_ms
+        self.max_window_sec = max_window_sec
+        self.endpoint_silence_ms = endpoint_silence_ms
+        self.supports_batching = False
+        self.scheduler = None
+        # Minimum audio length for buffered processing (1.5 seconds)
+        self._min_audio_length = int(self.sample_rate * 1.5)
+
+    def enable_batching(self, max_batch: int = 8, max_wait_ms: int = 10) -> None:
+        """Route all model calls through a cross-session batching scheduler."""
+        from stt_scheduler import WhisperBatchScheduler
+
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        self.scheduler = WhisperBatchScheduler(
+            self, max_batch=max_batch, max_wait_ms=max_wait_ms, name=self._LOG_TAG.lower()
+        )
+        self.scheduler.start()
+
+    def create_stream(self) -> Any:
+        """Create per-session decoding state bound to the shared model."""
+        if not self._initialized or self.model is None:
+            return None
+        if self.incremental:
+            return self.create_decoder()
+        return WhisperStream()
+
+    def create_decoder(self) -> IncrementalWhisperDecoder:
+        """Create an incremental decoder bound to this backend's model."""
+        return IncrementalWhisperDecoder(
+            self.transcribe_window,
+            sample_rate=self.sample_rate,
+            partial_interval_ms=self.partial_interval_ms,
+            max_window_sec=self.max_window_sec,
+            endpoint_silence_ms=self.endpoint_silence_ms,
+        )
+
+    def transcribe_window(
+        self, audio: np.ndarray, prompt: str = "", final: bool = False
+    ) -> List[Tuple[float, float, str]]:
+        """Decode one window, via the batching scheduler when enabled (blocking)."""
+        scheduler = self.scheduler
+        if scheduler is not None and scheduler.running:
+            return scheduler.transcribe(audio, prompt, final)
+        return self._transcribe_window(audio, prompt, final)
+
+    def transcribe(self, pcm16_audio: bytes) -> str:
+        """One-shot final transcription of a PCM16 16 kHz buffer."""
+        if not self._initialized or self.model is None or not pcm16_audio:
+            return ""
+        samples = np.frombuffer(pcm16_audio, dtype=np.int16).astype(np.float32) / 32768.0
+        segments = self.transcribe_window(samples, "", True)
+        return " ".join(text.strip() for _s, _e, text in segments if text).strip()
+
+    def reset(self, stream: Any) -> None:
+        """Clear a session's stream state."""
+        if stream is not None:
+            stream.reset()
+
+    def close_stream(self, stream: Any) -> None:
+        self.reset(stream)
+
+    def _incremental_call(self, decoder: IncrementalWhisperDecoder, fn) -> Optional[Dict[str, Any]]:
+        try:
+            return fn(decoder)
+        except Exception as exc:
+            logging.error("❌ %s - Incremental decode error: %s", self._LOG_TAG, exc)
+            decoder.reset()
+            return None
+
+    def _stop_scheduler(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.scheduler = None
+
+
+class FasterWhisperSTTBackend(_WhisperModelMixin):
     """
     Faster-Whisper STT backend using CTranslate2-optimized Whisper.
     
     Provides high-accuracy transcription with good performance on both CPU and GPU.
     Uses chunked processing for pseudo-streaming (Whisper is not natively streaming).
+    The model is shared; per-call state lives in streams from ``create_stream()``.
     
     Model sizes: tiny, base, small, medium, large-v2, large-v3
     """
+
+    _LOG_TAG = "FASTER-WHISPER"
     
     def __init__(
         self,
@@ -351,6 +701,10 @@ class FasterWhisperSTTBackend:
         compute_type: str = "int8",
         language: str = "en",
         sample_rate: int = 16000,
+        incremental: bool = False,
+        partial_interval_ms: int = 500,
+        max_window_sec: float = 15.0,
+        endpoint_silence_ms: int = 0,
     ):
         """
         Initialize Faster-Whisper backend.
@@ -361,6 +715,10 @@ class FasterWhisperSTTBackend:
             compute_type: Computation type (int8, float16, float32)
             language: Language code for transcription
             sample_rate: Audio sample rate (default 16000 Hz)
+            incremental: Use sliding-window incremental decoding (see IncrementalWhisperDecoder)
+            partial_interval_ms: Incremental mode partial-emit cadence
+            max_window_sec: Incremental mode maximum decode window
+            endpoint_silence_ms: Incremental mode trailing silence that finalizes (0 = caller finalizes)
         """
         self.model_size = model_size
         self.device = device
@@ -369,12 +727,8 @@ class FasterWhisperSTTBackend:
         self.sample_rate = sample_rate
         self.model = None
         self._initialized = False
-        # Audio buffer for chunked processing
-        self._audio_buffer = np.array([], dtype=np.float32)
-        # Minimum audio length for processing (1.5 seconds)
-        self._min_audio_length = int(sample_rate * 1.5)
-        # Last transcript to detect changes
-        self._last_text = ""
+        self._tokenizer = None
+        self._init_streaming(incremental, partial_interval_ms, max_window_sec, endpoint_silence_ms)
     
     def initialize(self) -> bool:
         """Initialize the Faster-Whisper model."""
@@ -400,9 +754,13 @@ class FasterWhisperSTTBackend:
                 device=device,
                 compute_type=self.compute_type,
             )
+            self.supports_batching = self._detect_batching()
             
             self._initialized = True
-            logging.info("✅ FASTER-WHISPER - Model loaded successfully")
+            logging.info(
+                "✅ FASTER-WHISPER - Model loaded successfully (batched decode=%s)",
+                self.supports_batching,
+            )
             return True
             
         except ImportError:
@@ -411,23 +769,43 @@ class FasterWhisperSTTBackend:
         except Exception as exc:
             logging.error("❌ FASTER-WHISPER - Failed to initialize: %s", exc)
             return False
+
+    def _detect_batching(self) -> bool:
+        """CTranslate2 Whisper can encode/generate a batch of 30 s windows in one call."""
+        try:
+            from faster_whisper.audio import pad_or_trim  # noqa: F401
+            from faster_whisper.tokenizer import Tokenizer
+
+            self._tokenizer = Tokenizer(
+                self.model.hf_tokenizer,
+                self.model.model.is_multilingual,
+                task="transcribe",
+                language=self.language if self.model.model.is_multilingual else None,
+            )
+            return hasattr(self.model, "encode") and hasattr(self.model.model, "generate")
+        except Exception as exc:
+            logging.debug("FASTER-WHISPER - Batched decode unavailable: %s", exc)
+            return False
     
-    def process_audio(self, pcm16_audio: bytes) -> Optional[Dict[str, Any]]:
+    def process_audio(self, stream: Any, pcm16_audio: bytes) -> Optional[Dict[str, Any]]:
         """
-        Process PCM16 audio and return transcript.
+        Process PCM16 audio for one session and return transcript.
         
         Buffers audio and processes when enough has accumulated.
         Returns partial results during buffering, final on silence detection.
         
         Args:
+            stream: Session state from create_stream()
             pcm16_audio: Audio in PCM16 format, 16kHz mono
             
         Returns:
             Dict with keys: type ("partial"|"final"), text
             None if no result yet
         """
-        if not self._initialized or self.model is None:
+        if stream is None or not self._initialized or self.model is None:
             return None
+        if isinstance(stream, IncrementalWhisperDecoder):
+            return self._incremental_call(stream, lambda d: d.feed(pcm16_audio))
         
         try:
             # Convert PCM16 to float32
@@ -435,30 +813,25 @@ class FasterWhisperSTTBackend:
             float_samples = samples.astype(np.float32) / 32768.0
             
             # Add to buffer
-            self._audio_buffer = np.concatenate([self._audio_buffer, float_samples])
+            stream.audio_buffer = np.concatenate([stream.audio_buffer, float_samples])
             
             # Only process if we have enough audio
-            if len(self._audio_buffer) < self._min_audio_length:
+            if len(stream.audio_buffer) < self._min_audio_length:
                 return None
             
-            # Transcribe the buffered audio
-            # Disable VAD for telephony audio - it often filters out speech
-            segments, info = self.model.transcribe(
-                self._audio_buffer,
-                language=self.language,
-                beam_size=1,  # Faster decoding
-                vad_filter=False,  # Disabled - telephony audio often misdetected as silence
-            )
+            # Transcribe the buffered audio (greedy, no VAD - telephony audio
+            # is often misdetected as silence)
+            segments = self.transcribe_window(stream.audio_buffer, "", False)
             
             # Collect all segment texts
-            text = " ".join(segment.text.strip() for segment in segments)
+            text = " ".join(text.strip() for _s, _e, text in segments)
             
             if not text:
                 return None
             
             # Check if text changed (indicates ongoing speech)
-            if text != self._last_text:
-                self._last_text = text
+            if text != stream.last_text:
+                stream.last_text = text
                 return {"type": "partial", "text": text}
             
             return None
@@ -467,33 +840,29 @@ class FasterWhisperSTTBackend:
             logging.error("❌ FASTER-WHISPER - Transcription error: %s", exc)
             return None
     
-    def finalize(self) -> Optional[Dict[str, Any]]:
+    def finalize(self, stream: Any) -> Optional[Dict[str, Any]]:
         """
-        Finalize transcription and return final result.
+        Finalize transcription for one session and return final result.
         
         Called when speech ends (silence detected).
-        Clears the buffer and returns final transcript.
+        Clears the session buffer and returns final transcript.
         """
-        if not self._initialized or self.model is None:
+        if stream is None or not self._initialized or self.model is None:
             return None
+        if isinstance(stream, IncrementalWhisperDecoder):
+            return self._incremental_call(stream, lambda d: d.finalize())
         
-        if len(self._audio_buffer) == 0:
+        if len(stream.audio_buffer) == 0:
             return None
         
         try:
-            # Transcribe remaining audio
-            segments, info = self.model.transcribe(
-                self._audio_buffer,
-                language=self.language,
-                beam_size=5,  # Better quality for final
-                vad_filter=True,
-            )
+            # Transcribe remaining audio (beam search + VAD for the final pass)
+            segments = self.transcribe_window(stream.audio_buffer, "", True)
             
-            text = " ".join(segment.text.strip() for segment in segments)
+            text = " ".join(text.strip() for _s, _e, text in segments)
             
             # Clear buffer
-            self._audio_buffer = np.array([], dtype=np.float32)
-            self._last_text = ""
+            stream.reset()
             
             if text:
                 return {"type": "final", "text": text}
@@ -501,37 +870,120 @@ class FasterWhisperSTTBackend:
             
         except Exception as exc:
             logging.error("❌ FASTER-WHISPER - Finalize error: %s", exc)
-            self._audio_buffer = np.array([], dtype=np.float32)
+            stream.reset()
             return None
-    
-    def reset(self) -> None:
-        """Reset the audio buffer."""
-        self._audio_buffer = np.array([], dtype=np.float32)
-        self._last_text = ""
+
+    def _transcribe_window(
+        self, audio: np.ndarray, prompt: str, final: bool
+    ) -> List[Tuple[float, float, str]]:
+        segments, _info = self.model.transcribe(
+            audio,
+            language=self.language,
+            beam_size=5 if final else 1,
+            vad_filter=final,
+            initial_prompt=prompt or None,
+        )
+        return [(seg.start, seg.end, seg.text) for seg in segments]
+
+    def transcribe_batch(
+        self, windows: Sequence[Tuple[np.ndarray, str]], final: bool
+    ) -> List[List[Tuple[float, float, str]]]:
+        """
+        Decode several ≤30 s windows with one encoder and one generate call.
+
+        Mirrors the per-window path: greedy for partials, beam 5 for finals.
+        Finals drop windows the model scores as no-speech (stand-in for the
+        per-window VAD filter, which cannot run batched).
+        """
+        from faster_whisper.audio import pad_or_trim
+
+        tokenizer = self._tokenizer
+        extractor = self.model.feature_extractor
+        n_frames = extractor.nb_max_frames
+        features = np.stack([
+            pad_or_trim(extractor(audio)[:, :n_frames], n_frames) for audio, _prompt in windows
+        ])
+        encoder_output = self.model.encode(features)
+
+        max_prompt = self.model.max_length // 2 - 1
+        prompts = []
+        for _audio, prompt in windows:
+            tokens: List[int] = []
+            if prompt:
+                tokens = [tokenizer.sot_prev] + tokenizer.encode(" " + prompt.strip())[-max_prompt:]
+            prompts.append(tokens + list(tokenizer.sot_sequence))
+
+        results = self.model.model.generate(
+            encoder_output,
+            prompts,
+            beam_size=5 if final else 1,
+            max_length=self.model.max_length,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+            return_no_speech_prob=True,
+        )
+
+        out: List[List[Tuple[float, float, str]]] = []
+        for (audio, _prompt), result in zip(windows, results):
+            if final and getattr(result, "no_speech_prob", 0.0) > 0.6:
+                out.append([])
+                continue
+            out.append(self._segments_from_tokens(result.sequences_ids[0], audio.size / self.sample_rate))
+        return out
+
+    def _segments_from_tokens(self, tokens: Sequence[int], duration: float) -> List[Tuple[float, float, str]]:
+        """Split a timestamped token sequence into (start, end, text) segments."""
+        tokenizer = self._tokenizer
+        ts_begin = tokenizer.timestamp_begin
+        segments: List[Tuple[float, float, str]] = []
+        start = 0.0
+        text_tokens: List[int] = []
+        for token in tokens:
+            if token >= ts_begin:
+                t = (token - ts_begin) * 0.02
+                if text_tokens:
+                    segments.append((start, min(t, duration), tokenizer.decode(text_tokens).strip()))
+                    text_tokens = []
+                start = t
+            elif token < tokenizer.eot:
+                text_tokens.append(token)
+        if text_tokens:
+            segments.append((min(start, duration), duration, tokenizer.decode(text_tokens).strip()))
+        return [seg for seg in segments if seg[2]]
     
     def shutdown(self) -> None:
         """Shutdown the model."""
+        self._stop_scheduler()
         self.model = None
+        self._tokenizer = None
         self._initialized = False
-        self._audio_buffer = np.array([], dtype=np.float32)
         logging.info("🛑 FASTER-WHISPER - Model shutdown")
 
 
-class WhisperCppSTTBackend:
+class WhisperCppSTTBackend(_WhisperModelMixin):
     """
     Whisper.cpp STT backend using ggml-optimized Whisper.
     
     Uses the same ggml backend as llama-cpp-python, avoiding library conflicts
     that cause segfaults with CTranslate2 (faster-whisper).
+    The model is shared; per-call state lives in streams from ``create_stream()``.
+    pywhispercpp decodes one window per call, so the batching scheduler only
+    serialises model access for this backend.
     
     Model sizes: tiny, base, small, medium, large
     """
+
+    _LOG_TAG = "WHISPER.CPP"
     
     def __init__(
         self,
         model_path: str = "/app/models/stt/ggml-base.en.bin",
         language: str = "en",
         sample_rate: int = 16000,
+        incremental: bool = False,
+        partial_interval_ms: int = 500,
+        max_window_sec: float = 15.0,
+        endpoint_silence_ms: int = 0,
     ):
         """
         Initialize Whisper.cpp backend.
@@ -540,18 +992,17 @@ class WhisperCppSTTBackend:
             model_path: Path to ggml Whisper model file (.bin)
             language: Language code for transcription
             sample_rate: Audio sample rate (default 16000 Hz)
+            incremental: Use sliding-window incremental decoding (see IncrementalWhisperDecoder)
+            partial_interval_ms: Incremental mode partial-emit cadence
+            max_window_sec: Incremental mode maximum decode window
+            endpoint_silence_ms: Incremental mode trailing silence that finalizes (0 = caller finalizes)
         """
         self.model_path = model_path
         self.language = language
         self.sample_rate = sample_rate
         self.model = None
         self._initialized = False
-        # Audio buffer for chunked processing
-        self._audio_buffer = np.array([], dtype=np.float32)
-        # Minimum audio length for processing (1.5 seconds)
-        self._min_audio_length = int(sample_rate * 1.5)
-        # Last transcript to detect changes
-        self._last_text = ""
+        self._init_streaming(incremental, partial_interval_ms, max_window_sec, endpoint_silence_ms)
     
     def initialize(self) -> bool:
         """Initialize the Whisper.cpp model."""
@@ -603,19 +1054,22 @@ class WhisperCppSTTBackend:
             return True
         return False
     
-    def process_audio(self, pcm16_audio: bytes) -> Optional[Dict[str, Any]]:
+    def process_audio(self, stream: Any, pcm16_audio: bytes) -> Optional[Dict[str, Any]]:
         """
-        Process PCM16 audio and return transcript.
+        Process PCM16 audio for one session and return transcript.
         
         Args:
+            stream: Session state from create_stream()
             pcm16_audio: Audio in PCM16 format, 16kHz mono
             
         Returns:
             Dict with keys: type ("partial"|"final"), text
             None if no result yet
         """
-        if not self._initialized or self.model is None:
+        if stream is None or not self._initialized or self.model is None:
             return None
+        if isinstance(stream, IncrementalWhisperDecoder):
+            return self._incremental_call(stream, lambda d: d.feed(pcm16_audio))
         
         try:
             # Convert PCM16 to float32
@@ -628,23 +1082,23 @@ class WhisperCppSTTBackend:
                 return None
             
             # Add to buffer
-            self._audio_buffer = np.concatenate([self._audio_buffer, float_samples])
+            stream.audio_buffer = np.concatenate([stream.audio_buffer, float_samples])
             
             # Only process if we have enough audio
-            if len(self._audio_buffer) < self._min_audio_length:
+            if len(stream.audio_buffer) < self._min_audio_length:
                 return None
             
             # Check buffer energy before processing
-            buffer_energy = self._compute_energy(self._audio_buffer)
+            buffer_energy = self._compute_energy(stream.audio_buffer)
             if buffer_energy < 0.02:  # Buffer too quiet
-                self._audio_buffer = np.array([], dtype=np.float32)
+                stream.reset()
                 return None
             
             # Transcribe the buffered audio
-            segments = self.model.transcribe(self._audio_buffer)
+            segments = self.transcribe_window(stream.audio_buffer, "", False)
             
             # Collect all segment texts
-            text = " ".join(seg.text.strip() for seg in segments if seg.text)
+            text = " ".join(text for _s, _e, text in segments)
             
             if not text:
                 return None
@@ -655,8 +1109,8 @@ class WhisperCppSTTBackend:
                 return None
             
             # Check if text changed (indicates ongoing speech)
-            if text != self._last_text:
-                self._last_text = text
+            if text != stream.last_text:
+                stream.last_text = text
                 return {"type": "partial", "text": text}
             
             return None
@@ -665,35 +1119,39 @@ class WhisperCppSTTBackend:
             logging.error("❌ WHISPER.CPP - Transcription error: %s", exc)
             return None
     
-    def finalize(self) -> Optional[Dict[str, Any]]:
+    def finalize(self, stream: Any) -> Optional[Dict[str, Any]]:
         """
-        Finalize transcription and return final result.
+        Finalize transcription for one session and return final result.
         
         Called when speech ends (silence detected).
-        Clears the buffer and returns final transcript.
+        Clears the session buffer and returns final transcript.
         """
-        if not self._initialized or self.model is None:
+        if stream is None or not self._initialized or self.model is None:
             return None
+        if isinstance(stream, IncrementalWhisperDecoder):
+            result = self._incremental_call(stream, lambda d: d.finalize())
+            if result and self._is_hallucination(result.get("text", "")):
+                logging.debug("🔇 WHISPER.CPP - Filtered hallucination in finalize: '%s'", result["text"])
+                return None
+            return result
         
-        if len(self._audio_buffer) == 0:
+        if len(stream.audio_buffer) == 0:
             return None
         
         try:
             # Check buffer energy - skip if too quiet
-            buffer_energy = self._compute_energy(self._audio_buffer)
+            buffer_energy = self._compute_energy(stream.audio_buffer)
             if buffer_energy < 0.02:
-                self._audio_buffer = np.array([], dtype=np.float32)
-                self._last_text = ""
+                stream.reset()
                 return None
             
             # Transcribe remaining audio
-            segments = self.model.transcribe(self._audio_buffer)
+            segments = self.transcribe_window(stream.audio_buffer, "", True)
             
-            text = " ".join(seg.text.strip() for seg in segments if seg.text)
+            text = " ".join(text for _s, _e, text in segments)
             
             # Clear buffer
-            self._audio_buffer = np.array([], dtype=np.float32)
-            self._last_text = ""
+            stream.reset()
             
             if text:
                 # Filter out hallucinations
@@ -705,18 +1163,28 @@ class WhisperCppSTTBackend:
             
         except Exception as exc:
             logging.error("❌ WHISPER.CPP - Finalize error: %s", exc)
-            self._audio_buffer = np.array([], dtype=np.float32)
+            stream.reset()
             return None
-    
-    def reset(self) -> None:
-        """Reset the audio buffer."""
-        self._audio_buffer = np.array([], dtype=np.float32)
-        self._last_text = ""
+
+    def _transcribe_window(
+        self, audio: np.ndarray, prompt: str, final: bool
+    ) -> List[Tuple[float, float, str]]:
+        params: Dict[str, Any] = {}
+        if prompt:
+            params["initial_prompt"] = prompt
+        segments = self.model.transcribe(audio, **params)
+        result: List[Tuple[float, float, str]] = []
+        for seg in segments:
+            text = (seg.text or "").strip()
+            if not text or self._is_hallucination(text):
+                continue
+            # pywhispercpp reports t0/t1 in 10 ms units
+            result.append((seg.t0 / 100.0, seg.t1 / 100.0, text))
+        return result
     
     def shutdown(self) -> None:
         """Shutdown the model."""
+        self._stop_scheduler()
         self.model = None
         self._initialized = False
-        self._audio_buffer = np.array([], dtype=np.float32)
         logging.info("🛑 WHISPER.CPP - Model shutdown")
-
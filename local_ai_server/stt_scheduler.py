@@ -0,0 +1,218 @@
+"""
+Cross-session batching for Whisper-style STT backends.
+
+Whisper models are loaded once and shared by every call, but neither
+CTranslate2 (faster-whisper) nor whisper.cpp contexts are safe to drive from
+several threads at once.  Rather than serialising each session's decode behind
+a lock, sessions submit decode windows to a ``WhisperBatchScheduler``.  A
+single worker thread owns the model: it drains whatever windows are pending
+(waiting up to ``max_wait_ms`` for stragglers), and hands them to the backend's
+``transcribe_batch`` in one call when the engine supports batching, or runs
+them back to back otherwise.  Throughput then scales with the number of
+concurrent calls instead of collapsing to one decode at a time.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Segments = List[Tuple[float, float, str]]
+
+# Whisper's encoder sees at most 30 s; longer windows are decoded one at a time.
+MAX_BATCH_WINDOW_SEC = 30.0
+
+
+@dataclass
+class _WindowJob:
+    audio: np.ndarray
+    prompt: str
+    final: bool
+    future: Future
+    enqueued_at: float
+
+
+class WhisperBatchScheduler:
+    """Single-owner decode loop that coalesces windows from many sessions."""
+
+    def __init__(
+        self,
+        backend: Any,
+        *,
+        max_batch: int = 8,
+        max_wait_ms: int = 10,
+        name: str = "whisper",
+    ):
+        """
+        Args:
+            backend: Object with ``_transcribe_window(audio, prompt, final)`` and,
+                when ``backend.supports_batching`` is true,
+                ``transcribe_batch([(audio, prompt), ...], final)``.
+            max_batch: Most windows handed to the model in one call.
+            max_wait_ms: How long to hold a partial batch waiting for more windows.
+            name: Worker thread name suffix (for logs and ``ps``).
+        """
+        self.backend = backend
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait = max(0, int(max_wait_ms)) / 1000.0
+        self.name = name
+        self._queue: "queue.Queue[Optional[_WindowJob]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._batches = 0
+        self._windows = 0
+        self._largest_batch = 0
+        self._queue_wait_total = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def sample_rate(self) -> int:
+        return int(getattr(self.backend, "sample_rate", 16000))
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"stt-batch-{self.name}", daemon=True
+        )
+        self._thread.start()
+        logging.info(
+            "🎛️ STT BATCH - Scheduler started backend=%s max_batch=%s max_wait_ms=%.0f batching=%s",
+            self.name,
+            self.max_batch,
+            self.max_wait * 1000,
+            bool(getattr(self.backend, "supports_batching", False)),
+        )
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+        # Fail anything still queued so blocked sessions don't hang.
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None and not job.future.done():
+                job.future.set_exception(RuntimeError("STT scheduler stopped"))
+
+    def submit(self, audio: np.ndarray, prompt: str = "", final: bool = False) -> Future:
+        """Queue one window; the future resolves to ``[(start, end, text), ...]``."""
+        future: Future = Future()
+        if not self._running:
+            future.set_exception(RuntimeError("STT scheduler not running"))
+            return future
+        self._queue.put(_WindowJob(audio, prompt, final, future, time.monotonic()))
+        return future
+
+    def transcribe(self, audio: np.ndarray, prompt: str = "", final: bool = False) -> Segments:
+        """Blocking submit for callers already running off the event loop."""
+        return self.submit(audio, prompt, final).result()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "batching": bool(getattr(self.backend, "supports_batching", False)),
+            "max_batch": self.max_batch,
+            "queued": self._queue.qsize(),
+            "batches": self._batches,
+            "windows": self._windows,
+            "largest_batch": self._largest_batch,
+            "avg_batch": round(self._windows / self._batches, 2) if self._batches else 0.0,
+            "avg_queue_wait_ms": round(self._queue_wait_total * 1000 / self._windows, 2) if self._windows else 0.0,
+        }
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            jobs = self._collect(job)
+            started = time.monotonic()
+            for pending in jobs:
+                self._queue_wait_total += started - pending.enqueued_at
+            self._batches += 1
+            self._windows += len(jobs)
+            self._largest_batch = max(self._largest_batch, len(jobs))
+            try:
+                self._execute(jobs)
+            except Exception as exc:  # pragma: no cover - defensive
+                logging.error("❌ STT BATCH - Worker error: %s", exc, exc_info=True)
+                for pending in jobs:
+                    if not pending.future.done():
+                        pending.future.set_exception(exc)
+            if not self._running:
+                return
+
+    def _collect(self, first: _WindowJob) -> List[_WindowJob]:
+        jobs = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(jobs) < self.max_batch:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    job = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if job is None:
+                # Re-queue the stop sentinel for the main loop.
+                self._queue.put(None)
+                break
+            jobs.append(job)
+        return jobs
+
+    def _execute(self, jobs: Sequence[_WindowJob]) -> None:
+        batchable = bool(getattr(self.backend, "supports_batching", False))
+        limit = int(MAX_BATCH_WINDOW_SEC * self.sample_rate)
+        for final in (False, True):
+            group = [j for j in jobs if bool(j.final) == final]
+            if not group:
+                continue
+            if batchable and len(group) > 1:
+                short = [j for j in group if j.audio.size <= limit]
+                if len(short) > 1 and self._execute_batch(short, final):
+                    group = [j for j in group if j.audio.size > limit]
+            for job in group:
+                self._execute_one(job)
+
+    def _execute_batch(self, jobs: Sequence[_WindowJob], final: bool) -> bool:
+        try:
+            results = self.backend.transcribe_batch([(j.audio, j.prompt) for j in jobs], final)
+            if len(results) != len(jobs):
+                raise RuntimeError(f"expected {len(jobs)} results, got {len(results)}")
+        except Exception as exc:
+            logging.warning(
+                "⚠️ STT BATCH - Batched decode failed (%s windows), falling back to sequential: %s",
+                len(jobs),
+                exc,
+            )
+            return False
+        for job, segments in zip(jobs, results):
+            job.future.set_result(segments)
+        return True
+
+    def _execute_one(self, job: _WindowJob) -> None:
+        try:
+            job.future.set_result(self.backend._transcribe_window(job.audio, job.prompt, job.final))
+        except Exception as exc:
+            job.future.set_exception(exc)
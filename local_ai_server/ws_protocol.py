@@ -1,14 +1,44 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional
 
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
 from constants import DEFAULT_MODE, SUPPORTED_MODES
+from protocol_contract import FRAME_AUDIO, FRAME_CREDIT, FRAME_VERSION, Frame, decode_frame, encode_frame
 from session import SessionContext
 
+# JSON messages that belong to one call; on a framed connection they are routed by call_id.
+_CALL_MESSAGES = {"set_mode", "audio", "tts_request", "llm_request", "call_end"}
+
+
+@dataclass
+class _MuxCall:
+    """One call on a binary-framed connection, processed in order by its own worker."""
+
+    session: SessionContext
+    inbox: asyncio.Queue = field(default_factory=asyncio.Queue)
+    task: Optional[asyncio.Task] = None
+    # Audio frames received and not yet returned to the client as credit
+    in_flight: int = 0
+    # Frames processed since the last credit frame
+    processed: int = 0
+
+
+@dataclass
+class _MuxConnection:
+    window: int
+    calls: Dict[str, _MuxCall] = field(default_factory=dict)
+
+    @property
+    def credit_batch(self) -> int:
+        # Return credit a few frames at a time rather than one frame per frame.
+        return max(1, self.window // 4)
+
 
 class WebSocketProtocol:
     def __init__(self, server):
@@ -63,20 +93,16 @@ class WebSocketProtocol:
             )
             return
 
+        if msg_type == "transport":
+            await self._open_transport(websocket, session, data)
+            return
+
+        if session.mux is not None and msg_type in _CALL_MESSAGES:
+            await self._route_call_message(websocket, session, data)
+            return
+
         if msg_type == "set_mode":
-            requested = data.get("mode", DEFAULT_MODE)
-            if requested in SUPPORTED_MODES:
-                session.mode = requested
-                logging.info("Session mode updated to %s", session.mode)
-            else:
-                logging.warning("Unsupported mode requested: %s", requested)
-            call_id = data.get("call_id")
-            if call_id:
-                session.call_id = call_id
-            await self._server._send_json(
-                websocket,
-                {"type": "mode_ready", "mode": session.mode, "call_id": session.call_id},
-            )
+            await self._handle_set_mode(websocket, session, data)
             return
 
         if msg_type == "audio":
@@ -205,6 +231,158 @@ class WebSocketProtocol:
 
         logging.warning("❓ Unknown message type: %s", msg_type)
 
+    async def _handle_set_mode(self, websocket, session: SessionContext, data: Dict[str, Any]) -> None:
+        requested = data.get("mode", DEFAULT_MODE)
+        if requested in SUPPORTED_MODES:
+            session.mode = requested
+            logging.info("Session mode updated to %s", session.mode)
+        else:
+            logging.warning("Unsupported mode requested: %s", requested)
+        call_id = data.get("call_id")
+        if call_id:
+            session.call_id = call_id
+        if "llm_stream" in data:
+            session.llm_stream = bool(data.get("llm_stream"))
+        await self._server._send_json(
+            websocket,
+            {"type": "mode_ready", "mode": session.mode, "call_id": session.call_id},
+        )
+
+    async def _open_transport(self, websocket, session: SessionContext, data: Dict[str, Any]) -> None:
+        if data.get("framing") != "binary" or data.get("version") != FRAME_VERSION:
+            await self._server._send_json(
+                websocket,
+                {
+                    "type": "error",
+                    "error": "Unsupported transport",
+                    "details": {
+                        "error_type": "invalid_request",
+                        "message": f"framing=binary version={FRAME_VERSION} is supported",
+                    },
+                },
+            )
+            logging.warning(
+                "🔀 WS TRANSPORT - Unsupported request framing=%s version=%s",
+                data.get("framing"),
+                data.get("version"),
+            )
+            return
+        if session.mux is None:
+            session.mux = _MuxConnection(window=max(1, int(self._server.config.ws_mux_window)))
+        await self._server._send_json(
+            websocket,
+            {
+                "type": "transport_ready",
+                "framing": "binary",
+                "version": FRAME_VERSION,
+                "window": session.mux.window,
+            },
+        )
+        logging.info("🔀 WS TRANSPORT - Binary framing enabled window=%d", session.mux.window)
+
+    def _mux_call(self, websocket, session: SessionContext, call_id: str) -> _MuxCall:
+        mux: _MuxConnection = session.mux
+        call = mux.calls.get(call_id)
+        if call is None:
+            call = _MuxCall(
+                SessionContext(
+                    call_id=call_id,
+                    mode=session.mode,
+                    authenticated=session.authenticated,
+                    framed=True,
+                )
+            )
+            call.task = asyncio.create_task(self._run_call(websocket, mux, call))
+            mux.calls[call_id] = call
+            logging.info("🔀 WS TRANSPORT - Call opened call_id=%s calls=%d", call_id, len(mux.calls))
+        return call
+
+    async def _route_call_message(self, websocket, session: SessionContext, data: Dict[str, Any]) -> None:
+        call_id = data.get("call_id")
+        if not call_id:
+            logging.warning("🔀 WS TRANSPORT - %s without call_id on a framed connection", data.get("type"))
+            return
+        if data["type"] == "call_end":
+            call = session.mux.calls.pop(call_id, None)
+            if call is not None:
+                # Let the worker finish what the call already queued, then release its state.
+                call.inbox.put_nowait(None)
+            return
+        self._mux_call(websocket, session, call_id).inbox.put_nowait(data)
+
+    async def handle_frame(self, websocket, session: SessionContext, message: bytes) -> None:
+        """Queue one audio frame from a binary-framed connection on its call's worker."""
+        try:
+            frame = decode_frame(message)
+        except ValueError as exc:
+            logging.warning("🔀 WS TRANSPORT - Dropping malformed frame (%d bytes): %s", len(message), exc)
+            return
+        if frame.kind != FRAME_AUDIO:
+            logging.warning("🔀 WS TRANSPORT - Unexpected frame kind=%d call_id=%s", frame.kind, frame.call_id)
+            return
+        call = self._mux_call(websocket, session, frame.call_id)
+        if call.in_flight >= session.mux.window:
+            # Client ignored its credit; dropping keeps one call from queueing unbounded audio.
+            logging.warning(
+                "🔀 WS TRANSPORT - Call over its window, dropping frame call_id=%s seq=%d",
+                frame.call_id,
+                frame.seq,
+            )
+            return
+        call.in_flight += 1
+        call.inbox.put_nowait(frame)
+
+    async def _run_call(self, websocket, mux: _MuxConnection, call: _MuxCall) -> None:
+        session = call.session
+        try:
+            while True:
+                item = await call.inbox.get()
+                if item is None:
+                    break
+                try:
+                    if isinstance(item, Frame):
+                        await self._server._handle_audio_payload(
+                            websocket,
+                            session,
+                            data={"mode": item.mode, "rate": item.rate, "call_id": item.call_id},
+                            incoming_bytes=item.payload,
+                        )
+                    else:
+                        await self._handle_call_message(websocket, session, item)
+                except Exception as exc:
+                    logging.error("❌ Call worker error call_id=%s: %s", session.call_id, exc, exc_info=True)
+                if isinstance(item, Frame):
+                    call.processed += 1
+                    if call.processed >= mux.credit_batch:
+                        credit, call.processed = call.processed, 0
+                        call.in_flight -= credit
+                        await self._server._send_bytes(
+                            websocket, encode_frame(FRAME_CREDIT, session.call_id, seq=credit)
+                        )
+        finally:
+            self._server._reset_stt_session(session)
+            self._server.release_llm_state(session.call_id)
+            logging.info("🔀 WS TRANSPORT - Call closed call_id=%s", session.call_id)
+
+    async def _handle_call_message(self, websocket, session: SessionContext, data: Dict[str, Any]) -> None:
+        msg_type = data["type"]
+        if msg_type == "set_mode":
+            await self._handle_set_mode(websocket, session, data)
+        elif msg_type == "audio":
+            await self._server._handle_audio_payload(websocket, session, data)
+        elif msg_type == "tts_request":
+            await self._server._handle_tts_request(websocket, session, data)
+        elif msg_type == "llm_request":
+            await self._server._handle_llm_request(websocket, session, data)
+
+    async def _close_mux(self, session: SessionContext) -> None:
+        calls = list(session.mux.calls.values())
+        session.mux.calls.clear()
+        for call in calls:
+            if call.task is not None:
+                call.task.cancel()
+        await asyncio.gather(*(call.task for call in calls if call.task is not None), return_exceptions=True)
+
     async def handle_binary_message(self, websocket, session: SessionContext, message: bytes) -> None:
         if self._server.ws_auth_token and not session.authenticated:
             await self._server._send_json(
@@ -248,7 +426,10 @@ class WebSocketProtocol:
         try:
             async for message in websocket:
                 if isinstance(message, bytes):
-                    await self.handle_binary_message(websocket, session, message)
+                    if session.mux is not None:
+                        await self.handle_frame(websocket, session, message)
+                    else:
+                        await self.handle_binary_message(websocket, session, message)
                 else:
                     await self.handle_json_message(websocket, session, message)
         except ConnectionClosedError:
@@ -258,5 +439,8 @@ class WebSocketProtocol:
         except Exception as exc:
             logging.error("❌ WebSocket handler error: %s", exc, exc_info=True)
         finally:
+            if session.mux is not None:
+                await self._close_mux(session)
             self._server._reset_stt_session(session)
+            self._server.release_llm_state(session.call_id)
             logging.debug("🔌 Connection closed: %s", websocket.remote_address)
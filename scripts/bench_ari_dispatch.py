@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+ARI event dispatch call-storm replay.
+
+Replays the WebSocket event stream of N calls arriving at once (each call:
+StasisStart, ChannelVarset x3, ChannelDtmfReceived, StasisEnd,
+ChannelDestroyed, interleaved across calls) through two dispatch models with
+handlers that take a few milliseconds of simulated ARI I/O:
+
+  * tasks      – the previous reader: json.loads + one create_task per handler
+  * dispatcher – ARIEventDispatcher: orjson (if installed) + per-channel lanes,
+                 bounded workers and queue
+
+Reports per-channel ordering violations (a handler starting before the
+previous event for that channel finished), peak handler tasks alive, peak
+traced memory and wall time.
+
+Usage:
+    python scripts/bench_ari_dispatch.py --calls 1000 --workers 64 --queue 256
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.ari_dispatcher import ARIEventDispatcher  # noqa: E402
+
+try:
+    import orjson
+    _fast_loads = orjson.loads
+except ImportError:
+    _fast_loads = json.loads
+
+CALL_EVENTS = (
+    "StasisStart", "ChannelVarset", "ChannelVarset", "ChannelVarset",
+    "ChannelDtmfReceived", "StasisEnd", "ChannelDestroyed",
+)
+
+
+def _storm(calls: int, seed: int):
+    rng = random.Random(seed)
+    cursors = {f"1700000000.{i}": 0 for i in range(calls)}
+    messages = []
+    while cursors:
+        cid = rng.choice(list(cursors))
+        seq = cursors[cid]
+        messages.append(json.dumps({
+            "type": CALL_EVENTS[seq],
+            "application": "ai-voice-agent",
+            "timestamp": "2026-01-01T00:00:00.000+0000",
+            "channel": {"id": cid, "name": f"PJSIP/trunk-{cid}", "state": "Up", "dialplan": {"context": "from-ai-agent"}},
+            "seq": seq,
+        }))
+        if seq + 1 == len(CALL_EVENTS):
+            del cursors[cid]
+        else:
+            cursors[cid] = seq + 1
+    return messages
+
+
+class _Probe:
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.last_done = {}
+        self.violations = 0
+        self.alive = 0
+        self.peak_alive = 0
+
+    async def handler(self, event):
+        cid = event["channel"]["id"]
+        if self.last_done.get(cid, -1) != event["seq"] - 1:
+            self.violations += 1
+        self.alive += 1
+        self.peak_alive = max(self.peak_alive, self.alive)
+        # StasisStart does the most ARI round trips in the engine
+        delay = 0.02 if event["type"] == "StasisStart" else 0.002
+        await asyncio.sleep(self.rng.uniform(0.5, 1.5) * delay)
+        self.alive -= 1
+        self.last_done[cid] = max(self.last_done.get(cid, -1), event["seq"])
+
+
+async def _replay_tasks(messages, probe: _Probe) -> None:
+    tasks = set()
+    for message in messages:
+        event = json.loads(message)
+        task = asyncio.create_task(probe.handler(event))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        await asyncio.sleep(0)
+    while tasks:
+        await asyncio.gather(*list(tasks))
+
+
+async def _replay_dispatcher(messages, probe: _Probe, workers: int, queue: int) -> None:
+    dispatcher = ARIEventDispatcher(workers=workers, max_pending=queue)
+    for message in messages:
+        await dispatcher.submit(_fast_loads(message), [probe.handler])
+        await asyncio.sleep(0)
+    while dispatcher.pending:
+        await asyncio.sleep(0.005)
+    await dispatcher.close()
+
+
+def _measure(mode: str, messages, args) -> dict:
+    probe = _Probe(args.seed)
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        if mode == "tasks":
+            asyncio.run(_replay_tasks(messages, probe))
+        else:
+            asyncio.run(_replay_dispatcher(messages, probe, args.workers, args.queue))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "mode": mode,
+        "wall": time.perf_counter() - started,
+        "violations": probe.violations,
+        "peak_alive": probe.peak_alive,
+        "peak_kb": peak / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay an ARI call storm through the event dispatcher")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--queue", type=int, default=256, help="Dispatcher max pending events")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    messages = _storm(args.calls, args.seed)
+    print(f"calls={args.calls} events={len(messages)} workers={args.workers} queue={args.queue}")
+    print(f"{'mode':<11} {'order_violations':>16} {'peak_handlers':>13} {'peak_mem_kb':>11} {'wall_ms':>8}")
+    for mode in ("tasks", "dispatcher"):
+        r = _measure(mode, messages, args)
+        print(
+            f"{r['mode']:<11} {r['violations']:>16} {r['peak_alive']:>13} "
+            f"{r['peak_kb']:>11.0f} {r['wall'] * 1000:>8.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
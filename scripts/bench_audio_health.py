@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Per-frame audio diagnostics cost benchmark.
+
+Feeds N concurrent calls' 20 ms frames through the audio diagnostics step
+(μ-law transport_in at 8 kHz and PCM16 provider_out at 16 kHz per call) and
+reports CPU per frame:
+
+  * legacy  – previous step: decode + audioop.rms/avg on every frame and two
+              process-wide gauge writes labelled only by stage
+  * sampled – AudioHealthMonitor with --sample-every, windows on the session
+
+Also prints the cross-call export time (what a /metrics scrape adds).
+
+Usage:
+    python scripts/bench_audio_health.py --calls 200 --seconds 10 --sample-every 5
+"""
+
+import argparse
+import audioop
+import math
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from prometheus_client import Gauge  # noqa: E402
+
+from src.core.audio_health import AudioHealthMonitor  # noqa: E402
+from src.core.models import CallSession  # noqa: E402
+
+_LEGACY_RMS = Gauge("bench_audio_rms", "legacy per-frame gauge", labelnames=("stage",))
+_LEGACY_DC = Gauge("bench_audio_dc_offset", "legacy per-frame gauge", labelnames=("stage",))
+
+
+def _frames(rng: random.Random):
+    pcm8 = array("h", (int(3000 * math.sin(i / 3.0) + rng.randint(-200, 200)) for i in range(160))).tobytes()
+    pcm16 = array("h", (int(6000 * math.sin(i / 5.0)) for i in range(320))).tobytes()
+    return audioop.lin2ulaw(pcm8, 2), pcm16
+
+
+def _legacy_step(session: CallSession, stage: str, audio: bytes, is_ulaw: bool) -> None:
+    pcm = audioop.ulaw2lin(audio, 2) if is_ulaw else audio
+    rms = audioop.rms(pcm, 2)
+    dc = audioop.avg(pcm, 2)
+    session.audio_diagnostics[stage] = {"rms": rms, "dc_offset": dc, "sample_rate": 8000, "updated": time.time()}
+    _LEGACY_RMS.labels(stage).set(rms)
+    _LEGACY_DC.labels(stage).set(dc)
+
+
+def _sampled_step(monitor: AudioHealthMonitor, session: CallSession, stage: str, audio: bytes, is_ulaw: bool) -> None:
+    win = monitor.sample(session, stage)
+    if win is None:
+        return
+    pcm = audioop.ulaw2lin(audio, 2) if is_ulaw else audio
+    rms, dc = monitor.record(win, pcm)
+    session.audio_diagnostics[stage] = {"rms": rms, "dc_offset": dc, "sample_rate": 8000, "updated": time.time()}
+
+
+def _run(mode: str, calls: int, frames: int, sample_every: int, window: int):
+    rng = random.Random(1)
+    ulaw, pcm16 = _frames(rng)
+    sessions = [CallSession(call_id=f"c{i}", caller_channel_id=f"c{i}", provider_name="pipeline") for i in range(calls)]
+    monitor = AudioHealthMonitor(sample_every=sample_every, window=window)
+    started = time.process_time()
+    for _ in range(frames):
+        for session in sessions:
+            if mode == "legacy":
+                _legacy_step(session, "transport_in", ulaw, True)
+                _legacy_step(session, "provider_out", pcm16, False)
+            else:
+                _sampled_step(monitor, session, "transport_in", ulaw, True)
+                _sampled_step(monitor, session, "provider_out", pcm16, False)
+    cpu = time.process_time() - started
+    export_ms = 0.0
+    if mode == "sampled":
+        t0 = time.perf_counter()
+        monitor.export(sessions)
+        export_ms = (time.perf_counter() - t0) * 1000
+    return cpu, export_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-frame audio health diagnostics")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Audio per call (20 ms frames)")
+    parser.add_argument("--sample-every", type=int, default=5)
+    parser.add_argument("--window", type=int, default=300)
+    args = parser.parse_args()
+
+    frames = int(args.seconds * 50)
+    total = args.calls * frames * 2
+    print(f"calls={args.calls} frames/call/stage={frames} sample_every={args.sample_every} window={args.window}")
+    print(f"{'mode':<8} {'cpu_ms':>9} {'us/frame':>9} {'export_ms':>10}")
+    for mode in ("legacy", "sampled"):
+        cpu, export_ms = _run(mode, args.calls, frames, args.sample_every, args.window)
+        print(f"{mode:<8} {cpu * 1000:>9.1f} {cpu * 1e6 / total:>9.2f} {export_ms:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
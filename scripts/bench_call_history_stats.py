@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Call history dashboard statistics benchmark.
+
+Fills a temporary database with N synthetic call records spread over --days
+(bulk-inserted, then rollups rebuilt) and times CallHistoryStore.get_stats for
+the Admin UI's usual ranges with:
+
+  * scan    – the full-scan queries (eight passes over call_records plus a
+              Python parse of every tool_calls blob)
+  * rollups – the hourly/daily rollups, caller rollup and call_tool_usage
+
+Usage:
+    python scripts/bench_call_history_stats.py --records 200000 --days 90
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.call_history import CallHistoryStore  # noqa: E402
+
+
+def _fill(db_path: str, records: int, days: int) -> None:
+    rng = random.Random(1)
+    now = datetime.now(timezone.utc)
+    conn = sqlite3.connect(db_path)
+    rows = []
+    for i in range(records):
+        start = now - timedelta(seconds=rng.randint(0, days * 86400))
+        duration = rng.uniform(5, 600)
+        tools = [{"name": rng.choice(["transfer_call", "hangup_call", "crm_lookup", "send_email"])}
+                 for _ in range(rng.choice([0, 0, 1, 2]))]
+        rows.append((
+            str(uuid.uuid4()), f"call-{i}", f"+1555{rng.randint(0, 5000):07d}",
+            start.isoformat(), (start + timedelta(seconds=duration)).isoformat(), duration,
+            rng.choice(["openai_realtime", "deepgram", "google_live", "local"]),
+            rng.choice([None, "local_hybrid"]), rng.choice(["default", "sales", "support"]),
+            json.dumps([{"role": "user", "content": "hello"}]),
+            rng.choice(["completed", "transferred", "abandoned", "error"]),
+            json.dumps(tools), rng.uniform(200, 1200), rng.randint(1, 20), rng.randint(0, 3),
+        ))
+    conn.executemany(
+        """
+        INSERT INTO call_records (
+            id, call_id, caller_number, start_time, end_time, duration_seconds, provider_name,
+            pipeline_name, context_name, conversation_history, outcome, tool_calls,
+            avg_turn_latency_ms, total_turns, barge_in_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def _main(args) -> None:
+    os.environ["CALL_HISTORY_ENABLED"] = "true"
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "call_history.db")
+        store = CallHistoryStore(db_path=db_path)
+        _fill(db_path, args.records, args.days)
+        started = time.perf_counter()
+        await store.rebuild_rollups()
+        rebuild_s = time.perf_counter() - started
+
+        now = datetime.now(timezone.utc)
+        ranges = {
+            "all": (None, None),
+            "last 30d": (now - timedelta(days=30), now),
+            "last 7d": (now - timedelta(days=7), now),
+            "today": (now.replace(hour=0, minute=0, second=0, microsecond=0), now),
+        }
+        print(f"records={args.records} days={args.days} rebuild_rollups={rebuild_s:.2f}s")
+        print(f"{'range':<10} {'scan_ms':>9} {'rollups_ms':>11} {'speedup':>8}")
+        conn = store._get_connection()
+        try:
+            for label, (start, end) in ranges.items():
+                scan = _time(lambda: store._stats_from_records_sync(conn.cursor(), start, end), args.repeat)
+                rollup = _time(lambda: store._stats_from_rollups_sync(conn, start, end), args.repeat)
+                print(f"{label:<10} {scan:>9.1f} {rollup:>11.1f} {scan / rollup:>7.1f}x")
+        finally:
+            conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark call history get_stats: full scan vs rollups")
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N timings per range")
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Call history persistence benchmark under a hangup storm.
+
+Fires hangups at --rate per second for --seconds and, for each, runs what the
+engine's cleanup path awaits before it can remove the session:
+
+  * sync         – previous behaviour: CallHistoryStore.save() (new connection,
+                   JSON serialization and a commit per call, under the store
+                   lock) followed by get_by_call_id() to resolve the row id
+  * write-behind – CallHistoryStore.enqueue(); records commit in batches on the
+                   writer thread
+
+Reports hangup-to-cleanup latency (p50/p95/p99/max) and committed records/sec,
+where the write-behind run includes the final drain. Optional --readers
+simulate Admin UI list queries against the same DB during the storm; --rate 0
+fires --calls hangups at once to measure peak throughput.
+
+Usage:
+    python scripts/bench_call_history_writes.py --rate 50 --seconds 10 --turns 20
+    python scripts/bench_call_history_writes.py --rate 0 --calls 1000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.call_history import CallHistoryStore, CallRecord  # noqa: E402
+
+
+def _record(i: int, turns: int) -> CallRecord:
+    now = datetime.now(timezone.utc)
+    history = []
+    for t in range(turns):
+        history.append({"role": "user", "content": f"Caller utterance {t} for call {i} " * 4, "timestamp": t})
+        history.append({"role": "assistant", "content": f"Agent reply {t} with some detail " * 6, "timestamp": t})
+    return CallRecord(
+        call_id=f"bench-{i}",
+        caller_number=f"+1555{i:07d}",
+        start_time=now - timedelta(seconds=90),
+        end_time=now,
+        duration_seconds=90.0,
+        provider_name="openai_realtime",
+        context_name="demo",
+        conversation_history=history,
+        tool_calls=[{"name": "hangup_call", "params": {}, "result": "success"}],
+        total_turns=turns,
+        audio_health={"transport_in": {"rms_p50": 800.0, "silence_ratio": 0.2}},
+    )
+
+
+def _pct(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+async def _run(mode: str, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CallHistoryStore(db_path=os.path.join(tmp, "call_history.db"))
+        latencies = []
+        stop_readers = asyncio.Event()
+
+        async def hangup(i: int) -> None:
+            record = _record(i, args.turns)
+            started = time.perf_counter()
+            if mode == "sync":
+                await store.save(record)
+                await store.get_by_call_id(record.call_id)
+            else:
+                store.enqueue(record)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        async def reader() -> None:
+            while not stop_readers.is_set():
+                await store.list(limit=50, include_details=False)
+                await asyncio.sleep(0.05)
+
+        readers = [asyncio.create_task(reader()) for _ in range(args.readers)]
+        total = int(args.rate * args.seconds) if args.rate > 0 else args.calls
+        interval = 1.0 / args.rate if args.rate > 0 else 0.0
+        started = time.perf_counter()
+        tasks = []
+        for i in range(total):
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(hangup(i)))
+        await asyncio.gather(*tasks)
+        await store.close()
+        elapsed = time.perf_counter() - started
+        stop_readers.set()
+        await asyncio.gather(*readers)
+        committed = await store.count()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "p50": _pct(latencies, 0.5),
+        "p95": _pct(latencies, 0.95),
+        "p99": _pct(latencies, 0.99),
+        "max": latencies[-1],
+        "committed": committed,
+        "rps": committed / elapsed,
+    }
+
+
+async def _main(args) -> None:
+    os.environ["CALL_HISTORY_ENABLED"] = "true"
+    os.environ["CALL_HISTORY_WRITE_BATCH_MS"] = str(args.batch_ms)
+    os.environ["CALL_HISTORY_WRITE_BATCH_MAX"] = str(args.batch_max)
+    print(
+        f"rate={args.rate}/s seconds={args.seconds} turns={args.turns} readers={args.readers} "
+        f"batch_ms={args.batch_ms} batch_max={args.batch_max}"
+    )
+    print(f"{'mode':<13} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'max_ms':>8} {'records':>8} {'rec/s':>7}")
+    for mode in ("sync", "write-behind"):
+        r = await _run(mode, args)
+        print(
+            f"{r['mode']:<13} {r['p50']:>8.2f} {r['p95']:>8.2f} {r['p99']:>8.2f} {r['max']:>8.2f} "
+            f"{r['committed']:>8} {r['rps']:>7.1f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark call history persistence during a hangup storm")
+    parser.add_argument("--rate", type=float, default=50.0, help="Hangups per second (0 = all at once)")
+    parser.add_argument("--calls", type=int, default=1000, help="Hangups to fire when --rate is 0")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--turns", type=int, default=20, help="Conversation turns per record")
+    parser.add_argument("--readers", type=int, default=2, help="Concurrent Admin UI style list queries")
+    parser.add_argument("--batch-ms", type=float, default=250.0, help="CALL_HISTORY_WRITE_BATCH_MS")
+    parser.add_argument("--batch-max", type=int, default=64, help="CALL_HISTORY_WRITE_BATCH_MAX")
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Codec engine benchmark.
+
+Measures 20 ms frames/sec on one core for the inbound RTP path
+(μ-law 8 kHz -> PCM16 16 kHz, stateful) across N concurrent calls:
+
+  * audioop      – one ulaw2lin + ratecv call per frame (current path)
+  * numpy        – NumpyCodecEngine, one call per frame
+  * numpy-batch  – NumpyCodecEngine.decode_batch + resample_batch per tick
+
+Usage:
+    python scripts/bench_codec_engine.py --calls 200 --seconds 5
+"""
+
+import argparse
+import math
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.audio.codec_engine import (  # noqa: E402
+    available_codec_engines,
+    create_codec_engine,
+)
+
+FRAME_SAMPLES = 160  # 20 ms @ 8 kHz
+
+
+def _make_frames(calls: int):
+    engine = create_codec_engine("numpy" if "numpy" in available_codec_engines() else "audioop")
+    frames = []
+    for c in range(calls):
+        freq = 200 + (c % 40) * 25
+        pcm = struct.pack(
+            f"<{FRAME_SAMPLES}h",
+            *(int(8000 * math.sin(2 * math.pi * freq * i / 8000)) for i in range(FRAME_SAMPLES)),
+        )
+        frames.append(engine.ulaw_encode(pcm))
+    return frames
+
+
+def _run_per_frame(engine_name: str, frames, ticks: int) -> float:
+    engine = create_codec_engine(engine_name)
+    resamplers = [engine.create_resampler(8000, 16000) for _ in frames]
+    start = time.process_time()
+    for _ in range(ticks):
+        for r, f in zip(resamplers, frames):
+            r.process(engine.ulaw_decode(f))
+    return time.process_time() - start
+
+
+def _run_batch(frames, ticks: int) -> float:
+    engine = create_codec_engine("numpy")
+    resamplers = [engine.create_resampler(8000, 16000) for _ in frames]
+    start = time.process_time()
+    for _ in range(ticks):
+        engine.resample_batch(resamplers, engine.decode_batch(frames))
+    return time.process_time() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark audio codec engines")
+    parser.add_argument("--calls", type=int, default=200, help="Concurrent calls per tick")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Simulated audio seconds per call")
+    args = parser.parse_args()
+
+    ticks = max(1, int(args.seconds * 50))
+    frames = _make_frames(args.calls)
+    total_frames = ticks * args.calls
+    available = available_codec_engines()
+
+    runs = []
+    if "audioop" in available:
+        runs.append(("audioop", lambda: _run_per_frame("audioop", frames, ticks)))
+    if "numpy" in available:
+        runs.append(("numpy", lambda: _run_per_frame("numpy", frames, ticks)))
+        runs.append(("numpy-batch", lambda: _run_batch(frames, ticks)))
+
+    print(f"calls={args.calls} ticks={ticks} frames={total_frames}")
+    print(f"{'engine':<12} {'cpu_s':>8} {'frames/s/core':>14} {'max_calls/core':>15}")
+    for name, fn in runs:
+        cpu = fn()
+        fps = total_frames / cpu if cpu > 0 else float("inf")
+        print(f"{name:<12} {cpu:>8.3f} {fps:>14,.0f} {fps / 50:>15,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
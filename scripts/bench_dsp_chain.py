@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Streaming playback egress conditioning benchmark.
+
+Runs provider-sized PCM16 chunks through the egress conditioning used by
+StreamingPlaybackManager and reports CPU per second of audio:
+
+  * legacy – the previous per-stage pure-Python loops (silence trim, DC clamp,
+             attack envelope, RMS normalizer), each round-tripping array('h')
+  * chain  – PlaybackDSPChain: the same stages (plus DC-block and soft limiter
+             when --full is given) in one vectorized pass per chunk
+
+Usage:
+    python scripts/bench_dsp_chain.py --seconds 30 --rate 8000 --chunk-ms 200
+"""
+
+import argparse
+import array
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.audio.dsp_chain import PlaybackDSPChain  # noqa: E402
+
+
+def _chunks(seconds: float, rate: int, chunk_ms: int, seed: int):
+    rng = random.Random(seed)
+    n = max(1, rate * chunk_ms // 1000)
+    total = int(seconds * rate)
+    out = []
+    phase = 0
+    for _ in range(0, total, n):
+        amp = rng.uniform(300, 4000)
+        buf = array.array("h", (int(amp * math.sin(2 * math.pi * 440 * (phase + i) / rate) + 300) for i in range(n)))
+        phase += n
+        out.append(buf.tobytes())
+    return out
+
+
+def _legacy(chunks, rate: int, attack_ms: int, target_rms: int, max_gain_db: float):
+    """Pre-chain behaviour: each stage decodes, loops per sample and re-encodes."""
+    attack_total = int(rate * attack_ms / 1000) * 2
+    remaining = attack_total
+    for pcm in chunks:
+        buf = array.array("h")
+        buf.frombytes(pcm)
+        for i in range(0, len(buf), 160):
+            frame = buf[i:i + 160]
+            if len(frame) < 160:
+                break
+            if int(math.sqrt(sum(float(s) * float(s) for s in frame) / len(frame))) > 100:
+                if i:
+                    pcm = buf[i:].tobytes()
+                break
+        dc = int(sum(array.array("h", pcm)) / max(1, len(pcm) // 2))
+        buf = array.array("h")
+        buf.frombytes(pcm)
+        if abs(dc) >= 256:
+            buf = array.array("h", (max(-32768, min(32767, s - dc)) for s in buf))
+        if remaining > 0:
+            shape = min(len(buf), remaining // 2)
+            for i in range(shape):
+                alpha = ((attack_total - remaining) + i * 2) / float(attack_total)
+                buf[i] = int(round(buf[i] * alpha))
+            remaining -= shape * 2
+        pcm = buf.tobytes()
+        buf = array.array("h")
+        buf.frombytes(pcm)
+        rms = math.sqrt(sum(float(s) * float(s) for s in buf) / len(buf))
+        gain = min(target_rms / max(1.0, rms), math.pow(10.0, max_gain_db / 20.0))
+        if gain > 1.01:
+            for i, s in enumerate(buf):
+                buf[i] = int(max(-32768.0, min(32767.0, s * gain)))
+        buf.tobytes()
+
+
+def _chain(chain: PlaybackDSPChain, chunks):
+    for pcm in chunks:
+        chain.process(pcm)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark playback egress conditioning")
+    parser.add_argument("--seconds", type=float, default=30.0, help="Audio length per run")
+    parser.add_argument("--rate", type=int, default=8000, help="Egress sample rate")
+    parser.add_argument("--chunk-ms", type=int, default=200, help="Provider chunk size")
+    parser.add_argument("--full", action="store_true", help="Also enable DC-block and soft limiter in the chain")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    chunks = _chunks(args.seconds, args.rate, args.chunk_ms, args.seed)
+    stages = dict(trim_threshold_rms=100, dc_threshold=256, attack_ms=20, target_rms=1400, max_gain_db=9.0)
+    if args.full:
+        stages.update(dc_block=True, limiter=True)
+
+    started = time.process_time()
+    _legacy(chunks, args.rate, 20, 1400, 9.0)
+    legacy_cpu = time.process_time() - started
+
+    started = time.process_time()
+    _chain(PlaybackDSPChain(args.rate, **stages), chunks)
+    chain_cpu = time.process_time() - started
+
+    print(f"seconds={args.seconds} rate={args.rate} chunk_ms={args.chunk_ms} chunks={len(chunks)} full={args.full}")
+    print(f"{'mode':<7} {'cpu_ms':>9} {'cpu_ms/audio_s':>15} {'x realtime':>11}")
+    for mode, cpu in (("legacy", legacy_cpu), ("chain", chain_cpu)):
+        per_sec = cpu * 1000 / max(1e-9, args.seconds)
+        print(f"{mode:<7} {cpu * 1000:>9.1f} {per_sec:>15.3f} {args.seconds / max(1e-9, cpu):>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+HTTP tool round-trip benchmark.
+
+Runs GenericHTTPLookupTool.execute() against a local aiohttp stub server and
+reports p50/p95 latency per call for three client modes:
+
+  * per-call – previous behaviour: a new aiohttp.ClientSession (and therefore
+               a new connection and DNS lookup) per execution
+  * pooled   – the shared HTTPClientPool (keep-alive, DNS cache)
+  * cached   – pooled plus cache_ttl_seconds on the tool; callers repeat from
+               a small set of numbers, as with returning customers
+
+The stub listens on "localhost" so name resolution is part of the per-call
+cost; TLS is not exercised, so remote HTTPS endpoints gain more than shown.
+
+Usage:
+    python scripts/bench_http_tools.py --requests 500 --concurrency 8 --callers 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from src.tools.context import PreCallContext  # noqa: E402
+from src.tools.http import client_pool  # noqa: E402
+from src.tools.http.generic_lookup import GenericHTTPLookupTool, HTTPLookupConfig  # noqa: E402
+
+
+async def _start_stub(delay_ms: float):
+    async def contact(request):
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000.0)
+        phone = request.query.get("phone", "")
+        return web.json_response({"contacts": [{"firstName": "Caller", "lastName": phone[-4:], "email": f"{phone}@example.com"}]})
+
+    app = web.Application()
+    app.router.add_get("/contacts/lookup", contact)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://localhost:{port}/contacts/lookup"
+
+
+@asynccontextmanager
+async def _per_call_session(self, tool, max_concurrency=0, acquire_timeout=None):
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def _pct(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+async def _run(mode: str, url: str, args) -> dict:
+    tool = GenericHTTPLookupTool(HTTPLookupConfig(
+        name=f"bench_{mode}",
+        url=url,
+        query_params={"phone": "{caller_number}"},
+        output_variables={"customer_email": "contacts[0].email"},
+        cache_ttl_seconds=60 if mode == "cached" else 0,
+    ))
+    original = client_pool.HTTPClientPool.session
+    if mode == "per-call":
+        client_pool.HTTPClientPool.session = _per_call_session
+    latencies = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(i)
+
+    async def worker():
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            ctx = PreCallContext(call_id=f"bench-{i}", caller_number=f"+1555{i % args.callers:07d}")
+            started = time.perf_counter()
+            result = await tool.execute(ctx)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if not result.get("customer_email"):
+                raise RuntimeError(f"{mode}: lookup failed")
+
+    try:
+        await client_pool.close_http_client_pool()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        wall = time.perf_counter() - started
+    finally:
+        client_pool.HTTPClientPool.session = original
+        await client_pool.close_http_client_pool()
+    latencies.sort()
+    return {"mode": mode, "p50": _pct(latencies, 0.5), "p95": _pct(latencies, 0.95), "rps": args.requests / wall}
+
+
+async def _main(args) -> None:
+    runner, url = await _start_stub(args.server_delay_ms)
+    try:
+        print(
+            f"requests={args.requests} concurrency={args.concurrency} "
+            f"callers={args.callers} server_delay_ms={args.server_delay_ms}"
+        )
+        print(f"{'mode':<9} {'p50_ms':>8} {'p95_ms':>8} {'req/s':>8}")
+        for mode in ("per-call", "pooled", "cached"):
+            r = await _run(mode, url, args)
+            print(f"{r['mode']:<9} {r['p50']:>8.2f} {r['p95']:>8.2f} {r['rps']:>8.0f}")
+    finally:
+        await runner.cleanup()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HTTP tool round trips against a local stub")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--callers", type=int, default=50, help="Distinct caller numbers (cache key spread)")
+    parser.add_argument("--server-delay-ms", type=float, default=2.0, help="Simulated API processing time")
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
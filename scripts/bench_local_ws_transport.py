@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Engine <-> local_ai_server audio transport benchmark: JSON/base64 vs binary mux.
+
+Runs the real local_ai_server websocket handler in-process with the STT
+backend stubbed out (so only transport and protocol work is measured) and
+streams --streams concurrent calls of PCM16 16 kHz audio in --chunk-ms chunks:
+
+  * json   – one websocket per call, each chunk a JSON ``audio`` message with
+             base64 ``data`` (what LocalProvider / LocalSTTAdapter send today)
+  * binary – calls multiplexed over --connections shared websockets, each
+             chunk one binary frame, paced by per-call credit
+
+Two passes per transport:
+
+  * flood     – every stream sends --seconds of audio as fast as it can;
+                reports audio seconds delivered per wall second and CPU
+                milliseconds (engine + server, same process) per audio second
+  * real-time – every stream sends one chunk per --chunk-ms; reports process
+                CPU utilisation while carrying --streams live calls
+
+Usage:
+    python scripts/bench_local_ws_transport.py --streams 50 --seconds 10 --chunk-ms 20
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import sys
+import time
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+sys.path.insert(0, os.path.join(_ROOT, "local_ai_server"))
+
+import structlog  # noqa: E402
+import websockets  # noqa: E402
+from websockets.asyncio.server import serve  # noqa: E402
+
+from server import LocalAIServer  # noqa: E402
+from src.providers.local_mux import LocalAIMuxPool  # noqa: E402
+
+_RATE = 16000
+
+
+class _CountingSTT:
+    def __init__(self):
+        self.bytes = 0
+
+    async def __call__(self, session, audio_bytes, input_rate):
+        self.bytes += len(audio_bytes)
+        return []
+
+
+async def _wait_for(stt: _CountingSTT, total: int) -> None:
+    while stt.bytes < total:
+        await asyncio.sleep(0.002)
+
+
+async def _stream_json(url: str, call_id: str, chunks: int, chunk: bytes, interval: float) -> None:
+    async with websockets.connect(url, ping_interval=None, ping_timeout=None, max_size=None) as ws:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for n in range(chunks):
+            await ws.send(
+                json.dumps(
+                    {
+                        "type": "audio",
+                        "data": base64.b64encode(chunk).decode("utf-8"),
+                        "rate": _RATE,
+                        "format": "pcm16le",
+                        "call_id": call_id,
+                        "mode": "stt",
+                    }
+                )
+            )
+            if interval:
+                await asyncio.sleep(max(0.0, start + (n + 1) * interval - loop.time()))
+        # Keep the socket open until the server has consumed this call's audio.
+        await asyncio.sleep(0)
+
+
+async def _stream_binary(pool: LocalAIMuxPool, call_id: str, chunks: int, chunk: bytes, interval: float) -> None:
+    channel = await pool.open_channel(call_id, "stt")
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for n in range(chunks):
+        await channel.send_audio(chunk, _RATE)
+        if interval:
+            await asyncio.sleep(max(0.0, start + (n + 1) * interval - loop.time()))
+
+
+async def _run(transport: str, paced: bool, args) -> dict:
+    server = LocalAIServer()
+    stt = _CountingSTT()
+    server.stt_backend = "stub"
+    server._stt_is_available = lambda: True
+    server._process_stt_stream = stt
+
+    chunk = b"\x01\x00" * int(_RATE * args.chunk_ms / 1000)
+    chunks = int(args.seconds * 1000 / args.chunk_ms)
+    total = len(chunk) * chunks * args.streams
+    interval = args.chunk_ms / 1000.0 if paced else 0.0
+
+    async with serve(server.handler, "127.0.0.1", 0, max_size=None) as ws_server:
+        url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+        pool = None
+        if transport == "binary":
+            pool = LocalAIMuxPool(url, size=args.connections)
+            # Connect up front so both transports are timed on established sockets.
+            warm = [await pool.open_channel(f"warm-{i}", "stt") for i in range(args.connections)]
+            for channel in warm:
+                await channel.close()
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        if transport == "json":
+            senders = [_stream_json(url, f"call-{i}", chunks, chunk, interval) for i in range(args.streams)]
+        else:
+            senders = [_stream_binary(pool, f"call-{i}", chunks, chunk, interval) for i in range(args.streams)]
+        await asyncio.gather(*senders, _wait_for(stt, total))
+        wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+        if pool is not None:
+            await pool.close()
+
+    audio_sec = total / 2 / _RATE
+    return {
+        "transport": transport,
+        "pass": "real-time" if paced else "flood",
+        "audio_x": audio_sec / wall,
+        "cpu_ms_per_audio_s": cpu * 1000 / audio_sec,
+        "cpu_pct": cpu / wall * 100,
+    }
+
+
+async def _main(args) -> None:
+    print(
+        f"streams={args.streams} seconds={args.seconds} chunk_ms={args.chunk_ms} "
+        f"binary_connections={args.connections}"
+    )
+    print(f"{'transport':<9} {'pass':<9} {'audio_x_realtime':>16} {'cpu_ms/audio_s':>15} {'cpu_%':>7}")
+    for paced in (False, True):
+        for transport in ("json", "binary"):
+            r = await _run(transport, paced, args)
+            print(
+                f"{r['transport']:<9} {r['pass']:<9} {r['audio_x']:>16.1f} "
+                f"{r['cpu_ms_per_audio_s']:>15.2f} {r['cpu_pct']:>7.1f}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark local_ai_server audio transport: JSON/base64 vs binary mux")
+    parser.add_argument("--streams", type=int, default=50, help="Concurrent calls")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Audio per call")
+    parser.add_argument("--chunk-ms", type=int, default=20, help="Audio per message")
+    parser.add_argument("--connections", type=int, default=2, help="Shared connections for the binary transport")
+    args = parser.parse_args()
+    # Per-call connect/disconnect logs would dominate the output.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    logging.getLogger().setLevel(logging.WARNING)
+    asyncio.run(_main(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Structured logging throughput benchmark.
+
+Measures events/sec through the engine's logging pipeline (configure_logging,
+JSON format, output to /dev/null) for three call patterns seen on the audio
+hot path:
+
+  * debug    – debug() calls with the root level at INFO (should cost ~nothing)
+  * info     – info() events with 8 fields, one nested dict
+  * frame    – a per-frame site ("RTP packet loss detected") hit 50x/s per call
+
+Modes:
+  * legacy – previous pipeline: stdlib BoundLogger, per-field sanitize loop
+             over all patterns, json renderer, no rate limiting
+  * fast   – current pipeline from src/logging_config.py
+
+Usage:
+    python scripts/bench_logging.py --events 50000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import structlog  # noqa: E402
+
+from src import logging_config  # noqa: E402
+
+
+def _legacy_sanitize(logger, method_name, event_dict):
+    """The per-event sanitizer this module replaced (rebuilt patterns every field)."""
+    sensitive = set(logging_config.SENSITIVE_KEYS)
+
+    def sanitize_dict(d):
+        out = {}
+        for key, value in d.items():
+            key_normalized = str(key).lower().replace('_', '').replace('-', '')
+            hit = False
+            for pattern in sensitive:
+                p = pattern.replace('_', '').replace('-', '')
+                if key_normalized == p or key_normalized.endswith(p):
+                    hit = True
+                    break
+            if hit:
+                out[key] = logging_config._redact_value(value)
+            elif isinstance(value, dict):
+                out[key] = sanitize_dict(value)
+            elif isinstance(value, (list, tuple)):
+                out[key] = [sanitize_dict(v) if isinstance(v, dict) else v for v in value]
+            else:
+                out[key] = value
+        return out
+
+    return sanitize_dict(event_dict)
+
+
+def _configure(mode: str, devnull) -> None:
+    structlog.reset_defaults()
+    logging_config._rate_limit_state.clear()
+    logging_config.configure_logging(log_level="INFO")
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.setStream(devnull)
+    if mode == "fast":
+        return
+    logging_config._min_level = logging.DEBUG  # no wrapper short-circuit
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.add_log_level,
+            logging_config.add_local_timestamp,
+            logging_config.add_service_context,
+            logging_config.add_correlation_id,
+            _legacy_sanitize,
+            structlog.processors.format_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    for handler in root.handlers:
+        handler.setFormatter(structlog.stdlib.ProcessorFormatter(processor=structlog.processors.JSONRenderer()))
+
+
+def _run(mode: str, pattern: str, events: int, devnull) -> float:
+    _configure(mode, devnull)
+    log = structlog.get_logger(f"bench.{mode}.{pattern}")
+    started = time.perf_counter()
+    if pattern == "debug":
+        for i in range(events):
+            log.debug("Audio frame details", call_id="1700000000.1", frame=i, bytes=320, rate=8000)
+    elif pattern == "info":
+        for i in range(events):
+            log.info(
+                "Streaming chunk processed",
+                call_id="1700000000.1",
+                stream_id="stream-1",
+                chunk=i,
+                bytes=640,
+                target_format="ulaw",
+                target_rate=8000,
+                jitter={"frames": 6, "high_water": 12},
+                provider="deepgram",
+            )
+    else:
+        calls = 20
+        for i in range(events):
+            log.debug("RTP packet loss detected", call_id=f"call-{i % calls}", expected=i, received=i + 1, lost=1)
+            log.info("RTP packet loss detected", call_id=f"call-{i % calls}", expected=i, received=i + 1, lost=1)
+    elapsed = time.perf_counter() - started
+    return events / max(1e-9, elapsed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the structlog pipeline")
+    parser.add_argument("--events", type=int, default=50000)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        print(f"events={args.events} (events/sec, higher is better)")
+        print(f"{'pattern':<8} {'legacy':>12} {'fast':>12} {'speedup':>8}")
+        for pattern in ("debug", "info", "frame"):
+            legacy = _run("legacy", pattern, args.events, devnull)
+            fast = _run("fast", pattern, args.events, devnull)
+            print(f"{pattern:<8} {legacy:>12,.0f} {fast:>12,.0f} {fast / legacy:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Provider session start benchmark: cold connect vs warm pool (local stand-in).
+
+Runs a local websocket stand-in for the OpenAI Realtime API that delays the
+upgrade response and each server event by --rtt-ms (one network round trip),
+then starts --calls OpenAI Realtime provider sessions, --gap-ms apart:
+
+  * cold – start_session() opens the websocket, waits for session.created and
+           sends the full session.update (previous behaviour)
+  * warm – a ProviderWarmPool of --pool-size keeps sockets connected with the
+           base session applied; start_session() sends the per-call delta
+
+Reports start_session latency (p50/p95/max) and warm pool hits/misses.
+
+Usage:
+    python scripts/bench_provider_warm_pool.py --calls 50 --rtt-ms 120 --pool-size 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import structlog  # noqa: E402
+from websockets.asyncio.server import serve  # noqa: E402
+from websockets.exceptions import ConnectionClosed  # noqa: E402
+
+from src.config import OpenAIRealtimeProviderConfig  # noqa: E402
+from src.core.provider_warm_pool import ProviderWarmPool  # noqa: E402
+from src.providers.openai_realtime import OpenAIRealtimeProvider  # noqa: E402
+
+
+def _pct(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+async def _on_event(event):
+    return None
+
+
+async def _run(mode: str, args) -> dict:
+    rtt = args.rtt_ms / 1000.0
+
+    async def process_request(connection, request):
+        # TCP/TLS + HTTP upgrade cost before the socket is usable.
+        await asyncio.sleep(rtt * args.handshake_rtts)
+        return None
+
+    async def handler(websocket):
+        try:
+            await asyncio.sleep(rtt)
+            await websocket.send(json.dumps({"type": "session.created", "session": {"id": "sess", "model": "bench"}}))
+            async for raw in websocket:
+                if json.loads(raw).get("type") == "session.update":
+                    await asyncio.sleep(rtt)
+                    await websocket.send(
+                        json.dumps({"type": "session.updated", "session": {"output_audio_format": "pcm16"}})
+                    )
+        except ConnectionClosed:
+            pass
+
+    async with serve(handler, "127.0.0.1", 0, process_request=process_request) as server:
+        port = server.sockets[0].getsockname()[1]
+
+        def config(instructions: str) -> OpenAIRealtimeProviderConfig:
+            return OpenAIRealtimeProviderConfig(
+                api_key="bench",
+                model="bench",
+                base_url=f"ws://127.0.0.1:{port}/v1/realtime",
+                instructions=instructions,
+                response_modalities=["audio"],
+            )
+
+        pool = None
+        if mode == "warm":
+            pool = ProviderWarmPool(
+                "openai_realtime",
+                lambda: OpenAIRealtimeProvider(config("Base prompt"), _on_event).open_warm_connection(),
+                size=args.pool_size,
+            )
+            pool.start()
+            while pool.stats()["idle"] < args.pool_size:
+                await asyncio.sleep(0.01)
+
+        latencies = []
+
+        async def call(i: int) -> None:
+            provider = OpenAIRealtimeProvider(config(f"Prompt for call {i}"), _on_event)
+            started = time.perf_counter()
+            if pool is not None:
+                warm = pool.lease()
+                if warm is not None:
+                    provider.adopt_warm_connection(warm)
+            await provider.start_session(f"bench-{i}", context={"tools": []})
+            latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(args.hold_ms / 1000.0)
+            await provider.stop_session()
+
+        tasks = []
+        for i in range(args.calls):
+            tasks.append(asyncio.create_task(call(i)))
+            await asyncio.sleep(args.gap_ms / 1000.0)
+        await asyncio.gather(*tasks)
+        stats = pool.stats() if pool is not None else {"hits": 0, "misses": 0}
+        if pool is not None:
+            await pool.close()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "p50": _pct(latencies, 0.5),
+        "p95": _pct(latencies, 0.95),
+        "max": latencies[-1],
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+    }
+
+
+async def _main(args) -> None:
+    print(
+        f"calls={args.calls} gap_ms={args.gap_ms} rtt_ms={args.rtt_ms} handshake_rtts={args.handshake_rtts} "
+        f"pool_size={args.pool_size}"
+    )
+    print(f"{'mode':<5} {'p50_ms':>8} {'p95_ms':>8} {'max_ms':>8} {'hits':>5} {'misses':>7}")
+    for mode in ("cold", "warm"):
+        r = await _run(mode, args)
+        print(f"{r['mode']:<5} {r['p50']:>8.1f} {r['p95']:>8.1f} {r['max']:>8.1f} {r['hits']:>5} {r['misses']:>7}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark provider session start with and without a warm pool")
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--gap-ms", type=float, default=200.0, help="Time between call arrivals")
+    parser.add_argument("--hold-ms", type=float, default=100.0, help="How long each session stays up")
+    parser.add_argument("--rtt-ms", type=float, default=120.0, help="Simulated network round trip")
+    parser.add_argument("--handshake-rtts", type=float, default=3.0, help="Round trips for TCP+TLS+upgrade")
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+    # Per-session info logs would dominate the output.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    # Connects still in flight when the pool closes abort their handshake on the stand-in.
+    logging.getLogger("websockets").setLevel(logging.CRITICAL)
+    asyncio.run(_main(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
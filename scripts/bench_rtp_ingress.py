@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+RTP ingress benchmark.
+
+Drives N concurrent calls of 20 ms RTP (50 packets/s each) into RTPServer
+from a separate sender process and measures the server process's CPU time
+per call for each socket mode:
+
+  * per_call – one bound socket + receiver task per call (default)
+  * shared   – a small pool of sockets demultiplexed by remote address/SSRC,
+               drained in batches per readiness event
+
+Usage:
+    python scripts/bench_rtp_ingress.py --calls 200 --seconds 5
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.logging_config import configure_logging  # noqa: E402
+from src.rtp_server import RTPServer  # noqa: E402
+
+PAYLOAD = b"\xff" * 160  # 20 ms μ-law silence
+
+
+def _packet(ssrc: int, seq: int) -> bytes:
+    return struct.pack("!BBHII", 0x80, 0, seq & 0xFFFF, (seq * 160) & 0xFFFFFFFF, ssrc) + PAYLOAD
+
+
+def _sender(socks, targets, ticks: int) -> None:
+    """Child process: send one packet per call every 20 ms."""
+    start = time.monotonic()
+    for tick in range(ticks):
+        for i, (sock, target) in enumerate(zip(socks, targets)):
+            try:
+                sock.sendto(_packet(1000 + i, tick + 2), target)
+            except BlockingIOError:
+                pass
+        delay = start + (tick + 1) * 0.02 - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+async def _run(mode: str, calls: int, seconds: float, base_port: int, shared_sockets: int):
+    received = 0
+
+    async def on_audio(call_id: str, ssrc: int, pcm: bytes) -> None:
+        nonlocal received
+        received += 1
+
+    server = RTPServer(
+        host="127.0.0.1",
+        port=base_port,
+        engine_callback=on_audio,
+        codec="ulaw",
+        sample_rate=8000,
+        port_range=(base_port, base_port + calls + shared_sockets + 8),
+        socket_mode=mode,
+        shared_socket_count=shared_sockets,
+    )
+    await server.start()
+    socks, targets = [], []
+    try:
+        # Set calls up one at a time, as the engine does: allocate, then first packet.
+        for i in range(calls):
+            call_id = f"bench-{i}"
+            port = await server.allocate_session(call_id)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(("127.0.0.1", 0))
+            socks.append(sock)
+            targets.append(("127.0.0.1", port))
+            sock.sendto(_packet(1000 + i, 1), ("127.0.0.1", port))
+            while not server.has_remote_endpoint(call_id):
+                await asyncio.sleep(0.001)
+
+        ticks = max(1, int(seconds * 50))
+        received = 0
+        proc = multiprocessing.get_context("fork").Process(target=_sender, args=(socks, targets, ticks))
+        cpu_start = time.process_time()
+        wall_start = time.monotonic()
+        proc.start()
+        while proc.is_alive():
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.1)  # let queued datagrams drain
+        cpu = time.process_time() - cpu_start
+        wall = time.monotonic() - wall_start
+        stats = server.get_stats()
+        return {
+            "mode": mode,
+            "sent": ticks * calls,
+            "received": received,
+            "cpu": cpu,
+            "wall": wall,
+            "tasks": len(asyncio.all_tasks()),
+            "sockets": len(server.sessions) if mode == "per_call" else len(stats["shared_sockets"]),
+            "avg_batch": max((s["avg_batch"] for s in stats["shared_sockets"]), default=1.0),
+        }
+    finally:
+        for sock in socks:
+            sock.close()
+        await server.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark RTP ingress socket modes")
+    parser.add_argument("--calls", type=int, default=200, help="Concurrent calls")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Audio seconds per call")
+    parser.add_argument("--port", type=int, default=40000, help="First UDP port to use")
+    parser.add_argument("--shared-sockets", type=int, default=2, help="Pool size for shared mode")
+    parser.add_argument("--mode", choices=["both", "per_call", "shared"], default="both")
+    args = parser.parse_args()
+    configure_logging(log_level="WARNING")
+
+    modes = ["per_call", "shared"] if args.mode == "both" else [args.mode]
+    print(f"calls={args.calls} seconds={args.seconds} packets/s={args.calls * 50}")
+    print(
+        f"{'mode':<9} {'sockets':>7} {'tasks':>6} {'recv/sent':>15} {'cpu_s':>7} "
+        f"{'cpu%':>6} {'cpu_ms/call/s':>14} {'avg_batch':>9}"
+    )
+    for mode in modes:
+        r = asyncio.run(_run(mode, args.calls, args.seconds, args.port, args.shared_sockets))
+        per_call = r["cpu"] * 1000 / (args.calls * r["wall"])
+        print(
+            f"{r['mode']:<9} {r['sockets']:>7} {r['tasks']:>6} {r['received']:>7}/{r['sent']:<7} "
+            f"{r['cpu']:>7.2f} {100 * r['cpu'] / r['wall']:>5.0f}% {per_call:>14.3f} {r['avg_batch']:>9.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+SessionStore per-frame lookup benchmark.
+
+Simulates N concurrent calls, each running an inbound-audio task and an
+outbound-playback task that look up the call's session every 20 ms frame
+(as ``_on_rtp_audio`` and ``_send_audio_chunk`` do), plus a TTS gating
+token set/clear every 25 frames. Frames are not paced; the figure of merit
+is event-loop CPU per frame.
+
+  * global – previous store: every lookup and mutation takes one store-wide lock
+  * lockfree – current store: ``await get_by_call_id()`` without a lock,
+               per-call locks for gating
+  * handle – frame tasks hold a ``SessionHandle`` and read ``handle.session``
+
+Usage:
+    python scripts/bench_session_store.py --calls 100 300 500 --frames 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import structlog  # noqa: E402
+
+from src.core.models import CallSession  # noqa: E402
+from src.core.session_store import SessionStore  # noqa: E402
+
+MODES = ("global", "lockfree", "handle")
+GATING_EVERY = 25
+
+
+class _GlobalLockStore(SessionStore):
+    """Previous locking model: one asyncio.Lock around every operation."""
+
+    async def get_by_call_id(self, call_id: str) -> Optional[CallSession]:
+        async with self._lock:
+            return self._sessions_by_call_id.get(call_id)
+
+    def _call_lock(self, call_id: str) -> asyncio.Lock:
+        return self._lock
+
+
+async def _frame_task(store: SessionStore, mode: str, call_id: str, frames: int, gating: bool) -> None:
+    handle = store.handle(call_id) if mode == "handle" else None
+    for n in range(frames):
+        if handle is not None:
+            session = handle.session
+        else:
+            session = await store.get_by_call_id(call_id)
+        assert session is not None
+        if gating and n % GATING_EVERY == 0:
+            await store.set_gating_token(call_id, f"pb-{n}")
+            await store.clear_gating_token(call_id, f"pb-{n}")
+        # Yield like a real frame handler awaiting transport I/O
+        await asyncio.sleep(0)
+
+
+async def _run(mode: str, calls: int, frames: int) -> dict:
+    store = _GlobalLockStore() if mode == "global" else SessionStore()
+    for i in range(calls):
+        call_id = f"call-{i}"
+        await store.upsert_call(CallSession(call_id=call_id, caller_channel_id=call_id, provider_name="pipeline"))
+    tasks = []
+    for i in range(calls):
+        call_id = f"call-{i}"
+        tasks.append(_frame_task(store, mode, call_id, frames, gating=True))   # outbound playback
+        tasks.append(_frame_task(store, mode, call_id, frames, gating=False))  # inbound audio
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return {
+        "mode": mode,
+        "calls": calls,
+        "frames": calls * frames * 2,
+        "cpu": time.process_time() - cpu,
+        "wall": time.perf_counter() - wall,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SessionStore lookups under concurrent calls")
+    parser.add_argument("--calls", type=int, nargs="+", default=[100, 300, 500], help="Concurrent calls")
+    parser.add_argument("--frames", type=int, default=500, help="Frames per task (500 = 10 s of audio)")
+    args = parser.parse_args()
+
+    # Gating logs at info level on every token change; keep them out of the timing.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    print(f"frames_per_task={args.frames} gating_every={GATING_EVERY}")
+    print(f"{'calls':>5} {'mode':<8} {'frames':>8} {'cpu_ms':>9} {'us/frame':>9} {'wall_ms':>9}")
+    for calls in args.calls:
+        for mode in MODES:
+            r = asyncio.run(_run(mode, calls, args.frames))
+            per_frame = r["cpu"] * 1e6 / max(1, r["frames"])
+            print(
+                f"{r['calls']:>5} {r['mode']:<8} {r['frames']:>8} {r['cpu'] * 1000:>9.1f} "
+                f"{per_frame:>9.2f} {r['wall'] * 1000:>9.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
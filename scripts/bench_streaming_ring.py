@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Streaming playback buffering allocation benchmark.
+
+Replays a 60 s TTS stream (irregular provider chunks) through the playback
+buffering path and reports allocations measured with tracemalloc:
+
+  * queue – the previous design: asyncio.Queue of provider ``bytes`` plus a
+            per-call remainder that is re-concatenated and sliced into frames
+  * ring  – FrameRingBuffer: chunks copied once into a preallocated bytearray,
+            frames read as memoryviews and consumed after "send"
+
+Each 20 ms pacer tick is measured on its own (tracemalloc.reset_peak), so
+"alloc/frame" is the memory the tick allocated on top of the buffered state
+it started with (frame objects, re-sliced remainders, views).
+
+Usage:
+    python scripts/bench_streaming_ring.py --seconds 60 --format ulaw
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.audio.frame_ring import FrameRingBuffer  # noqa: E402
+
+FORMATS = {
+    # name: (bytes per 20 ms frame, bytes per second)
+    "ulaw": (160, 8000),
+    "slin16": (640, 32000),
+}
+
+
+def _provider_chunks(seconds: float, bytes_per_sec: int, seed: int):
+    """TTS-like chunking: 40-400 ms chunks with odd sizes."""
+    rng = random.Random(seed)
+    remaining = int(seconds * bytes_per_sec)
+    while remaining > 0:
+        n = min(remaining, int(bytes_per_sec * rng.uniform(0.04, 0.4)) | 1)
+        remaining -= n
+        yield os.urandom(n)
+
+
+def _send(frame) -> int:
+    # Stand-in for the transport; what it does with the payload is the same for both modes.
+    return len(frame)
+
+
+async def _run_queue(chunks, frame_size: int, stats: dict) -> None:
+    queue: asyncio.Queue = asyncio.Queue()
+    remainder = b""
+    for chunk in chunks:
+        await queue.put(chunk)
+        while True:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            pending = remainder
+            while len(pending) < frame_size and not queue.empty():
+                pending += queue.get_nowait()
+            if len(pending) < frame_size:
+                remainder = pending
+                break
+            frame = pending[:frame_size]
+            remainder = pending[frame_size:]
+            _send(frame)
+            stats["alloc"] += tracemalloc.get_traced_memory()[1] - base
+            stats["frames"] += 1
+            # Drop tick-local references so the next tick's baseline is just the remainder.
+            frame = pending = None
+
+
+async def _run_ring(chunks, frame_size: int, stats: dict) -> None:
+    ring = FrameRingBuffer(capacity=32000, frame_size=frame_size)
+    for chunk in chunks:
+        await ring.wait_for_space(len(chunk))
+        ring.write(chunk)
+        while ring.frames(frame_size):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            _send(ring.peek_frame(frame_size))
+            ring.consume(frame_size)
+            stats["alloc"] += tracemalloc.get_traced_memory()[1] - base
+            stats["frames"] += 1
+
+
+def _measure(mode: str, seconds: float, fmt: str, seed: int) -> dict:
+    frame_size, bytes_per_sec = FORMATS[fmt]
+    chunks = list(_provider_chunks(seconds, bytes_per_sec, seed))
+    stats = {"mode": mode, "frames": 0, "alloc": 0, "chunks": len(chunks)}
+    runner = _run_queue if mode == "queue" else _run_ring
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        asyncio.run(runner(chunks, frame_size, stats))
+        stats["wall"] = time.perf_counter() - started
+    finally:
+        tracemalloc.stop()
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark streaming playback buffer allocations")
+    parser.add_argument("--seconds", type=float, default=60.0, help="TTS audio length")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="ulaw", help="Egress format")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"seconds={args.seconds} format={args.format}")
+    print(f"{'mode':<6} {'chunks':>6} {'frames':>6} {'alloc/frame':>12} {'alloc_total_kb':>14} {'wall_ms':>8}")
+    for mode in ("queue", "ring"):
+        r = _measure(mode, args.seconds, args.format, args.seed)
+        per_frame = r["alloc"] / max(1, r["frames"])
+        print(
+            f"{r['mode']:<6} {r['chunks']:>6} {r['frames']:>6} {per_frame:>12.1f} "
+            f"{r['alloc'] / 1024:>14.1f} {r['wall'] * 1000:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tool schema compilation benchmark.
+
+Registers N in-call tools (half with a raw MCP-style input schema so the
+Deepgram path walks it in _strip_defaults) and times what a session/turn pays
+to obtain its tool list per provider format:
+
+  * rebuild – previous behaviour: every ToolDefinition converted on each call
+  * cached  – ToolRegistry's compiled schema cache
+  * json    – cached, pre-serialized bytes (ToolRegistry.schema_json)
+
+Usage:
+    python scripts/bench_tool_schemas.py --tools 24 --iterations 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.tools.base import Tool, ToolCategory, ToolDefinition, ToolParameter  # noqa: E402
+from src.tools.registry import _SCHEMA_BUILDERS, tool_registry  # noqa: E402
+
+FORMATS = ("openai", "openai_realtime", "deepgram", "elevenlabs")
+
+
+def _make_tool(i: int):
+    if i % 2:
+        definition = ToolDefinition(
+            name=f"mcp_tool_{i}",
+            description=f"MCP tool {i}",
+            category=ToolCategory.BUSINESS,
+            input_schema={
+                "type": "object",
+                "properties": {
+                    f"field_{k}": {"type": "string", "description": f"Field {k}", "default": ""}
+                    for k in range(6)
+                },
+                "required": ["field_0"],
+            },
+        )
+    else:
+        definition = ToolDefinition(
+            name=f"http_tool_{i}",
+            description=f"HTTP tool {i}",
+            category=ToolCategory.BUSINESS,
+            parameters=[
+                ToolParameter(name=f"p{k}", type="string", description=f"Param {k}", required=k == 0, default="x")
+                for k in range(4)
+            ],
+        )
+
+    class _T(Tool):
+        @property
+        def definition(self) -> ToolDefinition:
+            return definition
+
+        async def execute(self, parameters, context):
+            return {}
+
+    return _T
+
+
+def _time(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark provider tool schema compilation")
+    parser.add_argument("--tools", type=int, default=24)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    tool_registry.clear()
+    for i in range(args.tools):
+        tool_registry.register(_make_tool(i))
+    names = tool_registry.list_tools()
+
+    print(f"tools={args.tools} iterations={args.iterations} (µs per session/turn, lower is better)")
+    print(f"{'format':<16} {'rebuild':>9} {'cached':>9} {'json':>9} {'rebuild+dumps':>14}")
+    for fmt in FORMATS:
+        build = _SCHEMA_BUILDERS[fmt]
+
+        def rebuild():
+            return [build(tool.definition) for tool in tool_registry._iter_tools_filtered(names)]
+
+        method = getattr(tool_registry, f"to_{fmt}_schema_filtered")
+        legacy = _time(rebuild, args.iterations)
+        cached = _time(lambda: method(names), args.iterations)
+        raw = _time(lambda: tool_registry.schema_json(fmt, names), args.iterations)
+        legacy_json = _time(lambda: json.dumps(rebuild()), max(1, args.iterations // 4))
+        print(f"{fmt:<16} {legacy:>9.1f} {cached:>9.2f} {raw:>9.2f} {legacy_json:>14.1f}")
+    tool_registry.clear()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+TTS phrase cache benchmark.
+
+Simulates N calls arriving in waves, each speaking the context greeting and,
+for a fraction of calls, a slow-tool "one moment" message and the configured
+farewell. The TTS adapter is a stub with a fixed time-to-first-byte and a
+per-chunk streaming delay (roughly a cloud TTS over a good link).
+
+  * none     – every phrase synthesized (previous behavior)
+  * cold     – TTSPhraseCache, empty at start (memory + disk tier)
+  * prewarm  – TTSPhraseCache with the greeting synthesized before the first call
+
+Reports TTS requests issued and per-phrase latency until the audio is ready.
+
+Usage:
+    python scripts/bench_tts_cache.py --calls 200 --wave 20 --ttfb-ms 300
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.tts_cache import TTSPhraseCache, make_key  # noqa: E402
+
+PHRASES = {
+    "greeting": "Thanks for calling Acme support. How can I help you today?",
+    "slow": "One moment while I look that up.",
+    "farewell": "Thanks for calling. Goodbye!",
+}
+
+
+class _StubTTS:
+    def __init__(self, ttfb: float, chunk_delay: float, seconds: float):
+        self.ttfb = ttfb
+        self.chunk_delay = chunk_delay
+        self.chunks = max(1, int(seconds * 10))  # 100 ms μ-law chunks
+        self.requests = 0
+
+    async def synthesize(self, text: str):
+        self.requests += 1
+        await asyncio.sleep(self.ttfb)
+        for _ in range(self.chunks):
+            await asyncio.sleep(self.chunk_delay)
+            yield b"\xff" * 800
+
+
+async def _phrase(tts: _StubTTS, cache, text: str) -> float:
+    async def synthesize() -> bytes:
+        buf = bytearray()
+        async for chunk in tts.synthesize(text):
+            buf.extend(chunk)
+        return bytes(buf)
+
+    started = time.perf_counter()
+    if cache is None:
+        await synthesize()
+    else:
+        await cache.get_or_synthesize(make_key("stub_tts", "v1", {"format": {"encoding": "mulaw"}}, text), synthesize)
+    return time.perf_counter() - started
+
+
+async def _run(mode: str, args, cache_dir: str) -> dict:
+    tts = _StubTTS(args.ttfb_ms / 1000.0, args.chunk_ms / 1000.0, args.phrase_seconds)
+    cache = None if mode == "none" else TTSPhraseCache(cache_dir)
+    if mode == "prewarm":
+        await _phrase(tts, cache, PHRASES["greeting"])
+        tts.requests = 0
+
+    latencies = {name: [] for name in PHRASES}
+
+    async def call(i: int) -> None:
+        latencies["greeting"].append(await _phrase(tts, cache, PHRASES["greeting"]))
+        if i % 3 == 0:
+            latencies["slow"].append(await _phrase(tts, cache, PHRASES["slow"]))
+        latencies["farewell"].append(await _phrase(tts, cache, PHRASES["farewell"]))
+
+    for start in range(0, args.calls, args.wave):
+        await asyncio.gather(*(call(i) for i in range(start, min(args.calls, start + args.wave))))
+    return {"mode": mode, "requests": tts.requests, "latencies": latencies}
+
+
+def _p(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * (len(values) - 1)))] * 1000 if values else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the TTS phrase cache")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--wave", type=int, default=20, help="Calls arriving together")
+    parser.add_argument("--ttfb-ms", type=float, default=300.0)
+    parser.add_argument("--chunk-ms", type=float, default=5.0, help="Delay per 100 ms audio chunk")
+    parser.add_argument("--phrase-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"calls={args.calls} wave={args.wave} ttfb_ms={args.ttfb_ms} phrase_s={args.phrase_seconds}")
+    print(f"{'mode':<8} {'tts_requests':>12} {'greet_p50':>10} {'greet_p95':>10} {'farewell_p50':>12}")
+    for mode in ("none", "cold", "prewarm"):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            r = asyncio.run(_run(mode, args, cache_dir))
+        lat = r["latencies"]
+        print(
+            f"{mode:<8} {r['requests']:>12} {_p(lat['greeting'], 0.5):>9.1f}ms "
+            f"{_p(lat['greeting'], 0.95):>9.1f}ms {_p(lat['farewell'], 0.5):>11.1f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
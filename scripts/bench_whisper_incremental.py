@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Whisper incremental decoding replay benchmark.
+
+Replays utterances of increasing length through two decode strategies using a
+fake model whose cost is proportional to the window it is asked to decode
+(like Whisper's encoder):
+
+  * legacy       – re-transcribe the whole growing buffer every interval
+                   (what the faster_whisper / whisper_cpp stream handlers did)
+  * incremental  – IncrementalWhisperDecoder (LocalAgreement-2 + trimming)
+
+Reports decoded audio seconds and CPU per utterance.
+
+Usage:
+    python scripts/bench_whisper_incremental.py --lengths 5 10 20 40
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "local_ai_server")))
+
+from stt_backends import IncrementalWhisperDecoder  # noqa: E402
+
+RATE = 16000
+WORD_SAMPLES = int(RATE * 0.4)
+GAP_SAMPLES = int(RATE * 0.1)
+CHUNK = RATE // 50  # 20 ms
+
+
+def _utterance(seconds: float) -> bytes:
+    parts = []
+    n_words = int(seconds / 0.5)
+    for i in range(n_words):
+        parts.append(np.full(WORD_SAMPLES, (i % 20 + 1) * 1000, dtype=np.int16))
+        parts.append(np.zeros(GAP_SAMPLES, dtype=np.int16))
+    return np.concatenate(parts).tobytes()
+
+
+class FakeModel:
+    """Level-coded 'recogniser' that burns CPU proportional to window length."""
+
+    def __init__(self, cost_passes: int):
+        self.cost_passes = cost_passes
+        self.decoded = 0
+
+    def __call__(self, audio, prompt, final):
+        self.decoded += audio.size
+        for _ in range(self.cost_passes):
+            np.fft.rfft(audio)
+        levels = np.rint(audio * 32768 / 1000).astype(int)
+        edges = np.flatnonzero(np.diff(levels)) + 1
+        bounds = np.concatenate(([0], edges, [levels.size]))
+        segments = []
+        for s, e in zip(bounds[:-1], bounds[1:]):
+            if levels[s] > 0 and (e < levels.size or final):
+                segments.append((s / RATE, e / RATE, f"w{levels[s]}"))
+        return segments
+
+
+def _run_legacy(pcm: bytes, model: FakeModel, interval: int) -> float:
+    start = time.process_time()
+    buf = b""
+    pending = 0
+    for pos in range(0, len(pcm), CHUNK * 2):
+        chunk = pcm[pos:pos + CHUNK * 2]
+        buf += chunk
+        pending += len(chunk) // 2
+        if pending >= interval:
+            pending = 0
+            model(np.frombuffer(buf, dtype=np.int16).astype(np.float32) / 32768.0, "", False)
+    model(np.frombuffer(buf, dtype=np.int16).astype(np.float32) / 32768.0, "", True)
+    return time.process_time() - start
+
+
+def _run_incremental(pcm: bytes, model: FakeModel, interval_ms: int) -> float:
+    decoder = IncrementalWhisperDecoder(model, sample_rate=RATE, partial_interval_ms=interval_ms)
+    start = time.process_time()
+    for pos in range(0, len(pcm), CHUNK * 2):
+        decoder.feed(pcm[pos:pos + CHUNK * 2])
+    decoder.finalize()
+    return time.process_time() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark incremental Whisper decoding")
+    parser.add_argument("--lengths", type=float, nargs="+", default=[5, 10, 20, 40], help="Utterance lengths (s)")
+    parser.add_argument("--interval-ms", type=int, default=500, help="Partial decode interval")
+    parser.add_argument("--cost", type=int, default=4, help="Fake model FFT passes per decode")
+    args = parser.parse_args()
+
+    interval = RATE * args.interval_ms // 1000
+    print(f"interval={args.interval_ms}ms cost_passes={args.cost}")
+    print(f"{'utt_s':>6} {'mode':<12} {'decoded_s':>10} {'x_realtime':>10} {'cpu_s':>8}")
+    for seconds in args.lengths:
+        pcm = _utterance(seconds)
+        for name, run in (
+            ("legacy", lambda m: _run_legacy(pcm, m, interval)),
+            ("incremental", lambda m: _run_incremental(pcm, m, args.interval_ms)),
+        ):
+            model = FakeModel(args.cost)
+            cpu = run(model)
+            decoded = model.decoded / RATE
+            print(f"{seconds:>6.0f} {name:<12} {decoded:>10.1f} {decoded / seconds:>10.1f} {cpu:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
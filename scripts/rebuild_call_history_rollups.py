@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Backfill or rebuild the Call History statistics rollups.
+
+Databases that already held call records when the rollup tables were added
+serve dashboard stats by scanning ``call_records`` until this has been run
+once. It is also safe to re-run at any time (for example after editing rows by
+hand): every rollup is recomputed from ``call_records`` in one transaction.
+
+Usage:
+    python scripts/rebuild_call_history_rollups.py
+    python scripts/rebuild_call_history_rollups.py --db /app/data/call_history.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.call_history import CallHistoryStore  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Rebuild Call History statistics rollups")
+    parser.add_argument(
+        "--db",
+        default=os.getenv("CALL_HISTORY_DB_PATH", "data/call_history.db"),
+        help="Path to the Call History SQLite database (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}", file=sys.stderr)
+        return 1
+    os.environ["CALL_HISTORY_ENABLED"] = "true"
+    store = CallHistoryStore(db_path=args.db)
+    started = time.perf_counter()
+    records = asyncio.run(store.rebuild_rollups())
+    print(f"Rebuilt call history rollups for {records} records in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
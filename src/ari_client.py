@@ -8,7 +8,6 @@ import json
 import os
 import time
 import uuid
-import audioop
 import wave
 from typing import Dict, Any, Optional, Callable, List
 import aiohttp
@@ -21,15 +20,34 @@ import ssl
 from websockets.exceptions import ConnectionClosed
 from websockets.asyncio.client import ClientConnection
 
+from .ari_dispatcher import ARIEventDispatcher
+from .audio.resampler import mulaw_to_pcm16le
 from .config import AsteriskConfig
 from .logging_config import get_logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
 class ARIClient:
     """A client for interacting with the Asterisk REST Interface (ARI)."""
 
-    def __init__(self, username: str, password: str, base_url: str, app_name: str, ssl_verify: bool = True):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str,
+        app_name: str,
+        ssl_verify: bool = True,
+        *,
+        event_workers: int = 64,
+        event_queue_max: int = 5000,
+        event_hold_timeout_sec: float = 5.0,
+    ):
         self.username = username
         self.password = password
         self.app_name = app_name
@@ -55,6 +73,12 @@ class ARIClient:
         self.event_handlers: Dict[str, List[Callable]] = {}
         self.active_playbacks: Dict[str, str] = {}
         self.audio_frame_handler: Optional[Callable] = None
+        # Events are dispatched in order per channel/bridge by a bounded worker pool
+        self.dispatcher = ARIEventDispatcher(
+            workers=event_workers,
+            max_pending=event_queue_max,
+            hold_timeout=event_hold_timeout_sec,
+        )
 
     def on_event(self, event_type: str, handler: Callable):
         """Alias for add_event_handler for backward compatibility."""
@@ -155,21 +179,20 @@ class ARIClient:
                 # Note: PlaybackFinished is registered by Engine.start(). Avoid duplicate registration here.
                 async for message in self.websocket:
                     try:
-                        event_data = json.loads(message)
+                        event_data = _json_loads(message)
                         event_type = event_data.get("type")
+                        handlers: List[Callable] = []
                         
                         # Handle audio frames from ExternalMedia connections
                         if event_type == "ChannelAudioFrame":
-                            channel = event_data.get('channel', {})
-                            channel_id = channel.get('id')
-                            logger.debug("ChannelAudioFrame received", channel_id=channel_id)
-                            asyncio.create_task(self._on_audio_frame(channel, event_data))
+                            logger.debug("ChannelAudioFrame received", channel_id=event_data.get('channel', {}).get('id'))
+                            handlers.append(self._dispatch_audio_frame)
                         
                         # Handle other events
                         if event_type and event_type in self.event_handlers:
-                            for handler in self.event_handlers[event_type]:
-                                # Call the handler with just the event data
-                                asyncio.create_task(handler(event_data))
+                            handlers.extend(self.event_handlers[event_type])
+                        # Ordered per channel/bridge; waits here (backpressure) when the dispatcher is full
+                        await self.dispatcher.submit(event_data, handlers)
                     except json.JSONDecodeError:
                         logger.warning("Failed to decode ARI event JSON", message=message)
                         
@@ -219,6 +242,7 @@ class ARIClient:
         self._should_reconnect = False  # Stop the reconnect supervisor
         self._connected = False
         self.running = False
+        await self.dispatcher.close()
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
@@ -724,6 +748,9 @@ class ARIClient:
                 except OSError as e:
                     logger.debug("Could not clean up file", file_path=file_path, error=str(e))
 
+    async def _dispatch_audio_frame(self, event):
+        await self._on_audio_frame(event.get('channel', {}), event)
+
     async def _on_audio_frame(self, channel, event):
         """Handles incoming raw audio frames from the snoop channel."""
         try:
@@ -826,7 +853,7 @@ class ARIClient:
         """Convert ulaw audio data to a WAV file and return the file path."""
         try:
             # Convert ulaw to linear PCM
-            pcm_data = audioop.ulaw2lin(ulaw_data, 2)  # 2 bytes per sample (16-bit)
+            pcm_data = mulaw_to_pcm16le(ulaw_data)  # 2 bytes per sample (16-bit)
             
             # Create timestamped filename for better debugging
             import time
@@ -0,0 +1,260 @@
+"""
+Ordered, bounded dispatch of ARI WebSocket events.
+
+``ARIClient`` used to spawn one task per event and handler, so handlers for the
+same channel could interleave (``ChannelDestroyed`` cleanup racing a
+``StasisStart`` that was still setting the call up) and a call storm created an
+unbounded number of tasks.
+
+``ARIEventDispatcher`` shards events by the resource they are about (channel,
+bridge, playback, recording) onto per-key FIFO lanes.  A fixed pool of worker
+tasks drains the lanes: events for one key run strictly in arrival order, events
+for different keys run in parallel up to the pool size.  ``submit()`` blocks
+once ``max_pending`` events are queued, which stops the WebSocket reader and
+pushes backpressure onto the socket instead of growing memory.
+
+A handler that is still running after ``hold_timeout`` seconds keeps running
+in the background and its lane moves on; this bounds the damage of a handler
+that waits for a later event on its own channel (e.g. a PlaybackFinished).
+
+DTMF events get a lane of their own per channel (``dtmf:<id>``): handlers such
+as the attended-transfer flow wait for digits on the channel whose StasisStart
+they are running in, so a digit must not queue behind that handler.  Digits
+stay in order among themselves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_ARI_EVENT_QUEUE_DEPTH = Gauge(
+    "ai_agent_ari_event_queue_depth",
+    "ARI events queued for dispatch (all lanes)",
+)
+_ARI_EVENT_LANES = Gauge(
+    "ai_agent_ari_event_lanes",
+    "Channel/bridge lanes with queued or running ARI events",
+)
+_ARI_EVENT_DISPATCH_LAG_SECONDS = Histogram(
+    "ai_agent_ari_event_dispatch_lag_seconds",
+    "Time from ARI event receipt to its handlers starting",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_ARI_EVENT_BACKPRESSURE_TOTAL = Counter(
+    "ai_agent_ari_event_backpressure_total",
+    "Times the ARI reader waited for dispatch queue space",
+)
+_ARI_EVENT_LANE_RELEASES_TOTAL = Counter(
+    "ai_agent_ari_event_lane_releases_total",
+    "ARI handlers still running at the hold timeout (lane ordering released)",
+)
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+_QueuedEvent = Tuple[float, Dict[str, Any], Tuple[EventHandler, ...]]
+
+# Resource objects that identify what an event is about, in priority order.
+_KEY_FIELDS = ("channel", "bridge", "playback", "recording", "peer")
+_UNKEYED = "global"
+# Events ordered on a per-channel lane separate from the channel's lifecycle events.
+_SIDE_LANE_EVENTS = {"ChannelDtmfReceived": "dtmf"}
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    """Ordering key for an ARI event: the first resource id it carries."""
+    for field in _KEY_FIELDS:
+        obj = event.get(field)
+        if isinstance(obj, dict):
+            rid = obj.get("id") or obj.get("name")
+            if rid:
+                if field == "channel" and event.get("type") in _SIDE_LANE_EVENTS:
+                    return f"{_SIDE_LANE_EVENTS[event['type']]}:{rid}"
+                return f"{field}:{rid}"
+    return _UNKEYED
+
+
+class ARIEventDispatcher:
+    """Per-key ordered event lanes drained by a bounded worker pool."""
+
+    def __init__(self, workers: int = 64, max_pending: int = 5000, hold_timeout: Optional[float] = 5.0, batch: int = 8):
+        """
+        Args:
+            workers: Worker tasks (max handlers running concurrently across keys).
+            max_pending: Queued events at which ``submit()`` starts to wait.
+            hold_timeout: Seconds a lane waits for its running handlers before
+                moving on; None/0 waits indefinitely.
+            batch: Events a worker takes from one lane before yielding it to
+                other lanes (fairness under a hot channel).
+        """
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending))
+        self.hold_timeout = float(hold_timeout) if hold_timeout else None
+        self.batch = max(1, int(batch))
+        self._lanes: Dict[str, Deque[_QueuedEvent]] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._space: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._background: Set[asyncio.Future] = set()
+        self._pending = 0
+        self.dispatched = 0
+        self.high_water = 0
+        self.backpressure_waits = 0
+        self.lane_releases = 0
+        self.handler_errors = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._tasks)
+
+    def _ensure_started(self) -> None:
+        if self.running:
+            return
+        if self._ready is None:
+            self._ready = asyncio.Queue()
+            self._space = asyncio.Event()
+            self._space.set()
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def submit(self, event: Dict[str, Any], handlers: Sequence[EventHandler]) -> None:
+        """Queue ``event`` for ``handlers`` on its key's lane; waits while the dispatcher is full."""
+        if not handlers:
+            return
+        self._ensure_started()
+        if self._pending >= self.max_pending:
+            self.backpressure_waits += 1
+            _ARI_EVENT_BACKPRESSURE_TOTAL.inc()
+            while self._pending >= self.max_pending:
+                self._space.clear()
+                await self._space.wait()
+        key = event_key(event)
+        item = (time.monotonic(), event, tuple(handlers))
+        lane = self._lanes.get(key)
+        if lane is None:
+            self._lanes[key] = deque((item,))
+            self._ready.put_nowait(key)
+            _ARI_EVENT_LANES.set(len(self._lanes))
+        else:
+            # Lane is queued or being drained by a worker; it will pick this up in order.
+            lane.append(item)
+        self._pending += 1
+        if self._pending > self.high_water:
+            self.high_water = self._pending
+        _ARI_EVENT_QUEUE_DEPTH.set(self._pending)
+
+    async def close(self) -> None:
+        """Stop the workers; queued events are dropped and background handlers cancelled."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        for fut in list(self._background):
+            fut.cancel()
+        self._background.clear()
+        self._lanes.clear()
+        self._ready = None
+        if self._space is not None:
+            self._space.set()
+        self._space = None
+        self._pending = 0
+        _ARI_EVENT_QUEUE_DEPTH.set(0)
+        _ARI_EVENT_LANES.set(0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "lanes": len(self._lanes),
+            "high_water": self.high_water,
+            "dispatched": self.dispatched,
+            "backpressure_waits": self.backpressure_waits,
+            "lane_releases": self.lane_releases,
+            "handler_errors": self.handler_errors,
+            "background_handlers": len(self._background),
+        }
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            key = await self._ready.get()
+            lane = self._lanes.get(key)
+            for _ in range(self.batch):
+                if not lane:
+                    break
+                received, event, handlers = lane.popleft()
+                try:
+                    _ARI_EVENT_DISPATCH_LAG_SECONDS.observe(max(0.0, time.monotonic() - received))
+                except Exception:
+                    pass
+                try:
+                    await self._run(key, event, handlers)
+                finally:
+                    self._pending -= 1
+                    self.dispatched += 1
+                    _ARI_EVENT_QUEUE_DEPTH.set(self._pending)
+                    self._space.set()
+            if lane:
+                self._ready.put_nowait(key)
+            else:
+                self._lanes.pop(key, None)
+                _ARI_EVENT_LANES.set(len(self._lanes))
+
+    async def _run(self, key: str, event: Dict[str, Any], handlers: Tuple[EventHandler, ...]) -> None:
+        futures = []
+        for handler in handlers:
+            try:
+                futures.append(asyncio.ensure_future(handler(event)))
+            except Exception as exc:
+                self._handler_failed(event, handler, exc)
+        if not futures:
+            return
+        _, still_running = await asyncio.wait(futures, timeout=self.hold_timeout)
+        for fut in futures:
+            if fut in still_running:
+                continue
+            if not fut.cancelled() and fut.exception() is not None:
+                self._handler_failed(event, None, fut.exception())
+        if still_running:
+            self.lane_releases += 1
+            _ARI_EVENT_LANE_RELEASES_TOTAL.inc()
+            logger.warning(
+                "ARI handler exceeded lane hold timeout; continuing in background",
+                key=key,
+                event_type=event.get("type"),
+                hold_timeout=self.hold_timeout,
+            )
+            for fut in still_running:
+                self._background.add(fut)
+                fut.add_done_callback(self._background_done(event))
+
+    def _background_done(self, event: Dict[str, Any]) -> Callable[[asyncio.Future], None]:
+        def _done(fut: asyncio.Future) -> None:
+            self._background.discard(fut)
+            if not fut.cancelled() and fut.exception() is not None:
+                self._handler_failed(event, None, fut.exception())
+        return _done
+
+    def _handler_failed(self, event: Dict[str, Any], handler: Optional[EventHandler], exc: BaseException) -> None:
+        self.handler_errors += 1
+        logger.error(
+            "ARI event handler failed",
+            event_type=event.get("type"),
+            handler=getattr(handler, "__name__", None),
+            error=str(exc),
+            exc_info=exc,
+        )
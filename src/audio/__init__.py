@@ -4,6 +4,21 @@ Audio processing utilities for the Asterisk AI Voice Agent.
 This package contains audio processing helpers and utilities.
 """
 
+from .codec_engine import (
+    AudioCodecEngine,
+    AudioopCodecEngine,
+    NumpyCodecEngine,
+    Pcm16kInputStage,
+    PolyphaseResampler,
+    Resampler,
+    available_codec_engines,
+    create_codec_engine,
+    get_codec_engine,
+    set_codec_engine,
+)
+from .dsp_chain import PlaybackDSPChain
+from .frame_ring import FrameRingBuffer
+from .jitter_buffer import RTPJitterBuffer, conceal_pcm16
 from .resampler import (
     mulaw_to_pcm16le,
     pcm16le_to_mulaw,
@@ -12,6 +27,20 @@ from .resampler import (
 )
 
 __all__ = [
+    "AudioCodecEngine",
+    "AudioopCodecEngine",
+    "NumpyCodecEngine",
+    "Pcm16kInputStage",
+    "PolyphaseResampler",
+    "Resampler",
+    "available_codec_engines",
+    "create_codec_engine",
+    "get_codec_engine",
+    "set_codec_engine",
+    "FrameRingBuffer",
+    "PlaybackDSPChain",
+    "RTPJitterBuffer",
+    "conceal_pcm16",
     "mulaw_to_pcm16le",
     "pcm16le_to_mulaw",
     "resample_audio",
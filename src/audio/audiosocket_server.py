@@ -270,6 +270,26 @@ class AudioSocketServer:
             logger.error("Failed to send audio over AudioSocket", conn_id=conn_id, error=str(exc), exc_info=True)
             return False
 
+    def send_audio_nowait(self, conn_id: str, audio_payload: bytes) -> bool:
+        """Queue a PCM16 8k audio frame without waiting for the socket to drain.
+
+        For the frame clock's pacers: frames leave at real-time rate, so the
+        transport buffer stays small and there is nothing to wait for.
+        """
+        writer = self._writers.get(conn_id)
+        if not writer or writer.is_closing():
+            logger.debug("Attempted to send audio on closed connection", conn_id=conn_id)
+            return False
+
+        frame = bytes([TYPE_AUDIO]) + len(audio_payload).to_bytes(2, "big") + audio_payload
+        try:
+            writer.write(frame)
+            _AUDIO_BYTES_TX.inc(len(audio_payload))
+            return True
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Failed to send audio over AudioSocket", conn_id=conn_id, error=str(exc), exc_info=True)
+            return False
+
     def get_connection_count(self) -> int:
         return len(self._writers)
 
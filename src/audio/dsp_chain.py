@@ -0,0 +1,252 @@
+"""
+Per-stream PCM16 conditioning chain for streaming playback egress.
+
+``StreamingPlaybackManager`` used to run each conditioning step as its own
+pure-Python loop over ``array('h')`` (silence trim, DC clamp, attack envelope,
+RMS normalizer), converting back to ``bytes`` in between.  ``PlaybackDSPChain``
+is configured once per stream with the stages it needs and applies them in a
+single float pass per chunk with NumPy, converting to int16 once at the end.
+
+Stages, in order (each disabled by its default):
+
+* leading-silence trim – drop whole 20 ms frames below ``trim_threshold_rms``
+  before the first loud one
+* DC removal – subtract the chunk mean when ``|mean| >= dc_threshold``
+* DC-block – first-order high-pass ``y[n] = x[n] - x[n-1] + r * y[n-1]`` with
+  its state carried across chunks (the old stub reset it every chunk, which
+  put a step at every chunk boundary)
+* attack envelope – linear fade-in over the first ``attack_ms`` of the stream
+  (``restart_attack()`` re-arms it at segment boundaries)
+* normalizer – scalar make-up gain toward ``target_rms``, capped at
+  ``max_gain_db``; gains within 1 % are skipped
+* soft limiter – samples above ``limiter_headroom`` of full scale are bent
+  with a tanh knee instead of clipping
+
+When no stage changes the samples the input object is returned unchanged.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Dict
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - array fallback below
+    np = None  # type: ignore[assignment]
+
+_FULL_SCALE = 32767.0
+# DC-block recursion is evaluated in closed form per block; keep r**-n finite.
+_DC_BLOCK_SPAN = 4096
+# Normalizer gains this close to unity are not worth a pass.
+_MIN_GAIN = 1.01
+
+
+class PlaybackDSPChain:
+    """Configured-once, stateful PCM16LE conditioning for one playback stream."""
+
+    def __init__(
+        self,
+        sample_rate: int = 8000,
+        *,
+        trim_threshold_rms: int = 0,
+        dc_threshold: int = 0,
+        dc_block: bool = False,
+        dc_block_r: float = 0.995,
+        attack_ms: int = 0,
+        target_rms: int = 0,
+        max_gain_db: float = 9.0,
+        limiter: bool = False,
+        limiter_headroom: float = 0.65,
+    ):
+        self.sample_rate = max(1, int(sample_rate))
+        self.trim_threshold_rms = max(0, int(trim_threshold_rms))
+        self.trim_frame_samples = max(1, self.sample_rate // 50)
+        self.dc_threshold = max(0, int(dc_threshold))
+        self.dc_block = bool(dc_block)
+        self.dc_block_r = float(dc_block_r)
+        self.attack_samples = max(0, int(self.sample_rate * max(0, int(attack_ms)) / 1000))
+        self.target_rms = max(0, int(target_rms))
+        self.max_gain = math.pow(10.0, float(max_gain_db) / 20.0)
+        self.limiter = bool(limiter)
+        self.limiter_knee = min(0.99, max(0.05, float(limiter_headroom))) * _FULL_SCALE
+        self.trimmed_samples = 0
+        self.dc_corrections = 0
+        self.last_dc = 0
+        self.last_gain = 1.0
+        self.limited_samples = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget filter history and re-arm the attack envelope."""
+        self._dc_x1 = 0.0
+        self._dc_y1 = 0.0
+        self.attack_remaining = self.attack_samples
+
+    def restart_attack(self) -> None:
+        self.attack_remaining = self.attack_samples
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self.trim_threshold_rms
+            or self.dc_threshold
+            or self.dc_block
+            or self.attack_remaining
+            or self.target_rms
+            or self.limiter
+        )
+
+    def process(self, pcm: Any) -> Any:
+        """Condition one chunk of PCM16LE; returns ``pcm`` itself when nothing changed."""
+        if not pcm or not self.enabled or len(pcm) < 2:
+            return pcm
+        if np is None:
+            return self._process_python(pcm)
+        x = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2).astype(np.float64)
+        changed = False
+
+        if self.trim_threshold_rms:
+            start = self._trim_start(x)
+            if start:
+                x = x[start:]
+                self.trimmed_samples += start
+                changed = True
+
+        if self.dc_threshold:
+            dc = math.floor(float(x.mean()))
+            if abs(dc) >= self.dc_threshold:
+                x -= dc
+                self.last_dc = dc
+                self.dc_corrections += 1
+                changed = True
+
+        if self.dc_block:
+            x = self._dc_block(x)
+            changed = True
+
+        if self.attack_remaining:
+            n = min(x.size, self.attack_remaining)
+            done = self.attack_samples - self.attack_remaining
+            x[:n] *= (np.arange(done, done + n, dtype=np.float64) / float(self.attack_samples))
+            self.attack_remaining -= n
+            changed = True
+
+        if self.target_rms:
+            rms = float(np.sqrt(np.dot(x, x) / x.size))
+            gain = min(float(self.target_rms) / max(1.0, rms), self.max_gain)
+            self.last_gain = gain
+            if gain > _MIN_GAIN:
+                x *= gain
+                changed = True
+
+        if self.limiter:
+            over = np.abs(x) > self.limiter_knee
+            if over.any():
+                knee = self.limiter_knee
+                span = _FULL_SCALE - knee
+                mag = np.abs(x[over])
+                x[over] = np.sign(x[over]) * (knee + span * np.tanh((mag - knee) / span))
+                self.limited_samples += int(over.sum())
+                changed = True
+
+        if not changed:
+            return pcm
+        np.clip(x, -32768.0, _FULL_SCALE, out=x)
+        return np.rint(x).astype("<i2").tobytes()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "trimmed_samples": self.trimmed_samples,
+            "dc_corrections": self.dc_corrections,
+            "last_dc": self.last_dc,
+            "last_gain": round(self.last_gain, 3),
+            "limited_samples": self.limited_samples,
+            "attack_remaining": self.attack_remaining,
+        }
+
+    def _trim_start(self, x: Any) -> int:
+        """Index of the first loud 20 ms frame, or 0 (no trim) if none/already loud."""
+        frame = self.trim_frame_samples
+        n_frames = x.size // frame
+        if not n_frames:
+            return 0
+        frames = x[: n_frames * frame].reshape(n_frames, frame)
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+        loud = np.flatnonzero(rms.astype(np.int64) > self.trim_threshold_rms)
+        if not loud.size:
+            return 0
+        return int(loud[0]) * frame
+
+    def _dc_block(self, x: Any) -> Any:
+        # y[n] = r**(n+1) * y[-1] + sum_k r**(n-k) * d[k], with d = diff(x) seeded by x[-1].
+        r = self.dc_block_r
+        out = np.empty_like(x)
+        x1, y1 = self._dc_x1, self._dc_y1
+        for start in range(0, x.size, _DC_BLOCK_SPAN):
+            seg = x[start:start + _DC_BLOCK_SPAN]
+            d = np.diff(seg, prepend=x1)
+            powers = np.power(r, np.arange(seg.size, dtype=np.float64))
+            y = powers * (np.cumsum(d / powers) + r * y1)
+            out[start:start + seg.size] = y
+            x1, y1 = float(seg[-1]), float(y[-1])
+        self._dc_x1, self._dc_y1 = x1, y1
+        return out
+
+    def _process_python(self, pcm: Any) -> bytes:
+        buf = array("h")
+        buf.frombytes(bytes(pcm[: len(pcm) - len(pcm) % 2]))
+        x = [float(s) for s in buf]
+        changed = False
+        if self.trim_threshold_rms:
+            frame = self.trim_frame_samples
+            for i in range(0, len(x) - frame + 1, frame):
+                acc = sum(s * s for s in x[i:i + frame])
+                if int(math.sqrt(acc / frame)) > self.trim_threshold_rms:
+                    if i:
+                        x = x[i:]
+                        self.trimmed_samples += i
+                        changed = True
+                    break
+        if self.dc_threshold and x:
+            dc = math.floor(sum(x) / len(x))
+            if abs(dc) >= self.dc_threshold:
+                x = [s - dc for s in x]
+                self.last_dc = dc
+                self.dc_corrections += 1
+                changed = True
+        if self.dc_block:
+            r, x1, y1 = self.dc_block_r, self._dc_x1, self._dc_y1
+            for i, s in enumerate(x):
+                y1 = s - x1 + r * y1
+                x1 = s
+                x[i] = y1
+            self._dc_x1, self._dc_y1 = x1, y1
+            changed = True
+        if self.attack_remaining:
+            n = min(len(x), self.attack_remaining)
+            done = self.attack_samples - self.attack_remaining
+            for i in range(n):
+                x[i] *= (done + i) / float(self.attack_samples)
+            self.attack_remaining -= n
+            changed = True
+        if self.target_rms and x:
+            rms = math.sqrt(sum(s * s for s in x) / len(x))
+            gain = min(float(self.target_rms) / max(1.0, rms), self.max_gain)
+            self.last_gain = gain
+            if gain > _MIN_GAIN:
+                x = [s * gain for s in x]
+                changed = True
+        if self.limiter:
+            knee = self.limiter_knee
+            span = _FULL_SCALE - knee
+            for i, s in enumerate(x):
+                if abs(s) > knee:
+                    x[i] = math.copysign(knee + span * math.tanh((abs(s) - knee) / span), s)
+                    self.limited_samples += 1
+                    changed = True
+        if not changed:
+            return pcm
+        return array("h", (int(round(min(_FULL_SCALE, max(-32768.0, s)))) for s in x)).tobytes()
+
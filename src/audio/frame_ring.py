@@ -0,0 +1,167 @@
+"""
+Byte ring buffer for paced streaming playback.
+
+``StreamingPlaybackManager`` used to hand provider chunks to the pacer through
+an ``asyncio.Queue`` of ``bytes`` and re-slice them into frames, allocating a
+new object at every step.  ``FrameRingBuffer`` keeps one preallocated
+``bytearray`` per stream instead: the producer copies converted (egress) audio
+in once, and the pacer reads each frame as a ``memoryview`` straight out of the
+buffer, consuming it only after the send succeeded.
+
+The fill level is tracked natively (``readable`` / ``frames()``), so warm-up
+and low-watermark decisions no longer estimate byte counts, and ``clear()``
+drops everything in O(1) for barge-in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional
+
+
+class FrameRingBuffer:
+    """Single-producer / single-consumer byte ring with memoryview frame reads."""
+
+    def __init__(self, capacity: int, frame_size: int = 160):
+        """
+        Args:
+            capacity: Bytes preallocated.  ``wait_for_space()`` holds the
+                producer until a write fits; a write that cannot fit even in
+                an empty buffer grows it rather than fail.
+            frame_size: Default read size for ``peek_frame()``/``frames()``.
+        """
+        self.capacity = max(1, int(capacity))
+        self.frame_size = max(1, int(frame_size))
+        self._buf = bytearray(self.capacity)
+        self._view = memoryview(self._buf)
+        self._scratch = bytearray(self.frame_size)
+        self._head = 0
+        self._size = 0
+        self._space = asyncio.Event()
+        self._space.set()
+        self.eos = False
+        self.bytes_written = 0
+        self.bytes_consumed = 0
+        self.bytes_cleared = 0
+        self.high_water = 0
+        self.grows = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def readable(self) -> int:
+        return self._size
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self._size
+
+    def frames(self, frame_size: Optional[int] = None) -> int:
+        """Whole frames currently buffered."""
+        return self._size // max(1, int(frame_size or self.frame_size))
+
+    def write(self, data) -> int:
+        """Copy ``data`` (any bytes-like object) in; grows the buffer if it does not fit."""
+        src = memoryview(data).cast("B")
+        n = src.nbytes
+        if not n:
+            return 0
+        if n > self.free:
+            self._grow(self._size + n)
+        cap = self.capacity
+        tail = (self._head + self._size) % cap
+        first = min(n, cap - tail)
+        self._view[tail:tail + first] = src[:first]
+        if first < n:
+            self._view[: n - first] = src[first:]
+        self._size += n
+        self.bytes_written += n
+        if self._size > self.high_water:
+            self.high_water = self._size
+        return n
+
+    async def wait_for_space(self, n: int = 1) -> None:
+        """Block the producer until ``n`` bytes fit (or the buffer has drained)."""
+        while self._size and self.free < n:
+            self._space.clear()
+            await self._space.wait()
+
+    def peek_frame(self, size: Optional[int] = None) -> memoryview:
+        """Return the next ``size`` bytes (default ``frame_size``) without consuming them.
+
+        The view aliases the ring (or a scratch buffer when the frame wraps), so
+        it is only valid until the next ``write``/``peek_frame``/``consume``.
+        Returns fewer bytes when less is buffered.
+        """
+        n = min(self._size, int(size or self.frame_size))
+        start = self._head
+        end = start + n
+        if end <= self.capacity:
+            return self._view[start:end]
+        if len(self._scratch) < n:
+            self._scratch = bytearray(n)
+        first = self.capacity - start
+        scratch = memoryview(self._scratch)
+        scratch[:first] = self._view[start:]
+        scratch[first:n] = self._view[: n - first]
+        return scratch[:n]
+
+    def consume(self, n: int) -> int:
+        """Drop ``n`` bytes from the read side (after a successful send)."""
+        n = max(0, min(int(n), self._size))
+        if not n:
+            return 0
+        self._size -= n
+        self._head = (self._head + n) % self.capacity if self._size else 0
+        self.bytes_consumed += n
+        self._space.set()
+        return n
+
+    def read_all(self) -> bytes:
+        """Copy out and consume everything buffered (end-of-stream flush / fallback)."""
+        data = bytes(self.peek_frame(self._size)) if self._size else b""
+        self.consume(len(data))
+        return data
+
+    def clear(self) -> int:
+        """Discard everything buffered in O(1); returns the bytes dropped."""
+        dropped = self._size
+        self._head = 0
+        self._size = 0
+        self.bytes_cleared += dropped
+        self._space.set()
+        return dropped
+
+    def mark_eos(self) -> None:
+        """Producer is done; whatever is buffered is the tail of the stream."""
+        self.eos = True
+        self._space.set()
+
+    def _grow(self, needed: int) -> None:
+        cap = self.capacity
+        while cap < needed:
+            cap *= 2
+        buf = bytearray(cap)
+        size = self._size
+        if size:
+            first = min(size, self.capacity - self._head)
+            buf[:first] = self._view[self._head:self._head + first]
+            buf[first:size] = self._view[: size - first]
+        self._buf = buf
+        self._view = memoryview(buf)
+        self.capacity = cap
+        self._head = 0
+        self.grows += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "readable": self._size,
+            "high_water": self.high_water,
+            "bytes_written": self.bytes_written,
+            "bytes_consumed": self.bytes_consumed,
+            "bytes_cleared": self.bytes_cleared,
+            "grows": self.grows,
+            "eos": self.eos,
+        }
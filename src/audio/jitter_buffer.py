@@ -0,0 +1,271 @@
+"""
+Adaptive RTP jitter buffer with packet-loss concealment.
+
+Inbound RTP from WAN SIP trunks arrives reordered, duplicated and with gaps.
+``RTPJitterBuffer`` keys packets by extended sequence number and releases
+them strictly in order.  In-order packets pass straight through (STT and VAD
+consume frames as fast as they come, so there is no playout clock to smooth
+for); when a sequence gap opens, later packets are held for up to the target
+depth waiting for the missing one.  If it never shows up its slot is released
+as ``None`` so the caller can run concealment (see ``conceal_pcm16``), and if
+it shows up after that it is dropped and counted as late.
+
+Interarrival jitter is estimated per RFC 3550 §6.4.1.  With ``adaptive``
+enabled the target depth follows the estimate (and grows after late drops),
+bounded by ``target_ms`` below and ``max_ms`` above.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - array fallback below
+    np = None  # type: ignore[assignment]
+
+_SEQ_MOD = 1 << 16
+_TS_MOD = 1 << 32
+
+# Lost frames in a row that are bridged by fading the last good frame before
+# switching to silence (5 x 20 ms = 100 ms).
+PLC_MAX_REPEAT = 5
+PLC_MODES = ("repeat", "zero")
+
+# A sequence jump larger than this (in packets) is treated as a new stream
+# (e.g. a re-INVITE or media restart) rather than as loss to conceal.
+_RESYNC_GAP_PACKETS = 100
+# Played packets without a late drop before a late-drop depth bump decays.
+_LATE_BOOST_DECAY_PACKETS = 500
+
+
+class RTPJitterBuffer:
+    """Per-call reordering buffer keyed by RTP sequence number."""
+
+    def __init__(
+        self,
+        *,
+        clock_rate: int = 8000,
+        frame_ms: int = 20,
+        target_ms: int = 60,
+        max_ms: int = 200,
+        adaptive: bool = True,
+    ):
+        """
+        Args:
+            clock_rate: RTP timestamp clock rate (Hz) used for jitter estimates.
+            frame_ms: Packetisation interval.
+            target_ms: How long to wait for a missing packet before concealing it.
+            max_ms: Upper bound for the adaptive depth.
+            adaptive: Grow the depth with the measured jitter and after late drops.
+        """
+        self.clock_rate = max(1, int(clock_rate))
+        self.frame_ms = max(1, int(frame_ms))
+        self.min_depth = max(1, math.ceil(int(target_ms) / self.frame_ms))
+        self.max_depth = max(self.min_depth, math.ceil(int(max_ms) / self.frame_ms))
+        self.adaptive = bool(adaptive)
+        self.received = 0
+        self.played = 0
+        self.concealed = 0
+        self.late_dropped = 0
+        self.duplicates = 0
+        self.resyncs = 0
+        self.max_depth_seen = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream position (counters are kept)."""
+        self._packets: Dict[int, bytes] = {}
+        self._next: Optional[int] = None
+        self._highest: Optional[int] = None
+        self._ssrc: Optional[int] = None
+        self._last_arrival: Optional[float] = None
+        self._last_timestamp: Optional[int] = None
+        self.jitter = 0.0  # RFC 3550 J, in timestamp units
+        self.target_depth = self.min_depth
+        self._late_boost = 0
+        self._since_late = 0
+
+    @property
+    def jitter_ms(self) -> float:
+        return self.jitter * 1000.0 / self.clock_rate
+
+    @property
+    def depth(self) -> int:
+        """Packets currently held (waiting behind a gap)."""
+        return len(self._packets)
+
+    @property
+    def expected_sequence(self) -> Optional[int]:
+        return None if self._next is None else self._next % _SEQ_MOD
+
+    def push(
+        self,
+        sequence: int,
+        timestamp: int,
+        payload: bytes,
+        *,
+        ssrc: Optional[int] = None,
+        arrival: Optional[float] = None,
+    ) -> List[Optional[bytes]]:
+        """Add one packet; return the payloads now ready, in order.
+
+        ``None`` entries mark lost packets the caller should conceal.
+        """
+        self.received += 1
+        released: List[Optional[bytes]] = []
+        if ssrc is not None and self._ssrc is not None and ssrc != self._ssrc:
+            released.extend(self._resync())
+        if ssrc is not None:
+            self._ssrc = ssrc
+
+        self._update_jitter(timestamp, time.monotonic() if arrival is None else arrival)
+
+        ext = self._extend(sequence)
+        if self._next is None:
+            self._next = ext
+            self._highest = ext
+        elif abs(ext - self._highest) > _RESYNC_GAP_PACKETS:
+            released.extend(self._resync())
+            self._next = ext
+            self._highest = ext
+        elif ext < self._next:
+            self.late_dropped += 1
+            self._on_late()
+            return released
+        elif ext in self._packets:
+            self.duplicates += 1
+            return released
+
+        self._packets[ext] = payload
+        if ext > self._highest:
+            self._highest = ext
+        self.max_depth_seen = max(self.max_depth_seen, len(self._packets))
+        released.extend(self._release())
+        return released
+
+    def drain(self) -> List[bytes]:
+        """Release every held packet in order, skipping gaps (end of stream)."""
+        out = [self._packets[k] for k in sorted(self._packets)]
+        self.played += len(out)
+        self._packets.clear()
+        if self._highest is not None:
+            self._next = self._highest + 1
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "jitter_ms": round(self.jitter_ms, 2),
+            "target_depth": self.target_depth,
+            "target_ms": self.target_depth * self.frame_ms,
+            "depth": self.depth,
+            "max_depth_seen": self.max_depth_seen,
+            "received": self.received,
+            "played": self.played,
+            "concealed": self.concealed,
+            "late_dropped": self.late_dropped,
+            "duplicates": self.duplicates,
+            "resyncs": self.resyncs,
+        }
+
+    def _extend(self, sequence: int) -> int:
+        """Map a 16-bit sequence number onto the unbounded extended space."""
+        sequence &= 0xFFFF
+        if self._highest is None:
+            return sequence
+        candidate = (self._highest & ~0xFFFF) | sequence
+        delta = candidate - self._highest
+        if delta > _SEQ_MOD // 2:
+            candidate -= _SEQ_MOD
+        elif delta < -(_SEQ_MOD // 2):
+            candidate += _SEQ_MOD
+        return candidate
+
+    def _update_jitter(self, timestamp: int, arrival: float) -> None:
+        if self._last_arrival is not None and self._last_timestamp is not None:
+            ts_delta = (timestamp - self._last_timestamp) % _TS_MOD
+            if ts_delta >= _TS_MOD // 2:
+                ts_delta -= _TS_MOD
+            d = (arrival - self._last_arrival) * self.clock_rate - ts_delta
+            self.jitter += (abs(d) - self.jitter) / 16.0
+        self._last_arrival = arrival
+        self._last_timestamp = timestamp & 0xFFFFFFFF
+        if self.adaptive:
+            self._retarget()
+
+    def _retarget(self) -> None:
+        wanted = math.ceil(4.0 * self.jitter_ms / self.frame_ms) + self._late_boost
+        self.target_depth = min(self.max_depth, max(self.min_depth, wanted))
+
+    def _on_late(self) -> None:
+        if not self.adaptive:
+            return
+        self._since_late = 0
+        if self.target_depth < self.max_depth:
+            self._late_boost += 1
+            self._retarget()
+
+    def _release(self) -> List[Optional[bytes]]:
+        out: List[Optional[bytes]] = []
+        packets = self._packets
+        while packets:
+            payload = packets.pop(self._next, None)
+            if payload is None:
+                # Gap at the head: wait until enough later packets have arrived.
+                if self._highest - self._next + 1 <= self.target_depth:
+                    break
+                self.concealed += 1
+            else:
+                self.played += 1
+                if self._late_boost:
+                    self._since_late += 1
+                    if self._since_late >= _LATE_BOOST_DECAY_PACKETS:
+                        self._late_boost -= 1
+                        self._since_late = 0
+                        self._retarget()
+            out.append(payload)
+            self._next += 1
+        return out
+
+    def _resync(self) -> List[bytes]:
+        self.resyncs += 1
+        out = self.drain()
+        self._next = None
+        self._highest = None
+        self._last_arrival = None
+        self._last_timestamp = None
+        return out
+
+
+def conceal_pcm16(
+    last_frame: Optional[bytes],
+    consecutive: int,
+    frame_bytes: int,
+    mode: str = "repeat",
+) -> bytes:
+    """Return a PCM16LE frame standing in for the ``consecutive``-th lost packet in a row.
+
+    ``repeat`` replays the last good frame with a linear fade that reaches
+    silence after ``PLC_MAX_REPEAT`` frames; ``zero`` always returns silence.
+    """
+    silence = b"\x00" * frame_bytes
+    if mode != "repeat" or not last_frame or consecutive > PLC_MAX_REPEAT:
+        return silence
+    frame = bytes(last_frame[:frame_bytes])
+    if len(frame) < frame_bytes:
+        frame = frame + silence[len(frame):]
+    n = frame_bytes // 2
+    start = 1.0 - (consecutive - 1) / PLC_MAX_REPEAT
+    end = 1.0 - consecutive / PLC_MAX_REPEAT
+    if np is not None:
+        samples = np.frombuffer(frame, dtype="<i2", count=n).astype(np.float32)
+        gains = np.linspace(start, end, n, endpoint=False, dtype=np.float32)
+        return np.rint(samples * gains).astype("<i2").tobytes()
+    samples = array("h", frame[: n * 2])
+    step = (end - start) / n if n else 0.0
+    for i in range(n):
+        samples[i] = int(round(samples[i] * (start + step * i)))
+    return samples.tobytes()
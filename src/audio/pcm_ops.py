@@ -0,0 +1,99 @@
+"""
+Mono PCM16LE sample helpers (level, DC, gain, byte order).
+
+These are the ``audioop`` analysis and gain functions the engine, providers
+and playback manager use on every frame, for 16-bit samples only.  They call
+``audioop`` where it exists and use NumPy on Python 3.13+ (where ``audioop``
+was removed); both give the same results, so callers never need to import
+``audioop`` themselves.  G.711 and resampling live in ``codec_engine.py``.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - audioop path below
+    np = None  # type: ignore[assignment]
+
+try:
+    import audioop  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - Python 3.13+
+    audioop = None  # type: ignore[assignment]
+
+_WIDTH = 2
+_MIN = -32768
+_MAX = 32767
+
+
+def _samples(data: bytes):
+    if np is None:
+        raise RuntimeError("PCM16 helpers need audioop or numpy")
+    return np.frombuffer(data, dtype="<i2", count=len(data) // _WIDTH)
+
+
+def _clip_floor(values) -> bytes:
+    # Same rounding as audioop's fbound(): clamp, then floor.
+    return np.floor(np.clip(values, _MIN, _MAX)).astype("<i2").tobytes()
+
+
+def rms(data: bytes) -> int:
+    """Root-mean-square level (``audioop.rms(data, 2)``)."""
+    if audioop is not None:
+        return audioop.rms(data, _WIDTH)
+    x = _samples(data)
+    if not x.size:
+        return 0
+    return int(math.sqrt(float(np.dot(x.astype(np.float64), x.astype(np.float64))) / x.size))
+
+
+def avg(data: bytes) -> int:
+    """Mean sample value, i.e. signed DC offset (``audioop.avg(data, 2)``)."""
+    if audioop is not None:
+        return audioop.avg(data, _WIDTH)
+    x = _samples(data)
+    if not x.size:
+        return 0
+    return int(math.floor(float(x.sum(dtype=np.int64)) / x.size))
+
+
+def peak(data: bytes) -> int:
+    """Largest absolute sample value (``audioop.max(data, 2)``)."""
+    if audioop is not None:
+        return audioop.max(data, _WIDTH)
+    x = _samples(data)
+    if not x.size:
+        return 0
+    return int(np.abs(x.astype(np.int32)).max())
+
+
+def bias(data: bytes, offset: int) -> bytes:
+    """Add ``offset`` to every sample, wrapping like ``audioop.bias(data, 2, offset)``."""
+    if audioop is not None:
+        return audioop.bias(data, _WIDTH, offset)
+    x = _samples(data)
+    return ((x.astype(np.int64) + int(offset)) & 0xFFFF).astype("<u2").view("<i2").tobytes()
+
+
+def mul(data: bytes, factor: float) -> bytes:
+    """Scale samples by ``factor`` with clipping (``audioop.mul(data, 2, factor)``)."""
+    if audioop is not None:
+        return audioop.mul(data, _WIDTH, factor)
+    return _clip_floor(_samples(data).astype(np.float64) * float(factor))
+
+
+def byteswap(data: bytes) -> bytes:
+    """Swap the byte order of every sample (``audioop.byteswap(data, 2)``)."""
+    if audioop is not None:
+        return audioop.byteswap(data, _WIDTH)
+    return _samples(data).byteswap().tobytes()
+
+
+def tomono(data: bytes, left: float = 1.0, right: float = 0.0) -> bytes:
+    """Mix interleaved stereo to mono (``audioop.tomono(data, 2, left, right)``)."""
+    if audioop is not None:
+        return audioop.tomono(data, _WIDTH, left, right)
+    x = _samples(data)
+    frames = x[: x.size - (x.size % 2)].reshape(-1, 2).astype(np.float64)
+    return _clip_floor(frames[:, 0] * float(left) + frames[:, 1] * float(right))
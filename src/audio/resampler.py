@@ -4,12 +4,16 @@ Audio resampling and format conversion helpers.
 These utilities provide common conversions required when bridging between
 provider audio formats (OpenAI Realtime PCM16 @ 24 kHz, etc.) and the
 AudioSocket expectations (typically μ-law or PCM16 at 8 kHz).
+
+All conversions are delegated to the process-wide ``AudioCodecEngine`` (see
+``codec_engine.py``), so the NumPy and audioop backends are interchangeable.
 """
 
 from __future__ import annotations
 
-import audioop
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
+
+from .codec_engine import Resampler, get_codec_engine
 
 # Default sample width for PCM16 little-endian audio
 _PCM_SAMPLE_WIDTH = 2
@@ -21,7 +25,7 @@ def mulaw_to_pcm16le(data: bytes) -> bytes:
     """
     if not data:
         return b""
-    return audioop.ulaw2lin(data, _PCM_SAMPLE_WIDTH)
+    return get_codec_engine().ulaw_decode(data)
 
 
 def pcm16le_to_mulaw(data: bytes) -> bytes:
@@ -30,7 +34,7 @@ def pcm16le_to_mulaw(data: bytes) -> bytes:
     """
     if not data:
         return b""
-    return audioop.lin2ulaw(data, _PCM_SAMPLE_WIDTH)
+    return get_codec_engine().ulaw_encode(data)
 
 
 def resample_audio(
@@ -40,28 +44,37 @@ def resample_audio(
     *,
     sample_width: int = _PCM_SAMPLE_WIDTH,
     channels: int = 1,
-    state: Optional[tuple] = None,
-) -> Tuple[bytes, Optional[tuple]]:
+    state: Optional[Any] = None,
+) -> Tuple[bytes, Optional[Any]]:
     """
-    Resample PCM audio between sample rates using audioop.ratecv.
+    Resample PCM audio between sample rates using the active codec engine.
 
     Returns a tuple of (converted_bytes, new_state) so callers can maintain
-    continuity between sequential calls.
+    continuity between sequential calls.  The state is an opaque
+    ``Resampler``; a state created for different rates (or by another
+    engine) is discarded and a fresh resampler is started.
     """
     if not pcm_bytes or source_rate == target_rate:
         return pcm_bytes, state
+    if sample_width != _PCM_SAMPLE_WIDTH or channels != 1:
+        # Engines only handle mono PCM16; keep the legacy path for anything else.
+        try:
+            import audioop
+        except ImportError:  # pragma: no cover - Python 3.13+
+            raise ValueError("Only mono PCM16 can be resampled without audioop") from None
+
+        return audioop.ratecv(pcm_bytes, sample_width, channels, source_rate, target_rate, state)
 
-    converted, new_state = audioop.ratecv(
-        pcm_bytes, sample_width, channels, source_rate, target_rate, state
-    )
-    return converted, new_state
+    if not isinstance(state, Resampler) or not state.matches(source_rate, target_rate):
+        state = get_codec_engine().create_resampler(source_rate, target_rate)
+    return state.process(pcm_bytes), state
 
 
 def convert_pcm16le_to_target_format(pcm_bytes: bytes, target_format: str) -> bytes:
     """
     Convert PCM16 little-endian audio into the target encoding.
 
-    Currently supports μ-law and PCM16 (no-op for PCM targets).
+    Currently supports μ-law, A-law and PCM16 (no-op for PCM targets).
     """
     if not pcm_bytes:
         return b""
@@ -69,5 +82,7 @@ def convert_pcm16le_to_target_format(pcm_bytes: bytes, target_format: str) -> by
     fmt = (target_format or "").lower()
     if fmt in ("ulaw", "mulaw", "mu-law"):
         return pcm16le_to_mulaw(pcm_bytes)
+    if fmt in ("alaw", "a-law"):
+        return get_codec_engine().alaw_encode(pcm_bytes)
     # Default: assume PCM target
     return pcm_bytes
\ No newline at end of file
@@ -42,6 +42,10 @@ class AsteriskConfig(BaseModel):
     username: str
     password: str
     app_name: str = Field(default="ai-voice-agent")
+    # ARI event dispatch: ordered per channel/bridge, bounded worker pool and queue
+    event_workers: int = Field(default=64)
+    event_queue_max: int = Field(default=5000)
+    event_hold_timeout_sec: float = Field(default=5.0)
 
 class ExternalMediaConfig(BaseModel):
     # Network configuration
@@ -59,8 +63,24 @@ class ExternalMediaConfig(BaseModel):
     format: str = Field(default="slin16")  # Engine internal format: slin (8kHz), slin16 (16kHz), ulaw (8kHz)
     sample_rate: Optional[int] = Field(default=None)  # Optional: inferred from format if not set (8000 or 16000)
     
-    # Note: jitter_buffer_ms removed - RTP has built-in buffering, not configurable
-    # streaming.jitter_buffer_ms controls StreamingPlaybackManager buffering instead
+    # Inbound RTP jitter buffer (reordering + packet-loss concealment before STT/VAD).
+    # jitter_target_ms is how long to wait for a missing packet before concealing it;
+    # 0 disables the buffer. With jitter_adaptive the wait follows the measured
+    # RFC 3550 jitter up to jitter_max_ms. plc_mode: repeat (fade last frame) or zero.
+    # (streaming.jitter_buffer_ms controls StreamingPlaybackManager buffering instead.)
+    jitter_target_ms: int = Field(default=60)
+    jitter_max_ms: int = Field(default=200)
+    jitter_adaptive: bool = Field(default=True)
+    plc_mode: str = Field(default="repeat")
+    # Ingress socket layout. per_call: one UDP socket + receiver task per call.
+    # shared: a pool of shared_sockets UDP sockets demultiplexed by remote address /
+    # SSRC; fewer tasks and wakeups at high call counts. Calls whose RTP source Asterisk
+    # did not report yet need a socket of their own until their first packet, so the
+    # pool grows during setup bursts up to shared_sockets_max, then such calls get a
+    # per-call socket.
+    socket_mode: str = Field(default="per_call")
+    shared_sockets: int = Field(default=2)
+    shared_sockets_max: int = Field(default=16)
 
     # Security / deployment hardening:
     # - If set, only accept inbound RTP packets from these source IPs/hosts.
@@ -107,6 +127,10 @@ class LocalProviderConfig(BaseModel):
     instructions: Optional[str] = None
     # Mode for local_ai_server: "full" (STT+LLM+TTS), "stt" (STT only for hybrid pipelines)
     mode: str = Field(default="full")
+    # Audio transport: "json" (base64 audio, one websocket per call) or "binary"
+    # (framed PCM, calls multiplexed over transport_connections shared websockets).
+    transport: str = Field(default="json")
+    transport_connections: int = Field(default=2)
     
     # STT Backend selection: vosk | kroko | sherpa
     stt_backend: str = Field(default="vosk")
@@ -499,6 +523,57 @@ class LoggingConfig(BaseModel):
     level: str = Field(default="info")  # debug|info|warning|error|critical
 
 
+class AudioHealthConfig(BaseModel):
+    """Per-call audio health sampling (RMS/DC/clipping/silence windows)."""
+    # Measure one frame in N per call and stage (1 = every frame)
+    sample_every: int = Field(default=5, ge=1)
+    # Sampled frames kept per call and stage for percentiles
+    window: int = Field(default=300, ge=1)
+    # Frames below this RMS (PCM16) count as silent
+    silence_rms: int = Field(default=200, ge=0)
+    # Absolute PCM16 sample value counted as clipped
+    clip_level: int = Field(default=32000, ge=1, le=32767)
+
+
+class TTSCacheConfig(BaseModel):
+    """Content-addressed cache of synthesized greetings/farewells/slow-tool messages."""
+    enabled: bool = Field(default=True)
+    # Disk tier directory; empty keeps the cache in memory only
+    cache_dir: str = Field(default="/app/data/tts_cache")
+    memory_max_mb: float = Field(default=32.0, ge=0)
+    disk_max_mb: float = Field(default=256.0, ge=0)
+    # Disk entries older than this are synthesized again (0 = keep until evicted)
+    disk_ttl_hours: float = Field(default=168.0, ge=0)
+    # Synthesize every context greeting at startup and on /reload
+    prewarm: bool = Field(default=False)
+
+
+class HTTPClientConfig(BaseModel):
+    """Shared HTTP client for generic_http_lookup, in_call_http_lookup and generic_webhook tools."""
+    max_connections: int = Field(default=100, ge=0)
+    max_connections_per_host: int = Field(default=16, ge=0)
+    keepalive_timeout_sec: float = Field(default=30.0, ge=0)
+    # Reuse resolved addresses for this long; 0 resolves on every new connection
+    dns_cache_ttl_sec: int = Field(default=300, ge=0)
+    # In-flight requests per tool when the tool sets no max_concurrency (0 = unlimited)
+    default_max_concurrency: int = Field(default=0, ge=0)
+    # HTTP/2 requires httpx[http2]; falls back to HTTP/1.1 keep-alive when missing
+    http2: bool = Field(default=False)
+    # Upper bound on GET responses kept for tools with cache_ttl_seconds > 0
+    response_cache_max_entries: int = Field(default=512, ge=0)
+
+
+class WarmPoolConfig(BaseModel):
+    """Pre-connected full-agent provider sockets leased at call start."""
+    enabled: bool = Field(default=False)
+    # Warm connections kept per provider name, e.g. {"openai_realtime": 2}
+    providers: Dict[str, int] = Field(default_factory=dict)
+    # Close unleased connections after this long (providers may drop idle sessions)
+    max_age_sec: float = Field(default=240.0, ge=0)
+    # Wait before retrying after a failed connect
+    refill_backoff_sec: float = Field(default=5.0, ge=0)
+
+
 class HealthConfig(BaseModel):
     """Health/metrics HTTP endpoint configuration."""
     host: str = Field(default="127.0.0.1")
@@ -588,6 +663,10 @@ class AppConfig(BaseModel):
     barge_in: Optional[BargeInConfig] = Field(default_factory=BargeInConfig)
     logging: Optional[LoggingConfig] = Field(default_factory=LoggingConfig)
     health: Optional[HealthConfig] = Field(default_factory=HealthConfig)
+    audio_health: Optional[AudioHealthConfig] = Field(default_factory=AudioHealthConfig)
+    tts_cache: Optional[TTSCacheConfig] = Field(default_factory=TTSCacheConfig)
+    http_client: Optional[HTTPClientConfig] = Field(default_factory=HTTPClientConfig)
+    warm_pool: Optional[WarmPoolConfig] = Field(default_factory=WarmPoolConfig)
     pipelines: Dict[str, PipelineEntry] = Field(default_factory=dict)
     active_pipeline: Optional[str] = None
     # P1: profiles/contexts for transport orchestration
@@ -48,6 +48,10 @@ LLMConfig = _parent_config.LLMConfig
 VADConfig = _parent_config.VADConfig
 StreamingConfig = _parent_config.StreamingConfig
 LoggingConfig = _parent_config.LoggingConfig
+AudioHealthConfig = _parent_config.AudioHealthConfig
+TTSCacheConfig = _parent_config.TTSCacheConfig
+HTTPClientConfig = _parent_config.HTTPClientConfig
+WarmPoolConfig = _parent_config.WarmPoolConfig
 PipelineEntry = _parent_config.PipelineEntry
 AppConfig = _parent_config.AppConfig
 load_config = _parent_config.load_config
@@ -75,6 +79,10 @@ __all__ = [
     'VADConfig',
     'StreamingConfig',
     'LoggingConfig',
+    'AudioHealthConfig',
+    'TTSCacheConfig',
+    'HTTPClientConfig',
+    'WarmPoolConfig',
     'PipelineEntry',
     'AppConfig',
     'load_config',
@@ -6,7 +6,7 @@ management components that replace the dict soup in the original engine.
 """
 
 from .models import CallSession, PlaybackRef, ProviderSession, TransportConfig
-from .session_store import SessionStore
+from .session_store import SessionHandle, SessionStore
 from .playback_manager import PlaybackManager
 from .conversation_coordinator import ConversationCoordinator
 
@@ -16,6 +16,7 @@ __all__ = [
     'ProviderSession',
     'TransportConfig',
     'SessionStore',
+    'SessionHandle',
     'PlaybackManager',
     'ConversationCoordinator'
 ]
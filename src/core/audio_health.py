@@ -0,0 +1,263 @@
+"""
+Per-call audio health aggregation.
+
+``Engine._update_audio_diagnostics`` used to decode and measure every frame it
+was handed and write the result into process-wide gauges labelled only by
+stage, so with concurrent calls the gauges showed whichever call wrote last.
+
+``AudioHealthMonitor`` samples one frame in ``sample_every`` per call and
+stage and records its RMS, DC offset, clipped-sample ratio and a silence flag
+into a ``StageWindow``: fixed-size ``array`` rings holding the most recent
+``window`` samples.  Unsampled frames cost a counter increment.
+
+The windows live on the ``CallSession`` (``session.audio_health``) so they go
+away with the call.  Consumers read them two ways:
+
+* ``CallAudioHealth.summary()`` - per-stage percentiles for ``/sessions/stats``
+  and the ``CallRecord`` written at hangup.
+* ``AudioHealthMonitor.export()`` - distribution across live calls of each
+  call's window median, published as ``ai_agent_audio_health_*{stage,quantile}``
+  gauges just before ``/metrics`` is rendered.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from prometheus_client import Gauge
+
+from ..audio import pcm_ops
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+_AUDIO_HEALTH_RMS = Gauge(
+    "ai_agent_audio_health_rms",
+    "Quantiles across active calls of each call's windowed median RMS",
+    labelnames=("stage", "quantile"),
+)
+_AUDIO_HEALTH_DC_OFFSET = Gauge(
+    "ai_agent_audio_health_dc_offset_abs",
+    "Quantiles across active calls of each call's windowed median |DC offset|",
+    labelnames=("stage", "quantile"),
+)
+_AUDIO_HEALTH_CLIP_RATIO = Gauge(
+    "ai_agent_audio_health_clip_ratio",
+    "Quantiles across active calls of the windowed fraction of clipped samples",
+    labelnames=("stage", "quantile"),
+)
+_AUDIO_HEALTH_SILENCE_RATIO = Gauge(
+    "ai_agent_audio_health_silence_ratio",
+    "Quantiles across active calls of the windowed fraction of silent frames",
+    labelnames=("stage", "quantile"),
+)
+_AUDIO_HEALTH_CALLS = Gauge(
+    "ai_agent_audio_health_calls",
+    "Active calls with audio health samples for a stage",
+    labelnames=("stage",),
+)
+
+EXPORT_QUANTILES: Tuple[float, ...] = (0.05, 0.5, 0.95)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence (0.0 when empty)."""
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    idx = int(round(q * (n - 1)))
+    return float(sorted_values[min(n - 1, max(0, idx))])
+
+
+def measure_pcm16(pcm: bytes, clip_level: int) -> Tuple[int, int, int]:
+    """Return ``(rms, dc_offset, clipped_samples)`` for little-endian PCM16."""
+    if len(pcm) < 2:
+        return 0, 0, 0
+    if len(pcm) & 1:
+        pcm = pcm[:-1]
+    rms = pcm_ops.rms(pcm)
+    dc = pcm_ops.avg(pcm)
+    # Most frames never get near full scale; only count when the peak says so.
+    if pcm_ops.peak(pcm) < clip_level:
+        return rms, dc, 0
+    if np is not None:
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.int32)
+        clipped = int(np.count_nonzero(np.abs(samples) >= clip_level))
+    else:
+        clipped = sum(1 for s in array("h", pcm) if s >= clip_level or s <= -clip_level)
+    return rms, dc, clipped
+
+
+class StageWindow:
+    """Ring of the most recent sampled frames for one call and stage."""
+
+    __slots__ = (
+        "size", "rms", "dc", "clip", "silent", "count", "head",
+        "frames_seen", "frames_sampled", "silent_frames", "clipped_frames", "clipped_samples",
+    )
+
+    def __init__(self, size: int):
+        self.size = max(1, int(size))
+        self.rms = array("f", bytes(4 * self.size))
+        self.dc = array("f", bytes(4 * self.size))
+        self.clip = array("f", bytes(4 * self.size))
+        self.silent = array("B", bytes(self.size))
+        self.count = 0
+        self.head = 0
+        # Lifetime counters (not windowed)
+        self.frames_seen = 0
+        self.frames_sampled = 0
+        self.silent_frames = 0
+        self.clipped_frames = 0
+        self.clipped_samples = 0
+
+    def tick(self, sample_every: int) -> bool:
+        """Count a frame; True when it should be measured."""
+        seen = self.frames_seen
+        self.frames_seen = seen + 1
+        return seen % sample_every == 0
+
+    def add(self, rms: float, dc: float, clipped: int, samples: int, silent: bool) -> None:
+        i = self.head
+        self.rms[i] = rms
+        self.dc[i] = dc
+        self.clip[i] = (clipped / samples) if samples else 0.0
+        self.silent[i] = 1 if silent else 0
+        self.head = (i + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        self.frames_sampled += 1
+        if silent:
+            self.silent_frames += 1
+        if clipped:
+            self.clipped_frames += 1
+            self.clipped_samples += clipped
+
+    def _values(self, ring: array) -> List[float]:
+        return sorted(ring[: self.count]) if self.count < self.size else sorted(ring)
+
+    def silence_ratio(self) -> float:
+        if not self.count:
+            return 0.0
+        return sum(self.silent[: self.count]) / self.count
+
+    def clip_ratio(self) -> float:
+        if not self.count:
+            return 0.0
+        return sum(self.clip[: self.count]) / self.count
+
+    def rms_median(self) -> float:
+        return percentile(self._values(self.rms), 0.5)
+
+    def dc_median(self) -> float:
+        """Signed median DC offset (the sign tells a positive from a negative bias)."""
+        return percentile(self._values(self.dc), 0.5)
+
+    def dc_abs_median(self) -> float:
+        return percentile(sorted(abs(v) for v in self.dc[: self.count]), 0.5)
+
+    def summary(self) -> Dict[str, Any]:
+        rms = self._values(self.rms)
+        dc = sorted(abs(v) for v in self.dc[: self.count])
+        clip = self._values(self.clip)
+        return {
+            "frames": self.frames_seen,
+            "sampled": self.frames_sampled,
+            "window": self.count,
+            "rms_p05": round(percentile(rms, 0.05), 1),
+            "rms_p50": round(percentile(rms, 0.5), 1),
+            "rms_p95": round(percentile(rms, 0.95), 1),
+            "dc_p50": round(self.dc_median(), 1),
+            "dc_abs_p50": round(percentile(dc, 0.5), 1),
+            "dc_abs_p95": round(percentile(dc, 0.95), 1),
+            "clip_ratio": round(self.clip_ratio(), 5),
+            "clip_ratio_p95": round(percentile(clip, 0.95), 5),
+            "silence_ratio": round(self.silence_ratio(), 4),
+            "silent_frames": self.silent_frames,
+            "clipped_frames": self.clipped_frames,
+            "clipped_samples": self.clipped_samples,
+        }
+
+
+class CallAudioHealth:
+    """Per-call set of stage windows (stored on ``CallSession.audio_health``)."""
+
+    __slots__ = ("window", "stages")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.stages: Dict[str, StageWindow] = {}
+
+    def stage(self, stage: str) -> StageWindow:
+        win = self.stages.get(stage)
+        if win is None:
+            win = self.stages[stage] = StageWindow(self.window)
+        return win
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {name: win.summary() for name, win in self.stages.items() if win.count}
+
+
+class AudioHealthMonitor:
+    """Samples frames into per-call windows and exports cross-call quantiles."""
+
+    def __init__(self, sample_every: int = 5, window: int = 300, silence_rms: int = 200, clip_level: int = 32000):
+        """
+        Args:
+            sample_every: Measure one frame in this many per call and stage (1 = every frame).
+            window: Sampled frames kept per call and stage.
+            silence_rms: Frames with RMS below this count as silent.
+            clip_level: Absolute PCM16 sample value treated as clipped.
+        """
+        self.sample_every = max(1, int(sample_every))
+        self.window = max(1, int(window))
+        self.silence_rms = int(silence_rms)
+        self.clip_level = max(1, min(32767, int(clip_level)))
+
+    def sample(self, session: Any, stage: str) -> Optional[StageWindow]:
+        """Count a frame for ``session``/``stage``; return its window when the frame should be measured."""
+        health = session.audio_health
+        if health is None:
+            health = session.audio_health = CallAudioHealth(self.window)
+        win = health.stage(stage)
+        return win if win.tick(self.sample_every) else None
+
+    def record(self, win: StageWindow, pcm: bytes) -> Tuple[int, int]:
+        """Measure PCM16 ``pcm`` into ``win``; returns ``(rms, dc_offset)``."""
+        rms, dc, clipped = measure_pcm16(pcm, self.clip_level)
+        win.add(rms, dc, clipped, len(pcm) // 2, rms < self.silence_rms)
+        return rms, dc
+
+    def export(self, sessions: Iterable[Any]) -> Dict[str, Dict[str, float]]:
+        """Publish cross-call quantiles for live ``sessions``; returns the cross-call medians per stage."""
+        per_stage: Dict[str, List[StageWindow]] = {}
+        for session in sessions:
+            health = getattr(session, "audio_health", None)
+            if health is None:
+                continue
+            for name, win in health.stages.items():
+                if win.count:
+                    per_stage.setdefault(name, []).append(win)
+
+        for gauge in (_AUDIO_HEALTH_RMS, _AUDIO_HEALTH_DC_OFFSET, _AUDIO_HEALTH_CLIP_RATIO, _AUDIO_HEALTH_SILENCE_RATIO, _AUDIO_HEALTH_CALLS):
+            gauge.clear()
+
+        medians: Dict[str, Dict[str, float]] = {}
+        for name, wins in per_stage.items():
+            rms = sorted(w.rms_median() for w in wins)
+            dc = sorted(w.dc_median() for w in wins)
+            dc_abs = sorted(w.dc_abs_median() for w in wins)
+            clip = sorted(w.clip_ratio() for w in wins)
+            silence = sorted(w.silence_ratio() for w in wins)
+            for q in EXPORT_QUANTILES:
+                label = str(q)
+                _AUDIO_HEALTH_RMS.labels(name, label).set(percentile(rms, q))
+                _AUDIO_HEALTH_DC_OFFSET.labels(name, label).set(percentile(dc_abs, q))
+                _AUDIO_HEALTH_CLIP_RATIO.labels(name, label).set(percentile(clip, q))
+                _AUDIO_HEALTH_SILENCE_RATIO.labels(name, label).set(percentile(silence, q))
+            _AUDIO_HEALTH_CALLS.labels(name).set(len(wins))
+            medians[name] = {"rms": percentile(rms, 0.5), "dc_offset": percentile(dc, 0.5)}
+        return medians
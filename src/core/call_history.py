@@ -2,6 +2,22 @@
 Call History persistence layer.
 
 Stores call records in SQLite for historical analysis and debugging.
+
+The engine writes through ``CallHistoryStore.enqueue`` at hangup: records are
+queued and a write-behind task commits them in batches (every
+``CALL_HISTORY_WRITE_BATCH_MS`` or ``CALL_HISTORY_WRITE_BATCH_MAX`` records,
+whichever comes first) on one persistent connection owned by a dedicated
+writer thread. ``save`` remains the synchronous, one-record path.
+
+Dashboard statistics are served from rollup tables maintained in the same
+transaction as each insert: ``call_stats_hourly`` / ``call_stats_daily``
+(per UTC bucket x provider x pipeline x context x outcome),
+``call_stats_daily_callers`` and the normalized ``call_tool_usage`` (one row per
+tool invocation). ``get_stats`` combines whole days, whole hours and a raw scan
+of the partial hours at the edges of the requested range. Databases that held
+records before the rollups existed are backfilled with ``rebuild_rollups``
+(``scripts/rebuild_call_history_rollups.py``); until then ``get_stats`` scans
+``call_records`` as before.
 """
 
 import asyncio
@@ -10,11 +26,13 @@ import logging
 import os
 import sqlite3
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +78,8 @@ class CallRecord:
     caller_audio_format: str = "ulaw"
     codec_alignment_ok: bool = True
     barge_in_count: int = 0
+    # Per-stage audio health summary at hangup: {stage: {rms_p50, silence_ratio, ...}}
+    audio_health: Dict[str, Any] = field(default_factory=dict)
     
     # Metadata
     created_at: Optional[datetime] = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -85,16 +105,161 @@ class CallRecord:
                     data[key] = None
         
         # Parse JSON strings for complex fields
-        for key in ['pipeline_components', 'conversation_history', 'tool_calls']:
+        for key in ['pipeline_components', 'conversation_history', 'tool_calls', 'audio_health']:
             if data.get(key) and isinstance(data[key], str):
                 try:
                     data[key] = json.loads(data[key])
                 except json.JSONDecodeError:
                     data[key] = [] if key in ['conversation_history', 'tool_calls'] else {}
+        # Rows written before the audio_health column existed
+        if data.get('audio_health') is None:
+            data['audio_health'] = {}
         
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
+_ROLLUP_DIMENSIONS = ("provider_name", "pipeline_name", "context_name", "outcome")
+
+_ROLLUP_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        bucket TEXT NOT NULL,
+        provider_name TEXT NOT NULL,
+        pipeline_name TEXT NOT NULL,
+        context_name TEXT NOT NULL,
+        outcome TEXT NOT NULL,
+        calls INTEGER NOT NULL DEFAULT 0,
+        calls_with_tools INTEGER NOT NULL DEFAULT 0,
+        total_duration REAL NOT NULL DEFAULT 0,
+        min_duration REAL,
+        max_duration REAL,
+        total_latency_ms REAL NOT NULL DEFAULT 0,
+        latency_samples INTEGER NOT NULL DEFAULT 0,
+        total_turns INTEGER NOT NULL DEFAULT 0,
+        total_barge_ins INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (bucket, provider_name, pipeline_name, context_name, outcome)
+    ) WITHOUT ROWID
+"""
+
+_ROLLUP_UPSERT_SQL = """
+    INSERT INTO {table} (
+        bucket, provider_name, pipeline_name, context_name, outcome,
+        calls, calls_with_tools, total_duration, min_duration, max_duration,
+        total_latency_ms, latency_samples, total_turns, total_barge_ins
+    ) VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bucket, provider_name, pipeline_name, context_name, outcome) DO UPDATE SET
+        calls = calls + 1,
+        calls_with_tools = calls_with_tools + excluded.calls_with_tools,
+        total_duration = total_duration + excluded.total_duration,
+        min_duration = CASE WHEN min_duration IS NULL OR excluded.min_duration < min_duration
+                            THEN excluded.min_duration ELSE min_duration END,
+        max_duration = CASE WHEN max_duration IS NULL OR excluded.max_duration > max_duration
+                            THEN excluded.max_duration ELSE max_duration END,
+        total_latency_ms = total_latency_ms + excluded.total_latency_ms,
+        latency_samples = latency_samples + excluded.latency_samples,
+        total_turns = total_turns + excluded.total_turns,
+        total_barge_ins = total_barge_ins + excluded.total_barge_ins
+"""
+
+# Same column shape from either a rollup table or call_records, so segments can be merged.
+_ROLLUP_SELECT_SQL = """
+    SELECT provider_name, pipeline_name, context_name, outcome, substr(bucket, 1, 10),
+           SUM(calls), SUM(calls_with_tools), SUM(total_duration), MIN(min_duration), MAX(max_duration),
+           SUM(total_latency_ms), SUM(latency_samples), SUM(total_turns), SUM(total_barge_ins)
+    FROM {table} WHERE {where}
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+_HOUR_BUCKET_SQL = "COALESCE(strftime('%Y-%m-%dT%H', start_time), '')"
+
+_RECORDS_SELECT_SQL = """
+    SELECT COALESCE(provider_name, ''), COALESCE(pipeline_name, ''), COALESCE(context_name, ''),
+           COALESCE(outcome, ''), {bucket},
+           COUNT(*), SUM(CASE WHEN tool_calls != '[]' THEN 1 ELSE 0 END),
+           TOTAL(duration_seconds), MIN(duration_seconds), MAX(duration_seconds),
+           TOTAL(avg_turn_latency_ms), COUNT(avg_turn_latency_ms),
+           TOTAL(total_turns), TOTAL(barge_in_count)
+    FROM call_records WHERE {where}
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def _hour_key(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H")
+
+
+def _day_key(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%d")
+
+
+def _floor_hour(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _floor_day(dt: datetime) -> datetime:
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _ceil_to(dt: datetime, floor, step: timedelta) -> datetime:
+    floored = floor(dt)
+    return floored if floored == dt else floored + step
+
+
+def _split_stats_range(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    *,
+    hourly: bool = True,
+) -> List[Tuple[str, Optional[datetime], Optional[datetime], bool]]:
+    """
+    Cover [start, end] with ("raw" | "hour" | "day", lo, hi, hi_inclusive) segments.
+
+    Whole days come from the daily rollup, whole hours at either side from the hourly
+    rollup (when ``hourly``), and the partial units at the edges from call_records.
+    None bounds are open.
+    """
+    unit_floor, step = (_floor_hour, timedelta(hours=1)) if hourly else (_floor_day, timedelta(days=1))
+    lo = _ceil_to(start, unit_floor, step) if start is not None else None
+    hi = unit_floor(end) if end is not None else None
+    if lo is not None and hi is not None and lo >= hi:
+        return [("raw", start, end, True)]
+
+    segments: List[Tuple[str, Optional[datetime], Optional[datetime], bool]] = []
+    if start is not None and start < lo:
+        segments.append(("raw", start, lo, False))
+    if end is not None:
+        segments.append(("raw", hi, end, True))
+    if not hourly:
+        segments.append(("day", lo, hi, False))
+        return segments
+
+    day_lo = _ceil_to(lo, _floor_day, timedelta(days=1)) if lo is not None else None
+    day_hi = _floor_day(hi) if hi is not None else None
+    if day_lo is not None and day_hi is not None and day_lo >= day_hi:
+        segments.append(("hour", lo, hi, False))
+        return segments
+    if lo is not None and lo < day_lo:
+        segments.append(("hour", lo, day_lo, False))
+    if hi is not None and day_hi < hi:
+        segments.append(("hour", day_hi, hi, False))
+    segments.append(("day", day_lo, day_hi, False))
+    return segments
+
+
+def _range_where(column: str, lo: Optional[str], hi: Optional[str], hi_inclusive: bool) -> Tuple[str, List[str]]:
+    clauses, params = ["1=1"], []
+    if lo is not None:
+        clauses.append(f"{column} >= ?")
+        params.append(lo)
+    if hi is not None:
+        clauses.append(f"{column} {'<=' if hi_inclusive else '<'} ?")
+        params.append(hi)
+    return " AND ".join(clauses), params
+
+
 class CallHistoryStore:
     """SQLite-based call history storage."""
     
@@ -122,6 +287,7 @@ class CallHistoryStore:
         caller_audio_format TEXT,
         codec_alignment_ok INTEGER,
         barge_in_count INTEGER,
+        audio_health TEXT,
         created_at TEXT DEFAULT CURRENT_TIMESTAMP
     )
     """
@@ -135,6 +301,29 @@ class CallHistoryStore:
         "CREATE INDEX IF NOT EXISTS idx_call_records_context ON call_records(context_name)",
     ]
 
+    _CREATE_ROLLUP_TABLES_SQL = [
+        _ROLLUP_TABLE_SQL.format(table="call_stats_hourly"),
+        _ROLLUP_TABLE_SQL.format(table="call_stats_daily"),
+        """
+        CREATE TABLE IF NOT EXISTS call_stats_daily_callers (
+            bucket TEXT NOT NULL,
+            caller_number TEXT NOT NULL,
+            calls INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket, caller_number)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS call_tool_usage (
+            record_id TEXT NOT NULL,
+            start_time TEXT,
+            tool_name TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_call_tool_usage_start_tool ON call_tool_usage(start_time, tool_name)",
+        "CREATE INDEX IF NOT EXISTS idx_call_tool_usage_record ON call_tool_usage(record_id)",
+        "CREATE TABLE IF NOT EXISTS call_stats_meta (key TEXT PRIMARY KEY, value TEXT)",
+    ]
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize call history store.
@@ -150,6 +339,18 @@ class CallHistoryStore:
         self._enabled = os.getenv("CALL_HISTORY_ENABLED", "true").lower() in ("true", "1", "yes")
         self._lock = threading.Lock()
         self._initialized = False
+        self._rollups_ready = False
+
+        # Write-behind queue (see enqueue). The writer connection is only ever touched
+        # from the single writer thread.
+        self._batch_delay = max(0.0, float(os.getenv("CALL_HISTORY_WRITE_BATCH_MS", "250"))) / 1000.0
+        self._batch_max = max(1, int(os.getenv("CALL_HISTORY_WRITE_BATCH_MAX", "64")))
+        self._pending: List[Tuple[CallRecord, "asyncio.Future[Optional[str]]"]] = []
+        self._writer_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Future] = None
+        self._draining = False
+        self._writer_executor: Optional[ThreadPoolExecutor] = None
+        self._writer_conn: Optional[sqlite3.Connection] = None
         
         if self._enabled:
             self._init_db()
@@ -167,8 +368,12 @@ class CallHistoryStore:
                 try:
                     cursor = conn.cursor()
                     cursor.execute(self._CREATE_TABLE_SQL)
+                    self._ensure_schema_sync(conn)
                     for idx_sql in self._CREATE_INDEXES_SQL:
                         cursor.execute(idx_sql)
+                    for rollup_sql in self._CREATE_ROLLUP_TABLES_SQL:
+                        cursor.execute(rollup_sql)
+                    self._rollups_ready = self._init_rollup_state_sync(conn)
                     conn.commit()
                     self._initialized = True
                     logger.info(f"Call history database initialized: {self._db_path}")
@@ -178,6 +383,17 @@ class CallHistoryStore:
             logger.error(f"Failed to initialize call history database: {e}", exc_info=True)
             self._enabled = False
     
+    def _ensure_schema_sync(self, conn: sqlite3.Connection) -> None:
+        """Best-effort migration: add columns introduced after a database was created."""
+        try:
+            cur = conn.cursor()
+            cols = {str(r[1]) for r in cur.execute("PRAGMA table_info(call_records)").fetchall()}
+            if "audio_health" not in cols:
+                cur.execute("ALTER TABLE call_records ADD COLUMN audio_health TEXT")
+        except Exception:
+            # Never fail startup due to a best-effort migration.
+            logger.debug("Call history schema migration failed (non-fatal)", exc_info=True)
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with WAL mode and busy timeout for multi-process safety."""
         conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)  # 30s busy timeout
@@ -189,6 +405,232 @@ class CallHistoryStore:
         conn.execute("PRAGMA foreign_keys=ON;")
         return conn
     
+    _INSERT_SQL = """
+        INSERT OR REPLACE INTO call_records (
+            id, call_id, caller_number, caller_name,
+            start_time, end_time, duration_seconds,
+            provider_name, pipeline_name, pipeline_components, context_name,
+            conversation_history, outcome, transfer_destination, error_message,
+            tool_calls, avg_turn_latency_ms, max_turn_latency_ms, total_turns,
+            caller_audio_format, codec_alignment_ok, barge_in_count, audio_health, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _record_params(record: CallRecord) -> Tuple[Any, ...]:
+        """Row values for _INSERT_SQL (JSON fields serialized here)."""
+        return (
+            record.id,
+            record.call_id,
+            record.caller_number,
+            record.caller_name,
+            record.start_time.isoformat() if record.start_time else None,
+            record.end_time.isoformat() if record.end_time else None,
+            record.duration_seconds,
+            record.provider_name,
+            record.pipeline_name,
+            json.dumps(record.pipeline_components),
+            record.context_name,
+            json.dumps(record.conversation_history),
+            record.outcome,
+            record.transfer_destination,
+            record.error_message,
+            json.dumps(record.tool_calls),
+            record.avg_turn_latency_ms,
+            record.max_turn_latency_ms,
+            record.total_turns,
+            record.caller_audio_format,
+            1 if record.codec_alignment_ok else 0,
+            record.barge_in_count,
+            json.dumps(record.audio_health),
+            record.created_at.isoformat() if record.created_at else None,
+        )
+
+    # ------------------------------------------------------------------
+    # Stats rollups
+    # ------------------------------------------------------------------
+
+    def _init_rollup_state_sync(self, conn: sqlite3.Connection) -> bool:
+        """Whether the rollups cover every record; a new (empty) database starts covered."""
+        row = conn.execute("SELECT value FROM call_stats_meta WHERE key = 'rollups_built_at'").fetchone()
+        if row:
+            return True
+        if conn.execute("SELECT 1 FROM call_records LIMIT 1").fetchone() is None:
+            conn.execute(
+                "INSERT OR REPLACE INTO call_stats_meta (key, value) VALUES ('rollups_built_at', ?)",
+                (datetime.now(timezone.utc).isoformat(),),
+            )
+            return True
+        logger.warning(
+            "Call history stats rollups are not built for existing records; dashboard stats will scan "
+            "call_records until scripts/rebuild_call_history_rollups.py is run"
+        )
+        return False
+
+    def _apply_rollups_sync(self, conn: sqlite3.Connection, records: List[CallRecord]) -> None:
+        """Add newly inserted records to the rollups (same transaction as the insert)."""
+        hourly, daily, callers, tools = [], [], [], []
+        for record in records:
+            start = _as_utc(record.start_time) if record.start_time else None
+            hour = _hour_key(start) if start else ""
+            day = hour[:10]
+            dims = (
+                record.provider_name or "",
+                record.pipeline_name or "",
+                record.context_name or "",
+                record.outcome or "",
+            )
+            measures = (
+                1 if record.tool_calls else 0,
+                record.duration_seconds or 0.0,
+                record.duration_seconds,
+                record.duration_seconds,
+                record.avg_turn_latency_ms or 0.0,
+                0 if record.avg_turn_latency_ms is None else 1,
+                record.total_turns or 0,
+                record.barge_in_count or 0,
+            )
+            hourly.append((hour, *dims, *measures))
+            daily.append((day, *dims, *measures))
+            if record.caller_number is not None:
+                callers.append((day, record.caller_number))
+            start_iso = record.start_time.isoformat() if record.start_time else None
+            for tool in record.tool_calls or []:
+                name = tool.get("name", "unknown") if isinstance(tool, dict) else "unknown"
+                tools.append((record.id, start_iso, str(name)))
+
+        conn.executemany(_ROLLUP_UPSERT_SQL.format(table="call_stats_hourly"), hourly)
+        conn.executemany(_ROLLUP_UPSERT_SQL.format(table="call_stats_daily"), daily)
+        conn.executemany(
+            """
+            INSERT INTO call_stats_daily_callers (bucket, caller_number, calls) VALUES (?, ?, 1)
+            ON CONFLICT(bucket, caller_number) DO UPDATE SET calls = calls + 1
+            """,
+            callers,
+        )
+        conn.executemany(
+            "INSERT INTO call_tool_usage (record_id, start_time, tool_name) VALUES (?, ?, ?)",
+            tools,
+        )
+
+    def _rebuild_rollups_sync(
+        self,
+        conn: sqlite3.Connection,
+        day_from: Optional[str] = None,
+        day_to: Optional[str] = None,
+    ) -> None:
+        """
+        Recompute the hourly/daily/caller rollups for UTC days [day_from, day_to] from call_records.
+
+        Used for the full backfill (no bounds) and after deletes, which can't be subtracted
+        from MIN/MAX. call_tool_usage is keyed by record and maintained separately.
+        """
+        bucket_where, bucket_params = _range_where("bucket", day_from, None, False)
+        if day_to is not None:
+            bucket_where += " AND bucket < ?"
+            bucket_params.append(_day_key(datetime.strptime(day_to, "%Y-%m-%d") + timedelta(days=1)))
+        # Narrow by the start_time index first (a day of margin for non-UTC offsets), then bucket exactly.
+        record_where, record_params = "1=1", []
+        if day_from is not None:
+            record_where += " AND start_time >= ?"
+            record_params.append(_day_key(datetime.strptime(day_from, "%Y-%m-%d") - timedelta(days=1)))
+        if day_to is not None:
+            record_where += " AND start_time < ?"
+            record_params.append(_day_key(datetime.strptime(day_to, "%Y-%m-%d") + timedelta(days=2)))
+        if day_from is not None:
+            record_where += f" AND {_HOUR_BUCKET_SQL} >= ?"
+            record_params.append(day_from)
+        if day_to is not None:
+            record_where += f" AND {_HOUR_BUCKET_SQL} < ?"
+            record_params.append(bucket_params[-1])
+
+        for table in ("call_stats_hourly", "call_stats_daily", "call_stats_daily_callers"):
+            conn.execute(f"DELETE FROM {table} WHERE {bucket_where}", bucket_params)
+
+        measures = (
+            "calls, calls_with_tools, total_duration, min_duration, max_duration, "
+            "total_latency_ms, latency_samples, total_turns, total_barge_ins"
+        )
+        conn.execute(
+            f"INSERT INTO call_stats_hourly (provider_name, pipeline_name, context_name, outcome, bucket, {measures})"
+            + _RECORDS_SELECT_SQL.format(bucket=_HOUR_BUCKET_SQL, where=record_where),
+            record_params,
+        )
+        conn.execute(
+            f"""
+            INSERT INTO call_stats_daily (bucket, provider_name, pipeline_name, context_name, outcome, {measures})
+            SELECT substr(bucket, 1, 10), provider_name, pipeline_name, context_name, outcome,
+                   SUM(calls), SUM(calls_with_tools), SUM(total_duration), MIN(min_duration), MAX(max_duration),
+                   SUM(total_latency_ms), SUM(latency_samples), SUM(total_turns), SUM(total_barge_ins)
+            FROM call_stats_hourly WHERE {bucket_where}
+            GROUP BY 1, 2, 3, 4, 5
+            """,
+            bucket_params,
+        )
+        conn.execute(
+            f"""
+            INSERT INTO call_stats_daily_callers (bucket, caller_number, calls)
+            SELECT substr({_HOUR_BUCKET_SQL}, 1, 10), caller_number, COUNT(*)
+            FROM call_records WHERE {record_where} AND caller_number IS NOT NULL
+            GROUP BY 1, 2
+            """,
+            record_params,
+        )
+
+    async def rebuild_rollups(self, batch_size: int = 5000) -> int:
+        """
+        Rebuild every stats rollup (and call_tool_usage) from call_records.
+
+        Runs in one write transaction, so concurrent writers wait on busy_timeout until
+        it commits. Returns the number of records covered.
+        """
+        if not self._enabled:
+            return 0
+
+        def _rebuild_sync():
+            with self._lock:
+                conn = self._get_connection()
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    self._rebuild_rollups_sync(conn)
+                    conn.execute("DELETE FROM call_tool_usage")
+                    cursor = conn.execute(
+                        "SELECT id, start_time, tool_calls FROM call_records WHERE tool_calls != '[]'"
+                    )
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        usage = []
+                        for row in rows:
+                            try:
+                                tools = json.loads(row["tool_calls"]) if row["tool_calls"] else []
+                            except (json.JSONDecodeError, TypeError):
+                                continue
+                            for tool in tools if isinstance(tools, list) else []:
+                                name = tool.get("name", "unknown") if isinstance(tool, dict) else "unknown"
+                                usage.append((row["id"], row["start_time"], str(name)))
+                        conn.executemany(
+                            "INSERT INTO call_tool_usage (record_id, start_time, tool_name) VALUES (?, ?, ?)",
+                            usage,
+                        )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO call_stats_meta (key, value) VALUES ('rollups_built_at', ?)",
+                        (datetime.now(timezone.utc).isoformat(),),
+                    )
+                    total = conn.execute("SELECT COUNT(*) FROM call_records").fetchone()[0]
+                    conn.commit()
+                    self._rollups_ready = True
+                    return total
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.close()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _rebuild_sync)
+
     async def save(self, record: CallRecord) -> bool:
         """
         Save a call record to the database.
@@ -214,40 +656,8 @@ class CallHistoryStore:
                         # Already saved, skip duplicate
                         return True
                     
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO call_records (
-                            id, call_id, caller_number, caller_name,
-                            start_time, end_time, duration_seconds,
-                            provider_name, pipeline_name, pipeline_components, context_name,
-                            conversation_history, outcome, transfer_destination, error_message,
-                            tool_calls, avg_turn_latency_ms, max_turn_latency_ms, total_turns,
-                            caller_audio_format, codec_alignment_ok, barge_in_count, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.id,
-                        record.call_id,
-                        record.caller_number,
-                        record.caller_name,
-                        record.start_time.isoformat() if record.start_time else None,
-                        record.end_time.isoformat() if record.end_time else None,
-                        record.duration_seconds,
-                        record.provider_name,
-                        record.pipeline_name,
-                        json.dumps(record.pipeline_components),
-                        record.context_name,
-                        json.dumps(record.conversation_history),
-                        record.outcome,
-                        record.transfer_destination,
-                        record.error_message,
-                        json.dumps(record.tool_calls),
-                        record.avg_turn_latency_ms,
-                        record.max_turn_latency_ms,
-                        record.total_turns,
-                        record.caller_audio_format,
-                        1 if record.codec_alignment_ok else 0,
-                        record.barge_in_count,
-                        record.created_at.isoformat() if record.created_at else None,
-                    ))
+                    cursor.execute(self._INSERT_SQL, self._record_params(record))
+                    self._apply_rollups_sync(conn, [record])
                     conn.commit()
                     return True
                 except Exception as e:
@@ -259,6 +669,160 @@ class CallHistoryStore:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _save_sync)
     
+    # ------------------------------------------------------------------
+    # Write-behind batching
+    # ------------------------------------------------------------------
+
+    def enqueue(self, record: CallRecord) -> "asyncio.Future[Optional[str]]":
+        """
+        Queue a record for the next batched write and return immediately.
+
+        The returned future resolves to the persisted row id once the batch commits:
+        the existing row's id when a record for the same call_id was already stored
+        (saves are dedupe-by-call_id), or None if the write failed or the store is
+        disabled. Callers that don't need the id can ignore it.
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Optional[str]]" = loop.create_future()
+        if not self._enabled:
+            future.set_result(None)
+            return future
+
+        self._pending.append((record, future))
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._write_behind_loop())
+        elif len(self._pending) >= self._batch_max:
+            self._wake_writer()
+        return future
+
+    def _wake_writer(self) -> None:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    async def _write_behind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._writer_executor is None:
+            self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="call-history-writer")
+        while self._pending:
+            if len(self._pending) < self._batch_max and not self._draining and self._batch_delay > 0:
+                # Linger so records from a burst of hangups share one transaction.
+                self._wakeup = loop.create_future()
+                try:
+                    await asyncio.wait({self._wakeup}, timeout=self._batch_delay)
+                finally:
+                    self._wakeup = None
+            batch = self._pending[: self._batch_max]
+            del self._pending[: len(batch)]
+            try:
+                ids = await loop.run_in_executor(
+                    self._writer_executor, self._write_batch_sync, [record for record, _ in batch]
+                )
+            except Exception as e:
+                logger.error(f"Failed to write call history batch ({len(batch)} records): {e}")
+                ids = [None] * len(batch)
+            for (_, future), persisted_id in zip(batch, ids):
+                if not future.done():
+                    future.set_result(persisted_id)
+
+    def _get_writer_connection(self) -> sqlite3.Connection:
+        """Persistent connection for the writer thread, tuned for small frequent batches."""
+        if self._writer_conn is None:
+            conn = self._get_connection()
+            conn.execute("PRAGMA temp_store=MEMORY;")
+            conn.execute("PRAGMA cache_size=-8192;")  # KiB
+            self._writer_conn = conn
+        return self._writer_conn
+
+    def _write_batch_sync(self, records: List[CallRecord]) -> List[Optional[str]]:
+        """Insert a batch in one transaction; returns the persisted id per record.
+
+        A record that cannot be serialized is skipped.  If the batch insert fails
+        (e.g. a constraint violation), it is retried row by row so only the bad
+        record is lost; lost records get None.
+        """
+        started = time.perf_counter()
+        conn = self._get_writer_connection()
+        try:
+            call_ids = list({r.call_id for r in records})
+            placeholders = ",".join(["?"] * len(call_ids))
+            persisted: Dict[str, str] = {
+                str(row["call_id"]): str(row["id"])
+                for row in conn.execute(
+                    f"SELECT call_id, id FROM call_records WHERE call_id IN ({placeholders})",
+                    call_ids,
+                ).fetchall()
+            }
+        except Exception as e:
+            logger.error(f"Failed to write call history batch ({len(records)} records): {e}")
+            return [None] * len(records)
+
+        rows, inserted = [], []
+        for record in records:
+            if record.call_id in persisted:
+                continue
+            try:
+                params = self._record_params(record)
+            except Exception as e:
+                logger.error(f"Skipping call history record {record.call_id}: {e}")
+                continue
+            persisted[record.call_id] = record.id
+            rows.append(params)
+            inserted.append(record)
+
+        if rows:
+            try:
+                conn.executemany(self._INSERT_SQL, rows)
+                self._apply_rollups_sync(conn, inserted)
+                conn.commit()
+            except Exception as e:
+                self._rollback_quietly(conn)
+                logger.warning(f"Call history batch insert failed ({len(rows)} records), retrying row by row: {e}")
+                for record, params in zip(inserted, rows):
+                    try:
+                        conn.execute(self._INSERT_SQL, params)
+                        self._apply_rollups_sync(conn, [record])
+                        conn.commit()
+                    except Exception as row_error:
+                        self._rollback_quietly(conn)
+                        persisted.pop(record.call_id, None)
+                        logger.error(f"Failed to save call history record {record.call_id}: {row_error}")
+        logger.debug(
+            f"Call history batch written: {len(rows)} new of {len(records)} "
+            f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return [persisted.get(r.call_id) for r in records]
+
+    @staticmethod
+    def _rollback_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+
+    async def flush(self) -> None:
+        """Write everything queued so far without waiting for the batch interval."""
+        self._draining = True
+        try:
+            while self._pending or (self._writer_task is not None and not self._writer_task.done()):
+                self._wake_writer()
+                task = self._writer_task
+                if task is None or task.done():
+                    task = self._writer_task = asyncio.get_running_loop().create_task(self._write_behind_loop())
+                await task
+        finally:
+            self._draining = False
+
+    async def close(self) -> None:
+        """Drain the write-behind queue and release the writer connection/thread."""
+        await self.flush()
+        executor, self._writer_executor = self._writer_executor, None
+        if executor is None:
+            return
+        conn, self._writer_conn = self._writer_conn, None
+        if conn is not None:
+            await asyncio.get_running_loop().run_in_executor(executor, conn.close)
+        executor.shutdown(wait=False)
+
     async def get(self, record_id: str) -> Optional[CallRecord]:
         """
         Get a call record by ID.
@@ -546,9 +1110,17 @@ class CallHistoryStore:
                 conn = self._get_connection()
                 try:
                     cursor = conn.cursor()
+                    row = cursor.execute(
+                        f"SELECT substr({_HOUR_BUCKET_SQL}, 1, 10) FROM call_records WHERE id = ?", (record_id,)
+                    ).fetchone()
                     cursor.execute("DELETE FROM call_records WHERE id = ?", (record_id,))
+                    deleted = cursor.rowcount > 0
+                    if deleted:
+                        cursor.execute("DELETE FROM call_tool_usage WHERE record_id = ?", (record_id,))
+                        if row and row[0]:
+                            self._rebuild_rollups_sync(conn, row[0], row[0])
                     conn.commit()
-                    return cursor.rowcount > 0
+                    return deleted
                 finally:
                     conn.close()
         
@@ -569,8 +1141,13 @@ class CallHistoryStore:
                         "DELETE FROM call_records WHERE start_time < ?",
                         (before_date.isoformat(),)
                     )
+                    deleted = cursor.rowcount
+                    if deleted:
+                        cursor.execute("DELETE FROM call_tool_usage WHERE start_time < ?", (before_date.isoformat(),))
+                        # Days wholly before the cutoff just empty out; the cutoff day is recomputed.
+                        self._rebuild_rollups_sync(conn, None, _day_key(_as_utc(before_date)))
                     conn.commit()
-                    return cursor.rowcount
+                    return deleted
                 finally:
                     conn.close()
         
@@ -595,133 +1172,253 @@ class CallHistoryStore:
             with self._lock:
                 conn = self._get_connection()
                 try:
-                    cursor = conn.cursor()
-                    
-                    # Build date filter
-                    date_filter = "1=1"
-                    params = []
-                    if start_date:
-                        date_filter += " AND start_time >= ?"
-                        params.append(start_date.isoformat())
-                    if end_date:
-                        date_filter += " AND start_time <= ?"
-                        params.append(end_date.isoformat())
-                    
-                    # Total calls and duration stats
-                    cursor.execute(f"""
-                        SELECT 
-                            COUNT(*) as total_calls,
-                            AVG(duration_seconds) as avg_duration,
-                            MAX(duration_seconds) as max_duration,
-                            MIN(duration_seconds) as min_duration,
-                            SUM(duration_seconds) as total_duration,
-                            AVG(avg_turn_latency_ms) as avg_latency,
-                            SUM(total_turns) as total_turns,
-                            SUM(barge_in_count) as total_barge_ins
-                        FROM call_records WHERE {date_filter}
-                    """, params)
-                    row = cursor.fetchone()
-                    stats = {
-                        "total_calls": row[0] or 0,
-                        "avg_duration_seconds": round(row[1] or 0, 2),
-                        "max_duration_seconds": round(row[2] or 0, 2),
-                        "min_duration_seconds": round(row[3] or 0, 2),
-                        "total_duration_seconds": round(row[4] or 0, 2),
-                        "avg_latency_ms": round(row[5] or 0, 2),
-                        "total_turns": row[6] or 0,
-                        "total_barge_ins": row[7] or 0,
-                    }
-                    
-                    # Outcome breakdown
-                    cursor.execute(f"""
-                        SELECT outcome, COUNT(*) as count
-                        FROM call_records WHERE {date_filter}
-                        GROUP BY outcome
-                    """, params)
-                    stats["outcomes"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Provider usage
-                    cursor.execute(f"""
-                        SELECT provider_name, COUNT(*) as count
-                        FROM call_records WHERE {date_filter}
-                        GROUP BY provider_name
-                    """, params)
-                    stats["providers"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Pipeline usage
-                    cursor.execute(f"""
-                        SELECT pipeline_name, COUNT(*) as count
-                        FROM call_records WHERE {date_filter} AND pipeline_name IS NOT NULL
-                        GROUP BY pipeline_name
-                    """, params)
-                    stats["pipelines"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Context usage
-                    cursor.execute(f"""
-                        SELECT context_name, COUNT(*) as count
-                        FROM call_records WHERE {date_filter} AND context_name IS NOT NULL
-                        GROUP BY context_name
-                    """, params)
-                    stats["contexts"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Calls per day (last 30 days)
-                    cursor.execute(f"""
-                        SELECT DATE(start_time) as day, COUNT(*) as count
-                        FROM call_records 
-                        WHERE {date_filter}
-                        GROUP BY DATE(start_time)
-                        ORDER BY day DESC
-                        LIMIT 30
-                    """, params)
-                    stats["calls_per_day"] = [
-                        {"date": row[0], "count": row[1]} 
-                        for row in cursor.fetchall()
-                    ]
-                    
-                    # Top callers
-                    cursor.execute(f"""
-                        SELECT caller_number, COUNT(*) as count
-                        FROM call_records 
-                        WHERE {date_filter} AND caller_number IS NOT NULL
-                        GROUP BY caller_number
-                        ORDER BY count DESC
-                        LIMIT 10
-                    """, params)
-                    stats["top_callers"] = [
-                        {"number": row[0], "count": row[1]} 
-                        for row in cursor.fetchall()
-                    ]
-                    
-                    # Tool usage stats
-                    cursor.execute(f"""
-                        SELECT COUNT(*) FROM call_records 
-                        WHERE {date_filter} AND tool_calls != '[]'
-                    """, params)
-                    stats["calls_with_tools"] = cursor.fetchone()[0]
-                    
-                    # Top tools aggregation (parse JSON tool_calls field)
-                    cursor.execute(f"""
-                        SELECT tool_calls FROM call_records 
-                        WHERE {date_filter} AND tool_calls != '[]'
-                    """, params)
-                    tool_counts: Dict[str, int] = {}
-                    for row in cursor.fetchall():
-                        try:
-                            tools = json.loads(row[0]) if row[0] else []
-                            for tool in tools:
-                                name = tool.get("name", "unknown")
-                                tool_counts[name] = tool_counts.get(name, 0) + 1
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    stats["top_tools"] = dict(sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-                    
-                    return stats
+                    if self._rollups_ready or conn.execute(
+                        "SELECT 1 FROM call_stats_meta WHERE key = 'rollups_built_at'"
+                    ).fetchone():
+                        self._rollups_ready = True
+                        return self._stats_from_rollups_sync(conn, start_date, end_date)
+                    return self._stats_from_records_sync(conn.cursor(), start_date, end_date)
                 finally:
                     conn.close()
         
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _stats_sync)
     
+    def _stats_from_rollups_sync(
+        self,
+        conn: sqlite3.Connection,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """get_stats from the rollup tables (see _split_stats_range for how the range is covered)."""
+        start = _as_utc(start_date) if start_date else None
+        end = _as_utc(end_date) if end_date else None
+
+        def _segment_where(kind, lo, hi, hi_inclusive):
+            if kind == "raw":
+                return _range_where(
+                    "start_time", lo.isoformat() if lo else None, hi.isoformat() if hi else None, hi_inclusive
+                )
+            key = _hour_key if kind == "hour" else _day_key
+            return _range_where("bucket", key(lo) if lo else None, key(hi) if hi else None, False)
+
+        rows = []
+        for kind, lo, hi, hi_inclusive in _split_stats_range(start, end):
+            where, params = _segment_where(kind, lo, hi, hi_inclusive)
+            if kind == "raw":
+                sql = _RECORDS_SELECT_SQL.format(bucket=f"substr({_HOUR_BUCKET_SQL}, 1, 10)", where=where)
+            else:
+                sql = _ROLLUP_SELECT_SQL.format(
+                    table="call_stats_hourly" if kind == "hour" else "call_stats_daily", where=where
+                )
+            rows.extend(conn.execute(sql, params).fetchall())
+
+        total_calls = calls_with_tools = latency_samples = 0
+        total_duration = total_latency = total_turns = total_barge_ins = 0.0
+        min_duration: Optional[float] = None
+        max_duration: Optional[float] = None
+        outcomes: Dict[Any, int] = {}
+        providers: Dict[Any, int] = {}
+        pipelines: Dict[str, int] = {}
+        contexts: Dict[str, int] = {}
+        per_day: Dict[str, int] = {}
+        for (provider, pipeline, context, outcome, day, calls, with_tools, duration, lo_duration,
+             hi_duration, latency, samples, turns, barge_ins) in rows:
+            total_calls += calls
+            calls_with_tools += with_tools or 0
+            total_duration += duration or 0.0
+            if lo_duration is not None and (min_duration is None or lo_duration < min_duration):
+                min_duration = lo_duration
+            if hi_duration is not None and (max_duration is None or hi_duration > max_duration):
+                max_duration = hi_duration
+            total_latency += latency or 0.0
+            latency_samples += samples or 0
+            total_turns += turns or 0
+            total_barge_ins += barge_ins or 0
+            # '' stands in for NULL in the rollup keys.
+            outcomes[outcome or None] = outcomes.get(outcome or None, 0) + calls
+            providers[provider or None] = providers.get(provider or None, 0) + calls
+            if pipeline:
+                pipelines[pipeline] = pipelines.get(pipeline, 0) + calls
+            if context:
+                contexts[context] = contexts.get(context, 0) + calls
+            per_day[day] = per_day.get(day, 0) + calls
+
+        stats: Dict[str, Any] = {
+            "total_calls": total_calls,
+            "avg_duration_seconds": round(total_duration / total_calls if total_calls else 0, 2),
+            "max_duration_seconds": round(max_duration or 0, 2),
+            "min_duration_seconds": round(min_duration or 0, 2),
+            "total_duration_seconds": round(total_duration, 2),
+            "avg_latency_ms": round(total_latency / latency_samples if latency_samples else 0, 2),
+            "total_turns": int(total_turns),
+            "total_barge_ins": int(total_barge_ins),
+            "outcomes": outcomes,
+            "providers": providers,
+            "pipelines": pipelines,
+            "contexts": contexts,
+        }
+        days = sorted((d for d in per_day if d), reverse=True) + ([""] if "" in per_day else [])
+        stats["calls_per_day"] = [{"date": d or None, "count": per_day[d]} for d in days[:30]]
+
+        callers: Dict[str, int] = {}
+        for kind, lo, hi, hi_inclusive in _split_stats_range(start, end, hourly=False):
+            where, params = _segment_where(kind, lo, hi, hi_inclusive)
+            if kind == "raw":
+                sql = (
+                    f"SELECT caller_number, COUNT(*) FROM call_records WHERE {where} "
+                    "AND caller_number IS NOT NULL GROUP BY caller_number"
+                )
+            else:
+                sql = f"SELECT caller_number, SUM(calls) FROM call_stats_daily_callers WHERE {where} GROUP BY caller_number"
+            for number, count in conn.execute(sql, params).fetchall():
+                callers[number] = callers.get(number, 0) + count
+        stats["top_callers"] = [
+            {"number": number, "count": count}
+            for number, count in sorted(callers.items(), key=lambda x: x[1], reverse=True)[:10]
+        ]
+
+        stats["calls_with_tools"] = calls_with_tools
+        where, params = _range_where(
+            "start_time", start.isoformat() if start else None, end.isoformat() if end else None, True
+        )
+        stats["top_tools"] = {
+            row[0]: row[1]
+            for row in conn.execute(
+                f"SELECT tool_name, COUNT(*) FROM call_tool_usage WHERE {where} "
+                "GROUP BY tool_name ORDER BY 2 DESC LIMIT 10",
+                params,
+            ).fetchall()
+        }
+        return stats
+
+    def _stats_from_records_sync(
+        self,
+        cursor: sqlite3.Cursor,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """get_stats by scanning call_records (databases whose rollups haven't been built yet)."""
+        # Build date filter
+        date_filter = "1=1"
+        params = []
+        if start_date:
+            date_filter += " AND start_time >= ?"
+            params.append(start_date.isoformat())
+        if end_date:
+            date_filter += " AND start_time <= ?"
+            params.append(end_date.isoformat())
+        
+        # Total calls and duration stats
+        cursor.execute(f"""
+            SELECT 
+                COUNT(*) as total_calls,
+                AVG(duration_seconds) as avg_duration,
+                MAX(duration_seconds) as max_duration,
+                MIN(duration_seconds) as min_duration,
+                SUM(duration_seconds) as total_duration,
+                AVG(avg_turn_latency_ms) as avg_latency,
+                SUM(total_turns) as total_turns,
+                SUM(barge_in_count) as total_barge_ins
+            FROM call_records WHERE {date_filter}
+        """, params)
+        row = cursor.fetchone()
+        stats = {
+            "total_calls": row[0] or 0,
+            "avg_duration_seconds": round(row[1] or 0, 2),
+            "max_duration_seconds": round(row[2] or 0, 2),
+            "min_duration_seconds": round(row[3] or 0, 2),
+            "total_duration_seconds": round(row[4] or 0, 2),
+            "avg_latency_ms": round(row[5] or 0, 2),
+            "total_turns": row[6] or 0,
+            "total_barge_ins": row[7] or 0,
+        }
+        
+        # Outcome breakdown
+        cursor.execute(f"""
+            SELECT outcome, COUNT(*) as count
+            FROM call_records WHERE {date_filter}
+            GROUP BY outcome
+        """, params)
+        stats["outcomes"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Provider usage
+        cursor.execute(f"""
+            SELECT provider_name, COUNT(*) as count
+            FROM call_records WHERE {date_filter}
+            GROUP BY provider_name
+        """, params)
+        stats["providers"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Pipeline usage
+        cursor.execute(f"""
+            SELECT pipeline_name, COUNT(*) as count
+            FROM call_records WHERE {date_filter} AND pipeline_name IS NOT NULL
+            GROUP BY pipeline_name
+        """, params)
+        stats["pipelines"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Context usage
+        cursor.execute(f"""
+            SELECT context_name, COUNT(*) as count
+            FROM call_records WHERE {date_filter} AND context_name IS NOT NULL
+            GROUP BY context_name
+        """, params)
+        stats["contexts"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Calls per day (last 30 days)
+        cursor.execute(f"""
+            SELECT DATE(start_time) as day, COUNT(*) as count
+            FROM call_records 
+            WHERE {date_filter}
+            GROUP BY DATE(start_time)
+            ORDER BY day DESC
+            LIMIT 30
+        """, params)
+        stats["calls_per_day"] = [
+            {"date": row[0], "count": row[1]} 
+            for row in cursor.fetchall()
+        ]
+        
+        # Top callers
+        cursor.execute(f"""
+            SELECT caller_number, COUNT(*) as count
+            FROM call_records 
+            WHERE {date_filter} AND caller_number IS NOT NULL
+            GROUP BY caller_number
+            ORDER BY count DESC
+            LIMIT 10
+        """, params)
+        stats["top_callers"] = [
+            {"number": row[0], "count": row[1]} 
+            for row in cursor.fetchall()
+        ]
+        
+        # Tool usage stats
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM call_records 
+            WHERE {date_filter} AND tool_calls != '[]'
+        """, params)
+        stats["calls_with_tools"] = cursor.fetchone()[0]
+        
+        # Top tools aggregation (parse JSON tool_calls field)
+        cursor.execute(f"""
+            SELECT tool_calls FROM call_records 
+            WHERE {date_filter} AND tool_calls != '[]'
+        """, params)
+        tool_counts: Dict[str, int] = {}
+        for row in cursor.fetchall():
+            try:
+                tools = json.loads(row[0]) if row[0] else []
+                for tool in tools:
+                    name = tool.get("name", "unknown")
+                    tool_counts[name] = tool_counts.get(name, 0) + 1
+            except (json.JSONDecodeError, TypeError):
+                pass
+        stats["top_tools"] = dict(sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        
+        return stats
+
     async def cleanup_old_records(self) -> int:
         """
         Delete records older than retention period.
@@ -775,3 +1472,9 @@ def get_call_history_store() -> CallHistoryStore:
     if _call_history_store is None:
         _call_history_store = CallHistoryStore()
     return _call_history_store
+
+
+async def close_call_history_store() -> None:
+    """Drain pending writes of the global store, if it was ever created (engine shutdown)."""
+    if _call_history_store is not None:
+        await _call_history_store.close()
@@ -0,0 +1,185 @@
+"""
+FrameClock - one engine-wide timer that paces every streaming playback.
+
+Instead of one asyncio task per stream sleeping its own ~20 ms (hundreds of
+timers with independent jitter), streams register a step callback with the
+clock.  A single task ticks on a fixed cadence with drift correction and runs
+every due callback in one pass.  Entries can run every tick (frame pacers) or
+every N ticks (keepalives).
+
+``register()`` returns an ``asyncio.Future`` that stands in for the old
+per-stream task: it resolves when the callback asks to stop, and cancelling it
+(directly or via ``asyncio.wait_for``) unregisters the entry.
+
+Steps are plain synchronous callbacks run inside the pass, so they must not
+block: anything slow (file fallback, session upserts, ARI calls) is handed to
+a regular ``asyncio`` task by the step itself.
+
+Each tick records how late it started (``ai_agent_frame_clock_tick_lateness_seconds``)
+and whether the pass ran past the next tick (``ai_agent_frame_clock_overruns_total``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = structlog.get_logger(__name__)
+
+_FRAME_CLOCK_TICK_LATENESS_SECONDS = Histogram(
+    "ai_agent_frame_clock_tick_lateness_seconds",
+    "How late each frame clock tick started relative to its schedule",
+    buckets=(0.001, 0.002, 0.005, 0.01, 0.02, 0.04, 0.08, 0.16),
+)
+_FRAME_CLOCK_PASS_SECONDS = Histogram(
+    "ai_agent_frame_clock_pass_seconds",
+    "Time spent stepping all registered streams in one tick",
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.04),
+)
+_FRAME_CLOCK_OVERRUNS_TOTAL = Counter(
+    "ai_agent_frame_clock_overruns_total",
+    "Ticks whose pass ran into the next tick",
+)
+_FRAME_CLOCK_SKIPPED_TICKS_TOTAL = Counter(
+    "ai_agent_frame_clock_skipped_ticks_total",
+    "Ticks dropped to resynchronise after the clock fell behind",
+)
+_FRAME_CLOCK_ENTRIES = Gauge(
+    "ai_agent_frame_clock_entries",
+    "Callbacks registered with the frame clock",
+)
+
+# Step callback: return True to stay registered, False to finish.
+StepCallback = Callable[[], bool]
+
+
+@dataclass
+class _ClockEntry:
+    step: StepCallback
+    future: asyncio.Future
+    every: int
+    due: int
+    name: str
+
+
+class FrameClock:
+    """Single task that drives registered step callbacks on a fixed tick."""
+
+    def __init__(self, tick_ms: int = 20):
+        self.tick_seconds = max(0.001, float(tick_ms) / 1000.0)
+        self._entries: Dict[int, _ClockEntry] = {}
+        self._ids = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._tick = 0
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.max_lateness = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def register(self, step: StepCallback, *, every: int = 1, name: str = "") -> asyncio.Future:
+        """Run ``step`` every ``every`` ticks (first run on the next due tick)."""
+        if inspect.iscoroutinefunction(step):
+            raise TypeError("frame clock steps must be synchronous; hand slow work to a task")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        every = max(1, int(every))
+        self._entries[next(self._ids)] = _ClockEntry(step, future, every, self._tick + every, name)
+        _FRAME_CLOCK_ENTRIES.set(len(self._entries))
+        if not self.running:
+            self._task = loop.create_task(self._run())
+        return future
+
+    async def stop(self) -> None:
+        for entry in self._entries.values():
+            if not entry.future.done():
+                entry.future.cancel()
+        self._entries.clear()
+        _FRAME_CLOCK_ENTRIES.set(0)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "tick_ms": round(self.tick_seconds * 1000, 3),
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+            "max_lateness_ms": round(self.max_lateness * 1000, 3),
+        }
+
+    async def _run(self) -> None:
+        tick = self.tick_seconds
+        next_tick = time.perf_counter() + tick
+        try:
+            while self._entries:
+                sleep_for = next_tick - time.perf_counter()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                started = time.perf_counter()
+                lateness = max(0.0, started - next_tick)
+                self.max_lateness = max(self.max_lateness, lateness)
+                self._tick += 1
+                self.ticks += 1
+                self._run_pass()
+                finished = time.perf_counter()
+                try:
+                    _FRAME_CLOCK_TICK_LATENESS_SECONDS.observe(lateness)
+                    _FRAME_CLOCK_PASS_SECONDS.observe(finished - started)
+                except Exception:
+                    pass
+                next_tick += tick
+                if finished > next_tick:
+                    # Pass overran the next tick: resynchronise instead of bursting
+                    # to catch up (same policy the per-stream pacers used).
+                    self.overruns += 1
+                    _FRAME_CLOCK_OVERRUNS_TOTAL.inc()
+                    skipped = int((finished - next_tick) // tick)
+                    if skipped:
+                        self.skipped_ticks += skipped
+                        _FRAME_CLOCK_SKIPPED_TICKS_TOTAL.inc(skipped)
+                    next_tick = finished
+        finally:
+            self._task = None
+
+    def _run_pass(self) -> None:
+        tick = self._tick
+        for key, entry in list(self._entries.items()):
+            if entry.future.done():
+                self._remove(key)
+                continue
+            if entry.due > tick:
+                continue
+            entry.due = tick + entry.every
+            try:
+                keep = bool(entry.step())
+            except Exception as exc:
+                logger.error("Frame clock step failed", entry=entry.name, error=str(exc), exc_info=True)
+                keep = False
+            if not keep or entry.future.done():
+                self._remove(key)
+                if not entry.future.done():
+                    entry.future.set_result(None)
+
+    def _remove(self, key: int) -> None:
+        self._entries.pop(key, None)
+        _FRAME_CLOCK_ENTRIES.set(len(self._entries))
@@ -146,6 +146,7 @@ class CallSession:
     codec_alignment_ok: bool = True
     codec_alignment_message: Optional[str] = None
     audio_diagnostics: Dict[str, Any] = field(default_factory=dict)
+    audio_health: Optional[Any] = None  # CallAudioHealth, created on first sampled frame
     
     # Agent action tracking (transfers, hangup, etc.)
     pending_actions: list = field(default_factory=list)  # Queue of pending actions
@@ -0,0 +1,191 @@
+"""
+Outbound dialer pacing and in-flight bookkeeping.
+
+The scheduler used to pace each campaign with a single "last dial" timestamp
+(one call per ``min_interval_seconds_between_calls``) and counted in-flight
+attempts by scanning every attempt's metadata once per campaign per tick.
+
+``TokenBucket`` generalises the interval into a rate plus a burst so a tick
+can dial several leads at once while keeping the long-run rate.  The engine
+keeps one bucket per campaign (rate ``1 / min_interval``) and one per trunk
+(``AAVA_OUTBOUND_TRUNK_CPS``; the trunk key is the originate route, see
+``trunk_key_for_endpoint``) in an ``OutboundPacer``.
+
+``AttemptIndex`` replaces the plain ``attempt_id -> meta`` dict.  It is a
+mapping with the same interface, so every existing ``pop``/assignment keeps
+working, but it maintains a per-campaign count as entries come and go.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class TokenBucket:
+    """Classic token bucket. A rate <= 0 means unlimited."""
+
+    def __init__(self, rate_per_sec: float, burst: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.rate = float(rate_per_sec)
+        self.burst = max(1.0, float(burst))
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def configure(self, rate_per_sec: float, burst: float) -> None:
+        """Change rate/burst in place (e.g. after a campaign edit) without refilling."""
+        self._refill()
+        self.rate = float(rate_per_sec)
+        self.burst = max(1.0, float(burst))
+        self._tokens = min(self._tokens, self.burst)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.rate > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def available(self) -> int:
+        """Whole tokens that could be taken right now."""
+        if self.unlimited:
+            return 1 << 30
+        self._refill()
+        return int(self._tokens)
+
+    def take(self, n: int = 1) -> int:
+        """Take up to ``n`` whole tokens without waiting; returns how many were taken."""
+        if n <= 0:
+            return 0
+        if self.unlimited:
+            return n
+        self._refill()
+        granted = min(n, int(self._tokens))
+        self._tokens -= granted
+        return granted
+
+    def delay(self) -> float:
+        """Seconds until one token is available (0 if one is available now)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait for and take one token. Waiters are served first-come first-served."""
+        if self.unlimited:
+            return
+        # Reserve immediately (tokens may go negative) so concurrent waiters queue
+        # behind each other instead of all waking on the same refill.
+        self._refill()
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+def trunk_key_for_endpoint(endpoint: str) -> str:
+    """
+    Pacing key for an originate endpoint: its route without the dialled number.
+
+    ``Local/15551234567@from-internal`` -> ``Local@from-internal`` (FreePBX outbound
+    routes/trunks) and ``PJSIP/2001`` -> ``PJSIP`` (internal extensions).
+    """
+    ep = (endpoint or "").strip()
+    tech, _, rest = ep.partition("/")
+    _, at, context = rest.partition("@")
+    return f"{tech}@{context}" if at else tech
+
+
+class OutboundPacer:
+    """Per-campaign and per-trunk token buckets for the outbound scheduler."""
+
+    def __init__(
+        self,
+        *,
+        campaign_burst: float = 1.0,
+        trunk_cps: float = 0.0,
+        trunk_burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self.campaign_burst = max(1.0, float(campaign_burst))
+        self.trunk_cps = max(0.0, float(trunk_cps))
+        self.trunk_burst = max(1.0, float(trunk_burst if trunk_burst is not None else self.trunk_cps or 1.0))
+        self._campaigns: Dict[str, TokenBucket] = {}
+        self._trunks: Dict[str, TokenBucket] = {}
+
+    def campaign(self, campaign_id: str, min_interval_seconds: float) -> TokenBucket:
+        """Bucket for a campaign; ``min_interval_seconds`` <= 0 disables campaign pacing."""
+        rate = 1.0 / float(min_interval_seconds) if min_interval_seconds and min_interval_seconds > 0 else 0.0
+        bucket = self._campaigns.get(campaign_id)
+        if bucket is None:
+            bucket = TokenBucket(rate, self.campaign_burst, clock=self._clock)
+            self._campaigns[campaign_id] = bucket
+        elif bucket.rate != rate or bucket.burst != self.campaign_burst:
+            bucket.configure(rate, self.campaign_burst)
+        return bucket
+
+    def trunk(self, key: str) -> TokenBucket:
+        bucket = self._trunks.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.trunk_cps, self.trunk_burst, clock=self._clock)
+            self._trunks[key] = bucket
+        return bucket
+
+    async def acquire_trunk(self, endpoint: str) -> None:
+        await self.trunk(trunk_key_for_endpoint(endpoint)).acquire()
+
+    def forget_campaigns(self, keep: "set[str]") -> None:
+        """Drop buckets for campaigns that are no longer running."""
+        for campaign_id in [c for c in self._campaigns if c not in keep]:
+            self._campaigns.pop(campaign_id, None)
+
+
+class AttemptIndex(MutableMapping):
+    """``attempt_id -> meta`` mapping that keeps in-flight counts per campaign."""
+
+    def __init__(self) -> None:
+        self._by_attempt: Dict[str, Dict[str, Any]] = {}
+        self._campaign_of: Dict[str, str] = {}
+        self._counts: Dict[str, int] = {}
+
+    def __getitem__(self, attempt_id: str) -> Dict[str, Any]:
+        return self._by_attempt[attempt_id]
+
+    def __setitem__(self, attempt_id: str, meta: Dict[str, Any]) -> None:
+        campaign_id = str((meta or {}).get("campaign_id") or "")
+        previous = self._campaign_of.get(attempt_id)
+        if previous is not None and previous != campaign_id:
+            self._decrement(previous)
+        if previous != campaign_id:
+            self._counts[campaign_id] = self._counts.get(campaign_id, 0) + 1
+        self._campaign_of[attempt_id] = campaign_id
+        self._by_attempt[attempt_id] = meta
+
+    def __delitem__(self, attempt_id: str) -> None:
+        del self._by_attempt[attempt_id]
+        self._decrement(self._campaign_of.pop(attempt_id))
+
+    def _decrement(self, campaign_id: str) -> None:
+        remaining = self._counts.get(campaign_id, 0) - 1
+        if remaining > 0:
+            self._counts[campaign_id] = remaining
+        else:
+            self._counts.pop(campaign_id, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_attempt)
+
+    def __len__(self) -> int:
+        return len(self._by_attempt)
+
+    def count(self, campaign_id: str) -> int:
+        """In-flight attempts for ``campaign_id`` (O(1))."""
+        return self._counts.get(campaign_id, 0)
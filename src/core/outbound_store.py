@@ -27,7 +27,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -50,6 +50,11 @@ def _as_int(value: Any, default: int) -> int:
         return default
 
 
+def max_concurrent_ceiling() -> int:
+    """Upper bound applied to a campaign's max_concurrent (AAVA_OUTBOUND_MAX_CONCURRENT_CEILING, default 5)."""
+    return max(1, _as_int(os.getenv("AAVA_OUTBOUND_MAX_CONCURRENT_CEILING", "5"), 5))
+
+
 def _as_str(value: Any) -> str:
     return "" if value is None else str(value)
 
@@ -331,7 +336,7 @@ class OutboundStore:
             timezone_name = _validate_iana_timezone_name(_as_str(payload.get("timezone")).strip() or "UTC")
             daily_start = _as_str(payload.get("daily_window_start_local")).strip() or "09:00"
             daily_end = _as_str(payload.get("daily_window_end_local")).strip() or "17:00"
-            max_concurrent = max(1, min(5, _as_int(payload.get("max_concurrent"), 1)))
+            max_concurrent = max(1, min(max_concurrent_ceiling(), _as_int(payload.get("max_concurrent"), 1)))
             min_interval = max(0, _as_int(payload.get("min_interval_seconds_between_calls"), 5))
             default_context = _as_str(payload.get("default_context")).strip() or "default"
             vm_enabled = 1 if bool(payload.get("voicemail_drop_enabled", True)) else 0
@@ -490,7 +495,7 @@ class OutboundStore:
                 updates["timezone"] = _validate_iana_timezone_name(_as_str(updates.get("timezone")).strip() or "UTC")
 
             if "max_concurrent" in updates:
-                updates["max_concurrent"] = max(1, min(5, _as_int(updates.get("max_concurrent"), 1)))
+                updates["max_concurrent"] = max(1, min(max_concurrent_ceiling(), _as_int(updates.get("max_concurrent"), 1)))
             if "min_interval_seconds_between_calls" in updates:
                 updates["min_interval_seconds_between_calls"] = max(
                     0, _as_int(updates.get("min_interval_seconds_between_calls"), 5)
@@ -772,6 +777,115 @@ class OutboundStore:
 
         return await self._run(_sync)
 
+    async def start_attempts_batch(
+        self,
+        campaign_id: str,
+        *,
+        limit: int,
+        default_context: str = "default",
+        resolve_provider: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Claim up to N dialable leads and open an attempt for each in one transaction.
+
+        Equivalent to lease_pending_leads + create_attempt + mark_lead_dialing per lead,
+        but with a single BEGIN IMMEDIATE/COMMIT for the whole batch: leads go straight
+        to 'dialing' (attempt_count incremented) and the attempt rows are inserted
+        together, so a crash can never leave a lead leased without an attempt.
+
+        Each returned lead dict carries `attempt_id`, `context` and `provider`.
+        `resolve_provider(context)` is called once per distinct context name.
+        """
+        if not self._enabled:
+            return []
+
+        def _sync():
+            now = _utcnow_iso()
+            batch = max(0, min(200, int(limit or 0)))
+            if batch <= 0:
+                return []
+
+            providers: Dict[str, Optional[str]] = {}
+            with self._lock:
+                conn = self._get_connection()
+                try:
+                    cur = conn.cursor()
+                    cur.execute("BEGIN IMMEDIATE")
+                    rows = cur.execute(
+                        """
+                        SELECT *
+                        FROM outbound_leads
+                        WHERE campaign_id = ?
+                          AND (
+                            state = 'pending'
+                            OR (state = 'leased' AND leased_until_utc IS NOT NULL AND leased_until_utc < ?)
+                          )
+                        ORDER BY created_at_utc ASC
+                        LIMIT ?
+                        """,
+                        (campaign_id, now, batch),
+                    ).fetchall()
+                    if not rows:
+                        conn.commit()
+                        return []
+
+                    out: List[Dict[str, Any]] = []
+                    attempt_rows: List[Tuple[Any, ...]] = []
+                    for r in rows:
+                        d = dict(r)
+                        d["custom_vars"] = _safe_json_loads(str(d.get("custom_vars_json") or "{}"))
+                        d.pop("custom_vars_json", None)
+                        context_name = str(d.get("context_override") or default_context or "default").strip() or "default"
+                        if context_name not in providers:
+                            try:
+                                providers[context_name] = resolve_provider(context_name) if resolve_provider else None
+                            except Exception:
+                                providers[context_name] = None
+                        attempt_id = str(uuid.uuid4())
+                        d["attempt_id"] = attempt_id
+                        d["context"] = context_name
+                        d["provider"] = providers[context_name]
+                        d["state"] = "dialing"
+                        d["attempt_count"] = int(d.get("attempt_count") or 0) + 1
+                        attempt_rows.append(
+                            (attempt_id, campaign_id, str(d["id"]), now, context_name, providers[context_name])
+                        )
+                        out.append(d)
+
+                    lead_ids = [str(d["id"]) for d in out]
+                    placeholders = ",".join(["?"] * len(lead_ids))
+                    cur.execute(
+                        f"""
+                        UPDATE outbound_leads
+                        SET state='dialing',
+                            attempt_count=attempt_count+1,
+                            last_attempt_at_utc=?,
+                            leased_until_utc=NULL,
+                            updated_at_utc=?
+                        WHERE id IN ({placeholders})
+                        """,
+                        [now, now, *lead_ids],
+                    )
+                    cur.executemany(
+                        """
+                        INSERT INTO outbound_attempts (id, campaign_id, lead_id, started_at_utc, context, provider)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        attempt_rows,
+                    )
+                    conn.commit()
+                    return out
+                except Exception:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    raise
+                finally:
+                    conn.close()
+
+        return await self._run(_sync)
+
     async def mark_lead_dialing(self, lead_id: str) -> bool:
         """Transition a lead from leased -> dialing and increment attempt_count."""
         if not self._enabled:
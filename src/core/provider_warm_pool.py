@@ -0,0 +1,232 @@
+"""
+Pre-connected provider sessions for full-agent providers.
+
+Every call used to open its provider websocket only after the channel was
+answered: DNS, TCP/TLS, the websocket upgrade, authentication and (for OpenAI
+Realtime) the ``session.created`` / ``session.update`` round trips all sat in
+front of the greeting.  ``ProviderWarmPool`` keeps up to ``size`` of those
+connections open per provider so a call can lease one that is ready:
+
+* The pool opens connections through the provider's ``open_warm_connection()``
+  on a throwaway instance built by the provider factory, so the base session
+  configuration matches what a call's instance would send before overrides.
+* ``lease()`` never waits: it hands out the oldest open, non-stale connection
+  (oldest first so sockets rotate before they age out) or returns None, in
+  which case the call connects the usual way.
+* Each lease immediately starts a connect for the slot it emptied; a
+  background task also retires connections older than ``max_age_sec`` (or
+  the connection's own, shorter ``max_age_sec`` - providers that drop idle
+  sockets set one below their idle timeout) or closed by the server and tops
+  the pool back up. After a failed connect no new connects start for
+  ``refill_backoff_sec``.
+
+What a warm connection covers is provider specific; see ``WarmConnection``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set
+
+import structlog
+from prometheus_client import Counter, Gauge
+
+from ..providers.base import WarmConnection
+
+logger = structlog.get_logger(__name__)
+
+_WARM_POOL_HITS_TOTAL = Counter(
+    "ai_agent_provider_warm_pool_hits_total",
+    "Provider sessions started on a pre-connected socket",
+    labelnames=("provider",),
+)
+_WARM_POOL_MISSES_TOTAL = Counter(
+    "ai_agent_provider_warm_pool_misses_total",
+    "Provider sessions that found the warm pool empty and connected on demand",
+    labelnames=("provider",),
+)
+_WARM_POOL_SETUP_SAVED_SECONDS_TOTAL = Counter(
+    "ai_agent_provider_warm_pool_setup_saved_seconds_total",
+    "Connection setup time taken off call start by leasing warm sockets",
+    labelnames=("provider",),
+)
+_WARM_POOL_IDLE = Gauge(
+    "ai_agent_provider_warm_pool_idle",
+    "Warm provider connections ready to lease",
+    labelnames=("provider",),
+)
+_WARM_POOL_RETIRED_TOTAL = Counter(
+    "ai_agent_provider_warm_pool_retired_total",
+    "Warm provider connections closed without being leased",
+    labelnames=("provider", "reason"),
+)
+_WARM_POOL_CONNECT_FAILURES_TOTAL = Counter(
+    "ai_agent_provider_warm_pool_connect_failures_total",
+    "Failed attempts to open a warm provider connection",
+    labelnames=("provider",),
+)
+
+
+class ProviderWarmPool:
+    """Keeps up to ``size`` warm connections for one provider."""
+
+    def __init__(
+        self,
+        provider_name: str,
+        connect: Callable[[], Awaitable[WarmConnection]],
+        *,
+        size: int,
+        max_age_sec: float = 240.0,
+        refill_backoff_sec: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.provider_name = provider_name
+        self.size = max(0, int(size))
+        self.max_age_sec = float(max_age_sec)
+        self.refill_backoff_sec = max(0.0, float(refill_backoff_sec))
+        self._connect = connect
+        self._clock = clock
+        self._idle: Deque[WarmConnection] = deque()
+        self._connecting: Set[asyncio.Task] = set()
+        # Loop time before which no new connects start (set after a failed connect)
+        self._backoff_until = 0.0
+        # Set when a connection joins the pool so the maintenance loop re-plans its wait
+        self._added = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+
+    def _max_age(self, conn: WarmConnection) -> float:
+        ages = [a for a in (self.max_age_sec, conn.max_age_sec or 0.0) if a > 0]
+        return min(ages) if ages else 0.0
+
+    def _is_stale(self, conn: WarmConnection) -> bool:
+        max_age = self._max_age(conn)
+        return max_age > 0 and self._clock() - conn.created_at >= max_age
+
+    def _retire(self, conn: WarmConnection, reason: str) -> None:
+        _WARM_POOL_RETIRED_TOTAL.labels(provider=self.provider_name, reason=reason).inc()
+        asyncio.get_running_loop().create_task(conn.close())
+
+    def _publish_idle(self) -> None:
+        _WARM_POOL_IDLE.labels(provider=self.provider_name).set(len(self._idle))
+
+    def lease(self) -> Optional[WarmConnection]:
+        """Take a ready connection, or None when the pool has none (never waits)."""
+        leased: Optional[WarmConnection] = None
+        while self._idle:
+            conn = self._idle.popleft()
+            if not conn.is_open():
+                self._retire(conn, "closed")
+            elif self._is_stale(conn):
+                self._retire(conn, "stale")
+            else:
+                leased = conn
+                break
+        self._publish_idle()
+        if self._task is not None:
+            self._top_up()
+        if leased is None:
+            self.misses += 1
+            _WARM_POOL_MISSES_TOTAL.labels(provider=self.provider_name).inc()
+            return None
+        self.hits += 1
+        _WARM_POOL_HITS_TOTAL.labels(provider=self.provider_name).inc()
+        _WARM_POOL_SETUP_SAVED_SECONDS_TOTAL.labels(provider=self.provider_name).inc(max(0.0, leased.setup_seconds))
+        return leased
+
+    def _prune(self) -> None:
+        kept: Deque[WarmConnection] = deque()
+        for conn in self._idle:
+            if not conn.is_open():
+                self._retire(conn, "closed")
+            elif self._is_stale(conn):
+                self._retire(conn, "stale")
+            else:
+                kept.append(conn)
+        self._idle = kept
+        self._publish_idle()
+
+    def _top_up(self, *, force: bool = False) -> None:
+        """Start one connect per empty slot (each lease is replaced right away, not in batches)."""
+        if self._closed:
+            return
+        # Leases during an outage must not turn into a reconnect per call.
+        if not force and asyncio.get_running_loop().time() < self._backoff_until:
+            return
+        for _ in range(self.size - len(self._idle) - len(self._connecting)):
+            task = asyncio.get_running_loop().create_task(self._open_one())
+            self._connecting.add(task)
+            task.add_done_callback(self._connecting.discard)
+
+    async def _open_one(self) -> None:
+        try:
+            conn = await self._connect()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            _WARM_POOL_CONNECT_FAILURES_TOTAL.labels(provider=self.provider_name).inc()
+            self._backoff_until = asyncio.get_running_loop().time() + self.refill_backoff_sec
+            logger.warning(
+                "Warm provider connection failed",
+                provider=self.provider_name,
+                error=str(exc) or type(exc).__name__,
+                retry_in_sec=self.refill_backoff_sec,
+            )
+            return
+        if self._closed:
+            await conn.close()
+            return
+        self._idle.append(conn)
+        self._publish_idle()
+        self._added.set()
+
+    async def fill(self) -> int:
+        """Prune, then open connections until the pool is full. Returns the number of idle connections."""
+        self._prune()
+        self._top_up(force=True)
+        if self._connecting:
+            await asyncio.gather(*list(self._connecting), return_exceptions=True)
+        return len(self._idle)
+
+    async def _maintain(self) -> None:
+        # Re-check at least a few times per max_age so stale sockets are replaced before a call needs one.
+        interval = min(30.0, self.max_age_sec / 4) if self.max_age_sec > 0 else 30.0
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            self._prune()
+            self._top_up()
+            wait = interval
+            for conn in self._idle:
+                max_age = self._max_age(conn)
+                if max_age > 0:
+                    # Replace sockets with a short provider limit as soon as they age out
+                    wait = min(wait, conn.created_at + max_age - self._clock())
+            if self._backoff_until > loop.time():
+                wait = min(wait, self._backoff_until - loop.time())
+            self._added.clear()
+            try:
+                await asyncio.wait_for(self._added.wait(), max(0.01, wait))
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self.size > 0 and self._task is None:
+            self._task = asyncio.create_task(self._maintain(), name=f"warm-pool-{self.provider_name}")
+
+    async def close(self) -> None:
+        self._closed = True
+        tasks = [t for t in (self._task, *self._connecting) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        idle, self._idle = list(self._idle), deque()
+        await asyncio.gather(*(conn.close() for conn in idle), return_exceptions=True)
+        self._publish_idle()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": self.size, "idle": len(self._idle), "hits": self.hits, "misses": self.misses}
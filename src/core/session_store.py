@@ -3,6 +3,16 @@ SessionStore - Centralized, atomic state management for call sessions.
 
 This replaces the dict soup (active_calls, caller_channels, active_playbacks)
 with a single, thread-safe store that enforces invariants.
+
+Locking model (all callers run on the engine's event loop):
+- Single-key lookups (``get_by_call_id``/``get_by_channel_id``/``get_playback``)
+  take no lock. The indexes are only mutated by code that never awaits between
+  updates, so a reader always sees a consistent mapping.
+- Index membership (``upsert_call``/``remove_call``) is serialized by one store
+  lock; per-call mutations (gating tokens, playback refs) take that call's own
+  lock, so calls never contend with each other.
+- ``handle(call_id)`` returns a ``SessionHandle`` that frame handlers can keep
+  for the life of a connection instead of looking the session up per frame.
 """
 
 import asyncio
@@ -15,6 +25,25 @@ from src.core.models import CallSession, PlaybackRef, ProviderSession
 logger = structlog.get_logger(__name__)
 
 
+class SessionHandle:
+    """Cached reference to a live ``CallSession``.
+
+    The store rebinds ``session`` when the call is upserted with a new object and
+    closes the handle (``session`` becomes None) when the call is removed.
+    """
+
+    __slots__ = ("call_id", "session", "closed")
+
+    def __init__(self, call_id: str, session: Optional[CallSession]):
+        self.call_id = call_id
+        self.session = session
+        self.closed = False
+
+    def _close(self) -> None:
+        self.session = None
+        self.closed = True
+
+
 class SessionStore:
     """
     Thread-safe store for call sessions and playback references.
@@ -33,8 +62,10 @@ class SessionStore:
         self._playbacks: Dict[str, PlaybackRef] = {}
         self._provider_sessions: Dict[str, ProviderSession] = {}
         
-        # Thread safety
+        # Thread safety: store lock for index membership, per-call locks for call state
         self._lock = asyncio.Lock()
+        self._call_locks: Dict[str, asyncio.Lock] = {}
+        self._handles: Dict[str, SessionHandle] = {}
         
         logger.info("SessionStore initialized")
     
@@ -58,6 +89,10 @@ class SessionStore:
             # Store by audiosocket_channel_id if present
             if session.audiosocket_channel_id:
                 self._sessions_by_channel_id[session.audiosocket_channel_id] = session
+
+            handle = self._handles.get(session.call_id)
+            if handle is not None:
+                handle.session = session
             
             logger.debug("Call session upserted",
                         call_id=session.call_id,
@@ -65,14 +100,37 @@ class SessionStore:
                         local_channel_id=session.local_channel_id)
     
     async def get_by_call_id(self, call_id: str) -> Optional[CallSession]:
-        """Get session by canonical call_id."""
-        async with self._lock:
-            return self._sessions_by_call_id.get(call_id)
+        """Get session by canonical call_id (lock-free)."""
+        return self._sessions_by_call_id.get(call_id)
     
     async def get_by_channel_id(self, channel_id: str) -> Optional[CallSession]:
-        """Get session by any channel_id (caller, local, external_media)."""
-        async with self._lock:
-            return self._sessions_by_channel_id.get(channel_id)
+        """Get session by any channel_id (caller, local, external_media) (lock-free)."""
+        return self._sessions_by_channel_id.get(channel_id)
+
+    def handle(self, call_id: str) -> Optional[SessionHandle]:
+        """Get a cached handle for a live call, or None if the call is unknown.
+
+        Hot paths (per-frame audio handlers) hold the handle and read
+        ``handle.session``; once ``handle.closed`` is set the call is gone and a
+        new handle must be requested.
+        """
+        handle = self._handles.get(call_id)
+        if handle is not None:
+            return handle
+        session = self._sessions_by_call_id.get(call_id)
+        if session is None:
+            return None
+        handle = self._handles[call_id] = SessionHandle(call_id, session)
+        return handle
+
+    def _call_lock(self, call_id: str) -> asyncio.Lock:
+        lock = self._call_locks.get(call_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            # Only live calls keep a lock; remove_call drops it.
+            if call_id in self._sessions_by_call_id:
+                self._call_locks[call_id] = lock
+        return lock
     
     async def remove_call(self, call_id: str) -> Optional[CallSession]:
         """Remove a call session and all its channel mappings."""
@@ -89,6 +147,11 @@ class SessionStore:
                 self._sessions_by_channel_id.pop(session.external_media_id, None)
             if session.audiosocket_channel_id:
                 self._sessions_by_channel_id.pop(session.audiosocket_channel_id, None)
+
+            handle = self._handles.pop(call_id, None)
+            if handle is not None:
+                handle._close()
+            self._call_locks.pop(call_id, None)
             
             logger.debug("Call session removed",
                         call_id=call_id,
@@ -98,7 +161,7 @@ class SessionStore:
     
     async def set_gating_token(self, call_id: str, playback_id: str) -> bool:
         """Add a TTS gating token for a call."""
-        async with self._lock:
+        async with self._call_lock(call_id):
             session = self._sessions_by_call_id.get(call_id)
             if not session:
                 logger.warning("Cannot set gating token - call not found", 
@@ -149,7 +212,7 @@ class SessionStore:
     
     async def clear_gating_token(self, call_id: str, playback_id: str) -> bool:
         """Remove a TTS gating token for a call."""
-        async with self._lock:
+        async with self._call_lock(call_id):
             session = self._sessions_by_call_id.get(call_id)
             if not session:
                 logger.warning("Cannot clear gating token - call not found",
@@ -199,7 +262,7 @@ class SessionStore:
     
     async def add_playback(self, playback_ref: PlaybackRef) -> None:
         """Add a playback reference."""
-        async with self._lock:
+        async with self._call_lock(playback_ref.call_id):
             self._playbacks[playback_ref.playback_id] = playback_ref
             logger.debug("Playback reference added",
                         playback_id=playback_ref.playback_id,
@@ -207,7 +270,10 @@ class SessionStore:
     
     async def pop_playback(self, playback_id: str) -> Optional[PlaybackRef]:
         """Remove and return a playback reference."""
-        async with self._lock:
+        current = self._playbacks.get(playback_id)
+        if current is None:
+            return None
+        async with self._call_lock(current.call_id):
             playback_ref = self._playbacks.pop(playback_id, None)
             if playback_ref:
                 logger.debug("Playback reference removed",
@@ -216,9 +282,8 @@ class SessionStore:
             return playback_ref
     
     async def get_playback(self, playback_id: str) -> Optional[PlaybackRef]:
-        """Get a playback reference without removing it."""
-        async with self._lock:
-            return self._playbacks.get(playback_id)
+        """Get a playback reference without removing it (lock-free)."""
+        return self._playbacks.get(playback_id)
 
     async def list_playbacks_for_call(self, call_id: str) -> List[str]:
         """List playback IDs associated with a given call_id."""
@@ -260,6 +325,7 @@ class SessionStore:
                     "context": session.context_name,
                     "status": session.status,
                     "conversation_state": session.conversation_state,
+                    "audio_health": session.audio_health.summary() if session.audio_health else {},
                 })
             
             return {
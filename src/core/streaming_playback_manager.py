@@ -8,9 +8,9 @@ It includes automatic fallback to file playback on errors or timeouts.
 
 import asyncio
 import time
-import audioop
 import array
 from contextlib import suppress
+from functools import partial
 from typing import Optional, Dict, Any, TYPE_CHECKING, Set, Callable, Awaitable, Tuple
 import structlog
 from prometheus_client import Counter, Gauge, Histogram
@@ -18,6 +18,9 @@ import math
 import os
 import wave
 
+from src.audio import pcm_ops
+from src.audio.dsp_chain import PlaybackDSPChain
+from src.audio.frame_ring import FrameRingBuffer
 from src.audio.resampler import (
     mulaw_to_pcm16le,
     pcm16le_to_mulaw,
@@ -25,6 +28,7 @@ from src.audio.resampler import (
 )
 from src.core.session_store import SessionStore
 from src.core.models import CallSession, PlaybackRef
+from .frame_clock import FrameClock
 from .adaptive_streaming import (
     StreamCharacterizer,
     AdaptiveBufferController,
@@ -38,7 +42,8 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 
 logger = structlog.get_logger(__name__)
 
-_JITTER_SENTINEL = object()
+# Worst-case egress byte rate (PCM16 @ 16 kHz) used to preallocate frame rings.
+_RING_BYTES_PER_MS = 32
 
 # Prometheus metrics for streaming playback (module-scope, registered once)
 _STREAMING_ACTIVE_GAUGE = Gauge(
@@ -140,7 +145,7 @@ class StreamingPlaybackManager:
         audio_transport: str = "externalmedia",
         rtp_server: Optional[Any] = None,
         audiosocket_server: Optional[Any] = None,
-        audio_diag_callback: Optional[Callable[[str, str, bytes, str, int], Awaitable[None]]] = None,
+        audio_diag_callback: Optional[Callable[[str, str, bytes, str, int], None]] = None,
         audio_capture_manager: Optional[Any] = None,
     ):
         self.session_store = session_store
@@ -162,15 +167,20 @@ class StreamingPlaybackManager:
             swap_mode_cfg = 'disabled'
         self.egress_swap_mode: str = swap_mode_cfg
         self.egress_force_mulaw: bool = bool(self.streaming_config.get('egress_force_mulaw', False))
-        # Output conditioning: limiter and attack envelope
+        # Output conditioning: limiter, DC-block and attack envelope (applied by PlaybackDSPChain).
+        # Limiter and DC-block were no-op stubs until the chain existed, so both default off.
         try:
-            self.limiter_enabled: bool = bool(self.streaming_config.get('limiter_enabled', True))
+            self.limiter_enabled: bool = bool(self.streaming_config.get('limiter_enabled', False))
         except Exception:
-            self.limiter_enabled = True
+            self.limiter_enabled = False
         try:
             self.limiter_headroom_ratio: float = float(self.streaming_config.get('limiter_headroom_ratio', 0.65))
         except Exception:
             self.limiter_headroom_ratio = 0.65
+        try:
+            self.dc_block_enabled: bool = bool(self.streaming_config.get('dc_block_enabled', False))
+        except Exception:
+            self.dc_block_enabled = False
         try:
             # Explicitly handle 0 value (don't treat as falsy)
             attack_val = self.streaming_config.get('attack_ms')
@@ -180,15 +190,15 @@ class StreamingPlaybackManager:
         
         # Streaming state
         self.active_streams: Dict[str, Dict[str, Any]] = {}  # call_id -> stream_info
-        self.jitter_buffers: Dict[str, asyncio.Queue] = {}  # call_id -> audio_queue
-        self.keepalive_tasks: Dict[str, asyncio.Task] = {}  # call_id -> keepalive_task
+        self.jitter_buffers: Dict[str, FrameRingBuffer] = {}  # call_id -> egress frame ring
+        self.keepalive_tasks: Dict[str, asyncio.Future] = {}  # call_id -> keepalive frame-clock entry
         self._cleanup_in_progress: Set[str] = set()
-        # Per-call remainder buffer for precise frame sizing
-        self.frame_remainders: Dict[str, bytes] = {}
+        # Fallbacks and session upserts started from frame-clock ticks
+        self._side_tasks: Set[asyncio.Task] = set()
         # Per-call resampler state (used when converting between rates)
         self._resample_states: Dict[str, Optional[tuple]] = {}
-        # Per-call DC-block filter state: last_x, last_y
-        self._dc_block_state: Dict[str, Tuple[float, float]] = {}
+        # Per-call egress conditioning chains (call_id -> path kind -> chain); filter and envelope state live here
+        self._dsp_chains: Dict[str, Dict[str, PlaybackDSPChain]] = {}
         # First outbound frame logged tracker
         self._first_send_logged: Set[str] = set()
         # RTP codec cache for performance (avoid repeated codec checks on every packet)
@@ -210,6 +220,8 @@ class StreamingPlaybackManager:
         self.fallback_timeout_ms = self.streaming_config.get('fallback_timeout_ms', 4000)
         self.chunk_size_ms = self._resolve_chunk_size_ms(self.streaming_config.get('chunk_size_ms'))
         self.idle_cutoff_ms = self._resolve_idle_cutoff_ms(self.streaming_config.get('idle_cutoff_ms'))
+        # One clock paces every stream's frames (and keepalives) in a single pass per tick.
+        self.frame_clock = FrameClock(tick_ms=max(20, int(self.chunk_size_ms)))
         # Continuous streaming across provider segments
         try:
             self.continuous_stream: bool = bool(self.streaming_config.get('continuous_stream', True))
@@ -360,6 +372,7 @@ class StreamingPlaybackManager:
             logger.debug("Call tap buffer init failed", call_id=call_id, exc_info=True)
 
     def _append_call_taps(self, call_id: str, pre: Optional[bytes], post: Optional[bytes], sample_rate: int) -> None:
+        """Accumulate call-level taps; ``pre``/``post`` may be memoryviews (copied once, here)."""
         if not getattr(self, "diag_enable_taps", False):
             return
         try:
@@ -493,7 +506,12 @@ class StreamingPlaybackManager:
                 jb_chunks = max(1, int(math.ceil(jb_ms / chunk_ms)))
             except Exception:
                 jb_chunks = 10
-            jitter_buffer = asyncio.Queue(maxsize=jb_chunks)
+            # Preallocate the stream's frame ring for at least jb_chunks frames (and
+            # 1 s) of worst-case egress audio; a larger provider burst grows it.
+            jitter_buffer = FrameRingBuffer(
+                capacity=max(1000, jb_chunks * int(self.chunk_size_ms)) * _RING_BYTES_PER_MS,
+                frame_size=self._frame_size_bytes(),
+            )
             self.jitter_buffers[call_id] = jitter_buffer
             
             # 🧠 Initialize adaptive streaming components
@@ -601,18 +619,18 @@ class StreamingPlaybackManager:
                            stream_id=stream_id)
                 return None
             
-            # Start streaming task
-            streaming_task = asyncio.create_task(
-                self._stream_audio_loop(call_id, stream_id, audio_chunks, jitter_buffer)
-            )
-            
-            # Start pacer (consumer) task to drain jitter buffer independently of producer
-            pacer_task = asyncio.create_task(
-                self._pacer_loop(call_id, stream_id, jitter_buffer)
+            # Register the pacer (consumer) with the frame clock to drain the jitter
+            # buffer independently of the producer; the returned future stands in
+            # for a task (cancel / await / wait_for).
+            pacer_task = self.frame_clock.register(
+                partial(self._pacer_tick, call_id, stream_id, jitter_buffer),
+                name=f"pacer:{call_id}",
             )
-            # Start keepalive task
-            keepalive_task = asyncio.create_task(
-                self._keepalive_loop(call_id, stream_id)
+            # Keepalive rides the same clock at its own (much slower) period
+            keepalive_task = self.frame_clock.register(
+                partial(self._keepalive_tick, call_id, stream_id),
+                every=self._keepalive_every_ticks(),
+                name=f"keepalive:{call_id}",
             )
             self.keepalive_tasks[call_id] = keepalive_task
             
@@ -690,6 +708,8 @@ class StreamingPlaybackManager:
                 )
 
             self._resample_states[call_id] = None
+            # Fresh conditioning state (filter history, attack envelope) per stream
+            self._dsp_chains.pop(call_id, None)
             # Store stream info
             try:
                 idle_cutoff_ticks = max(1, int(math.ceil(self.idle_cutoff_ms / max(1, self.chunk_size_ms))))
@@ -703,7 +723,7 @@ class StreamingPlaybackManager:
             self.active_streams[call_id] = {
                 'stream_id': stream_id,
                 'playback_type': playback_type,
-                'streaming_task': streaming_task,
+                'streaming_task': None,
                 'pacer_task': pacer_task,
                 'keepalive_task': keepalive_task,
                 'start_time': time.time(),
@@ -743,6 +763,12 @@ class StreamingPlaybackManager:
                 'last_emit_was_filler': False,
             }
             self._startup_ready[call_id] = bool(initial_startup_ready)
+            jitter_buffer.frame_size = self._frame_size_bytes(call_id)
+            # Start the producer only now: it converts chunks to the egress format
+            # as it buffers them, which needs the target format registered above.
+            self.active_streams[call_id]['streaming_task'] = asyncio.create_task(
+                self._stream_audio_loop(call_id, stream_id, audio_chunks, jitter_buffer)
+            )
             try:
                 _STREAM_STARTED_TOTAL.labels(playback_type).inc()
             except Exception:
@@ -808,9 +834,9 @@ class StreamingPlaybackManager:
         call_id: str, 
         stream_id: str, 
         audio_chunks: asyncio.Queue,
-        jitter_buffer: asyncio.Queue
+        jitter_buffer: FrameRingBuffer
     ) -> None:
-        """Main streaming loop that processes audio chunks."""
+        """Main streaming loop: convert provider chunks to egress audio and buffer them for the pacer."""
         sentinel_sent = False
         try:
             fallback_timeout = self.fallback_timeout_ms / 1000.0
@@ -828,11 +854,8 @@ class StreamingPlaybackManager:
                                 self.active_streams[call_id]['end_reason'] = 'end-of-stream'
                         except Exception:
                             pass
-                        try:
-                            await jitter_buffer.put(_JITTER_SENTINEL)
-                            sentinel_sent = True
-                        except Exception:
-                            pass
+                        jitter_buffer.mark_eos()
+                        sentinel_sent = True
                         break
 
                     # Update timing and metrics
@@ -841,7 +864,7 @@ class StreamingPlaybackManager:
                         _STREAMING_BYTES_TOTAL.inc(len(chunk))
                         info = self.active_streams.get(call_id)
                         if info is not None:
-                            info["jitter_depth"] = jitter_buffer.qsize()
+                            info["jitter_depth"] = jitter_buffer.frames(self._frame_size_bytes(call_id))
                             info["last_chunk_age_s"] = 0.0
                         self._refresh_streaming_summary_metrics()
                         # Track per-call queued total as well as segment-local queued_bytes
@@ -850,13 +873,17 @@ class StreamingPlaybackManager:
                         sess = await self.session_store.get_by_call_id(call_id)
                         if sess:
                             sess.streaming_bytes_sent += len(chunk)
-                            sess.streaming_jitter_buffer_depth = jitter_buffer.qsize()
+                            sess.streaming_jitter_buffer_depth = jitter_buffer.frames(self._frame_size_bytes(call_id))
                             await self.session_store.upsert_call(sess)
                     except Exception:
                         logger.debug("Streaming metrics update failed", call_id=call_id)
 
-                    # Enqueue provider chunk for downstream processing
-                    await jitter_buffer.put(chunk)
+                    # Convert once to the egress format and copy into the frame ring;
+                    # the pacer reads frames straight out of it.
+                    processed_chunk = await self._process_audio_chunk(call_id, chunk)
+                    if processed_chunk:
+                        await jitter_buffer.wait_for_space(len(processed_chunk))
+                        jitter_buffer.write(processed_chunk)
                     
                     # 🧠 ADAPTIVE STREAMING: Characterize stream pattern during first 500ms
                     if call_id in self.stream_characterizers:
@@ -889,33 +916,9 @@ class StreamingPlaybackManager:
                                             optimal_buffer_ms=pattern.optimal_buffer_ms
                                         )
 
-                    # Normalize buffered_bytes accounting to target (egress) bytes so warm-up gating matches wire frame size
                     try:
-                        if call_id in self.active_streams:
-                            info = self.active_streams[call_id]
-                            src_enc = self._canonicalize_encoding(info.get('source_encoding')) or "slin16"
-                            try:
-                                src_rate = int(info.get('source_sample_rate') or 0) or int(self.sample_rate)
-                            except Exception:
-                                src_rate = int(self.sample_rate)
-                            tgt_fmt = self._canonicalize_encoding(info.get('target_format')) or self._canonicalize_encoding(self.audiosocket_format) or "ulaw"
-                            try:
-                                tgt_rate = int(info.get('target_sample_rate') or 0) or int(self.sample_rate)
-                            except Exception:
-                                tgt_rate = int(self.sample_rate)
-                            if tgt_rate <= 0:
-                                tgt_rate = self._default_sample_rate_for_format(
-                                    tgt_fmt,
-                                    int(self.sample_rate),
-                                )
-                            src_bps = 1 if self._is_mulaw(src_enc) else 2
-                            tgt_bps = 1 if self._is_mulaw(tgt_fmt) else 2
-                            try:
-                                ratio = (tgt_bps / float(max(1, src_bps))) * (float(tgt_rate) / float(max(1, src_rate)))
-                                egress_bytes = int(max(1, round(len(chunk) * max(0.5, ratio))))
-                            except Exception:
-                                egress_bytes = len(chunk)
-                            info['buffered_bytes'] = int(info.get('buffered_bytes', 0)) + egress_bytes
+                        info = self.active_streams.get(call_id)
+                        if info is not None:
                             info['queued_bytes'] = int(info.get('queued_bytes', 0)) + len(chunk)
                     except Exception:
                         pass
@@ -927,12 +930,8 @@ class StreamingPlaybackManager:
                             logger.warning("🎵 STREAMING PLAYBACK - Timeout, falling back to file playback", call_id=call_id, stream_id=stream_id, timeout=fallback_timeout)
                             await self._record_fallback(call_id, f"timeout>{fallback_timeout}s")
                             await self._fallback_to_file_playback(call_id, stream_id)
-                            if not sentinel_sent:
-                                try:
-                                    await jitter_buffer.put(_JITTER_SENTINEL)
-                                    sentinel_sent = True
-                                except Exception:
-                                    pass
+                            jitter_buffer.mark_eos()
+                            sentinel_sent = True
                             break
                         continue
                     # Continuous stream: stay alive, pacer will inject fillers as needed
@@ -946,8 +945,7 @@ class StreamingPlaybackManager:
                     continue
         finally:
             if not sentinel_sent:
-                with suppress(asyncio.CancelledError, Exception):
-                    await jitter_buffer.put(_JITTER_SENTINEL)
+                jitter_buffer.mark_eos()
                 sentinel_sent = True
             pacer_task: Optional[asyncio.Task] = None
             stream_info = self.active_streams.get(call_id)
@@ -956,7 +954,7 @@ class StreamingPlaybackManager:
                 pacer_task = stream_info.get('pacer_task')
             if pacer_task and not pacer_task.done():
                 try:
-                    frames_remaining = self._estimate_available_frames(call_id, jitter_buffer, include_remainder=True)
+                    frames_remaining = jitter_buffer.frames(self._frame_size_bytes(call_id))
                 except Exception:
                     frames_remaining = 0
                 chunk_sec = max(0.02, self.chunk_size_ms / 1000.0)
@@ -981,67 +979,49 @@ class StreamingPlaybackManager:
                     await keepalive_task
             await self._cleanup_stream(call_id, stream_id)
 
-    async def _pacer_loop(
+    def _pacer_tick(
         self,
         call_id: str,
         stream_id: str,
-        jitter_buffer: asyncio.Queue,
-    ) -> None:
-        """Drain jitter buffer at steady cadence so producer and consumer are independent."""
-        tick_seconds = max(0.02, self.chunk_size_ms / 1000.0)
-        next_tick = time.perf_counter()
-        try:
-            while True:
-                now = time.perf_counter()
-                sleep_for = next_tick - now
-                if sleep_for > 0:
-                    try:
-                        await asyncio.sleep(sleep_for)
-                    except asyncio.CancelledError:
-                        raise
-                else:
-                    next_tick = now
-                if call_id not in self.active_streams:
-                    break
-                status = await self._drain_next_frame(
-                    call_id, stream_id, jitter_buffer
-                )
-                if status == "error":
-                    try:
-                        await self._record_fallback(call_id, "transport-failure")
-                        await self._fallback_to_file_playback(call_id, stream_id)
-                        if call_id in self.active_streams:
-                            self.active_streams[call_id]['end_reason'] = 'transport-failure'
-                    except Exception:
-                        pass
-                    break
-                self._update_idle_tracking(call_id, status)
-                if self._should_stop_for_idle(call_id, stream_id, jitter_buffer):
-                    break
-                if status == "finished":
-                    break
-                next_tick += tick_seconds
-                now_after = time.perf_counter()
-                if next_tick < now_after:
-                    next_tick = now_after
-        except asyncio.CancelledError:
-            logger.debug("Pacer loop cancelled", call_id=call_id, stream_id=stream_id)
-        except Exception as e:
-            logger.error("Error in pacer loop", call_id=call_id, stream_id=stream_id, error=str(e), exc_info=True)
+        jitter_buffer: FrameRingBuffer,
+    ) -> bool:
+        """Drain one frame per frame-clock tick so producer and consumer are independent.
+
+        Returns False once pacing for this stream should stop.
+        """
+        if call_id not in self.active_streams:
+            return False
+        status = self._drain_next_frame(
+            call_id, stream_id, jitter_buffer
+        )
+        if status == "error":
+            try:
+                self._schedule_fallback(call_id, stream_id, "transport-failure")
+                if call_id in self.active_streams:
+                    self.active_streams[call_id]['end_reason'] = 'transport-failure'
+            except Exception:
+                pass
+            return False
+        self._update_idle_tracking(call_id, status)
+        if self._should_stop_for_idle(call_id, stream_id, jitter_buffer):
+            return False
+        return status != "finished"
     
-    async def _drain_next_frame(
+    def _drain_next_frame(
         self,
         call_id: str,
         stream_id: str,
-        jitter_buffer: asyncio.Queue,
+        jitter_buffer: FrameRingBuffer,
     ) -> str:
         """Send one 20ms frame (or filler) per tick."""
         stream_info = self.active_streams.get(call_id)
         if not stream_info:
             return "finished"
 
+        frame_size = self._frame_size_bytes(call_id)
+        available_frames = jitter_buffer.frames(frame_size)
         try:
-            stream_info["jitter_depth"] = jitter_buffer.qsize()
+            stream_info["jitter_depth"] = available_frames
             self._refresh_streaming_summary_metrics()
         except Exception:
             pass
@@ -1061,30 +1041,9 @@ class StreamingPlaybackManager:
         if target_rate <= 0:
             target_rate = self._default_sample_rate_for_format(target_fmt, int(self.sample_rate))
 
-        frame_size = self._frame_size_bytes(call_id)
-        sentinel_seen = bool(stream_info.get('sentinel_seen', False))
-        pending = self.frame_remainders.get(call_id, b"")
-
-        while len(pending) < frame_size:
-            try:
-                chunk = jitter_buffer.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-            if chunk is _JITTER_SENTINEL:
-                sentinel_seen = True
-                stream_info['sentinel_seen'] = True
-                continue
-            processed_chunk = await self._process_audio_chunk(call_id, chunk)
-            if not processed_chunk:
-                try:
-                    self._decrement_buffered_bytes(call_id, len(chunk))
-                except Exception:
-                    pass
-                continue
-            pending += processed_chunk
-
-        self.frame_remainders[call_id] = pending
-        available_frames = self._estimate_available_frames(call_id, jitter_buffer, include_remainder=True)
+        sentinel_seen = jitter_buffer.eos
+        if sentinel_seen:
+            stream_info['sentinel_seen'] = True
         try:
             info = self.active_streams.get(call_id, {})
             current_max = int(info.get('buffer_depth_max_frames', 0) or 0)
@@ -1099,39 +1058,35 @@ class StreamingPlaybackManager:
         if self._should_wait_for_low_water(call_id, stream_info, available_frames, sentinel_seen):
             return "wait"
 
-        if len(pending) >= frame_size:
-            frame = pending[:frame_size]
-            self.frame_remainders[call_id] = pending[frame_size:]
-            return await self._emit_frame(
+        if available_frames:
+            # Zero-copy read: the frame is a view into the ring, consumed once sent.
+            return self._emit_frame(
                 call_id,
                 stream_id,
-                frame,
+                jitter_buffer.peek_frame(frame_size),
                 target_fmt,
                 target_rate,
                 filler=False,
+                consume=frame_size,
             )
 
+        pending_len = jitter_buffer.readable
         if sentinel_seen:
-            if pending:
+            if pending_len:
                 filler_byte = b"\xFF" if self._is_mulaw(target_fmt) else b"\x00"
-                padded = pending + (filler_byte * max(0, frame_size - len(pending)))
-                self.frame_remainders[call_id] = b""
-                return await self._emit_frame(
+                padded = bytes(jitter_buffer.peek_frame(pending_len)) + (filler_byte * (frame_size - pending_len))
+                return self._emit_frame(
                     call_id,
                     stream_id,
-                    padded[:frame_size],
+                    padded,
                     target_fmt,
                     target_rate,
                     filler=False,
+                    consume=pending_len,
                 )
-            if jitter_buffer.empty():
-                return "finished"
-
-        if (
-            stream_info.get('startup_ready')
-            and not sentinel_seen
-            and jitter_buffer.empty()
-        ):
+            return "finished"
+
+        if stream_info.get('startup_ready'):
             # Adaptive low-buffer backoff: occasionally wait instead of emitting filler
             try:
                 backoff = int(stream_info.get('empty_backoff_ticks', 0) or 0)
@@ -1156,41 +1111,27 @@ class StreamingPlaybackManager:
             except Exception:
                 pass
             filler_byte = b"\xFF" if self._is_mulaw(target_fmt) else b"\x00"
-            if pending:
-                pending_len = len(pending)
-                frame = pending + (filler_byte * max(0, frame_size - pending_len))
-                self.frame_remainders[call_id] = b""
-                try:
-                    if pending_len:
-                        self._decrement_buffered_bytes(call_id, pending_len)
-                except Exception:
-                    pass
+            if pending_len:
+                frame = bytes(jitter_buffer.peek_frame(pending_len)) + (filler_byte * (frame_size - pending_len))
+                jitter_buffer.consume(pending_len)
             else:
                 frame = filler_byte * frame_size
-            return await self._emit_frame(
+            return self._emit_frame(
                 call_id,
                 stream_id,
-                frame[:frame_size],
+                frame,
                 target_fmt,
                 target_rate,
                 filler=True,
             )
 
-        try:
-            info = self.active_streams.get(call_id)
-            if info is not None:
-                info["jitter_depth"] = jitter_buffer.qsize()
-            self._refresh_streaming_summary_metrics()
-        except Exception:
-            pass
-
         return "wait"
 
     def _ensure_startup_ready(
         self,
         call_id: str,
         stream_id: str,
-        jitter_buffer: asyncio.Queue,
+        jitter_buffer: FrameRingBuffer,
         stream_info: Dict[str, Any],
     ) -> bool:
         if self._startup_ready.get(call_id, False):
@@ -1208,7 +1149,7 @@ class StreamingPlaybackManager:
                     call_id=call_id,
                     stream_id=stream_id,
                     segment_num=stream_info.get('segments_played', 0),
-                    jitter_depth=jitter_buffer.qsize(),
+                    jitter_depth=jitter_buffer.frames(self._frame_size_bytes(call_id)),
                 )
             except Exception:
                 pass
@@ -1219,8 +1160,9 @@ class StreamingPlaybackManager:
             min_need = int(stream_info.get('min_start_chunks', self.min_start_chunks))
         except Exception:
             min_need = self.min_start_chunks
-        available_frames = self._estimate_available_frames(call_id, jitter_buffer, include_remainder=True)
-        if available_frames < min_need:
+        available_frames = jitter_buffer.frames(self._frame_size_bytes(call_id))
+        # A producer that already finished will not add more; play what there is.
+        if available_frames < min_need and not jitter_buffer.eos:
             return False
         self._startup_ready[call_id] = True
         stream_info['startup_ready'] = True
@@ -1229,7 +1171,7 @@ class StreamingPlaybackManager:
                 "Streaming jitter buffer warm-up complete",
                 call_id=call_id,
                 stream_id=stream_id,
-                buffered_chunks=jitter_buffer.qsize(),
+                buffered_frames=available_frames,
             )
         except Exception:
             pass
@@ -1291,7 +1233,7 @@ class StreamingPlaybackManager:
         stream_info.pop('low_water_deadline', None)
         return False
 
-    async def _emit_frame(
+    def _emit_frame(
         self,
         call_id: str,
         stream_id: str,
@@ -1300,8 +1242,14 @@ class StreamingPlaybackManager:
         target_rate: int,
         *,
         filler: bool,
+        consume: int = 0,
     ) -> str:
-        success = await self._send_audio_chunk(
+        """Send one frame; on success drop ``consume`` bytes from the stream's frame ring.
+
+        ``frame`` may be a view into the ring, so nothing is consumed when the send
+        fails: the audio stays buffered, in order, for the retry or file fallback.
+        """
+        success = self._send_audio_chunk(
             call_id,
             stream_id,
             frame,
@@ -1309,17 +1257,6 @@ class StreamingPlaybackManager:
             target_rate=target_rate,
         )
         if not success:
-            # Preserve audio for retry/fallback. Without this, a failed first outbound send can
-            # drain the jitter buffer and leave nothing for file playback fallback.
-            try:
-                rem = self.frame_remainders.get(call_id, b"") or b""
-                # FIX: Append frame to end (chronological order), not prepend
-                # Previously: frame + rem (wrong - newest first)
-                # Now: rem + frame (correct - oldest first)
-                self.frame_remainders[call_id] = rem + frame
-            except Exception:
-                pass
-
             # ExternalMedia greeting can fail before we learn the remote RTP endpoint (Asterisk may
             # not emit RTP until the caller speaks). Wait for greeting to complete, then fall back.
             try:
@@ -1358,8 +1295,11 @@ class StreamingPlaybackManager:
             except Exception:
                 logger.debug("Greeting fallback check failed", call_id=call_id, exc_info=True)
             return "error"
+        if consume:
+            ring = self.jitter_buffers.get(call_id)
+            if ring is not None:
+                ring.consume(consume)
         if not filler:
-            self._decrement_buffered_bytes(call_id, len(frame))
             # Reset low-buffer backoff when sending real audio
             try:
                 info = self.active_streams.get(call_id)
@@ -1505,38 +1445,11 @@ class StreamingPlaybackManager:
                     back_pcm = b""
 
                 working_pcm = back_pcm
-                
-                # Trim leading silence before normalization
+                # Leading-silence trim, normalizer and limiter in one pass
                 if working_pcm:
-                    original_size = len(working_pcm)
-                    working_pcm = self._trim_leading_silence(working_pcm, threshold_rms=100)
-                    if len(working_pcm) < original_size:
-                        logger.debug("SILENCE TRIMMING APPLIED",
-                                    call_id=call_id,
-                                    original_bytes=original_size,
-                                    trimmed_bytes=len(working_pcm),
-                                    removed_bytes=original_size - len(working_pcm))
-                
-                try:
-                    logger.debug(
-                        "NORMALIZER CONDITION CHECK (ulaw guarded)",
-                        call_id=call_id,
-                        working_pcm_size=(len(working_pcm) if working_pcm else 0),
-                        normalizer_enabled=bool(self.normalizer_enabled),
-                        target_rms=int(self.normalizer_target_rms),
-                    )
-                    if working_pcm and self.normalizer_enabled and self.normalizer_target_rms > 0:
-                        logger.debug("ENTERING NORMALIZER (ulaw guarded)", call_id=call_id)
-                        working_pcm = self._apply_normalizer(working_pcm, self.normalizer_target_rms, self.normalizer_max_gain_db)
-                    elif not working_pcm:
-                        logger.warning("EMPTY PCM AFTER DECODE - NORMALIZER SKIPPED", call_id=call_id)
-                except Exception:
-                    logger.debug("Normalizer failed in μ-law guarded path", call_id=call_id, exc_info=True)
-                try:
-                    if working_pcm and self.limiter_enabled:
-                        working_pcm = self._apply_soft_limiter(working_pcm, self.limiter_headroom_ratio)
-                except Exception:
-                    pass
+                    working_pcm = self._run_dsp_chain(call_id, "ulaw-guarded", working_pcm, src_rate)
+                else:
+                    logger.warning("EMPTY PCM AFTER DECODE - NORMALIZER SKIPPED", call_id=call_id)
                 try:
                     ulaw_bytes = pcm16le_to_mulaw(working_pcm) if working_pcm else chunk
                 except Exception:
@@ -1576,7 +1489,7 @@ class StreamingPlaybackManager:
                             pre_buf = info['tap_pre_pcm16']
                             if len(pre_buf) < pre_lim:
                                 need = pre_lim - len(pre_buf)
-                                pre_buf.extend(working_pcm[:need])
+                                pre_buf.extend(memoryview(working_pcm)[:need])
                         try:
                             post_lim = max(0, int(self.diag_post_secs * rate * 2))
                         except Exception:
@@ -1585,7 +1498,7 @@ class StreamingPlaybackManager:
                             post_buf = info['tap_post_pcm16']
                             if len(post_buf) < post_lim:
                                 need2 = post_lim - len(post_buf)
-                                post_buf.extend(working_pcm[:need2])
+                                post_buf.extend(memoryview(working_pcm)[:need2])
                         # Maintain post window in guarded path
                         try:
                             win_rate = int(rate)
@@ -1599,7 +1512,7 @@ class StreamingPlaybackManager:
                             post_w = info['tap_first_window_post']
                             if len(post_w) < win_bytes:
                                 needw2 = win_bytes - len(post_w)
-                                post_w.extend(working_pcm[:needw2])
+                                post_w.extend(memoryview(working_pcm)[:needw2])
                             if not info.get('tap_first_window_done') and len(post_w) >= win_bytes:
                                 sid = str(info.get('stream_id', 'seg'))
                                 try:
@@ -1644,25 +1557,8 @@ class StreamingPlaybackManager:
                 try:
                     pcm16_bytes = mulaw_to_pcm16le(chunk)
                     # Deterministic normalization on fast-path when enabled
-                    try:
-                        if self.normalizer_enabled and self.normalizer_target_rms > 0 and pcm16_bytes:
-                            pcm16_bytes = self._apply_normalizer(pcm16_bytes, self.normalizer_target_rms, self.normalizer_max_gain_db)
-                            try:
-                                info = self.active_streams.get(call_id, {}) if call_id in self.active_streams else {}
-                                if not info.get('normalizer_applied_fastpath_logged'):
-                                    logger.info(
-                                        "Normalizer applied (mulaw→pcm fast path)",
-                                        call_id=call_id,
-                                        target_rms=int(self.normalizer_target_rms),
-                                        max_gain_db=float(self.normalizer_max_gain_db),
-                                    )
-                                    info['normalizer_applied_fastpath_logged'] = True
-                                    if call_id in self.active_streams:
-                                        self.active_streams[call_id] = info
-                            except Exception:
-                                pass
-                    except Exception:
-                        logger.debug("Normalizer failed in mulaw→pcm fast path", call_id=call_id, exc_info=True)
+                    if pcm16_bytes:
+                        pcm16_bytes = self._run_dsp_chain(call_id, "ulaw-to-pcm", pcm16_bytes, src_rate)
                     # Accumulate diagnostics taps and snapshots in fast path
                     try:
                         if getattr(self, 'diag_enable_taps', False) and call_id in self.active_streams and pcm16_bytes:
@@ -1680,7 +1576,7 @@ class StreamingPlaybackManager:
                                 pre_buf = info['tap_pre_pcm16']
                                 if len(pre_buf) < pre_lim:
                                     need = pre_lim - len(pre_buf)
-                                    pre_buf.extend(pcm16_bytes[:need])
+                                    pre_buf.extend(memoryview(pcm16_bytes)[:need])
                             try:
                                 post_lim = max(0, int(self.diag_post_secs * rate * 2))
                             except Exception:
@@ -1689,7 +1585,7 @@ class StreamingPlaybackManager:
                                 post_buf = info['tap_post_pcm16']
                                 if len(post_buf) < post_lim:
                                     need2 = post_lim - len(post_buf)
-                                    post_buf.extend(pcm16_bytes[:need2])
+                                    post_buf.extend(memoryview(pcm16_bytes)[:need2])
                             # Call-level accumulation
                             self._append_call_taps(call_id, pcm16_bytes, pcm16_bytes, int(rate))
                             # First-window (200ms) snapshots
@@ -1706,12 +1602,12 @@ class StreamingPlaybackManager:
                                     pre_w = info['tap_first_window_pre']
                                     if len(pre_w) < win_bytes:
                                         needw = win_bytes - len(pre_w)
-                                        pre_w.extend(pcm16_bytes[:needw])
+                                        pre_w.extend(memoryview(pcm16_bytes)[:needw])
                                 if isinstance(info.get('tap_first_window_post'), bytearray):
                                     post_w = info['tap_first_window_post']
                                     if len(post_w) < win_bytes:
                                         needw2 = win_bytes - len(post_w)
-                                        post_w.extend(pcm16_bytes[:needw2])
+                                        post_w.extend(memoryview(pcm16_bytes)[:needw2])
                                 if not info.get('tap_first_window_done'):
                                     pre_w = info.get('tap_first_window_pre') or bytearray()
                                     post_w = info.get('tap_first_window_post') or bytearray()
@@ -1781,20 +1677,18 @@ class StreamingPlaybackManager:
                     threshold=256,
                     stage="stream-pipeline",
                 )
-                working = self._apply_dc_block(call_id, working)
                 src_encoding = "pcm16"
             else:
                 # Source is PCM16. Probe endianness once and auto-correct to little-endian for downstream ops.
                 src_encoding = "pcm16"
                 try:
                     if not stream_info.get('src_endian_probe_done', False):
-                        import audioop
-                        rms_native = audioop.rms(working, 2)
-                        avg_native = audioop.avg(working, 2)
+                        rms_native = pcm_ops.rms(working)
+                        avg_native = pcm_ops.avg(working)
                         try:
-                            swapped = audioop.byteswap(working, 2)
-                            rms_swapped = audioop.rms(swapped, 2)
-                            avg_swapped = audioop.avg(swapped, 2)
+                            swapped = pcm_ops.byteswap(working)
+                            rms_swapped = pcm_ops.rms(swapped)
+                            avg_swapped = pcm_ops.avg(swapped)
                         except Exception:
                             swapped = None
                             rms_swapped = 0
@@ -1829,8 +1723,7 @@ class StreamingPlaybackManager:
                     else:
                         if stream_info.get('src_endian_swapped', False):
                             try:
-                                import audioop
-                                working = audioop.byteswap(working, 2)
+                                working = pcm_ops.byteswap(working)
                             except Exception:
                                 pass
                 except Exception:
@@ -1839,11 +1732,10 @@ class StreamingPlaybackManager:
 
                 # Remove significant DC offset before further processing
                 try:
-                    import audioop
-                    dc = audioop.avg(working, 2)
+                    dc = pcm_ops.avg(working)
                     if abs(dc) >= 1024:
                         try:
-                            working = audioop.bias(working, 2, -int(dc))
+                            working = pcm_ops.bias(working, -int(dc))
                             if not stream_info.get('src_dc_correction_logged', False):
                                 logger.info(
                                     "Streaming source PCM16 DC correction applied",
@@ -1855,7 +1747,6 @@ class StreamingPlaybackManager:
                             pass
                 except Exception:
                     pass
-                working = self._apply_dc_block(call_id, working)
 
             # Resample to target rate when necessary
             if src_rate != target_rate:
@@ -1867,88 +1758,18 @@ class StreamingPlaybackManager:
                 )
             else:
                 resample_state = None
-            # Post-resample DC offset correction (secondary clamp)
-            try:
-                import audioop
-                dc2 = audioop.avg(working, 2)
-                # Use a lower threshold post-resample to clamp small residual bias
-                if abs(dc2) >= 256:
-                    working = audioop.bias(working, 2, -int(dc2))
-                    if not stream_info.get('post_resample_dc_correction_logged', False):
-                        logger.info(
-                            "Streaming PCM16 post-resample DC correction applied",
-                            call_id=call_id,
-                            dc_before=int(dc2),
-                        )
-                        stream_info['post_resample_dc_correction_logged'] = True
-            except Exception:
-                pass
-            working = self._apply_dc_block(call_id, working)
             self._resample_states[call_id] = resample_state
 
-            # Apply a light DC-block filter on PCM16 prior to target encoding
+            # Egress conditioning in one pass: residual DC clamp, DC-block, attack envelope,
+            # make-up gain and soft limiter (PCM16 at the target rate, before any encode)
             try:
-                if not self._is_mulaw(target_fmt):
-                    working = self._apply_dc_block(call_id, working)
+                rate_egress = int(target_rate)
             except Exception:
-                pass
+                rate_egress = int(self.sample_rate)
+            working = self._run_dsp_chain(call_id, "egress", working, rate_egress)
 
             # Convert to target encoding
             if self._is_mulaw(target_fmt):
-                working, _ = self._remove_dc_from_pcm16(
-                    call_id,
-                    working,
-                    threshold=256,
-                    stage="stream-pre-encode",
-                )
-                working = self._apply_dc_block(call_id, working)
-                # Apply short attack envelope at segment start and a soft limiter before μ-law encode
-                try:
-                    info = self.active_streams.get(call_id, {})
-                    rate_attack = int(target_rate) if isinstance(target_rate, int) else int(self.sample_rate)
-                    working = self._apply_attack_envelope(call_id, working, rate_attack, info)
-                except Exception:
-                    pass
-                # Apply make-up gain normalization before limiter if enabled
-                try:
-                    logger.debug(
-                        "NORMALIZER CONDITION CHECK (pcm->ulaw)",
-                        call_id=call_id,
-                        normalizer_enabled=bool(self.normalizer_enabled),
-                        target_rms=int(self.normalizer_target_rms),
-                        pcm_size=len(working) if working else 0,
-                    )
-                    if self.normalizer_enabled and self.normalizer_target_rms > 0:
-                        logger.debug("ENTERING NORMALIZER (pcm->ulaw)", call_id=call_id)
-                        working = self._apply_normalizer(working, self.normalizer_target_rms, self.normalizer_max_gain_db)
-                        # One-time info log per stream to confirm normalizer activation in production
-                        try:
-                            sinfo = self.active_streams.get(call_id, {})
-                            if not sinfo.get('normalizer_applied_ulaw_logged'):
-                                logger.info(
-                                    "Normalizer applied (pcm->ulaw encode path)",
-                                    call_id=call_id,
-                                    target_rms=int(self.normalizer_target_rms),
-                                    max_gain_db=float(self.normalizer_max_gain_db),
-                                )
-                                sinfo['normalizer_applied_ulaw_logged'] = True
-                                self.active_streams[call_id] = sinfo
-                        except Exception:
-                            pass
-                    else:
-                        logger.warning(
-                            "NORMALIZER SKIPPED - WHY? (pcm->ulaw)",
-                            call_id=call_id,
-                            normalizer_enabled=bool(self.normalizer_enabled),
-                            target_rms=int(self.normalizer_target_rms),
-                        )
-                except Exception:
-                    logger.debug("Normalizer failed; continuing without gain", call_id=call_id, exc_info=True)
-                if self.limiter_enabled:
-                    try:
-                        working = self._apply_soft_limiter(working, self.limiter_headroom_ratio)
-                    except Exception:
-                        pass
                 if getattr(self, 'diag_enable_taps', False) and call_id in self.active_streams:
                     info = self.active_streams.get(call_id, {})
                     try:
@@ -1963,7 +1784,7 @@ class StreamingPlaybackManager:
                         pre_buf = info['tap_pre_pcm16']
                         if len(pre_buf) < pre_lim:
                             need = pre_lim - len(pre_buf)
-                            pre_buf.extend(working[:need])
+                            pre_buf.extend(memoryview(working)[:need])
                     # Encode to μ-law and back-convert for post snapshot
                     ulaw_bytes = pcm16le_to_mulaw(working)
                     back_pcm = mulaw_to_pcm16le(ulaw_bytes)
@@ -2014,7 +1835,7 @@ class StreamingPlaybackManager:
                         post_buf = info['tap_post_pcm16']
                         if len(post_buf) < post_lim:
                             need2 = post_lim - len(post_buf)
-                            post_buf.extend(back_pcm[:need2])
+                            post_buf.extend(memoryview(back_pcm)[:need2])
                     tap_rate = int(rate) if isinstance(rate, int) else int(self.sample_rate)
                     self._append_call_taps(call_id, working, back_pcm, tap_rate)
                     # First-window (200ms) per-segment snapshots
@@ -2031,7 +1852,7 @@ class StreamingPlaybackManager:
                             pre_w = info['tap_first_window_pre']
                             if len(pre_w) < win_bytes:
                                 needw = win_bytes - len(pre_w)
-                                pre_w.extend(working[:needw])
+                                pre_w.extend(memoryview(working)[:needw])
                     except Exception:
                         pass
                 try:
@@ -2039,7 +1860,7 @@ class StreamingPlaybackManager:
                         post_w = info['tap_first_window_post']
                         if len(post_w) < win_bytes:
                             needw2 = win_bytes - len(post_w)
-                            post_w.extend(back_pcm[:needw2])
+                            post_w.extend(memoryview(back_pcm)[:needw2])
                             if not info.get('tap_first_window_done'):
                                 pre_w = info.get('tap_first_window_pre') or bytearray()
                                 post_w = info.get('tap_first_window_post') or bytearray()
@@ -2079,54 +1900,8 @@ class StreamingPlaybackManager:
                     logger.debug("First-window snapshot failed (ulaw)", call_id=call_id, exc_info=True)
                     return ulaw_bytes
                 return pcm16le_to_mulaw(working)
-            # Otherwise target PCM16, apply optional envelope/limiter, with optional (or auto) egress byteswap
-            # Short attack envelope to avoid hot-start clicks on PCM path too
-            try:
-                info = self.active_streams.get(call_id, {})
-                try:
-                    rate = int(target_rate)
-                except Exception:
-                    rate = target_rate
-                working = self._apply_attack_envelope(call_id, working, int(rate) if isinstance(rate, int) else int(self.sample_rate), info)
-            except Exception:
-                pass
+            # Otherwise target PCM16 (already conditioned above), with optional (or auto) egress byteswap
             out_pcm = working
-            # Apply normalization and soft limiter on PCM egress to ensure consistent loudness
-            try:
-                logger.debug(
-                    "🔊 PCM EGRESS: Normalizer check",
-                    call_id=call_id,
-                    normalizer_enabled=bool(self.normalizer_enabled),
-                    target_rms=int(self.normalizer_target_rms),
-                    has_pcm=bool(out_pcm),
-                    pcm_size=len(out_pcm) if out_pcm else 0,
-                )
-                if self.normalizer_enabled and self.normalizer_target_rms > 0 and out_pcm:
-                    logger.debug("🔊 PCM EGRESS: Applying normalizer", call_id=call_id)
-                    out_pcm = self._apply_normalizer(out_pcm, self.normalizer_target_rms, self.normalizer_max_gain_db)
-                    logger.info(
-                        "🔊 Normalizer applied (pcm egress)",
-                        call_id=call_id,
-                        target_rms=int(self.normalizer_target_rms),
-                        max_gain_db=float(self.normalizer_max_gain_db),
-                    )
-                else:
-                    logger.warning(
-                        "🔊 PCM EGRESS: Normalizer SKIPPED",
-                        call_id=call_id,
-                        normalizer_enabled=bool(self.normalizer_enabled),
-                        target_rms=int(self.normalizer_target_rms),
-                        has_pcm=bool(out_pcm),
-                    )
-                if self.limiter_enabled and out_pcm:
-                    out_pcm = self._apply_soft_limiter(out_pcm, self.limiter_headroom_ratio)
-            except Exception as e:
-                logger.error(
-                    "🔊 PCM EGRESS: Normalizer exception",
-                    call_id=call_id,
-                    error=str(e),
-                    exc_info=True,
-                )
             if getattr(self, 'diag_enable_taps', False) and call_id in self.active_streams:
                 info = self.active_streams.get(call_id, {})
                 try:
@@ -2179,7 +1954,7 @@ class StreamingPlaybackManager:
                     pre_buf = info['tap_pre_pcm16']
                     if len(pre_buf) < pre_lim:
                         need = pre_lim - len(pre_buf)
-                        pre_buf.extend(working[:need])
+                        pre_buf.extend(memoryview(working)[:need])
                 try:
                     post_lim = max(0, int(self.diag_post_secs * rate * 2))
                 except Exception:
@@ -2188,7 +1963,7 @@ class StreamingPlaybackManager:
                     post_buf = info['tap_post_pcm16']
                     if len(post_buf) < post_lim:
                         need2 = post_lim - len(post_buf)
-                        post_buf.extend(out_pcm[:need2])
+                        post_buf.extend(memoryview(out_pcm)[:need2])
                 tap_rate = int(rate) if isinstance(rate, int) else int(self.sample_rate)
                 self._append_call_taps(call_id, working, out_pcm, tap_rate)
                 # First-window (200ms) per-segment snapshots
@@ -2205,12 +1980,12 @@ class StreamingPlaybackManager:
                         pre_w = info['tap_first_window_pre']
                         if len(pre_w) < win_bytes:
                             needw = win_bytes - len(pre_w)
-                            pre_w.extend(working[:needw])
+                            pre_w.extend(memoryview(working)[:needw])
                     if isinstance(info.get('tap_first_window_post'), bytearray) and out_pcm:
                         post_w = info['tap_first_window_post']
                         if len(post_w) < win_bytes:
                             needw2 = win_bytes - len(post_w)
-                            post_w.extend(out_pcm[:needw2])
+                            post_w.extend(memoryview(out_pcm)[:needw2])
                     if not info.get('tap_first_window_done'):
                         pre_w = info.get('tap_first_window_pre') or bytearray()
                         post_w = info.get('tap_first_window_post') or bytearray()
@@ -2257,208 +2032,86 @@ class StreamingPlaybackManager:
             )
             return None
 
-    def _apply_dc_block(self, call_id: str, pcm_bytes: bytes, r: float = 0.995) -> bytes:
-        """DISABLED - DC-block filter was corrupting audio samples."""
-        return pcm_bytes
-
-    def _apply_soft_limiter(self, pcm_bytes: bytes, headroom_ratio: float = 0.8) -> bytes:
-        """DISABLED - limiter was causing unnecessary audio processing."""
-        return pcm_bytes
-
-    def _trim_leading_silence(self, pcm_bytes: bytes, threshold_rms: int = 100) -> bytes:
-        """
-        Remove silent frames from the start of audio chunk.
-        Returns trimmed audio or original if no leading silence detected.
-        
-        Args:
-            pcm_bytes: PCM16 LE audio data
-            threshold_rms: RMS threshold below which audio is considered silent (default 100)
-        
-        Returns:
-            Trimmed PCM16 bytes with leading silence removed
-        """
-        if not pcm_bytes or len(pcm_bytes) < 320:  # Less than 20ms at 8kHz
-            return pcm_bytes
-        
-        try:
-            import array
-            import math
-            
-            buf = array.array('h')
-            buf.frombytes(pcm_bytes)
-            
-            # Process in 20ms frames (160 samples at 8kHz)
-            frame_size = 160
-            
-            for i in range(0, len(buf), frame_size):
-                frame = buf[i:i+frame_size]
-                if len(frame) < frame_size:
-                    break
-                
-                # Calculate frame RMS
-                acc = sum(float(s) * float(s) for s in frame)
-                frame_rms = int(math.sqrt(acc / len(frame)))
-                
-                if frame_rms > threshold_rms:  # Found real audio
-                    if i > 0:
-                        # Trim everything before this frame
-                        trimmed = buf[i:]
-                        trimmed_ms = int(i / 8)  # 8 samples per ms at 8kHz
-                        logger.info("SILENCE TRIMMED FROM CHUNK",
-                                   trimmed_samples=i,
-                                   trimmed_ms=trimmed_ms,
-                                   first_audio_rms=frame_rms,
-                                   original_bytes=len(pcm_bytes),
-                                   trimmed_bytes=len(trimmed) * 2)
-                        return trimmed.tobytes()
-                    else:
-                        # No leading silence
-                        return pcm_bytes
-            
-            # All frames were silent
-            logger.warning("ENTIRE CHUNK SILENT",
-                          chunk_size=len(buf),
-                          threshold=threshold_rms)
-            return pcm_bytes
-            
-        except Exception as e:
-            logger.error("SILENCE TRIM FAILED", error=str(e), exc_info=True)
-            return pcm_bytes
-
     def _apply_normalizer(self, pcm_bytes: bytes, target_rms: int, max_gain_db: float) -> bytes:
         """Apply simple RMS-based make-up gain to PCM16 LE audio.
 
-        - Computes RMS of the current buffer and applies a scalar gain to approach
-          target_rms, capped by max_gain_db.
-          - Clips to int16 range.
-          - Returns original input on any error.
+        One-off (stateless) use of the chain's normalizer stage: scalar gain toward
+        target_rms capped by max_gain_db, clipped to int16.  Returns the original
+        input when the gain is negligible or on any error.
         """
-        # Entry diagnostics
-        try:
-            logger.debug(
-                "NORMALIZER FUNCTION ENTRY",
-                pcm_bytes_len=(len(pcm_bytes) if pcm_bytes else 0),
-                target_rms=int(target_rms),
-                max_gain_db=float(max_gain_db),
-            )
-        except Exception:
-            pass
         if not pcm_bytes or target_rms <= 0:
-            try:
-                logger.debug(
-                    "NORMALIZER EARLY RETURN #1",
-                    empty_pcm=(not bool(pcm_bytes)),
-                    invalid_target=bool(target_rms <= 0),
-                )
-            except Exception:
-                pass
             return pcm_bytes
         try:
-            import array, math
-            buf = array.array('h')
-            buf.frombytes(pcm_bytes)
-            try:
-                logger.debug(
-                    "NORMALIZER BUFFER DECODED",
-                    buf_itemsize=int(buf.itemsize),
-                    buf_len=int(len(buf)),
-                )
-            except Exception:
-                pass
-            if buf.itemsize != 2 or len(buf) == 0:
-                try:
-                    logger.debug(
-                        "NORMALIZER EARLY RETURN #2",
-                        wrong_itemsize=bool(buf.itemsize != 2),
-                        empty_buffer=bool(len(buf) == 0),
-                    )
-                except Exception:
-                    pass
-                return pcm_bytes
-            # Compute RMS
-            acc = 0.0
-            for s in buf:
-                acc += float(s) * float(s)
-            rms = math.sqrt(acc / float(len(buf))) if len(buf) > 0 else 0.0
-            # Do NOT early-return for low RMS; boost very quiet audio too.
-            # Prevent divide-by-zero by clamping effective RMS to >= 1.0
-            effective_rms = max(1.0, float(rms))
-            # Compute linear gain toward target, limited by max_gain_db
-            desired = float(target_rms) / effective_rms
-            max_lin = math.pow(10.0, float(max_gain_db) / 20.0)
-            gain = min(desired, max_lin)
-            # Diagnostics: always log RMS/gain decision for RCA
-            try:
-                logger.debug(
-                    "NORMALIZER RMS CHECK",
-                    current_rms=int(rms),
-                    target_rms=int(target_rms),
-                    calculated_gain=round(gain, 3),
-                    will_skip=bool(gain <= 1.01),
-                )
-            except Exception:
-                pass
-            if gain <= 1.01:
-                # Avoid tiny changes to reduce CPU
-                try:
-                    logger.debug("NORMALIZER SKIPPED - gain too small", gain=round(gain, 3), current_rms=int(rms))
-                except Exception:
-                    pass
-                return pcm_bytes
-            try:
-                gain_db = 20.0 * math.log10(max(1e-6, gain))
-                logger.debug("Normalizer applied", target_rms=target_rms, current_rms=int(rms), gain_db=round(gain_db, 2))
-            except Exception:
-                pass
-            # Apply and clip
-            for i, s in enumerate(buf):
-                y = float(s) * gain
-                if y > 32767.0:
-                    y = 32767.0
-                elif y < -32768.0:
-                    y = -32768.0
-                buf[i] = int(y)
-            return buf.tobytes()
+            return PlaybackDSPChain(target_rms=target_rms, max_gain_db=max_gain_db).process(pcm_bytes)
         except Exception:
             return pcm_bytes
 
-    def _apply_attack_envelope(self, call_id: str, pcm_bytes: bytes, sample_rate: int, stream_info: Dict[str, Any]) -> bytes:
-        """Apply a short linear attack envelope at the start of a streaming segment to avoid hot starts.
-        Maintains per-stream remaining bytes in stream_info['attack_bytes_remaining'].
+    def _get_dsp_chain(self, call_id: str, kind: str, sample_rate: int) -> PlaybackDSPChain:
+        """Per-call conditioning chain for one egress path, built once from config.
+
+        kind: "ulaw-guarded" (μ-law re-encode path), "ulaw-to-pcm" (decode fast path)
+        or "egress" (general PCM16 path before encode).
         """
-        if not pcm_bytes or sample_rate <= 0 or self.attack_ms <= 0:
-            return pcm_bytes
+        chains = self._dsp_chains.setdefault(call_id, {})
+        chain = chains.get(kind)
+        if chain is not None and chain.sample_rate == sample_rate:
+            return chain
+        stages: Dict[str, Any] = {}
+        if self.normalizer_enabled and self.normalizer_target_rms > 0:
+            stages.update(target_rms=self.normalizer_target_rms, max_gain_db=self.normalizer_max_gain_db)
+        if kind != "ulaw-to-pcm":
+            stages.update(limiter=self.limiter_enabled, limiter_headroom=self.limiter_headroom_ratio)
+        if kind == "ulaw-guarded":
+            stages.update(trim_threshold_rms=100)
+        elif kind == "egress":
+            stages.update(dc_threshold=256, dc_block=self.dc_block_enabled, attack_ms=self.attack_ms)
+        chain = PlaybackDSPChain(sample_rate, **stages)
+        chains[kind] = chain
+        return chain
+
+    def _run_dsp_chain(self, call_id: str, kind: str, pcm_bytes: bytes, sample_rate: int) -> bytes:
+        """Condition PCM16 through the call's chain; passes audio through on error."""
         try:
-            import array
-            total_attack_bytes = int(max(0, int(sample_rate * (self.attack_ms / 1000.0)) * 2))
-            remaining = int(stream_info.get('attack_bytes_remaining', total_attack_bytes))
-            if remaining <= 0:
-                return pcm_bytes
-            buf = array.array('h')
-            buf.frombytes(pcm_bytes)
-            if buf.itemsize != 2:
-                return pcm_bytes
-            # Number of samples to shape in this buffer
-            shape_samples = min(len(buf), remaining // 2)
-            if shape_samples <= 0:
-                return pcm_bytes
-            # Linear ramp from ~0 -> 1 over remaining bytes
-            for i in range(shape_samples):
-                # Progress across total attack window (bytes consumed so far)
-                consumed_bytes = (total_attack_bytes - remaining) + (i * 2)
-                alpha = max(0.0, min(1.0, consumed_bytes / float(max(1, total_attack_bytes))))
-                s = int(buf[i])
-                buf[i] = int(round(s * alpha))
-            remaining -= shape_samples * 2
-            if remaining <= 0:
-                stream_info['attack_bytes_remaining'] = 0
-            else:
-                stream_info['attack_bytes_remaining'] = remaining
-            return buf.tobytes()
+            chain = self._get_dsp_chain(call_id, kind, int(sample_rate) or int(self.sample_rate))
+            dc_corrections = chain.dc_corrections
+            trimmed = chain.trimmed_samples
+            out = chain.process(pcm_bytes)
         except Exception:
+            logger.debug("Playback DSP chain failed; passing audio through", call_id=call_id, kind=kind, exc_info=True)
             return pcm_bytes
+        info = self.active_streams.get(call_id)
+        if info is None:
+            return out
+        if chain.attack_samples:
+            info['attack_bytes_remaining'] = chain.attack_remaining * 2
+        if chain.trimmed_samples > trimmed:
+            logger.debug(
+                "SILENCE TRIMMED FROM CHUNK",
+                call_id=call_id,
+                trimmed_samples=chain.trimmed_samples - trimmed,
+                original_bytes=len(pcm_bytes),
+                trimmed_bytes=len(out),
+            )
+        if chain.dc_corrections > dc_corrections and not info.get('egress_dc_correction_logged'):
+            logger.info(
+                "Streaming PCM16 egress DC correction applied",
+                call_id=call_id,
+                dc_before=int(chain.last_dc),
+            )
+            info['egress_dc_correction_logged'] = True
+        if chain.target_rms and not info.get(f'normalizer_{kind}_logged'):
+            # One-time info log per stream to confirm normalizer activation in production
+            logger.info(
+                "Normalizer applied",
+                call_id=call_id,
+                path=kind,
+                target_rms=int(chain.target_rms),
+                max_gain_db=float(self.normalizer_max_gain_db),
+            )
+            info[f'normalizer_{kind}_logged'] = True
+        return out
 
-    async def _send_audio_chunk(
+    def _send_audio_chunk(
         self,
         call_id: str,
         stream_id: str,
@@ -2469,11 +2122,17 @@ class StreamingPlaybackManager:
     ) -> bool:
         """Send audio chunk via configured streaming transport."""
         try:
-            session = await self.session_store.get_by_call_id(call_id)
+            stream_info = self.active_streams.get(call_id, {})
+            # Hold the session handle for the life of the stream instead of a store lookup per frame
+            handle = stream_info.get('session_handle')
+            if handle is None or handle.closed:
+                handle = self.session_store.handle(call_id)
+                if handle is not None and call_id in self.active_streams:
+                    stream_info['session_handle'] = handle
+            session = handle.session if handle is not None else None
             if not session:
                 logger.warning("Cannot stream audio - session not found", call_id=call_id)
                 return False
-            stream_info = self.active_streams.get(call_id, {})
             if self.audio_diag_callback:
                 try:
                     effective_fmt = (
@@ -2493,7 +2152,7 @@ class StreamingPlaybackManager:
                     if effective_rate <= 0:
                         effective_rate = self._default_sample_rate_for_format(effective_fmt, self.sample_rate)
                     stage = f"transport_out:{stream_info.get('playback_type', 'response')}"
-                    await self.audio_diag_callback(call_id, stage, chunk, effective_fmt, effective_rate)
+                    self.audio_diag_callback(call_id, stage, chunk, effective_fmt, effective_rate)
                 except Exception:
                     try:
                         info = self.active_streams.get(call_id) or {}
@@ -2519,14 +2178,13 @@ class StreamingPlaybackManager:
                 # Fast path: byte-swap only if needed for PCM16
                 if self._rtp_codec_cache.get(call_id, False) and len(chunk) > 0:
                     try:
-                        import audioop
-                        rtp_chunk = audioop.byteswap(chunk, 2)
+                        rtp_chunk = pcm_ops.byteswap(chunk)
                     except Exception as e:
                         logger.warning("RTP byte-swap failed, sending original", call_id=call_id, error=str(e))
                         rtp_chunk = chunk
 
                 ssrc = getattr(session, "ssrc", None)
-                success = await self.rtp_server.send_audio(call_id, rtp_chunk, ssrc=ssrc)
+                success = self.rtp_server.send_audio_nowait(call_id, rtp_chunk, ssrc=ssrc)
                 if not success:
                     # If the remote RTP endpoint isn't known yet, early sends are expected to be deferred.
                     # Avoid warning spam; higher-level logic will wait briefly and then fall back for greetings.
@@ -2650,7 +2308,7 @@ class StreamingPlaybackManager:
                     conns = list(set(getattr(session, 'audiosocket_conns', []) or []))
                     sent = 0
                     for cid in conns or [conn_id]:
-                        if await self.audiosocket_server.send_audio(cid, chunk):
+                        if self.audiosocket_server.send_audio_nowait(cid, chunk):
                             sent += 1
                     if sent == 0:
                         logger.warning("AudioSocket broadcast send failed (no recipients)", call_id=call_id, stream_id=stream_id)
@@ -2659,7 +2317,7 @@ class StreamingPlaybackManager:
                         logger.debug("AudioSocket broadcast sent", call_id=call_id, stream_id=stream_id, recipients=len(conns))
                     return True
                 # Normal single-conn send
-                success = await self.audiosocket_server.send_audio(conn_id, chunk)
+                success = self.audiosocket_server.send_audio_nowait(conn_id, chunk)
                 if not success:
                     logger.warning("AudioSocket streaming send failed", call_id=call_id, stream_id=stream_id)
                 else:
@@ -2708,12 +2366,7 @@ class StreamingPlaybackManager:
         if not pcm_bytes:
             return pcm_bytes, False
         try:
-            import audioop
-        except Exception:
-            return pcm_bytes, False
-
-        try:
-            dc = audioop.avg(pcm_bytes, 2)
+            dc = pcm_ops.avg(pcm_bytes)
         except Exception:
             return pcm_bytes, False
 
@@ -2721,7 +2374,7 @@ class StreamingPlaybackManager:
             return pcm_bytes, False
 
         try:
-            cleaned = audioop.bias(pcm_bytes, 2, -int(dc))
+            cleaned = pcm_ops.bias(pcm_bytes, -int(dc))
         except Exception:
             return pcm_bytes, False
 
@@ -2761,7 +2414,7 @@ class StreamingPlaybackManager:
         elif status == "finished":
             info['idle_ticks'] = current_ticks + 1
 
-    def _should_stop_for_idle(self, call_id: str, stream_id: str, jitter_buffer: asyncio.Queue) -> bool:
+    def _should_stop_for_idle(self, call_id: str, stream_id: str, jitter_buffer: FrameRingBuffer) -> bool:
         info = self.active_streams.get(call_id)
         if not info or info.get('idle_cutoff_triggered'):
             return False
@@ -2774,13 +2427,9 @@ class StreamingPlaybackManager:
         if not bool(info.get('sentinel_seen', False)):
             self._note_idle_block(info, 'waiting-for-sentinel')
             return False
-        if not jitter_buffer.empty():
+        if jitter_buffer.readable:
             self._note_idle_block(info, 'buffer-not-empty')
             return False
-        remainder = self.frame_remainders.get(call_id, b"")
-        if remainder:
-            self._note_idle_block(info, 'pending-remainder')
-            return False
         try:
             idle_ticks = int(info.get('idle_ticks', 0) or 0)
         except Exception:
@@ -2876,32 +2525,6 @@ class StreamingPlaybackManager:
             frame_size = 160 if bytes_per_sample == 1 else 320
         return frame_size
 
-    def _estimate_available_frames(
-        self,
-        call_id: str,
-        jitter_buffer: asyncio.Queue,
-        *,
-        include_remainder: bool = False,
-    ) -> int:
-        frame_size = self._frame_size_bytes(call_id)
-        try:
-            info = self.active_streams.get(call_id, {})
-            buffered_bytes = int(info.get('buffered_bytes', 0))
-        except Exception:
-            buffered_bytes = 0
-
-        if buffered_bytes <= 0:
-            # Approximate using queue depth when buffered_bytes not yet initialised
-            buffered_bytes = jitter_buffer.qsize() * frame_size
-
-        if include_remainder:
-            remainder = self.frame_remainders.get(call_id, b"")
-            if remainder:
-                buffered_bytes += len(remainder)
-
-        frames = int(buffered_bytes / max(1, frame_size))
-        return max(0, frames)
-
     def _get_low_watermark_frames(self, call_id: str) -> int:
         try:
             info = self.active_streams.get(call_id, {})
@@ -2910,18 +2533,6 @@ class StreamingPlaybackManager:
             lw = self.low_watermark_chunks
         return max(0, lw)
 
-    def _decrement_buffered_bytes(self, call_id: str, byte_count: int) -> None:
-        if byte_count <= 0:
-            return
-        try:
-            info = self.active_streams.get(call_id)
-            if info is None:
-                return
-            current = int(info.get('buffered_bytes', 0))
-            info['buffered_bytes'] = max(0, current - byte_count)
-        except Exception:
-            pass
-
     def set_transport(
         self,
         *,
@@ -2964,12 +2575,57 @@ class StreamingPlaybackManager:
         except Exception:
             logger.debug("Failed to record streaming fallback", call_id=call_id, reason=reason, exc_info=True)
     
+    def _take_fallback_audio(self, call_id: str) -> Tuple[bytes, str, int]:
+        """Drain the audio still buffered in the frame ring, with its egress encoding and rate.
+
+        Includes a frame whose send failed: frames are only consumed once sent.
+        """
+        remaining_audio = b""
+        if call_id in self.jitter_buffers:
+            remaining_audio = self.jitter_buffers[call_id].read_all()
+        info = self.active_streams.get(call_id, {})
+        src_encoding = (
+            self._canonicalize_encoding(info.get('target_format'))
+            or self._canonicalize_encoding(info.get('source_encoding'))
+            or 'slin16'
+        )
+        try:
+            src_rate = int(info.get('target_sample_rate') or 0) or self.sample_rate
+        except Exception:
+            src_rate = self.sample_rate
+        return remaining_audio, src_encoding, src_rate
+
+    def _spawn_side_task(self, coro: Awaitable[Any], name: str) -> None:
+        """Run slow work (session upserts, file fallback) outside the frame clock's pass."""
+        task = asyncio.create_task(coro, name=name)
+        self._side_tasks.add(task)
+        task.add_done_callback(self._side_tasks.discard)
+
+    def _schedule_fallback(self, call_id: str, stream_id: str, reason: str) -> None:
+        """Hand a failed stream to file playback without blocking the frame clock.
+
+        The buffered audio is taken now, before the stream is cleaned up; the
+        ARI/file work and the session upsert run in a side task.
+        """
+        buffered = self._take_fallback_audio(call_id)
+
+        async def _fallback() -> None:
+            await self._record_fallback(call_id, reason)
+            await self._fallback_to_file_playback(call_id, stream_id, buffered=buffered)
+
+        self._spawn_side_task(_fallback(), name=f"streaming-fallback-{call_id}")
+
     async def _fallback_to_file_playback(
         self, 
         call_id: str, 
-        stream_id: str
+        stream_id: str,
+        buffered: Optional[Tuple[bytes, str, int]] = None,
     ) -> None:
-        """Fallback to file-based playback when streaming fails."""
+        """Fallback to file-based playback when streaming fails.
+
+        ``buffered`` is audio already taken with ``_take_fallback_audio()``;
+        by default the frame ring is drained here.
+        """
         try:
             if not self.fallback_playback_manager:
                 logger.error("No fallback playback manager available",
@@ -2977,6 +2633,10 @@ class StreamingPlaybackManager:
                            stream_id=stream_id)
                 return
             
+            if buffered is None:
+                buffered = self._take_fallback_audio(call_id)
+            remaining_audio, src_encoding, src_rate = buffered
+
             # Get session
             session = await self.session_store.get_by_call_id(call_id)
             if not session:
@@ -2984,42 +2644,11 @@ class StreamingPlaybackManager:
                            call_id=call_id)
                 return
             
-            # Collect any remaining audio chunks
-            remaining_audio = bytearray()
-            # Include any remainder frames already drained from the jitter buffer.
-            # Otherwise, a failed first outbound send can leave nothing to play on fallback.
-            try:
-                rem = self.frame_remainders.pop(call_id, b"") or b""
-                if rem:
-                    remaining_audio.extend(rem)
-            except Exception:
-                pass
-            if call_id in self.jitter_buffers:
-                jitter_buffer = self.jitter_buffers[call_id]
-                while not jitter_buffer.empty():
-                    chunk = jitter_buffer.get_nowait()
-                    # Skip sentinel objects and non-bytes data
-                    if chunk is _JITTER_SENTINEL:
-                        continue
-                    if chunk and isinstance(chunk, (bytes, bytearray)):
-                        remaining_audio.extend(chunk)
-                        self._decrement_buffered_bytes(call_id, len(chunk))
-            
             if remaining_audio:
-                raw_buf = bytes(remaining_audio)
+                raw_buf = remaining_audio
 
-                # Convert provider-encoded buffer to μ-law @ 8 kHz for Asterisk file playback
+                # Convert buffered (egress-format) audio to μ-law @ 8 kHz for Asterisk file playback
                 try:
-                    info = self.active_streams.get(call_id, {})
-                    src_encoding = (
-                        self._canonicalize_encoding(info.get('source_encoding'))
-                        or 'slin16'
-                    )
-                    try:
-                        src_rate = int(info.get('source_sample_rate') or 0) or self.sample_rate
-                    except Exception:
-                        src_rate = self.sample_rate
-
                     # Normalize to PCM16
                     if self._is_mulaw(src_encoding):
                         pcm = mulaw_to_pcm16le(raw_buf)
@@ -3064,71 +2693,84 @@ class StreamingPlaybackManager:
                         error=str(e),
                         exc_info=True)
     
-    async def _keepalive_loop(self, call_id: str, stream_id: str) -> None:
-        """Keepalive loop to maintain streaming connection."""
+    def _keepalive_every_ticks(self) -> int:
         try:
-            while call_id in self.active_streams:
-                await asyncio.sleep(self.keepalive_interval_ms / 1000.0)
-                
-                # Check if stream is still active
-                if call_id not in self.active_streams:
-                    break
-                
-                # Check for timeout
-                stream_info = self.active_streams[call_id]
-                time_since_last_chunk = time.time() - stream_info['last_chunk_time']
-                stream_info["last_chunk_age_s"] = max(0.0, float(time_since_last_chunk))
-                self._refresh_streaming_summary_metrics()
-                _STREAMING_KEEPALIVES_SENT_TOTAL.inc()
-                try:
-                    sess = await self.session_store.get_by_call_id(call_id)
-                    if sess:
-                        sess.streaming_keepalive_sent += 1
-                        await self.session_store.upsert_call(sess)
-                except Exception:
-                    pass
-                
-                if time_since_last_chunk > (self.connection_timeout_ms / 1000.0):
-                    logger.warning("🎵 STREAMING PLAYBACK - Connection timeout",
-                                 call_id=call_id,
-                                 stream_id=stream_id,
-                                 time_since_last_chunk=time_since_last_chunk)
-                    _STREAMING_KEEPALIVE_TIMEOUTS_TOTAL.inc()
-                    # In continuous-stream mode, do NOT fallback or end the stream; continue pacing
-                    if not self.continuous_stream:
-                        try:
-                            if call_id in self.active_streams:
-                                self.active_streams[call_id]['end_reason'] = 'keepalive-timeout'
-                        except Exception:
-                            pass
-                        try:
-                            sess = await self.session_store.get_by_call_id(call_id)
-                            if sess:
-                                sess.streaming_keepalive_timeouts += 1
-                                sess.last_streaming_error = f"keepalive-timeout>{time_since_last_chunk:.2f}s"
-                                await self.session_store.upsert_call(sess)
-                        except Exception:
-                            pass
-                        await self._fallback_to_file_playback(call_id, stream_id)
-                        break
-                    else:
-                        # Continuous: just keep the pacer alive; no action required
-                        continue
-                
-                # Send keepalive (placeholder)
-                logger.debug("🎵 STREAMING KEEPALIVE - Sending keepalive",
-                           call_id=call_id,
-                           stream_id=stream_id)
-        
-        except asyncio.CancelledError:
-            logger.debug("Keepalive loop cancelled",
-                        call_id=call_id,
-                        stream_id=stream_id)
+            interval_s = max(0.0, float(self.keepalive_interval_ms) / 1000.0)
+        except Exception:
+            interval_s = 5.0
+        return max(1, int(round(interval_s / self.frame_clock.tick_seconds)))
+
+    async def _record_keepalive(self, call_id: str, timeout_reason: Optional[str] = None) -> None:
+        """Persist keepalive counters (side task: the frame clock never waits on the session store)."""
+        try:
+            sess = await self.session_store.get_by_call_id(call_id)
+            if sess:
+                if timeout_reason is None:
+                    sess.streaming_keepalive_sent += 1
+                else:
+                    sess.streaming_keepalive_timeouts += 1
+                    sess.last_streaming_error = timeout_reason
+                await self.session_store.upsert_call(sess)
+        except Exception:
+            pass
+
+    def _keepalive_tick(self, call_id: str, stream_id: str) -> bool:
+        """Keepalive check to maintain streaming connection (runs every keepalive interval).
+
+        Returns False once the keepalive for this stream should stop.
+        """
+        try:
+            # Check if stream is still active
+            if call_id not in self.active_streams:
+                return False
+            
+            # Check for timeout
+            stream_info = self.active_streams[call_id]
+            time_since_last_chunk = time.time() - stream_info['last_chunk_time']
+            stream_info["last_chunk_age_s"] = max(0.0, float(time_since_last_chunk))
+            self._refresh_streaming_summary_metrics()
+            _STREAMING_KEEPALIVES_SENT_TOTAL.inc()
+            self._spawn_side_task(self._record_keepalive(call_id), name=f"streaming-keepalive-{call_id}")
+            
+            if time_since_last_chunk > (self.connection_timeout_ms / 1000.0):
+                logger.warning("🎵 STREAMING PLAYBACK - Connection timeout",
+                             call_id=call_id,
+                             stream_id=stream_id,
+                             time_since_last_chunk=time_since_last_chunk)
+                _STREAMING_KEEPALIVE_TIMEOUTS_TOTAL.inc()
+                # In continuous-stream mode, do NOT fallback or end the stream; continue pacing
+                if not self.continuous_stream:
+                    try:
+                        if call_id in self.active_streams:
+                            self.active_streams[call_id]['end_reason'] = 'keepalive-timeout'
+                    except Exception:
+                        pass
+                    self._spawn_side_task(
+                        self._record_keepalive(
+                            call_id, timeout_reason=f"keepalive-timeout>{time_since_last_chunk:.2f}s"
+                        ),
+                        name=f"streaming-keepalive-{call_id}",
+                    )
+                    buffered = self._take_fallback_audio(call_id)
+                    self._spawn_side_task(
+                        self._fallback_to_file_playback(call_id, stream_id, buffered=buffered),
+                        name=f"streaming-fallback-{call_id}",
+                    )
+                    return False
+                # Continuous: just keep the pacer alive; no action required
+                return True
+            
+            # Send keepalive (placeholder)
+            logger.debug("🎵 STREAMING KEEPALIVE - Sending keepalive",
+                       call_id=call_id,
+                       stream_id=stream_id)
+            return True
         except Exception as e:
             logger.error("Error in keepalive loop",
                         call_id=call_id,
                         stream_id=stream_id,
                         error=str(e))
+            return False
 
     
     async def stop_streaming_playback(self, call_id: str) -> bool:
@@ -3160,6 +2802,10 @@ class StreamingPlaybackManager:
                 except Exception:
                     pass
                 self.keepalive_tasks.pop(call_id, None)
+            # Barge-in: drop buffered audio in O(1) so cleanup does not flush it
+            ring = self.jitter_buffers.get(call_id)
+            if ring is not None:
+                ring.clear()
             # Cleanup resources and emit summaries
             await self._cleanup_stream(call_id, stream_id)
             logger.info("🎵 STREAMING PLAYBACK - Stopped", call_id=call_id, stream_id=stream_id)
@@ -3190,6 +2836,9 @@ class StreamingPlaybackManager:
                 rate = int(self.sample_rate)
             total_attack_bytes = int(max(0, int(rate * (self.attack_ms / 1000.0)) * 2))
             info['attack_bytes_remaining'] = total_attack_bytes
+            chain = self._dsp_chains.get(call_id, {}).get("egress")
+            if chain is not None:
+                chain.restart_attack()
             logger.info(
                 "⚡ CONTINUOUS STREAM - Segment boundary",
                 call_id=call_id,
@@ -3349,7 +2998,8 @@ class StreamingPlaybackManager:
                             info = self.active_streams.get(call_id, {}) if call_id in self.active_streams else {}
                             qbytes = int(info.get('queued_bytes', 0) or 0)
                             txbytes = int(info.get('tx_bytes', 0) or 0)
-                            bbytes = int(info.get('buffered_bytes', 0) or 0)
+                            ring = self.jitter_buffers.get(call_id)
+                            bbytes = ring.readable if ring is not None else 0
                             frames_sent = int(info.get('frames_sent', 0) or 0)
                             underflows = int(info.get('underflow_events', 0) or 0)
                             provider_bytes = int(info.get('provider_bytes', 0) or 0)
@@ -3446,11 +3096,15 @@ class StreamingPlaybackManager:
             except Exception:
                 pass
 
-            # Flush any remainder bytes as a final frame
+            # Flush any remainder bytes as a final frame (at most one; whatever a
+            # cancelled pacer left beyond that is dropped with the ring)
             try:
-                rem = self.frame_remainders.get(call_id, b"") or b""
+                ring = self.jitter_buffers.get(call_id)
+                rem = b""
+                if ring is not None:
+                    rem = bytes(ring.peek_frame(self._frame_size_bytes(call_id)))
+                    ring.clear()
                 if rem:
-                    self._decrement_buffered_bytes(call_id, len(rem))
                     if self.audio_transport == "audiosocket":
                         fmt = (
                             self._canonicalize_encoding(self.audiosocket_format)
@@ -3472,11 +3126,11 @@ class StreamingPlaybackManager:
                         # Zero-pad to a full frame boundary to avoid truncation artifacts
                         if len(rem) < frame_size:
                             rem = rem + (b"\x00" * (frame_size - len(rem)))
-                        await self._send_audio_chunk(call_id, stream_id, rem[:frame_size], target_fmt=fmt, target_rate=sr)
+                        self._send_audio_chunk(call_id, stream_id, rem[:frame_size], target_fmt=fmt, target_rate=sr)
                         # small pacing to let Asterisk play the last frame
                         await asyncio.sleep(self.chunk_size_ms / 1000.0)
                     else:
-                        await self._send_audio_chunk(call_id, stream_id, rem)
+                        self._send_audio_chunk(call_id, stream_id, rem)
             except Exception:
                 logger.debug("Remainder flush failed", call_id=call_id, stream_id=stream_id)
 
@@ -3562,7 +3216,7 @@ class StreamingPlaybackManager:
                 del self.jitter_buffers[call_id]
             self._startup_ready.pop(call_id, None)
             self._resample_states.pop(call_id, None)
-            self._dc_block_state.pop(call_id, None)
+            self._dsp_chains.pop(call_id, None)
             self._rtp_codec_cache.pop(call_id, None)
             # Metrics are aggregate; refreshed when active_streams changes.
             
@@ -3575,8 +3229,6 @@ class StreamingPlaybackManager:
                     await self.session_store.upsert_call(sess)
             except Exception:
                 pass
-            # Clear any remainder record after flushing
-            self.frame_remainders.pop(call_id, None)
             
             
             
@@ -0,0 +1,367 @@
+"""
+Content-addressed cache for synthesized phrases.
+
+Greetings, farewells, slow-tool "one moment" messages and attended-transfer
+prompts are the same text on every call, yet each call paid TTS latency (and
+API cost) to synthesize them again.  ``TTSPhraseCache`` stores the audio the
+TTS adapter produced, already in the wire format the adapter was asked for
+(μ-law or slin), under a key derived from:
+
+    adapter + voice + effective synthesis options (including the endpoint) + normalized text
+
+Two tiers:
+
+* memory - an ``OrderedDict`` LRU bounded by ``memory_max_bytes``.
+* disk   - one file per key under ``cache_dir``, bounded by ``disk_max_bytes``;
+  least recently used files (by atime, touched on hit) are evicted first, and
+  files written more than ``disk_ttl_sec`` ago (by mtime) are dropped so a
+  voice or model changed behind an unchanged config is picked up eventually.
+  Disk I/O runs in the default executor.
+
+Concurrent misses for the same key share one synthesis (single flight), so a
+burst of calls arriving on a cold cache costs one TTS request.
+
+Only configured phrases should be cached: text containing per-call template
+values (caller name, ids) would miss every time and put caller data on disk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+import structlog
+from prometheus_client import Counter, Gauge
+
+logger = structlog.get_logger(__name__)
+
+_TTS_CACHE_HITS_TOTAL = Counter(
+    "ai_agent_tts_cache_hits_total",
+    "TTS phrase cache hits",
+    labelnames=("tier",),
+)
+_TTS_CACHE_MISSES_TOTAL = Counter(
+    "ai_agent_tts_cache_misses_total",
+    "TTS phrase cache misses (phrase synthesized)",
+)
+_TTS_CACHE_BYTES = Gauge(
+    "ai_agent_tts_cache_bytes",
+    "Audio bytes held by the TTS phrase cache",
+    labelnames=("tier",),
+)
+_TTS_CACHE_EVICTIONS_TOTAL = Counter(
+    "ai_agent_tts_cache_evictions_total",
+    "Phrases evicted from the TTS phrase cache",
+    labelnames=("tier",),
+)
+_TTS_CACHE_SERVED_BYTES_TOTAL = Counter(
+    "ai_agent_tts_cache_served_bytes_total",
+    "Audio bytes served from the TTS phrase cache instead of synthesized",
+)
+
+_FILE_SUFFIX = ".tts"
+_WHITESPACE = re.compile(r"\s+")
+# Option keys that never change the audio (credentials, timeouts).  Endpoints stay in the key:
+# a different server can serve a different voice under the same name.
+_IGNORED_OPTION_MARKERS = ("key", "token", "secret", "password", "credential", "timeout", "organization", "project")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of a phrase for keying: NFC, trimmed, whitespace collapsed."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def _audio_options(options: Mapping[str, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for key, value in (options or {}).items():
+        lowered = str(key).lower()
+        if any(marker in lowered for marker in _IGNORED_OPTION_MARKERS):
+            continue
+        out[str(key)] = _audio_options(value) if isinstance(value, Mapping) else value
+    return out
+
+
+def make_key(adapter: str, voice: Optional[str], options: Mapping[str, Any], text: str) -> str:
+    """Content address for a phrase: sha256 over adapter, voice, audio options and normalized text."""
+    material = json.dumps(
+        {
+            "adapter": adapter or "",
+            "voice": voice or "",
+            "options": _audio_options(options),
+            "text": normalize_text(text),
+        },
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def voice_of(options: Mapping[str, Any]) -> Optional[str]:
+    """Best-effort voice identifier from effective TTS options."""
+    for key in ("voice", "voice_id", "voice_name", "model_id", "model", "tts_model"):
+        value = (options or {}).get(key)
+        if value:
+            return str(value)
+    return None
+
+
+class TTSPhraseCache:
+    """Two-tier (memory LRU + size-bounded disk) cache of synthesized phrase audio."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+        disk_ttl_sec: float = 7 * 24 * 3600,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            cache_dir: Directory for the disk tier; None/"" keeps the cache in memory only.
+            memory_max_bytes: Audio bytes kept in the in-memory LRU.
+            disk_max_bytes: Audio bytes kept on disk before the oldest files are evicted.
+            disk_ttl_sec: Age after which a disk entry is synthesized again; 0 keeps entries until evicted.
+            enabled: When False every lookup misses and nothing is stored.
+        """
+        self.enabled = bool(enabled)
+        self.cache_dir = cache_dir or None
+        self.memory_max_bytes = max(0, int(memory_max_bytes))
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self.disk_ttl_sec = max(0.0, float(disk_ttl_sec))
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_index: Optional[Dict[str, Tuple[float, int, float]]] = None  # key -> (atime, size, mtime)
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+
+    @property
+    def disk_enabled(self) -> bool:
+        return self.enabled and bool(self.cache_dir) and self.disk_max_bytes > 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Cached audio for ``key`` (promoting disk hits into memory), else None."""
+        if not self.enabled:
+            return None
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            self._hit("memory", audio)
+            return audio
+        if not self.disk_enabled:
+            return None
+        loop = asyncio.get_running_loop()
+        audio = await loop.run_in_executor(None, self._disk_read, key)
+        if audio is None:
+            return None
+        self._remember(key, audio)
+        self._hit("disk", audio)
+        return audio
+
+    async def contains(self, key: str) -> bool:
+        """True when ``key`` is cached in either tier (no hit is recorded)."""
+        if not self.enabled:
+            return False
+        if key in self._memory:
+            return True
+        if not self.disk_enabled:
+            return False
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._disk_contains, key)
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """Store ``audio`` for ``key`` in both tiers (empty audio is ignored)."""
+        if not self.enabled or not audio:
+            return
+        self._remember(key, audio)
+        if self.disk_enabled:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._disk_write, key, bytes(audio))
+
+    async def get_or_synthesize(self, key: str, synthesize: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        """Cached audio for ``key``; on a miss run ``synthesize()`` once (shared by concurrent callers) and store it."""
+        if not self.enabled:
+            return await synthesize()
+        audio = await self.get(key)
+        if audio is not None:
+            return audio
+        pending = self._inflight.get(key)
+        if pending is not None:
+            audio = await asyncio.shield(pending)
+            if audio:
+                return audio
+            # The shared synthesis failed or was cancelled; try on our own.
+            return await synthesize()
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        audio = None
+        try:
+            self.record_miss()
+            audio = await synthesize()
+            if audio:
+                await self.put(key, audio)
+            return audio
+        finally:
+            self._inflight.pop(key, None)
+            if not fut.done():
+                fut.set_result(audio)
+
+    def record_miss(self) -> None:
+        self.misses += 1
+        _TTS_CACHE_MISSES_TOTAL.inc()
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+        self._memory_bytes = 0
+        _TTS_CACHE_BYTES.labels("memory").set(0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk_index or {}),
+            "disk_bytes": self._disk_bytes,
+            "hits": dict(self.hits),
+            "misses": self.misses,
+        }
+
+    def _hit(self, tier: str, audio: bytes) -> None:
+        self.hits[tier] += 1
+        _TTS_CACHE_HITS_TOTAL.labels(tier).inc()
+        _TTS_CACHE_SERVED_BYTES_TOTAL.inc(len(audio))
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.memory_max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.memory_max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            _TTS_CACHE_EVICTIONS_TOTAL.labels("memory").inc()
+        _TTS_CACHE_BYTES.labels("memory").set(self._memory_bytes)
+
+    # Disk tier (runs in the executor)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _FILE_SUFFIX)
+
+    def _load_index(self) -> Dict[str, Tuple[float, int, float]]:
+        if self._disk_index is not None:
+            return self._disk_index
+        index: Dict[str, Tuple[float, int, float]] = {}
+        total = 0
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_FILE_SUFFIX) or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    index[entry.name[: -len(_FILE_SUFFIX)]] = (st.st_atime, st.st_size, st.st_mtime)
+                    total += st.st_size
+        except OSError as exc:
+            logger.warning("TTS cache directory unavailable; disk tier disabled", cache_dir=self.cache_dir, error=str(exc))
+            self.cache_dir = None
+        self._disk_index = index
+        self._disk_bytes = total
+        _TTS_CACHE_BYTES.labels("disk").set(total)
+        return index
+
+    def _disk_contains(self, key: str) -> bool:
+        with self._disk_lock:
+            entry = self._load_index().get(key)
+            return entry is not None and not self._expired(entry)
+
+    def _disk_read(self, key: str) -> Optional[bytes]:
+        with self._disk_lock:
+            return self._disk_read_locked(key)
+
+    def _disk_write(self, key: str, audio: bytes) -> None:
+        with self._disk_lock:
+            self._disk_write_locked(key, audio)
+
+    def _disk_read_locked(self, key: str) -> Optional[bytes]:
+        index = self._load_index()
+        entry = index.get(key)
+        if entry is None or not self.cache_dir:
+            return None
+        if self._expired(entry):
+            self._forget(key, unlink=True)
+            _TTS_CACHE_EVICTIONS_TOTAL.labels("disk").inc()
+            _TTS_CACHE_BYTES.labels("disk").set(self._disk_bytes)
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            now = time.time()
+            os.utime(path, (now, entry[2]))  # LRU order by atime; mtime keeps the write time for the TTL
+            index[key] = (now, len(audio), entry[2])
+            return audio
+        except OSError:
+            self._forget(key)
+            return None
+
+    def _disk_write_locked(self, key: str, audio: bytes) -> None:
+        index = self._load_index()
+        if not self.cache_dir or len(audio) > self.disk_max_bytes:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(audio)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("TTS cache write failed", key=key, error=str(exc))
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+        previous = index.get(key)
+        if previous is not None:
+            self._disk_bytes -= previous[1]
+        written = os.stat(path).st_mtime
+        index[key] = (written, len(audio), written)
+        self._disk_bytes += len(audio)
+        if self._disk_bytes > self.disk_max_bytes:
+            for old_key, _ in sorted(index.items(), key=lambda kv: kv[1][0]):
+                if self._disk_bytes <= self.disk_max_bytes:
+                    break
+                if old_key == key:
+                    continue
+                self._forget(old_key, unlink=True)
+                _TTS_CACHE_EVICTIONS_TOTAL.labels("disk").inc()
+        _TTS_CACHE_BYTES.labels("disk").set(self._disk_bytes)
+
+    def _expired(self, entry: Tuple[float, int, float]) -> bool:
+        return self.disk_ttl_sec > 0 and time.time() - entry[2] > self.disk_ttl_sec
+
+    def _forget(self, key: str, unlink: bool = False) -> None:
+        entry = (self._disk_index or {}).pop(key, None)
+        if entry is not None:
+            self._disk_bytes -= entry[1]
+        if unlink and self.cache_dir:
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
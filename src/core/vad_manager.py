@@ -5,13 +5,14 @@ Enhanced VAD Manager - integrates WebRTC VAD and energy-based detection under a
 from __future__ import annotations
 
 import asyncio
-import audioop
 from dataclasses import dataclass
 from typing import Dict, Optional, Any
 import time
 
 import structlog
 from prometheus_client import Counter, Gauge, Histogram
+from src.audio import pcm_ops
+from src.audio.resampler import mulaw_to_pcm16le
 from .call_context_analyzer import CallContextAnalyzer
 
 try:
@@ -143,7 +144,7 @@ class EnhancedVADManager:
         if self.adaptive_threshold_enabled and call_state['frame_count'] % self._adaptation_interval == 0:
             await self._adapt_vad_parameters(call_id)
             
-        energy = audioop.rms(audio_frame_pcm16, 2)
+        energy = pcm_ops.rms(audio_frame_pcm16)
         webrtc_result = False
         if self.webrtc_vad and sample_rate in WEBRTC_SUPPORTED_RATES:
             try:
@@ -326,7 +327,7 @@ class EnhancedVADManager:
         if len(frame_ulaw) == 0:
             return b""
         try:
-            return audioop.ulaw2lin(frame_ulaw, 2)
+            return mulaw_to_pcm16le(frame_ulaw)
         except Exception:
             logger.debug("Enhanced VAD - ulaw to PCM16 conversion failed", exc_info=True)
             return b""
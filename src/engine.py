@@ -9,7 +9,6 @@ import signal
 import struct
 import time
 import uuid
-import audioop
 import base64
 import json
 import ipaddress
@@ -47,21 +46,32 @@ from .pipelines import PipelineOrchestrator, PipelineOrchestratorError, Pipeline
 from .logging_config import get_logger, configure_logging
 from .rtp_server import RTPServer
 from .audio.audiosocket_server import AudioSocketServer
+from .audio.codec_engine import Pcm16kInputStage
+from .audio import pcm_ops
+from .audio.resampler import mulaw_to_pcm16le, pcm16le_to_mulaw, resample_audio
 from .providers.base import AIProviderInterface
 from .providers.deepgram import DeepgramProvider
 from .providers.local import LocalProvider
+from .providers.local_mux import close_local_mux_pools
 from .providers.openai_realtime import OpenAIRealtimeProvider
 from .providers.google_live import GoogleLiveProvider
 from .providers.elevenlabs_agent import ElevenLabsAgentProvider
 from .providers.elevenlabs_config import ElevenLabsAgentConfig
-from .core import SessionStore, PlaybackManager, ConversationCoordinator
+from .core import SessionStore, SessionHandle, PlaybackManager, ConversationCoordinator
 from .core.vad_manager import EnhancedVADManager, VADResult
 from .core.streaming_playback_manager import StreamingPlaybackManager
 from .core.transport_orchestrator import TransportOrchestrator, TransportProfile
 from .core.models import CallSession
-from .core.outbound_store import get_outbound_store
+from .core.audio_health import AudioHealthMonitor
+from .core.tts_cache import TTSPhraseCache, make_key as make_tts_cache_key, voice_of
+from .core.provider_warm_pool import ProviderWarmPool
+from .tools.http.client_pool import close_http_client_pool, configure_http_client_pool
+from .core.outbound_pacing import AttemptIndex, OutboundPacer
+from .core.outbound_store import get_outbound_store, max_concurrent_ceiling
 from .utils.audio_capture import AudioCaptureManager
 from src.pipelines.base import LLMResponse
+from src.pipelines.segmenter import SentenceSegmenter, ToolMarkupGuard
+from src.tools.parser import parse_response_with_tools
 from src.tools.telephony.hangup_policy import resolve_hangup_policy, text_contains_marker_word
 
 logger = get_logger(__name__)
@@ -103,6 +113,9 @@ def _resolve_config_env_vars(config_dict: Dict[str, Any]) -> Dict[str, Any]:
             resolved[key] = value
     return resolved
 
+# How long the TTS model reported by local-ai-server is trusted before asking again
+_LOCAL_TTS_MODEL_TTL_SEC = 60.0
+
 # -----------------------------------------------------------------------------
 # Prometheus latency histograms (module scope, registered once)
 # -----------------------------------------------------------------------------
@@ -118,6 +131,18 @@ _TURN_RESPONSE_SECONDS = Histogram(
     buckets=(0.2, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 8.0),
     labelnames=("pipeline", "provider"),
 )
+_TURN_FIRST_AUDIO_SECONDS = Histogram(
+    "ai_agent_turn_first_audio_seconds",
+    "Time from STT final transcript to first TTS audio queued for playback",
+    buckets=(0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0),
+    labelnames=("pipeline", "provider", "llm_mode"),
+)
+_TURN_LLM_FIRST_TOKEN_SECONDS = Histogram(
+    "ai_agent_llm_first_token_seconds",
+    "Time from STT final transcript to the first streamed LLM text delta",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0),
+    labelnames=("pipeline", "provider"),
+)
 
 # Config exposure gauges (per call at session start)
 _CFG_BARGE_MS = Gauge(
@@ -163,12 +188,12 @@ _CODEC_ALIGNMENT = Gauge(
 )
 _AUDIO_RMS_GAUGE = Gauge(
     "ai_agent_audio_rms",
-    "Observed RMS levels for audio stages",
+    "Median across active calls of each call's windowed median RMS per audio stage",
     labelnames=("stage",),
 )
 _AUDIO_DC_OFFSET = Gauge(
     "ai_agent_audio_dc_offset",
-    "Observed DC offset (mean sample value) for audio stages",
+    "Median across active calls of each call's windowed median signed DC offset per audio stage",
     labelnames=("stage",),
 )
 
@@ -202,7 +227,10 @@ class Engine:
             password=config.asterisk.password,
             base_url=base_url,
             app_name=config.asterisk.app_name,
-            ssl_verify=config.asterisk.ssl_verify
+            ssl_verify=config.asterisk.ssl_verify,
+            event_workers=config.asterisk.event_workers,
+            event_queue_max=config.asterisk.event_queue_max,
+            event_hold_timeout_sec=config.asterisk.event_hold_timeout_sec,
         )
         # Set engine reference for event propagation
         self.ari_client.engine = self
@@ -216,6 +244,20 @@ class Engine:
             conversation_coordinator=self.conversation_coordinator,
         )
         self.conversation_coordinator.set_playback_manager(self.playback_manager)
+        # Sampled per-call audio health windows (RMS/DC/clipping/silence)
+        audio_health_cfg = getattr(config, "audio_health", None)
+        self.audio_health = AudioHealthMonitor(
+            sample_every=int(getattr(audio_health_cfg, "sample_every", 5) or 5),
+            window=int(getattr(audio_health_cfg, "window", 300) or 300),
+            silence_rms=int(getattr(audio_health_cfg, "silence_rms", 200)),
+            clip_level=int(getattr(audio_health_cfg, "clip_level", 32000) or 32000),
+        )
+        # Synthesized greetings/farewells/slow-tool messages, keyed by adapter+voice+options+text
+        self.tts_cache = self._build_tts_cache(config)
+        # local-ai-server URL -> (expires_at, TTS model it reported); part of its phrase cache keys
+        self._local_tts_models: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Greeting pre-warm in flight (startup or /reload); at most one at a time
+        self._tts_prewarm_task: Optional[asyncio.Task] = None
         # Attended transfer (warm transfer w/ agent DTMF acceptance) runtime state.
         # These are intentionally in-memory only (per-engine-instance) to avoid schema churn.
         self._ari_playback_waiters: Dict[str, asyncio.Future] = {}
@@ -230,8 +272,17 @@ class Engine:
         # ------------------------------------------------------------------
         self.outbound_store = get_outbound_store()
         self._outbound_scheduler_task: Optional[asyncio.Task] = None
-        self._outbound_last_dial_ts: Dict[str, float] = {}
-        self._outbound_attempt_meta_by_attempt_id: Dict[str, Dict[str, Any]] = {}
+        # Indexed by campaign so the scheduler's in-flight check is O(1) per campaign.
+        self._outbound_attempt_meta_by_attempt_id: AttemptIndex = AttemptIndex()
+        self._outbound_pacer = OutboundPacer(
+            campaign_burst=float(os.getenv("AAVA_OUTBOUND_PACING_BURST", "1") or "1"),
+            trunk_cps=float(os.getenv("AAVA_OUTBOUND_TRUNK_CPS", "0") or "0"),
+        )
+        self._outbound_lease_batch = max(1, min(200, int(os.getenv("AAVA_OUTBOUND_LEASE_BATCH", "25") or "25")))
+        self._outbound_tick_seconds = max(0.05, float(os.getenv("AAVA_OUTBOUND_SCHEDULER_TICK_SECONDS", "1.0") or "1.0"))
+        self._outbound_dial_tasks: Set[asyncio.Task] = set()
+        # Outbound attempts waiting for their Call History row to be committed.
+        self._call_history_tasks: Set[asyncio.Task] = set()
         self._outbound_attempt_meta_by_channel_id: Dict[str, Dict[str, Any]] = {}
         self._outbound_awaiting_amd_channel_ids: Set[str] = set()
         self._outbound_attempt_amd: Dict[str, Dict[str, Optional[str]]] = {}
@@ -349,6 +400,8 @@ class Engine:
         self.providers: Dict[str, AIProviderInterface] = {}
         # Factories for creating per-call provider instances (supports concurrent calls).
         self.provider_factories: Dict[str, Callable[[], AIProviderInterface]] = {}
+        # Pre-connected provider sockets leased at call start (warm_pool config).
+        self._provider_warm_pools: Dict[str, ProviderWarmPool] = {}
         # Active provider instances keyed by call_id (one provider instance per call).
         self._call_providers: Dict[str, AIProviderInterface] = {}
         # Single-flight start tasks keyed by call_id (prevents duplicate start_session races).
@@ -376,6 +429,8 @@ class Engine:
         self._resample_state_provider_in: Dict[str, Dict[str, Optional[tuple]]] = {}
         # Forced pipeline PCM16@16k path (per-call)
         self._resample_state_pipeline16k: Dict[str, Optional[tuple]] = {}
+        # AudioSocket -> PCM16@16k conversion stages for _as_to_pcm16_16k (per-call)
+        self._pipeline16k_stages: Dict[str, Pcm16kInputStage] = {}
         # Enhanced VAD normalization to 8 kHz (per-call)
         self._resample_state_vad8k: Dict[str, Optional[tuple]] = {}
         self.pending_channel_for_bind: Optional[str] = None
@@ -477,6 +532,8 @@ class Engine:
         self._pipeline_tasks: Dict[str, asyncio.Task] = {}
         # Track calls where a pipeline was explicitly requested via AI_PROVIDER
         self._pipeline_forced: Dict[str, bool] = {}
+        # Session handles held by per-frame audio handlers (call_id -> handle)
+        self._session_handles: Dict[str, SessionHandle] = {}
         # Cache for called_number variables (DIALED_NUMBER, __FROM_DID) from ChannelVarSet events
         # These are set early in dialplan but may not be available via GET when StasisStart fires
         self._called_number_cache: Dict[str, str] = {}  # channel_id -> called_number
@@ -515,6 +572,17 @@ class Engine:
         """Default event handler for unhandled ARI events."""
         logger.debug("Received unhandled ARI event", event_type=event.get("type"), ari_event=event)
 
+    def _live_session(self, call_id: str) -> Optional[CallSession]:
+        """Per-frame session lookup through a cached SessionHandle (no lock, no await)."""
+        handle = self._session_handles.get(call_id)
+        if handle is None or handle.closed:
+            handle = self.session_store.handle(call_id)
+            if handle is None:
+                self._session_handles.pop(call_id, None)
+                return None
+            self._session_handles[call_id] = handle
+        return handle.session
+
     async def _save_session(self, session: CallSession, *, new: bool = False) -> None:
         """Persist session updates and keep coordinator metrics in sync."""
         await self.session_store.upsert_call(session)
@@ -528,8 +596,16 @@ class Engine:
         """Start the engine and ARI reconnect supervisor."""
         # 1) Load providers first (low risk)
         await self._load_providers()
+        try:
+            await self._start_provider_warm_pools()
+        except Exception as e:
+            logger.warning(f"Failed to start provider warm pools: {e}", exc_info=True)
         
         # Initialize tool calling system
+        try:
+            await configure_http_client_pool(getattr(self.config, "http_client", None))
+        except Exception as e:
+            logger.warning(f"Failed to configure shared HTTP tool client: {e}", exc_info=True)
         try:
             from src.tools.registry import tool_registry
             tool_registry.initialize_default_tools()
@@ -576,6 +652,8 @@ class Engine:
                 "Unexpected error starting pipeline orchestrator - falling back to direct provider mode",
                 error=str(exc),
             )
+        if getattr(self.pipeline_orchestrator, "started", False):
+            self._schedule_tts_prewarm()
 
         # 2) Start health server EARLY so diagnostics are available even if transport/ARI fail
         try:
@@ -677,6 +755,13 @@ class Engine:
                     port_range=port_range,
                     allowed_remote_hosts=allowed_remote_hosts,
                     lock_remote_endpoint=lock_remote_endpoint,
+                    jitter_target_ms=int(getattr(self.config.external_media, "jitter_target_ms", 60)),
+                    jitter_max_ms=int(getattr(self.config.external_media, "jitter_max_ms", 200)),
+                    jitter_adaptive=bool(getattr(self.config.external_media, "jitter_adaptive", True)),
+                    plc_mode=str(getattr(self.config.external_media, "plc_mode", "repeat")),
+                    socket_mode=str(getattr(self.config.external_media, "socket_mode", "per_call")),
+                    shared_socket_count=int(getattr(self.config.external_media, "shared_sockets", 2)),
+                    shared_socket_max=int(getattr(self.config.external_media, "shared_sockets_max", 16)),
                 )
                 
                 # Start RTP server
@@ -994,7 +1079,7 @@ class Engine:
         logger.info("Outbound scheduler started")
         try:
             while True:
-                await asyncio.sleep(1.0)
+                await asyncio.sleep(self._outbound_tick_seconds)
                 # Guard against pre-answer failures that never enter Stasis (prevents capacity lockup).
                 await self._outbound_cleanup_stale_attempts()
                 try:
@@ -1003,6 +1088,7 @@ class Engine:
                     logger.debug("Outbound scheduler: list campaigns failed", exc_info=True)
                     continue
 
+                self._outbound_pacer.forget_campaigns({str(c.get("id") or "") for c in campaigns})
                 if not campaigns:
                     await asyncio.sleep(2.0)
                     continue
@@ -1015,120 +1101,131 @@ class Engine:
                             continue
                         if not self._outbound_campaign_in_window(campaign, now_utc):
                             continue
-
-                        max_concurrent = int(campaign.get("max_concurrent") or 1)
-                        max_concurrent = max(1, min(5, max_concurrent))
-                        inflight = sum(
-                            1
-                            for meta in self._outbound_attempt_meta_by_attempt_id.values()
-                            if str(meta.get("campaign_id") or "") == campaign_id
-                        )
-                        active_outbound = await self.session_store.count_active_outbound_calls(campaign_id=campaign_id)
-                        capacity = max_concurrent - inflight - active_outbound
-                        if capacity <= 0:
-                            continue
-
-                        min_interval = int(campaign.get("min_interval_seconds_between_calls") or 0)
-                        last_ts = float(self._outbound_last_dial_ts.get(campaign_id, 0.0) or 0.0)
-                        if min_interval > 0 and (time.time() - last_ts) < float(min_interval):
-                            continue
-
-                        leads = await self.outbound_store.lease_pending_leads(campaign_id, limit=min(capacity, 1))
-                        if not leads:
-                            await self._outbound_maybe_mark_campaign_completed(
-                                campaign,
-                                inflight=inflight,
-                                active_outbound=active_outbound,
-                            )
-                            continue
-
-                        for lead in leads:
-                            lead_id = str(lead.get("id") or "")
-                            phone = str(lead.get("phone_number") or "").strip()
-                            if not lead_id or not phone:
-                                continue
-
-                            context_name = str(
-                                lead.get("context_override") or campaign.get("default_context") or "default"
-                            ).strip() or "default"
-                            # Best-effort provider resolution for metadata/UI.
-                            resolved_context_provider = None
-                            try:
-                                ctx_cfg = self.transport_orchestrator.get_context_config(context_name)
-                                ctx_provider = getattr(ctx_cfg, "provider", None) if ctx_cfg else None
-                                if isinstance(ctx_provider, str):
-                                    ctx_provider = ctx_provider.strip()
-                                provider_aliases = {
-                                    "openai": "openai_realtime",
-                                    "deepgram_agent": "deepgram",
-                                    "google": "google_live",
-                                }
-                                resolved_context_provider = provider_aliases.get(ctx_provider, ctx_provider)
-                                if resolved_context_provider and resolved_context_provider not in self.providers:
-                                    resolved_context_provider = None
-                            except Exception:
-                                resolved_context_provider = None
-
-                            attempt_id = await self.outbound_store.create_attempt(
-                                campaign_id,
-                                lead_id,
-                                context=context_name,
-                                provider=resolved_context_provider,
-                            )
-                            self._outbound_attempt_meta_by_attempt_id[attempt_id] = {
-                                "attempt_id": attempt_id,
-                                "campaign_id": campaign_id,
-                                "lead_id": lead_id,
-                                "phone_number": phone,
-                                "context": context_name,
-                                "provider": resolved_context_provider,
-                                "lead_name": str(lead.get("name") or "").strip() or None,
-                                "custom_vars": lead.get("custom_vars") or {},
-                                "created_at_ts": time.time(),
-                            }
-
-                            marked = await self.outbound_store.mark_lead_dialing(lead_id)
-                            if not marked:
-                                await self.outbound_store.finish_attempt(
-                                    attempt_id,
-                                    outcome="canceled",
-                                    error_message="Lead not leased (state transition failed)",
-                                )
-                                self._outbound_attempt_meta_by_attempt_id.pop(attempt_id, None)
-                                continue
-
-                            await self._outbound_originate_attempt(campaign, lead, attempt_id)
-                            self._outbound_last_dial_ts[campaign_id] = time.time()
-                            # Respect pacing: only one lead per tick for MVP.
-                            break
+                        await self._outbound_dispatch_campaign(campaign)
                     except Exception as e:
                         # Surface persistent failures (e.g., SQLite perms) in error logs for operators,
                         # but throttle to avoid flooding.
-                        key = campaign_id or "<unknown>"
-                        now_ts = time.time()
-                        last_ts = float(self._outbound_last_campaign_error_log_ts.get(key, 0.0) or 0.0)
-                        is_sqlite_readonly = isinstance(e, sqlite3.OperationalError) and "readonly database" in str(e).lower()
-                        should_error = is_sqlite_readonly or (now_ts - last_ts) >= 30.0
-                        if should_error:
-                            self._outbound_last_campaign_error_log_ts[key] = now_ts
-                            logger.error(
-                                "Outbound scheduler: campaign loop failed",
-                                campaign_id=campaign_id,
-                                error=str(e),
-                                exc_info=True,
-                            )
-                        else:
-                            logger.debug(
-                                "Outbound scheduler: campaign loop failed",
-                                campaign_id=campaign_id,
-                                exc_info=True,
-                            )
+                        self._outbound_log_campaign_error(campaign_id, e)
                         continue
         except asyncio.CancelledError:
             logger.info("Outbound scheduler cancelled")
         except Exception:
             logger.error("Outbound scheduler crashed", exc_info=True)
 
+    async def _outbound_dispatch_campaign(self, campaign: Dict[str, Any]) -> int:
+        """
+        Start as many attempts for one campaign as capacity and pacing allow.
+
+        Leads are claimed and their attempts opened in one store transaction; the
+        originates then run as background tasks (each waiting on its trunk bucket) so
+        a slow ARI round trip or a CPS-limited trunk does not stall other campaigns.
+        Returns the number of attempts started.
+        """
+        campaign_id = str(campaign.get("id") or "")
+        max_concurrent = int(campaign.get("max_concurrent") or 1)
+        max_concurrent = max(1, min(max_concurrent_ceiling(), max_concurrent))
+        inflight = self._outbound_attempt_meta_by_attempt_id.count(campaign_id)
+        active_outbound = await self.session_store.count_active_outbound_calls(campaign_id=campaign_id)
+        capacity = max_concurrent - inflight - active_outbound
+        if capacity <= 0:
+            return 0
+
+        bucket = self._outbound_pacer.campaign(
+            campaign_id, float(campaign.get("min_interval_seconds_between_calls") or 0)
+        )
+        want = min(capacity, self._outbound_lease_batch, bucket.available())
+        if want <= 0:
+            return 0
+
+        leads = await self.outbound_store.start_attempts_batch(
+            campaign_id,
+            limit=want,
+            default_context=str(campaign.get("default_context") or "default"),
+            resolve_provider=self._outbound_resolve_context_provider,
+        )
+        if not leads:
+            await self._outbound_maybe_mark_campaign_completed(
+                campaign,
+                inflight=inflight,
+                active_outbound=active_outbound,
+            )
+            return 0
+        bucket.take(len(leads))
+
+        now_ts = time.time()
+        for lead in leads:
+            attempt_id = str(lead["attempt_id"])
+            self._outbound_attempt_meta_by_attempt_id[attempt_id] = {
+                "attempt_id": attempt_id,
+                "campaign_id": campaign_id,
+                "lead_id": str(lead.get("id") or ""),
+                "phone_number": str(lead.get("phone_number") or "").strip(),
+                "context": lead.get("context"),
+                "provider": lead.get("provider"),
+                "lead_name": str(lead.get("name") or "").strip() or None,
+                "custom_vars": lead.get("custom_vars") or {},
+                "created_at_ts": now_ts,
+            }
+            task = asyncio.create_task(self._outbound_dial(campaign, lead, attempt_id))
+            self._outbound_dial_tasks.add(task)
+            task.add_done_callback(self._outbound_dial_tasks.discard)
+        return len(leads)
+
+    async def _outbound_dial(self, campaign: Dict[str, Any], lead: Dict[str, Any], attempt_id: str) -> None:
+        """Originate one claimed attempt; on unexpected failure close it so capacity is released."""
+        try:
+            await self._outbound_originate_attempt(campaign, lead, attempt_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._outbound_log_campaign_error(str(campaign.get("id") or ""), e)
+            try:
+                await self.outbound_store.finish_attempt(attempt_id, outcome="error", error_message=str(e) or "originate failed")
+                await self.outbound_store.set_lead_state(str(lead.get("id") or ""), state="failed", last_outcome="error")
+            except Exception:
+                logger.debug("Outbound dial cleanup failed", attempt_id=attempt_id, exc_info=True)
+            self._outbound_attempt_meta_by_attempt_id.pop(attempt_id, None)
+
+    def _outbound_log_campaign_error(self, campaign_id: str, e: BaseException) -> None:
+        key = campaign_id or "<unknown>"
+        now_ts = time.time()
+        last_ts = float(self._outbound_last_campaign_error_log_ts.get(key, 0.0) or 0.0)
+        is_sqlite_readonly = isinstance(e, sqlite3.OperationalError) and "readonly database" in str(e).lower()
+        should_error = is_sqlite_readonly or (now_ts - last_ts) >= 30.0
+        if should_error:
+            self._outbound_last_campaign_error_log_ts[key] = now_ts
+            logger.error(
+                "Outbound scheduler: campaign loop failed",
+                campaign_id=campaign_id,
+                error=str(e),
+                exc_info=True,
+            )
+        else:
+            logger.debug(
+                "Outbound scheduler: campaign loop failed",
+                campaign_id=campaign_id,
+                exc_info=True,
+            )
+
+    def _outbound_resolve_context_provider(self, context_name: str) -> Optional[str]:
+        """Provider declared by a context (aliases normalized), or None if unset/unknown."""
+        try:
+            ctx_cfg = self.transport_orchestrator.get_context_config(context_name)
+            ctx_provider = getattr(ctx_cfg, "provider", None) if ctx_cfg else None
+        except Exception:
+            return None
+        if isinstance(ctx_provider, str):
+            ctx_provider = ctx_provider.strip()
+        provider_aliases = {
+            "openai": "openai_realtime",
+            "deepgram_agent": "deepgram",
+            "google": "google_live",
+        }
+        resolved = provider_aliases.get(ctx_provider, ctx_provider)
+        if resolved and resolved not in self.providers:
+            return None
+        return resolved or None
+
     async def _outbound_originate_attempt(self, campaign: Dict[str, Any], lead: Dict[str, Any], attempt_id: str) -> None:
         """Originate a leased+marked lead via FreePBX routing (Local/...@from-internal)."""
         campaign_id = str(campaign.get("id") or "")
@@ -1152,22 +1249,7 @@ class Engine:
         # If a context declares a monolithic provider (e.g., google_live), honor it by setting
         # AI_PROVIDER on the originated channel. This prevents pipeline defaults from taking over
         # when the dialplan does not explicitly set AI_PROVIDER.
-        context_provider = None
-        try:
-            ctx_cfg = self.transport_orchestrator.get_context_config(context_name)
-            context_provider = getattr(ctx_cfg, "provider", None) if ctx_cfg else None
-        except Exception:
-            context_provider = None
-        if isinstance(context_provider, str):
-            context_provider = context_provider.strip()
-        provider_aliases = {
-            "openai": "openai_realtime",
-            "deepgram_agent": "deepgram",
-            "google": "google_live",
-        }
-        resolved_context_provider = provider_aliases.get(context_provider, context_provider)
-        if resolved_context_provider and resolved_context_provider not in self.providers:
-            resolved_context_provider = None
+        resolved_context_provider = self._outbound_resolve_context_provider(context_name)
 
         amd_opts = ""
         try:
@@ -1257,6 +1339,17 @@ class Engine:
 
         endpoint = await self._outbound_choose_endpoint(dial_phone)
         app_args = f"outbound,{attempt_id},{campaign_id},{lead_id}"
+        # Per-trunk CPS (AAVA_OUTBOUND_TRUNK_CPS); a no-op when unlimited. The stale-attempt
+        # watchdog must not reap an attempt that is only queued behind its trunk.
+        pending_meta = self._outbound_attempt_meta_by_attempt_id.get(attempt_id)
+        if pending_meta is not None:
+            pending_meta["pacing_wait"] = True
+        try:
+            await self._outbound_pacer.acquire_trunk(endpoint)
+        finally:
+            if pending_meta is not None:
+                pending_meta.pop("pacing_wait", None)
+                pending_meta["created_at_ts"] = time.time()
 
         logger.info(
             "Outbound originate",
@@ -1368,6 +1461,8 @@ class Engine:
                 created_at_ts = float(meta.get("originated_at_ts") or meta.get("created_at_ts") or 0.0)
                 if not (attempt_id and lead_id and created_at_ts):
                     continue
+                if meta.get("pacing_wait"):
+                    continue
                 if (now - created_at_ts) < stale_after:
                     continue
                 if channel_id and channel_id in self._outbound_awaiting_amd_channel_ids:
@@ -1783,6 +1878,8 @@ class Engine:
             task = getattr(self, "_outbound_scheduler_task", None)
             if task:
                 task.cancel()
+            for dial_task in list(getattr(self, "_outbound_dial_tasks", ())):
+                dial_task.cancel()
         except Exception:
             pass
         
@@ -1838,6 +1935,11 @@ class Engine:
                 await self._health_runner.cleanup()
         except Exception:
             logger.debug("Health server cleanup error", exc_info=True)
+        prewarm = self._tts_prewarm_task
+        if prewarm is not None and not prewarm.done():
+            prewarm.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await prewarm
         # Ensure orchestrator releases component assignments before shutdown.
         try:
             await self.pipeline_orchestrator.stop()
@@ -1849,8 +1951,73 @@ class Engine:
                 await self.mcp_manager.stop()
         except Exception:
             logger.debug("MCP manager stop error", exc_info=True)
+        try:
+            await close_http_client_pool()
+        except Exception:
+            logger.debug("HTTP tool client close error", exc_info=True)
+        try:
+            await self._stop_provider_warm_pools()
+        except Exception:
+            logger.debug("Provider warm pool close error", exc_info=True)
+        try:
+            await close_local_mux_pools()
+        except Exception:
+            logger.debug("Local AI Server mux pool close error", exc_info=True)
+        # Drain write-behind call history (records from the forced cleanup above included).
+        try:
+            from src.core.call_history import close_call_history_store
+
+            await close_call_history_store()
+            pending = list(getattr(self, "_call_history_tasks", ()))
+            if pending:
+                await asyncio.wait(pending, timeout=10.0)
+        except ImportError:
+            pass
+        except Exception:
+            logger.debug("Call history drain error", exc_info=True)
         logger.info("Engine stopped.")
 
+    async def _start_provider_warm_pools(self) -> None:
+        """(Re)start warm pools for the providers listed under warm_pool.providers."""
+        await self._stop_provider_warm_pools()
+        cfg = getattr(self.config, "warm_pool", None)
+        if not cfg or not getattr(cfg, "enabled", False):
+            return
+        for name, size in (getattr(cfg, "providers", None) or {}).items():
+            factory = self.provider_factories.get(name)
+            template = self.providers.get(name)
+            if int(size or 0) <= 0:
+                continue
+            if factory is None or template is None:
+                logger.warning("Warm pool configured for a provider that is not loaded", provider=name)
+                continue
+            if not hasattr(template, "open_warm_connection"):
+                logger.warning("Provider does not support warm pooling", provider=name)
+                continue
+            if hasattr(template, "is_ready") and not template.is_ready():
+                logger.warning("Provider not ready; warm pool not started", provider=name)
+                continue
+            pool = ProviderWarmPool(
+                name,
+                lambda f=factory: f().open_warm_connection(),
+                size=int(size),
+                max_age_sec=float(getattr(cfg, "max_age_sec", 240.0)),
+                refill_backoff_sec=float(getattr(cfg, "refill_backoff_sec", 5.0)),
+            )
+            pool.start()
+            self._provider_warm_pools[name] = pool
+        if self._provider_warm_pools:
+            logger.info(
+                "Provider warm pools started",
+                pools={name: pool.size for name, pool in self._provider_warm_pools.items()},
+                max_age_sec=getattr(cfg, "max_age_sec", None),
+            )
+
+    async def _stop_provider_warm_pools(self) -> None:
+        pools = list(self._provider_warm_pools.values())
+        self._provider_warm_pools.clear()
+        await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
+
     async def _load_providers(self):
         """Load and initialize AI providers from the configuration."""
         # Pipeline adapter suffixes - these are loaded by PipelineOrchestrator, not Engine
@@ -2259,6 +2426,15 @@ class Engine:
                              exc_info=True)
             return None
 
+        # Where Asterisk sends this call's RTP from; shared RTP sockets use it to route the first packet.
+        channelvars = response.get("channelvars") or {}
+        if channelvars.get("UNICASTRTP_LOCAL_PORT"):
+            self.rtp_server.expect_remote(
+                caller_channel_id,
+                channelvars.get("UNICASTRTP_LOCAL_ADDRESS"),
+                channelvars.get("UNICASTRTP_LOCAL_PORT"),
+            )
+
         session = await self.session_store.get_by_call_id(caller_channel_id)
         if session:
             session.pending_external_media_id = channel_id
@@ -3434,17 +3610,227 @@ class Engine:
         finally:
             self._attended_transfer_dtmf_waiters.pop(agent_channel_id, None)
 
-    async def _local_ai_server_tts(self, *, call_id: str, text: str, timeout_sec: float) -> Optional[bytes]:
-        """Synthesize μ-law 8k audio via local-ai-server (hard requirement for attended transfer)."""
+    @staticmethod
+    def _build_tts_cache(config: Any) -> TTSPhraseCache:
+        cfg = getattr(config, "tts_cache", None)
+        return TTSPhraseCache(
+            str(getattr(cfg, "cache_dir", "") or "") or None,
+            memory_max_bytes=int(float(getattr(cfg, "memory_max_mb", 32.0)) * 1024 * 1024),
+            disk_max_bytes=int(float(getattr(cfg, "disk_max_mb", 256.0)) * 1024 * 1024),
+            disk_ttl_sec=float(getattr(cfg, "disk_ttl_hours", 168.0)) * 3600,
+            enabled=bool(getattr(cfg, "enabled", True)) if cfg is not None else True,
+        )
+
+    def _pipeline_tts_cache_key(self, pipeline: PipelineResolution, text: str) -> Optional[str]:
+        """Phrase cache key for ``text`` on the pipeline's TTS adapter (None when caching is off)."""
+        if not self.tts_cache.enabled or not (text or "").strip():
+            return None
+        try:
+            adapter = pipeline.tts_adapter
+            options = pipeline.tts_options or {}
+            if hasattr(adapter, "synthesis_options"):
+                options = adapter.synthesis_options(options)
+            adapter_key = getattr(adapter, "component_key", "") or pipeline.tts_key
+            return make_tts_cache_key(adapter_key, voice_of(options), options, text)
+        except Exception:
+            logger.debug("TTS cache key failed", pipeline=getattr(pipeline, "pipeline_name", None), exc_info=True)
+            return None
+
+    async def _pipeline_tts_bytes(
+        self,
+        call_id: str,
+        pipeline: PipelineResolution,
+        text: str,
+        *,
+        cacheable: bool = True,
+    ) -> bytes:
+        """Synthesize ``text`` on the pipeline TTS adapter, through the phrase cache when ``cacheable``."""
+
+        async def _synthesize() -> bytes:
+            buf = bytearray()
+            async for chunk in pipeline.tts_adapter.synthesize(call_id, text, pipeline.tts_options):
+                if chunk:
+                    buf.extend(chunk)
+            return bytes(buf)
+
+        key = self._pipeline_tts_cache_key(pipeline, text) if cacheable else None
+        if key is None:
+            return await _synthesize()
+        return await self.tts_cache.get_or_synthesize(key, _synthesize) or b""
+
+    def _is_configured_farewell(self, text: Optional[str]) -> bool:
+        """True when ``text`` is the configured hangup farewell (not model-generated), so it may be cached."""
+        if not text:
+            return False
+        tools_cfg = getattr(self.config, "tools", {}) or {}
+        hangup_cfg = tools_cfg.get("hangup_call", {}) if isinstance(tools_cfg, dict) else {}
+        configured = hangup_cfg.get("farewell_message") if isinstance(hangup_cfg, dict) else None
+        return text.strip() in {str(configured or "").strip(), "Goodbye!"} - {""}
+
+    def _prewarm_greetings(self) -> Dict[str, Set[str]]:
+        """Cacheable greetings per pipeline: each context's greeting (or the global one) without template fields."""
+        global_greeting = (getattr(getattr(self.config, "llm", None), "initial_greeting", None) or "").strip()
+        active = getattr(self.config, "active_pipeline", None)
+        pipelines = getattr(self.config, "pipelines", {}) or {}
+        phrases: Dict[str, Set[str]] = {}
+
+        def _add(pipeline_name: Optional[str], text: str) -> None:
+            if pipeline_name and pipeline_name in pipelines and text and "{" not in text:
+                phrases.setdefault(pipeline_name, set()).add(text)
+
+        if global_greeting:
+            _add(active, global_greeting)
+        for ctx in (getattr(self.config, "contexts", {}) or {}).values():
+            get = ctx.get if isinstance(ctx, dict) else (lambda k, _c=ctx: getattr(_c, k, None))
+            provider = get("provider")
+            pipeline_name = get("pipeline") or (provider if provider in pipelines else None) or (None if provider else active)
+            _add(pipeline_name, (get("greeting") or "").strip() or global_greeting)
+        return phrases
+
+    def _schedule_tts_prewarm(self, *, restart: bool = False) -> bool:
+        """Start ``_prewarm_tts_cache`` in a task the engine keeps a reference to.
+
+        A pre-warm that is still running is left alone, or cancelled and
+        replaced when ``restart`` is set. Returns True if a new one started.
+        """
+        running = self._tts_prewarm_task
+        if running is not None and not running.done():
+            if not restart:
+                return False
+            running.cancel()
+        task = asyncio.create_task(self._prewarm_tts_cache(), name="tts-cache-prewarm")
+        self._tts_prewarm_task = task
+        task.add_done_callback(self._tts_prewarm_done)
+        return True
+
+    def _tts_prewarm_done(self, task: asyncio.Task) -> None:
+        if self._tts_prewarm_task is task:
+            self._tts_prewarm_task = None
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("TTS greeting pre-warm failed", error=str(exc), exc_info=exc)
+
+    async def _prewarm_tts_cache(self) -> int:
+        """Synthesize configured greetings into the phrase cache (startup and /reload). Returns phrases added."""
+        cfg = getattr(self.config, "tts_cache", None)
+        if not self.tts_cache.enabled or not bool(getattr(cfg, "prewarm", False)):
+            return 0
+        orchestrator = self.pipeline_orchestrator
+        if not getattr(orchestrator, "started", False) or not orchestrator.enabled:
+            return 0
+        added = 0
+        for pipeline_name, texts in self._prewarm_greetings().items():
+            prewarm_id = f"tts-prewarm-{uuid.uuid4().hex[:8]}"
+            try:
+                pipeline = orchestrator.get_pipeline(prewarm_id, pipeline_name)
+                if pipeline is None:
+                    continue
+                opened = False
+                for text in sorted(texts):
+                    key = self._pipeline_tts_cache_key(pipeline, text)
+                    if key is None or await self.tts_cache.contains(key):
+                        continue
+                    if not opened:
+                        await pipeline.tts_adapter.open_call(prewarm_id, pipeline.tts_options)
+                        opened = True
+                    if await self._pipeline_tts_bytes(prewarm_id, pipeline, text):
+                        added += 1
+            except Exception:
+                logger.warning("TTS greeting pre-warm failed", pipeline=pipeline_name, exc_info=True)
+            finally:
+                try:
+                    await orchestrator.release_pipeline(prewarm_id)
+                except Exception:
+                    logger.debug("TTS pre-warm pipeline release failed", pipeline=pipeline_name, exc_info=True)
+        if added:
+            logger.info("TTS phrase cache pre-warmed", phrases=added, **self.tts_cache.stats())
+        return added
+
+    async def _local_ai_server_tts(
+        self,
+        *,
+        call_id: str,
+        text: str,
+        timeout_sec: float,
+        cacheable: bool = False,
+    ) -> Optional[bytes]:
+        """Synthesize μ-law 8k audio via local-ai-server (hard requirement for attended transfer).
+
+        ``cacheable`` routes fixed prompts (no per-call template values) through the phrase cache.
+        """
+        providers = getattr(self.config, "providers", {}) or {}
+        local_cfg = providers.get("local") if isinstance(providers, dict) else None
+        if not isinstance(local_cfg, dict) or not bool(local_cfg.get("enabled", True)):
+            return None
+        if not cacheable or not self.tts_cache.enabled:
+            return await self._local_ai_server_tts_request(local_cfg, call_id=call_id, text=text, timeout_sec=timeout_sec)
+
+        def synthesize():
+            return self._local_ai_server_tts_request(local_cfg, call_id=call_id, text=text, timeout_sec=timeout_sec)
+
+        # The voice is whatever model the server has loaded, which can change without our config changing.
+        loaded_tts = await self._local_ai_server_tts_model(local_cfg, timeout_sec=timeout_sec)
+        if loaded_tts is None:
+            return await synthesize()
+        options = {k: v for k, v in local_cfg.items() if "tts" in str(k).lower()}
+        options["base_url"] = str(local_cfg.get("base_url") or local_cfg.get("ws_url") or "").strip()
+        options["server_tts"] = loaded_tts
+        options["format"] = {"encoding": "ulaw", "sample_rate": 8000}
+        key = make_tts_cache_key("local_ai_server", voice_of(options), options, text)
+        return await self.tts_cache.get_or_synthesize(key, synthesize)
+
+    async def _local_ai_server_tts_model(self, local_cfg: Dict[str, Any], *, timeout_sec: float) -> Optional[Dict[str, Any]]:
+        """TTS backend/model the local-ai-server reports in its status (cached briefly), else None."""
+        ws_url = str(local_cfg.get("base_url") or local_cfg.get("ws_url") or "").strip()
+        if not ws_url:
+            return None
+        cached = self._local_tts_models.get(ws_url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
         try:
-            import base64
             import json
             import websockets
 
-            providers = getattr(self.config, "providers", {}) or {}
-            local_cfg = providers.get("local") if isinstance(providers, dict) else None
-            if not isinstance(local_cfg, dict) or not bool(local_cfg.get("enabled", True)):
+            auth_token = str(local_cfg.get("auth_token") or "").strip() or None
+            async with websockets.connect(ws_url, open_timeout=float(timeout_sec), ping_interval=None) as ws:
+                if auth_token:
+                    await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
+                await ws.send(json.dumps({"type": "status"}))
+                deadline = time.time() + max(0.1, float(timeout_sec))
+                while time.time() < deadline:
+                    msg = await asyncio.wait_for(ws.recv(), timeout=max(0.1, float(deadline - time.time())))
+                    if isinstance(msg, bytes):
+                        continue
+                    try:
+                        data = json.loads(msg)
+                    except Exception:
+                        continue
+                    if data.get("type") != "status_response":
+                        continue
+                    tts = (data.get("models") or {}).get("tts") or {}
+                    model = {k: tts.get(k) for k in ("backend", "path", "display")}
+                    self._local_tts_models[ws_url] = (time.monotonic() + _LOCAL_TTS_MODEL_TTL_SEC, model)
+                    return model
                 return None
+        except Exception:
+            logger.debug("Local AI Server status failed", ws_url=ws_url, exc_info=True)
+            return None
+
+    async def _local_ai_server_tts_request(
+        self,
+        local_cfg: Dict[str, Any],
+        *,
+        call_id: str,
+        text: str,
+        timeout_sec: float,
+    ) -> Optional[bytes]:
+        try:
+            import base64
+            import json
+            import websockets
+
             ws_url = str(local_cfg.get("base_url") or local_cfg.get("ws_url") or "").strip()
             if not ws_url:
                 return None
@@ -3647,7 +4033,12 @@ class Engine:
         )
 
         # Step A: Play one-way announcement to agent (hard requirement: Local AI Server TTS).
-        announcement_audio = await self._local_ai_server_tts(call_id=caller_id, text=announcement_text, timeout_sec=tts_timeout)
+        announcement_audio = await self._local_ai_server_tts(
+            call_id=caller_id,
+            text=announcement_text,
+            timeout_sec=tts_timeout,
+            cacheable="{" not in announcement_template,
+        )
         if not announcement_audio:
             logger.warning("Attended transfer requires Local AI Server TTS; aborting", call_id=caller_id)
             await self._attended_transfer_abort_and_resume(session, channel_id, reason="tts-unavailable")
@@ -3663,7 +4054,12 @@ class Engine:
         # Step B: Collect DTMF acceptance/decline (early digits during announcement are honored).
         digit = self._attended_transfer_dtmf_digits.get(channel_id)
         if digit not in {accept_digit, decline_digit}:
-            prompt_audio = await self._local_ai_server_tts(call_id=caller_id, text=prompt_text, timeout_sec=tts_timeout)
+            prompt_audio = await self._local_ai_server_tts(
+                call_id=caller_id,
+                text=prompt_text,
+                timeout_sec=tts_timeout,
+                cacheable="{" not in prompt_template,
+            )
             if not prompt_audio:
                 logger.warning("Attended transfer prompt TTS failed; aborting", call_id=caller_id)
                 await self._attended_transfer_abort_and_resume(session, channel_id, reason="tts-unavailable")
@@ -3736,7 +4132,12 @@ class Engine:
                         session.audio_capture_enabled = False
                     except Exception:
                         pass
-                    prompt_audio = await self._local_ai_server_tts(call_id=call_id, text=caller_prompt.strip(), timeout_sec=tts_timeout)
+                    prompt_audio = await self._local_ai_server_tts(
+                        call_id=call_id,
+                        text=caller_prompt.strip(),
+                        timeout_sec=tts_timeout,
+                        cacheable=True,
+                    )
                     if prompt_audio:
                         await self._play_ulaw_bytes_on_channel_and_wait(
                             channel_id=session.caller_channel_id,
@@ -3784,6 +4185,7 @@ class Engine:
                 call_id=call_id,
                 text=caller_connected_prompt.strip(),
                 timeout_sec=float(tts_timeout),
+                cacheable=True,
             )
             if prompt_audio:
                 await self._play_ulaw_bytes_on_channel_and_wait(
@@ -4469,6 +4871,7 @@ class Engine:
                 except Exception:
                     logger.debug("Pipeline talk detect disable failed", call_id=call_id, exc_info=True)
                 self._pipeline_forced.pop(call_id, None)
+                self._pipeline16k_stages.pop(call_id, None)
             except Exception:
                 logger.debug("Pipeline cleanup failed", call_id=call_id, exc_info=True)
 
@@ -4613,6 +5016,7 @@ class Engine:
 
             # Finally remove the session.
             await self.session_store.remove_call(call_id)
+            self._session_handles.pop(call_id, None)
 
             # Best-effort cleanup of attended transfer agent channel mappings for this call.
             try:
@@ -4754,72 +5158,79 @@ class Engine:
                 caller_audio_format=session.caller_audio_format,
                 codec_alignment_ok=session.codec_alignment_ok,
                 barge_in_count=barge_in_count,
+                audio_health=session.audio_health.summary() if session.audio_health else {},
             )
             
-            saved = await store.save(record)
-            if saved:
-                logger.debug("Call history record saved", call_id=call_id, record_id=record.id)
-
-                # CallHistoryStore.save(...) is dedupe-by-call_id; when a record already exists,
-                # `record.id` is not the persisted row id. Resolve the persisted id so outbound
-                # attempts can link to the correct Call History row for UI click-through.
-                persisted_record_id = record.id
-                try:
-                    persisted = await store.get_by_call_id(call_id)
-                    if persisted and getattr(persisted, "id", None):
-                        persisted_record_id = str(getattr(persisted, "id"))
-                except Exception:
-                    persisted_record_id = record.id
-
-                # Outbound attempt linkage: store call history record id for UI click-through.
-                try:
-                    if getattr(session, "is_outbound", False) and getattr(session, "outbound_attempt_id", None):
-                        attempt_id = str(getattr(session, "outbound_attempt_id") or "")
-                        lead_id = str(getattr(session, "outbound_lead_id") or "")
-                        if attempt_id:
-                            amd = self._outbound_attempt_amd.get(attempt_id) if hasattr(self, "_outbound_attempt_amd") else None
-                            # Normalize final outcome (MVP: answered vs error)
-                            final_outcome = "answered_human"
-                            if session.error_message:
-                                final_outcome = "error"
-                            elif session.transfer_destination:
-                                final_outcome = "transferred"
-
-                            await self.outbound_store.finish_attempt(
-                                attempt_id,
-                                outcome=final_outcome,
-                                amd_status=(amd or {}).get("amd_status"),
-                                amd_cause=(amd or {}).get("amd_cause"),
-                                consent_dtmf=(amd or {}).get("consent_dtmf"),
-                                consent_result=(amd or {}).get("consent_result"),
-                                context=getattr(session, "context_name", None),
-                                provider=getattr(session, "provider_name", None),
-                                call_history_call_id=persisted_record_id,
-                                error_message=session.error_message,
-                            )
-                            if lead_id:
-                                try:
-                                    await self.outbound_store.set_lead_state(
-                                        lead_id,
-                                        state="completed" if final_outcome != "error" else "failed",
-                                        last_outcome=final_outcome,
-                                    )
-                                except Exception:
-                                    pass
-                            # Drop in-memory attempt tracking
-                            try:
-                                self._outbound_attempt_meta_by_attempt_id.pop(attempt_id, None)
-                                self._outbound_attempt_meta_by_channel_id.pop(call_id, None)
-                                self._outbound_attempt_amd.pop(attempt_id, None)
-                            except Exception:
-                                pass
-                except Exception:
-                    logger.debug("Failed to finalize outbound attempt from call history", call_id=call_id, exc_info=True)
+            # Write-behind: the record is committed with the next batch; cleanup does not wait.
+            persisted = store.enqueue(record)
+            if getattr(session, "is_outbound", False) and getattr(session, "outbound_attempt_id", None):
+                task = asyncio.create_task(self._finalize_outbound_attempt_from_history(session, call_id, persisted))
+                self._call_history_tasks.add(task)
+                task.add_done_callback(self._call_history_tasks.discard)
         except ImportError:
             logger.debug("Call history module not available", call_id=call_id)
         except Exception as e:
             logger.debug("Failed to persist call history", call_id=call_id, error=str(e))
 
+    async def _finalize_outbound_attempt_from_history(
+        self,
+        session: CallSession,
+        call_id: str,
+        persisted: "asyncio.Future[Optional[str]]",
+    ) -> None:
+        """Close the outbound attempt once its Call History row is committed (for UI click-through).
+
+        The attempt is closed even when the record was not saved (store disabled
+        or a bad record), so campaign capacity is always released.
+        """
+        persisted_record_id = await persisted
+        if persisted_record_id:
+            logger.debug("Call history record saved", call_id=call_id, record_id=persisted_record_id)
+        else:
+            logger.debug("Call history record not saved; closing outbound attempt without it", call_id=call_id)
+        try:
+            attempt_id = str(getattr(session, "outbound_attempt_id") or "")
+            lead_id = str(getattr(session, "outbound_lead_id") or "")
+            if attempt_id:
+                amd = self._outbound_attempt_amd.get(attempt_id) if hasattr(self, "_outbound_attempt_amd") else None
+                # Normalize final outcome (MVP: answered vs error)
+                final_outcome = "answered_human"
+                if session.error_message:
+                    final_outcome = "error"
+                elif session.transfer_destination:
+                    final_outcome = "transferred"
+
+                await self.outbound_store.finish_attempt(
+                    attempt_id,
+                    outcome=final_outcome,
+                    amd_status=(amd or {}).get("amd_status"),
+                    amd_cause=(amd or {}).get("amd_cause"),
+                    consent_dtmf=(amd or {}).get("consent_dtmf"),
+                    consent_result=(amd or {}).get("consent_result"),
+                    context=getattr(session, "context_name", None),
+                    provider=getattr(session, "provider_name", None),
+                    call_history_call_id=persisted_record_id,
+                    error_message=session.error_message,
+                )
+                if lead_id:
+                    try:
+                        await self.outbound_store.set_lead_state(
+                            lead_id,
+                            state="completed" if final_outcome != "error" else "failed",
+                            last_outcome=final_outcome,
+                        )
+                    except Exception:
+                        pass
+                # Drop in-memory attempt tracking
+                try:
+                    self._outbound_attempt_meta_by_attempt_id.pop(attempt_id, None)
+                    self._outbound_attempt_meta_by_channel_id.pop(call_id, None)
+                    self._outbound_attempt_amd.pop(attempt_id, None)
+                except Exception:
+                    pass
+        except Exception:
+            logger.debug("Failed to finalize outbound attempt from call history", call_id=call_id, exc_info=True)
+
     async def _resolve_audio_profile(self, session: CallSession, channel_id: str) -> None:
         """Resolve TransportProfile and provider prefs from profiles/contexts.
 
@@ -5099,7 +5510,7 @@ class Engine:
                     conn_id=conn_id,
                 )
 
-            session = await self.session_store.get_by_call_id(caller_channel_id)
+            session = self._live_session(caller_channel_id)
             if not session:
                 logger.debug("No session for caller; dropping AudioSocket audio", conn_id=conn_id, caller_channel_id=caller_channel_id)
                 return
@@ -5139,10 +5550,10 @@ class Engine:
                     except Exception:
                         as_fmt = 'ulaw'
                     if as_fmt in ('slin16', 'linear16', 'pcm16'):
-                        rms_native = audioop.rms(audio_bytes, 2)
+                        rms_native = pcm_ops.rms(audio_bytes)
                         try:
-                            swapped = audioop.byteswap(audio_bytes, 2)
-                            rms_swapped = audioop.rms(swapped, 2)
+                            swapped = pcm_ops.byteswap(audio_bytes)
+                            rms_swapped = pcm_ops.rms(swapped)
                         except Exception:
                             rms_swapped = 0
                         logger.info(
@@ -5174,8 +5585,8 @@ class Engine:
                             pass
                     else:
                         try:
-                            pcm = audioop.ulaw2lin(audio_bytes, 2)
-                            rms_pcm = audioop.rms(pcm, 2)
+                            pcm = mulaw_to_pcm16le(audio_bytes)
+                            rms_pcm = pcm_ops.rms(pcm)
                         except Exception:
                             rms_pcm = 0
                         logger.info(
@@ -5229,12 +5640,12 @@ class Engine:
             try:
                 if pcm_bytes:
                     try:
-                        mean = int(audioop.avg(pcm_bytes, 2))
+                        mean = int(pcm_ops.avg(pcm_bytes))
                     except Exception:
                         mean = 0
                     if mean:
                         try:
-                            pcm_bytes = audioop.bias(pcm_bytes, 2, -mean)
+                            pcm_bytes = pcm_ops.bias(pcm_bytes, -mean)
                         except Exception:
                             pass
                     # DC-block IIR filter DISABLED - was causing progressive audio level collapse
@@ -5284,7 +5695,7 @@ class Engine:
                     if tts_elapsed_ms < initial_protect:
                         return
                     try:
-                        energy = audioop.rms(pcm_bytes, 2)
+                        energy = pcm_ops.rms(pcm_bytes)
                     except Exception:
                         energy = 0
                     threshold = int(getattr(cfg, "pipeline_energy_threshold", 0) or getattr(cfg, "energy_threshold", 1000))
@@ -5359,7 +5770,7 @@ class Engine:
                         if pcm16 and pcm_rate != 16000:
                             try:
                                 state = self._resample_state_pipeline16k.get(caller_channel_id)
-                                pcm16, state = audioop.ratecv(pcm16, 2, 1, pcm_rate, 16000, state)
+                                pcm16, state = resample_audio(pcm16, pcm_rate, 16000, state=state)
                                 self._resample_state_pipeline16k[caller_channel_id] = state
                             except Exception:
                                 pcm16 = pcm_bytes
@@ -5452,10 +5863,8 @@ class Engine:
 
                 if squelch_applicable and pcm_bytes:
                     try:
-                        import audioop
-
                         state = session.vad_state.setdefault("upstream_squelch", {})
-                        energy = int(audioop.rms(pcm_bytes, 2)) if pcm_bytes else 0
+                        energy = int(pcm_ops.rms(pcm_bytes)) if pcm_bytes else 0
 
                         base_rms = 200
                         noise_factor = 2.5
@@ -5808,7 +6217,7 @@ class Engine:
                 else:
                     try:
                         pcm16_frame = pcm_bytes
-                        energy = audioop.rms(pcm16_frame, 2) if pcm16_frame else 0
+                        energy = pcm_ops.rms(pcm16_frame) if pcm16_frame else 0
                     except Exception:
                         energy = 0
 
@@ -5938,7 +6347,7 @@ class Engine:
                         if pcm16 and pcm_rate != 16000:
                             try:
                                 state = self._resample_state_pipeline16k.get(caller_channel_id)
-                                pcm16, state = audioop.ratecv(pcm16, 2, 1, pcm_rate, 16000, state)
+                                pcm16, state = resample_audio(pcm16, pcm_rate, 16000, state=state)
                                 self._resample_state_pipeline16k[caller_channel_id] = state
                             except Exception:
                                 pcm16 = pcm_bytes
@@ -5956,7 +6365,7 @@ class Engine:
 
             # Pre-guard RMS for instrumentation
             try:
-                pre_guard_rms = audioop.rms(pcm_bytes, 2) if pcm_bytes else 0
+                pre_guard_rms = pcm_ops.rms(pcm_bytes) if pcm_bytes else 0
             except Exception:
                 pre_guard_rms = 0
 
@@ -6006,7 +6415,7 @@ class Engine:
 
             # Post-guard RMS instrumentation
             try:
-                post_guard_rms = audioop.rms(pcm_payload, 2) if pcm_payload else 0
+                post_guard_rms = pcm_ops.rms(pcm_payload) if pcm_payload else 0
             except Exception:
                 post_guard_rms = 0
             try:
@@ -6135,13 +6544,13 @@ class Engine:
                 # Normalize endian if probe indicated swap
                 try:
                     if bool(session.vad_state.get('pcm16_inbound_swap', False)):
-                        pcm_src = audioop.byteswap(pcm_src, 2)
+                        pcm_src = pcm_ops.byteswap(pcm_src)
                 except Exception:
                     pass
             if src_rate != 8000:
                 try:
                     state = self._resample_state_vad8k.get(session.call_id)
-                    pcm16, state = audioop.ratecv(pcm_src, 2, 1, src_rate, 8000, state)
+                    pcm16, state = resample_audio(pcm_src, src_rate, 8000, state=state)
                     self._resample_state_vad8k[session.call_id] = state
                 except Exception:
                     pcm16 = pcm_src
@@ -6202,7 +6611,7 @@ class Engine:
         try:
             if src_rate != 8000:
                 state = self._resample_state_vad8k.get(session.call_id)
-                pcm16_8k, state = audioop.ratecv(pcm16_bytes, 2, 1, src_rate, 8000, state)
+                pcm16_8k, state = resample_audio(pcm16_bytes, src_rate, 8000, state=state)
                 self._resample_state_vad8k[session.call_id] = state
             else:
                 pcm16_8k = pcm16_bytes
@@ -6331,7 +6740,7 @@ class Engine:
 
             # Energy fallback
             try:
-                energy = int(vad_result.energy_level) if vad_result else int(audioop.rms(pcm16, 2) if pcm16 else 0)
+                energy = int(vad_result.energy_level) if vad_result else int(pcm_ops.rms(pcm16) if pcm16 else 0)
             except Exception:
                 energy = 0
 
@@ -6650,7 +7059,7 @@ class Engine:
         Do not infer SSRC→call mappings in the engine; that is not concurrency-safe.
         """
         try:
-            session = await self.session_store.get_by_call_id(caller_channel_id)
+            session = self._live_session(caller_channel_id)
             if not session:
                 logger.debug(
                     "No session for call; dropping RTP audio",
@@ -6721,7 +7130,7 @@ class Engine:
                     if tts_elapsed_ms < initial_protect:
                         return
                     try:
-                        energy = audioop.rms(pcm_16k, 2)
+                        energy = pcm_ops.rms(pcm_16k)
                     except Exception:
                         energy = 0
                     threshold = int(getattr(cfg, "pipeline_energy_threshold", 0) or getattr(cfg, "energy_threshold", 1000))
@@ -6951,7 +7360,7 @@ class Engine:
 
                 # Barge-in detection on PCM16 energy
                 try:
-                    energy = audioop.rms(pcm_16k, 2)
+                    energy = pcm_ops.rms(pcm_16k)
                 except Exception:
                     energy = 0
                 threshold = int(getattr(cfg, 'energy_threshold', 1000))
@@ -7655,7 +8064,7 @@ class Engine:
                 out_chunk = chunk
                 if enc in ("linear16", "pcm16", "slin", "slin16") and rate and wire_rate and rate != wire_rate:
                     try:
-                        out_chunk, _ = audioop.ratecv(chunk, 2, 1, rate, wire_rate, None)
+                        out_chunk, _ = resample_audio(chunk, rate, wire_rate)
                         seq = self._provider_chunk_seq.get(call_id, 0) + 1
                         self._provider_chunk_seq[call_id] = seq
                         logger.info(
@@ -8397,10 +8806,11 @@ class Engine:
         except Exception as exc:
             logger.error("Error handling provider event", error=str(exc), exc_info=True)
 
-    def _as_to_pcm16_16k(self, audio_bytes: bytes) -> bytes:
+    def _as_to_pcm16_16k(self, audio_bytes: bytes, call_id: Optional[str] = None) -> bytes:
         """Convert AudioSocket inbound bytes to PCM16 @ 16 kHz for pipeline STT.
 
-        Assumes AudioSocket format is 8 kHz μ-law (default) or PCM16.
+        Assumes AudioSocket format is 8 kHz μ-law (default) or PCM16.  Resampler
+        state is kept per call (``call_id``), so consecutive frames join seamlessly.
         """
         try:
             fmt = None
@@ -8409,19 +8819,14 @@ class Engine:
                     fmt = (self.config.audiosocket.format or 'ulaw').lower()
             except Exception:
                 fmt = 'ulaw'
+            key = call_id or 'pipeline'
+            stage = self._pipeline16k_stages.get(key)
+            if stage is None:
+                stage = self._pipeline16k_stages[key] = Pcm16kInputStage()
             if fmt in ('ulaw', 'mulaw', 'g711_ulaw'):
-                pcm8k = audioop.ulaw2lin(audio_bytes, 2)
-            else:
-                # Treat as PCM16 8 kHz
-                pcm8k = audio_bytes
-            try:
-                # Use pipeline16k resample state under synthetic key 'pipeline'
-                state = self._resample_state_pipeline16k.get('pipeline')
-                pcm16, state = audioop.ratecv(pcm8k, 2, 1, 8000, 16000, state)
-                self._resample_state_pipeline16k['pipeline'] = state
-            except Exception:
-                pcm16 = pcm8k
-            return pcm16
+                return stage.convert(audio_bytes, 'ulaw')
+            # Treat as PCM16 8 kHz
+            return stage.convert(audio_bytes, 'pcm16_8k')
         except Exception:
             logger.debug("AudioSocket -> PCM16 16k conversion failed", exc_info=True)
             return audio_bytes
@@ -8452,6 +8857,179 @@ class Engine:
         self._pipeline_tasks[call_id] = task
         logger.info("Pipeline runner started", call_id=call_id, pipeline=session.pipeline_name)
 
+    @staticmethod
+    def _pipeline_tts_format(pipeline: Any) -> Tuple[str, int]:
+        """Resolve (encoding, sample_rate) of the pipeline TTS output for streaming playback."""
+        tts_format = (pipeline.tts_options or {}).get("format")
+        if not isinstance(tts_format, dict):
+            tts_format = (pipeline.tts_options or {}).get("target_format")
+        if not isinstance(tts_format, dict):
+            tts_format = {}
+        tts_encoding = str(tts_format.get("encoding") or tts_format.get("format") or "mulaw")
+        try:
+            tts_rate = int(tts_format.get("sample_rate") or tts_format.get("sample_rate_hz") or 8000)
+        except Exception:
+            tts_rate = 8000
+        return tts_encoding, tts_rate
+
+    async def _pipeline_stream_llm_to_tts(
+        self,
+        call_id: str,
+        session: CallSession,
+        pipeline: Any,
+        transcript_text: str,
+        context_for_llm: Dict[str, Any],
+        llm_options: Dict[str, Any],
+        *,
+        t_start: Optional[float],
+        turn_start_time: float,
+        pipeline_label: str,
+        provider_label: str,
+    ) -> Tuple[Optional[LLMResponse], Optional[str], str]:
+        """Stream LLM deltas into sentence-chunked TTS on one streaming playback.
+
+        TTS starts on the first complete clause while the LLM keeps generating.
+        Segments are synthesized in order by a single consumer so audio stays
+        sequential. Text-embedded tool-call markup is never spoken; structured
+        tool calls arrive on the final ``LLMResponse`` and are returned for the
+        normal tool path.
+
+        Returns ``(llm_response, playback_id, spoken_text)``; ``llm_response``
+        is None if generation failed before producing anything.
+        """
+        segmenter = SentenceSegmenter()
+        guard = ToolMarkupGuard()
+        segment_q: asyncio.Queue = asyncio.Queue()
+        stream_q: asyncio.Queue = asyncio.Queue(maxsize=256)
+        playback_id: Optional[str] = None
+        spoken: List[str] = []
+        deltas: List[str] = []
+        final: Optional[LLMResponse] = None
+        tts_task: Optional[asyncio.Task] = None
+        old_provider_name = getattr(session, "provider_name", None)
+        llm_mode = "streaming" if getattr(pipeline.llm_adapter, "supports_streaming", False) else "batch"
+
+        async def synthesize_segments() -> None:
+            first_audio = True
+            while True:
+                segment = await segment_q.get()
+                if segment is None:
+                    break
+                try:
+                    async for tts_chunk in pipeline.tts_adapter.synthesize(call_id, segment, pipeline.tts_options):
+                        if not tts_chunk:
+                            continue
+                        if first_audio:
+                            first_audio = False
+                            now = time.time()
+                            session.turn_latencies_ms.append((now - turn_start_time) * 1000)
+                            try:
+                                if t_start is not None:
+                                    _TURN_STT_TO_TTS.labels(pipeline_label, provider_label).observe(max(0.0, now - t_start))
+                                    _TURN_FIRST_AUDIO_SECONDS.labels(pipeline_label, provider_label, llm_mode).observe(
+                                        max(0.0, now - t_start)
+                                    )
+                            except Exception:
+                                pass
+                        try:
+                            stream_q.put_nowait(tts_chunk)
+                        except asyncio.QueueFull:
+                            logger.debug("Pipeline streaming queue full; dropping TTS chunk", call_id=call_id)
+                except Exception:
+                    logger.warning("Pipeline segment TTS failed", call_id=call_id, segment_preview=segment[:60], exc_info=True)
+
+        async def speak(segment: str) -> None:
+            nonlocal playback_id, tts_task
+            if playback_id is None:
+                session.provider_name = "pipeline"
+                await self.session_store.upsert_call(session)
+                tts_encoding, tts_rate = self._pipeline_tts_format(pipeline)
+                playback_id = await self.streaming_playback_manager.start_streaming_playback(
+                    call_id,
+                    stream_q,
+                    playback_type="pipeline-tts",
+                    source_encoding=tts_encoding,
+                    source_sample_rate=tts_rate,
+                )
+                if not playback_id:
+                    raise RuntimeError("start_streaming_playback returned no stream_id")
+                tts_task = asyncio.create_task(synthesize_segments())
+            spoken.append(segment)
+            await segment_q.put(segment)
+
+        try:
+            first_delta = True
+            async for item in pipeline.llm_adapter.generate_stream(
+                call_id, transcript_text, context_for_llm, llm_options
+            ):
+                if isinstance(item, LLMResponse):
+                    final = item
+                    if deltas:
+                        continue
+                    text = item.text or ""
+                else:
+                    text = str(item or "")
+                    deltas.append(text)
+                if not text:
+                    continue
+                if first_delta:
+                    first_delta = False
+                    try:
+                        if t_start is not None and llm_mode == "streaming":
+                            _TURN_LLM_FIRST_TOKEN_SECONDS.labels(pipeline_label, provider_label).observe(
+                                max(0.0, time.time() - t_start)
+                            )
+                    except Exception:
+                        pass
+                for segment in segmenter.push(guard.push(text)):
+                    await speak(segment)
+
+            tail = segmenter.push(guard.flush())
+            rest = segmenter.flush()
+            for segment in tail + ([rest] if rest else []):
+                await speak(segment)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("LLM generate_stream failed", call_id=call_id, exc_info=True)
+            if not deltas and final is None:
+                return None, playback_id, ""
+        finally:
+            if tts_task is not None:
+                await segment_q.put(None)
+                try:
+                    await tts_task
+                except asyncio.CancelledError:
+                    tts_task.cancel()
+                    raise
+                finally:
+                    try:
+                        stream_q.put_nowait(None)
+                    except asyncio.QueueFull:
+                        asyncio.create_task(stream_q.put(None))
+                    try:
+                        if old_provider_name is not None:
+                            session.provider_name = old_provider_name
+                            await self.session_store.upsert_call(session)
+                    except Exception:
+                        pass
+
+        if final is None:
+            final = LLMResponse(text="".join(deltas))
+        elif deltas and not final.text:
+            final.text = "".join(deltas)
+        if guard.markup_seen:
+            clean_text, parsed_calls = parse_response_with_tools(final.text or "")
+            final.text = clean_text or ""
+            if not final.tool_calls:
+                final.tool_calls = parsed_calls or []
+        try:
+            if playback_id and t_start is not None:
+                _TURN_RESPONSE_SECONDS.labels(pipeline_label, provider_label).observe(max(0.0, time.time() - t_start))
+        except Exception:
+            pass
+        return final, playback_id, " ".join(spoken)
+
     async def _pipeline_runner(self, call_id: str) -> None:
         """Minimal adapter-driven loop: STT -> LLM -> TTS -> file playback.
 
@@ -8612,6 +9190,8 @@ class Engine:
             # Fallback chain: AI_CONTEXT → global llm_config → empty
             greeting = ""
             greeting_source = "none"
+            # Greetings without per-call template fields are served from the TTS phrase cache
+            greeting_cacheable = False
             try:
                 # Priority 1: Check if context has a custom greeting
                 # Use session.context_name (persisted string) instead of transport_profile.context
@@ -8621,6 +9201,7 @@ class Engine:
                     if context_config and context_config.greeting:
                         greeting = self._apply_prompt_template_substitution(context_config.greeting.strip(), session)
                         greeting_source = "context_injection"
+                        greeting_cacheable = "{" not in context_config.greeting
                         logger.info(
                             "Pipeline greeting resolved from context",
                             call_id=call_id,
@@ -8634,6 +9215,7 @@ class Engine:
                     if global_greeting:
                         greeting = self._apply_prompt_template_substitution(global_greeting, session)
                         greeting_source = "global_llm_config"
+                        greeting_cacheable = "{" not in global_greeting
                         logger.info(
                             "Pipeline greeting resolved from global config",
                             call_id=call_id,
@@ -8688,14 +9270,33 @@ class Engine:
                             if not stream_id:
                                 raise RuntimeError("start_streaming_playback returned no stream_id")
                             any_audio = False
-                            async for chunk in pipeline.tts_adapter.synthesize(call_id, greeting, pipeline.tts_options):
-                                if not chunk:
-                                    continue
+                            cache_key = self._pipeline_tts_cache_key(pipeline, greeting) if greeting_cacheable else None
+                            cached = await self.tts_cache.get(cache_key) if cache_key else None
+                            if cached:
+                                # Cached audio is already in the TTS wire format; feed it in ~100 ms pieces,
+                                # sized so the whole phrase fits the queue.
+                                bytes_per_sec = tts_rate * (1 if tts_encoding.lower() in ("mulaw", "ulaw", "g711_ulaw") else 2)
+                                piece = max(bytes_per_sec // 10, -(-len(cached) // (q.maxsize - 1)))
+                                piece += piece % 2
+                                for offset in range(0, len(cached), piece):
+                                    q.put_nowait(cached[offset:offset + piece])
                                 any_audio = True
-                                try:
-                                    q.put_nowait(chunk)
-                                except asyncio.QueueFull:
-                                    logger.debug("Pipeline greeting streaming queue full; dropping chunk", call_id=call_id)
+                            else:
+                                if cache_key:
+                                    self.tts_cache.record_miss()
+                                synthesized = bytearray()
+                                async for chunk in pipeline.tts_adapter.synthesize(call_id, greeting, pipeline.tts_options):
+                                    if not chunk:
+                                        continue
+                                    any_audio = True
+                                    if cache_key:
+                                        synthesized.extend(chunk)
+                                    try:
+                                        q.put_nowait(chunk)
+                                    except asyncio.QueueFull:
+                                        logger.debug("Pipeline greeting streaming queue full; dropping chunk", call_id=call_id)
+                                if cache_key and synthesized:
+                                    await self.tts_cache.put(cache_key, bytes(synthesized))
                             try:
                                 q.put_nowait(None)
                             except asyncio.QueueFull:
@@ -8715,10 +9316,7 @@ class Engine:
                                 except Exception as e:
                                     logger.warning("Failed to persist greeting history", call_id=call_id, error=str(e))
                         else:
-                            tts_bytes = bytearray()
-                            async for chunk in pipeline.tts_adapter.synthesize(call_id, greeting, pipeline.tts_options):
-                                if chunk:
-                                    tts_bytes.extend(chunk)
+                            tts_bytes = await self._pipeline_tts_bytes(call_id, pipeline, greeting, cacheable=greeting_cacheable)
                             if not tts_bytes:
                                 logger.warning(
                                     "Pipeline greeting produced no audio",
@@ -9018,16 +9616,37 @@ class Engine:
                     # System prompt only in first turn (when history is empty)
                     context_for_llm = {"prior_messages": list(conversation_history)}
                     
-                    try:
-                        llm_result = await pipeline.llm_adapter.generate(
+                    # Streaming mode (pipeline llm option `streaming: true`): speak sentence
+                    # chunks while the LLM is still generating. File downstream keeps the
+                    # whole-response path since it cannot start playback incrementally.
+                    streamed_playback_id: Optional[str] = None
+                    streamed_text = ""
+                    if bool((llm_options or {}).get("streaming")) and self.config.downstream_mode != "file":
+                        llm_result, streamed_playback_id, streamed_text = await self._pipeline_stream_llm_to_tts(
                             call_id,
+                            session,
+                            pipeline,
                             transcript_text,
-                            context_for_llm,  # Include conversation history
-                            llm_options,  # Use context-injected options (includes system_prompt)
+                            context_for_llm,
+                            llm_options,
+                            t_start=t_start,
+                            turn_start_time=turn_start_time,
+                            pipeline_label=pipeline_label,
+                            provider_label=provider_label,
                         )
-                    except Exception:
-                        logger.debug("LLM generate failed", call_id=call_id, exc_info=True)
-                        return
+                        if llm_result is None:
+                            return
+                    else:
+                        try:
+                            llm_result = await pipeline.llm_adapter.generate(
+                                call_id,
+                                transcript_text,
+                                context_for_llm,  # Include conversation history
+                                llm_options,  # Use context-injected options (includes system_prompt)
+                            )
+                        except Exception:
+                            logger.debug("LLM generate failed", call_id=call_id, exc_info=True)
+                            return
 
                     # Handle structured LLM response with tool calls
                     if isinstance(llm_result, LLMResponse):
@@ -9145,10 +9764,10 @@ class Engine:
                     session.conversation_history = list(conversation_history)
                     await self.session_store.upsert_call(session)
 
-                    playback_id = None
+                    playback_id = streamed_playback_id
                     
-                    # 1. Synthesize and Play Text (if any)
-                    if response_text:
+                    # 1. Synthesize and Play Text (if any; already spoken when streamed)
+                    if response_text and not streamed_text:
                         use_streaming_playback = self.config.downstream_mode != "file"
                         if use_streaming_playback:
                             stream_q: asyncio.Queue = asyncio.Queue(maxsize=256)
@@ -9194,6 +9813,7 @@ class Engine:
                                         try:
                                             if t_start is not None:
                                                 _TURN_STT_TO_TTS.labels(pipeline_label, provider_label).observe(max(0.0, first_tts_ts - t_start))
+                                                _TURN_FIRST_AUDIO_SECONDS.labels(pipeline_label, provider_label, "batch").observe(max(0.0, first_tts_ts - t_start))
                                         except Exception:
                                             pass
                                     try:
@@ -9231,6 +9851,7 @@ class Engine:
                                                 try:
                                                     if t_start is not None:
                                                         _TURN_STT_TO_TTS.labels(pipeline_label, provider_label).observe(max(0.0, first_tts_ts - t_start))
+                                                        _TURN_FIRST_AUDIO_SECONDS.labels(pipeline_label, provider_label, "batch").observe(max(0.0, first_tts_ts - t_start))
                                                 except Exception:
                                                     pass
                                             tts_bytes.extend(tts_chunk)
@@ -9266,6 +9887,7 @@ class Engine:
                                             try:
                                                 if t_start is not None:
                                                     _TURN_STT_TO_TTS.labels(pipeline_label, provider_label).observe(max(0.0, first_tts_ts - t_start))
+                                                    _TURN_FIRST_AUDIO_SECONDS.labels(pipeline_label, provider_label, "batch").observe(max(0.0, first_tts_ts - t_start))
                                             except Exception:
                                                 pass
                                         tts_bytes.extend(tts_chunk)
@@ -9343,10 +9965,7 @@ class Engine:
                                         )
                                         if not done:
                                             try:
-                                                wait_bytes = bytearray()
-                                                async for chunk in pipeline.tts_adapter.synthesize(call_id, slow_message, pipeline.tts_options):
-                                                    if chunk:
-                                                        wait_bytes.extend(chunk)
+                                                wait_bytes = await self._pipeline_tts_bytes(call_id, pipeline, slow_message)
                                                 if wait_bytes:
                                                     wait_pid = await self.playback_manager.play_audio(call_id, bytes(wait_bytes), "pipeline-wait")
                                                     if wait_pid:
@@ -9372,10 +9991,13 @@ class Engine:
                                             
                                             # Speak farewell
                                             try:
-                                                # Re-use TTS synthesis for farewell
-                                                fw_bytes = bytearray()
-                                                async for chunk in pipeline.tts_adapter.synthesize(call_id, farewell, pipeline.tts_options):
-                                                    fw_bytes.extend(chunk)
+                                                # Re-use TTS synthesis for farewell (configured farewells come from the phrase cache)
+                                                fw_bytes = await self._pipeline_tts_bytes(
+                                                    call_id,
+                                                    pipeline,
+                                                    farewell,
+                                                    cacheable=self._is_configured_farewell(farewell),
+                                                )
                                                 if fw_bytes:
                                                     pid = await self.playback_manager.play_audio(call_id, bytes(fw_bytes), "pipeline-farewell")
                                                     # Calculate actual duration: mulaw 8kHz = 8000 bytes/sec
@@ -9482,10 +10104,7 @@ class Engine:
                                                                 )
                                                                 if not done:
                                                                     try:
-                                                                        wait_bytes = bytearray()
-                                                                        async for chunk in pipeline.tts_adapter.synthesize(call_id, slow_message, pipeline.tts_options):
-                                                                            if chunk:
-                                                                                wait_bytes.extend(chunk)
+                                                                        wait_bytes = await self._pipeline_tts_bytes(call_id, pipeline, slow_message)
                                                                         if wait_bytes:
                                                                             wait_pid = await self.playback_manager.play_audio(call_id, bytes(wait_bytes), "pipeline-wait")
                                                                             if wait_pid:
@@ -9502,9 +10121,12 @@ class Engine:
                                                                 conversation_history.append({"role": "assistant", "content": farewell})
                                                                 session.conversation_history = list(conversation_history)
                                                                 await self.session_store.upsert_call(session)
-                                                                fw_bytes = bytearray()
-                                                                async for chunk in pipeline.tts_adapter.synthesize(call_id, farewell, pipeline.tts_options):
-                                                                    fw_bytes.extend(chunk)
+                                                                fw_bytes = await self._pipeline_tts_bytes(
+                                                                    call_id,
+                                                                    pipeline,
+                                                                    farewell,
+                                                                    cacheable=self._is_configured_farewell(farewell),
+                                                                )
                                                                 if fw_bytes:
                                                                     fw_pid = await self.playback_manager.play_audio(call_id, bytes(fw_bytes), "pipeline-farewell")
                                                                     if fw_pid:
@@ -10290,11 +10912,11 @@ class Engine:
         pcm = audio_bytes
         try:
             if canonical in ("ulaw", "mulaw", "g711_ulaw", "mu-law"):
-                pcm = audioop.ulaw2lin(audio_bytes, 2)
+                pcm = mulaw_to_pcm16le(audio_bytes)
                 rate = 8000
             else:
                 if swap_needed:
-                    pcm = audioop.byteswap(audio_bytes, 2)
+                    pcm = pcm_ops.byteswap(audio_bytes)
                 else:
                     pcm = audio_bytes
         except Exception:
@@ -10387,7 +11009,7 @@ class Engine:
                     # Example: 320 bytes @ 8kHz → 638 bytes @ 16kHz (should be 640)
                     # This 2-byte misalignment corrupts streaming for Google Live
                     input_bytes = len(pcm_bytes)
-                    pcm_bytes, _ = audioop.ratecv(pcm_bytes, 2, 1, pcm_rate, expected_rate, None)
+                    pcm_bytes, _ = resample_audio(pcm_bytes, pcm_rate, expected_rate)
                     
                     # Calculate expected output size based on sample rate ratio
                     # input_samples = input_bytes // 2 (2 bytes per sample)
@@ -10460,8 +11082,7 @@ class Engine:
             # - both > 0 => enable normalization with configured target/max gain.
             if pcm_bytes and gain_target_rms > 0 and gain_max_db > 0.0:
                 try:
-                    # audioop already imported at module level - don't re-import here!
-                    current_rms = audioop.rms(pcm_bytes, 2)
+                    current_rms = pcm_ops.rms(pcm_bytes)
                     target_rms = gain_target_rms
                     max_gain_db = gain_max_db
                     
@@ -10471,8 +11092,8 @@ class Engine:
                         gain = min(gain_needed, max_gain)
                         
                         if gain > 1.05:  # Apply if gain needed is >5%
-                            pcm_bytes = audioop.mul(pcm_bytes, 2, gain)
-                            actual_rms = audioop.rms(pcm_bytes, 2)
+                            pcm_bytes = pcm_ops.mul(pcm_bytes, gain)
+                            actual_rms = pcm_ops.rms(pcm_bytes)
                             
                             # CRITICAL: Warn about excessive gain (indicates audio quality issues)
                             # High gain on low-quality audio causes distortion and speech recognition failures
@@ -10508,12 +11129,12 @@ class Engine:
             if pcm_rate != expected_rate and working:
                 try:
                     state = prov_states.get(state_key)
-                    working, state = audioop.ratecv(working, 2, 1, pcm_rate, expected_rate, state)
+                    working, state = resample_audio(working, pcm_rate, expected_rate, state=state)
                     prov_states[state_key] = state
                 except Exception:
                     working = pcm_bytes
             try:
-                encoded = audioop.lin2ulaw(working, 2)
+                encoded = pcm16le_to_mulaw(working)
             except Exception:
                 encoded = b""
             return encoded, "ulaw", expected_rate
@@ -10594,23 +11215,27 @@ class Engine:
                 pass
 
     def _update_audio_diagnostics(self, session: CallSession, stage: str, audio_bytes: bytes, encoding: str, sample_rate: int) -> None:
-        """Track audio health metrics (RMS/DC offset) for observability."""
+        """Track audio health metrics (RMS/DC offset/clipping/silence) for observability.
+
+        Only one frame in ``audio_health.sample_every`` per stage is decoded and
+        measured; the rest just bump a counter.
+        """
         try:
+            window = self.audio_health.sample(session, stage)
+            if window is None:
+                return
             canonical = self._canonicalize_encoding(encoding) or "slin16"
             if canonical == "ulaw":
-                pcm = audioop.ulaw2lin(audio_bytes, 2)
+                pcm = mulaw_to_pcm16le(audio_bytes)
             else:
                 pcm = audio_bytes
-            rms = audioop.rms(pcm, 2) if pcm else 0
-            dc_offset = audioop.avg(pcm, 2) if pcm else 0
+            rms, dc_offset = self.audio_health.record(window, pcm)
             session.audio_diagnostics[stage] = {
                 "rms": rms,
                 "dc_offset": dc_offset,
                 "sample_rate": sample_rate,
                 "updated": time.time(),
             }
-            _AUDIO_RMS_GAUGE.labels(stage).set(rms)
-            _AUDIO_DC_OFFSET.labels(stage).set(dc_offset)
             first_sample_key = f"{stage}_first_sample_logged"
             if not session.audio_diagnostics.get(first_sample_key):
                 session.audio_diagnostics[first_sample_key] = True
@@ -10649,7 +11274,7 @@ class Engine:
         except Exception:
             logger.debug("Audio diagnostics update failed", call_id=session.call_id, stage=stage, exc_info=True)
 
-    async def _update_audio_diagnostics_by_call(
+    def _update_audio_diagnostics_by_call(
         self,
         call_id: str,
         stage: str,
@@ -10657,10 +11282,11 @@ class Engine:
         encoding: str,
         sample_rate: int,
     ) -> None:
-        session = await self.session_store.get_by_call_id(call_id)
-        if not session:
+        # Called per outbound frame from the frame clock's pass, so no awaits here.
+        handle = self.session_store.handle(call_id)
+        if handle is None or handle.session is None:
             return
-        self._update_audio_diagnostics(session, stage, audio_bytes, encoding, sample_rate)
+        self._update_audio_diagnostics(handle.session, stage, audio_bytes, encoding, sample_rate)
 
     def _emit_transport_card(
         self,
@@ -11349,6 +11975,13 @@ class Engine:
                 except Exception as e:
                     logger.warning(f"Failed to inject tool context: {e}", call_id=call_id)
 
+            # Hand over a pre-connected socket when the warm pool has one; a miss connects as before.
+            warm_pool = getattr(self, "_provider_warm_pools", {}).get(provider_name)
+            if warm_pool is not None and hasattr(provider, "adopt_warm_connection"):
+                warm = warm_pool.lease()
+                if warm is not None:
+                    provider.adopt_warm_connection(warm)
+
             await provider.start_session(call_id, context=provider_context if provider_context else None)
             logger.info("Provider session started", call_id=call_id, provider=provider_name)
             # If provider supports an explicit greeting (e.g., LocalProvider), trigger it now
@@ -12171,6 +12804,15 @@ class Engine:
     async def _metrics_handler(self, request):
         """Expose Prometheus metrics."""
         try:
+            try:
+                sessions = await self.session_store.get_all_sessions()
+                _AUDIO_RMS_GAUGE.clear()
+                _AUDIO_DC_OFFSET.clear()
+                for stage, medians in self.audio_health.export(sessions).items():
+                    _AUDIO_RMS_GAUGE.labels(stage).set(medians["rms"])
+                    _AUDIO_DC_OFFSET.labels(stage).set(medians["dc_offset"])
+            except Exception:
+                logger.debug("Audio health export failed", exc_info=True)
             data = generate_latest()
             # aiohttp forbids 'charset=' inside content_type arg; pass full header via headers.
             return web.Response(body=data, headers={"Content-Type": CONTENT_TYPE_LATEST})
@@ -12270,6 +12912,18 @@ class Engine:
             except Exception as e:
                 errors.append(f"Error updating contexts: {str(e)}")
 
+            # Step 4a: Refresh the TTS phrase cache and pre-warm (new) context greetings
+            try:
+                if getattr(old_config, "tts_cache", None) != getattr(new_config, "tts_cache", None):
+                    self.tts_cache = self._build_tts_cache(new_config)
+                    changes.append("TTS phrase cache settings updated")
+                if self.tts_cache.enabled and getattr(self.pipeline_orchestrator, "started", False):
+                    # Greetings or the cache may have changed: restart a pre-warm that is still running
+                    self._schedule_tts_prewarm(restart=True)
+                    changes.append("TTS greeting pre-warm scheduled")
+            except Exception as e:
+                errors.append(f"Error refreshing TTS cache: {str(e)}")
+
             # Step 4b: Reload MCP tools (best-effort; applies to new calls)
             try:
                 old_mcp = getattr(old_config, "mcp", None)
@@ -12311,6 +12965,22 @@ class Engine:
             except Exception as e:
                 errors.append(f"Error reloading MCP tools: {str(e)}")
             
+            # Step 4c: Rebuild the shared HTTP tool client when its settings changed
+            try:
+                if getattr(old_config, "http_client", None) != getattr(new_config, "http_client", None):
+                    await configure_http_client_pool(getattr(new_config, "http_client", None))
+                    changes.append("HTTP tool client settings updated")
+            except Exception as e:
+                errors.append(f"Error updating HTTP tool client: {str(e)}")
+
+            # Step 4d: Restart provider warm pools when their settings changed
+            try:
+                if getattr(old_config, "warm_pool", None) != getattr(new_config, "warm_pool", None):
+                    await self._start_provider_warm_pools()
+                    changes.append("Provider warm pool settings updated")
+            except Exception as e:
+                errors.append(f"Error updating provider warm pools: {str(e)}")
+
             # Step 5: Update prompts
             try:
                 if hasattr(new_config, 'prompts') and new_config.prompts:
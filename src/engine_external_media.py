@@ -10,10 +10,10 @@ import signal
 import uuid
 import json
 import base64
-import audioop
 from typing import Dict, Any, Optional
 
 from .ari_client import ARIClient
+from .audio.resampler import mulaw_to_pcm16le, pcm16le_to_mulaw
 from aiohttp import web
 from .config import AppConfig, load_config
 from .logging_config import get_logger, configure_logging
@@ -105,7 +105,7 @@ class ExternalMediaEngine:
                 audio_data = event.get('data')
                 if audio_data and call_id:
                     # Convert ulaw to PCM for RTP
-                    pcm_data = audioop.ulaw2lin(audio_data, 2)
+                    pcm_data = mulaw_to_pcm16le(audio_data)
                     await self.rtp_server.send_audio(call_id, pcm_data)
                     logger.debug("Audio response sent via RTP", call_id=call_id, size=len(pcm_data))
             
@@ -334,8 +334,7 @@ class ExternalMediaEngine:
             provider = call_info["provider"]
             
             # Convert PCM to ulaw for LocalProvider
-            import audioop
-            ulaw_data = audioop.lin2ulaw(pcm_data, 2)
+            ulaw_data = pcm16le_to_mulaw(pcm_data)
             
             # Send audio to provider via WebSocket
             if hasattr(provider, 'send_audio') and provider.websocket:
@@ -13,11 +13,17 @@ import contextvars
 import uuid
 import time
 import datetime
+import json
 
 import structlog
 from structlog import dev as structlog_dev
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - json fallback
+    _orjson = None
+
 # Context variable for correlation ID
 correlation_id_var = contextvars.ContextVar('correlation_id', default=None)
 
@@ -52,6 +58,76 @@ def add_service_context(logger, method_name, event_dict):
     event_dict['component'] = component
     return event_dict
 
+# Keys that should be redacted (case-insensitive). A key is sensitive when its
+# normalized form (lowercase, no '_'/'-') equals or ends with a normalized entry,
+# e.g. "user_password"; "passthrough_providers" does not match "pass".
+SENSITIVE_KEYS = frozenset({
+    'api_key', 'apikey', 'api-key', 'api_keys',
+    'token', 'access_token', 'refresh_token', 'auth_token', 'bearer',
+    'password', 'passwd', 'pwd', 'pass',
+    'authorization', 'auth',
+    'credential', 'credentials', 'secret', 'secrets',
+    'private_key', 'private-key', 'privatekey',
+    'client_secret', 'client-secret', 'clientsecret',
+})
+_SENSITIVE_SUFFIXES = tuple(sorted({k.replace('_', '').replace('-', '') for k in SENSITIVE_KEYS}))
+# key -> is_sensitive; log call sites use a small, fixed vocabulary of keys
+_KEY_CLASS_CACHE = {}
+_KEY_CLASS_CACHE_MAX = 4096
+
+
+def _is_sensitive_key(key):
+    cached = _KEY_CLASS_CACHE.get(key)
+    if cached is None:
+        cached = str(key).lower().replace('_', '').replace('-', '').endswith(_SENSITIVE_SUFFIXES)
+        if len(_KEY_CLASS_CACHE) >= _KEY_CLASS_CACHE_MAX:
+            _KEY_CLASS_CACHE.clear()
+        _KEY_CLASS_CACHE[key] = cached
+    return cached
+
+
+def _redact_value(value):
+    """Redact a sensitive value, preserving structure for debugging."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return value  # Don't redact booleans
+    # Preserve type hints but redact content
+    if isinstance(value, str):
+        if not value:  # Empty string
+            return ''
+        # Show first 2 chars for debugging (e.g., "sk" for OpenAI keys)
+        if len(value) > 4:
+            return f"{value[:2]}***REDACTED***"
+        return "***REDACTED***"
+    if isinstance(value, (int, float)):
+        return "***REDACTED***"
+    if isinstance(value, (list, tuple)):
+        return [_redact_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _redact_value(v) if k.lower() in SENSITIVE_KEYS else v
+                for k, v in value.items()}
+    return "***REDACTED***"
+
+
+def _sanitize_dict(d):
+    """Return d with sensitive keys redacted; copies only when something changes."""
+    sanitized = None
+    for key, value in d.items():
+        if _is_sensitive_key(key):
+            new = _redact_value(value)
+        elif isinstance(value, dict):
+            new = _sanitize_dict(value)
+        elif isinstance(value, (list, tuple)) and any(isinstance(v, dict) for v in value):
+            new = [_sanitize_dict(v) if isinstance(v, dict) else v for v in value]
+        else:
+            continue
+        if sanitized is None:
+            sanitized = dict(d)
+        sanitized[key] = new
+    return d if sanitized is None else sanitized
+
+
 def sanitize_secrets(logger, method_name, event_dict):
     """
     Redact sensitive information from log events.
@@ -67,74 +143,73 @@ def sanitize_secrets(logger, method_name, event_dict):
     - Credentials: credential, secret, private_key
     
     Values are replaced with '***REDACTED***' while preserving log context.
+    Key classification is cached, so events without secrets or nested
+    containers pass through without being copied.
     """
-    # List of keys that should be redacted (case-insensitive)
-    SENSITIVE_KEYS = {
-        'api_key', 'apikey', 'api-key', 'api_keys',
-        'token', 'access_token', 'refresh_token', 'auth_token', 'bearer',
-        'password', 'passwd', 'pwd', 'pass',
-        'authorization', 'auth',
-        'credential', 'credentials', 'secret', 'secrets',
-        'private_key', 'private-key', 'privatekey',
-        'client_secret', 'client-secret', 'clientsecret',
-    }
-    
-    def redact_value(value):
-        """Redact a sensitive value, preserving structure for debugging."""
-        if value is None:
+    return _sanitize_dict(event_dict)
+
+
+# Per-frame log sites: at most `burst` events per call per `window` seconds.
+# The next event let through carries `suppressed=<n>` for what was dropped.
+RATE_LIMITED_EVENTS = {
+    "🎤 AUDIOSOCKET RX - Frame received": (5, 1.0),
+    "RTP packet loss detected": (5, 1.0),
+    "RTP out-of-order packet": (5, 1.0),
+}
+_rate_limit_state = {}
+
+
+def rate_limit_repetitive_events(logger, method_name, event_dict):
+    """Drop repeats of known per-frame log sites beyond their per-call budget."""
+    limit = RATE_LIMITED_EVENTS.get(event_dict.get('event'))
+    if limit is None:
+        return event_dict
+    burst, window = limit
+    key = (event_dict.get('event'), event_dict.get('call_id'))
+    now = time.monotonic()
+    state = _rate_limit_state.get(key)
+    if state is None or now - state[0] >= window:
+        suppressed = state[2] if state is not None else 0
+        if len(_rate_limit_state) >= _KEY_CLASS_CACHE_MAX:
+            _rate_limit_state.clear()
+        _rate_limit_state[key] = [now, 1, 0]
+        if suppressed:
+            event_dict['suppressed'] = suppressed
+        return event_dict
+    if state[1] >= burst:
+        state[2] += 1
+        raise structlog.DropEvent
+    state[1] += 1
+    return event_dict
+
+
+class LevelFilteringBoundLogger(structlog.stdlib.BoundLogger):
+    """stdlib BoundLogger that drops calls below the configured root level before any processor runs."""
+
+    def debug(self, event=None, *args, **kw):
+        if _min_level > logging.DEBUG:
             return None
-        if isinstance(value, bool):
-            return value  # Don't redact booleans
-        # Preserve type hints but redact content
-        if isinstance(value, str):
-            if not value:  # Empty string
-                return ''
-            # Show first 2 chars for debugging (e.g., "sk" for OpenAI keys)
-            if len(value) > 4:
-                return f"{value[:2]}***REDACTED***"
-            return "***REDACTED***"
-        if isinstance(value, (int, float)):
-            return "***REDACTED***"
-        if isinstance(value, (list, tuple)):
-            return [redact_value(v) for v in value]
-        if isinstance(value, dict):
-            return {k: redact_value(v) if k.lower() in SENSITIVE_KEYS else v 
-                    for k, v in value.items()}
-        return "***REDACTED***"
-    
-    def sanitize_dict(d):
-        """Recursively sanitize dictionary keys."""
-        if not isinstance(d, dict):
-            return d
-        
-        sanitized = {}
-        for key, value in d.items():
-            # Normalize key for comparison (remove separators, lowercase)
-            key_normalized = str(key).lower().replace('_', '').replace('-', '')
-            
-            # Check if key matches any sensitive pattern (exact match only)
-            # This prevents false positives like "passthrough" matching "pass"
-            is_sensitive = False
-            for pattern in SENSITIVE_KEYS:
-                pattern_normalized = pattern.replace('_', '').replace('-', '')
-                # Match if pattern is the key itself, or ends with pattern (e.g., "user_password")
-                if key_normalized == pattern_normalized or key_normalized.endswith(pattern_normalized):
-                    is_sensitive = True
-                    break
-            
-            if is_sensitive:
-                sanitized[key] = redact_value(value)
-            elif isinstance(value, dict):
-                sanitized[key] = sanitize_dict(value)
-            elif isinstance(value, (list, tuple)):
-                sanitized[key] = [sanitize_dict(v) if isinstance(v, dict) else v 
-                                 for v in value]
-            else:
-                sanitized[key] = value
-        return sanitized
-    
-    # Sanitize the entire event_dict
-    return sanitize_dict(event_dict)
+        return super().debug(event, *args, **kw)
+
+    def info(self, event=None, *args, **kw):
+        if _min_level > logging.INFO:
+            return None
+        return super().info(event, *args, **kw)
+
+
+# Set by configure_logging(); DEBUG until then so unconfigured use behaves as before.
+_min_level = logging.DEBUG
+
+
+def _fast_json_dumps(obj, default=None, **kw):
+    """JSON serializer for the renderer: orjson when available, json otherwise."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=default, option=_orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default, **kw)
+
 
 def add_local_timestamp(logger, method_name, event_dict):
     """
@@ -191,11 +266,14 @@ def configure_logging(log_level="INFO", log_to_file=False, log_file_path="servic
         level_value = getattr(logging, log_level_upper, logging.INFO) if isinstance(log_level, str) else int(log_level)
     except Exception:
         level_value = logging.INFO
+    global _min_level
+    _min_level = level_value
 
     # Configure structlog to integrate with stdlib logging
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
+            rate_limit_repetitive_events,
             structlog.stdlib.add_logger_name,
             structlog.processors.add_log_level,
             add_local_timestamp,
@@ -208,12 +286,12 @@ def configure_logging(log_level="INFO", log_to_file=False, log_file_path="servic
         ],
         context_class=structlog.threadlocal.wrap_dict(dict),
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=LevelFilteringBoundLogger,
         cache_logger_on_first_use=True,
     )
 
     # Choose final renderer
-    renderer = structlog_dev.ConsoleRenderer(colors=log_color) if log_format == "console" else structlog.processors.JSONRenderer()
+    renderer = structlog_dev.ConsoleRenderer(colors=log_color) if log_format == "console" else structlog.processors.JSONRenderer(serializer=_fast_json_dumps)
 
     # Stdlib ProcessorFormatter for both structlog and foreign loggers
     processor_formatter = structlog.stdlib.ProcessorFormatter(
@@ -294,6 +294,27 @@ class LLMComponent(Component):
     ) -> Union[str, LLMResponse]:
         """Generate a response given transcript + context."""
 
+    async def generate_stream(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """Yield text deltas as they are generated (optional).
+
+        Adapters that support token streaming override this and yield ``str``
+        deltas, then finish with one ``LLMResponse`` carrying the complete
+        text, any tool calls and metadata. The default wraps ``generate()``,
+        yielding its full result once, so callers can always use this method.
+        """
+        yield await self.generate(call_id, transcript, context, options)
+
+    @property
+    def supports_streaming(self) -> bool:
+        """True when the adapter overrides ``generate_stream`` with real token streaming."""
+        return type(self).generate_stream is not LLMComponent.generate_stream
+
 
 class TTSComponent(Component):
     """Text-to-speech component."""
@@ -306,3 +327,18 @@ class TTSComponent(Component):
         options: Dict[str, Any],
     ) -> AsyncIterator[bytes]:
         """Yield audio frames (μ-law or PCM) for the supplied text."""
+
+    def synthesis_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Effective options for ``synthesize`` (provider defaults merged in).
+
+        Used to key the TTS phrase cache, so a voice or format change in the
+        provider block yields a different key. Adapters that merge defaults in
+        ``_compose_options`` get them folded in automatically.
+        """
+        compose = getattr(self, "_compose_options", None)
+        if callable(compose):
+            try:
+                return dict(compose(options or {}))
+            except Exception:
+                pass
+        return dict(options or {})
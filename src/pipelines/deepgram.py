@@ -20,7 +20,13 @@ from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 import aiohttp
 import websockets
 
-from ..audio import convert_pcm16le_to_target_format, mulaw_to_pcm16le, resample_audio
+from ..audio import (
+    convert_pcm16le_to_target_format,
+    get_codec_engine,
+    mulaw_to_pcm16le,
+    pcm16le_to_mulaw,
+    resample_audio,
+)
 from ..config import AppConfig, DeepgramProviderConfig
 from ..logging_config import get_logger
 from .base import STTComponent, TTSComponent
@@ -203,8 +209,7 @@ class DeepgramSTTAdapter(STTComponent):
         
         # Resample if needed
         if sample_rate_hz != api_sample_rate:
-            import audioop
-            api_audio, _ = audioop.ratecv(api_audio, 2, 1, sample_rate_hz, api_sample_rate, None)
+            api_audio, _ = resample_audio(api_audio, sample_rate_hz, api_sample_rate)
             logger.debug(
                 "STT resampled audio",
                 call_id=call_id,
@@ -215,12 +220,10 @@ class DeepgramSTTAdapter(STTComponent):
         
         # Encode if needed
         if api_encoding in ("mulaw", "g711_ulaw", "mu-law"):
-            import audioop
-            api_audio = audioop.lin2ulaw(api_audio, 2)
+            api_audio = pcm16le_to_mulaw(api_audio)
             logger.debug("STT encoded PCM16 → mulaw", call_id=call_id, bytes=len(api_audio))
         elif api_encoding in ("alaw", "g711_alaw"):
-            import audioop
-            api_audio = audioop.lin2alaw(api_audio, 2)
+            api_audio = get_codec_engine().alaw_encode(api_audio)
             logger.debug("STT encoded PCM16 → alaw", call_id=call_id, bytes=len(api_audio))
         # "linear16", "pcm16" = no encoding needed
 
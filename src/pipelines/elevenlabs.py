@@ -7,13 +7,13 @@ API Reference: https://elevenlabs.io/docs/api-reference/text-to-speech
 """
 from __future__ import annotations
 
-import audioop
 import time
 import uuid
 from typing import Any, AsyncIterator, Callable, Dict, Optional
 
 import aiohttp
 
+from ..audio import pcm16le_to_mulaw, resample_audio
 from ..config import AppConfig, ElevenLabsProviderConfig
 from ..logging_config import get_logger
 from .base import TTSComponent
@@ -165,12 +165,12 @@ class ElevenLabsTTSAdapter(TTSComponent):
                     converted = raw_audio
                 elif output_format == "pcm_16000":
                     # Convert PCM16 16kHz to μ-law 8kHz
-                    resampled, _ = audioop.ratecv(raw_audio, 2, 1, 16000, 8000, None)
-                    converted = audioop.lin2ulaw(resampled, 2)
+                    resampled, _ = resample_audio(raw_audio, 16000, 8000)
+                    converted = pcm16le_to_mulaw(resampled)
                 elif output_format == "pcm_24000":
                     # Convert PCM16 24kHz to μ-law 8kHz
-                    resampled, _ = audioop.ratecv(raw_audio, 2, 1, 24000, 8000, None)
-                    converted = audioop.lin2ulaw(resampled, 2)
+                    resampled, _ = resample_audio(raw_audio, 24000, 8000)
+                    converted = pcm16le_to_mulaw(resampled)
                 else:
                     # For other formats, assume it's already usable or skip conversion
                     logger.warning(
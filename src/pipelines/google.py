@@ -370,6 +370,93 @@ class GoogleLLMAdapter(LLMComponent):
         )
         return LLMResponse(text=text or "")
 
+    async def generate_stream(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[str | LLMResponse]:
+        """Stream streamGenerateContent (SSE) text chunks; finishes with a full LLMResponse.
+
+        Failures before the first chunk fall back to ``generate()``; a stream
+        cut off later ends with the text received so far.
+        """
+        await self._ensure_session()
+        assert self._session is not None
+
+        merged = self._compose_options(options)
+        headers, params = await self._credential_manager.build_auth(self._auth_scopes)
+
+        payload = self._build_payload(transcript, context, merged)
+        payload = _merge_dicts(payload, merged.get("request_overrides"))
+
+        request_id = f"google-llm-{uuid.uuid4().hex[:10]}"
+        model_path = merged["model"]
+        if not model_path.startswith("models/"):
+            model_path = f"models/{model_path}"
+        url = f"{self._provider_defaults.llm_base_url.rstrip('/')}/{model_path}:streamGenerateContent"
+
+        text_parts: list[str] = []
+        try:
+            async with self._session.post(
+                url,
+                json=payload,
+                params={**(params or {}), "alt": "sse"},
+                headers=headers or None,
+                timeout=merged["timeout_sec"],
+            ) as response:
+                if response.status >= 400:
+                    body = await response.text()
+                    logger.warning(
+                        "Google LLM streamGenerateContent failed; falling back to non-streaming",
+                        call_id=call_id,
+                        request_id=request_id,
+                        status=response.status,
+                        body_preview=body[:128],
+                    )
+                    yield await self.generate(call_id, transcript, context, options)
+                    return
+
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8", errors="ignore").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    try:
+                        data = json.loads(line[5:].strip())
+                    except json.JSONDecodeError:
+                        continue
+                    text = _extract_candidate_text(data)
+                    if text:
+                        text_parts.append(text)
+                        yield text
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            if not text_parts and self._session is not None and not self._session.closed:
+                logger.warning(
+                    "Google LLM stream failed; falling back to non-streaming",
+                    call_id=call_id,
+                    request_id=request_id,
+                    error=str(exc) or type(exc).__name__,
+                )
+                yield await self.generate(call_id, transcript, context, options)
+                return
+            logger.warning(
+                "Google LLM stream interrupted; keeping the partial answer",
+                call_id=call_id,
+                request_id=request_id,
+                error=str(exc) or type(exc).__name__,
+                chars=sum(len(part) for part in text_parts),
+            )
+
+        text = "".join(text_parts)
+        logger.info(
+            "Google LLM response streamed",
+            call_id=call_id,
+            request_id=request_id,
+            preview=text[:80] if text else "(empty)",
+        )
+        yield LLMResponse(text=text)
+
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
@@ -22,7 +22,7 @@ from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
 
 import aiohttp
 
-from ..audio import convert_pcm16le_to_target_format, resample_audio
+from ..audio import convert_pcm16le_to_target_format, pcm_ops, resample_audio
 from ..config import AppConfig, GroqSTTProviderConfig, GroqTTSProviderConfig
 from ..logging_config import get_logger
 from .base import STTComponent, TTSComponent
@@ -81,9 +81,7 @@ def _wav_bytes_to_pcm16le(wav_bytes: bytes) -> Tuple[bytes, int]:
     if channels != 1:
         # Avoid extra dependencies; simplest safe approach is to keep left channel only.
         if sample_width == 2:
-            import audioop
-
-            frames = audioop.tomono(frames, 2, 1.0, 0.0)
+            frames = pcm_ops.tomono(frames, 1.0, 0.0)
         else:
             # Unknown layout; fall back to returning raw bytes.
             logger.warning("Groq TTS WAV returned non-mono audio; returning raw frames", channels=channels)
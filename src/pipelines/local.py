@@ -12,7 +12,6 @@ import asyncio
 import base64
 import json
 import time
-import audioop
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
@@ -20,12 +19,14 @@ import websockets
 from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import ConnectionClosed, ConnectionClosedError
 
+from ..audio.codec_engine import Pcm16kInputStage
 from ..config import AppConfig, LocalProviderConfig
 
 # Reconnection constants
 _MAX_RECONNECT_ATTEMPTS = 3
 _RECONNECT_DELAY_BASE_SEC = 0.5
 from ..logging_config import get_logger
+from ..providers.local_mux import LocalAIMuxChannel, get_local_mux_pool
 from .base import LLMComponent, LLMResponse, STTComponent, TTSComponent
 
 logger = get_logger(__name__)
@@ -54,6 +55,8 @@ class _LocalSessionState:
     result_queue: Optional[asyncio.Queue] = None
     receiver_task: Optional[asyncio.Task] = None
     send_lock: Optional[asyncio.Lock] = None
+    # Created on first streamed audio; keeps resampler state across send_audio calls
+    input_stage: Optional[Pcm16kInputStage] = None
 
 
 class _LocalAdapterBase:
@@ -120,6 +123,8 @@ class _LocalAdapterBase:
         ws_url = merged.get("ws_url") or _DEFAULT_WS_URL
         connect_timeout = float(merged.get("connect_timeout_sec", 5.0))
         mode = merged.get("mode", self._default_mode)
+        auth_token = (merged.get("auth_token") or "").strip()
+        transport = str(merged.get("transport") or "json").lower()
 
         logger.info(
             "Opening local adapter session",
@@ -130,15 +135,26 @@ class _LocalAdapterBase:
         )
 
         try:
-            websocket = await asyncio.wait_for(
-                websockets.connect(
+            if transport == "binary":
+                # Shared framed connections; the pool authenticates each connection once.
+                pool = get_local_mux_pool(
                     ws_url,
-                    ping_interval=None,
-                    ping_timeout=None,
-                    max_size=None,
-                ),
-                timeout=connect_timeout,
-            )
+                    name=self.component_key,
+                    size=int(merged.get("transport_connections", 2) or 2),
+                    auth_token=auth_token or None,
+                    connect_timeout=connect_timeout,
+                )
+                websocket = await pool.open_channel(call_id, mode)
+            else:
+                websocket = await asyncio.wait_for(
+                    websockets.connect(
+                        ws_url,
+                        ping_interval=None,
+                        ping_timeout=None,
+                        max_size=None,
+                    ),
+                    timeout=connect_timeout,
+                )
         except Exception as exc:
             logger.error(
                 "Failed to connect to local AI server",
@@ -149,8 +165,7 @@ class _LocalAdapterBase:
             raise
 
         # Optional auth handshake for local-ai-server.
-        auth_token = (merged.get("auth_token") or "").strip()
-        if auth_token:
+        if auth_token and not isinstance(websocket, LocalAIMuxChannel):
             try:
                 await websocket.send(
                     json.dumps(
@@ -590,7 +605,9 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             )
             return  # Skip this audio frame rather than crash the call
         
-        pcm16 = self._to_pcm16_16k(audio, fmt)
+        if session.input_stage is None:
+            session.input_stage = Pcm16kInputStage()
+        pcm16 = self._to_pcm16_16k(audio, fmt, session.input_stage)
         if not pcm16:
             logger.warning(
                 "send_audio: conversion to PCM16 16kHz produced empty result",
@@ -605,18 +622,8 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             component=self.component_key,
             call_id=call_id,
             pcm16_bytes=len(pcm16),
-            base64_size=len(base64.b64encode(pcm16).decode("ascii")),
         )
         
-        payload = {
-            "type": "audio",
-            "mode": "stt",
-            "call_id": call_id,
-            "rate": 16000,
-            "format": "pcm16le",
-            "data": base64.b64encode(pcm16).decode("ascii"),
-        }
-        
         try:
             async with session.send_lock:
                 # Check connection state before sending
@@ -628,9 +635,11 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
                         ws_state=session.websocket.state.name,
                     )
                     # Use retry logic
-                    await self._send_json_with_retry(call_id, payload, session.options)
+                    await self._send_json_with_retry(
+                        call_id, self._audio_payload(call_id, pcm16, 16000), session.options
+                    )
                 else:
-                    await self._send_json(session, payload)
+                    await self._send_audio(session, pcm16, 16000)
         except (ConnectionClosed, ConnectionClosedError) as exc:
             logger.warning(
                 "STT send_audio connection closed, will retry on next audio",
@@ -749,19 +758,34 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             except asyncio.QueueFull:
                 pass
 
-    def _to_pcm16_16k(self, audio: bytes, fmt: str) -> bytes:
+    @staticmethod
+    def _audio_payload(call_id: str, pcm16: bytes, rate: int) -> Dict[str, Any]:
+        return {
+            "type": "audio",
+            "mode": "stt",
+            "call_id": call_id,
+            "rate": rate,
+            "format": "pcm16le",
+            "data": base64.b64encode(pcm16).decode("ascii"),
+        }
+
+    async def _send_audio(self, session: _LocalSessionState, pcm16: bytes, rate: int) -> None:
+        if isinstance(session.websocket, LocalAIMuxChannel):
+            # Binary transport: raw PCM in one frame (waits for the call's credit)
+            await session.websocket.send_audio(pcm16, rate, mode="stt")
+            return
+        await self._send_json(session, self._audio_payload(session.call_id, pcm16, rate))
+
+    def _to_pcm16_16k(self, audio: bytes, fmt: str, stage: Pcm16kInputStage) -> bytes:
         if not audio:
             return audio
         fmt = fmt.lower()
         if fmt in {"pcm16", "pcm16_16k", "pcm16-16k"}:
             return audio
         if fmt in {"pcm16_8k", "pcm16-8k"}:
-            converted, _ = audioop.ratecv(audio, 2, 1, 8000, 16000, None)
-            return converted
+            return stage.convert(audio, "pcm16_8k")
         if fmt in {"mulaw8k", "ulaw8k"}:
-            linear = audioop.ulaw2lin(audio, 2)
-            converted, _ = audioop.ratecv(linear, 2, 1, 8000, 16000, None)
-            return converted
+            return stage.convert(audio, "ulaw")
         raise ValueError(f"Unsupported audio format '{fmt}' for local STT streaming")
 
     async def transcribe(
@@ -782,15 +806,7 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             bytes=len(audio_pcm16),
             rate=sample_rate_hz,
         )
-        payload = {
-            "type": "audio",
-            "mode": "stt",
-            "call_id": call_id,
-            "rate": sample_rate_hz,
-            "data": base64.b64encode(audio_pcm16).decode("ascii"),
-        }
-
-        await self._send_json(session, payload)
+        await self._send_audio(session, audio_pcm16, sample_rate_hz)
         # STT should use its own response timeout
         timeout = float(merged.get("response_timeout_sec", 5.0))
         started_at = time.perf_counter()
@@ -861,6 +877,37 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
         context: Dict[str, Any],
         options: Dict[str, Any],
     ) -> LLMResponse:
+        response = LLMResponse(text="")
+        async for item in self._llm_exchange(call_id, transcript, context, options, stream=False):
+            if isinstance(item, LLMResponse):
+                response = item
+        return response
+
+    async def generate_stream(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[str | LLMResponse]:
+        """Yield ``llm_partial`` chunks as the server generates; finishes with a full LLMResponse.
+
+        The final text is the server's ``llm_response`` (authoritative, see
+        PROTOCOL.md); if the connection drops or the response times out after
+        partials arrived, the text received so far is kept.
+        """
+        async for item in self._llm_exchange(call_id, transcript, context, options, stream=True):
+            yield item
+
+    async def _llm_exchange(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+        *,
+        stream: bool,
+    ) -> AsyncIterator[str | LLMResponse]:
         runtime_options = options or {}
         
         try:
@@ -872,7 +919,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                 call_id=call_id,
                 error=str(exc),
             )
-            return LLMResponse(text="")  # Return empty response rather than crash
+            yield LLMResponse(text="")  # Return empty response rather than crash
+            return
 
         merged = self._compose_options(runtime_options)
         logger.debug(
@@ -888,6 +936,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
             "text": transcript,
             "context": context.get("messages") or context,
         }
+        if stream:
+            payload["stream"] = True
 
         # Use retry logic for LLM send
         try:
@@ -899,7 +949,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                 call_id=call_id,
                 error=str(exc),
             )
-            return LLMResponse(text="")  # Return empty response rather than crash
+            yield LLMResponse(text="")  # Return empty response rather than crash
+            return
         
         # Re-fetch session after potential reconnection
         session = self._sessions.get(call_id)
@@ -909,11 +960,13 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                 component=self.component_key,
                 call_id=call_id,
             )
-            return LLMResponse(text="")
+            yield LLMResponse(text="")
+            return
 
         # Prefer a dedicated LLM timeout when provided (pipeline or provider level)
         timeout = float(merged.get("llm_response_timeout_sec", merged.get("response_timeout_sec", 5.0)))
         started_at = time.perf_counter()
+        partials: list[str] = []
 
         try:
             while True:
@@ -927,7 +980,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                         error=str(exc),
                     )
                     self._sessions.pop(call_id, None)
-                    return LLMResponse(text="")
+                    yield LLMResponse(text="".join(partials).strip())
+                    return
                 except asyncio.TimeoutError:
                     logger.warning(
                         "LLM response timed out",
@@ -935,10 +989,17 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                         call_id=call_id,
                         timeout_sec=timeout,
                     )
-                    return LLMResponse(text="")
-                    
+                    yield LLMResponse(text="".join(partials).strip())
+                    return
+
                 if kind != "json":
                     continue
+                if stream and message.get("type") == "llm_partial":
+                    text = message.get("text") or ""
+                    if text:
+                        partials.append(text)
+                        yield text
+                    continue
                 if message.get("type") != "llm_response":
                     continue
 
@@ -951,7 +1012,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                     latency_ms=round(latency_ms, 2),
                     response_preview=response[:80],
                 )
-                return LLMResponse(text=response)
+                yield LLMResponse(text=response)
+                return
         except Exception as exc:
             logger.error(
                 "LLM receive loop failed unexpectedly",
@@ -960,7 +1022,7 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                 error=str(exc),
                 exc_info=True,
             )
-            return LLMResponse(text="")
+            yield LLMResponse(text="".join(partials).strip())
 
 
 class LocalTTSAdapter(_LocalAdapterBase, TTSComponent):
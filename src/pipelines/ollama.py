@@ -28,7 +28,7 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 from urllib.parse import urlparse
@@ -190,14 +190,17 @@ class OllamaLLMAdapter(LLMComponent):
                 })
         return tools
 
-    async def generate(
+    async def _prepare_chat(
         self,
         call_id: str,
         transcript: str,
         context: Dict[str, Any],
         options: Dict[str, Any],
-    ) -> LLMResponse:
-        """Generate a response using Ollama's /api/chat endpoint."""
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], str, Dict[str, Any], bool]:
+        """Sync per-call history and build the /api/chat request.
+
+        Returns (session_state, merged_options, url, payload, use_tools).
+        """
         
         # Get or create session state
         if call_id not in self._sessions:
@@ -300,7 +303,22 @@ class OllamaLLMAdapter(LLMComponent):
             messages_count=len(messages),
             tools_enabled=use_tools,
         )
-        
+        return session_state, merged, url, payload, bool(use_tools)
+
+    async def generate(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> LLMResponse:
+        """Generate a response using Ollama's /api/chat endpoint."""
+        session_state, merged, url, payload, use_tools = await self._prepare_chat(
+            call_id, transcript, context, options
+        )
+        messages = session_state["messages"]
+        model = merged["model"]
+
         try:
             timeout = aiohttp.ClientTimeout(total=merged["timeout_sec"])
             async with self._session.post(url, json=payload, timeout=timeout) as response:
@@ -387,6 +405,109 @@ class OllamaLLMAdapter(LLMComponent):
             logger.error("Ollama request failed", call_id=call_id, error=str(e))
             return LLMResponse(text="I encountered an error. Please try again.")
 
+    async def generate_stream(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """Stream /api/chat (NDJSON) content deltas; finishes with a full LLMResponse.
+
+        ``<think>...</think>`` reasoning blocks are dropped as they arrive. API
+        errors before the first delta fall back to ``generate()``, which owns
+        the tool-less retry.
+        """
+        session_state, merged, url, payload, _use_tools = await self._prepare_chat(
+            call_id, transcript, context, options
+        )
+        messages = session_state["messages"]
+        model = merged["model"]
+        payload["stream"] = True
+
+        text_parts: List[str] = []
+        parsed_tool_calls: List[Dict[str, Any]] = []
+        in_think = False
+        pending = ""
+        timeout = aiohttp.ClientTimeout(total=merged["timeout_sec"])
+        async with self._session.post(url, json=payload, timeout=timeout) as response:
+            if response.status >= 400:
+                body = await response.text()
+                logger.warning(
+                    "Ollama streaming request failed; falling back to non-streaming",
+                    call_id=call_id,
+                    status=response.status,
+                    body_preview=body[:200],
+                )
+                if transcript and transcript.strip() and messages and messages[-1].get("content") == transcript:
+                    messages.pop()  # generate() re-adds the user turn
+                yield await self.generate(call_id, transcript, context, options)
+                return
+
+            async for raw_line in response.content:
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                message = data.get("message") or {}
+                for tc in message.get("tool_calls") or []:
+                    func = tc.get("function", {})
+                    parsed_tool_calls.append({
+                        "id": tc.get("id", f"call_{len(parsed_tool_calls)}"),
+                        "name": func.get("name"),
+                        "parameters": func.get("arguments", {}),
+                        "type": "function",
+                    })
+                pending += message.get("content") or ""
+                # Hold back a partial "<think>"/"</think>" tag until it is complete.
+                while pending:
+                    tag = "</think>" if in_think else "<think>"
+                    idx = pending.find(tag)
+                    if idx >= 0:
+                        if not in_think and pending[:idx]:
+                            text_parts.append(pending[:idx])
+                            yield pending[:idx]
+                        pending = pending[idx + len(tag):]
+                        in_think = not in_think
+                        continue
+                    keep = next((n for n in range(len(tag) - 1, 0, -1) if pending.endswith(tag[:n])), 0)
+                    emit, pending = pending[: len(pending) - keep], pending[len(pending) - keep:]
+                    if emit and not in_think:
+                        text_parts.append(emit)
+                        yield emit
+                    break
+                if data.get("done"):
+                    break
+
+        if pending and not in_think:
+            text_parts.append(pending)
+            yield pending
+
+        text = "".join(text_parts).strip()
+        if parsed_tool_calls:
+            logger.info(
+                "Ollama tool calls detected",
+                call_id=call_id,
+                tools=[tc["name"] for tc in parsed_tool_calls],
+            )
+        logger.info(
+            "Ollama response streamed",
+            call_id=call_id,
+            model=model,
+            response_length=len(text),
+            tool_calls=len(parsed_tool_calls),
+            preview=text[:80] if text else "(tool call only)",
+        )
+        messages.append({"role": "assistant", "content": text})
+        yield LLMResponse(
+            text=text,
+            tool_calls=parsed_tool_calls,
+            metadata={"model": model, "done": True, "streamed": True},
+        )
+
     async def validate_connectivity(self, options: Dict[str, Any]) -> Dict[str, Any]:
         """Test connectivity to the Ollama instance and list available models."""
         merged = self._compose_options(options)
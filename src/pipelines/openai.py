@@ -450,29 +450,7 @@ class OpenAILLMAdapter(LLMComponent):
         await self._ensure_session()
         assert self._session
         payload = self._build_chat_payload(transcript, context, merged)
-        
-        # Tool support: tool allowlists are resolved per-context by the engine and passed in via `merged["tools"]`.
-        # Do not gate tools by provider-level flags; contexts are the source of truth for tool availability.
-        tools_list = merged.get("tools")
-        tool_schemas = []
-        if tools_list and isinstance(tools_list, list):
-            for tool_name in tools_list:
-                tool = tool_registry.get(tool_name)
-                if tool:
-                    try:
-                        from src.tools.base import ToolPhase
-                        if getattr(tool.definition, "phase", ToolPhase.IN_CALL) != ToolPhase.IN_CALL:
-                            logger.warning("Skipping non-in-call tool in pipeline schema", tool=tool_name)
-                            continue
-                    except Exception:
-                        pass
-                    tool_schemas.append(tool.definition.to_openai_schema())
-                else:
-                    logger.warning("Tool not found in registry", tool=tool_name)
-            
-        if tool_schemas:
-            payload["tools"] = tool_schemas
-            payload["tool_choice"] = "auto"
+        self._attach_tool_schemas(payload, merged)
 
         headers = _make_http_headers(merged)
         url = merged["chat_base_url"].rstrip("/") + "/chat/completions"
@@ -574,6 +552,157 @@ class OpenAILLMAdapter(LLMComponent):
 
                 logger.warning("OpenAI LLM connection error, retrying", call_id=call_id, error=str(e))
     
+    def _attach_tool_schemas(self, payload: Dict[str, Any], merged: Dict[str, Any]) -> None:
+        # Tool support: tool allowlists are resolved per-context by the engine and passed in via `merged["tools"]`.
+        # Do not gate tools by provider-level flags; contexts are the source of truth for tool availability.
+        tools_list = merged.get("tools")
+        in_call_names = []
+        if tools_list and isinstance(tools_list, list):
+            for tool_name in tools_list:
+                tool = tool_registry.get(tool_name)
+                if tool:
+                    try:
+                        from src.tools.base import ToolPhase
+                        if getattr(tool.definition, "phase", ToolPhase.IN_CALL) != ToolPhase.IN_CALL:
+                            logger.warning("Skipping non-in-call tool in pipeline schema", tool=tool_name)
+                            continue
+                    except Exception:
+                        pass
+                    in_call_names.append(tool_name)
+                else:
+                    logger.warning("Tool not found in registry", tool=tool_name)
+
+        # Compiled once per tool list and registry generation, not per turn
+        tool_schemas = tool_registry.to_openai_schema_filtered(in_call_names) if in_call_names else []
+        if tool_schemas:
+            payload["tools"] = tool_schemas
+            payload["tool_choice"] = "auto"
+
+    async def generate_stream(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[str | LLMResponse]:
+        """Stream Chat Completions deltas (SSE); finishes with a full LLMResponse.
+
+        Tool-call fragments are accumulated per index and only surfaced in the
+        final LLMResponse. Failures before the first delta fall back to the
+        non-streaming ``generate()`` path (which owns the tool-less retry); a
+        stream cut off later ends with the text received so far.
+        """
+        merged = self._compose_options(options)
+        if not merged["api_key"]:
+            raise RuntimeError("OpenAI LLM requires an API key")
+        if merged.get("use_realtime"):
+            yield await self._generate_realtime(call_id, transcript, context, merged)
+            return
+
+        await self._ensure_session()
+        assert self._session
+        payload = self._build_chat_payload(transcript, context, merged)
+        self._attach_tool_schemas(payload, merged)
+        payload["stream"] = True
+        # Not every OpenAI-compatible server accepts stream_options; send it only when asked to.
+        if merged.get("stream_include_usage"):
+            payload["stream_options"] = {"include_usage": True}
+
+        headers = _make_http_headers(merged)
+        url = merged["chat_base_url"].rstrip("/") + "/chat/completions"
+
+        text_parts: list[str] = []
+        tool_parts: Dict[int, Dict[str, Any]] = {}
+        usage: Dict[str, Any] = {}
+        try:
+            async with self._session.post(url, json=payload, headers=headers, timeout=merged["timeout_sec"]) as response:
+                if response.status >= 400:
+                    body = await response.text()
+                    logger.warning(
+                        "OpenAI streaming chat completion failed; falling back to non-streaming",
+                        call_id=call_id,
+                        status=response.status,
+                        body_preview=body[:128],
+                    )
+                    yield await self.generate(call_id, transcript, context, options)
+                    return
+
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8", errors="ignore").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data_str = line[5:].strip()
+                    if data_str == "[DONE]":
+                        break
+                    try:
+                        data = json.loads(data_str)
+                    except json.JSONDecodeError:
+                        continue
+                    if data.get("usage"):
+                        usage = data["usage"]
+                    for choice in data.get("choices") or []:
+                        delta = choice.get("delta") or {}
+                        content = delta.get("content")
+                        if content:
+                            text_parts.append(content)
+                            yield content
+                        for tc in delta.get("tool_calls") or []:
+                            slot = tool_parts.setdefault(
+                                int(tc.get("index", 0)), {"id": None, "type": "function", "name": "", "arguments": ""}
+                            )
+                            if tc.get("id"):
+                                slot["id"] = tc["id"]
+                            if tc.get("type"):
+                                slot["type"] = tc["type"]
+                            func = tc.get("function") or {}
+                            if func.get("name"):
+                                slot["name"] += func["name"]
+                            if func.get("arguments"):
+                                slot["arguments"] += func["arguments"]
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if self._session is None or self._session.closed:
+                logger.info("OpenAI LLM generation cancelled (session closed)", call_id=call_id)
+            elif not text_parts:
+                logger.warning(
+                    "OpenAI streaming chat completion failed; falling back to non-streaming",
+                    call_id=call_id,
+                    error=str(e) or type(e).__name__,
+                )
+                yield await self.generate(call_id, transcript, context, options)
+                return
+            else:
+                logger.warning(
+                    "OpenAI chat completion stream interrupted; keeping the partial answer",
+                    call_id=call_id,
+                    error=str(e) or type(e).__name__,
+                    chars=sum(len(part) for part in text_parts),
+                )
+            # Tool calls may be cut off mid-arguments, so only the text survives.
+            yield LLMResponse(text="".join(text_parts), tool_calls=[], metadata=usage)
+            return
+
+        parsed_tool_calls = []
+        for _index, slot in sorted(tool_parts.items()):
+            try:
+                parsed_tool_calls.append({
+                    "id": slot["id"],
+                    "name": slot["name"],
+                    "parameters": json.loads(slot["arguments"] or "{}"),
+                    "type": slot["type"],
+                })
+            except Exception as e:
+                logger.warning("Failed to parse streamed tool call", error=str(e))
+
+        content = "".join(text_parts)
+        logger.info(
+            "OpenAI chat completion streamed",
+            call_id=call_id,
+            model=payload.get("model"),
+            preview=content[:80],
+            tool_calls=len(parsed_tool_calls),
+        )
+        yield LLMResponse(text=content, tool_calls=parsed_tool_calls, metadata=usage)
+
     async def _generate_realtime(
         self,
         call_id: str,
@@ -682,6 +811,9 @@ class OpenAILLMAdapter(LLMComponent):
             "max_tokens": runtime_options.get("max_tokens", self._pipeline_defaults.get("max_tokens")),
             "timeout_sec": float(runtime_options.get("timeout_sec", self._pipeline_defaults.get("timeout_sec", self._default_timeout))),
             "use_realtime": runtime_options.get("use_realtime", self._pipeline_defaults.get("use_realtime", False)),
+            "stream_include_usage": bool(
+                runtime_options.get("stream_include_usage", self._pipeline_defaults.get("stream_include_usage", False))
+            ),
             "tools": runtime_options.get("tools", self._pipeline_defaults.get("tools", [])),
             "api_version": runtime_options.get(
                 "api_version",
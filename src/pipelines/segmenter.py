@@ -0,0 +1,155 @@
+"""
+Incremental sentence/clause segmentation for streaming LLM output into TTS.
+
+The pipeline runner feeds token deltas from ``LLMComponent.generate_stream``
+into a ``SentenceSegmenter`` and synthesizes each segment as soon as it is
+complete, so the caller hears the first clause while the LLM is still
+generating the rest of the reply.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Optional
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) or a line
+# break, confirmed by the whitespace that follows it. Waiting for that
+# whitespace keeps "3.5" or "example.com" from splitting mid-token.
+_SENTENCE_END = re.compile(r"[.!?…]+[\"'”’)\]]*(?=\s)|\n+")
+_CLAUSE_END = re.compile(r"[,;:—–](?=\s)")
+_LAST_WORD = re.compile(r"(\S+)$")
+
+_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "st", "sr", "jr", "vs", "etc", "e.g", "i.e",
+    "no", "approx", "dept", "apt", "ave", "blvd", "inc", "ltd", "co", "mt",
+    "a.m", "p.m", "u.s",
+})
+
+
+def _is_abbreviation(text: str, end: int) -> bool:
+    match = _LAST_WORD.search(text[:end])
+    if not match:
+        return False
+    word = match.group(1).rstrip(".").lower()
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+class SentenceSegmenter:
+    """Split a stream of text deltas into speakable segments.
+
+    ``push()`` returns every segment completed by the new delta; ``flush()``
+    returns whatever is left at end of stream. The first segment is emitted
+    eagerly (a clause boundary after ``first_clause_chars`` is enough) to cut
+    time-to-first-audio; later segments prefer full sentences of at least
+    ``min_chars`` so TTS prosody stays natural. Segments never exceed
+    ``max_chars`` (split on whitespace).
+    """
+
+    def __init__(
+        self,
+        *,
+        min_chars: int = 24,
+        first_clause_chars: int = 16,
+        clause_chars: int = 80,
+        max_chars: int = 240,
+    ):
+        self.min_chars = max(1, int(min_chars))
+        self.first_clause_chars = max(1, int(first_clause_chars))
+        self.clause_chars = max(self.min_chars, int(clause_chars))
+        self.max_chars = max(self.clause_chars, int(max_chars))
+        self._buffer = ""
+        self._emitted = 0
+
+    def push(self, delta: str) -> List[str]:
+        if not delta:
+            return []
+        self._buffer += delta
+        segments: List[str] = []
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                break
+            segment = self._buffer[:cut].strip()
+            self._buffer = self._buffer[cut:].lstrip()
+            if segment:
+                segments.append(segment)
+                self._emitted += 1
+        return segments
+
+    def flush(self) -> Optional[str]:
+        segment = self._buffer.strip()
+        self._buffer = ""
+        if not segment:
+            return None
+        self._emitted += 1
+        return segment
+
+    def reset(self) -> None:
+        self._buffer = ""
+        self._emitted = 0
+
+    def _find_cut(self) -> Optional[int]:
+        text = self._buffer
+        min_sentence = 1 if self._emitted == 0 else self.min_chars
+        for match in _SENTENCE_END.finditer(text):
+            end = match.end()
+            if end < min_sentence:
+                continue
+            if text[match.start()] == "." and _is_abbreviation(text, match.start()):
+                continue
+            return end
+
+        clause_min = self.first_clause_chars if self._emitted == 0 else self.clause_chars
+        if len(text) >= clause_min:
+            cut = None
+            for match in _CLAUSE_END.finditer(text):
+                if match.end() >= clause_min and match.end() <= self.max_chars:
+                    cut = match.end()
+                    break
+            if cut is not None:
+                return cut
+
+        if len(text) > self.max_chars:
+            space = text.rfind(" ", 0, self.max_chars)
+            return space if space > 0 else self.max_chars
+        return None
+
+
+# Text-embedded tool-call markup some local models emit (see src/tools/parser.py).
+_TOOL_MARKERS = ("<tool_call", "functools[", '{"function"')
+
+
+class ToolMarkupGuard:
+    """Keep text-embedded tool-call markup out of streamed TTS.
+
+    ``push()`` returns the part of a delta that is safe to speak. A tail that
+    could be the start of a marker is held back until disambiguated; once a
+    marker appears, everything after it is withheld and ``markup_seen`` is set
+    so the caller can parse tool calls from the complete response.
+    """
+
+    def __init__(self):
+        self._pending = ""
+        self.markup_seen = False
+
+    def push(self, delta: str) -> str:
+        if self.markup_seen or not delta:
+            return ""
+        text = self._pending + delta
+        hits = [idx for idx in (text.find(m) for m in _TOOL_MARKERS) if idx >= 0]
+        if hits:
+            self.markup_seen = True
+            self._pending = ""
+            return text[: min(hits)]
+        keep = 0
+        for marker in _TOOL_MARKERS:
+            for n in range(min(len(marker) - 1, len(text)), keep, -1):
+                if text.endswith(marker[:n]):
+                    keep = n
+                    break
+        self._pending = text[len(text) - keep:] if keep else ""
+        return text[: len(text) - keep]
+
+    def flush(self) -> str:
+        text, self._pending = self._pending, ""
+        return "" if self.markup_seen else text
@@ -1,5 +1,6 @@
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Callable, Dict, Any, Optional
 
 class AIProviderInterface(ABC):
@@ -68,6 +69,40 @@ class ProviderCapabilities:
     requires_continuous_audio: bool = False  # True if provider needs continuous audio stream (not VAD-gated)
 
 
+@dataclass
+class WarmConnection:
+    """A provider connection opened before the call that will use it.
+
+    Providers that support warm pooling return one from ``open_warm_connection()``
+    and take one over in ``adopt_warm_connection()``; ``start_session`` then skips
+    whatever the connection already covers (see src/core/provider_warm_pool.py).
+    """
+    websocket: Any = None
+    # Seconds the provider spent opening it - what the leasing call no longer waits for
+    setup_seconds: float = 0.0
+    # Session configuration already applied on the socket; per-call values go out as a delta
+    base_session: Optional[Dict[str, Any]] = None
+    # Pre-authorized connect URL for providers that hand out signed URLs
+    url: Optional[str] = None
+    # Provider limit on how long the connection stays usable unleased (idle timeout, URL
+    # expiry); the pool retires it at the lower of this and warm_pool.max_age_sec
+    max_age_sec: Optional[float] = None
+    created_at: float = field(default_factory=time.monotonic)
+
+    def is_open(self) -> bool:
+        if self.websocket is None:
+            return True
+        state = getattr(self.websocket, "state", None)
+        return getattr(state, "name", None) == "OPEN"
+
+    async def close(self) -> None:
+        if self.websocket is not None:
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
+
+
 def _safe_list(val: Optional[List[Any]]) -> List[Any]:
     try:
         return list(val or [])
@@ -4,20 +4,20 @@ import websockets
 import time
 import array
 import re
-import audioop
 from typing import Callable, Optional, List, Dict, Any
 import websockets.exceptions
 from websockets.asyncio.client import ClientConnection
 
 from structlog import get_logger
 from prometheus_client import Gauge, Info
+from ..audio import pcm_ops
 from ..audio.resampler import (
     mulaw_to_pcm16le,
     pcm16le_to_mulaw,
     resample_audio,
 )
 from ..config import LLMConfig
-from .base import AIProviderInterface, ProviderCapabilities
+from .base import AIProviderInterface, ProviderCapabilities, WarmConnection
 
 # Tool calling support
 from src.tools.registry import tool_registry
@@ -42,6 +42,9 @@ _DEEPGRAM_SETTINGS_ACK_LATENCY_MS = Gauge(
     "Latency from Settings send to SettingsApplied ACK (ms)",
 )
 
+# Unleased warm sockets send nothing, and the agent drops sockets idle for 10 s
+_WARM_MAX_AGE_SEC = 8.0
+
 class DeepgramProvider(AIProviderInterface):
     @staticmethod
     def _canonicalize_encoding(value: Optional[str]) -> str:
@@ -137,6 +140,8 @@ class DeepgramProvider(AIProviderInterface):
         self.llm_config = llm_config
         self.websocket: Optional[ClientConnection] = None
         self._keep_alive_task: Optional[asyncio.Task] = None
+        # Pre-connected socket handed over by the engine's warm pool (consumed by start_session)
+        self._warm_connection: Optional[WarmConnection] = None
         self._is_audio_flowing = False
         self.request_id: Optional[str] = None
         self.session_id: Optional[str] = None
@@ -337,16 +342,47 @@ class DeepgramProvider(AIProviderInterface):
         except Exception:
             return pcm_bytes
 
-    async def start_session(self, call_id: str, context: Optional[Dict[str, Any]] = None):
+    def _voice_agent_url(self) -> str:
         # Use configurable voice agent endpoint when available; fall back to default.
-        base_url = getattr(self.config, "voice_agent_base_url", None) or "wss://agent.deepgram.com/v1/agent/converse"
-        ws_url = base_url
+        return getattr(self.config, "voice_agent_base_url", None) or "wss://agent.deepgram.com/v1/agent/converse"
+
+    async def _connect_voice_agent(self) -> ClientConnection:
         headers = {'Authorization': f'Token {self.config.api_key}'}
+        return await websockets.connect(self._voice_agent_url(), additional_headers=list(headers.items()))
+
+    async def open_warm_connection(self) -> WarmConnection:
+        """Connect and authenticate ahead of a call (provider warm pool).
+
+        Settings carries the per-call greeting and prompt and can only be sent
+        once, so it still goes out from start_session on the leased socket.
+        Until then nothing can keep the socket alive, and the agent closes
+        sockets that send no data for 10 seconds, so it is retired before that.
+        """
+        started = time.perf_counter()
+        websocket = await self._connect_voice_agent()
+        return WarmConnection(
+            websocket=websocket,
+            setup_seconds=time.perf_counter() - started,
+            max_age_sec=_WARM_MAX_AGE_SEC,
+        )
+
+    def adopt_warm_connection(self, conn: WarmConnection) -> None:
+        self._warm_connection = conn
 
+    async def start_session(self, call_id: str, context: Optional[Dict[str, Any]] = None):
+        warm, self._warm_connection = self._warm_connection, None
         try:
-            logger.info("Connecting to Deepgram Voice Agent...", url=ws_url)
-            self.websocket = await websockets.connect(ws_url, additional_headers=list(headers.items()))
-            logger.info("✅ Successfully connected to Deepgram Voice Agent.")
+            if warm is not None:
+                self.websocket = warm.websocket
+                logger.info(
+                    "Using pre-connected Deepgram Voice Agent socket",
+                    call_id=call_id,
+                    warm_age_sec=round(time.monotonic() - warm.created_at, 1),
+                )
+            else:
+                logger.info("Connecting to Deepgram Voice Agent...", url=self._voice_agent_url())
+                self.websocket = await self._connect_voice_agent()
+                logger.info("✅ Successfully connected to Deepgram Voice Agent.")
 
             # Persist call context for downstream events
             self.call_id = call_id
@@ -646,7 +682,7 @@ class DeepgramProvider(AIProviderInterface):
                 if input_encoding in ("ulaw", "mulaw", "g711_ulaw", "mu-law"):
                     if actual_format == "pcm16":
                         try:
-                            payload = audioop.lin2ulaw(audio_chunk, 2)
+                            payload = pcm16le_to_mulaw(audio_chunk)
                         except Exception:
                             logger.warning("Failed to convert PCM to μ-law for Deepgram", exc_info=True)
                             payload = audio_chunk
@@ -662,7 +698,7 @@ class DeepgramProvider(AIProviderInterface):
                             state=self._input_resample_state,
                         )
                         try:
-                            payload = audioop.lin2ulaw(pcm_resampled, 2)
+                            payload = pcm16le_to_mulaw(pcm_resampled)
                         except Exception:
                             logger.warning("Failed to convert resampled PCM back to μ-law", exc_info=True)
                             payload = audio_chunk
@@ -702,7 +738,7 @@ class DeepgramProvider(AIProviderInterface):
 
                 if pcm_for_rms is not None:
                     try:
-                        rms = audioop.rms(pcm_for_rms, 2)
+                        rms = pcm_ops.rms(pcm_for_rms)
                         alpha = 0.2
                         self._rms_ma = (alpha * float(rms)) + (1.0 - alpha) * float(self._rms_ma or 0.0)
                         protect_elapsed = 0.0
@@ -1422,12 +1458,12 @@ class DeepgramProvider(AIProviderInterface):
                             else:
                                 # Compare RMS treating payload as PCM16 vs μ-law→PCM16
                                 try:
-                                    rms_pcm = audioop.rms(message[: min(960, l - (l % 2))], 2) if l >= 2 else 0
+                                    rms_pcm = pcm_ops.rms(message[: min(960, l - (l % 2))]) if l >= 2 else 0
                                 except Exception:
                                     rms_pcm = 0
                                 try:
                                     pcm_from_ulaw = mulaw_to_pcm16le(message[: min(320, l)])
-                                    rms_ulaw = audioop.rms(pcm_from_ulaw, 2) if pcm_from_ulaw else 0
+                                    rms_ulaw = pcm_ops.rms(pcm_from_ulaw) if pcm_from_ulaw else 0
                                 except Exception:
                                     rms_ulaw = 0
                                 if rms_ulaw > max(50, int(1.5 * (rms_pcm or 1))):
@@ -14,19 +14,23 @@ import base64
 import json
 import logging
 import os
-import audioop
 import struct
+import time
 from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass
 
 import websockets
 from websockets.asyncio.client import ClientConnection
 
-from .base import AIProviderInterface, ProviderCapabilities, ProviderCapabilitiesMixin
+from ..audio import get_codec_engine, mulaw_to_pcm16le, pcm16le_to_mulaw, resample_audio
+from .base import AIProviderInterface, ProviderCapabilities, ProviderCapabilitiesMixin, WarmConnection
 from .elevenlabs_config import ElevenLabsAgentConfig
 
 logger = logging.getLogger(__name__)
 
+# Signed conversation URLs expire after 15 minutes
+_WARM_MAX_AGE_SEC = 14 * 60.0
+
 
 @dataclass
 class ElevenLabsSessionState:
@@ -74,6 +78,8 @@ class ElevenLabsAgentProvider(AIProviderInterface, ProviderCapabilitiesMixin):
         self._session_state = ElevenLabsSessionState()
         self._connected = False
         self._closing = False
+        # Signed URL fetched ahead of the call by the engine's warm pool (consumed by start_session)
+        self._warm_connection: Optional[WarmConnection] = None
         
         # Audio resampling state
         self._resample_state_in = None  # For input resampling
@@ -152,8 +158,13 @@ class ElevenLabsAgentProvider(AIProviderInterface, ProviderCapabilitiesMixin):
         
         logger.info(f"[elevenlabs] [{call_id}] Connecting to ElevenLabs Conversational AI...")
         
-        # For authenticated agents, get a signed URL first
-        signed_url = await self._get_signed_url(api_key, agent_id, call_id)
+        # For authenticated agents, get a signed URL first (unless the warm pool already did)
+        warm, self._warm_connection = self._warm_connection, None
+        if warm is not None and warm.url:
+            signed_url = warm.url
+            logger.info(f"[elevenlabs] [{call_id}] Using pre-fetched signed URL")
+        else:
+            signed_url = await self._get_signed_url(api_key, agent_id, call_id)
         
         try:
             self._ws = await asyncio.wait_for(
@@ -190,6 +201,24 @@ class ElevenLabsAgentProvider(AIProviderInterface, ProviderCapabilitiesMixin):
             logger.error(f"[elevenlabs] [{call_id}] Connection failed: {e}")
             raise
     
+    async def open_warm_connection(self) -> WarmConnection:
+        """Fetch a signed URL ahead of a call (provider warm pool).
+
+        The conversation (and its billing) starts as soon as the websocket
+        opens, so only the signed-URL round trip is done in advance. Signed
+        URLs stay valid for 15 minutes, so the pool retires them before that.
+        """
+        api_key = self.config.api_key or os.getenv("ELEVENLABS_API_KEY", "")
+        agent_id = self.config.agent_id or os.getenv("ELEVENLABS_AGENT_ID", "")
+        if not api_key or not agent_id:
+            raise ValueError("ELEVENLABS_API_KEY and ELEVENLABS_AGENT_ID must be configured")
+        started = time.perf_counter()
+        signed_url = await self._get_signed_url(api_key, agent_id, "warm-pool")
+        return WarmConnection(url=signed_url, setup_seconds=time.perf_counter() - started, max_age_sec=_WARM_MAX_AGE_SEC)
+
+    def adopt_warm_connection(self, conn: WarmConnection) -> None:
+        self._warm_connection = conn
+
     async def _get_signed_url(self, api_key: str, agent_id: str, call_id: str) -> str:
         """
         Get a signed URL for connecting to an authenticated ElevenLabs agent.
@@ -320,15 +349,15 @@ class ElevenLabsAgentProvider(AIProviderInterface, ProviderCapabilitiesMixin):
         
         if in_encoding in ("ulaw", "mulaw"):
             # Decode μ-law to PCM16
-            pcm16_audio = audioop.ulaw2lin(audio_chunk, 2)
+            pcm16_audio = mulaw_to_pcm16le(audio_chunk)
         elif in_encoding == "alaw":
-            pcm16_audio = audioop.alaw2lin(audio_chunk, 2)
+            pcm16_audio = get_codec_engine().alaw_decode(audio_chunk)
         
         # Resample to 16kHz if needed
         target_rate = self.config.provider_input_sample_rate_hz
         if in_rate != target_rate:
-            pcm16_audio, self._resample_state_in = audioop.ratecv(
-                pcm16_audio, 2, 1, in_rate, target_rate, self._resample_state_in
+            pcm16_audio, self._resample_state_in = resample_audio(
+                pcm16_audio, in_rate, target_rate, state=self._resample_state_in
             )
         
         # Encode to base64
@@ -567,15 +596,15 @@ class ElevenLabsAgentProvider(AIProviderInterface, ProviderCapabilitiesMixin):
         
         # Resample if needed
         if source_rate != target_rate:
-            output, self._resample_state_out = audioop.ratecv(
-                output, 2, 1, source_rate, target_rate, self._resample_state_out
+            output, self._resample_state_out = resample_audio(
+                output, source_rate, target_rate, state=self._resample_state_out
             )
         
         # Encode to μ-law or a-law if needed
         if target_encoding in ("ulaw", "mulaw"):
-            output = audioop.lin2ulaw(output, 2)
+            output = pcm16le_to_mulaw(output)
         elif target_encoding == "alaw":
-            output = audioop.lin2alaw(output, 2)
+            output = get_codec_engine().alaw_encode(output)
         
         return output
     
@@ -23,7 +23,6 @@ import contextlib
 import json
 import time
 import struct
-import audioop
 import re
 from typing import Any, Dict, Optional, List, Tuple
 from collections import deque
@@ -35,7 +34,7 @@ from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 from structlog import get_logger
 from prometheus_client import Gauge, Counter
 
-from .base import AIProviderInterface, ProviderCapabilities
+from .base import AIProviderInterface, ProviderCapabilities, WarmConnection
 from ..audio import (
     convert_pcm16le_to_target_format,
     mulaw_to_pcm16le,
@@ -81,6 +80,7 @@ _GEMINI_INPUT_RATE = 16000  # Gemini requires 16kHz input
 _GEMINI_OUTPUT_RATE = 24000  # Gemini outputs 24kHz audio
 _COMMIT_INTERVAL_SEC = 0.02  # 20ms chunks (320 bytes at 16kHz)
 _KEEPALIVE_INTERVAL_SEC = 15.0
+_WARM_MAX_AGE_SEC = 60.0  # Pre-setup sockets cannot send keepalives
 
 # Metrics
 _GOOGLE_LIVE_SESSIONS = Gauge(
@@ -135,6 +135,8 @@ class GoogleLiveProvider(AIProviderInterface):
         self._keepalive_task: Optional[asyncio.Task] = None
         self._send_lock = asyncio.Lock()
         self._gating_manager = gating_manager
+        # Pre-connected socket handed over by the engine's warm pool (consumed by start_session)
+        self._warm_connection: Optional[WarmConnection] = None
 
         self._call_id: Optional[str] = None
         self._session_id: Optional[str] = None
@@ -608,28 +610,26 @@ class GoogleLiveProvider(AIProviderInterface):
             raise ValueError("GOOGLE_API_KEY is required for Google Live provider")
         
         api_key_preview = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "<too_short>"
-        endpoint = (self.config.websocket_endpoint or "").strip()
-        if not endpoint:
-            # Fallback to historical constant if config not populated
-            endpoint = "wss://generativelanguage.googleapis.com/ws/google.ai.generativelanguage.v1beta.GenerativeService.BidiGenerateContent"
-
-        logger.debug(
-            "Connecting to Google Live API",
-            call_id=call_id,
-            endpoint=endpoint,
-            api_key_preview=api_key_preview,
-        )
-        
-        ws_url = f"{endpoint}?key={api_key}"
+        warm, self._warm_connection = self._warm_connection, None
 
         try:
-            # Establish WebSocket connection
-            self.websocket = await websockets.connect(
-                ws_url,
-                subprotocols=["gemini-live"],
-                max_size=10 * 1024 * 1024,  # 10MB max message size
-            )
-            
+            if warm is not None:
+                self.websocket = warm.websocket
+                logger.info(
+                    "Using pre-connected Google Live socket",
+                    call_id=call_id,
+                    warm_age_sec=round(time.monotonic() - warm.created_at, 1),
+                )
+            else:
+                logger.debug(
+                    "Connecting to Google Live API",
+                    call_id=call_id,
+                    endpoint=self._websocket_endpoint(),
+                    api_key_preview=api_key_preview,
+                )
+                # Establish WebSocket connection
+                self.websocket = await self._connect_live_api(api_key)
+
             _GOOGLE_LIVE_SESSIONS.inc()
             self._session_gauge_incremented = True
              
@@ -678,6 +678,42 @@ class GoogleLiveProvider(AIProviderInterface):
             await self.stop_session()
             raise
 
+    def _websocket_endpoint(self) -> str:
+        endpoint = (self.config.websocket_endpoint or "").strip()
+        if not endpoint:
+            # Fallback to historical constant if config not populated
+            endpoint = "wss://generativelanguage.googleapis.com/ws/google.ai.generativelanguage.v1beta.GenerativeService.BidiGenerateContent"
+        return endpoint
+
+    async def _connect_live_api(self, api_key: str) -> ClientConnection:
+        return await websockets.connect(
+            f"{self._websocket_endpoint()}?key={api_key}",
+            subprotocols=["gemini-live"],
+            max_size=10 * 1024 * 1024,  # 10MB max message size
+        )
+
+    async def open_warm_connection(self) -> WarmConnection:
+        """Open the Live API socket ahead of a call (provider warm pool).
+
+        The setup message fixes the model, system instruction and tools for the
+        whole session and must be the first message, so it is sent from
+        start_session on the leased socket. Nothing else may be sent before it
+        to keep the socket alive, so the pool retires it after a minute.
+        """
+        api_key = self.config.api_key or ""
+        if not api_key:
+            raise ValueError("GOOGLE_API_KEY is required for Google Live provider")
+        started = time.perf_counter()
+        websocket = await self._connect_live_api(api_key)
+        return WarmConnection(
+            websocket=websocket,
+            setup_seconds=time.perf_counter() - started,
+            max_age_sec=_WARM_MAX_AGE_SEC,
+        )
+
+    def adopt_warm_connection(self, conn: WarmConnection) -> None:
+        self._warm_connection = conn
+
     @staticmethod
     def _normalize_model_name(model: Optional[str]) -> str:
         """
@@ -8,8 +8,10 @@ from websockets.asyncio.client import ClientConnection
 
 from structlog import get_logger
 
+from ..audio.codec_engine import Pcm16kInputStage
 from ..config import LocalProviderConfig
 from .base import AIProviderInterface
+from .local_mux import LocalAIMuxChannel, get_local_mux_pool
 from ..tools.parser import parse_response_with_tools
 
 logger = get_logger(__name__)
@@ -33,11 +35,16 @@ class LocalProvider(AIProviderInterface):
         self._send_queue: asyncio.Queue = asyncio.Queue(maxsize=200)
         self._active_call_id: Optional[str] = None
         self.input_mode: str = 'mulaw8k'  # or 'pcm16_8k' or 'pcm16_16k'
+        # Carries resampler state across send batches so batch edges don't click
+        self._input_stage = Pcm16kInputStage()
         self._pending_tts_responses: Dict[str, asyncio.Future] = {}  # Track pending TTS responses
         # Initial greeting text provided by engine/config (optional)
         self._initial_greeting: Optional[str] = None
         # Mode for local_ai_server: "full" or "stt" (for hybrid pipelines with cloud LLM)
         self._mode: str = getattr(config, 'mode', 'full') or 'full'
+        # "binary": share framed connections with other calls instead of a websocket per call
+        self._transport: str = (getattr(config, 'transport', 'json') or 'json').lower()
+        self._transport_connections: int = int(getattr(config, 'transport_connections', 2) or 2)
         # Track if server port is unavailable (not running at all)
         self._server_unavailable: bool = False
         # Parse host/port from ws_url for port checking
@@ -106,6 +113,14 @@ class LocalProvider(AIProviderInterface):
         return bool(self.websocket is not None and self.websocket.state.name == "OPEN")
 
     async def _connect_ws(self):
+        if self._transport == "binary":
+            pool = get_local_mux_pool(
+                self.ws_url,
+                size=self._transport_connections,
+                auth_token=self.auth_token,
+                connect_timeout=self.connect_timeout,
+            )
+            return await pool.open_channel(self._active_call_id or "unknown", self._mode)
         # Use conservative client settings; server will drive pings if needed
         return await asyncio.wait_for(
             websockets.connect(
@@ -122,6 +137,8 @@ class LocalProvider(AIProviderInterface):
         """Authenticate with local-ai-server if auth_token is configured."""
         if not self.auth_token or not self.websocket or self.websocket.state.name != "OPEN":
             return
+        if isinstance(self.websocket, LocalAIMuxChannel):
+            return  # the shared connection authenticated when it was opened
         await self.websocket.send(
             json.dumps({"type": "auth", "auth_token": self.auth_token})
         )
@@ -340,6 +357,7 @@ class LocalProvider(AIProviderInterface):
             if self.websocket and self.websocket.state.name == "OPEN":
                 logger.debug("WebSocket already connected, reusing connection", call_id=call_id)
                 self._active_call_id = call_id
+                self._input_stage.reset()
                 # Ensure listener and sender tasks are running (may have crashed)
                 if self._listener_task is None or self._listener_task.done():
                     logger.info("Restarting listener task for reused connection", call_id=call_id)
@@ -349,9 +367,10 @@ class LocalProvider(AIProviderInterface):
                     self._sender_task = asyncio.create_task(self._send_loop())
                 return
             
-            # If not connected, initialize first
-            await self.initialize()
+            # If not connected, initialize first (binary transport opens the channel for this call id)
             self._active_call_id = call_id
+            self._input_stage.reset()
+            await self.initialize()
         except Exception:
             logger.error("Failed to start session", call_id=call_id, exc_info=True)
             raise
@@ -388,19 +407,17 @@ class LocalProvider(AIProviderInterface):
                     pass
 
                 # Convert and send one aggregated message
-                import audioop
-                # Handle different input modes
                 if self.input_mode == 'pcm16_16k':
                     # Already 16kHz PCM, just concatenate
-                    pcm16k = b"".join(batch)
+                    pcm16k = self._input_stage.convert(batch, 'pcm16_16k')
                 elif self.input_mode == 'pcm16_8k':
                     # 8kHz PCM, resample to 16kHz
-                    pcm8k = b"".join(batch)
-                    pcm16k, _ = audioop.ratecv(pcm8k, 2, 1, 8000, 16000, None)
+                    pcm16k = self._input_stage.convert(batch, 'pcm16_8k')
                 else:
-                    # µ-law 8kHz, convert to PCM then resample
-                    pcm8k = b"".join(audioop.ulaw2lin(b, 2) for b in batch)
-                    pcm16k, _ = audioop.ratecv(pcm8k, 2, 1, 8000, 16000, None)
+                    # µ-law 8kHz, decode the whole batch at once then resample
+                    pcm16k = self._input_stage.convert(batch, 'ulaw')
+                if not pcm16k:
+                    continue
                 
                 # Process audio batch for STT
                 total_bytes = sum(len(b) for b in batch)
@@ -409,14 +426,18 @@ class LocalProvider(AIProviderInterface):
                              total_bytes=total_bytes,
                              input_mode=self.input_mode)
                 
-                msg = json.dumps({
-                    "type": "audio", 
-                    "data": base64.b64encode(pcm16k).decode('utf-8'),
-                    "rate": 16000,
-                    "format": "pcm16le",
-                    "call_id": self._active_call_id,
-                    "mode": self._mode  # "stt" for hybrid, "full" for all-local
-                })
+                if isinstance(self.websocket, LocalAIMuxChannel):
+                    # Binary transport: raw PCM in one frame (waits for the call's credit)
+                    msg = pcm16k
+                else:
+                    msg = json.dumps({
+                        "type": "audio",
+                        "data": base64.b64encode(pcm16k).decode('utf-8'),
+                        "rate": 16000,
+                        "format": "pcm16le",
+                        "call_id": self._active_call_id,
+                        "mode": self._mode  # "stt" for hybrid, "full" for all-local
+                    })
                 try:
                     await self.websocket.send(msg)
                     logger.debug("WebSocket batch send successful", 
@@ -447,18 +468,20 @@ class LocalProvider(AIProviderInterface):
 
     def set_input_mode(self, mode: str):
         # mode: 'mulaw8k' or 'pcm16_8k'
+        if mode != self.input_mode:
+            self._input_stage.reset()
         self.input_mode = mode
 
     async def play_initial_greeting(self, call_id: str):
         """Play an initial greeting message to the caller."""
         try:
+            # Ensure the receive loop will attribute AgentAudio to this call
+            self._active_call_id = call_id
+
             # Ensure websocket connection exists
             if not self.websocket or self.websocket.state.name != "OPEN":
                 await self.initialize()
 
-            # Ensure the receive loop will attribute AgentAudio to this call
-            self._active_call_id = call_id
-
             # Compute greeting to speak; skip if none
             greeting_text = self._initial_greeting or ""
             if not greeting_text.strip():
@@ -507,6 +530,15 @@ class LocalProvider(AIProviderInterface):
                 except asyncio.QueueEmpty:
                     break
         
+        if isinstance(self.websocket, LocalAIMuxChannel):
+            # Binary transport: the shared connection stays up, this call's channel goes away.
+            await self.websocket.close()
+            for task in (self._sender_task, self._listener_task):
+                if task and not task.done() and task is not asyncio.current_task():
+                    task.cancel()
+            logger.info("Provider session stopped, mux channel closed", call_id=self._active_call_id)
+            return
+
         # DON'T clear the active call ID immediately - keep it for AgentAudio processing
         # The call_id will be cleared when the TTS playback is complete
         # self._active_call_id = None
@@ -0,0 +1,369 @@
+"""
+Binary-framed, multiplexed transport to the Local AI Server.
+
+With ``transport: binary`` the local provider and the local pipeline adapters
+stop opening one websocket per call and shipping audio as base64 inside JSON.
+A ``LocalAIMuxPool`` instead keeps up to ``transport_connections`` persistent
+connections and spreads calls over them:
+
+* Each connection authenticates once and negotiates framing once
+  (``transport`` -> ``transport_ready``).
+* Audio goes out as binary frames: a 12-byte header (mode, rate, sequence
+  number, call id length), the call id, then raw PCM16.  No base64 on either
+  side, no JSON encode/decode per chunk, and no permessage-deflate pass over
+  audio that does not compress.
+* The server grants each call ``window`` frames and returns credit as it
+  processes them.  A channel waits for credit before sending past its window,
+  so a call whose STT falls behind backs up in its own send queue (where the
+  sender coalesces chunks) instead of in the socket every other call shares.
+* ``LocalAIMuxChannel`` stands in for the per-call websocket (``send``,
+  ``recv``, async iteration, ``state``, ``close``), so callers keep their JSON
+  handling; server messages reach it by ``call_id`` and TTS audio by the frame
+  header.
+
+The frame layout mirrors ``local_ai_server/protocol_contract.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+import websockets
+from structlog import get_logger
+from websockets.asyncio.client import ClientConnection
+from websockets.exceptions import ConnectionClosed, ConnectionClosedError, ConnectionClosedOK
+from websockets.protocol import State
+
+logger = get_logger(__name__)
+
+FRAME_MAGIC = b"LA"
+FRAME_VERSION = 1
+FRAME_AUDIO = 1
+FRAME_TTS_AUDIO = 2
+FRAME_CREDIT = 3
+FRAME_MODES = ("full", "stt", "llm", "tts")
+FRAME_HEADER = struct.Struct("!2sBBBBHI")
+
+
+class Frame(NamedTuple):
+    kind: int
+    call_id: str
+    mode: str
+    rate: int
+    seq: int
+    payload: bytes
+
+
+def encode_frame(
+    kind: int,
+    call_id: str,
+    payload: bytes = b"",
+    *,
+    mode: str = "full",
+    rate: int = 0,
+    seq: int = 0,
+) -> bytes:
+    cid = call_id.encode("utf-8")
+    if not 0 < len(cid) < 256:
+        raise ValueError("frame call_id must be 1-255 bytes")
+    header = FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, kind, FRAME_MODES.index(mode), len(cid), rate, seq)
+    return b"".join((header, cid, payload))
+
+
+def decode_frame(message: bytes) -> Frame:
+    """Split a binary frame into header fields and payload. Raises ValueError on malformed frames."""
+    if len(message) < FRAME_HEADER.size:
+        raise ValueError("frame shorter than header")
+    magic, version, kind, mode, id_len, rate, seq = FRAME_HEADER.unpack_from(message)
+    if magic != FRAME_MAGIC:
+        raise ValueError("bad frame magic")
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version {version}")
+    if mode >= len(FRAME_MODES):
+        raise ValueError(f"unknown frame mode {mode}")
+    start = FRAME_HEADER.size + id_len
+    if id_len == 0 or len(message) < start:
+        raise ValueError("truncated frame call_id")
+    call_id = message[FRAME_HEADER.size:start].decode("utf-8")
+    return Frame(kind, call_id, FRAME_MODES[mode], rate, seq, message[start:])
+
+
+class LocalAIMuxChannel:
+    """One call's view of a shared connection; quacks like the websocket it replaces."""
+
+    def __init__(self, connection: "LocalAIMuxConnection", call_id: str, mode: str):
+        self.call_id = call_id
+        self.mode = mode
+        self._connection = connection
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._credits = connection.window
+        self._credit_event = asyncio.Event()
+        self._seq = 0
+        self._closed_by: Optional[ConnectionClosed] = None
+
+    @property
+    def state(self) -> State:
+        return State.OPEN if self._closed_by is None else State.CLOSED
+
+    @property
+    def credits(self) -> int:
+        return self._credits
+
+    def _raise_if_closed(self) -> None:
+        if self._closed_by is not None:
+            raise self._closed_by
+
+    async def send(self, message: Union[str, bytes]) -> None:
+        """Send a JSON text message, or raw 16 kHz PCM16 as an audio frame."""
+        if isinstance(message, (bytes, bytearray)):
+            await self.send_audio(bytes(message))
+            return
+        self._raise_if_closed()
+        # The server routes by call_id, so every message on a channel must carry this one.
+        payload = json.loads(message)
+        if payload.get("call_id") != self.call_id:
+            payload["call_id"] = self.call_id
+            message = json.dumps(payload)
+        await self._connection.send(message)
+
+    async def send_audio(self, pcm16: bytes, rate: int = 16000, *, mode: Optional[str] = None) -> None:
+        """Send one audio frame, waiting for credit when the call's window is used up."""
+        while self._credits <= 0:
+            self._raise_if_closed()
+            self._credit_event.clear()
+            await self._credit_event.wait()
+        self._raise_if_closed()
+        self._credits -= 1
+        self._seq += 1
+        await self._connection.send(
+            encode_frame(FRAME_AUDIO, self.call_id, pcm16, mode=mode or self.mode, rate=rate, seq=self._seq)
+        )
+
+    async def recv(self) -> Union[str, bytes]:
+        if self._inbox.empty():
+            self._raise_if_closed()
+        message = await self._inbox.get()
+        if message is None:
+            self._raise_if_closed()
+        return message
+
+    async def __aiter__(self):
+        try:
+            while True:
+                yield await self.recv()
+        except ConnectionClosedOK:
+            return
+
+    async def close(self) -> None:
+        if self._closed_by is not None:
+            return
+        self._shut(ConnectionClosedOK(None, None))
+        if self._connection.channels.get(self.call_id) is self:
+            self._connection.channels.pop(self.call_id, None)
+            try:
+                await self._connection.send(json.dumps({"type": "call_end", "call_id": self.call_id}))
+            except ConnectionClosed:
+                pass
+
+    # Called by the connection's reader
+    def _deliver(self, message: Union[str, bytes]) -> None:
+        self._inbox.put_nowait(message)
+
+    def _grant(self, frames: int) -> None:
+        self._credits += frames
+        self._credit_event.set()
+
+    def _shut(self, reason: ConnectionClosed) -> None:
+        if self._closed_by is None:
+            self._closed_by = reason
+            self._inbox.put_nowait(None)
+            self._credit_event.set()
+
+
+class LocalAIMuxConnection:
+    """One persistent, binary-framed websocket carrying many calls."""
+
+    def __init__(self, websocket: ClientConnection, window: int):
+        self.websocket = websocket
+        self.window = max(1, int(window))
+        self.channels: Dict[str, LocalAIMuxChannel] = {}
+        self._reader: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def open(
+        cls,
+        url: str,
+        *,
+        auth_token: Optional[str] = None,
+        connect_timeout: float = 5.0,
+    ) -> "LocalAIMuxConnection":
+        websocket = await asyncio.wait_for(
+            # PCM does not deflate usefully; permessage-deflate only costs CPU per frame.
+            websockets.connect(url, ping_interval=None, ping_timeout=None, max_size=None, compression=None),
+            timeout=connect_timeout,
+        )
+        try:
+            if auth_token:
+                await websocket.send(json.dumps({"type": "auth", "auth_token": auth_token}))
+                resp = await cls._recv_json(websocket, connect_timeout)
+                if resp.get("type") != "auth_response" or resp.get("status") != "ok":
+                    raise RuntimeError(f"Auth rejected: {resp}")
+            await websocket.send(json.dumps({"type": "transport", "framing": "binary", "version": FRAME_VERSION}))
+            try:
+                resp = await cls._recv_json(websocket, connect_timeout)
+            except asyncio.TimeoutError:
+                resp = {}
+            if resp.get("type") != "transport_ready":
+                raise RuntimeError(
+                    "Local AI Server did not accept binary transport "
+                    "(upgrade local_ai_server or set transport: json)"
+                )
+        except BaseException:
+            await websocket.close()
+            raise
+        connection = cls(websocket, int(resp.get("window") or 1))
+        connection._reader = asyncio.create_task(connection._read_loop())
+        return connection
+
+    @staticmethod
+    async def _recv_json(websocket: ClientConnection, timeout: float) -> dict:
+        raw = await asyncio.wait_for(websocket.recv(), timeout=timeout)
+        if isinstance(raw, (bytes, bytearray)):
+            raise RuntimeError("Unexpected binary message during transport handshake")
+        return json.loads(raw)
+
+    def is_open(self) -> bool:
+        return self.websocket.state is State.OPEN and self._reader is not None and not self._reader.done()
+
+    def open_channel(self, call_id: str, mode: str) -> LocalAIMuxChannel:
+        previous = self.channels.get(call_id)
+        if previous is not None:
+            # Same call re-opened (e.g. after its caller gave up on the old channel).
+            previous._shut(ConnectionClosedOK(None, None))
+        channel = LocalAIMuxChannel(self, call_id, mode)
+        self.channels[call_id] = channel
+        return channel
+
+    async def send(self, message: Union[str, bytes]) -> None:
+        await self.websocket.send(message)
+
+    async def _read_loop(self) -> None:
+        reason: ConnectionClosed = ConnectionClosedError(None, None)
+        try:
+            async for message in self.websocket:
+                if isinstance(message, bytes):
+                    try:
+                        frame = decode_frame(message)
+                    except ValueError as exc:
+                        logger.warning("Dropping malformed frame from Local AI Server", error=str(exc))
+                        continue
+                    channel = self.channels.get(frame.call_id)
+                    if channel is None:
+                        continue
+                    if frame.kind == FRAME_CREDIT:
+                        channel._grant(frame.seq)
+                    elif frame.kind == FRAME_TTS_AUDIO:
+                        channel._deliver(frame.payload)
+                    continue
+                try:
+                    call_id = json.loads(message).get("call_id")
+                except (json.JSONDecodeError, AttributeError):
+                    call_id = None
+                channel = self.channels.get(call_id) if call_id else None
+                if channel is not None:
+                    channel._deliver(message)
+                else:
+                    logger.debug("Local AI Server message for no open call", call_id=call_id, preview=message[:80])
+        except ConnectionClosed as exc:
+            reason = exc
+        except Exception:
+            logger.error("Local AI Server mux reader failed", exc_info=True)
+        finally:
+            # Callers see a dropped connection like a dropped per-call websocket and reconnect.
+            if not isinstance(reason, ConnectionClosedError):
+                reason = ConnectionClosedError(reason.rcvd, reason.sent)
+            channels, self.channels = list(self.channels.values()), {}
+            for channel in channels:
+                channel._shut(reason)
+
+    async def close(self) -> None:
+        await self.websocket.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class LocalAIMuxPool:
+    """Spreads calls over up to ``size`` shared connections to one Local AI Server."""
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        size: int = 2,
+        auth_token: Optional[str] = None,
+        connect_timeout: float = 5.0,
+    ):
+        self.url = url
+        self.size = max(1, int(size))
+        self.auth_token = auth_token or None
+        self.connect_timeout = float(connect_timeout)
+        self._connections: List[LocalAIMuxConnection] = []
+        self._lock = asyncio.Lock()
+
+    async def open_channel(self, call_id: str, mode: str) -> LocalAIMuxChannel:
+        async with self._lock:
+            self._connections = [c for c in self._connections if c.is_open()]
+            if len(self._connections) < self.size:
+                connection = await LocalAIMuxConnection.open(
+                    self.url,
+                    auth_token=self.auth_token,
+                    connect_timeout=self.connect_timeout,
+                )
+                self._connections.append(connection)
+                logger.info(
+                    "Opened Local AI Server mux connection",
+                    url=self.url,
+                    connections=len(self._connections),
+                    window=connection.window,
+                )
+            else:
+                connection = min(self._connections, key=lambda c: len(c.channels))
+            return connection.open_channel(call_id, mode)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": len(self._connections),
+            "calls": sum(len(c.channels) for c in self._connections),
+        }
+
+    async def close(self) -> None:
+        connections, self._connections = self._connections, []
+        await asyncio.gather(*(c.close() for c in connections), return_exceptions=True)
+
+
+_pools: Dict[Tuple[str, str, str], LocalAIMuxPool] = {}
+
+
+def get_local_mux_pool(
+    url: str,
+    *,
+    name: str = "local",
+    size: int = 2,
+    auth_token: Optional[str] = None,
+    connect_timeout: float = 5.0,
+) -> LocalAIMuxPool:
+    """Return the shared pool for ``url``; ``name`` keeps components' call ids apart."""
+    key = (url, auth_token or "", name)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = LocalAIMuxPool(url, size=size, auth_token=auth_token, connect_timeout=connect_timeout)
+    return pool
+
+
+async def close_local_mux_pools() -> None:
+    pools = list(_pools.values())
+    _pools.clear()
+    await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
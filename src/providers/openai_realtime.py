@@ -15,7 +15,6 @@ import contextlib
 import json
 import time
 import uuid
-import audioop
 from typing import Any, Dict, Optional, List
 
 import websockets
@@ -25,16 +24,17 @@ from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 from structlog import get_logger
 from prometheus_client import Gauge, Info
 
-from .base import AIProviderInterface, ProviderCapabilities
+from .base import AIProviderInterface, ProviderCapabilities, WarmConnection
 from ..audio import (
     convert_pcm16le_to_target_format,
     mulaw_to_pcm16le,
+    pcm_ops,
     resample_audio,
 )
 from ..config import OpenAIRealtimeProviderConfig
 
 # Tool calling support
-from src.tools.registry import tool_registry
+from src.tools.registry import splice_json, tool_registry
 from src.tools.adapters.openai import OpenAIToolAdapter
 
 logger = get_logger(__name__)
@@ -160,6 +160,8 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         self._pacer_lock: asyncio.Lock = asyncio.Lock()
         self._fallback_pcm24k_done: bool = False
         self._reconnect_task: Optional[asyncio.Task] = None
+        # Pre-connected socket handed over by the engine's warm pool (consumed by start_session)
+        self._warm_connection: Optional[WarmConnection] = None
 
         # Tool calling support
         self.tool_adapter = OpenAIToolAdapter(tool_registry)
@@ -360,67 +362,32 @@ class OpenAIRealtimeProvider(AIProviderInterface):
 
         self._reset_output_meter()
 
-        url = self._build_ws_url()
-        use_beta = getattr(self.config, 'api_version', 'ga').lower() == 'beta'
-        headers = [
-            ("Authorization", f"Bearer {self.config.api_key}"),
-        ]
-        if use_beta:
-            headers.append(("OpenAI-Beta", "realtime=v1"))
-        if self.config.organization:
-            headers.append(("OpenAI-Organization", self.config.organization))
-        if self.config.project_id:
-            headers.append(("OpenAI-Project", self.config.project_id))
-
-        logger.info("Connecting to OpenAI Realtime", url=url, call_id=call_id, api_version="beta" if use_beta else "ga")
-        try:
-            self.websocket = await websockets.connect(url, additional_headers=headers)
-        except Exception:
-            logger.error("Failed to connect to OpenAI Realtime", call_id=call_id, exc_info=True)
-            raise
-
-        # CRITICAL FIX: Wait for session.created before configuring (per OpenAI docs)
-        # "The server sends session.created as the first inbound message.
-        # session.update sent before session.created is ignored."
-        logger.debug("Waiting for session.created from OpenAI...", call_id=call_id)
-        try:
-            first_message = await asyncio.wait_for(
-                self.websocket.recv(),
-                timeout=5.0
-            )
-            first_event = json.loads(first_message)
-            
-            if first_event.get("type") == "session.created":
-                session_data = first_event.get("session", {})
-                logger.info(
-                    "✅ Received session.created - session ready",
-                    call_id=call_id,
-                    session_id=session_data.get("id"),
-                    model=session_data.get("model"),
-                )
-            else:
-                logger.warning(
-                    "Unexpected first event (expected session.created)",
-                    call_id=call_id,
-                    event_type=first_event.get("type")
-                )
-        except asyncio.TimeoutError:
-            logger.error(
-                "Timeout waiting for session.created",
-                call_id=call_id
+        warm, self._warm_connection = self._warm_connection, None
+        if warm is not None:
+            # Warm pool: connected, session.created seen and base session applied ahead of the call.
+            self.websocket = warm.websocket
+            logger.info(
+                "Using pre-connected OpenAI Realtime session",
+                call_id=call_id,
+                warm_age_sec=round(time.monotonic() - warm.created_at, 1),
             )
-            raise RuntimeError("OpenAI did not send session.created within 5s")
-        except Exception as exc:
-            logger.error(
-                "Error receiving session.created",
+        else:
+            url = self._build_ws_url()
+            logger.info(
+                "Connecting to OpenAI Realtime",
+                url=url,
                 call_id=call_id,
-                error=str(exc),
-                exc_info=True
+                api_version="beta" if self._uses_beta_api() else "ga",
             )
-            raise
+            try:
+                self.websocket = await websockets.connect(url, additional_headers=self._ws_headers())
+            except Exception:
+                logger.error("Failed to connect to OpenAI Realtime", call_id=call_id, exc_info=True)
+                raise
+            await self._await_session_created(call_id)
 
         # NOW send session configuration (server is ready)
-        await self._send_session_update()
+        await self._send_session_update(base_session=warm.base_session if warm is not None else None)
         self._log_session_assumptions()
         
         # Start receive loop FIRST - this is required to receive ACK events!
@@ -473,6 +440,80 @@ class OpenAIRealtimeProvider(AIProviderInterface):
 
         logger.info("OpenAI Realtime session established", call_id=call_id)
 
+    async def _await_session_created(self, call_id: Optional[str]) -> None:
+        # CRITICAL FIX: Wait for session.created before configuring (per OpenAI docs)
+        # "The server sends session.created as the first inbound message.
+        # session.update sent before session.created is ignored."
+        logger.debug("Waiting for session.created from OpenAI...", call_id=call_id)
+        try:
+            first_message = await asyncio.wait_for(
+                self.websocket.recv(),
+                timeout=5.0
+            )
+            first_event = json.loads(first_message)
+            
+            if first_event.get("type") == "session.created":
+                session_data = first_event.get("session", {})
+                logger.info(
+                    "✅ Received session.created - session ready",
+                    call_id=call_id,
+                    session_id=session_data.get("id"),
+                    model=session_data.get("model"),
+                )
+            else:
+                logger.warning(
+                    "Unexpected first event (expected session.created)",
+                    call_id=call_id,
+                    event_type=first_event.get("type")
+                )
+        except asyncio.TimeoutError:
+            logger.error(
+                "Timeout waiting for session.created",
+                call_id=call_id
+            )
+            raise RuntimeError("OpenAI did not send session.created within 5s")
+        except Exception as exc:
+            logger.error(
+                "Error receiving session.created",
+                call_id=call_id,
+                error=str(exc),
+                exc_info=True
+            )
+            raise
+
+    async def open_warm_connection(self) -> WarmConnection:
+        """Connect and apply the base session configuration ahead of a call (provider warm pool).
+
+        The call that leases the socket sends only the session fields its
+        context changes (prompt, tools, ...) in its own session.update.
+        """
+        if not self.config.api_key:
+            raise ValueError("OpenAI Realtime provider requires OPENAI_API_KEY")
+        started = time.perf_counter()
+        self.websocket = await websockets.connect(self._build_ws_url(), additional_headers=self._ws_headers())
+        websocket = self.websocket
+        try:
+            await self._await_session_created(None)
+            session, _ = self._build_session_config()
+            await self._send_json({"type": "session.update", "event_id": f"sess-{uuid.uuid4()}", "session": session})
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 5.0
+            while True:
+                event = json.loads(await asyncio.wait_for(websocket.recv(), timeout=max(0.0, deadline - loop.time())))
+                if event.get("type") == "session.updated":
+                    break
+                if event.get("type") == "error":
+                    raise RuntimeError(f"OpenAI rejected base session.update: {event.get('error')}")
+        except BaseException:
+            await websocket.close()
+            raise
+        finally:
+            self.websocket = None
+        return WarmConnection(websocket=websocket, setup_seconds=time.perf_counter() - started, base_session=session)
+
+    def adopt_warm_connection(self, conn: WarmConnection) -> None:
+        self._warm_connection = conn
+
     async def send_audio(self, audio_chunk: bytes, sample_rate: int = None, encoding: str = None):
         """Send audio to OpenAI Realtime API.
         
@@ -811,7 +852,23 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         base = base.rstrip("/")
         return f"{base}?model={self.config.model}"
 
-    async def _send_session_update(self):
+    def _uses_beta_api(self) -> bool:
+        return getattr(self.config, 'api_version', 'ga').lower() == 'beta'
+
+    def _ws_headers(self) -> List[tuple]:
+        headers = [
+            ("Authorization", f"Bearer {self.config.api_key}"),
+        ]
+        if self._uses_beta_api():
+            headers.append(("OpenAI-Beta", "realtime=v1"))
+        if self.config.organization:
+            headers.append(("OpenAI-Organization", self.config.organization))
+        if self.config.project_id:
+            headers.append(("OpenAI-Project", self.config.project_id))
+        return headers
+
+    def _build_session_config(self) -> tuple:
+        """Return (session, encoded tools or None) for session.update from config and the tool allowlist."""
         # Map config modalities to output_modalities per latest guide
         output_modalities = [m for m in (self.config.response_modalities or []) if m in ("audio", "text")]
         if not output_modalities:
@@ -947,11 +1004,15 @@ class OpenAIRealtimeProvider(AIProviderInterface):
             session["instructions"] = audio_forcing_prefix
 
         # Add tool calling configuration (context allowlist only)
+        tools_json: Optional[bytes] = None
         try:
-            tools = self.tool_adapter.get_tools_config(list(self._allowed_tools or []))
+            tool_names = list(self._allowed_tools or [])
+            tools = self.tool_adapter.get_tools_config(tool_names)
             if tools:
                 session["tools"] = tools
                 session["tool_choice"] = "auto"  # Let OpenAI decide when to call tools
+                # Registry keeps the encoded list; splice it instead of re-encoding per call
+                tools_json = self.tool_adapter.registry.schema_json("openai_realtime", tool_names)
                 logger.info(
                     f"🛠️  OpenAI session configured with {len(tools)} tools",
                     call_id=self._call_id,
@@ -963,6 +1024,21 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                 exc_info=True,
             )
 
+        return session, tools_json
+
+    async def _send_session_update(self, base_session: Optional[Dict[str, Any]] = None):
+        session, tools_json = self._build_session_config()
+        if base_session is not None:
+            # Warm socket: send only what this call changes. instructions always go out so the
+            # server still answers with a full session.updated (output-format ACK).
+            session = {
+                key: value
+                for key, value in session.items()
+                if key in ("type", "instructions") or base_session.get(key) != value
+            }
+            if "tools" not in session:
+                tools_json = None
+
         payload: Dict[str, Any] = {
             "type": "session.update",
             "event_id": f"sess-{uuid.uuid4()}",
@@ -976,9 +1052,15 @@ class OpenAIRealtimeProvider(AIProviderInterface):
             output_audio_format=session.get("output_audio_format"),
             input_audio_format=session.get("input_audio_format"),
             modalities=session.get("modalities"),
+            delta=base_session is not None,
+            fields=sorted(session),
         )
 
-        await self._send_json(payload)
+        if tools_json is None:
+            await self._send_json(payload)
+        else:
+            session_json = splice_json(session, "tools", tools_json)
+            await self._send_text(splice_json(payload, "session", session_json).decode("utf-8"), payload["type"])
 
     async def _send_explicit_greeting(self):
         greeting = (self.config.greeting or "").strip()
@@ -1204,7 +1286,14 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                 logger.debug("OpenAI send", call_id=self._call_id, type=ptype)
         except Exception:
             pass
-        message = json.dumps(payload)
+        await self._send_text(json.dumps(payload))
+
+    async def _send_text(self, message: str, ptype: Optional[str] = None):
+        """Send an already-encoded JSON message."""
+        if not self.websocket or self.websocket.state.name != "OPEN":
+            return
+        if ptype:
+            logger.debug("OpenAI send", call_id=self._call_id, type=ptype)
         async with self._send_lock:
             await self.websocket.send(message)
     
@@ -1389,11 +1478,10 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         # Diagnostics-only: probe PCM16 RMS native vs swapped once; do not mutate audio
         try:
             if actual_format == "pcm16" and not getattr(self, "_endianness_probe_done", False):
-                import audioop  # local import to avoid top-level dependency for non-PCM paths
-                rms_native = audioop.rms(pcm_src, 2) if pcm_src else 0
+                rms_native = pcm_ops.rms(pcm_src) if pcm_src else 0
                 try:
-                    swapped = audioop.byteswap(pcm_src, 2) if pcm_src else b""
-                    rms_swapped = audioop.rms(swapped, 2) if swapped else 0
+                    swapped = pcm_ops.byteswap(pcm_src) if pcm_src else b""
+                    rms_swapped = pcm_ops.rms(swapped) if swapped else 0
                 except Exception:
                     rms_swapped = 0
                 try:
@@ -1990,12 +2078,12 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                     else:
                         # Compare RMS when treated as PCM16 vs μ-law→PCM16 on a small window
                         win_pcm = raw_bytes[: min(640, l - (l % 2))]
-                        rms_pcm = audioop.rms(win_pcm, 2) if win_pcm else 0
+                        rms_pcm = pcm_ops.rms(win_pcm) if win_pcm else 0
                         try:
                             win_mulaw_pcm16 = mulaw_to_pcm16le(raw_bytes[: min(320, l)])
                         except Exception:
                             win_mulaw_pcm16 = b""
-                        rms_ulaw = audioop.rms(win_mulaw_pcm16, 2) if win_mulaw_pcm16 else 0
+                        rms_ulaw = pcm_ops.rms(win_mulaw_pcm16) if win_mulaw_pcm16 else 0
                         if rms_ulaw > max(50, int(1.5 * (rms_pcm or 1))):
                             inferred = "ulaw"
                         else:
@@ -2243,18 +2331,8 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                 return
             try:
                 url = self._build_ws_url()
-                use_beta = getattr(self.config, 'api_version', 'ga').lower() == 'beta'
-                headers = [
-                    ("Authorization", f"Bearer {self.config.api_key}"),
-                ]
-                if use_beta:
-                    headers.append(("OpenAI-Beta", "realtime=v1"))
-                if self.config.organization:
-                    headers.append(("OpenAI-Organization", self.config.organization))
-                if self.config.project_id:
-                    headers.append(("OpenAI-Project", self.config.project_id))
                 logger.info("Reconnecting to OpenAI Realtime", call_id=call_id, attempt=attempt)
-                self.websocket = await websockets.connect(url, additional_headers=headers)
+                self.websocket = await websockets.connect(url, additional_headers=self._ws_headers())
                 # Reset minor state
                 self._pending_response = False
                 self._in_audio_burst = False
@@ -6,16 +6,27 @@ Handles bidirectional RTP audio streams for the AI voice agent.
 import asyncio
 import socket
 import struct
-import audioop
 import time
 import random
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Callable, Any, Tuple, Iterable
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Callable, Any, Set, Tuple, Iterable
 
+from .audio.codec_engine import get_codec_engine
+from .audio.jitter_buffer import PLC_MODES, RTPJitterBuffer, conceal_pcm16
+from .audio.resampler import resample_audio
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_RTP_SEQ_TS_SSRC = struct.Struct("!HII")
+
+SOCKET_MODES = ("per_call", "shared")
+_SHARED_PORT_OWNER = "__shared__"
+# Datagrams drained per readiness callback / held per shared socket.
+_SHARED_RECV_BATCH = 64
+_SHARED_QUEUE_LIMIT = 8192
+
 
 @dataclass
 class RTPSession:
@@ -34,14 +45,110 @@ class RTPSession:
     expected_sequence: int = 0
     packet_loss_count: int = 0
     last_sequence: int = 0
-    jitter_buffer: list = field(default_factory=list)
+    jitter_buffer: Optional[RTPJitterBuffer] = None
     frames_received: int = 0
     frames_processed: int = 0
-    resample_state: Optional[tuple] = None
+    resample_state: Optional[Any] = None
     receiver_task: Optional[asyncio.Task] = None
     send_sequence_initialized: bool = False
     send_timestamp_initialized: bool = False
     echo_packets_filtered: int = 0  # Count filtered echo packets
+    plc_last_pcm: bytes = b""  # Last good decoded frame (codec rate) for concealment
+    plc_consecutive: int = 0  # Lost frames concealed in a row
+    shared_socket: Optional["_SharedRTPSocket"] = None  # Set in shared socket mode
+    # Source Asterisk reported for this call's RTP (host None = any); lets shared sockets claim it
+    expected_remote: Optional[Tuple[Optional[str], int]] = None
+
+
+class _SharedRTPSocket(asyncio.DatagramProtocol):
+    """One UDP socket carrying many calls (``socket_mode: shared``).
+
+    On selector event loops the socket is drained with a readiness callback
+    that reads every queued datagram per wakeup (batched receive); other loops
+    get a regular datagram endpoint with this protocol.  Either way datagrams
+    land in a queue consumed by a single task, which keeps per-call packet
+    order and replaces one receiver task per call.
+
+    Streams are demultiplexed by remote address (then SSRC).  A datagram from
+    an unknown source is claimed by a call allocated on this socket that is
+    still waiting for its first packet: the one whose expected source (from
+    the ExternalMedia channel's UNICASTRTP_LOCAL_* variables) matches, or the
+    only pending call.  Several pending calls can share a socket once their
+    sources are known; the server keeps at most one pending call with an
+    unknown source per socket so every claim is unambiguous.
+    """
+
+    def __init__(self, server: "RTPServer", sock: socket.socket, port: int):
+        self.server = server
+        self.sock = sock
+        self.port = port
+        self.by_addr: Dict[Tuple[str, int], RTPSession] = {}
+        self.pending: Dict[str, RTPSession] = {}  # call_id -> session awaiting its first packet
+        self.calls: Set[str] = set()
+        self.queue: Deque[Tuple[bytes, Tuple[str, int]]] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.transport: Optional[asyncio.BaseTransport] = None
+        self.reader_installed = False
+        self.datagrams = 0
+        self.wakeups = 0
+        self.dropped = 0
+        self.unrouted = 0
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        if len(self.queue) >= _SHARED_QUEUE_LIMIT:
+            self.dropped += 1
+            return
+        self.queue.append((data, addr))
+        self.datagrams += 1
+        if not self.wakeup.is_set():
+            self.wakeups += 1
+            self.wakeup.set()
+
+    def error_received(self, exc: Exception) -> None:
+        logger.debug("Shared RTP socket error", port=self.port, error=str(exc))
+
+    def has_unresolved(self) -> bool:
+        """True when a pending call's source is unknown (it can only be claimed while alone)."""
+        return any(s.expected_remote is None for s in self.pending.values())
+
+    def claim(self, addr: Tuple[str, int]) -> Optional[RTPSession]:
+        """Pending session a datagram from unknown ``addr`` belongs to, if that is unambiguous."""
+        by_port = [
+            s for s in self.pending.values() if s.expected_remote is not None and s.expected_remote[1] == addr[1]
+        ]
+        for session in by_port:
+            if session.expected_remote[0] in (None, addr[0]):
+                return session
+        if len(by_port) == 1:
+            return by_port[0]  # NAT rewrote the address but kept the port
+        if len(self.pending) == 1:
+            return next(iter(self.pending.values()))
+        return None
+
+    def on_readable(self) -> None:
+        recvfrom = self.sock.recvfrom
+        for _ in range(_SHARED_RECV_BATCH):
+            try:
+                data, addr = recvfrom(1500)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                logger.debug("Shared RTP recv error", port=self.port, error=str(exc))
+                return
+            self.datagram_received(data, addr)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "port": self.port,
+            "calls": len(self.calls),
+            "pending": sorted(self.pending),
+            "datagrams": self.datagrams,
+            "wakeups": self.wakeups,
+            "avg_batch": round(self.datagrams / self.wakeups, 2) if self.wakeups else 0.0,
+            "dropped": self.dropped,
+            "unrouted": self.unrouted,
+        }
 
 
 class RTPServer:
@@ -71,6 +178,13 @@ class RTPServer:
         *,
         allowed_remote_hosts: Optional[Iterable[str]] = None,
         lock_remote_endpoint: bool = True,
+        jitter_target_ms: int = 60,
+        jitter_max_ms: int = 200,
+        jitter_adaptive: bool = True,
+        plc_mode: str = "repeat",
+        socket_mode: str = "per_call",
+        shared_socket_count: int = 2,
+        shared_socket_max: int = 16,
     ):
         self.host = host
         self.base_port = int(port)
@@ -98,6 +212,18 @@ class RTPServer:
             if allowed_remote_hosts is not None
             else None
         )
+        # jitter_target_ms <= 0 disables the jitter buffer (arrival-order forwarding).
+        self.jitter_target_ms = max(0, int(jitter_target_ms or 0))
+        self.jitter_max_ms = max(self.jitter_target_ms, int(jitter_max_ms or 0))
+        self.jitter_adaptive = bool(jitter_adaptive)
+        self.plc_mode = plc_mode if plc_mode in PLC_MODES else "repeat"
+        # per_call: one socket + receiver task per call. shared: a small pool of
+        # sockets demultiplexed by remote address / SSRC (high-density mode).
+        self.socket_mode = socket_mode if socket_mode in SOCKET_MODES else "per_call"
+        self.shared_socket_count = max(1, int(shared_socket_count or 1))
+        # Pool growth limit; beyond it a call awaiting an unknown source gets its own socket.
+        self.shared_socket_max = max(self.shared_socket_count, int(shared_socket_max or 0))
+        self.shared_sockets: Dict[int, _SharedRTPSocket] = {}
 
         logger.info(
             "RTP Server initialized",
@@ -108,6 +234,11 @@ class RTPServer:
             sample_rate=self.sample_rate,
             lock_remote_endpoint=self.lock_remote_endpoint,
             allowed_remote_hosts=sorted(self.allowed_remote_hosts) if self.allowed_remote_hosts else None,
+            jitter_target_ms=self.jitter_target_ms,
+            jitter_max_ms=self.jitter_max_ms,
+            jitter_adaptive=self.jitter_adaptive,
+            plc_mode=self.plc_mode,
+            socket_mode=self.socket_mode,
         )
 
     async def start(self) -> None:
@@ -116,6 +247,10 @@ class RTPServer:
             logger.warning("RTP server already running")
             return
         self.running = True
+        if self.socket_mode == "shared":
+            for _ in range(self.shared_socket_count):
+                if self._open_shared_socket() is None:
+                    break
         logger.info(
             "RTP Server ready",
             host=self.host,
@@ -123,6 +258,8 @@ class RTPServer:
             codec=self.codec,
             format=self.format,
             sample_rate=self.sample_rate,
+            socket_mode=self.socket_mode,
+            shared_sockets=sorted(self.shared_sockets) or None,
         )
 
     async def stop(self) -> None:
@@ -146,6 +283,8 @@ class RTPServer:
         # Close sockets / release ports.
         for session in list(self.sessions.values()):
             await self._cleanup_session(session)
+        for shared in list(self.shared_sockets.values()):
+            await self._close_shared_socket(shared)
 
         self.session_tasks.clear()
         self.sessions.clear()
@@ -162,6 +301,11 @@ class RTPServer:
         if call_id in self.sessions:
             return self.sessions[call_id].local_port
 
+        if self.socket_mode == "shared":
+            return self._allocate_shared_session(call_id)
+        return self._allocate_per_call_session(call_id)
+
+    def _allocate_per_call_session(self, call_id: str) -> int:
         port = self._reserve_port(call_id)
         if port is None:
             raise RuntimeError("No free RTP ports available in configured range")
@@ -188,6 +332,62 @@ class RTPServer:
         logger.info("RTP session allocated", call_id=call_id, port=port, codec=self.codec)
         return port
 
+    def _allocate_shared_session(self, call_id: str) -> int:
+        # Prefer the least loaded socket where every pending call's source is known.
+        free = [s for s in self.shared_sockets.values() if not s.has_unresolved()]
+        if free:
+            shared = min(free, key=lambda s: len(s.calls))
+        elif len(self.shared_sockets) < self.shared_socket_max:
+            shared = self._open_shared_socket()
+        else:
+            shared = None
+        if shared is None:
+            logger.info(
+                "Shared RTP pool busy; using a per-call socket",
+                call_id=call_id,
+                shared_sockets=len(self.shared_sockets),
+            )
+            return self._allocate_per_call_session(call_id)
+
+        now = time.time()
+        session = RTPSession(
+            call_id=call_id,
+            local_port=shared.port,
+            socket=shared.sock,
+            created_at=now,
+            last_packet_at=now,
+            shared_socket=shared,
+        )
+        shared.pending[call_id] = session
+        shared.calls.add(call_id)
+        self.sessions[call_id] = session
+        logger.info(
+            "RTP session allocated",
+            call_id=call_id,
+            port=shared.port,
+            codec=self.codec,
+            socket_mode=self.socket_mode,
+        )
+        return shared.port
+
+    def expect_remote(self, call_id: str, host: Optional[str], port: Any) -> None:
+        """Record the address Asterisk sends ``call_id``'s RTP from (UNICASTRTP_LOCAL_ADDRESS/PORT).
+
+        In shared mode this lets several calls await their first packet on one
+        socket.  A wildcard or empty ``host`` matches on the port alone.
+        """
+        session = self.sessions.get(call_id)
+        if session is None or session.remote_host is not None:
+            return
+        try:
+            port = int(port)
+        except (TypeError, ValueError):
+            return
+        if port <= 0:
+            return
+        host = str(host or "").strip()
+        session.expected_remote = (None if host in ("", "0.0.0.0", "::") else host, port)
+
     async def cleanup_session(self, call_id: str) -> None:
         """Public helper to clean up a specific RTP session."""
         session = self.sessions.pop(call_id, None)
@@ -210,6 +410,10 @@ class RTPServer:
 
     async def send_audio(self, call_id: str, chunk: bytes, *, ssrc: Optional[int] = None) -> bool:
         """Send provider audio back to Asterisk as RTP for the specified call."""
+        return self.send_audio_nowait(call_id, chunk, ssrc=ssrc)
+
+    def send_audio_nowait(self, call_id: str, chunk: bytes, *, ssrc: Optional[int] = None) -> bool:
+        """Synchronous ``send_audio`` (non-blocking UDP send) for the frame clock's pacers."""
         if not chunk:
             return True
 
@@ -259,18 +463,22 @@ class RTPServer:
         packet = header + chunk
 
         try:
-            # Prefer connected UDP sockets for lower overhead.
-            if not self._socket_is_connected(session.socket):
-                try:
-                    session.socket.connect((session.remote_host, session.remote_port))
-                except Exception as exc:
-                    logger.debug(
-                        "RTP connect failed; falling back to sendto",
-                        call_id=call_id,
-                        error=str(exc),
-                    )
-                    session.socket = session.socket  # no-op for mypy hints
-            sent = session.socket.send(packet) if self._socket_is_connected(session.socket) else session.socket.sendto(packet, (session.remote_host, session.remote_port))
+            if session.shared_socket is not None:
+                # Shared sockets carry many calls and must stay unconnected.
+                sent = session.socket.sendto(packet, (session.remote_host, session.remote_port))
+            else:
+                # Prefer connected UDP sockets for lower overhead.
+                if not self._socket_is_connected(session.socket):
+                    try:
+                        session.socket.connect((session.remote_host, session.remote_port))
+                    except Exception as exc:
+                        logger.debug(
+                            "RTP connect failed; falling back to sendto",
+                            call_id=call_id,
+                            error=str(exc),
+                        )
+                        session.socket = session.socket  # no-op for mypy hints
+                sent = session.socket.send(packet) if self._socket_is_connected(session.socket) else session.socket.sendto(packet, (session.remote_host, session.remote_port))
             if sent != len(packet):
                 logger.debug("Short RTP send", call_id=call_id, expected=len(packet), sent=sent)
         except BlockingIOError:
@@ -310,95 +518,98 @@ class RTPServer:
                     logger.error("RTP receiver error", call_id=call_id, error=str(exc))
                 break
 
-            if len(data) < self.RTP_HEADER_SIZE:
-                continue
+            await self._process_datagram(session, data, addr)
+
+        logger.debug("RTP receiver loop stopped", call_id=call_id, port=session.local_port)
 
-            version = data[0] >> 6
-            if version != self.RTP_VERSION:
-                logger.debug("Invalid RTP version", call_id=call_id, version=version)
-                continue
+    async def _process_datagram(self, session: RTPSession, data: bytes, addr: Tuple[str, int]) -> None:
+        """Validate one inbound datagram for ``session`` and hand its payload on."""
+        call_id = session.call_id
+        if len(data) < self.RTP_HEADER_SIZE:
+            return
 
-            sequence = struct.unpack("!H", data[2:4])[0]
-            timestamp = struct.unpack("!I", data[4:8])[0]
-            ssrc = struct.unpack("!I", data[8:12])[0]
-            payload = data[self.RTP_HEADER_SIZE:]
+        version = data[0] >> 6
+        if version != self.RTP_VERSION:
+            logger.debug("Invalid RTP version", call_id=call_id, version=version)
+            return
 
-            # CRITICAL: Filter echo - drop packets with our own outbound SSRC
-            # This prevents the agent from hearing its own audio output in the bridge
-            if session.outbound_ssrc is not None and ssrc == session.outbound_ssrc:
-                session.echo_packets_filtered += 1
-                if session.echo_packets_filtered <= 5:  # Log first few
-                    logger.debug(
-                        "RTP echo packet filtered (our own SSRC)",
-                        call_id=call_id,
-                        ssrc=ssrc,
-                        filtered_count=session.echo_packets_filtered,
-                    )
-                continue
+        sequence, timestamp, ssrc = _RTP_SEQ_TS_SSRC.unpack_from(data, 2)
+        payload = data[self.RTP_HEADER_SIZE:]
 
-            # Record remote endpoint on first packet.
-            if session.remote_host is None:
-                if self.allowed_remote_hosts is not None and addr[0] not in self.allowed_remote_hosts:
-                    logger.warning(
-                        "RTP packet rejected (source not allowed)",
-                        call_id=call_id,
-                        remote_host=addr[0],
-                        remote_port=addr[1],
-                    )
-                    continue
-                session.remote_host, session.remote_port = addr[0], addr[1]
-                logger.info(
-                    "RTP remote endpoint established",
+        # CRITICAL: Filter echo - drop packets with our own outbound SSRC
+        # This prevents the agent from hearing its own audio output in the bridge
+        if session.outbound_ssrc is not None and ssrc == session.outbound_ssrc:
+            session.echo_packets_filtered += 1
+            if session.echo_packets_filtered <= 5:  # Log first few
+                logger.debug(
+                    "RTP echo packet filtered (our own SSRC)",
                     call_id=call_id,
-                    remote_host=session.remote_host,
-                    remote_port=session.remote_port,
+                    ssrc=ssrc,
+                    filtered_count=session.echo_packets_filtered,
                 )
-            elif (addr[0] != session.remote_host) or (addr[1] != session.remote_port):
-                if self.allowed_remote_hosts is not None and addr[0] not in self.allowed_remote_hosts:
-                    logger.warning(
-                        "RTP packet rejected (source not allowed)",
-                        call_id=call_id,
-                        remote_host=addr[0],
-                        remote_port=addr[1],
-                    )
-                    continue
-                if self.lock_remote_endpoint:
-                    logger.warning(
-                        "RTP remote endpoint mismatch (locked; dropping packet)",
-                        call_id=call_id,
-                        expected_host=session.remote_host,
-                        expected_port=session.remote_port,
-                        actual_host=addr[0],
-                        actual_port=addr[1],
-                    )
-                    continue
-                session.remote_host, session.remote_port = addr[0], addr[1]
-                logger.info(
-                    "RTP remote endpoint updated",
+            return
+
+        # Record remote endpoint on first packet.
+        if session.remote_host is None:
+            if self.allowed_remote_hosts is not None and addr[0] not in self.allowed_remote_hosts:
+                logger.warning(
+                    "RTP packet rejected (source not allowed)",
                     call_id=call_id,
-                    remote_host=session.remote_host,
-                    remote_port=session.remote_port,
+                    remote_host=addr[0],
+                    remote_port=addr[1],
                 )
-
-            # Maintain SSRC mapping (only for inbound caller audio, not our echo)
-            if session.ssrc is None:
-                session.ssrc = ssrc
-                self.ssrc_to_call_id[ssrc] = call_id
-                logger.info(
-                    "RTP inbound SSRC established (caller audio)",
+                return
+            session.remote_host, session.remote_port = addr[0], addr[1]
+            logger.info(
+                "RTP remote endpoint established",
+                call_id=call_id,
+                remote_host=session.remote_host,
+                remote_port=session.remote_port,
+            )
+        elif (addr[0] != session.remote_host) or (addr[1] != session.remote_port):
+            if self.allowed_remote_hosts is not None and addr[0] not in self.allowed_remote_hosts:
+                logger.warning(
+                    "RTP packet rejected (source not allowed)",
+                    call_id=call_id,
+                    remote_host=addr[0],
+                    remote_port=addr[1],
+                )
+                return
+            if self.lock_remote_endpoint:
+                logger.warning(
+                    "RTP remote endpoint mismatch (locked; dropping packet)",
                     call_id=call_id,
-                    inbound_ssrc=ssrc,
+                    expected_host=session.remote_host,
+                    expected_port=session.remote_port,
+                    actual_host=addr[0],
+                    actual_port=addr[1],
                 )
+                return
+            session.remote_host, session.remote_port = addr[0], addr[1]
+            logger.info(
+                "RTP remote endpoint updated",
+                call_id=call_id,
+                remote_host=session.remote_host,
+                remote_port=session.remote_port,
+            )
 
-            # Seed outbound sequence/timestamp with inbound values so the far-end sees continuity.
-            if not session.send_sequence_initialized:
-                session.sequence_number = sequence
-            if not session.send_timestamp_initialized:
-                session.timestamp = timestamp
+        # Maintain SSRC mapping (only for inbound caller audio, not our echo)
+        if session.ssrc is None:
+            session.ssrc = ssrc
+            self.ssrc_to_call_id[ssrc] = call_id
+            logger.info(
+                "RTP inbound SSRC established (caller audio)",
+                call_id=call_id,
+                inbound_ssrc=ssrc,
+            )
 
-            await self._handle_inbound_packet(session, sequence, timestamp, payload, ssrc)
+        # Seed outbound sequence/timestamp with inbound values so the far-end sees continuity.
+        if not session.send_sequence_initialized:
+            session.sequence_number = sequence
+        if not session.send_timestamp_initialized:
+            session.timestamp = timestamp
 
-        logger.debug("RTP receiver loop stopped", call_id=call_id, port=session.local_port)
+        await self._handle_inbound_packet(session, sequence, timestamp, payload, ssrc)
 
     async def _handle_inbound_packet(
         self,
@@ -408,12 +619,38 @@ class RTPServer:
         payload: bytes,
         ssrc: int,
     ) -> None:
-        """Decode inbound RTP audio and forward PCM16 16 kHz to the engine."""
+        """Reorder inbound RTP through the jitter buffer and forward PCM to the engine."""
         call_id = session.call_id
         session.frames_received += 1
         session.last_packet_at = time.time()
+        session.last_sequence = sequence
+
+        if not self.jitter_target_ms:
+            self._track_arrival_order(session, sequence)
+            await self._forward_frame(session, payload, ssrc)
+            return
+
+        jb = session.jitter_buffer
+        if jb is None:
+            jb = session.jitter_buffer = self._create_jitter_buffer()
+        late_before = jb.late_dropped
+        for frame in jb.push(sequence, timestamp, payload, ssrc=ssrc):
+            if frame is None:
+                session.packet_loss_count += 1
+            await self._forward_frame(session, frame, ssrc)
+        session.expected_sequence = jb.expected_sequence or 0
+        if jb.late_dropped != late_before and jb.late_dropped <= 5:
+            logger.debug(
+                "RTP late packet dropped",
+                call_id=call_id,
+                sequence=sequence,
+                expected=session.expected_sequence,
+                late_dropped=jb.late_dropped,
+            )
 
-        # Packet loss / ordering diagnostics.
+    def _track_arrival_order(self, session: RTPSession, sequence: int) -> None:
+        """Loss / ordering diagnostics when the jitter buffer is disabled."""
+        call_id = session.call_id
         if session.expected_sequence == 0:
             session.expected_sequence = sequence
         else:
@@ -437,16 +674,39 @@ class RTPServer:
                         received=sequence,
                     )
         session.expected_sequence = (sequence + 1) & 0xFFFF
-        session.last_sequence = sequence
 
+    def _create_jitter_buffer(self) -> RTPJitterBuffer:
+        return RTPJitterBuffer(
+            clock_rate=self.SAMPLE_RATE,
+            frame_ms=self.SAMPLES_PER_PACKET * 1000 // self.SAMPLE_RATE,
+            target_ms=self.jitter_target_ms,
+            max_ms=self.jitter_max_ms,
+            adaptive=self.jitter_adaptive,
+        )
+
+    async def _forward_frame(self, session: RTPSession, payload: Optional[bytes], ssrc: int) -> None:
+        """Decode one frame (or conceal a lost one) and forward PCM16 at the engine rate."""
+        call_id = session.call_id
         try:
-            pcm_decoded = self._decode_payload(payload)
+            if payload is None:
+                session.plc_consecutive += 1
+                pcm_decoded = conceal_pcm16(
+                    session.plc_last_pcm,
+                    session.plc_consecutive,
+                    len(session.plc_last_pcm) or self.SAMPLES_PER_PACKET * 2,
+                    self.plc_mode,
+                )
+            else:
+                pcm_decoded = self._decode_payload(payload)
+                session.plc_last_pcm = pcm_decoded
+                session.plc_consecutive = 0
             # Use configured sample_rate instead of hardcoded constant
             # CRITICAL: Must match what engine expects based on config
             if self.sample_rate != self.SAMPLE_RATE:
                 # Resample from codec rate to configured engine rate
-                pcm_resampled, state = audioop.ratecv(pcm_decoded, 2, 1, self.SAMPLE_RATE, self.sample_rate, session.resample_state)
-                session.resample_state = state
+                pcm_resampled, session.resample_state = resample_audio(
+                    pcm_decoded, self.SAMPLE_RATE, self.sample_rate, state=session.resample_state
+                )
             else:
                 # No resampling needed
                 pcm_resampled = pcm_decoded
@@ -478,11 +738,13 @@ class RTPServer:
             "expected_sequence": session.expected_sequence,
             "created_at": session.created_at,
             "last_packet_at": session.last_packet_at,
+            "jitter_buffer": session.jitter_buffer.stats() if session.jitter_buffer else None,
         }
 
     def get_stats(self) -> Dict[str, Any]:
         now = time.time()
         active_sessions = sum(1 for s in self.sessions.values() if now - s.last_packet_at < 30)
+        buffers = [s.jitter_buffer for s in self.sessions.values() if s.jitter_buffer is not None]
         return {
             "running": self.running,
             "host": self.host,
@@ -493,6 +755,19 @@ class RTPServer:
             "frames_received": sum(s.frames_received for s in self.sessions.values()),
             "frames_processed": sum(s.frames_processed for s in self.sessions.values()),
             "packet_loss_total": sum(s.packet_loss_count for s in self.sessions.values()),
+            "socket_mode": self.socket_mode,
+            "shared_sockets": [sh.stats() for sh in self.shared_sockets.values()],
+            "jitter_buffer": {
+                "enabled": bool(self.jitter_target_ms),
+                "target_ms": self.jitter_target_ms,
+                "max_ms": self.jitter_max_ms,
+                "adaptive": self.jitter_adaptive,
+                "plc_mode": self.plc_mode,
+                "late_dropped_total": sum(b.late_dropped for b in buffers),
+                "concealed_total": sum(b.concealed for b in buffers),
+                "duplicates_total": sum(b.duplicates for b in buffers),
+                "jitter_ms_max": round(max((b.jitter_ms for b in buffers), default=0.0), 2),
+            },
         }
 
     # ------------------------------------------------------------------ #
@@ -510,8 +785,114 @@ class RTPServer:
     def _release_port(self, port: int) -> None:
         self.port_allocation.pop(port, None)
 
+    def _open_shared_socket(self) -> Optional[_SharedRTPSocket]:
+        port = self._reserve_port(_SHARED_PORT_OWNER)
+        if port is None:
+            return None
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind((self.host, port))
+            sock.setblocking(False)
+        except OSError:
+            self._release_port(port)
+            raise
+        shared = _SharedRTPSocket(self, sock, port)
+        loop = self._get_loop()
+        try:
+            loop.add_reader(sock, shared.on_readable)
+            shared.reader_installed = True
+        except NotImplementedError:
+            # Proactor loops (Windows) have no readiness callbacks.
+            loop.create_task(self._attach_shared_endpoint(shared))
+        shared.task = loop.create_task(self._shared_socket_loop(shared))
+        self.shared_sockets[port] = shared
+        logger.debug("Shared RTP socket opened", port=port)
+        return shared
+
+    async def _attach_shared_endpoint(self, shared: _SharedRTPSocket) -> None:
+        transport, _ = await self._get_loop().create_datagram_endpoint(lambda: shared, sock=shared.sock)
+        shared.transport = transport
+
+    async def _close_shared_socket(self, shared: _SharedRTPSocket) -> None:
+        self.shared_sockets.pop(shared.port, None)
+        if shared.reader_installed:
+            try:
+                self._get_loop().remove_reader(shared.sock)
+            except Exception:
+                pass
+        if shared.task:
+            shared.task.cancel()
+            try:
+                await shared.task
+            except asyncio.CancelledError:
+                pass
+            except Exception as exc:
+                logger.debug("Shared RTP task finalisation error", port=shared.port, error=str(exc))
+        if shared.transport is not None:
+            shared.transport.close()
+        else:
+            try:
+                shared.sock.close()
+            except Exception:
+                pass
+        self._release_port(shared.port)
+
+    def _detach_shared_session(self, shared: _SharedRTPSocket, session: RTPSession) -> None:
+        shared.calls.discard(session.call_id)
+        if shared.pending.get(session.call_id) is session:
+            shared.pending.pop(session.call_id)
+        for addr in [a for a, s in shared.by_addr.items() if s is session]:
+            shared.by_addr.pop(addr, None)
+        # Shrink back to the configured pool once surplus sockets go idle.
+        if self.running and not shared.calls and len(self.shared_sockets) > self.shared_socket_count:
+            self._get_loop().create_task(self._close_shared_socket(shared))
+
+    async def _shared_socket_loop(self, shared: _SharedRTPSocket) -> None:
+        """Consume datagrams queued by one shared socket, in arrival order."""
+        queue = shared.queue
+        while self.running:
+            await shared.wakeup.wait()
+            shared.wakeup.clear()
+            while queue:
+                data, addr = queue.popleft()
+                try:
+                    await self._route_shared_datagram(shared, data, addr)
+                except Exception as exc:
+                    logger.error("Shared RTP dispatch failed", port=shared.port, error=str(exc))
+
+    async def _route_shared_datagram(self, shared: _SharedRTPSocket, data: bytes, addr: Tuple[str, int]) -> None:
+        session = shared.by_addr.get(addr)
+        if session is None and len(data) >= self.RTP_HEADER_SIZE:
+            call_id = self.ssrc_to_call_id.get(_RTP_SEQ_TS_SSRC.unpack_from(data, 2)[2])
+            candidate = self.sessions.get(call_id) if call_id else None
+            if candidate is not None and candidate.shared_socket is shared:
+                session = candidate
+        if session is None:
+            session = shared.claim(addr)
+        if session is None:
+            shared.unrouted += 1
+            return
+
+        await self._process_datagram(session, data, addr)
+
+        if session.remote_host is None or session.call_id not in self.sessions:
+            return
+        if shared.pending.get(session.call_id) is session:
+            shared.pending.pop(session.call_id)
+        remote = (session.remote_host, session.remote_port)
+        if shared.by_addr.get(remote) is not session:
+            for old in [a for a, s in shared.by_addr.items() if s is session]:
+                shared.by_addr.pop(old, None)
+            shared.by_addr[remote] = session
+
     async def _cleanup_session(self, session: RTPSession) -> None:
         call_id = session.call_id
+        shared = session.shared_socket
+        if shared is not None:
+            self._detach_shared_session(shared, session)
+            if session.ssrc in self.ssrc_to_call_id:
+                self.ssrc_to_call_id.pop(session.ssrc, None)
+            return
         if session.receiver_task:
             session.receiver_task.cancel()
             try:
@@ -542,7 +923,7 @@ class RTPServer:
 
     def _decode_payload(self, payload: bytes) -> bytes:
         if self.codec == "ulaw":
-            return audioop.ulaw2lin(payload, 2)
+            return get_codec_engine().ulaw_decode(payload)
         if self.codec == "slin16":
             return payload
         raise ValueError(f"Unsupported codec '{self.codec}'")
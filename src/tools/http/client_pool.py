@@ -0,0 +1,372 @@
+"""
+Process-wide HTTP client for the YAML-defined HTTP tools.
+
+``generic_http_lookup``, ``in_call_http_lookup`` and ``generic_webhook`` used to
+open a fresh ``aiohttp.ClientSession`` per execution, so every mid-call lookup
+paid DNS resolution plus TCP/TLS setup before the first byte was sent.
+
+``HTTPClientPool`` keeps one session per event loop with:
+
+- a keep-alive ``TCPConnector`` (global and per-host connection limits),
+- aiohttp's DNS cache (``ttl_dns_cache``),
+- no cookie storage, so nothing set for one call is sent on another's request,
+- per-tool concurrency limits (``max_concurrency`` on the tool, falling back to
+  ``http_client.default_max_concurrency``),
+- optional HTTP/2 through ``httpx`` when ``httpx[http2]`` is installed,
+- an opt-in TTL response cache for idempotent GET lookups, keyed on the
+  rendered request after variable substitution.
+
+Tools use it as::
+
+    pool = get_http_client_pool()
+    deadline = time.monotonic() + budget
+    async with pool.session(self.config.name, self.config.max_concurrency, budget) as session:
+        async with session.request(..., timeout=remaining_timeout(deadline)) as response:
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import http.cookiejar
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+from prometheus_client import Counter
+
+try:  # Optional: HTTP/2 needs httpx with the h2 extra
+    import httpx  # type: ignore
+    import h2  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - depends on installed extras
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+_HTTP_TOOL_CACHE_HITS = Counter(
+    "ai_agent_http_tool_cache_hits_total",
+    "HTTP tool GET responses served from the response cache",
+    labelnames=("tool",),
+)
+_HTTP_TOOL_CACHE_MISSES = Counter(
+    "ai_agent_http_tool_cache_misses_total",
+    "Cacheable HTTP tool GET requests that went to the network",
+    labelnames=("tool",),
+)
+
+
+class ToolConcurrencyTimeout(aiohttp.ClientError):
+    """Raised when a tool waits longer than its timeout for a concurrency slot."""
+
+
+def response_cache_key(
+    tool: str,
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, Any]] = None,
+    body: Any = None,
+) -> str:
+    """Hash of a fully rendered request (headers are included so credentials never share entries)."""
+    payload = json.dumps(
+        [tool, method.upper(), url, sorted((params or {}).items()), sorted((headers or {}).items()), body],
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def remaining_timeout(deadline: float) -> aiohttp.ClientTimeout:
+    """Timeout for a request that must finish by ``deadline`` (a ``time.monotonic()`` value).
+
+    Tools set the deadline before waiting for a concurrency slot, so the wait
+    is taken out of ``timeout_ms`` rather than added to it.
+    """
+    return aiohttp.ClientTimeout(total=max(0.001, deadline - time.monotonic()))
+
+
+class _HTTPXContent:
+    """The slice of ``aiohttp.StreamReader`` the HTTP tools use."""
+
+    def __init__(self, response: Any):
+        self._response = response
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        async for chunk in self._response.aiter_bytes(n):
+            yield chunk
+
+    async def read(self, n: int = -1) -> bytes:
+        buf = bytearray()
+        async for chunk in self._response.aiter_bytes():
+            buf.extend(chunk)
+            if 0 <= n <= len(buf):
+                break
+        return bytes(buf if n < 0 else buf[:n])
+
+
+class _HTTPXResponse:
+    """Adapts an ``httpx.Response`` to the ``aiohttp.ClientResponse`` attributes the tools read."""
+
+    def __init__(self, response: Any):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.charset = response.charset_encoding
+        self.content = _HTTPXContent(response)
+
+    async def text(self) -> str:
+        await self._response.aread()
+        return self._response.text
+
+
+class _HTTPXRequest:
+    def __init__(self, client: Any, method: str, url: str, kwargs: Dict[str, Any]):
+        self._client = client
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+        self._response: Any = None
+
+    async def __aenter__(self) -> _HTTPXResponse:
+        kw = self._kwargs
+        timeout = kw.get("timeout")
+        total = getattr(timeout, "total", None)
+        data = kw.get("data")
+        try:
+            request = self._client.build_request(
+                self._method,
+                self._url,
+                headers=kw.get("headers"),
+                params=kw.get("params"),
+                content=data.encode("utf-8") if isinstance(data, str) else data,
+                json=kw.get("json"),
+                timeout=httpx.Timeout(total) if total else httpx.USE_CLIENT_DEFAULT,
+            )
+            self._response = await self._client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise aiohttp.ClientError(str(e)) from e
+        return _HTTPXResponse(self._response)
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._response is not None:
+            await self._response.aclose()
+
+
+class _HTTPXSession:
+    """``session.request(...)`` over an ``httpx.AsyncClient`` with HTTP/2 enabled."""
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _HTTPXRequest:
+        return _HTTPXRequest(self._client, method, url, kwargs)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class HTTPClientPool:
+    """Shared keep-alive HTTP session, per-tool concurrency limits and GET response cache."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_connections_per_host: int = 16,
+        keepalive_timeout_sec: float = 30.0,
+        dns_cache_ttl_sec: int = 300,
+        default_max_concurrency: int = 0,
+        http2: bool = False,
+        response_cache_max_entries: int = 512,
+    ):
+        """
+        Args:
+            max_connections: Open connections across all hosts (0 = unlimited).
+            max_connections_per_host: Open connections per host:port (0 = unlimited).
+            keepalive_timeout_sec: Idle time before a pooled connection is closed.
+            dns_cache_ttl_sec: How long resolved addresses are reused (0 disables the cache).
+            default_max_concurrency: In-flight requests per tool when the tool sets none (0 = unlimited).
+            http2: Use HTTP/2 via httpx when available; falls back to aiohttp (HTTP/1.1).
+            response_cache_max_entries: Upper bound on cached GET responses.
+        """
+        self.max_connections = max(0, int(max_connections))
+        self.max_connections_per_host = max(0, int(max_connections_per_host))
+        self.keepalive_timeout_sec = max(0.0, float(keepalive_timeout_sec))
+        self.dns_cache_ttl_sec = max(0, int(dns_cache_ttl_sec))
+        self.default_max_concurrency = max(0, int(default_max_concurrency))
+        self.response_cache_max_entries = max(0, int(response_cache_max_entries))
+        self.http2 = bool(http2)
+        if self.http2 and httpx is None:
+            logger.warning("http_client.http2 requested but httpx[http2] is not installed; using HTTP/1.1")
+            self.http2 = False
+
+        self._session: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphores: Dict[str, Tuple[int, asyncio.Semaphore]] = {}
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight = 0
+
+    @classmethod
+    def from_config(cls, cfg: Any) -> "HTTPClientPool":
+        if cfg is None:
+            return cls()
+        return cls(
+            max_connections=getattr(cfg, "max_connections", 100),
+            max_connections_per_host=getattr(cfg, "max_connections_per_host", 16),
+            keepalive_timeout_sec=getattr(cfg, "keepalive_timeout_sec", 30.0),
+            dns_cache_ttl_sec=getattr(cfg, "dns_cache_ttl_sec", 300),
+            default_max_concurrency=getattr(cfg, "default_max_concurrency", 0),
+            http2=getattr(cfg, "http2", False),
+            response_cache_max_entries=getattr(cfg, "response_cache_max_entries", 512),
+        )
+
+    def _new_session(self) -> Any:
+        if self.http2:
+            client = httpx.AsyncClient(
+                http2=True,
+                # Shared by every call: reject Set-Cookie so it is never replayed for another caller.
+                cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections or None,
+                    max_keepalive_connections=self.max_connections_per_host or None,
+                    keepalive_expiry=self.keepalive_timeout_sec,
+                ),
+            )
+            return _HTTPXSession(client)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout_sec,
+            ttl_dns_cache=self.dns_cache_ttl_sec or None,
+            use_dns_cache=self.dns_cache_ttl_sec > 0,
+        )
+        # The session is shared by every call: never store cookies, or a
+        # Set-Cookie from one caller's lookup would be replayed for the next.
+        return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+    def _get_session(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._loop is not loop or getattr(self._session, "closed", False):
+            # Sessions and semaphores are bound to the loop that created them.
+            self._session = self._new_session()
+            self._loop = loop
+            self._semaphores.clear()
+        return self._session
+
+    def _semaphore(self, tool: str, max_concurrency: int) -> Optional[asyncio.Semaphore]:
+        limit = int(max_concurrency or 0) or self.default_max_concurrency
+        if limit <= 0:
+            return None
+        entry = self._semaphores.get(tool)
+        if entry is None or entry[0] != limit:
+            entry = self._semaphores[tool] = (limit, asyncio.Semaphore(limit))
+        return entry[1]
+
+    @asynccontextmanager
+    async def session(
+        self,
+        tool: str,
+        max_concurrency: int = 0,
+        acquire_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """Yield the shared session once ``tool`` has a free concurrency slot."""
+        session = self._get_session()
+        sem = self._semaphore(tool, max_concurrency)
+        if sem is not None:
+            try:
+                await asyncio.wait_for(sem.acquire(), timeout=acquire_timeout)
+            except asyncio.TimeoutError:
+                raise ToolConcurrencyTimeout(
+                    f"{tool}: no free request slot within {acquire_timeout:.2f}s"
+                ) from None
+        self._inflight += 1
+        try:
+            yield session
+        finally:
+            self._inflight -= 1
+            if sem is not None:
+                sem.release()
+
+    def get_cached(self, tool: str, key: str) -> Optional[str]:
+        """Return the cached response body for ``key`` if it has not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            _HTTP_TOOL_CACHE_MISSES.labels(tool).inc()
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            _HTTP_TOOL_CACHE_MISSES.labels(tool).inc()
+            return None
+        self._cache.move_to_end(key)
+        _HTTP_TOOL_CACHE_HITS.labels(tool).inc()
+        return body
+
+    def store(self, key: str, body: str, ttl_sec: float) -> None:
+        """Cache a successful response body for ``ttl_sec`` seconds."""
+        if ttl_sec <= 0 or self.response_cache_max_entries <= 0:
+            return
+        self._cache[key] = (time.monotonic() + float(ttl_sec), body)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.response_cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "session_open": self._session is not None and not getattr(self._session, "closed", False),
+            "cached_responses": len(self._cache),
+            "limited_tools": len(self._semaphores),
+            "inflight": self._inflight,
+        }
+
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """Close the session once in-flight requests finish (or ``drain_timeout`` passes)."""
+        deadline = time.monotonic() + max(0.0, drain_timeout)
+        while self._inflight > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        session, self._session = self._session, None
+        self._loop = None
+        self._semaphores.clear()
+        self._cache.clear()
+        if session is not None:
+            try:
+                await session.close()
+            except Exception:
+                logger.debug("HTTP client pool close error", exc_info=True)
+
+
+_pool: Optional[HTTPClientPool] = None
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Return the process-wide pool, creating one with defaults on first use."""
+    global _pool
+    if _pool is None:
+        _pool = HTTPClientPool()
+    return _pool
+
+
+async def configure_http_client_pool(cfg: Any) -> HTTPClientPool:
+    """Replace the process-wide pool with one built from ``http_client`` config."""
+    global _pool
+    old, _pool = _pool, HTTPClientPool.from_config(cfg)
+    if old is not None:
+        await old.close()
+    return _pool
+
+
+async def close_http_client_pool() -> None:
+    global _pool
+    old, _pool = _pool, None
+    if old is not None:
+        await old.close()
@@ -17,6 +17,7 @@ import aiohttp
 
 from src.tools.base import PreCallTool, ToolDefinition, ToolCategory, ToolPhase
 from src.tools.context import PreCallContext
+from src.tools.http.client_pool import get_http_client_pool, remaining_timeout, response_cache_key
 from src.tools.http.debug_trace import (
     build_var_snapshot,
     debug_enabled,
@@ -52,6 +53,11 @@ class HTTPLookupConfig:
     # Response limits
     max_response_size_bytes: int = 65536  # 64KB max
 
+    # Shared HTTP client: in-flight request cap (0 = http_client.default_max_concurrency)
+    max_concurrency: int = 0
+    # Reuse successful GET responses for this many seconds (0 = no caching)
+    cache_ttl_seconds: float = 0.0
+
 
 class GenericHTTPLookupTool(PreCallTool):
     """
@@ -68,6 +74,8 @@ class GenericHTTPLookupTool(PreCallTool):
         phase: pre_call
         enabled: true
         timeout_ms: 2000
+        max_concurrency: 8         # optional; in-flight requests for this tool
+        cache_ttl_seconds: 60      # optional; reuse GET responses for repeat callers
         url: "https://rest.gohighlevel.com/v1/contacts/lookup"
         method: GET
         headers:
@@ -175,15 +183,29 @@ class GenericHTTPLookupTool(PreCallTool):
 
             logger.info(f"Executing HTTP lookup: {self.config.name} {self.config.method} {self._redact_url(url)}")
             
+            pool = get_http_client_pool()
+            cache_key = None
+            if self.config.cache_ttl_seconds > 0 and self.config.method.upper() == "GET":
+                cache_key = response_cache_key(self.config.name, self.config.method, url, params, headers, body)
+                cached = pool.get_cached(self.config.name, cache_key)
+                if cached is not None:
+                    results = self._extract_output_variables(json.loads(cached))
+                    logger.info(f"HTTP lookup served from cache: {self.config.name} keys={list(results.keys())}")
+                    return results
+
             # Make request
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            budget = self.config.timeout_ms / 1000.0
+            deadline = time.monotonic() + budget
+            async with pool.session(self.config.name, self.config.max_concurrency, budget) as session:
+                # Time spent waiting for a slot comes out of the request's budget.
+                timeout = remaining_timeout(deadline)
                 async with session.request(
                     method=self.config.method,
                     url=url,
                     headers=headers,
                     params=params,
                     data=body,
+                    timeout=timeout,
                 ) as response:
                     if response.status != 200:
                         logger.warning(f"HTTP lookup returned non-200: {self.config.name} status={response.status}")
@@ -247,7 +269,8 @@ class GenericHTTPLookupTool(PreCallTool):
 
                         body_bytes = b"".join(chunks)
                         charset = getattr(response, "charset", None) or "utf-8"
-                        data = json.loads(body_bytes.decode(charset, errors="replace"))
+                        body_text = body_bytes.decode(charset, errors="replace")
+                        data = json.loads(body_text)
                     except json.JSONDecodeError as e:
                         logger.warning(f"Failed to parse JSON response: {self.config.name} error={e}")
                         if debug_enabled(logger):
@@ -276,6 +299,9 @@ class GenericHTTPLookupTool(PreCallTool):
                             )
                         return results
                     
+                    if cache_key is not None:
+                        pool.store(cache_key, body_text, self.config.cache_ttl_seconds)
+
                     # Extract output variables
                     results = self._extract_output_variables(data)
 
@@ -448,6 +474,8 @@ def create_http_lookup_tool(name: str, config_dict: Dict[str, Any]) -> GenericHT
         body_template=config_dict.get('body_template'),
         output_variables=config_dict.get('output_variables', {}),
         max_response_size_bytes=config_dict.get('max_response_size_bytes', 65536),
+        max_concurrency=int(config_dict.get('max_concurrency', 0) or 0),
+        cache_ttl_seconds=float(config_dict.get('cache_ttl_seconds', 0) or 0),
     )
     
     return GenericHTTPLookupTool(config)
@@ -16,6 +16,7 @@ import aiohttp
 
 from src.tools.base import PostCallTool, ToolDefinition, ToolCategory, ToolPhase
 from src.tools.context import PostCallContext
+from src.tools.http.client_pool import get_http_client_pool, remaining_timeout
 from src.tools.http.debug_trace import (
     build_var_snapshot,
     debug_enabled,
@@ -56,6 +57,9 @@ class WebhookConfig:
     generate_summary: bool = False
     summary_max_words: int = 100
 
+    # Shared HTTP client: in-flight request cap (0 = http_client.default_max_concurrency)
+    max_concurrency: int = 0
+
 
 class GenericWebhookTool(PostCallTool):
     """
@@ -182,13 +186,18 @@ class GenericWebhookTool(PostCallTool):
             logger.info(f"Sending webhook: {self.config.name} {self.config.method} {self._redact_url(url)}")
             
             # Make request (fire-and-forget)
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            budget = self.config.timeout_ms / 1000.0
+            deadline = time.monotonic() + budget
+            pool = get_http_client_pool()
+            async with pool.session(self.config.name, self.config.max_concurrency, budget) as session:
+                # Time spent waiting for a slot comes out of the request's budget.
+                timeout = remaining_timeout(deadline)
                 async with session.request(
                     method=self.config.method,
                     url=url,
                     headers=headers,
                     data=payload,
+                    timeout=timeout,
                 ) as response:
                     status = response.status
                     body_text = ""
@@ -395,6 +404,7 @@ def create_webhook_tool(name: str, config_dict: Dict[str, Any]) -> GenericWebhoo
         content_type=config_dict.get('content_type', 'application/json'),
         generate_summary=config_dict.get('generate_summary', False),
         summary_max_words=config_dict.get('summary_max_words', 100),
+        max_concurrency=int(config_dict.get('max_concurrency', 0) or 0),
     )
     
     return GenericWebhookTool(config)
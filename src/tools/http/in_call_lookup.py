@@ -17,6 +17,7 @@ import aiohttp
 
 from src.tools.base import Tool, ToolDefinition, ToolCategory, ToolPhase, ToolParameter
 from src.tools.context import ToolExecutionContext
+from src.tools.http.client_pool import get_http_client_pool, remaining_timeout, response_cache_key
 from src.tools.http.debug_trace import (
     build_var_snapshot,
     debug_enabled,
@@ -61,6 +62,11 @@ class InCallHTTPConfig:
     # Error handling
     error_message: str = "I'm sorry, I couldn't retrieve that information right now."
 
+    # Shared HTTP client: in-flight request cap (0 = http_client.default_max_concurrency)
+    max_concurrency: int = 0
+    # Reuse successful GET responses for this many seconds (0 = no caching)
+    cache_ttl_seconds: float = 0.0
+
 
 class InCallHTTPTool(Tool):
     """
@@ -236,14 +242,41 @@ class InCallHTTPTool(Tool):
                 }
             )
             
+            pool = get_http_client_pool()
+            cache_key = None
+            if self.config.cache_ttl_seconds > 0 and self.config.method.upper() == "GET":
+                cache_key = response_cache_key(
+                    self.config.name,
+                    self.config.method,
+                    url,
+                    query_params,
+                    headers,
+                    json_body if json_body is not None else body,
+                )
+                cached = pool.get_cached(self.config.name, cache_key)
+                if cached is not None:
+                    result = self._build_success_result(json.loads(cached))
+                    logger.info(
+                        f"In-call HTTP tool served from cache: {self.config.name}",
+                        extra={
+                            "call_id": context.call_id,
+                            "output_keys": list(result.get("data", {}).keys()),
+                        }
+                    )
+                    return result
+
             # Make request
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            budget = self.config.timeout_ms / 1000.0
+            deadline = time.monotonic() + budget
+            async with pool.session(self.config.name, self.config.max_concurrency, budget) as session:
+                # Time spent waiting for a slot comes out of the request's budget.
+                timeout = remaining_timeout(deadline)
                 request_kwargs = {
                     "method": self.config.method,
                     "url": url,
                     "headers": headers,
                     "params": query_params if query_params else None,
+                    "timeout": timeout,
                 }
                 
                 if json_body is not None:
@@ -384,31 +417,20 @@ class InCallHTTPTool(Tool):
                             context.call_id,
                         )
                     
-                    # Build result
-                    result = {
-                        "status": "success",
-                    }
-                    
-                    if self.config.return_raw_json:
-                        # Return full JSON to AI
-                        result["data"] = data
-                        result["message"] = f"Retrieved data successfully."
-                    else:
-                        # Extract output variables
-                        extracted = self._extract_output_variables(data)
-                        result["data"] = extracted
-                        # Build human-readable message
-                        result["message"] = self._build_result_message(extracted)
+                    if cache_key is not None:
+                        pool.store(cache_key, body_text, self.config.cache_ttl_seconds)
 
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] outputs in_call tool=%s elapsed_ms=%s outputs=%s call_id=%s",
-                                self.config.name,
-                                elapsed_ms,
-                                extracted,
-                                context.call_id,
-                            )
+                    result = self._build_success_result(data)
+
+                    if not self.config.return_raw_json and debug_enabled(logger):
+                        elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                        logger.debug(
+                            "[HTTP_TOOL_TRACE] outputs in_call tool=%s elapsed_ms=%s outputs=%s call_id=%s",
+                            self.config.name,
+                            elapsed_ms,
+                            result["data"],
+                            context.call_id,
+                        )
                     
                     logger.info(
                         f"In-call HTTP tool completed: {self.config.name}",
@@ -570,6 +592,27 @@ class InCallHTTPTool(Tool):
         
         return current
     
+    def _build_success_result(self, data: Any) -> Dict[str, Any]:
+        """
+        Build the success payload returned to the AI from a parsed JSON response.
+        """
+        result: Dict[str, Any] = {
+            "status": "success",
+        }
+        
+        if self.config.return_raw_json:
+            # Return full JSON to AI
+            result["data"] = data
+            result["message"] = "Retrieved data successfully."
+        else:
+            # Extract output variables
+            extracted = self._extract_output_variables(data)
+            result["data"] = extracted
+            # Build human-readable message
+            result["message"] = self._build_result_message(extracted)
+        
+        return result
+    
     def _build_result_message(self, data: Dict[str, Any]) -> str:
         """
         Build a human-readable message from extracted data.
@@ -628,6 +671,8 @@ def create_in_call_http_tool(name: str, config_dict: Dict[str, Any]) -> InCallHT
         return_raw_json=config_dict.get('return_raw_json', False),
         max_response_size_bytes=config_dict.get('max_response_size_bytes', 65536),
         error_message=config_dict.get('error_message', "I'm sorry, I couldn't retrieve that information right now."),
+        max_concurrency=int(config_dict.get('max_concurrency', 0) or 0),
+        cache_ttl_seconds=float(config_dict.get('cache_ttl_seconds', 0) or 0),
     )
     
     return InCallHTTPTool(config)
@@ -2,9 +2,13 @@
 Tool registry - central repository for all available tools.
 
 Singleton pattern ensures only one registry exists across the application.
+
+Provider schemas are compiled once per (format, requested tool names,
+registry generation) and reused until a tool is registered or removed; see
+``ToolRegistry.schema_json`` for the pre-serialized form.
 """
 
-from typing import Dict, List, Type, Optional, Iterable, Set, Union, Any
+from typing import Callable, Dict, List, Type, Optional, Iterable, Set, Tuple, Union, Any
 from src.tools.base import Tool, ToolDefinition, ToolCategory, ToolPhase, PreCallTool, PostCallTool
 import logging
 import hashlib
@@ -12,6 +16,44 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Provider format -> ToolDefinition method producing one tool's schema
+_SCHEMA_BUILDERS: Dict[str, Callable[[ToolDefinition], Dict[str, Any]]] = {
+    "openai": ToolDefinition.to_openai_schema,
+    "openai_realtime": ToolDefinition.to_openai_realtime_schema,
+    "deepgram": ToolDefinition.to_deepgram_schema,
+    "elevenlabs": ToolDefinition.to_elevenlabs_schema,
+    "local_llm": ToolDefinition.to_local_llm_schema,
+}
+
+
+class _CompiledSchemas:
+    """Schemas for one cache key; JSON encoded on first request."""
+
+    __slots__ = ("schemas", "_json")
+
+    def __init__(self, schemas: List[Dict[str, Any]]):
+        self.schemas = schemas
+        self._json: Optional[bytes] = None
+
+    def json_bytes(self) -> bytes:
+        if self._json is None:
+            self._json = json.dumps(self.schemas).encode("utf-8")
+        return self._json
+
+
+def splice_json(payload: Dict[str, Any], key: str, raw: bytes) -> bytes:
+    """
+    Encode ``payload`` with ``raw`` (already JSON) as its top-level ``key``.
+
+    Lets callers send ``schema_json()`` output without decoding and
+    re-encoding the tool list on every request.
+    """
+    head = json.dumps({k: v for k, v in payload.items() if k != key}).encode("utf-8")
+    field = json.dumps(key).encode("utf-8") + b": " + raw
+    if head == b"{}":
+        return b"{" + field + b"}"
+    return head[:-1] + b", " + field + b"}"
+
 
 class ToolRegistry:
     """
@@ -38,7 +80,22 @@ class ToolRegistry:
             cls._instance._tools: Dict[str, Tool] = {}
             cls._instance._initialized = False
             cls._instance._in_call_http_init_cache: Set[str] = set()
+            cls._instance._generation = 0
+            cls._instance._schema_cache: Dict[Tuple[str, Optional[Tuple[str, ...]], int], Any] = {}
         return cls._instance
+
+    # Distinct (format, tool list) combinations kept before the cache is reset
+    SCHEMA_CACHE_MAX_ENTRIES = 256
+
+    @property
+    def generation(self) -> int:
+        """Incremented whenever the set of registered tools changes."""
+        return self._generation
+
+    def invalidate_schemas(self) -> None:
+        """Drop compiled provider schemas (called on every registry change)."""
+        self._generation += 1
+        self._schema_cache.clear()
     
     def register(self, tool_class: Type[Tool]) -> None:
         """
@@ -57,6 +114,7 @@ class ToolRegistry:
             logger.warning(f"Tool {tool_name} already registered, overwriting")
         
         self._tools[tool_name] = tool
+        self.invalidate_schemas()
         logger.info(f"✅ Registered tool: {tool_name} ({tool.definition.category.value})")
 
     def register_instance(self, tool: Tool) -> None:
@@ -67,6 +125,7 @@ class ToolRegistry:
         if tool_name in self._tools:
             logger.warning(f"Tool {tool_name} already registered, overwriting")
         self._tools[tool_name] = tool
+        self.invalidate_schemas()
         logger.info(f"✅ Registered tool: {tool_name} ({tool.definition.category.value})")
 
     def get(self, name: str) -> Optional[Tool]:
@@ -99,6 +158,7 @@ class ToolRegistry:
         """Unregister a tool by exact name (no alias resolution)."""
         if name in self._tools:
             self._tools.pop(name, None)
+            self.invalidate_schemas()
             logger.info(f"🗑️ Unregistered tool: {name}")
             return True
         return False
@@ -273,6 +333,31 @@ class ToolRegistry:
             tools.append(tool)
         return tools
 
+    def _compiled(self, fmt: str, tool_names: Optional[Iterable[str]]) -> _CompiledSchemas:
+        names_key = None if tool_names is None else tuple(tool_names)
+        key = (fmt, names_key, self._generation)
+        entry = self._schema_cache.get(key)
+        if entry is None:
+            build = _SCHEMA_BUILDERS[fmt]
+            entry = _CompiledSchemas([build(tool.definition) for tool in self._iter_tools_filtered(names_key)])
+            if len(self._schema_cache) >= self.SCHEMA_CACHE_MAX_ENTRIES:
+                self._schema_cache.clear()
+            self._schema_cache[key] = entry
+        return entry
+
+    def schema_json(self, fmt: str, tool_names: Optional[Iterable[str]] = None) -> bytes:
+        """
+        Pre-serialized JSON array of tool schemas in provider format ``fmt``.
+
+        Args:
+            fmt: One of "openai", "openai_realtime", "deepgram", "elevenlabs", "local_llm"
+            tool_names: Allowlist (aliases resolved, order kept); None = all tools
+        """
+        return self._compiled(fmt, tool_names).json_bytes()
+
+    # The schema lists below are shared with the cache: callers may replace or
+    # append to the returned list but must not mutate the schema dicts.
+
     def to_deepgram_schema(self) -> List[Dict]:
         """
         Export all tools in Deepgram Voice Agent format.
@@ -280,10 +365,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for Deepgram
         """
-        return [tool.definition.to_deepgram_schema() for tool in self._tools.values()]
+        return list(self._compiled("deepgram", None).schemas)
 
     def to_deepgram_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_deepgram_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return list(self._compiled("deepgram", tool_names).schemas)
     
     def to_openai_schema(self) -> List[Dict]:
         """
@@ -292,10 +377,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for OpenAI Chat Completions (nested format)
         """
-        return [tool.definition.to_openai_schema() for tool in self._tools.values()]
+        return list(self._compiled("openai", None).schemas)
 
     def to_openai_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_openai_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return list(self._compiled("openai", tool_names).schemas)
     
     def to_openai_realtime_schema(self) -> List[Dict]:
         """
@@ -304,10 +389,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for OpenAI Realtime API (flat format)
         """
-        return [tool.definition.to_openai_realtime_schema() for tool in self._tools.values()]
+        return list(self._compiled("openai_realtime", None).schemas)
 
     def to_openai_realtime_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_openai_realtime_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return list(self._compiled("openai_realtime", tool_names).schemas)
     
     def to_elevenlabs_schema(self) -> List[Dict]:
         """
@@ -316,10 +401,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for ElevenLabs (client-side execution)
         """
-        return [tool.definition.to_elevenlabs_schema() for tool in self._tools.values()]
+        return list(self._compiled("elevenlabs", None).schemas)
 
     def to_elevenlabs_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_elevenlabs_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return list(self._compiled("elevenlabs", tool_names).schemas)
     
     def to_prompt_text(self) -> str:
         """
@@ -345,10 +430,7 @@ class ToolRegistry:
         Returns:
             List of tool schemas for local LLM prompt injection
         """
-        return [
-            tool.definition.to_local_llm_schema()
-            for tool in self._tools.values()
-        ]
+        return list(self._compiled("local_llm", None).schemas)
     
     def to_local_llm_prompt(self) -> str:
         """
@@ -357,13 +439,16 @@ class ToolRegistry:
         Returns a formatted string that can be injected into system prompts
         for local LLMs like Phi-3, Llama, etc.
         """
-        import json
         if not self._tools:
             return ""
+        key = ("local_llm_prompt", None, self._generation)
+        cached = self._schema_cache.get(key)
+        if cached is not None:
+            return cached
         
         tools_json = json.dumps(self.to_local_llm_schema(), indent=2)
         
-        return f"""## Available Tools
+        prompt = f"""## Available Tools
 
 You have access to the following tools. When you need to use a tool, output EXACTLY this format:
 
@@ -383,6 +468,8 @@ After outputting a tool call, provide a brief spoken response.
 - Always provide a spoken response along with tool calls
 - Only use tools when the user's intent clearly matches the tool's purpose
 """
+        self._schema_cache[key] = prompt
+        return prompt
     
     def initialize_default_tools(self) -> None:
         """
@@ -495,6 +582,7 @@ After outputting a tool call, provide a brief spoken response.
                     logger.warning(f"Failed to create webhook tool {tool_name}: {e}", exc_info=True)
         
         if http_tool_count > 0:
+            self.invalidate_schemas()
             logger.info(f"🌐 Initialized {http_tool_count} HTTP tools from config")
 
     def initialize_in_call_http_tools_from_config(self, in_call_tools_config: Dict[str, Any], *, cache_key: Optional[str] = None) -> None:
@@ -567,6 +655,7 @@ After outputting a tool call, provide a brief spoken response.
         self._tools.clear()
         self._initialized = False
         self._in_call_http_init_cache.clear()
+        self.invalidate_schemas()
         logger.info("Cleared all registered tools")
 
 
@@ -3,7 +3,7 @@ import wave
 import threading
 from typing import Dict, Tuple, Optional
 
-import audioop
+from src.audio.resampler import mulaw_to_pcm16le
 
 
 class AudioCaptureManager:
@@ -85,7 +85,7 @@ class AudioCaptureManager:
         encoding = (encoding or "").lower()
         try:
             if encoding in ("ulaw", "mulaw", "g711_ulaw", "mu-law"):
-                pcm16 = audioop.ulaw2lin(payload, 2)
+                pcm16 = mulaw_to_pcm16le(payload)
                 rate = sample_rate or 8000
             elif encoding in ("slin16", "linear16", "pcm16"):
                 pcm16 = payload
@@ -0,0 +1,11 @@
+"""
+Local AI server modules use flat imports (``from constants import ...``) because
+the server runs from its own directory inside its container. Mirror that here.
+"""
+
+import os
+import sys
+
+_SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "local_ai_server"))
+if _SERVER_DIR not in sys.path:
+    sys.path.insert(0, _SERVER_DIR)
@@ -0,0 +1,79 @@
+import io
+import math
+import struct
+import wave
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from audio_processor import AudioProcessor, RatecvResampler, StreamingResampler, pcm16_to_ulaw
+
+try:
+    import audioop
+except ImportError:  # pragma: no cover - Python 3.13+
+    audioop = None
+
+
+def _tone(rate: int, seconds: float = 0.25, freq: float = 300.0) -> bytes:
+    n = int(rate * seconds)
+    return struct.pack(f"<{n}h", *(int(9000 * math.sin(2 * math.pi * freq * i / rate)) for i in range(n)))
+
+
+def _wav(pcm: bytes, rate: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+@pytest.mark.skipif(audioop is None, reason="audioop not available")
+def test_ulaw_encoding_matches_g711_reference():
+    pcm = _tone(8000)
+    assert pcm16_to_ulaw(pcm) == audioop.lin2ulaw(pcm, 2)
+
+
+def test_streaming_resampler_is_continuous_across_odd_chunks():
+    pcm = _tone(8000)
+    whole = StreamingResampler(8000, 16000).process(pcm)
+
+    streaming = StreamingResampler(8000, 16000)
+    view = memoryview(pcm)
+    pieces = [streaming.process(view[i:i + 321]) for i in range(0, len(pcm), 321)]
+
+    assert b"".join(pieces) == whole
+    assert len(whole) == 2 * len(pcm)
+
+
+@pytest.mark.parametrize("rate", [22050, 24000, 44100])
+def test_convert_to_ulaw_8k_handles_wav_and_raw_in_process(rate, monkeypatch):
+    def _no_sox(*_args, **_kwargs):
+        raise AssertionError("sox fallback should not run for PCM16 input")
+
+    monkeypatch.setattr("audio_processor.subprocess.run", _no_sox)
+    pcm = _tone(rate)
+
+    from_wav = AudioProcessor.convert_to_ulaw_8k(_wav(pcm, rate), rate)
+    from_raw = AudioProcessor.convert_pcm16_to_ulaw_8k(pcm, rate)
+
+    assert from_wav == from_raw
+    assert abs(len(from_raw) - len(pcm) // 2 * 8000 / rate) <= 1
+
+
+@pytest.mark.skipif(audioop is None, reason="audioop not available")
+def test_without_numpy_resampling_falls_back_to_stateful_ratecv(monkeypatch):
+    monkeypatch.setattr("audio_processor.np", None)
+    monkeypatch.setattr("audio_processor._ULAW_ENCODE", None)
+    pcm = _tone(8000)
+
+    resampler = AudioProcessor.create_resampler(8000, 16000)
+    assert isinstance(resampler, RatecvResampler)
+    view = memoryview(pcm)
+    pieces = [resampler.process(view[i:i + 321]) for i in range(0, len(pcm), 321)]
+    assert b"".join(pieces) == audioop.ratecv(pcm, 2, 1, 8000, 16000, None)[0]
+
+    ulaw = AudioProcessor.convert_pcm16_to_ulaw_8k(_tone(16000), 16000)
+    assert abs(len(ulaw) - len(pcm) // 2) <= 1  # one byte per 8 kHz sample
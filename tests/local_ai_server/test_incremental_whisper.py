@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from server import LocalAIServer
+from session import SessionContext
+from stt_backends import AudioRingBuffer, IncrementalWhisperDecoder
+
+RATE = 16000
+WORD_SEC = 0.4
+GAP_SEC = 0.1
+VOCAB = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+
+
+def _utterance(n_words: int) -> bytes:
+    """Each word is a constant-level block whose level encodes its vocab index."""
+    parts = []
+    for i in range(n_words):
+        level = int((i % len(VOCAB) + 1) * 1000)
+        parts.append(np.full(int(RATE * WORD_SEC), level, dtype=np.int16))
+        parts.append(np.zeros(int(RATE * GAP_SEC), dtype=np.int16))
+    return np.concatenate(parts).tobytes()
+
+
+class FakeWhisper:
+    """Decodes the level-coded audio above, one segment per complete word."""
+
+    def __init__(self):
+        self.window_sizes = []
+        self.prompts = []
+
+    def __call__(self, audio, prompt, final):
+        self.window_sizes.append(audio.size)
+        self.prompts.append(prompt)
+        levels = np.rint(audio * 32768 / 1000).astype(int)
+        segments = []
+        i = 0
+        while i < levels.size:
+            if levels[i] <= 0:
+                i += 1
+                continue
+            j = i
+            while j < levels.size and levels[j] == levels[i]:
+                j += 1
+            if j < levels.size or final:
+                segments.append((i / RATE, j / RATE, VOCAB[levels[i] - 1]))
+            i = j
+        return segments
+
+
+def _feed(decoder, pcm: bytes, chunk_ms: int = 20):
+    step = RATE * chunk_ms // 1000 * 2
+    results = []
+    for pos in range(0, len(pcm), step):
+        result = decoder.feed(pcm[pos:pos + step])
+        if result:
+            results.append(result)
+    return results
+
+
+def test_ring_buffer_wraps_and_grows():
+    ring = AudioRingBuffer(4)
+    ring.append(np.arange(3, dtype=np.float32))
+    ring.drop(2)
+    ring.append(np.arange(3, 6, dtype=np.float32))
+    assert ring.view().tolist() == [2, 3, 4, 5]
+    ring.append(np.arange(6, 9, dtype=np.float32))
+    assert ring.capacity >= 7
+    assert ring.view().tolist() == [2, 3, 4, 5, 6, 7, 8]
+
+
+def test_partials_commit_agreed_words_and_final_is_complete():
+    model = FakeWhisper()
+    decoder = IncrementalWhisperDecoder(model, sample_rate=RATE, partial_interval_ms=300, min_audio_ms=500)
+    results = _feed(decoder, _utterance(6))
+    assert results and all(r["type"] == "partial" for r in results)
+    assert decoder.committed_text.split() == VOCAB[:len(decoder.committed_text.split())]
+    assert len(decoder.committed_text.split()) >= 3
+
+    final = decoder.finalize()
+    assert final == {"type": "final", "text": " ".join(VOCAB[:6])}
+    assert decoder.committed_text == ""
+    assert decoder.buffered_seconds == 0.0
+    # The committed text is offered to the model as a prompt.
+    assert any(p.startswith("alpha") for p in model.prompts)
+
+
+def test_committed_audio_is_trimmed_so_decode_cost_is_linear():
+    model = FakeWhisper()
+    decoder = IncrementalWhisperDecoder(model, sample_rate=RATE, partial_interval_ms=500, min_audio_ms=500)
+    _feed(decoder, _utterance(40))  # 20 s of speech
+    final = decoder.finalize()
+    assert final["text"].split() == [VOCAB[i % len(VOCAB)] for i in range(40)]
+    # Windows never grow past a few words of uncommitted audio.
+    assert max(model.window_sizes) < RATE * 3
+    # Total decoded audio is a small multiple of the utterance, not quadratic.
+    assert decoder.decoded_samples < 6 * RATE * 20
+
+
+def test_max_window_forces_commit_when_agreement_stalls():
+    calls = {"n": 0}
+
+    def flaky(audio, prompt, final):
+        calls["n"] += 1
+        return [(0.0, audio.size / RATE, f"word{calls['n']}")]
+
+    decoder = IncrementalWhisperDecoder(
+        flaky, sample_rate=RATE, partial_interval_ms=500, min_audio_ms=0, max_window_sec=2.0
+    )
+    _feed(decoder, np.full(RATE * 6, 2000, dtype=np.int16).tobytes())
+    assert decoder.buffered_seconds <= 2.5
+    assert decoder.committed_text
+
+
+def test_endpoint_silence_emits_final():
+    decoder = IncrementalWhisperDecoder(
+        FakeWhisper(), sample_rate=RATE, partial_interval_ms=300, min_audio_ms=500, endpoint_silence_ms=600
+    )
+    pcm = _utterance(3) + np.zeros(RATE, dtype=np.int16).tobytes()
+    results = _feed(decoder, pcm)
+    assert results[-1] == {"type": "final", "text": "alpha bravo charlie"}
+
+
+class SlowIncrementalBackend:
+    """Counts chunks per utterance and records whether two decoder calls ever overlapped."""
+
+    incremental = True
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self.active = 0
+        self.overlapped = False
+        self.finals = []
+
+    def _enter(self):
+        with self._guard:
+            self.overlapped |= self.active > 0
+            self.active += 1
+
+    def _exit(self):
+        with self._guard:
+            self.active -= 1
+
+    def create_stream(self):
+        return []
+
+    def reset(self, stream):
+        stream.clear()
+
+    def process_audio(self, stream, pcm16_audio):
+        self._enter()
+        try:
+            time.sleep(0.002)
+            stream.append(pcm16_audio)
+            return None
+        finally:
+            self._exit()
+
+    def finalize(self, stream):
+        self._enter()
+        try:
+            time.sleep(0.03)
+            self.finals.append(len(stream))
+            stream.clear()
+            return {"type": "final", "text": "chunk " * self.finals[-1]}
+        finally:
+            self._exit()
+
+
+@pytest.mark.asyncio
+async def test_idle_finalize_is_serialized_with_streaming_audio():
+    server = LocalAIServer()
+    backend = SlowIncrementalBackend()
+    server.stt_backend = "faster_whisper"
+    server.faster_whisper_backend = backend
+    session = SessionContext(call_id="c1")
+    chunk = b"\x00\x00" * 320
+
+    async def stream_audio():
+        for _ in range(40):
+            await server._process_stt_stream_whisper(session, chunk, RATE, backend, "Fake")
+            await asyncio.sleep(0)
+
+    feeder = asyncio.create_task(stream_audio())
+    await asyncio.sleep(0.02)
+    final = await server._finalize_whisper_stream(session)  # idle timer fires while silence keeps arriving
+    assert final["type"] == "final"
+
+    # A finalizer cancelled mid-decode keeps the stream locked until its thread returns.
+    cancelled = asyncio.create_task(server._finalize_whisper_stream(session))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    await feeder
+
+    assert not backend.overlapped
+    # Every chunk lands in exactly one utterance: nothing fed during a finalize is lost.
+    assert sum(backend.finals) + len(session.whisper_stream) == 40
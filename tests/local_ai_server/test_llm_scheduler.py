@@ -0,0 +1,152 @@
+"""
+Round-robin LLM scheduling and ``llm_partial`` streaming.
+
+``WordLlama`` answers a prompt ``"<name>:<n>|"`` with ``n`` words, continuing
+from however many words the context already holds, so a preempted turn that
+resumes from prompt + generated text picks up exactly where it stopped.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+import websockets
+from websockets.asyncio.server import serve
+
+from server import LocalAIServer
+
+
+class WordLlama:
+    def __init__(self, delay=0.002, state_bytes=1):
+        self.delay = delay
+        self.state_bytes = state_bytes
+        self.calls = []
+        self.input_ids = []
+
+    def tokenize(self, text, add_bos=True, special=False):
+        return list(text)
+
+    def reset(self):
+        self.input_ids = []
+
+    def eval(self, tokens):
+        self.input_ids = self.input_ids + list(tokens)
+
+    def save_state(self):
+        ids = list(self.input_ids)
+        return SimpleNamespace(input_ids=ids, n_tokens=len(ids), llama_state_size=self.state_bytes)
+
+    def load_state(self, state):
+        self.input_ids = list(state.input_ids[: state.n_tokens])
+
+    def __call__(self, prompt, max_tokens=16, stream=False, **kwargs):
+        head, reply = prompt.split("|", 1)
+        total = int(head.split(":")[1])
+        already = len(reply.split())
+        self.calls.append(head)
+        for i in range(already, min(total, already + max_tokens)):
+            time.sleep(self.delay)
+            yield {"choices": [{"text": f" {head[0]}{i}"}]}
+
+
+def _server(slice_tokens=4, cache_mb=1, state_bytes=1):
+    server = LocalAIServer()
+    server.llm_model = WordLlama(state_bytes=state_bytes)
+    server.llm_state_cache_mb = cache_mb
+    server.llm_scheduler.slice_tokens = slice_tokens
+    return server
+
+
+def _words(name, n):
+    return " ".join(f"{name}{i}" for i in range(n))
+
+
+async def _race(server):
+    scheduler = server.llm_scheduler
+    finished = []
+
+    async def turn(prompt, call_id):
+        text = await scheduler.submit(prompt, call_id=call_id)
+        finished.append(call_id)
+        return text
+
+    long = asyncio.create_task(turn("A:40|", "a"))
+    await asyncio.sleep(0.02)  # "a" is mid-answer when "b" arrives
+    short = asyncio.create_task(turn("B:4|", "b"))
+    results = await asyncio.gather(long, short)
+    return finished, results
+
+
+@pytest.mark.asyncio
+async def test_short_turn_is_not_stuck_behind_a_long_answer():
+    server = _server(slice_tokens=4)
+    finished, (long_text, short_text) = await _race(server)
+    assert finished == ["b", "a"]
+    # The long answer was preempted and resumed without losing or repeating words.
+    assert long_text.strip() == _words("A", 40)
+    assert short_text.strip() == _words("B", 4)
+    assert server.llm_model.calls.count("A:40") > 1
+
+    sessions = server.llm_scheduler.stats()["sessions"]
+    assert set(sessions) == {"a", "b"}
+    assert sessions["b"]["last_queue_wait_ms"] > 0
+    assert sessions["a"]["tokens_per_sec"] > 0 and sessions["b"]["turns"] == 1
+
+    fifo = _server(slice_tokens=0)
+    finished, _ = await _race(fifo)
+    assert finished == ["a", "b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_mb, state_bytes", [(0, 1), (1, 2 << 20)], ids=["cache-off", "over-budget"])
+async def test_turn_without_a_snapshot_is_not_preempted(cache_mb, state_bytes):
+    # Resuming without a snapshot would re-evaluate prompt + answer, so the turn runs to completion.
+    server = _server(slice_tokens=4, cache_mb=cache_mb, state_bytes=state_bytes)
+    finished, (long_text, _) = await _race(server)
+    assert finished == ["a", "b"]
+    assert long_text.strip() == _words("A", 40)
+    assert server.llm_model.calls.count("A:40") == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_turn_stops_taking_slices():
+    server = _server(slice_tokens=4)
+    scheduler = server.llm_scheduler
+    gone = asyncio.create_task(scheduler.submit("A:400|", call_id="a"))
+    await asyncio.sleep(0.02)
+    live = asyncio.create_task(scheduler.submit("B:12|", call_id="b"))
+    await asyncio.sleep(0.01)
+    gone.cancel()  # the caller hit llm_infer_timeout_sec
+
+    assert (await asyncio.wait_for(live, 2.0)).strip() == _words("B", 12)
+    while scheduler.stats()["running"] or scheduler.stats()["queued"]:
+        await asyncio.sleep(0.01)
+    # "a" was dropped at the next slice boundary instead of generating all 400 words.
+    assert server.llm_model.calls.count("A:400") <= 3
+    assert "a" not in scheduler.stats()["sessions"]
+
+
+@pytest.mark.asyncio
+async def test_llm_request_streams_partials_before_the_response():
+    server = _server()
+    async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+        url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+        async with websockets.connect(url) as ws:
+            await ws.send(
+                json.dumps(
+                    {"type": "llm_request", "text": "S:6|", "call_id": "c1", "request_id": "r1", "stream": True}
+                )
+            )
+            partials = []
+            while True:
+                message = json.loads(await asyncio.wait_for(ws.recv(), 2.0))
+                if message["type"] == "llm_response":
+                    break
+                assert message["type"] == "llm_partial"
+                assert message["call_id"] == "c1" and message["request_id"] == "r1"
+                partials.append(message)
+
+    assert [p["seq"] for p in partials] == list(range(1, len(partials) + 1))
+    assert "".join(p["text"] for p in partials).strip() == message["text"] == _words("S", 6)
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+
+import pytest
+
+from llm_state_cache import LlamaStateCache, _state_size, common_prefix_length
+from server import LocalAIServer
+from session import SessionContext
+from status_builder import build_status_response
+
+
+class FakeLlama:
+    """Character-token stand-in that evaluates only what its context doesn't already hold."""
+
+    def __init__(self, bytes_per_token=10):
+        self.bytes_per_token = bytes_per_token
+        self.tokens = []
+        self.evaluated = 0
+
+    @property
+    def input_ids(self):
+        return list(self.tokens)
+
+    def tokenize(self, text, add_bos=True, special=False):
+        return list(text)
+
+    def reset(self):
+        self.tokens = []
+
+    def eval(self, tokens):
+        self.tokens.extend(tokens)
+        self.evaluated += len(tokens)
+
+    def save_state(self):
+        return SimpleNamespace(
+            input_ids=list(self.tokens),
+            n_tokens=len(self.tokens),
+            llama_state_size=len(self.tokens) * self.bytes_per_token,
+        )
+
+    def load_state(self, state):
+        self.tokens = list(state.input_ids[: state.n_tokens])
+
+    def __call__(self, prompt, stream=False, **kwargs):
+        tokens = self.tokenize(prompt.encode("utf-8"))
+        # Like llama-cpp-python: reuse the shared prefix, always re-evaluate the last prompt token.
+        keep = common_prefix_length(self.tokens, tokens[:-1])
+        self.tokens = self.tokens[:keep]
+        self.eval(tokens[keep:])
+        self.eval(list(b" ok"))
+        yield {"choices": [{"text": " ok"}]}
+
+
+def _server(cache_mb=64):
+    server = LocalAIServer()
+    server.llm_model = FakeLlama()
+    server.llm_context = 8192
+    server.llm_state_cache_mb = cache_mb
+    return server
+
+
+async def _turn(server, session, text):
+    prompt, _, _, _ = server._prepare_llm_prompt(session, text)
+    before = server.llm_model.evaluated
+    assert await server.process_llm(prompt, session) == "ok"
+    return prompt, server.llm_model.evaluated - before - len(b" ok")
+
+
+@pytest.mark.asyncio
+async def test_interleaved_calls_evaluate_only_the_new_turn():
+    server = _server()
+    alice, bob = SessionContext(call_id="alice"), SessionContext(call_id="bob")
+    system = len(server._phi_prompt_prefix())
+
+    await _turn(server, alice, "I need to move my appointment")
+    prompt, evaluated = await _turn(server, bob, "What are your opening hours")
+    # The system prefix primed on the first turn is not evaluated again.
+    assert evaluated == len(prompt) - system
+
+    # Only the new turn is evaluated (the first "\n" is shared with "\n<|assistant|>").
+    prompt, evaluated = await _turn(server, alice, "Tuesday afternoon works")
+    assert evaluated == len("\nTuesday afternoon works\n<|assistant|>\n")
+    prompt, evaluated = await _turn(server, bob, "Thanks")
+    assert evaluated == len("\nThanks\n<|assistant|>\n")
+
+    stats = server.llm_state_cache.stats()
+    # First turns found the system prefix already live, so nothing had to be loaded.
+    assert stats["session_hits"] == 2 and stats["live_hits"] == 2 and stats["calls"] == 2
+    server.release_llm_state("alice")
+    assert server.llm_state_cache.stats()["calls"] == 1
+
+    cold = _server(cache_mb=0)
+    alice, bob = SessionContext(call_id="alice"), SessionContext(call_id="bob")
+    await _turn(cold, alice, "I need to move my appointment")
+    await _turn(cold, bob, "What are your opening hours")
+    prompt, evaluated = await _turn(cold, alice, "Tuesday afternoon works")
+    assert evaluated == len(prompt) - system
+
+
+def test_lru_eviction_keeps_system_prefix_within_budget():
+    model = FakeLlama(bytes_per_token=1)
+    cache = LlamaStateCache(model, budget_bytes=100)
+    system = list(b"SYSTEM:")
+    for call_id in ("a", "b", "c"):
+        prompt = system + list(call_id.encode() * 30)
+        cache.prepare(call_id, prompt, system)
+        model.load_state(SimpleNamespace(input_ids=prompt, n_tokens=len(prompt)))
+        cache.remember(call_id)
+
+    stats = cache.stats()
+    # 7-token system snapshot plus two 37-token call snapshots fit in 100 bytes.
+    assert stats["bytes"] == 7 + 37 + 37 and stats["calls"] == 2 and stats["evictions"] == 1
+    assert stats["system_tokens"] == 7
+
+    # "a" was evicted: its next turn falls back to the system prefix.
+    assert cache.prepare("a", system + list(b"a" * 31), system) == len(system)
+    assert cache.prepare("c", system + list(b"c" * 31), system) == len(system) + 30
+
+    # A snapshot that can never fit is skipped instead of flushing everything else.
+    model.load_state(SimpleNamespace(input_ids=list(range(200)), n_tokens=200))
+    cache.remember("huge")
+    assert cache.stats()["calls"] == 2
+
+
+def test_system_prefix_that_does_not_fit_is_not_primed_every_turn():
+    model = FakeLlama(bytes_per_token=10)
+    cache = LlamaStateCache(model, budget_bytes=50)
+    system = list(b"SYSTEM:")  # 70 bytes > budget
+    for turn in range(3):
+        cache.prepare("a", system + list(b"hi") * (turn + 1), system)
+    assert model.evaluated == len(system)
+    assert cache.stats()["system_tokens"] == 0
+
+
+def test_state_size_counts_token_and_logit_arrays():
+    np = pytest.importorskip("numpy")
+    state = SimpleNamespace(
+        input_ids=np.zeros(8, dtype=np.intc),
+        scores=np.zeros((8, 100), dtype=np.single),
+        n_tokens=8,
+        llama_state_size=1000,
+    )
+    assert _state_size(state) == 1000 + 8 * 4 + 8 * 100 * 4
+
+
+@pytest.mark.asyncio
+async def test_status_reports_turn_timings():
+    server = _server()
+    session = SessionContext(call_id="alice")
+    await _turn(server, session, "Hello there")
+
+    llm = build_status_response(server)["models"]["llm"]
+    assert llm["state_cache"]["enabled"] is True
+    timings = llm["turn_timings"]
+    assert timings["turns"] == 1
+    (turn,) = timings["recent"]
+    assert turn["call_id"] == "alice" and turn["completion_tokens"] == 1
+    assert turn["reused_tokens"] == len(server._phi_prompt_prefix())
+    assert turn["prompt_eval_ms"] >= 0 and turn["generation_ms"] >= 0
@@ -0,0 +1,157 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from stt_backends import FasterWhisperSTTBackend, IncrementalWhisperDecoder, WhisperStream
+from stt_scheduler import WhisperBatchScheduler
+
+
+class FakeBackend:
+    sample_rate = 16000
+
+    def __init__(self, batching=True, fail_batch=False, delay=0.01):
+        self.supports_batching = batching
+        self.fail_batch = fail_batch
+        self.delay = delay
+        self.batch_sizes = []
+        self.single_calls = 0
+        self._active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+
+    def _exit(self):
+        with self._lock:
+            self._active -= 1
+
+    @staticmethod
+    def _label(audio, final):
+        return [(0.0, audio.size / 16000, f"{'F' if final else 'P'}{int(audio[0])}")]
+
+    def _transcribe_window(self, audio, prompt, final):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            self.single_calls += 1
+            return self._label(audio, final)
+        finally:
+            self._exit()
+
+    def transcribe_batch(self, windows, final):
+        self._enter()
+        try:
+            if self.fail_batch:
+                raise RuntimeError("boom")
+            time.sleep(self.delay)
+            self.batch_sizes.append(len(windows))
+            return [self._label(audio, final) for audio, _prompt in windows]
+        finally:
+            self._exit()
+
+
+def _submit_concurrently(scheduler, count, final=False):
+    results = [None] * count
+
+    def worker(i):
+        results[i] = scheduler.transcribe(np.full(1600, i, dtype=np.float32), "", final)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return results
+
+
+def test_scheduler_batches_windows_from_many_sessions():
+    backend = FakeBackend()
+    scheduler = WhisperBatchScheduler(backend, max_batch=8, max_wait_ms=50)
+    scheduler.start()
+    try:
+        results = _submit_concurrently(scheduler, 16)
+    finally:
+        scheduler.stop()
+    assert [r[0][2] for r in results] == [f"P{i}" for i in range(16)]
+    assert max(backend.batch_sizes) > 1
+    assert sum(backend.batch_sizes) + backend.single_calls == 16
+    assert backend.max_active == 1
+    stats = scheduler.stats()
+    assert stats["windows"] == 16 and stats["largest_batch"] > 1
+
+
+def test_scheduler_falls_back_to_sequential_when_batch_fails():
+    backend = FakeBackend(fail_batch=True)
+    scheduler = WhisperBatchScheduler(backend, max_batch=8, max_wait_ms=50)
+    scheduler.start()
+    try:
+        results = _submit_concurrently(scheduler, 6, final=True)
+    finally:
+        scheduler.stop()
+    assert [r[0][2] for r in results] == [f"F{i}" for i in range(6)]
+    assert backend.single_calls == 6
+
+
+def test_non_batching_backend_is_serialized():
+    backend = FakeBackend(batching=False)
+    scheduler = WhisperBatchScheduler(backend, max_batch=4, max_wait_ms=5)
+    scheduler.start()
+    try:
+        _submit_concurrently(scheduler, 8)
+    finally:
+        scheduler.stop()
+    assert backend.batch_sizes == []
+    assert backend.single_calls == 8
+    assert backend.max_active == 1
+
+
+def test_submit_after_stop_fails_fast():
+    scheduler = WhisperBatchScheduler(FakeBackend())
+    with pytest.raises(RuntimeError):
+        scheduler.transcribe(np.zeros(10, dtype=np.float32))
+
+
+class _FakeWhisperModel:
+    """Stands in for faster_whisper.WhisperModel: echoes the buffer length."""
+
+    def transcribe(self, audio, **kwargs):
+        seg = SimpleNamespace(start=0.0, end=audio.size / 16000, text=f"n{audio.size}")
+        return [seg], None
+
+
+def _loaded_backend(**kwargs):
+    backend = FasterWhisperSTTBackend(**kwargs)
+    backend.model = _FakeWhisperModel()
+    backend._initialized = True
+    return backend
+
+
+def test_sessions_get_independent_streams_on_a_shared_model():
+    backend = _loaded_backend()
+    backend.enable_batching(max_batch=4, max_wait_ms=1)
+    try:
+        a, b = backend.create_stream(), backend.create_stream()
+        assert isinstance(a, WhisperStream) and a is not b
+        backend.process_audio(a, np.zeros(16000, dtype=np.int16).tobytes())
+        backend.process_audio(b, np.zeros(8000, dtype=np.int16).tobytes())
+        assert a.audio_buffer.size == 16000 and b.audio_buffer.size == 8000
+        assert backend.finalize(b) == {"type": "final", "text": "n8000"}
+        assert a.audio_buffer.size == 16000 and b.audio_buffer.size == 0
+        assert backend.transcribe(np.zeros(320, dtype=np.int16).tobytes()) == "n320"
+        assert backend.scheduler.stats()["windows"] == 2
+    finally:
+        backend.shutdown()
+    assert backend.scheduler is None
+
+
+def test_incremental_mode_streams_are_decoders():
+    backend = _loaded_backend(incremental=True)
+    stream = backend.create_stream()
+    assert isinstance(stream, IncrementalWhisperDecoder)
+    assert stream is not backend.create_stream()
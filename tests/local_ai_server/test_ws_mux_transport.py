@@ -0,0 +1,161 @@
+"""
+Binary-framed, multiplexed transport between the engine and local_ai_server.
+
+Runs the real ``WebSocketProtocol`` handler (STT backend replaced by a stub)
+against the engine-side ``LocalAIMuxPool`` and ``LocalProvider``.
+"""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+from websockets.asyncio.server import serve
+
+import protocol_contract
+from server import LocalAIServer
+from src.config import LocalProviderConfig
+from src.providers import local_mux
+from src.providers.local import LocalProvider
+
+
+def test_engine_and_server_frame_layouts_match():
+    for name in ("FRAME_MAGIC", "FRAME_VERSION", "FRAME_AUDIO", "FRAME_TTS_AUDIO", "FRAME_CREDIT", "FRAME_MODES"):
+        assert getattr(local_mux, name) == getattr(protocol_contract, name)
+    frame = local_mux.encode_frame(local_mux.FRAME_AUDIO, "call-1", b"\x01\x02", mode="stt", rate=16000, seq=7)
+    assert frame == protocol_contract.encode_frame(
+        protocol_contract.FRAME_AUDIO, "call-1", b"\x01\x02", mode="stt", rate=16000, seq=7
+    )
+    assert len(frame) == protocol_contract.FRAME_HEADER.size + len("call-1") + 2
+    assert tuple(protocol_contract.decode_frame(frame)) == (1, "call-1", "stt", 16000, 7, b"\x01\x02")
+    for bad in (b"LA", b"XX" + frame[2:], frame[:2] + b"\x09" + frame[3:], frame[:14]):
+        with pytest.raises(ValueError):
+            local_mux.decode_frame(bad)
+
+
+class _StubSTT:
+    """Emits one final transcript per audio chunk; calls listed in ``blocked`` wait for ``release``."""
+
+    def __init__(self):
+        self.chunks = []
+        self.blocked = set()
+        self.release = asyncio.Event()
+
+    async def __call__(self, session, audio_bytes, input_rate):
+        if session.call_id in self.blocked:
+            await self.release.wait()
+        self.chunks.append((session.call_id, audio_bytes[:1], len(audio_bytes), input_rate))
+        return [{"is_final": True, "text": f"{session.call_id} {len(self.chunks)}"}]
+
+
+def _server(window=4):
+    server = LocalAIServer()
+    server.config = replace(server.config, ws_mux_window=window)
+    server.stt_backend = "stub"
+    server._stt_is_available = lambda: True
+    server._process_stt_stream = _StubSTT()
+    return server
+
+
+async def _finals(channel, count, timeout=2.0):
+    texts = []
+    while len(texts) < count:
+        message = json.loads(await asyncio.wait_for(channel.recv(), timeout))
+        if message.get("type") == "stt_result" and message.get("is_final"):
+            assert message["call_id"] == channel.call_id
+            texts.append(message["text"])
+    return texts
+
+
+@pytest.mark.asyncio
+async def test_calls_share_connections_and_keep_their_own_results():
+    server = _server()
+    async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+        pool = local_mux.LocalAIMuxPool(f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}", size=2)
+        channels = [await pool.open_channel(f"call-{i}", "stt") for i in range(5)]
+        try:
+            assert pool.stats() == {"connections": 2, "calls": 5}
+            for n in range(3):
+                for i, channel in enumerate(channels):
+                    await channel.send_audio(bytes([i * 10 + n]) * 320, 16000)
+            for channel in channels:
+                assert len(await _finals(channel, 3)) == 3
+            stub = server._process_stt_stream
+            for i in range(5):
+                # Per-call order survives the shared socket; the raw PCM arrives as sent.
+                assert [c[1:] for c in stub.chunks if c[0] == f"call-{i}"] == [
+                    (bytes([i * 10 + n]), 320, 16000) for n in range(3)
+                ]
+        finally:
+            await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_call_waits_for_credit_without_stalling_others():
+    server = _server(window=4)
+    stub = server._process_stt_stream
+    stub.blocked.add("slow")
+    async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+        pool = local_mux.LocalAIMuxPool(f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}", size=1)
+        slow = await pool.open_channel("slow", "stt")
+        fast = await pool.open_channel("fast", "stt")
+        try:
+            for _ in range(4):
+                await slow.send_audio(b"\x00" * 320)
+            assert slow.credits == 0
+            blocked_send = asyncio.create_task(slow.send_audio(b"\x00" * 320))
+            await asyncio.sleep(0.05)
+            assert not blocked_send.done()
+
+            for _ in range(6):
+                await fast.send_audio(b"\x01" * 320)
+            assert len(await _finals(fast, 6)) == 6
+
+            stub.release.set()
+            await asyncio.wait_for(blocked_send, 2.0)
+            assert len(await _finals(slow, 5)) == 5
+        finally:
+            await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_server_without_binary_transport_is_rejected():
+    async def old_server(websocket):
+        async for _ in websocket:
+            pass  # ignores the unknown "transport" request
+
+    async with serve(old_server, "127.0.0.1", 0) as ws_server:
+        url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+        with pytest.raises(RuntimeError, match="binary transport"):
+            await local_mux.LocalAIMuxConnection.open(url, connect_timeout=0.2)
+
+
+@pytest.mark.asyncio
+async def test_local_provider_streams_over_binary_transport():
+    server = _server()
+    events = []
+
+    async def on_event(event):
+        events.append(event)
+
+    async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        config = LocalProviderConfig(ws_url=f"ws://127.0.0.1:{port}", transport="binary", mode="stt", chunk_ms=5)
+        provider = LocalProvider(config, on_event)
+        await provider.start_session("call-7")
+        try:
+            assert isinstance(provider.websocket, local_mux.LocalAIMuxChannel)
+            await provider.send_audio(b"\xff" * 160)  # 20 ms of μ-law silence
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 2.0
+            while not any(e.get("type") == "transcript" for e in events):
+                assert loop.time() < deadline, "no transcript"
+                await asyncio.sleep(0.01)
+            assert [e["call_id"] for e in events if e.get("type") == "transcript"] == ["call-7"]
+            # μ-law 8 kHz in, PCM16 16 kHz framed out.
+            _, _, size, rate = server._process_stt_stream.chunks[0]
+            assert rate == 16000 and size >= 600
+        finally:
+            await provider.stop_session()
+        assert provider.websocket.state.name == "CLOSED"
+        await local_mux.close_local_mux_pools()
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from src.ari_client import ARIClient
+from src.ari_dispatcher import ARIEventDispatcher, event_key
+
+CALL_EVENTS = ("StasisStart", "ChannelVarset", "ChannelStateChange", "StasisEnd", "ChannelDestroyed")
+
+
+def _event(event_type: str, channel_id: str, seq: int) -> dict:
+    return {"type": event_type, "channel": {"id": channel_id}, "seq": seq}
+
+
+def test_event_key_prefers_channel_then_other_resources():
+    assert event_key({"type": "StasisStart", "channel": {"id": "c1"}}) == "channel:c1"
+    assert event_key({"type": "ChannelEnteredBridge", "channel": {"id": "c1"}, "bridge": {"id": "b1"}}) == "channel:c1"
+    assert event_key({"type": "BridgeDestroyed", "bridge": {"id": "b1"}}) == "bridge:b1"
+    assert event_key({"type": "PlaybackFinished", "playback": {"id": "p1", "target_uri": "channel:c1"}}) == "playback:p1"
+    assert event_key({"type": "ApplicationReplaced"}) == "global"
+    assert event_key({"type": "ChannelDtmfReceived", "channel": {"id": "c1"}, "digit": "1"}) == "dtmf:c1"
+
+
+@pytest.mark.asyncio
+async def test_call_storm_keeps_per_channel_order_with_bounded_queue():
+    dispatcher = ARIEventDispatcher(workers=8, max_pending=64)
+    rng = random.Random(3)
+    seen = {}
+    running = set()
+    max_running = 0
+
+    async def handler(event):
+        nonlocal max_running
+        cid = event["channel"]["id"]
+        assert cid not in running  # never two handlers for one channel at once
+        running.add(cid)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(rng.uniform(0, 0.003))
+        seen.setdefault(cid, []).append(event["seq"])
+        running.discard(cid)
+
+    # Interleave 200 calls' lifecycles the way a storm arrives on the socket
+    pending = {f"ch-{i}": 0 for i in range(200)}
+    while pending:
+        cid = rng.choice(list(pending))
+        seq = pending[cid]
+        await dispatcher.submit(_event(CALL_EVENTS[seq], cid, seq), [handler])
+        assert dispatcher.pending <= 64
+        if seq + 1 == len(CALL_EVENTS):
+            del pending[cid]
+        else:
+            pending[cid] = seq + 1
+
+    while dispatcher.pending:
+        await asyncio.sleep(0.01)
+    await dispatcher.close()
+
+    assert len(seen) == 200
+    assert all(seqs == list(range(len(CALL_EVENTS))) for seqs in seen.values())
+    assert 1 < max_running <= 8
+    assert dispatcher.high_water <= 64
+    assert dispatcher.backpressure_waits > 0
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_releases_lane_after_hold_timeout():
+    dispatcher = ARIEventDispatcher(workers=2, hold_timeout=0.05)
+    order = []
+    release = asyncio.Event()
+
+    async def waits_for_later_event(event):
+        order.append(("start", event["seq"]))
+        await release.wait()
+        order.append(("end", event["seq"]))
+
+    async def releases(event):
+        order.append(("run", event["seq"]))
+        release.set()
+
+    await dispatcher.submit(_event("StasisStart", "c1", 0), [waits_for_later_event])
+    await dispatcher.submit(_event("PlaybackFinished", "c1", 1), [releases])
+    await asyncio.wait_for(release.wait(), timeout=1.0)
+    await asyncio.sleep(0.01)
+    assert order == [("start", 0), ("run", 1), ("end", 0)]
+    assert dispatcher.lane_releases == 1
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_handler_waiting_for_dtmf_on_its_own_channel_gets_the_digit():
+    # Attended transfer: the agent channel's StasisStart handler waits for the
+    # agent's accept digit, which arrives on that same channel.
+    dispatcher = ARIEventDispatcher(workers=4, hold_timeout=5.0)
+    digit = asyncio.get_running_loop().create_future()
+    digits = []
+
+    async def attended_transfer(event):
+        return await asyncio.wait_for(asyncio.shield(digit), timeout=1.0)
+
+    async def dtmf(event):
+        digits.append(event["digit"])
+        if not digit.done():
+            digit.set_result(event["digit"])
+
+    started = asyncio.get_running_loop().time()
+    await dispatcher.submit(_event("StasisStart", "agent", 0), [attended_transfer])
+    for seq, d in enumerate("12", start=1):
+        await dispatcher.submit({**_event("ChannelDtmfReceived", "agent", seq), "digit": d}, [dtmf])
+    assert await asyncio.wait_for(digit, timeout=1.0) == "1"
+    while dispatcher.pending:
+        await asyncio.sleep(0.01)
+
+    assert asyncio.get_running_loop().time() - started < 0.5
+    assert digits == ["1", "2"]
+    assert dispatcher.lane_releases == 0
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_are_logged_and_lane_continues():
+    dispatcher = ARIEventDispatcher(workers=1)
+    seen = []
+
+    async def boom(event):
+        raise RuntimeError("handler bug")
+
+    async def record(event):
+        seen.append(event["seq"])
+
+    await dispatcher.submit(_event("StasisStart", "c1", 0), [boom, record])
+    await dispatcher.submit(_event("StasisEnd", "c1", 1), [record])
+    while dispatcher.pending:
+        await asyncio.sleep(0.01)
+    assert seen == [0, 1]
+    assert dispatcher.handler_errors == 1
+    await dispatcher.close()
+
+
+class _FakeWebSocket:
+    def __init__(self, client, messages):
+        self._client = client
+        self._messages = messages
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for message in self._messages:
+            yield message
+        self._client._should_reconnect = False
+        from websockets.exceptions import ConnectionClosed
+        raise ConnectionClosed(None, None)
+
+
+@pytest.mark.asyncio
+async def test_listener_routes_events_through_dispatcher_in_order():
+    client = ARIClient("u", "p", "http://127.0.0.1:8088/ari", "app")
+    seen = []
+
+    async def record(event):
+        await asyncio.sleep(0.001 if event["type"] == "StasisStart" else 0)
+        seen.append(event["type"])
+
+    client.add_event_handler("StasisStart", record)
+    client.add_event_handler("ChannelDestroyed", record)
+    messages = [
+        json.dumps(_event("StasisStart", "c1", 0)),
+        "not json",
+        json.dumps(_event("ChannelDestroyed", "c1", 1)),
+    ]
+    client.websocket = _FakeWebSocket(client, messages)
+    client.running = True
+    await client._listen_with_reconnect()
+    while client.dispatcher.pending:
+        await asyncio.sleep(0.01)
+    assert seen == ["StasisStart", "ChannelDestroyed"]
+    await client.dispatcher.close()
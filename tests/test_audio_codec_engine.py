@@ -0,0 +1,184 @@
+import math
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.audio import (
+    AudioopCodecEngine,
+    NumpyCodecEngine,
+    Pcm16kInputStage,
+    PolyphaseResampler,
+    create_codec_engine,
+    resample_audio,
+    set_codec_engine,
+)
+
+try:
+    import audioop
+except ImportError:  # pragma: no cover - Python 3.13+
+    audioop = None
+
+
+def _tone(rate: int, seconds: float = 0.5, freq: float = 440.0, amp: int = 12000) -> bytes:
+    n = int(rate * seconds)
+    return struct.pack(
+        f"<{n}h", *(int(amp * math.sin(2 * math.pi * freq * i / rate)) for i in range(n))
+    )
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return NumpyCodecEngine()
+
+
+@pytest.mark.skipif(audioop is None, reason="audioop not available")
+def test_g711_tables_match_audioop_exactly(engine):
+    every_sample = np.arange(65536, dtype=np.uint16).astype("<u2").tobytes()
+    every_byte = bytes(range(256))
+    assert engine.ulaw_encode(every_sample) == audioop.lin2ulaw(every_sample, 2)
+    assert engine.alaw_encode(every_sample) == audioop.lin2alaw(every_sample, 2)
+    assert engine.ulaw_decode(every_byte) == audioop.ulaw2lin(every_byte, 2)
+    assert engine.alaw_decode(every_byte) == audioop.alaw2lin(every_byte, 2)
+
+
+@pytest.mark.parametrize("src,dst", [(8000, 16000), (16000, 8000), (24000, 8000), (8000, 24000), (44100, 16000)])
+def test_resampler_chunking_matches_continuous(src, dst):
+    pcm = _tone(src)
+    whole = PolyphaseResampler(src, dst).process(pcm)
+
+    chunked = PolyphaseResampler(src, dst)
+    pieces = [chunked.process(pcm[i:i + 322]) for i in range(0, len(pcm), 322)]
+
+    assert b"".join(pieces) == whole
+    assert abs(len(whole) // 2 - len(pcm) // 2 * dst / src) <= 1
+
+
+def test_resampler_preserves_tone_level():
+    out = np.frombuffer(PolyphaseResampler(8000, 16000).process(_tone(8000)), dtype="<i2")
+    settled = out[200:]
+    assert abs(int(settled.max()) - 12000) < 300
+    assert abs(float(settled.mean())) < 50
+
+
+def test_batch_apis_match_per_stream_results(engine):
+    frames = [_tone(8000, 0.02, freq=300 + 50 * i) for i in range(6)]
+    ulaw = [engine.ulaw_encode(f) for f in frames]
+
+    assert engine.encode_batch(frames) == ulaw
+    assert engine.decode_batch(ulaw) == [engine.ulaw_decode(u) for u in ulaw]
+
+    batched = [engine.create_resampler(8000, 16000) for _ in frames]
+    single = [engine.create_resampler(8000, 16000) for _ in frames]
+    for _ in range(3):
+        assert engine.resample_batch(batched, frames) == [r.process(f) for r, f in zip(single, frames)]
+
+
+@pytest.fixture
+def numpy_engine_active():
+    set_codec_engine("numpy")
+    yield
+    set_codec_engine(None)
+
+
+def test_resample_audio_replaces_mismatched_state(numpy_engine_active):
+    pcm = _tone(8000, 0.02)
+    out, state = resample_audio(pcm, 8000, 16000)
+    assert isinstance(state, PolyphaseResampler)
+    assert len(out) == 2 * len(pcm)
+    assert state.matches(8000, 16000)
+
+    out2, state2 = resample_audio(pcm, 8000, 24000, state=state)
+    assert state2 is not state
+    assert len(out2) == 3 * len(pcm)
+
+
+def _stage_engines():
+    engines = [NumpyCodecEngine]
+    if audioop is not None:
+        engines.append(AudioopCodecEngine)
+    return engines
+
+
+@pytest.mark.parametrize("engine_cls", _stage_engines())
+def test_input_stage_batches_match_continuous_conversion(engine_cls):
+    codec = engine_cls()
+    ulaw = codec.ulaw_encode(_tone(8000))
+    continuous = codec.create_resampler(8000, 16000).process(codec.ulaw_decode(ulaw))
+
+    stage = Pcm16kInputStage(codec)
+    frames = [ulaw[i:i + 160] for i in range(0, len(ulaw), 160)]
+    # Uneven coalesced batches, as the provider send loop produces them.
+    batches, pos = [], 0
+    for size in (1, 3, 2, 5, 1, 4):
+        batches.append(frames[pos:pos + size])
+        pos += size
+    batches.append(frames[pos:])
+    assert b"".join(stage.convert(batch, "ulaw") for batch in batches) == continuous
+
+    stage.reset()
+    assert stage.convert(ulaw, "ulaw") == continuous
+
+
+@pytest.mark.parametrize("engine_cls", _stage_engines())
+def test_input_stage_carries_odd_pcm_bytes(engine_cls):
+    codec = engine_cls()
+    pcm = _tone(8000, 0.1)
+    continuous = codec.create_resampler(8000, 16000).process(pcm)
+
+    stage = Pcm16kInputStage(codec)
+    pieces = [stage.convert(pcm[i:i + 161], "pcm16_8k") for i in range(0, len(pcm), 161)]
+    assert b"".join(pieces) == continuous
+
+    passthrough = Pcm16kInputStage(codec)
+    assert passthrough.convert([pcm[:3], pcm[3:]], "pcm16_16k") == pcm
+    with pytest.raises(ValueError):
+        passthrough.convert(pcm, "alaw")
+
+
+def test_unknown_engine_name_rejected():
+    with pytest.raises(ValueError):
+        create_codec_engine("bogus")
+
+
+@pytest.mark.skipif(audioop is None, reason="audioop not available")
+def test_pcm_ops_numpy_path_matches_audioop(monkeypatch):
+    from src.audio import pcm_ops
+
+    data = _tone(8000, 0.1, amp=30000) + struct.pack("<3h", -32768, 32767, -1)
+    stereo = data[: len(data) - len(data) % 4]
+    expected = {
+        "rms": audioop.rms(data, 2),
+        "avg": audioop.avg(data, 2),
+        "peak": audioop.max(data, 2),
+        "bias": audioop.bias(data, 2, -1234),
+        "mul": audioop.mul(data, 2, 1.7),
+        "byteswap": audioop.byteswap(data, 2),
+        "tomono": audioop.tomono(stereo, 2, 0.5, 0.5),
+    }
+    monkeypatch.setattr(pcm_ops, "audioop", None)
+    assert {
+        "rms": pcm_ops.rms(data),
+        "avg": pcm_ops.avg(data),
+        "peak": pcm_ops.peak(data),
+        "bias": pcm_ops.bias(data, -1234),
+        "mul": pcm_ops.mul(data, 1.7),
+        "byteswap": pcm_ops.byteswap(data),
+        "tomono": pcm_ops.tomono(stereo, 0.5, 0.5),
+    } == expected
+
+
+def test_resampler_plan_cache_is_capped_by_bytes(monkeypatch):
+    from src.audio import codec_engine
+
+    monkeypatch.setattr(codec_engine, "_PLAN_CACHE", {})
+    monkeypatch.setattr(codec_engine, "_plan_cache_bytes", 0)
+    monkeypatch.setattr(codec_engine, "_PLAN_CACHE_MAX_BYTES", 1 << 20)
+    resampler = PolyphaseResampler(8000, 16000)
+    for n in range(160, 4000, 40):
+        resampler.reset()
+        resampler.process(b"\x00\x00" * n)
+
+    cached = sum(plan.nbytes for plan in codec_engine._PLAN_CACHE.values())
+    assert cached == codec_engine._plan_cache_bytes <= 1 << 20
@@ -0,0 +1,106 @@
+import array
+import math
+
+from prometheus_client import REGISTRY
+
+from src.core.audio_health import AudioHealthMonitor, StageWindow, measure_pcm16, percentile
+from src.core.models import CallSession
+from src.core.session_store import SessionStore
+
+
+def _tone(amplitude: int, samples: int = 160, dc: int = 0) -> bytes:
+    return array.array(
+        "h",
+        (max(-32768, min(32767, int(amplitude * math.sin(2 * math.pi * i / 20)) + dc)) for i in range(samples)),
+    ).tobytes()
+
+
+def _session(call_id: str) -> CallSession:
+    return CallSession(call_id=call_id, caller_channel_id=call_id, provider_name="pipeline")
+
+
+def test_measure_pcm16_counts_clipping_only_near_full_scale():
+    rms, dc, clipped = measure_pcm16(_tone(1000), clip_level=32000)
+    assert 650 < rms < 760 and abs(dc) < 5 and clipped == 0
+
+    loud = _tone(40000)  # saturates at the int16 rails
+    _, _, clipped = measure_pcm16(loud, clip_level=32000)
+    assert clipped > 0
+
+    _, dc, _ = measure_pcm16(_tone(500, dc=700), clip_level=32000)
+    assert 690 <= dc <= 710
+
+
+def test_monitor_samples_one_in_n_frames_into_session_window():
+    monitor = AudioHealthMonitor(sample_every=5, window=8)
+    session = _session("c1")
+    measured = 0
+    for _ in range(50):
+        win = monitor.sample(session, "transport_in")
+        if win is not None:
+            monitor.record(win, _tone(1000))
+            measured += 1
+    win = session.audio_health.stages["transport_in"]
+    assert measured == 10
+    assert win.frames_seen == 50 and win.frames_sampled == 10
+    assert win.count == 8  # ring keeps only the window
+
+
+def test_window_ring_overwrites_oldest_and_reports_percentiles():
+    win = StageWindow(4)
+    for rms in (10, 20, 30, 40, 1000, 1000):
+        win.add(rms, 0, 0, 160, rms < 200)
+    summary = win.summary()
+    assert summary["window"] == 4
+    assert summary["rms_p50"] in (40.0, 1000.0)
+    assert summary["rms_p05"] == 30.0
+    assert summary["silence_ratio"] == 0.5  # 30, 40 silent; 1000, 1000 not
+    assert summary["silent_frames"] == 4  # lifetime count
+    assert percentile([], 0.5) == 0.0
+
+
+def test_export_publishes_cross_call_quantiles_without_call_labels():
+    monitor = AudioHealthMonitor(sample_every=1, window=16)
+    quiet, loud = _session("quiet"), _session("loud")
+    for _ in range(16):
+        monitor.record(monitor.sample(quiet, "provider_in"), _tone(100))
+        monitor.record(monitor.sample(loud, "provider_in"), _tone(3000))
+    medians = monitor.export([quiet, loud])
+    assert 0 < medians["provider_in"]["rms"] < 2200
+
+    value = REGISTRY.get_sample_value("ai_agent_audio_health_calls", {"stage": "provider_in"})
+    assert value == 2
+    p95 = REGISTRY.get_sample_value("ai_agent_audio_health_rms", {"stage": "provider_in", "quantile": "0.95"})
+    assert p95 > 2000
+    silence = REGISTRY.get_sample_value("ai_agent_audio_health_silence_ratio", {"stage": "provider_in", "quantile": "0.05"})
+    assert silence == 0.0
+
+    # Stages disappear once their calls are gone
+    monitor.export([])
+    assert REGISTRY.get_sample_value("ai_agent_audio_health_calls", {"stage": "provider_in"}) is None
+
+
+def test_dc_offset_median_keeps_its_sign():
+    monitor = AudioHealthMonitor(sample_every=1, window=8)
+    low, high = _session("low"), _session("high")
+    for _ in range(8):
+        monitor.record(monitor.sample(low, "transport_in"), _tone(500, dc=-900))
+        monitor.record(monitor.sample(high, "transport_in"), _tone(500, dc=-300))
+    medians = monitor.export([low, high])
+    assert -910 <= medians["transport_in"]["dc_offset"] <= -290
+    assert low.audio_health.summary()["transport_in"]["dc_p50"] < -800
+    assert low.audio_health.summary()["transport_in"]["dc_abs_p50"] > 800
+    p95 = REGISTRY.get_sample_value("ai_agent_audio_health_dc_offset_abs", {"stage": "transport_in", "quantile": "0.95"})
+    assert p95 > 800
+
+
+async def test_session_stats_include_audio_health_summary():
+    store = SessionStore()
+    monitor = AudioHealthMonitor(sample_every=1, window=4)
+    session = _session("c1")
+    await store.upsert_call(session)
+    monitor.record(monitor.sample(session, "transport_in"), _tone(1000))
+    stats = await store.get_session_stats()
+    health = stats["sessions"][0]["audio_health"]
+    assert set(health) == {"transport_in"}
+    assert health["transport_in"]["sampled"] == 1
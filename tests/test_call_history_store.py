@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime, timedelta, timezone
 
@@ -78,3 +79,214 @@ async def test_call_history_list_count_filter_parity(tmp_path, monkeypatch):
     assert listed[0].call_id == "call-1"
 
 
+
+
+@pytest.mark.asyncio
+async def test_call_history_audio_health_roundtrip_and_migration(tmp_path, monkeypatch):
+    import sqlite3
+
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    db_path = str(tmp_path / "call_history.db")
+
+    # Database created before the audio_health column existed
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE call_records (id TEXT PRIMARY KEY, call_id TEXT NOT NULL, caller_number TEXT, "
+        "caller_name TEXT, start_time TEXT NOT NULL, end_time TEXT NOT NULL, duration_seconds REAL, "
+        "provider_name TEXT, pipeline_name TEXT, pipeline_components TEXT, context_name TEXT, "
+        "conversation_history TEXT, outcome TEXT, transfer_destination TEXT, error_message TEXT, "
+        "tool_calls TEXT, avg_turn_latency_ms REAL, max_turn_latency_ms REAL, total_turns INTEGER, "
+        "caller_audio_format TEXT, codec_alignment_ok INTEGER, barge_in_count INTEGER, "
+        "created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO call_records (id, call_id, start_time, end_time) VALUES ('old', 'call-old', ?, ?)",
+        ("2026-01-01T00:00:00+00:00", "2026-01-01T00:00:05+00:00"),
+    )
+    conn.commit()
+    conn.close()
+
+    from src.core.call_history import CallHistoryStore, CallRecord
+
+    store = CallHistoryStore(db_path=db_path)
+    now = datetime.now(timezone.utc)
+    health = {"transport_in": {"rms_p50": 812.0, "silence_ratio": 0.25, "clipped_samples": 0}}
+    assert await store.save(CallRecord(call_id="call-new", start_time=now, end_time=now, audio_health=health))
+
+    saved = await store.get_by_call_id("call-new")
+    assert saved.audio_health == health
+    old = await store.get_by_call_id("call-old")
+    assert old.audio_health == {}
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batches_writes_and_dedupes_by_call_id(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    monkeypatch.setenv("CALL_HISTORY_WRITE_BATCH_MS", "5000")
+    monkeypatch.setenv("CALL_HISTORY_WRITE_BATCH_MAX", "3")
+
+    from src.core.call_history import CallHistoryStore, CallRecord
+
+    store = CallHistoryStore(db_path=str(tmp_path / "call_history.db"))
+    now = datetime.now(timezone.utc)
+    existing = CallRecord(call_id="call-0", start_time=now, end_time=now)
+    assert await store.save(existing)
+
+    records = [CallRecord(call_id=f"call-{i}", start_time=now, end_time=now) for i in range(4)]
+    futures = [store.enqueue(r) for r in records]
+
+    # The batch-size threshold (3) flushes well before the 5 s linger.
+    first = await asyncio.wait_for(asyncio.gather(*futures[:3]), timeout=2.0)
+    assert first == [existing.id, records[1].id, records[2].id]
+    assert not futures[3].done()
+    assert await store.get_by_call_id("call-3") is None
+
+    # close() drains the remainder without waiting out the interval.
+    await asyncio.wait_for(store.close(), timeout=2.0)
+    assert futures[3].result() == records[3].id
+    assert await store.count() == 4
+    assert (await store.get_by_call_id("call-0")).id == existing.id
+
+
+@pytest.mark.asyncio
+async def test_bad_record_does_not_drop_the_rest_of_its_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    monkeypatch.setenv("CALL_HISTORY_WRITE_BATCH_MAX", "4")
+
+    from src.core.call_history import CallHistoryStore, CallRecord
+
+    store = CallHistoryStore(db_path=str(tmp_path / "call_history.db"))
+    now = datetime.now(timezone.utc)
+    existing = CallRecord(call_id="call-0", start_time=now, end_time=now)
+    assert await store.save(existing)
+
+    good = CallRecord(call_id="call-1", start_time=now, end_time=now)
+    unserializable = CallRecord(call_id="call-2", start_time=now, end_time=now, tool_calls=[object()])
+    # Serializes fine but fails inside executemany (NOT NULL call_id).
+    unbindable = CallRecord(call_id=None, start_time=now, end_time=now)
+    also_good = CallRecord(call_id="call-4", start_time=now, end_time=now)
+    futures = [store.enqueue(r) for r in (good, unserializable, unbindable, also_good)]
+
+    ids = await asyncio.wait_for(asyncio.gather(*futures), timeout=2.0)
+    assert ids == [good.id, None, None, also_good.id]
+    await store.close()
+    assert await store.count() == 3
+    assert (await store.get_by_call_id("call-4")).id == also_good.id
+
+
+@pytest.mark.asyncio
+async def test_enqueue_on_disabled_store_resolves_none(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "false")
+
+    from src.core.call_history import CallHistoryStore, CallRecord
+
+    store = CallHistoryStore(db_path=str(tmp_path / "call_history.db"))
+    assert await store.enqueue(CallRecord(call_id="x")) is None
+    await store.close()
+
+
+def _stats_records(now):
+    import random
+
+    from src.core.call_history import CallRecord
+
+    rng = random.Random(7)
+    records = []
+    for i in range(120):
+        start = now - timedelta(minutes=rng.randint(0, 60 * 24 * 4))
+        duration = round(rng.uniform(1, 300), 2)
+        records.append(CallRecord(
+            call_id=f"call-{i}",
+            caller_number=f"100{rng.randint(0, 6)}" if i % 9 else None,
+            start_time=start,
+            end_time=start + timedelta(seconds=duration),
+            duration_seconds=duration,
+            provider_name=rng.choice(["openai_realtime", "deepgram", "local"]),
+            pipeline_name=rng.choice([None, "local_hybrid"]),
+            context_name=rng.choice([None, "demo", "sales"]),
+            outcome=rng.choice(["completed", "transferred", "abandoned", "error"]),
+            tool_calls=[{"name": rng.choice(["transfer_call", "hangup_call", "crm_lookup"])}
+                        for _ in range(rng.randint(0, 2))],
+            avg_turn_latency_ms=round(rng.uniform(100, 900), 1),
+            total_turns=rng.randint(0, 12),
+            barge_in_count=rng.randint(0, 3),
+        ))
+    return records
+
+
+def _comparable(stats):
+    # Sums are accumulated in a different order, so the rounded floats may differ in the last digit.
+    stats = {k: pytest.approx(v, abs=0.011) if isinstance(v, float) else v for k, v in stats.items()}
+    stats["top_callers"] = sorted((c["number"], c["count"]) for c in stats["top_callers"])
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_stats_from_rollups_match_full_scan(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    from src.core.call_history import CallHistoryStore
+
+    store = CallHistoryStore(db_path=str(tmp_path / "call_history.db"))
+    now = datetime(2026, 3, 14, 15, 27, 11, tzinfo=timezone.utc)
+    records = _stats_records(now)
+    for record in records[:60]:
+        assert await store.save(record)
+    for record in records[60:]:
+        store.enqueue(record)
+    await store.flush()
+
+    conn = store._get_connection()
+    ranges = [
+        (None, None),
+        (now - timedelta(days=2, minutes=13), None),
+        (None, now - timedelta(hours=30, seconds=5)),
+        (now - timedelta(days=3, hours=2, minutes=1), now - timedelta(hours=5, minutes=44)),
+        (now - timedelta(minutes=50), now - timedelta(minutes=10)),
+        (now - timedelta(days=1), now - timedelta(hours=1)),
+    ]
+    try:
+        for start, end in ranges:
+            fast = store._stats_from_rollups_sync(conn, start, end)
+            full = store._stats_from_records_sync(conn.cursor(), start, end)
+            assert _comparable(fast) == _comparable(full), (start, end)
+        assert fast["total_calls"] > 0
+    finally:
+        conn.close()
+
+    # Deletes keep rollups exact (MIN/MAX are recomputed for the affected days).
+    victim = max(records, key=lambda r: r.duration_seconds)
+    assert await store.delete(victim.id)
+    assert await store.delete_before(now - timedelta(days=2, hours=7)) > 0
+    assert _comparable(await store.get_stats()) == _comparable(
+        store._stats_from_records_sync(store._get_connection().cursor(), None, None)
+    )
+
+
+@pytest.mark.asyncio
+async def test_existing_database_uses_scan_until_rollups_rebuilt(tmp_path, monkeypatch):
+    import sqlite3
+
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    from src.core.call_history import CallHistoryStore
+
+    db_path = str(tmp_path / "call_history.db")
+    store = CallHistoryStore(db_path=db_path)
+    now = datetime(2026, 3, 14, 15, 27, 11, tzinfo=timezone.utc)
+    for record in _stats_records(now)[:40]:
+        assert await store.save(record)
+    expected = _comparable(await store.get_stats())
+
+    # Simulate a database created before the rollup tables existed.
+    conn = sqlite3.connect(db_path)
+    for table in ("call_stats_hourly", "call_stats_daily", "call_stats_daily_callers", "call_tool_usage", "call_stats_meta"):
+        conn.execute(f"DROP TABLE {table}")
+    conn.commit()
+    conn.close()
+
+    legacy = CallHistoryStore(db_path=db_path)
+    assert legacy._rollups_ready is False
+    assert _comparable(await legacy.get_stats()) == expected
+
+    assert await legacy.rebuild_rollups() == 40
+    assert legacy._rollups_ready is True
+    assert _comparable(await legacy.get_stats()) == expected
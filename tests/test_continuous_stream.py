@@ -1,7 +1,7 @@
-import asyncio
 import math
 import pytest
 
+from src.audio.frame_ring import FrameRingBuffer
 from src.core.streaming_playback_manager import StreamingPlaybackManager
 
 
@@ -45,7 +45,7 @@ def test_continuous_stream_skips_warmup_for_non_first_segment():
         'segments_played': 1,
         'min_start_chunks': mgr.min_start_chunks,
     }
-    jitter = asyncio.Queue()
+    jitter = FrameRingBuffer(capacity=3200, frame_size=160)
 
     ready = mgr._ensure_startup_ready(call_id, stream_id, jitter, stream_info)
     assert ready is True
@@ -62,7 +62,7 @@ def test_first_segment_requires_min_start_when_empty():
         'segments_played': 0,
         'min_start_chunks': 4,
     }
-    jitter = asyncio.Queue()
+    jitter = FrameRingBuffer(capacity=3200, frame_size=160)
     # empty jitter buffer -> available_frames = 0 < 4
     ready = mgr._ensure_startup_ready(call_id, stream_id, jitter, stream_info)
     assert ready is False
@@ -0,0 +1,113 @@
+import math
+from array import array
+
+import pytest
+
+import src.audio.dsp_chain as dsp_chain
+from src.audio.dsp_chain import PlaybackDSPChain
+
+
+def _pcm(samples) -> bytes:
+    return array("h", (int(s) for s in samples)).tobytes()
+
+
+def _samples(pcm: bytes):
+    buf = array("h")
+    buf.frombytes(pcm)
+    return list(buf)
+
+
+def _sine(amplitude: float, n: int, rate: int = 8000, freq: float = 440.0, offset: float = 0.0):
+    return [offset + amplitude * math.sin(2 * math.pi * freq * i / rate) for i in range(n)]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(dsp_chain, "np", None)
+    elif dsp_chain.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+def test_disabled_chain_returns_input_object(backend):
+    pcm = _pcm(_sine(1000, 320))
+    assert PlaybackDSPChain(8000).process(pcm) is pcm
+    # Normalizer gain within 1% is skipped too
+    assert PlaybackDSPChain(8000, target_rms=1).process(pcm) is pcm
+
+
+def test_trim_drops_leading_silent_frames(backend):
+    silence = [0] * 480  # three 20 ms frames at 8 kHz
+    tone = _sine(3000, 320)
+    chain = PlaybackDSPChain(8000, trim_threshold_rms=100)
+    out = _samples(chain.process(_pcm(silence + tone)))
+    assert len(out) == 320
+    assert chain.trimmed_samples == 480
+    # All-silent chunks are left alone
+    quiet = _pcm([5] * 480)
+    assert chain.process(quiet) is quiet
+
+
+def test_attack_envelope_ramps_across_chunks(backend):
+    chain = PlaybackDSPChain(8000, attack_ms=20)  # 160 samples
+    flat = _pcm([10000] * 100)
+    first = _samples(chain.process(flat))
+    second = _samples(chain.process(flat))
+    assert first[0] == 0
+    assert first[50] == 3125  # 10000 * 50/160
+    assert second[0] == 6250  # ramp continues where it left off
+    assert second[59] == round(10000 * 159 / 160)
+    assert second[60:] == [10000] * 40
+    assert chain.attack_remaining == 0
+    assert chain.process(flat) is flat
+    chain.restart_attack()
+    assert _samples(chain.process(flat))[0] == 0
+
+
+def test_dc_removal_and_normalizer_match_reference(backend):
+    chain = PlaybackDSPChain(8000, dc_threshold=256, target_rms=2000, max_gain_db=20.0)
+    out = _samples(chain.process(_pcm(_sine(500, 800, offset=600))))
+    mean = sum(out) / len(out)
+    rms = math.sqrt(sum(s * s for s in out) / len(out))
+    assert abs(mean) < 10
+    assert rms == pytest.approx(2000, rel=0.02)
+    assert chain.dc_corrections == 1
+    assert abs(chain.last_dc - 600) <= 2
+
+
+def test_dc_block_state_carries_across_chunks(backend):
+    signal = _sine(2000, 4000, offset=3000)
+    whole = PlaybackDSPChain(8000, dc_block=True)
+    split = PlaybackDSPChain(8000, dc_block=True)
+    expected = _samples(whole.process(_pcm(signal)))
+    got = []
+    for i in range(0, len(signal), 333):
+        got += _samples(split.process(_pcm(signal[i:i + 333])))
+    assert max(abs(a - b) for a, b in zip(expected, got)) <= 1
+    tail = expected[-800:]
+    assert abs(sum(tail) / len(tail)) < 100  # offset filtered out
+
+
+def test_soft_limiter_bends_peaks_below_full_scale(backend):
+    chain = PlaybackDSPChain(8000, target_rms=20000, max_gain_db=20.0, limiter=True, limiter_headroom=0.65)
+    out = _samples(chain.process(_pcm(_sine(8000, 800))))
+    knee = 0.65 * 32767
+    assert max(abs(s) for s in out) < 32767
+    assert max(out) > knee
+    assert chain.limited_samples > 0
+
+
+def test_numpy_and_python_backends_agree(monkeypatch):
+    if dsp_chain.np is None:
+        pytest.skip("numpy not installed")
+    cfg = dict(trim_threshold_rms=100, dc_threshold=256, dc_block=True, attack_ms=10, target_rms=1400, limiter=True)
+    chunks = [_pcm([0] * 160 + _sine(900, 640, offset=400)), _pcm(_sine(12000, 500))]
+    fast = PlaybackDSPChain(8000, **cfg)
+    expected = [_samples(fast.process(c)) for c in chunks]
+    monkeypatch.setattr(dsp_chain, "np", None)
+    slow = PlaybackDSPChain(8000, **cfg)
+    got = [_samples(slow.process(c)) for c in chunks]
+    for e, g in zip(expected, got):
+        assert len(e) == len(g)
+        assert max(abs(a - b) for a, b in zip(e, g)) <= 1
@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.frame_clock import FrameClock
+from src.core.models import CallSession
+from src.core.session_store import SessionStore
+from src.core.streaming_playback_manager import StreamingPlaybackManager
+
+
+@pytest.mark.asyncio
+async def test_one_pass_steps_every_registered_entry():
+    clock = FrameClock(tick_ms=5)
+    seen = []
+
+    def make_step(name, limit):
+        count = {"n": 0}
+
+        def step():
+            count["n"] += 1
+            seen.append((clock.ticks, name))
+            return count["n"] < limit
+
+        return step
+
+    a = clock.register(make_step("a", 3))
+    b = clock.register(make_step("b", 3))
+    await asyncio.wait_for(asyncio.gather(a, b), timeout=1.0)
+
+    # Both streams were stepped on the same ticks by the single clock task.
+    ticks_a = [t for t, n in seen if n == "a"]
+    ticks_b = [t for t, n in seen if n == "b"]
+    assert ticks_a == ticks_b == [1, 2, 3]
+    assert len(clock) == 0
+    await asyncio.sleep(0.02)
+    assert not clock.running
+
+
+@pytest.mark.asyncio
+async def test_periodic_entry_and_cancel_unregisters():
+    clock = FrameClock(tick_ms=5)
+    slow_ticks = []
+
+    def every_tick():
+        return True
+
+    def slow():
+        slow_ticks.append(clock.ticks)
+        return True
+
+    fast = clock.register(every_tick)
+    periodic = clock.register(slow, every=3)
+    await asyncio.sleep(0.06)
+    assert slow_ticks[:3] == [3, 6, 9]
+
+    fast.cancel()
+    periodic.cancel()
+    await asyncio.sleep(0.02)
+    assert len(clock) == 0
+    await clock.stop()
+
+
+@pytest.mark.asyncio
+async def test_overrun_resynchronises_without_burst():
+    clock = FrameClock(tick_ms=5)
+    stamps = []
+
+    def slow_step():
+        stamps.append(time.perf_counter())
+        time.sleep(0.012)  # blocks the pass past two ticks
+        return len(stamps) < 3
+
+    await asyncio.wait_for(clock.register(slow_step), timeout=1.0)
+    assert clock.overruns >= 2
+    assert clock.skipped_ticks >= 1
+    # No catch-up burst: consecutive steps stay at least one pass apart.
+    assert all(b - a >= 0.012 for a, b in zip(stamps, stamps[1:]))
+
+
+@pytest.mark.asyncio
+async def test_slow_work_runs_in_a_task_without_stalling_other_streams():
+    clock = FrameClock(tick_ms=5)
+    fast_ticks = []
+    fast_stamps = []
+    slow_runs = []
+    pending = []
+
+    def fast():
+        fast_ticks.append(clock.ticks)
+        fast_stamps.append(time.perf_counter())
+        return len(fast_ticks) < 20
+
+    async def fallback():
+        assert asyncio.current_task() is not clock._task
+        await asyncio.sleep(0.05)  # e.g. ARI/file I/O
+
+    def slow():
+        slow_runs.append(clock.ticks)
+        if pending and not pending[0].done():
+            return True
+        if not pending:
+            pending.append(asyncio.create_task(fallback()))
+            return True
+        return False
+
+    fast_done = clock.register(fast)
+    slow_done = clock.register(slow)
+    await asyncio.wait_for(asyncio.gather(fast_done, slow_done), timeout=1.0)
+
+    # The fast stream kept its cadence while the slow work ran in its own task.
+    assert fast_ticks == list(range(1, 21))
+    assert max(b - a for a, b in zip(fast_stamps, fast_stamps[1:])) < 0.04
+    await pending[0]
+
+
+def test_coroutine_steps_are_rejected():
+    clock = FrameClock(tick_ms=5)
+
+    async def step():
+        return True
+
+    with pytest.raises(TypeError):
+        clock.register(step)
+
+
+@pytest.mark.asyncio
+async def test_failing_step_is_unregistered():
+    clock = FrameClock(tick_ms=5)
+
+    def boom():
+        raise RuntimeError("boom")
+
+    fut = clock.register(boom)
+    await asyncio.wait_for(fut, timeout=1.0)
+    assert len(clock) == 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_playback_paced_by_shared_clock():
+    session_store = SessionStore()
+    sent = {}
+
+    class _RTP:
+        def send_audio_nowait(self, call_id, chunk, **kwargs):
+            sent.setdefault(call_id, []).append(chunk)
+            return True
+
+        def has_remote_endpoint(self, call_id):
+            return True
+
+    mgr = StreamingPlaybackManager(
+        session_store=session_store,
+        ari_client=object(),
+        conversation_coordinator=None,
+        streaming_config={"min_start_ms": 20, "provider_grace_ms": 0, "normalizer": {"enabled": False}},
+        audio_transport="externalmedia",
+        rtp_server=_RTP(),
+    )
+    queues = {}
+    for call_id in ("call-a", "call-b"):
+        session = CallSession(call_id=call_id, caller_channel_id=call_id, provider_name="pipeline")
+        session.external_media_codec = "ulaw"
+        await session_store.upsert_call(session)
+        q: asyncio.Queue = asyncio.Queue()
+        queues[call_id] = q
+        assert await mgr.start_streaming_playback(
+            call_id, q, playback_type="pipeline-tts", source_encoding="mulaw", source_sample_rate=8000
+        )
+
+    assert len(mgr.frame_clock) == 4  # pacer + keepalive per stream, one clock task
+    for q in queues.values():
+        await q.put(b"\xff" * 160 * 5)
+        await q.put(None)
+
+    deadline = time.monotonic() + 2.0
+    while mgr.active_streams and time.monotonic() < deadline:
+        await asyncio.sleep(0.02)
+
+    assert not mgr.active_streams
+    assert [len(c) for c in sent["call-a"]] == [160] * 5
+    assert [len(c) for c in sent["call-b"]] == [160] * 5
+    assert mgr.frame_clock.ticks >= 5
+    await mgr.frame_clock.stop()
@@ -0,0 +1,173 @@
+import asyncio
+import time
+
+import pytest
+
+from src.audio.frame_ring import FrameRingBuffer
+from src.core.models import CallSession
+from src.core.session_store import SessionStore
+from src.core.streaming_playback_manager import StreamingPlaybackManager
+
+
+def test_peek_and_consume_in_order_across_wrap():
+    ring = FrameRingBuffer(capacity=500, frame_size=160)
+    data = bytes(range(256)) * 4
+    out = bytearray()
+    pos = 0
+    while pos < len(data) or ring.readable:
+        if pos < len(data) and ring.free >= 100:
+            ring.write(data[pos:pos + 100])
+            pos += 100
+        while ring.frames() or (pos >= len(data) and ring.readable):
+            view = ring.peek_frame()
+            assert isinstance(view, memoryview)
+            out += view
+            ring.consume(len(view))
+    assert bytes(out) == data
+    assert ring.grows == 0
+    assert ring.bytes_written == ring.bytes_consumed == len(data)
+
+
+def test_peek_is_a_view_into_the_ring():
+    ring = FrameRingBuffer(capacity=1000, frame_size=160)
+    ring.write(b"\x01" * 320)
+    first = ring.peek_frame()
+    assert first.obj is ring.peek_frame().obj
+    assert ring.readable == 320  # peeking does not consume
+    assert ring.frames() == 2
+
+
+def test_write_larger_than_free_space_grows_and_keeps_order():
+    ring = FrameRingBuffer(capacity=256, frame_size=64)
+    ring.write(b"a" * 200)
+    ring.consume(150)
+    ring.write(b"b" * 100)  # wraps
+    ring.write(b"c" * 300)  # does not fit: grow
+    assert ring.grows == 1
+    assert ring.capacity >= 450
+    assert ring.read_all() == b"a" * 50 + b"b" * 100 + b"c" * 300
+    assert ring.readable == 0
+
+
+def test_clear_drops_everything():
+    ring = FrameRingBuffer(capacity=640, frame_size=160)
+    ring.write(b"\x00" * 500)
+    ring.consume(160)
+    assert ring.clear() == 340
+    assert ring.readable == 0
+    assert ring.frames() == 0
+    assert ring.bytes_cleared == 340
+    ring.write(b"\x02" * 160)
+    assert bytes(ring.peek_frame()) == b"\x02" * 160
+
+
+@pytest.mark.asyncio
+async def test_wait_for_space_blocks_until_consumed():
+    ring = FrameRingBuffer(capacity=320, frame_size=160)
+    ring.write(b"\x00" * 320)
+    waiter = asyncio.create_task(ring.wait_for_space(160))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    ring.consume(160)
+    await asyncio.wait_for(waiter, timeout=1.0)
+    # A write larger than the whole ring only waits for it to drain, then grows it.
+    ring.write(b"\x00" * 160)
+    big = asyncio.create_task(ring.wait_for_space(1000))
+    await asyncio.sleep(0.01)
+    assert not big.done()
+    ring.clear()
+    await asyncio.wait_for(big, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_keeps_frame_buffered_until_it_goes_out():
+    session_store = SessionStore()
+    sent = []
+
+    class _RTP:
+        ready = False
+
+        def send_audio_nowait(self, call_id, chunk, **kwargs):
+            if not self.ready:
+                return False
+            sent.append(bytes(chunk))
+            return True
+
+        def has_remote_endpoint(self, call_id):
+            return self.ready
+
+    rtp = _RTP()
+    mgr = StreamingPlaybackManager(
+        session_store=session_store,
+        ari_client=object(),
+        conversation_coordinator=None,
+        streaming_config={"min_start_ms": 20, "greeting_min_start_ms": 20, "provider_grace_ms": 0, "normalizer": {"enabled": False}},
+        audio_transport="externalmedia",
+        rtp_server=rtp,
+    )
+    session = CallSession(call_id="call-r", caller_channel_id="call-r", provider_name="pipeline")
+    session.external_media_codec = "ulaw"
+    await session_store.upsert_call(session)
+    q: asyncio.Queue = asyncio.Queue()
+    assert await mgr.start_streaming_playback(
+        "call-r", q, playback_type="greeting", source_encoding="mulaw", source_sample_rate=8000
+    )
+    audio = bytes(i % 251 for i in range(160 * 6))
+    await q.put(audio)
+    await q.put(None)
+
+    await asyncio.sleep(0.1)  # greeting waits for the RTP endpoint; frames stay in the ring
+    assert not sent
+    assert mgr.jitter_buffers["call-r"].readable == len(audio)
+    rtp.ready = True
+
+    deadline = time.monotonic() + 2.0
+    while mgr.active_streams and time.monotonic() < deadline:
+        await asyncio.sleep(0.02)
+
+    assert not mgr.active_streams
+    assert b"".join(sent) == audio
+    await mgr.frame_clock.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_streaming_playback_clears_ring():
+    session_store = SessionStore()
+    sent = []
+
+    class _RTP:
+        def send_audio_nowait(self, call_id, chunk, **kwargs):
+            sent.append(bytes(chunk))
+            return True
+
+        def has_remote_endpoint(self, call_id):
+            return True
+
+    mgr = StreamingPlaybackManager(
+        session_store=session_store,
+        ari_client=object(),
+        conversation_coordinator=None,
+        streaming_config={"min_start_ms": 20, "provider_grace_ms": 0, "normalizer": {"enabled": False}},
+        audio_transport="externalmedia",
+        rtp_server=_RTP(),
+    )
+    session = CallSession(call_id="call-s", caller_channel_id="call-s", provider_name="pipeline")
+    session.external_media_codec = "ulaw"
+    await session_store.upsert_call(session)
+    q: asyncio.Queue = asyncio.Queue()
+    assert await mgr.start_streaming_playback(
+        "call-s", q, playback_type="pipeline-tts", source_encoding="mulaw", source_sample_rate=8000
+    )
+    ring = mgr.jitter_buffers["call-s"]
+    await q.put(b"\xff" * 160 * 50)
+    await asyncio.sleep(0.05)
+    buffered = ring.readable
+    sent_before = len(sent)
+    assert buffered > 0
+
+    assert await mgr.stop_streaming_playback("call-s")
+    assert ring.readable == 0
+    assert ring.bytes_cleared == buffered
+    assert len(sent) == sent_before  # buffered audio is dropped, not flushed
+    assert "call-s" not in mgr.jitter_buffers
+    await mgr.frame_clock.stop()
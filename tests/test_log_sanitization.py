@@ -6,7 +6,8 @@ Verifies that sensitive information is redacted from logs.
 
 import pytest
 import structlog
-from src.logging_config import sanitize_secrets
+from src import logging_config
+from src.logging_config import sanitize_secrets, rate_limit_repetitive_events
 
 
 class TestLogSanitization:
@@ -167,3 +168,57 @@ class TestLogSanitization:
         assert 'REDACTED' in result['user_password']
         assert 'REDACTED' in result['password']
         assert 'REDACTED' in result['pass']
+
+
+class TestLoggingFastPath:
+    """Tests for the cached sanitizer, per-frame rate limiting and level short-circuit."""
+
+    def test_clean_event_is_not_copied(self):
+        """Events without secrets or nested containers pass through untouched."""
+        event_dict = {'event': 'frame', 'call_id': 'c1', 'bytes': 320}
+        assert sanitize_secrets(None, None, event_dict) is event_dict
+
+    def test_key_classification_is_cached(self):
+        """Sensitive-key decisions are computed once per key."""
+        sanitize_secrets(None, None, {'openai_api_key': 'sk-abcdef', 'passthrough': True})
+        assert logging_config._KEY_CLASS_CACHE['openai_api_key'] is True
+        assert logging_config._KEY_CLASS_CACHE['passthrough'] is False
+
+    def test_per_frame_sites_are_rate_limited_per_call(self, monkeypatch):
+        """Repeats beyond the burst are dropped and reported on the next window."""
+        monkeypatch.setitem(logging_config.RATE_LIMITED_EVENTS, 'RTP packet loss detected', (2, 60.0))
+        logging_config._rate_limit_state.clear()
+        clock = [100.0]
+        monkeypatch.setattr(logging_config.time, 'monotonic', lambda: clock[0])
+
+        def emit(call_id):
+            try:
+                return rate_limit_repetitive_events(None, 'debug', {'event': 'RTP packet loss detected', 'call_id': call_id})
+            except structlog.DropEvent:
+                return None
+
+        assert emit('c1') is not None
+        assert emit('c1') is not None
+        assert emit('c1') is None
+        assert emit('c1') is None
+        assert emit('c2') is not None  # budget is per call
+        clock[0] += 61.0
+        assert emit('c1')['suppressed'] == 2
+        # Other events are never limited
+        assert rate_limit_repetitive_events(None, 'info', {'event': 'Call started'}) == {'event': 'Call started'}
+
+    def test_below_level_calls_skip_processors(self, monkeypatch):
+        """debug()/info() below the configured level return before any processor runs."""
+        calls = []
+
+        def spy(logger, method_name, event_dict):
+            calls.append(method_name)
+            raise structlog.DropEvent
+
+        log = logging_config.LevelFilteringBoundLogger(
+            logging_config.logging.getLogger('fastpath-test'), [spy], {}
+        )
+        monkeypatch.setattr(logging_config, '_min_level', logging_config.logging.INFO)
+        log.debug('hidden', call_id='c1')
+        log.info('shown')
+        assert calls == ['info']
@@ -118,3 +118,38 @@ async def test_session_requests_g711_when_beta_mode():
     assert session.get("output_audio_format") == "pcm16"
     assert provider._provider_output_format == "pcm16"
     assert provider._session_output_bytes_per_sample == 2
+
+
+@pytest.mark.asyncio
+async def test_session_update_splices_cached_tool_schemas(openai_config):
+    import json
+    from src.tools.base import Tool, ToolCategory, ToolDefinition
+    from src.tools.registry import tool_registry
+
+    class _Lookup(Tool):
+        @property
+        def definition(self) -> ToolDefinition:
+            return ToolDefinition(name="lookup_order", description="Find an order", category=ToolCategory.BUSINESS)
+
+        async def execute(self, parameters, context):
+            return {"status": "success"}
+
+    tool_registry.clear()
+    tool_registry.register(_Lookup)
+    try:
+        provider = OpenAIRealtimeProvider(openai_config, on_event=None)
+        provider._allowed_tools = ["lookup_order"]
+        sent = []
+
+        async def fake_send_text(message, ptype=None):
+            sent.append(message)
+
+        provider._send_text = fake_send_text  # type: ignore
+        await provider._send_session_update()
+
+        payload = json.loads(sent[0])
+        assert payload["type"] == "session.update"
+        assert payload["session"]["tool_choice"] == "auto"
+        assert payload["session"]["tools"] == tool_registry.to_openai_realtime_schema_filtered(["lookup_order"])
+    finally:
+        tool_registry.clear()
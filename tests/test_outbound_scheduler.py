@@ -0,0 +1,164 @@
+"""
+Tests for the outbound dialer's pacing model and batched dispatch.
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from src.core.outbound_pacing import AttemptIndex, OutboundPacer, TokenBucket, trunk_key_for_endpoint
+from src.core.outbound_store import OutboundStore
+from src.engine import Engine
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_rate_and_burst():
+    clock = _Clock()
+    bucket = TokenBucket(rate_per_sec=2.0, burst=3, clock=clock)
+    assert bucket.take(5) == 3
+    assert bucket.take(1) == 0
+    assert bucket.delay() == pytest.approx(0.5)
+    clock.now += 1.0
+    assert bucket.available() == 2
+    clock.now += 10.0
+    assert bucket.available() == 3  # capped at burst
+
+    unlimited = TokenBucket(rate_per_sec=0, clock=clock)
+    assert unlimited.take(1000) == 1000
+    assert unlimited.delay() == 0.0
+
+
+def test_campaign_bucket_follows_min_interval_edits():
+    clock = _Clock()
+    pacer = OutboundPacer(clock=clock)
+    bucket = pacer.campaign("c1", 5)
+    assert bucket.take(2) == 1
+    clock.now += 4.9
+    assert pacer.campaign("c1", 5).available() == 0
+    clock.now += 0.1
+    assert pacer.campaign("c1", 5) is bucket and bucket.available() == 1
+    assert pacer.campaign("c1", 0).unlimited
+    pacer.forget_campaigns(set())
+    assert pacer.campaign("c1", 5) is not bucket
+
+
+def test_trunk_key_groups_endpoints_by_route():
+    assert trunk_key_for_endpoint("Local/15551234567@from-internal") == "Local@from-internal"
+    assert trunk_key_for_endpoint("Local/2001@from-internal") == "Local@from-internal"
+    assert trunk_key_for_endpoint("PJSIP/2001") == "PJSIP"
+
+
+def test_attempt_index_counts_per_campaign():
+    index = AttemptIndex()
+    index["a1"] = {"campaign_id": "c1"}
+    index["a2"] = {"campaign_id": "c1"}
+    index["a3"] = {"campaign_id": "c2"}
+    index["a1"] = {"campaign_id": "c1", "channel_id": "ch"}  # re-assignment keeps the count
+    assert (index.count("c1"), index.count("c2"), len(index)) == (2, 1, 3)
+    index.pop("a1", None)
+    index.pop("missing", None)
+    del index["a3"]
+    assert (index.count("c1"), index.count("c2")) == (1, 0)
+    assert [m["campaign_id"] for m in index.values()] == ["c1"]
+
+
+class _SimulatedARI:
+    def __init__(self):
+        self.originated = []
+
+    async def originate_channel(self, **kwargs):
+        self.originated.append(kwargs)
+        return {"id": f"chan-{len(self.originated)}"}
+
+    async def send_command(self, *args, **kwargs):
+        return {"status": 404}
+
+
+class _Sessions:
+    async def count_active_outbound_calls(self, campaign_id=None):
+        return 0
+
+
+async def _engine(store, **pacer_kwargs):
+    engine = Engine.__new__(Engine)
+    engine.outbound_store = store
+    engine.session_store = _Sessions()
+    engine.ari_client = _SimulatedARI()
+    engine.providers = {}
+    engine.transport_orchestrator = types.SimpleNamespace(get_context_config=lambda name: None)
+    engine.config = types.SimpleNamespace(asterisk=types.SimpleNamespace(app_name="asterisk-ai-voice-agent"))
+    engine._outbound_attempt_meta_by_attempt_id = AttemptIndex()
+    engine._outbound_attempt_meta_by_channel_id = {}
+    engine._outbound_pacer = OutboundPacer(**pacer_kwargs)
+    engine._outbound_lease_batch = 25
+    engine._outbound_dial_tasks = set()
+    engine._outbound_last_campaign_error_log_ts = {}
+    engine._outbound_extension_identity = "6789"
+    engine._outbound_pjsip_endpoint_cache = {}
+    engine._outbound_pjsip_endpoint_cache_ttl_seconds = 300.0
+    return engine
+
+
+async def _campaign(tmp_path, leads, **overrides):
+    store = OutboundStore(db_path=str(tmp_path / "call_history.db"))
+    campaign = await store.create_campaign({"name": "Load", **overrides})
+    csv_bytes = "phone_number\n" + "".join(f"+1555{i:07d}\n" for i in range(leads))
+    await store.import_leads_csv(campaign["id"], csv_bytes.encode("utf-8"), skip_existing=True, max_error_rows=20)
+    return store, await store.get_campaign(campaign["id"])
+
+
+@pytest.mark.asyncio
+async def test_dispatch_dials_a_batch_up_to_capacity(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    monkeypatch.setenv("AAVA_OUTBOUND_MAX_CONCURRENT_CEILING", "50")
+    store, campaign = await _campaign(tmp_path, 30, max_concurrent=20, min_interval_seconds_between_calls=0)
+    engine = await _engine(store)
+
+    assert await engine._outbound_dispatch_campaign(campaign) == 20
+    await asyncio.gather(*engine._outbound_dial_tasks)
+    assert len(engine.ari_client.originated) == 20
+    assert engine._outbound_attempt_meta_by_attempt_id.count(campaign["id"]) == 20
+    assert len(engine._outbound_attempt_meta_by_channel_id) == 20
+    # At capacity: nothing more until attempts finish.
+    assert await engine._outbound_dispatch_campaign(campaign) == 0
+
+    for attempt_id in list(engine._outbound_attempt_meta_by_attempt_id)[:5]:
+        engine._outbound_attempt_meta_by_attempt_id.pop(attempt_id, None)
+    assert await engine._outbound_dispatch_campaign(campaign) == 5
+
+
+@pytest.mark.asyncio
+async def test_dispatch_respects_campaign_interval(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    store, campaign = await _campaign(tmp_path, 5, max_concurrent=5, min_interval_seconds_between_calls=30)
+    engine = await _engine(store)
+
+    assert await engine._outbound_dispatch_campaign(campaign) == 1
+    assert await engine._outbound_dispatch_campaign(campaign) == 0
+    await asyncio.gather(*engine._outbound_dial_tasks)
+    assert len(engine.ari_client.originated) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_originate_releases_capacity(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    store, campaign = await _campaign(tmp_path, 2, max_concurrent=2, min_interval_seconds_between_calls=0)
+    engine = await _engine(store)
+
+    async def boom(**kwargs):
+        raise ConnectionError("ARI down")
+
+    engine.ari_client.originate_channel = boom
+    assert await engine._outbound_dispatch_campaign(campaign) == 2
+    await asyncio.gather(*engine._outbound_dial_tasks)
+    assert engine._outbound_attempt_meta_by_attempt_id.count(campaign["id"]) == 0
+    leads = (await store.list_leads(campaign["id"], page=1, page_size=50))["leads"]
+    assert {l["state"] for l in leads} == {"failed"}
@@ -62,3 +62,49 @@ async def test_outbound_store_campaign_import_and_leasing(tmp_path, monkeypatch)
     leased2 = await store.lease_pending_leads(campaign_id, limit=1, lease_seconds=60)
     assert len(leased2) == 1
     assert leased2[0]["id"] != lead["id"]
+
+
+@pytest.mark.asyncio
+async def test_start_attempts_batch_claims_leads_and_opens_attempts(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    from src.core.outbound_store import OutboundStore
+
+    store = OutboundStore(db_path=str(tmp_path / "call_history.db"))
+    campaign = await store.create_campaign({"name": "Batch", "default_context": "demo", "max_concurrent": 1})
+    campaign_id = campaign["id"]
+    csv_bytes = "phone_number,context\n" + "".join(
+        f"+1555123{i:04d},{'sales' if i == 0 else ''}\n" for i in range(5)
+    )
+    await store.import_leads_csv(campaign_id, csv_bytes.encode("utf-8"), skip_existing=True, max_error_rows=20)
+
+    resolved = []
+
+    def resolve(context):
+        resolved.append(context)
+        return "local" if context == "demo" else None
+
+    started = await store.start_attempts_batch(campaign_id, limit=3, default_context="demo", resolve_provider=resolve)
+    assert len(started) == 3
+    assert sorted(resolved) == ["demo", "sales"]
+    assert started[0]["context"] == "sales" and started[0]["provider"] is None
+    assert {s["context"] for s in started[1:]} == {"demo"}
+    assert all(s["state"] == "dialing" and s["attempt_count"] == 1 for s in started)
+
+    leads = {l["id"]: l for l in (await store.list_leads(campaign_id, page=1, page_size=50))["leads"]}
+    assert sorted(l["state"] for l in leads.values()) == ["dialing", "dialing", "dialing", "pending", "pending"]
+    attempts = (await store.list_attempts(campaign_id, page=1, page_size=50))["attempts"]
+    assert {a["id"] for a in attempts} == {s["attempt_id"] for s in started}
+    assert {a["provider"] for a in attempts if a["context"] == "demo"} == {"local"}
+
+    rest = await store.start_attempts_batch(campaign_id, limit=10)
+    assert len(rest) == 2
+    assert await store.start_attempts_batch(campaign_id, limit=10) == []
+
+
+def test_max_concurrent_ceiling_is_configurable(monkeypatch):
+    from src.core.outbound_store import max_concurrent_ceiling
+
+    monkeypatch.delenv("AAVA_OUTBOUND_MAX_CONCURRENT_CEILING", raising=False)
+    assert max_concurrent_ceiling() == 5
+    monkeypatch.setenv("AAVA_OUTBOUND_MAX_CONCURRENT_CEILING", "200")
+    assert max_concurrent_ceiling() == 200
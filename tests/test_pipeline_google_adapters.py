@@ -206,3 +206,47 @@ async def test_pipeline_orchestrator_registers_google_adapters():
     assert isinstance(resolution.llm_adapter, GoogleLLMAdapter)
     assert isinstance(resolution.tts_adapter, GoogleTTSAdapter)
     assert resolution.stt_options["language_code"] == "en-US"
+
+
+class _FakeStreamContent:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __aiter__(self):
+        async def gen():
+            for line in self._lines:
+                yield line
+        return gen()
+
+
+class _FakeStreamSession(_FakeSession):
+    def __init__(self, chunks):
+        super().__init__("")
+        self._lines = [f"data: {json.dumps(c)}\r\n".encode() for c in chunks]
+
+    def post(self, url, json=None, params=None, headers=None, timeout=None):
+        response = super().post(url, json=json, params=params, headers=headers, timeout=timeout)
+        response.content = _FakeStreamContent(self._lines)
+        return response
+
+
+@pytest.mark.asyncio
+async def test_google_llm_adapter_streams_sse_chunks():
+    app_config = _build_app_config()
+    provider_config = GoogleProviderConfig(**app_config.providers["google"])
+    chunks = [
+        {"candidates": [{"content": {"parts": [{"text": "Sure, "}]}}]},
+        {"candidates": [{"content": {"parts": [{"text": "it is sunny."}]}}]},
+    ]
+    fake_session = _FakeStreamSession(chunks)
+    adapter = GoogleLLMAdapter("google_llm", app_config, provider_config, {}, session_factory=lambda: fake_session)
+    assert adapter.supports_streaming
+
+    await adapter.start()
+    items = [item async for item in adapter.generate_stream("call-1", "weather?", {}, {})]
+    assert items[:2] == ["Sure, ", "it is sunny."]
+    assert items[-1].text == "Sure, it is sunny."
+
+    request = fake_session.requests[0]
+    assert request["url"].endswith(":streamGenerateContent")
+    assert request["params"] == {"key": "test-google-key", "alt": "sse"}
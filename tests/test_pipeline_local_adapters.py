@@ -156,6 +156,38 @@ async def test_local_llm_adapter_generate(monkeypatch):
     assert llm_message["context"] == [{"role": "user", "content": "user text"}]
 
 
+@pytest.mark.asyncio
+async def test_local_llm_adapter_streams_partials(monkeypatch):
+    app_config = _build_app_config()
+    provider_config = LocalProviderConfig(**app_config.providers["local"])
+    adapter = LocalLLMAdapter("local_llm", app_config, provider_config, {"mode": "llm"})
+    assert adapter.supports_streaming
+
+    mock_ws = _MockWebSocket()
+
+    async def fake_connect(*_args, **_kwargs):
+        return mock_ws
+
+    monkeypatch.setattr("src.pipelines.local.websockets.connect", fake_connect)
+
+    await adapter.start()
+    await adapter.open_call("call-3", {"mode": "llm"})
+
+    mock_ws.push(json.dumps({"type": "llm_partial", "text": "Hello ", "seq": 1}))
+    mock_ws.push(json.dumps({"type": "llm_partial", "text": "there.", "seq": 2}))
+    mock_ws.push(json.dumps({"type": "llm_response", "text": "Hello there."}))
+    items = [item async for item in adapter.generate_stream("call-3", "hi", {"messages": []}, {})]
+    assert items[:2] == ["Hello ", "there."]
+    assert items[-1].text == "Hello there."
+    assert json.loads(mock_ws.sent[1])["stream"] is True
+
+    # No llm_response before the timeout: the partials received so far are the answer.
+    mock_ws.push(json.dumps({"type": "llm_partial", "text": "Cut ", "seq": 1}))
+    items = [item async for item in adapter.generate_stream("call-3", "hi", {"messages": []}, {})]
+    assert items[0] == "Cut "
+    assert items[-1].text == "Cut"
+
+
 @pytest.mark.asyncio
 async def test_local_tts_adapter_synthesizes(monkeypatch):
     app_config = _build_app_config()
@@ -4,6 +4,7 @@ import json
 import wave
 from io import BytesIO
 
+import aiohttp
 import pytest
 
 from src.audio.resampler import convert_pcm16le_to_target_format
@@ -244,3 +245,116 @@ async def test_pipeline_orchestrator_registers_openai_adapters():
     assert isinstance(resolution.llm_adapter, OpenAILLMAdapter)
     assert isinstance(resolution.tts_adapter, OpenAITTSAdapter)
     assert resolution.tts_options["format"]["encoding"] == "mulaw"
+
+
+class _FakeStreamContent:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __aiter__(self):
+        async def gen():
+            for line in self._lines:
+                yield line
+        return gen()
+
+
+class _FakeStreamSession(_FakeSession):
+    def __init__(self, events):
+        super().__init__(b"")
+        self._lines = [f"data: {json.dumps(e)}\n".encode() for e in events] + [b"data: [DONE]\n"]
+
+    def post(self, url, json=None, data=None, headers=None, timeout=None):
+        response = super().post(url, json=json, data=data, headers=headers, timeout=timeout)
+        response.content = _FakeStreamContent(self._lines)
+        return response
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_streams_deltas_and_tool_calls():
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    events = [
+        {"choices": [{"delta": {"content": "Let me "}}]},
+        {"choices": [{"delta": {"content": "check."}}]},
+        {"choices": [{"delta": {"tool_calls": [{"index": 0, "id": "c1", "function": {"name": "get_time", "arguments": '{"tz": '}}]}}]},
+        {"choices": [{"delta": {"tool_calls": [{"index": 0, "function": {"arguments": '"UTC"}'}}]}}]},
+        {"choices": [], "usage": {"total_tokens": 12}},
+    ]
+    fake_session = _FakeStreamSession(events)
+    adapter = OpenAILLMAdapter(
+        "openai_llm", app_config, provider_config, {"use_realtime": False}, session_factory=lambda: fake_session
+    )
+    assert adapter.supports_streaming
+
+    items = [item async for item in adapter.generate_stream("call-1", "hello", {}, {})]
+    assert items[:2] == ["Let me ", "check."]
+    final = items[-1]
+    assert final.text == "Let me check."
+    assert final.tool_calls == [{"id": "c1", "name": "get_time", "parameters": {"tz": "UTC"}, "type": "function"}]
+    assert final.metadata == {"total_tokens": 12}
+    assert fake_session.requests[0]["json"]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_stream_sends_stream_options_only_when_configured():
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    events = [{"choices": [{"delta": {"content": "Hi."}}]}]
+
+    fake_session = _FakeStreamSession(events)
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {}, session_factory=lambda: fake_session)
+    [item async for item in adapter.generate_stream("call-1", "hello", {}, {})]
+    assert "stream_options" not in fake_session.requests[0]["json"]
+
+    fake_session = _FakeStreamSession(events)
+    adapter = OpenAILLMAdapter(
+        "openai_llm", app_config, provider_config, {"stream_include_usage": True}, session_factory=lambda: fake_session
+    )
+    [item async for item in adapter.generate_stream("call-1", "hello", {}, {})]
+    assert fake_session.requests[0]["json"]["stream_options"] == {"include_usage": True}
+
+
+class _BrokenStreamContent:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __aiter__(self):
+        async def gen():
+            for line in self._lines:
+                yield line
+            raise aiohttp.ClientPayloadError("connection reset")
+        return gen()
+
+
+class _BrokenStreamSession(_FakeSession):
+    """Streams ``events`` then drops the connection; non-streaming posts return ``body``."""
+
+    def __init__(self, events, body: bytes = b""):
+        super().__init__(body)
+        self._lines = [f"data: {json.dumps(e)}\n".encode() for e in events]
+
+    def post(self, url, json=None, data=None, headers=None, timeout=None):
+        response = super().post(url, json=json, data=data, headers=headers, timeout=timeout)
+        if json and json.get("stream"):
+            response.content = _BrokenStreamContent(self._lines)
+        return response
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_stream_keeps_partial_text_or_falls_back_when_cut_off():
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+
+    fake_session = _BrokenStreamSession([{"choices": [{"delta": {"content": "Half an "}}]}])
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {}, session_factory=lambda: fake_session)
+    items = [item async for item in adapter.generate_stream("call-1", "hello", {}, {})]
+    assert items[0] == "Half an "
+    assert items[-1].text == "Half an " and items[-1].tool_calls == []
+    assert len(fake_session.requests) == 1
+
+    body = json.dumps({"choices": [{"message": {"role": "assistant", "content": "Full answer."}}]}).encode()
+    fake_session = _BrokenStreamSession([], body=body)
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {}, session_factory=lambda: fake_session)
+    items = [item async for item in adapter.generate_stream("call-1", "hello", {}, {})]
+    assert [getattr(item, "text", item) for item in items] == ["Full answer."]
+    assert [r["json"].get("stream") for r in fake_session.requests] == [True, None]
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from src.config import AppConfig
+from src.core.models import CallSession
+from src.engine import Engine
+from src.pipelines.base import LLMComponent, LLMResponse, TTSComponent
+from src.pipelines.segmenter import SentenceSegmenter, ToolMarkupGuard
+
+
+def _segment(text, step=3):
+    seg = SentenceSegmenter()
+    out = []
+    for i in range(0, len(text), step):
+        out += seg.push(text[i:i + step])
+    rest = seg.flush()
+    return out + ([rest] if rest else [])
+
+
+def test_segmenter_emits_first_clause_early_and_keeps_abbreviations():
+    out = _segment(
+        "Sure, I can help with that. Dr. Smith is free at 3.5 p.m. on Tuesday! "
+        "Would you like me to book it, or should I check another day for you? Thanks."
+    )
+    assert out == [
+        "Sure, I can help with that.",
+        "Dr. Smith is free at 3.5 p.m. on Tuesday!",
+        "Would you like me to book it, or should I check another day for you?",
+        "Thanks.",
+    ]
+
+
+def test_segmenter_splits_long_first_clause_and_caps_length():
+    seg = SentenceSegmenter(max_chars=100)
+    first = seg.push("Let me look that up for you, ")
+    assert first == ["Let me look that up for you,"]
+    out = seg.push("word " * 40)
+    assert out and all(len(s) <= 100 for s in out)
+
+
+def test_tool_markup_guard_withholds_markup():
+    guard = ToolMarkupGuard()
+    spoken = "".join(guard.push(d) for d in ["Transferring you now. <to", 'ol_call>{"name": "transfer"}</tool_call>'])
+    spoken += guard.flush()
+    assert spoken == "Transferring you now. "
+    assert guard.markup_seen
+
+
+class _StreamingLLM(LLMComponent):
+    def __init__(self, deltas, final=None):
+        self.deltas = deltas
+        self.final = final
+        self.tts_started_before_done = False
+        self.tts_started = asyncio.Event()
+
+    async def generate(self, call_id, transcript, context, options):
+        return "".join(self.deltas)
+
+    async def generate_stream(self, call_id, transcript, context, options):
+        for delta in self.deltas:
+            await asyncio.sleep(0.01)
+            yield delta
+        self.tts_started_before_done = self.tts_started.is_set()
+        if self.final is not None:
+            yield self.final
+
+
+class _RecordingTTS(TTSComponent):
+    def __init__(self, llm):
+        self.llm = llm
+        self.segments = []
+
+    async def synthesize(self, call_id, text, options):
+        self.llm.tts_started.set()
+        self.segments.append(text)
+        yield text.encode()
+
+
+class _Pipeline:
+    def __init__(self, llm):
+        self.llm_adapter = llm
+        self.tts_adapter = _RecordingTTS(llm)
+        self.tts_options = {}
+
+
+def _engine():
+    config = AppConfig(**{
+        "default_provider": "local",
+        "providers": {"local": {"enabled": True}},
+        "asterisk": {"host": "127.0.0.1", "port": 8088, "username": "u", "password": "p", "app_name": "ai-voice-agent"},
+        "llm": {"initial_greeting": "hi", "prompt": "You are helpful", "model": "gpt-4o"},
+        "pipelines": {"local_only": {}},
+        "active_pipeline": "local_only",
+        "audio_transport": "externalmedia",
+    })
+    return Engine(config)
+
+
+async def _run(engine, pipeline, monkeypatch):
+    queued = []
+
+    async def fake_start(call_id, q, **kwargs):
+        async def drain():
+            while True:
+                chunk = await q.get()
+                if chunk is None:
+                    return
+                queued.append(chunk)
+        asyncio.create_task(drain())
+        return "stream-1"
+
+    monkeypatch.setattr(engine.streaming_playback_manager, "start_streaming_playback", fake_start)
+    session = CallSession(call_id="call-s", caller_channel_id="call-s")
+    await engine.session_store.upsert_call(session)
+    result = await engine._pipeline_stream_llm_to_tts(
+        "call-s", session, pipeline, "hi", {}, {},
+        t_start=None, turn_start_time=0.0, pipeline_label="p", provider_label="x",
+    )
+    await asyncio.sleep(0)
+    return result, queued
+
+
+@pytest.mark.asyncio
+async def test_streamed_turn_starts_tts_before_llm_finishes(monkeypatch):
+    llm = _StreamingLLM(["Sure, one moment. ", "I am checking ", "the schedule now. ", "Anything else?"])
+    pipeline = _Pipeline(llm)
+    (final, playback_id, spoken), queued = await _run(_engine(), pipeline, monkeypatch)
+    assert playback_id == "stream-1"
+    assert llm.tts_started_before_done
+    assert pipeline.tts_adapter.segments == ["Sure, one moment.", "I am checking the schedule now.", "Anything else?"]
+    assert final.text == "Sure, one moment. I am checking the schedule now. Anything else?"
+    assert spoken and b"".join(queued).decode().startswith("Sure")
+
+
+@pytest.mark.asyncio
+async def test_streamed_turn_keeps_structured_and_text_tool_calls(monkeypatch):
+    tool = {"id": "1", "name": "hangup_call", "parameters": {}, "type": "function"}
+    llm = _StreamingLLM(["Goodbye now. "], final=LLMResponse(text="Goodbye now.", tool_calls=[tool]))
+    (final, _pid, _spoken), _q = await _run(_engine(), _Pipeline(llm), monkeypatch)
+    assert final.tool_calls == [tool]
+
+    llm = _StreamingLLM(["Let me transfer you. ", '<tool_call>{"name": "transfer", "arguments": {"to": "sales"}}</tool_call>'])
+    pipeline = _Pipeline(llm)
+    (final, _pid, _spoken), _q = await _run(_engine(), pipeline, monkeypatch)
+    assert pipeline.tts_adapter.segments == ["Let me transfer you."]
+    assert final.text == "Let me transfer you."
+    assert final.tool_calls == [{"name": "transfer", "parameters": {"to": "sales"}}]
+
+
+@pytest.mark.asyncio
+async def test_tool_only_stream_starts_no_playback(monkeypatch):
+    tool = {"id": "1", "name": "transfer", "parameters": {}, "type": "function"}
+    llm = _StreamingLLM([], final=LLMResponse(text="", tool_calls=[tool]))
+    (final, playback_id, spoken), _q = await _run(_engine(), _Pipeline(llm), monkeypatch)
+    assert playback_id is None and spoken == ""
+    assert final.tool_calls == [tool]
@@ -0,0 +1,196 @@
+"""
+Tests for the provider warm pool and warm-socket handover in OpenAI Realtime.
+"""
+
+import asyncio
+import json
+import types
+
+import pytest
+from websockets.asyncio.server import serve
+
+from src.config import OpenAIRealtimeProviderConfig
+from src.core.provider_warm_pool import ProviderWarmPool
+from src.providers.base import WarmConnection
+from src.providers.openai_realtime import OpenAIRealtimeProvider
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.state = types.SimpleNamespace(name="OPEN")
+
+    async def close(self):
+        self.state = types.SimpleNamespace(name="CLOSED")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(clock=None, **kwargs):
+    opened = []
+
+    async def connect():
+        conn = WarmConnection(websocket=_FakeSocket(), setup_seconds=0.4, created_at=clock() if clock else 0.0)
+        opened.append(conn)
+        return conn
+
+    kwargs.setdefault("size", 2)
+    pool = ProviderWarmPool("openai_realtime", connect, clock=clock or (lambda: 0.0), **kwargs)
+    return pool, opened
+
+
+async def _until(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_lease_hits_until_empty_then_misses():
+    pool, opened = _pool()
+    assert await pool.fill() == 2
+    first, second = pool.lease(), pool.lease()
+    assert first is opened[0] and second is opened[1]
+    assert pool.lease() is None
+    assert pool.stats() == {"size": 2, "idle": 0, "hits": 2, "misses": 1}
+    assert await pool.fill() == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_and_closed_connections_are_retired():
+    clock = _Clock()
+    pool, opened = _pool(clock=clock, max_age_sec=60.0)
+    await pool.fill()
+    await opened[0].websocket.close()
+    clock.now += 61.0
+    assert pool.lease() is None
+    await asyncio.sleep(0)
+    assert all(conn.websocket.state.name == "CLOSED" for conn in opened)
+    assert await pool.fill() == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_idle_limit_retires_sockets_before_pool_max_age():
+    opened = []
+
+    async def connect():
+        # e.g. Deepgram: nothing keeps an unleased socket alive past the provider's idle timeout
+        conn = WarmConnection(websocket=_FakeSocket(), max_age_sec=0.05)
+        opened.append(conn)
+        return conn
+
+    pool = ProviderWarmPool("deepgram", connect, size=1, max_age_sec=240.0)
+    pool.start()
+    try:
+        await _until(lambda: len(opened) >= 3, timeout=1.0)  # replaced without waiting for the 30 s sweep
+        assert opened[0].websocket.state.name == "CLOSED"
+        leased = pool.lease()
+        assert leased is None or leased.is_open() and not pool._is_stale(leased)
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_background_refill_after_lease_and_close():
+    pool, opened = _pool()
+    pool.start()
+    try:
+        await _until(lambda: pool.stats()["idle"] == 2)
+        leased = pool.lease()
+        await _until(lambda: pool.stats()["idle"] == 2)
+        assert len(opened) == 3
+    finally:
+        await pool.close()
+    assert leased.websocket.state.name == "OPEN"
+    assert [conn.websocket.state.name for conn in opened[1:]] == ["CLOSED", "CLOSED"]
+
+
+@pytest.mark.asyncio
+async def test_failed_connects_back_off():
+    attempts = []
+
+    async def connect():
+        attempts.append(1)
+        raise ConnectionRefusedError("down")
+
+    pool = ProviderWarmPool("deepgram", connect, size=1, refill_backoff_sec=0.1)
+    pool.start()
+    try:
+        await asyncio.sleep(0.05)
+        for _ in range(5):
+            assert pool.lease() is None  # leases during the outage do not force reconnects
+        await asyncio.sleep(0.02)
+        assert len(attempts) == 1
+    finally:
+        await pool.close()
+
+
+class _RealtimeStandIn:
+    """Local stand-in for the OpenAI Realtime websocket: session.created, then ACKs every session.update."""
+
+    def __init__(self):
+        self.connections = 0
+        self.updates = []
+
+    async def handler(self, websocket):
+        self.connections += 1
+        await websocket.send(json.dumps({"type": "session.created", "session": {"id": "sess_1", "model": "gpt-test"}}))
+        async for raw in websocket:
+            message = json.loads(raw)
+            if message.get("type") == "session.update":
+                self.updates.append(message["session"])
+                await websocket.send(
+                    json.dumps({"type": "session.updated", "session": {"output_audio_format": "pcm16"}})
+                )
+
+
+def _realtime_config(port, instructions):
+    return OpenAIRealtimeProviderConfig(
+        api_key="test-key",
+        model="gpt-test",
+        base_url=f"ws://127.0.0.1:{port}/v1/realtime",
+        instructions=instructions,
+        response_modalities=["audio"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_openai_realtime_starts_on_warm_socket_with_delta_update():
+    stand_in = _RealtimeStandIn()
+    events = []
+
+    async def on_event(event):
+        events.append(event)
+
+    async with serve(stand_in.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        warm = await OpenAIRealtimeProvider(_realtime_config(port, "Base prompt"), on_event).open_warm_connection()
+        assert warm.is_open() and warm.setup_seconds > 0
+        assert stand_in.connections == 1
+        assert "Base prompt" in stand_in.updates[0]["instructions"]
+        assert stand_in.updates[0]["voice"] == "alloy"
+
+        provider = OpenAIRealtimeProvider(_realtime_config(port, "Per-call prompt"), on_event)
+        provider.adopt_warm_connection(warm)
+        await provider.start_session("call-1", context={"tools": []})
+        try:
+            assert stand_in.connections == 1
+            # Only what the call changed goes out; voice, formats and VAD were applied while warm.
+            assert set(stand_in.updates[1]) == {"instructions"}
+            assert "Per-call prompt" in stand_in.updates[1]["instructions"]
+            assert provider._outfmt_acknowledged is True
+        finally:
+            await provider.stop_session()
+
+        cold = OpenAIRealtimeProvider(_realtime_config(port, "Per-call prompt"), on_event)
+        await cold.start_session("call-2", context={"tools": []})
+        await cold.stop_session()
+        assert stand_in.connections == 2
+        assert "voice" in stand_in.updates[2]
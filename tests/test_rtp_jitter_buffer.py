@@ -0,0 +1,129 @@
+import socket
+import struct
+import time
+
+import pytest
+
+from src.audio.jitter_buffer import PLC_MAX_REPEAT, RTPJitterBuffer, conceal_pcm16
+from src.rtp_server import RTPServer, RTPSession
+
+
+def _push_all(jb, seqs, *, start_arrival=0.0):
+    out = []
+    for i, seq in enumerate(seqs):
+        out.extend(jb.push(seq, seq * 160, bytes([seq & 0xFF]), arrival=start_arrival + i * 0.02))
+    return out
+
+
+def test_in_order_packets_pass_straight_through():
+    jb = RTPJitterBuffer(target_ms=60)
+    assert jb.push(10, 1600, b"a", arrival=0.0) == [b"a"]
+    assert jb.push(11, 1760, b"b", arrival=0.02) == [b"b"]
+    assert jb.depth == 0
+    assert jb.jitter_ms == pytest.approx(0.0)
+
+
+def test_reorders_within_window():
+    jb = RTPJitterBuffer(target_ms=60, adaptive=False)
+    out = _push_all(jb, [1, 3, 2, 4])
+    assert out == [bytes([1]), bytes([2]), bytes([3]), bytes([4])]
+    assert jb.concealed == 0
+    assert jb.late_dropped == 0
+
+
+def test_gap_is_concealed_after_target_depth_and_late_packet_dropped():
+    jb = RTPJitterBuffer(target_ms=60, adaptive=False)  # 3 packets
+    out = _push_all(jb, [1, 3, 4])
+    assert out == [bytes([1])]  # 2 still awaited
+    out = jb.push(5, 800, bytes([5]), arrival=0.1)
+    assert out == [None, bytes([3]), bytes([4]), bytes([5])]
+    assert jb.concealed == 1
+
+    assert jb.push(2, 320, bytes([2]), arrival=0.12) == []
+    assert jb.late_dropped == 1
+
+
+def test_sequence_wraparound_and_duplicates():
+    jb = RTPJitterBuffer(target_ms=60, adaptive=False)
+    out = _push_all(jb, [65534, 0, 65535, 1])
+    assert out == [bytes([254]), bytes([255]), bytes([0]), bytes([1])]
+    assert jb.expected_sequence == 2
+    jb.push(3, 480, b"x", arrival=1.0)
+    assert jb.push(3, 480, b"x", arrival=1.0) == []
+    assert jb.duplicates == 1
+
+
+def test_large_jump_resyncs_instead_of_concealing():
+    jb = RTPJitterBuffer(target_ms=60)
+    _push_all(jb, [1, 2])
+    assert jb.push(5000, 800000, b"new", arrival=0.1) == [b"new"]
+    assert jb.resyncs == 1
+    assert jb.concealed == 0
+
+
+def test_rfc3550_jitter_estimate_and_adaptive_depth():
+    jb = RTPJitterBuffer(target_ms=20, max_ms=200, adaptive=True)
+    arrival = 0.0
+    for i in range(200):
+        # Alternate 0 ms / 40 ms spacing: |D| = 160 timestamp units every packet.
+        arrival += 0.0 if i % 2 else 0.04
+        jb.push(i, i * 160, b"\x00", arrival=arrival)
+    assert jb.jitter_ms == pytest.approx(20.0, rel=0.01)
+    assert jb.target_depth == 4
+
+
+def test_conceal_pcm16_fades_then_silences():
+    frame = struct.pack("<4h", 1000, 1000, 1000, 1000)
+    first = struct.unpack("<4h", conceal_pcm16(frame, 1, len(frame)))
+    assert first[0] == 1000 and first[-1] < 1000
+    later = struct.unpack("<4h", conceal_pcm16(frame, PLC_MAX_REPEAT, len(frame)))
+    assert max(later) < first[-1]
+    assert conceal_pcm16(frame, PLC_MAX_REPEAT + 1, len(frame)) == b"\x00" * len(frame)
+    assert conceal_pcm16(frame, 1, len(frame), mode="zero") == b"\x00" * len(frame)
+
+
+@pytest.mark.asyncio
+async def test_rtp_server_conceals_loss_and_reports_stats():
+    captured = []
+
+    async def cb(call_id: str, ssrc: int, pcm: bytes) -> None:
+        captured.append(pcm)
+
+    server = RTPServer(
+        host="127.0.0.1",
+        port=18080,
+        engine_callback=cb,
+        codec="slin16",
+        sample_rate=8000,
+        jitter_target_ms=40,
+        jitter_adaptive=False,
+    )
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        session = RTPSession(
+            call_id="call-jb",
+            local_port=9999,
+            socket=sock,
+            created_at=time.time(),
+            last_packet_at=time.time(),
+        )
+        server.sessions[session.call_id] = session
+        voiced = struct.pack("<160h", *([4000] * 160))
+        for seq in (1, 3, 4):
+            await server._handle_inbound_packet(session, seq, seq * 160, voiced, 42)  # type: ignore[attr-defined]
+        await server._handle_inbound_packet(session, 2, 320, voiced, 42)  # type: ignore[attr-defined]
+
+        assert len(captured) == 4
+        concealed = struct.unpack("<160h", captured[1])
+        assert 0 < concealed[-1] < 4000
+
+        info = server.get_session_info("call-jb")
+        assert info["packet_loss_count"] == 1
+        assert info["jitter_buffer"]["late_dropped"] == 1
+        assert info["jitter_buffer"]["concealed"] == 1
+        stats = server.get_stats()["jitter_buffer"]
+        assert stats["late_dropped_total"] == 1
+        assert stats["concealed_total"] == 1
+    finally:
+        server.sessions.clear()
+        sock.close()
@@ -0,0 +1,206 @@
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from src.rtp_server import RTPServer
+
+
+def _free_port_range(count: int):
+    for base in range(39000, 40000, count):
+        socks = []
+        try:
+            for port in range(base, base + count):
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                socks.append(s)
+                s.bind(("127.0.0.1", port))
+        except OSError:
+            continue
+        finally:
+            for s in socks:
+                s.close()
+        return base, base + count - 1
+    pytest.skip("no free UDP port range")
+
+
+def _packet(*, ssrc: int, seq: int, payload: bytes) -> bytes:
+    return struct.pack("!BBHII", 0x80, 0, seq & 0xFFFF, (seq * 160) & 0xFFFFFFFF, ssrc) + payload
+
+
+async def _wait_for(predicate, timeout: float = 1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_shared_mode_demultiplexes_calls_on_one_socket():
+    captured = {}
+
+    async def cb(call_id: str, ssrc: int, pcm: bytes) -> None:
+        captured.setdefault(call_id, []).append(ssrc)
+
+    server = RTPServer(
+        host="127.0.0.1",
+        port=0,
+        engine_callback=cb,
+        codec="slin16",
+        sample_rate=8000,
+        port_range=_free_port_range(4),
+        socket_mode="shared",
+        shared_socket_count=1,
+    )
+    await server.start()
+    senders = []
+    try:
+        assert len(server.shared_sockets) == 1
+        payload = b"\x00\x00" * 160
+
+        ports = []
+        for i, call_id in enumerate(("call-a", "call-b")):
+            port = await server.allocate_session(call_id)
+            ports.append(port)
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sender.bind(("127.0.0.1", 0))
+            senders.append(sender)
+            sender.sendto(_packet(ssrc=100 + i, seq=1, payload=payload), ("127.0.0.1", port))
+            await _wait_for(lambda cid=call_id: server.has_remote_endpoint(cid))
+
+        # Both calls were claimed in turn, so they share the pool socket.
+        assert ports[0] == ports[1]
+        assert len(server.shared_sockets) == 1
+
+        for seq in range(2, 6):
+            for i, sender in enumerate(senders):
+                sender.sendto(_packet(ssrc=100 + i, seq=seq, payload=payload), ("127.0.0.1", ports[0]))
+        await _wait_for(lambda: sum(len(v) for v in captured.values()) == 10)
+
+        assert captured["call-a"] == [100] * 5
+        assert captured["call-b"] == [101] * 5
+        assert server.get_call_id_for_ssrc(101) == "call-b"
+
+        # Unknown sources are dropped once no call is waiting for its first packet.
+        stray = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        senders.append(stray)
+        stray.sendto(_packet(ssrc=999, seq=1, payload=payload), ("127.0.0.1", ports[0]))
+        await _wait_for(lambda: server.get_stats()["shared_sockets"][0]["unrouted"] == 1)
+
+        # Outbound audio goes back through the shared socket to each caller.
+        assert await server.send_audio("call-b", payload)
+        data, _ = senders[1].recvfrom(1500)
+        assert len(data) == 12 + len(payload)
+    finally:
+        for s in senders:
+            s.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_shared_mode_grows_pool_while_calls_await_first_packet():
+    async def cb(call_id: str, ssrc: int, pcm: bytes) -> None:
+        return None
+
+    server = RTPServer(
+        host="127.0.0.1",
+        port=0,
+        engine_callback=cb,
+        codec="slin16",
+        sample_rate=8000,
+        port_range=_free_port_range(4),
+        socket_mode="shared",
+        shared_socket_count=1,
+    )
+    await server.start()
+    try:
+        p1 = await server.allocate_session("call-1")
+        p2 = await server.allocate_session("call-2")
+        assert p1 != p2
+        assert len(server.shared_sockets) == 2
+
+        await server.cleanup_session("call-2")
+        await _wait_for(lambda: len(server.shared_sockets) == 1)
+        assert p2 not in server.port_allocation
+    finally:
+        await server.stop()
+    assert server.port_allocation == {}
+
+
+@pytest.mark.asyncio
+async def test_calls_with_known_sources_await_first_packet_on_one_socket():
+    captured = {}
+
+    async def cb(call_id: str, ssrc: int, pcm: bytes) -> None:
+        captured.setdefault(call_id, []).append(ssrc)
+
+    server = RTPServer(
+        host="127.0.0.1",
+        port=0,
+        engine_callback=cb,
+        codec="slin16",
+        sample_rate=8000,
+        port_range=_free_port_range(4),
+        socket_mode="shared",
+        shared_socket_count=1,
+    )
+    await server.start()
+    senders = []
+    try:
+        payload = b"\x00\x00" * 160
+        ports = []
+        for call_id in ("call-a", "call-b", "call-c"):
+            ports.append(await server.allocate_session(call_id))
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sender.bind(("127.0.0.1", 0))
+            senders.append(sender)
+            # What Asterisk reports as UNICASTRTP_LOCAL_ADDRESS / UNICASTRTP_LOCAL_PORT
+            server.expect_remote(call_id, "0.0.0.0" if call_id == "call-c" else "127.0.0.1", sender.getsockname()[1])
+
+        # All three wait for their first packet on the pool socket at once.
+        assert len(set(ports)) == 1 and len(server.shared_sockets) == 1
+        assert server.get_stats()["shared_sockets"][0]["pending"] == ["call-a", "call-b", "call-c"]
+
+        # First packets arrive in the opposite order and still reach the right calls.
+        for i in (2, 1, 0):
+            senders[i].sendto(_packet(ssrc=200 + i, seq=1, payload=payload), ("127.0.0.1", ports[0]))
+        await _wait_for(lambda: sum(len(v) for v in captured.values()) == 3)
+        assert captured == {"call-a": [200], "call-b": [201], "call-c": [202]}
+        assert server.get_stats()["shared_sockets"][0]["pending"] == []
+    finally:
+        for s in senders:
+            s.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_shared_pool_falls_back_to_per_call_sockets():
+    async def cb(call_id: str, ssrc: int, pcm: bytes) -> None:
+        return None
+
+    server = RTPServer(
+        host="127.0.0.1",
+        port=0,
+        engine_callback=cb,
+        codec="slin16",
+        sample_rate=8000,
+        port_range=_free_port_range(4),
+        socket_mode="shared",
+        shared_socket_count=1,
+        shared_socket_max=1,
+    )
+    await server.start()
+    try:
+        shared_port = await server.allocate_session("call-1")
+        own_port = await server.allocate_session("call-2")  # call-1's source is still unknown
+        assert own_port != shared_port
+        assert len(server.shared_sockets) == 1
+        assert server.sessions["call-2"].shared_socket is None
+        assert "call-2" in server.session_tasks
+
+        await server.cleanup_session("call-2")
+        assert own_port not in server.port_allocation
+    finally:
+        await server.stop()
+    assert server.port_allocation == {}
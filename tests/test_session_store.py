@@ -219,3 +219,50 @@ class TestSessionStore:
         stats = await session_store.get_session_stats()
         assert stats["active_calls"] == 1
         assert stats["active_playbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_handle_follows_call_lifecycle(self, session_store, sample_session):
+        """Handles track re-upserts and close when the call is removed."""
+        assert session_store.handle("test_call_123") is None
+
+        await session_store.upsert_call(sample_session)
+        handle = session_store.handle("test_call_123")
+        assert handle is not None
+        assert handle.session is sample_session
+        assert session_store.handle("test_call_123") is handle
+
+        replacement = CallSession(
+            call_id="test_call_123",
+            caller_channel_id="1758498324.399",
+            provider_name="local",
+        )
+        await session_store.upsert_call(replacement)
+        assert handle.session is replacement
+
+        await session_store.remove_call("test_call_123")
+        assert handle.closed
+        assert handle.session is None
+        assert session_store.handle("test_call_123") is None
+
+    @pytest.mark.asyncio
+    async def test_per_call_lock_does_not_block_other_calls(self, session_store):
+        """A held call lock only serializes that call's mutations."""
+        for i in range(2):
+            await session_store.upsert_call(CallSession(
+                call_id=f"call_{i}", caller_channel_id=f"call_{i}", provider_name="local"
+            ))
+
+        async with session_store._call_lock("call_0"):
+            # Other calls and all lookups proceed while call_0 is locked
+            assert await asyncio.wait_for(session_store.set_gating_token("call_1", "pb1"), timeout=1.0)
+            assert await asyncio.wait_for(session_store.get_by_call_id("call_0"), timeout=1.0) is not None
+            blocked = asyncio.create_task(session_store.set_gating_token("call_0", "pb0"))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+        assert await asyncio.wait_for(blocked, timeout=1.0)
+
+        await session_store.remove_call("call_0")
+        assert "call_0" not in session_store._call_locks
+        # Mutations for unknown calls do not leave locks behind
+        assert not await session_store.set_gating_token("call_0", "pb0")
+        assert "call_0" not in session_store._call_locks
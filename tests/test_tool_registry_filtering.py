@@ -40,3 +40,79 @@ def test_tool_registry_filtered_schema():
 
     tool_registry.clear()
 
+
+
+def _tool_class(name: str, description: str = ""):
+    from src.tools.base import Tool, ToolCategory, ToolDefinition, ToolParameter
+
+    class _Tool(Tool):
+        @property
+        def definition(self) -> ToolDefinition:
+            return ToolDefinition(
+                name=name,
+                description=description or name,
+                category=ToolCategory.BUSINESS,
+                parameters=[ToolParameter(name="x", type="string", description="x", default="d")],
+            )
+
+        async def execute(self, parameters, context):
+            return {"status": "success"}
+
+    return _Tool
+
+
+@pytest.mark.unit
+def test_schema_cache_reuses_until_registry_changes():
+    import json
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_tool_class("tool_a"))
+    tool_registry.register(_tool_class("tool_b"))
+
+    first = tool_registry.to_deepgram_schema_filtered(["tool_b", "tool_a"])
+    second = tool_registry.to_deepgram_schema_filtered(["tool_b", "tool_a"])
+    assert [s["name"] for s in first] == ["tool_b", "tool_a"]
+    assert first is not second and first[0] is second[0]
+    assert "default" not in first[0]["parameters"]["properties"]["x"]
+    assert json.loads(tool_registry.schema_json("deepgram", ["tool_b", "tool_a"])) == first
+
+    generation = tool_registry.generation
+    tool_registry.register(_tool_class("tool_a", "changed"))
+    assert tool_registry.generation > generation
+    assert tool_registry.to_deepgram_schema_filtered(["tool_a"])[0]["description"] == "changed"
+
+    tool_registry.unregister("tool_b")
+    assert tool_registry.to_openai_schema_filtered(["tool_b", "tool_a"])[0]["function"]["name"] == "tool_a"
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_local_llm_prompt_cached_and_invalidated():
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_tool_class("tool_a"))
+    prompt = tool_registry.to_local_llm_prompt()
+    assert '"tool_a"' in prompt
+    assert tool_registry.to_local_llm_prompt() is prompt
+
+    tool_registry.register(_tool_class("tool_b"))
+    assert '"tool_b"' in tool_registry.to_local_llm_prompt()
+    tool_registry.clear()
+    assert tool_registry.to_local_llm_prompt() == ""
+
+
+@pytest.mark.unit
+def test_splice_json_matches_full_encoding():
+    import json
+    from src.tools.registry import splice_json
+
+    tools = [{"type": "function", "name": "t", "parameters": {"type": "object"}}]
+    raw = json.dumps(tools).encode("utf-8")
+    session = {"voice": "alloy", "tool_choice": "auto"}
+    payload = {"type": "session.update", "session": session}
+    inner = splice_json(session, "tools", raw)
+    message = splice_json(payload, "session", inner)
+    assert json.loads(message) == {"type": "session.update", "session": {**session, "tools": tools}}
+    assert json.loads(splice_json({}, "tools", raw)) == {"tools": tools}
@@ -0,0 +1,241 @@
+import asyncio
+import base64
+import json
+import os
+import time
+
+import pytest
+from websockets.asyncio.server import serve
+
+from src.core.tts_cache import TTSPhraseCache, make_key, normalize_text, voice_of
+from src.engine import Engine
+from src.pipelines.base import TTSComponent
+
+
+def test_key_covers_adapter_voice_options_and_normalized_text():
+    base = make_key("openai_tts", "alloy", {"format": {"encoding": "mulaw", "sample_rate": 8000}}, "Hello there.")
+    assert base == make_key("openai_tts", "alloy", {"format": {"sample_rate": 8000, "encoding": "mulaw"}}, "  Hello\n there. ")
+    assert base != make_key("openai_tts", "nova", {"format": {"encoding": "mulaw", "sample_rate": 8000}}, "Hello there.")
+    assert base != make_key("openai_tts", "alloy", {"format": {"encoding": "slin16", "sample_rate": 16000}}, "Hello there.")
+    assert base != make_key("deepgram_tts", "alloy", {"format": {"encoding": "mulaw", "sample_rate": 8000}}, "Hello there.")
+    # Credentials and timeouts do not change the audio; the endpoint can
+    fmt = {"encoding": "mulaw", "sample_rate": 8000}
+    assert base == make_key("openai_tts", "alloy", {"format": fmt, "api_key": "sk-1", "request_timeout_sec": 3}, "Hello there.")
+    assert base != make_key("openai_tts", "alloy", {"format": fmt, "tts_base_url": "http://other"}, "Hello there.")
+    assert normalize_text("  a\tb  ") == "a b"
+    assert voice_of({"model": "tts-1", "voice": "alloy"}) == "alloy"
+
+
+async def test_memory_tier_is_lru_bounded():
+    cache = TTSPhraseCache(None, memory_max_bytes=10)
+    await cache.put("a", b"aaaa")
+    await cache.put("b", b"bbbb")
+    assert await cache.get("a") == b"aaaa"  # a is now most recent
+    await cache.put("c", b"cccc")
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"aaaa"
+    assert cache.stats()["memory_bytes"] == 8
+
+
+async def test_disk_tier_survives_restart_and_evicts_oldest(tmp_path):
+    cache_dir = str(tmp_path / "tts")
+    cache = TTSPhraseCache(cache_dir, memory_max_bytes=1024, disk_max_bytes=10)
+    await cache.put("old", b"0000")
+    os.utime(os.path.join(cache_dir, "old.tts"), (1, 1))
+    await cache.put("mid", b"1111")
+    await cache.put("new", b"2222")  # 12 bytes > 10: oldest file goes
+    assert sorted(os.listdir(cache_dir)) == ["mid.tts", "new.tts"]
+
+    restarted = TTSPhraseCache(cache_dir, memory_max_bytes=1024, disk_max_bytes=10)
+    assert await restarted.contains("new")
+    assert await restarted.get("new") == b"2222"
+    assert restarted.hits == {"memory": 0, "disk": 1}
+    assert await restarted.get("new") == b"2222"
+    assert restarted.hits == {"memory": 1, "disk": 1}
+    assert await restarted.get("old") is None
+
+
+async def test_disk_entries_expire_after_ttl(tmp_path):
+    cache_dir = str(tmp_path / "tts")
+    cache = TTSPhraseCache(cache_dir, disk_ttl_sec=3600)
+    await cache.put("stale", b"0000")
+    await cache.put("fresh", b"1111")
+    os.utime(os.path.join(cache_dir, "stale.tts"), (time.time(), time.time() - 7200))
+
+    restarted = TTSPhraseCache(cache_dir, disk_ttl_sec=3600)
+    assert not await restarted.contains("stale")
+    assert await restarted.get("stale") is None
+    assert sorted(os.listdir(cache_dir)) == ["fresh.tts"]
+    # A hit refreshes LRU order without extending the entry's lifetime
+    written = os.stat(os.path.join(cache_dir, "fresh.tts")).st_mtime
+    assert await restarted.get("fresh") == b"1111"
+    assert os.stat(os.path.join(cache_dir, "fresh.tts")).st_mtime == written
+
+
+async def test_concurrent_misses_share_one_synthesis():
+    cache = TTSPhraseCache(None)
+    calls = 0
+
+    async def synthesize():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"greeting"
+
+    results = await asyncio.gather(*(cache.get_or_synthesize("k", synthesize) for _ in range(5)))
+    assert results == [b"greeting"] * 5
+    assert calls == 1
+    assert cache.misses == 1
+    assert await cache.get_or_synthesize("k", synthesize) == b"greeting"
+    assert calls == 1
+
+
+async def test_failed_synthesis_is_not_cached():
+    cache = TTSPhraseCache(None)
+
+    async def boom():
+        raise RuntimeError("tts down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_synthesize("k", boom)
+    assert not await cache.contains("k")
+
+
+async def test_disabled_cache_always_synthesizes():
+    cache = TTSPhraseCache(None, enabled=False)
+    await cache.put("k", b"x")
+    assert await cache.get("k") is None
+    assert await cache.get_or_synthesize("k", _const(b"y")) == b"y"
+
+
+def _const(value):
+    async def _f():
+        return value
+    return _f
+
+
+class _CountingTTS(TTSComponent):
+    component_key = "stub_tts"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def synthesize(self, call_id, text, options):
+        self.calls += 1
+        yield b"\xff" * 160
+        yield b"\x7f" * 160
+
+
+class _Resolution:
+    def __init__(self, adapter):
+        self.pipeline_name = "stub"
+        self.tts_key = "stub_tts"
+        self.tts_adapter = adapter
+        self.tts_options = {"voice": "v1"}
+
+
+async def test_engine_pipeline_phrases_hit_cache_after_first_call():
+    engine = Engine.__new__(Engine)
+    engine.tts_cache = TTSPhraseCache(None)
+    adapter = _CountingTTS()
+    pipeline = _Resolution(adapter)
+
+    first = await engine._pipeline_tts_bytes("c1", pipeline, "One moment please.")
+    second = await engine._pipeline_tts_bytes("c2", pipeline, "One  moment please.")
+    assert first == second and len(first) == 320
+    assert adapter.calls == 1
+
+    # Model-generated text stays uncached
+    await engine._pipeline_tts_bytes("c3", pipeline, "Bye Alice!", cacheable=False)
+    await engine._pipeline_tts_bytes("c4", pipeline, "Bye Alice!", cacheable=False)
+    assert adapter.calls == 3
+
+
+def test_prewarm_collects_static_context_greetings_per_pipeline():
+    class _Cfg:
+        pass
+
+    engine = Engine.__new__(Engine)
+    cfg = _Cfg()
+    cfg.llm = _Cfg()
+    cfg.llm.initial_greeting = "Hello, how can I help?"
+    cfg.active_pipeline = "main"
+    cfg.pipelines = {"main": {}, "alt": {}}
+    cfg.contexts = {
+        "sales": {"greeting": "Thanks for calling sales."},
+        "vip": {"greeting": "Hi {caller_name}!", "pipeline": "alt"},  # per-call field: not cached
+        "support": {"pipeline": "alt"},  # falls back to the global greeting
+        "realtime": {"provider": "openai_realtime", "greeting": "Hi"},  # not a pipeline
+    }
+    engine.config = cfg
+    assert engine._prewarm_greetings() == {
+        "main": {"Hello, how can I help?", "Thanks for calling sales."},
+        "alt": {"Hello, how can I help?"},
+    }
+
+
+async def test_prewarm_task_is_kept_and_never_overlaps():
+    engine = Engine.__new__(Engine)
+    engine._tts_prewarm_task = None
+    started, release = [], asyncio.Event()
+
+    async def prewarm():
+        started.append(len(started))
+        await release.wait()
+        return 0
+
+    engine._prewarm_tts_cache = prewarm
+    assert engine._schedule_tts_prewarm()
+    first = engine._tts_prewarm_task
+    assert not engine._schedule_tts_prewarm()  # startup pre-warm still running
+    await asyncio.sleep(0)
+    assert started == [0]
+
+    # /reload replaces a pre-warm that is still running
+    assert engine._schedule_tts_prewarm(restart=True)
+    await asyncio.sleep(0)
+    assert first.cancelled() and started == [0, 1]
+
+    release.set()
+    await engine._tts_prewarm_task
+    assert engine._tts_prewarm_task is None
+
+
+async def test_local_ai_server_prompts_are_keyed_by_server_and_loaded_voice():
+    loaded = {"voice": "Kokoro (af_heart)"}
+    synthesized = []
+
+    async def local_ai_server(ws):
+        async for raw in ws:
+            msg = json.loads(raw)
+            if msg["type"] == "status":
+                tts = {"backend": "kokoro", "path": "/models/kokoro", "display": loaded["voice"]}
+                await ws.send(json.dumps({"type": "status_response", "status": "ok", "models": {"tts": tts}}))
+            elif msg["type"] == "tts_request":
+                synthesized.append(loaded["voice"])
+                audio = base64.b64encode(loaded["voice"].encode()).decode()
+                await ws.send(json.dumps({"type": "tts_response", "audio_data": audio}))
+
+    class _Cfg:
+        pass
+
+    async with serve(local_ai_server, "127.0.0.1", 0) as server:
+        url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        engine = Engine.__new__(Engine)
+        engine.config = _Cfg()
+        engine.config.providers = {"local": {"enabled": True, "base_url": url}}
+        engine.tts_cache = TTSPhraseCache(None)
+        engine._local_tts_models = {}
+
+        async def prompt():
+            return await engine._local_ai_server_tts(call_id="c1", text="Connecting you now.", timeout_sec=2.0, cacheable=True)
+
+        assert await prompt() == b"Kokoro (af_heart)"
+        assert await prompt() == b"Kokoro (af_heart)"
+        assert synthesized == ["Kokoro (af_heart)"]
+
+        # The server switched voices; once its status is asked again the old audio is not served
+        loaded["voice"] = "Kokoro (am_adam)"
+        engine._local_tts_models.clear()
+        assert await prompt() == b"Kokoro (am_adam)"
+        assert synthesized == ["Kokoro (af_heart)", "Kokoro (am_adam)"]
@@ -10,6 +10,7 @@ import json
 from unittest.mock import AsyncMock, patch, MagicMock
 import aiohttp
 
+from src.tools.http.client_pool import HTTPClientPool
 from src.tools.http.generic_lookup import (
     GenericHTTPLookupTool, HTTPLookupConfig, create_http_lookup_tool
 )
@@ -175,7 +176,7 @@ class TestGenericHTTPLookupTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(precall_context)
         
         assert result["customer_name"] == "John"
@@ -204,7 +205,7 @@ class TestGenericHTTPLookupTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(precall_context)
 
         assert result == {"customer_name": "", "customer_email": ""}
@@ -232,7 +233,7 @@ class TestGenericHTTPLookupTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(precall_context)
 
         assert result == {"customer_name": "", "customer_email": ""}
@@ -259,7 +260,7 @@ class TestGenericHTTPLookupTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(precall_context)
         
         assert result == {"customer_name": "", "customer_email": ""}
@@ -269,7 +270,7 @@ class TestGenericHTTPLookupTool:
         """Test that request errors return empty values."""
         tool = GenericHTTPLookupTool(lookup_config)
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             mock_client.return_value.__aenter__ = AsyncMock(
                 side_effect=aiohttp.ClientError("Connection failed")
             )
@@ -10,6 +10,7 @@ import json
 from unittest.mock import AsyncMock, patch, MagicMock
 import aiohttp
 
+from src.tools.http.client_pool import HTTPClientPool
 from src.tools.http.generic_webhook import (
     GenericWebhookTool, WebhookConfig, create_webhook_tool
 )
@@ -119,7 +120,7 @@ class TestGenericWebhookTool:
         )
         tool = GenericWebhookTool(config)
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             await tool.execute(postcall_context)
             mock_client.assert_not_called()
     
@@ -133,7 +134,7 @@ class TestGenericWebhookTool:
         )
         tool = GenericWebhookTool(config)
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             await tool.execute(postcall_context)
             mock_client.assert_not_called()
     
@@ -151,7 +152,7 @@ class TestGenericWebhookTool:
             __aexit__=AsyncMock(return_value=None),
         ))
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_session)
             mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
             
@@ -173,7 +174,7 @@ class TestGenericWebhookTool:
             __aexit__=AsyncMock(return_value=None),
         ))
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_session)
             mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
             
@@ -185,7 +186,7 @@ class TestGenericWebhookTool:
         """Test that request errors are handled gracefully."""
         tool = GenericWebhookTool(webhook_config)
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             mock_client.return_value.__aenter__ = AsyncMock(
                 side_effect=aiohttp.ClientError("Connection failed")
             )
@@ -0,0 +1,208 @@
+"""
+Tests for the shared HTTP tool client (connection reuse, per-tool limits, GET cache).
+
+Runs the tools against a local aiohttp server instead of mocks so connection
+reuse is observable.
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from src.tools.context import PostCallContext, PreCallContext
+from src.tools.http.client_pool import (
+    HTTPClientPool,
+    close_http_client_pool,
+    configure_http_client_pool,
+    get_http_client_pool,
+    response_cache_key,
+)
+from src.tools.http.generic_lookup import GenericHTTPLookupTool, HTTPLookupConfig
+from src.tools.http.generic_webhook import GenericWebhookTool, WebhookConfig
+
+
+class _Stub:
+    def __init__(self):
+        self.hits = 0
+        self.peers = set()
+        self.active = 0
+        self.peak_active = 0
+        self.delay = 0.0
+        self.cookies = []
+
+    async def contact(self, request):
+        self.hits += 1
+        self.cookies.append(dict(request.cookies))
+        self.peers.add(request.transport.get_extra_info("peername")[1])
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            response = web.json_response({"name": request.query.get("phone", ""), "hit": self.hits})
+            response.set_cookie("session", request.query.get("phone", ""))
+            return response
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+async def stub():
+    state = _Stub()
+    app = web.Application()
+    app.router.add_route("*", "/contact", state.contact)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    state.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/contact"
+    yield state
+    await close_http_client_pool()
+    await runner.cleanup()
+
+
+def _context(caller="+15550001"):
+    return PreCallContext(call_id="c1", caller_number=caller, called_number="+15559999")
+
+
+def _lookup(url, **kwargs):
+    return GenericHTTPLookupTool(HTTPLookupConfig(
+        name=kwargs.pop("name", "crm"),
+        url=url,
+        query_params={"phone": "{caller_number}"},
+        output_variables={"customer_name": "name", "hit": "hit"},
+        **kwargs,
+    ))
+
+
+@pytest.mark.asyncio
+async def test_lookups_reuse_one_connection(stub):
+    tool = _lookup(stub.url)
+    for _ in range(5):
+        result = await tool.execute(_context())
+        assert result["customer_name"] == "+15550001"
+    assert stub.hits == 5
+    assert len(stub.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_cache_serves_repeat_lookups_until_ttl(stub, monkeypatch):
+    tool = _lookup(stub.url, cache_ttl_seconds=30)
+    first = await tool.execute(_context())
+    second = await tool.execute(_context())
+    assert first == second == {"customer_name": "+15550001", "hit": "1"}
+    assert stub.hits == 1
+
+    # Different rendered URL (another caller) is a different entry
+    other = await tool.execute(_context("+15550002"))
+    assert other["customer_name"] == "+15550002"
+    assert stub.hits == 2
+
+    import src.tools.http.client_pool as client_pool
+    real = client_pool.time.monotonic
+    monkeypatch.setattr(client_pool.time, "monotonic", lambda: real() + 31)
+    await tool.execute(_context())
+    assert stub.hits == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_is_opt_in_and_get_only(stub):
+    await _lookup(stub.url).execute(_context())
+    await _lookup(stub.url).execute(_context())
+    assert stub.hits == 2
+
+    post = _lookup(stub.url, name="crm_post", method="POST", cache_ttl_seconds=30)
+    await post.execute(_context())
+    await post.execute(_context())
+    assert stub.hits == 4
+
+
+@pytest.mark.asyncio
+async def test_per_tool_concurrency_limit(stub):
+    stub.delay = 0.05
+    tool = _lookup(stub.url, max_concurrency=1)
+    results = await asyncio.gather(*(tool.execute(_context()) for _ in range(4)))
+    assert all(r["customer_name"] for r in results)
+    assert stub.peak_active == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_wait_respects_tool_timeout(stub):
+    stub.delay = 0.3
+    tool = _lookup(stub.url, max_concurrency=1, timeout_ms=100)
+    slow = _lookup(stub.url, max_concurrency=1, timeout_ms=1000)
+    first = asyncio.create_task(slow.execute(_context()))
+    await asyncio.sleep(0.02)
+    assert (await tool.execute(_context()))["customer_name"] == ""
+    assert (await first)["customer_name"] == "+15550001"
+
+
+@pytest.mark.asyncio
+async def test_slot_wait_counts_against_tool_timeout(stub):
+    stub.delay = 0.25
+    tool = _lookup(stub.url, max_concurrency=1, timeout_ms=400)
+    first = asyncio.create_task(tool.execute(_context()))
+    await asyncio.sleep(0.02)
+    started = asyncio.get_running_loop().time()
+    # Waits ~0.23 s for the slot, so only ~0.17 s of the 0.4 s budget is left for a 0.25 s reply.
+    assert (await tool.execute(_context()))["customer_name"] == ""
+    assert asyncio.get_running_loop().time() - started < 0.45
+    assert (await first)["customer_name"] == "+15550001"
+
+
+@pytest.mark.asyncio
+async def test_cookies_are_not_shared_between_calls(stub):
+    # aiohttp's default jar ignores cookies from IP hosts, so use a name.
+    tool = _lookup(stub.url.replace("127.0.0.1", "localhost"))
+    await tool.execute(_context("+15550001"))
+    await tool.execute(_context("+15550002"))
+    assert stub.cookies == [{}, {}]
+
+
+@pytest.mark.asyncio
+async def test_webhook_uses_shared_pool(stub):
+    webhook = GenericWebhookTool(WebhookConfig(name="notify", url=stub.url, payload_template='{"a": 1}'))
+    ctx = PostCallContext(call_id="c1", caller_number="+15550001", called_number="+15559999")
+    await webhook.execute(ctx)
+    await _lookup(stub.url).execute(_context())
+    assert stub.hits == 2
+    assert len(stub.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_configure_replaces_pool_and_close_resets():
+    class Cfg:
+        max_connections = 10
+        max_connections_per_host = 2
+        keepalive_timeout_sec = 5.0
+        dns_cache_ttl_sec = 60
+        default_max_concurrency = 3
+        http2 = False
+        response_cache_max_entries = 2
+
+    pool = await configure_http_client_pool(Cfg())
+    assert get_http_client_pool() is pool
+    assert pool.default_max_concurrency == 3
+    for i in range(3):
+        pool.store(f"k{i}", json.dumps({"i": i}), 60)
+    assert pool.stats()["cached_responses"] == 2
+    assert pool.get_cached("t", "k0") is None
+
+    await close_http_client_pool()
+    assert get_http_client_pool() is not pool
+
+
+def test_cache_key_covers_rendered_request():
+    base = response_cache_key("t", "GET", "http://x/a", {"p": "1"}, {"Authorization": "a"})
+    assert base == response_cache_key("t", "get", "http://x/a", {"p": "1"}, {"Authorization": "a"})
+    assert base != response_cache_key("t", "GET", "http://x/a", {"p": "2"}, {"Authorization": "a"})
+    assert base != response_cache_key("t", "GET", "http://x/a", {"p": "1"}, {"Authorization": "b"})
+    assert base != response_cache_key("t", "GET", "http://x/a", {"p": "1"}, {"Authorization": "a"}, "body")
+
+
+def test_http2_without_httpx_falls_back():
+    import src.tools.http.client_pool as client_pool
+    pool = HTTPClientPool(http2=True)
+    assert pool.http2 is (client_pool.httpx is not None)
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 import aiohttp
 import json
 
+from src.tools.http.client_pool import HTTPClientPool
 from src.tools.http.in_call_lookup import (
     InCallHTTPTool, InCallHTTPConfig, create_in_call_http_tool
 )
@@ -206,7 +207,7 @@ class TestInCallHTTPTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute({"date": "2026-01-30"}, execution_context)
         
         assert result["status"] == "success"
@@ -243,7 +244,7 @@ class TestInCallHTTPTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute({}, execution_context)
         
         assert result["status"] == "success"
@@ -269,7 +270,7 @@ class TestInCallHTTPTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute({"date": "2026-01-30"}, execution_context)
         
         assert result["status"] == "failed"
@@ -279,7 +280,7 @@ class TestInCallHTTPTool:
         """Test that request errors return error status."""
         tool = InCallHTTPTool(tool_config)
         
-        with patch("aiohttp.ClientSession") as mock_client:
+        with patch.object(HTTPClientPool, "session") as mock_client:
             mock_client.return_value.__aenter__ = AsyncMock(
                 side_effect=aiohttp.ClientError("Connection failed")
             )
@@ -314,7 +315,7 @@ class TestInCallHTTPTool:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute({}, execution_context)
         
         assert result["status"] == "error"
@@ -11,6 +11,7 @@ import json
 
 from src.tools.base import ToolPhase, ToolCategory, ToolDefinition, PreCallTool, PostCallTool
 from src.tools.context import PreCallContext, PostCallContext
+from src.tools.http.client_pool import HTTPClientPool
 from src.tools.http.generic_lookup import GenericHTTPLookupTool, HTTPLookupConfig, create_http_lookup_tool
 from src.tools.http.generic_webhook import GenericWebhookTool, WebhookConfig, create_webhook_tool
 
@@ -83,7 +84,7 @@ class TestPreCallToolExecution:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(precall_context)
         
         # Verify output variables match definition
@@ -109,7 +110,7 @@ class TestPreCallToolExecution:
         mock_session_cm.__aenter__ = AsyncMock(side_effect=aiohttp.ClientError("Timeout"))
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(precall_context)
         
         # Should return empty string, not crash
@@ -142,7 +143,7 @@ class TestPreCallToolExecution:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result1 = await tool1.execute(precall_context)
             result2 = await tool2.execute(precall_context)
         
@@ -209,7 +210,7 @@ class TestPostCallToolExecution:
         mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             await tool.execute(postcall_context)
         
         # Verify payload was sent
@@ -233,7 +234,7 @@ class TestPostCallToolExecution:
         mock_session_cm.__aenter__ = AsyncMock(side_effect=aiohttp.ClientError("Connection refused"))
         mock_session_cm.__aexit__ = AsyncMock(return_value=None)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             # Should not raise
             await tool.execute(postcall_context)
     
@@ -360,7 +361,7 @@ class TestVariableInjectionIntegration:
             caller_number="+1234567890",
         )
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with patch.object(HTTPClientPool, "session", return_value=mock_session_cm):
             result = await tool.execute(context)
         
         assert result["name"] == "John"